@@ -0,0 +1,89 @@
+# noqa: INP001
+r"""Contain a benchmark to compare the peak resident set size (RSS) of
+some metrics when the labels are stored with narrow dtypes.
+
+Each measurement runs in a new process because the peak RSS of a
+process never decreases. The reported value is the increase of the
+peak RSS while computing the metric, i.e. the memory used by the
+temporary arrays, in addition to the memory used by the inputs.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import resource
+from functools import partial
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from arkas.metric import accuracy, binary_confusion_matrix, mean_squared_error
+from arkas.utils.logging import configure_logging
+from arkas.utils.stats import compute_statistics_continuous_array
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+METRICS = {
+    "accuracy": accuracy,
+    "binary_confusion_matrix": binary_confusion_matrix,
+    "mean_squared_error": partial(mean_squared_error, backend="native"),
+    "statistics": lambda _y_true, y_pred: compute_statistics_continuous_array(y_pred),
+}
+DTYPES = ["float64", "int64", "int32", "float32", "int8", "bool"]
+
+
+def make_labels(n_samples: int, dtype: str, seed: int) -> np.ndarray:
+    r"""Return an array of binary labels that is created directly with
+    the requested dtype, so the peak RSS of the process does not
+    include a wider temporary array."""
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(0, 2, size=n_samples, dtype=np.int8)
+    if dtype == "bool":
+        return labels.view(np.bool_)
+    if dtype == "int8":
+        return labels
+    out = np.empty(n_samples, dtype=dtype)
+    out[:] = labels
+    return out
+
+
+def peak_rss_mib() -> float:
+    r"""Return the peak RSS of the current process in MiB."""
+    # ``ru_maxrss`` is in KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure_peak_rss(name: str, dtype: str, n_samples: int) -> tuple[float, float]:
+    r"""Return the size of the inputs and the increase of the peak RSS
+    while computing a metric, in MiB."""
+    metric: Callable = METRICS[name]
+    y_true = make_labels(n_samples, dtype, seed=0)
+    y_pred = make_labels(n_samples, dtype, seed=1)
+    # Run the metric once on a small input to load the lazy imports.
+    metric(y_true[:10], y_pred[:10])
+    before = peak_rss_mib()
+    metric(y_true, y_pred)
+    return (y_true.nbytes + y_pred.nbytes) / 2**20, peak_rss_mib() - before
+
+
+def main() -> None:
+    r"""Define the main function."""
+    context = multiprocessing.get_context("spawn")
+    n_samples = 20_000_000
+    for name in METRICS:
+        for dtype in DTYPES:
+            with context.Pool(processes=1) as pool:
+                inputs, peak = pool.apply(measure_peak_rss, (name, dtype, n_samples))
+            logger.info(
+                f"n_samples={n_samples:,} | {name} | dtype={dtype}: "
+                f"inputs={inputs:,.1f} MiB | peak RSS increase={peak:,.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    configure_logging(level=logging.INFO)
+    main()
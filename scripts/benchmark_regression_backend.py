@@ -0,0 +1,67 @@
+# noqa: INP001
+r"""Contain a micro-benchmark to compare the per-call latency of the
+native and sklearn backends of the regression metrics."""
+
+from __future__ import annotations
+
+import logging
+import timeit
+from functools import partial
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from arkas.metric import (
+    mean_absolute_error,
+    mean_squared_error,
+    median_absolute_error,
+    r2_score,
+    regression_errors,
+    root_mean_squared_error,
+)
+from arkas.utils.logging import configure_logging
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+METRICS = {
+    "mean_absolute_error": mean_absolute_error,
+    "median_absolute_error": median_absolute_error,
+    "mean_squared_error": mean_squared_error,
+    "root_mean_squared_error": root_mean_squared_error,
+    "r2_score": r2_score,
+    "regression_errors": regression_errors,
+}
+
+
+def measure_latency(func: Callable, number: int = 200, repeat: int = 5) -> float:
+    r"""Return the best per-call latency in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main() -> None:
+    r"""Define the main function."""
+    rng = np.random.default_rng(42)
+    for n_samples in [1_000, 10_000, 100_000]:
+        y_true = rng.normal(size=(n_samples,))
+        y_pred = y_true + rng.normal(scale=0.1, size=(n_samples,))
+        for name, metric in METRICS.items():
+            latency = {
+                backend: measure_latency(
+                    partial(metric, y_true=y_true, y_pred=y_pred, backend=backend),
+                    number=max(10, 100_000 // n_samples),
+                )
+                for backend in ["native", "sklearn"]
+            }
+            logger.info(
+                f"n_samples={n_samples:,} | {name}: native={latency['native']:.1f}us | "
+                f"sklearn={latency['sklearn']:.1f}us | "
+                f"speedup={latency['sklearn'] / latency['native']:.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    configure_logging(level=logging.INFO)
+    main()
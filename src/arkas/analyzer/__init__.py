@@ -9,6 +9,7 @@ __all__ = [
     "BaseInNLazyAnalyzer",
     "BaseLazyAnalyzer",
     "BaseTruePredAnalyzer",
+    "BinnedResidualAnalyzer",
     "ColumnCooccurrenceAnalyzer",
     "ColumnCorrelationAnalyzer",
     "ContentAnalyzer",
@@ -32,6 +33,7 @@ __all__ = [
 from arkas.analyzer.accuracy import AccuracyAnalyzer
 from arkas.analyzer.balanced_accuracy import BalancedAccuracyAnalyzer
 from arkas.analyzer.base import BaseAnalyzer, is_analyzer_config, setup_analyzer
+from arkas.analyzer.binned_residual import BinnedResidualAnalyzer
 from arkas.analyzer.column_cooccurrence import ColumnCooccurrenceAnalyzer
 from arkas.analyzer.column_correlation import ColumnCorrelationAnalyzer
 from arkas.analyzer.columns import BaseTruePredAnalyzer
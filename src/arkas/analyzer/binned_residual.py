@@ -0,0 +1,135 @@
+r"""Contain the binned residual analyzer."""
+
+from __future__ import annotations
+
+__all__ = ["BinnedResidualAnalyzer"]
+
+import logging
+from typing import TYPE_CHECKING
+
+from coola.utils.format import repr_mapping_line
+
+from arkas.analyzer.columns import BaseTruePredAnalyzer
+from arkas.metric.utils import check_nan_policy
+from arkas.output.binned_residual import BinnedResidualOutput
+from arkas.state.binned_residual import BinnedResidualState
+from arkas.utils.array import to_array
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+    import polars as pl
+
+    from arkas.figure import BaseFigureConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+class BinnedResidualAnalyzer(BaseTruePredAnalyzer):
+    r"""Implement an analyzer of the residuals of a regression model
+    binned by predicted value.
+
+    The bias, mean absolute error, and root mean squared error of the
+    residuals are computed for each bin in a single pass over the
+    columns, so the errors can be compared across the range of
+    predicted values.
+
+    Args:
+        y_true: The column name of the ground truth target values.
+        y_pred: The column name of the predicted values.
+        bins: The number of bins, or the monotonically increasing bin
+            edges of the predicted values.
+        strategy: The strategy to find the bin edges if ``bins`` is
+            the number of bins. The following options are available:
+            ``'quantile'`` and ``'uniform'``.
+        drop_nulls: If ``True``, the rows with null values in
+            ``y_true`` or ``y_pred`` columns are dropped.
+        missing_policy: The policy on how to handle missing columns.
+            The following options are available: ``'ignore'``,
+            ``'warn'``, and ``'raise'``. If ``'raise'``, an exception
+            is raised if at least one column is missing.
+            If ``'warn'``, a warning is raised if at least one column
+            is missing and the missing columns are ignored.
+            If ``'ignore'``, the missing columns are ignored and
+            no warning message appears.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+        figure_config: The figure configuration.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from arkas.analyzer import BinnedResidualAnalyzer
+    >>> analyzer = BinnedResidualAnalyzer(y_true="target", y_pred="pred", bins=3)
+    >>> analyzer
+    BinnedResidualAnalyzer(y_true='target', y_pred='pred', bins=3, strategy='quantile', drop_nulls=True, missing_policy='raise', nan_policy='propagate', figure_config=None)
+    >>> frame = pl.DataFrame(
+    ...     {"pred": [2.0, 2.0, 3.0, 3.0, 6.0, 8.0], "target": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]}
+    ... )
+    >>> output = analyzer.analyze(frame)
+    >>> output
+    BinnedResidualOutput(
+      (state): BinnedResidualState(y_true=(6,), y_pred=(6,), y_true_name='target', y_pred_name='pred', bins=3, strategy='quantile', nan_policy='propagate', figure_config=MatplotlibFigureConfig())
+    )
+
+    ```
+    """
+
+    def __init__(
+        self,
+        y_true: str,
+        y_pred: str,
+        bins: int | Sequence[float] | np.ndarray = 10,
+        strategy: str = "quantile",
+        drop_nulls: bool = True,
+        missing_policy: str = "raise",
+        nan_policy: str = "propagate",
+        figure_config: BaseFigureConfig | None = None,
+    ) -> None:
+        super().__init__(
+            y_true=y_true, y_pred=y_pred, drop_nulls=drop_nulls, missing_policy=missing_policy
+        )
+        self._bins = bins
+        self._strategy = strategy
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+        self._figure_config = figure_config
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "y_true": self._y_true,
+                "y_pred": self._y_pred,
+                "bins": self._bins,
+                "strategy": self._strategy,
+                "drop_nulls": self._drop_nulls,
+                "missing_policy": self._missing_policy,
+                "nan_policy": self._nan_policy,
+                "figure_config": self._figure_config,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    def _analyze(self, frame: pl.DataFrame) -> BinnedResidualOutput:
+        logger.info(
+            f"Analyzing the binned residuals | y_true={self._y_true!r} | "
+            f"y_pred={self._y_pred!r} | bins={self._bins} | strategy={self._strategy!r} | "
+            f"drop_nulls={self._drop_nulls} | nan_policy={self._nan_policy!r}"
+        )
+        return BinnedResidualOutput(
+            state=BinnedResidualState(
+                y_true=to_array(frame[self._y_true]).ravel(),
+                y_pred=to_array(frame[self._y_pred]).ravel(),
+                y_true_name=self._y_true,
+                y_pred_name=self._y_pred,
+                bins=self._bins,
+                strategy=self._strategy,
+                nan_policy=self._nan_policy,
+                figure_config=self._figure_config,
+            ),
+        )
@@ -6,6 +6,7 @@ __all__ = [
     "AccuracyContentGenerator",
     "BalancedAccuracyContentGenerator",
     "BaseContentGenerator",
+    "BinnedResidualContentGenerator",
     "ColumnCooccurrenceContentGenerator",
     "ColumnCorrelationContentGenerator",
     "ContentGenerator",
@@ -26,6 +27,7 @@ __all__ = [
 from arkas.content.accuracy import AccuracyContentGenerator
 from arkas.content.balanced_accuracy import BalancedAccuracyContentGenerator
 from arkas.content.base import BaseContentGenerator
+from arkas.content.binned_residual import BinnedResidualContentGenerator
 from arkas.content.column_cooccurrence import ColumnCooccurrenceContentGenerator
 from arkas.content.column_correlation import ColumnCorrelationContentGenerator
 from arkas.content.continuous_series import ContinuousSeriesContentGenerator
@@ -0,0 +1,266 @@
+r"""Contain the implementation of a HTML content generator that analyzes
+the residuals of a regression model binned by predicted value."""
+
+from __future__ import annotations
+
+__all__ = [
+    "BinnedResidualContentGenerator",
+    "create_table",
+    "create_template",
+]
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from coola import objects_are_equal
+from coola.utils import repr_indent, repr_mapping, str_indent, str_mapping
+from jinja2 import Template
+
+from arkas.content.section import BaseSectionContentGenerator
+from arkas.content.utils import float_to_str
+from arkas.evaluator2.binned_residual import BinnedResidualEvaluator
+from arkas.figure.utils import figure2html
+from arkas.plotter.binned_residual import BinnedResidualPlotter
+from arkas.utils.style import get_tab_number_style
+
+if TYPE_CHECKING:
+    from arkas.state.binned_residual import BinnedResidualState
+
+logger = logging.getLogger(__name__)
+
+
+class BinnedResidualContentGenerator(BaseSectionContentGenerator):
+    r"""Implement a content generator that analyzes the residuals of a
+    regression model binned by predicted value.
+
+    Args:
+        evaluator: The evaluator that computes the binned residuals.
+        plotter: The binned residual plotter.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.content import BinnedResidualContentGenerator
+    >>> from arkas.evaluator2 import BinnedResidualEvaluator
+    >>> from arkas.plotter import BinnedResidualPlotter
+    >>> from arkas.state import BinnedResidualState
+    >>> state = BinnedResidualState(
+    ...     y_true=np.array([1, 2, 3, 4, 5, 6]),
+    ...     y_pred=np.array([2, 2, 3, 3, 6, 8]),
+    ...     y_true_name="target",
+    ...     y_pred_name="pred",
+    ...     bins=3,
+    ... )
+    >>> content = BinnedResidualContentGenerator(
+    ...     evaluator=BinnedResidualEvaluator(state), plotter=BinnedResidualPlotter(state)
+    ... )
+    >>> content
+    BinnedResidualContentGenerator(
+      (evaluator): BinnedResidualEvaluator(
+          (state): BinnedResidualState(y_true=(6,), y_pred=(6,), y_true_name='target', y_pred_name='pred', bins=3, strategy='quantile', nan_policy='propagate', figure_config=MatplotlibFigureConfig())
+        )
+      (plotter): BinnedResidualPlotter(
+          (state): BinnedResidualState(y_true=(6,), y_pred=(6,), y_true_name='target', y_pred_name='pred', bins=3, strategy='quantile', nan_policy='propagate', figure_config=MatplotlibFigureConfig())
+        )
+    )
+
+    ```
+    """
+
+    def __init__(self, evaluator: BinnedResidualEvaluator, plotter: BinnedResidualPlotter) -> None:
+        self._evaluator = evaluator
+        self._plotter = plotter
+
+    def __repr__(self) -> str:
+        args = repr_indent(repr_mapping(self.get_args()))
+        return f"{self.__class__.__qualname__}(\n  {args}\n)"
+
+    def __str__(self) -> str:
+        args = str_indent(str_mapping(self.get_args()))
+        return f"{self.__class__.__qualname__}(\n  {args}\n)"
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return objects_are_equal(self.get_args(), other.get_args(), equal_nan=equal_nan)
+
+    def generate_content(self) -> str:
+        state = self._evaluator.state
+        logger.info(
+            f"Generating the binned residuals of {state.y_pred_name!r} "
+            f"with respect to {state.y_true_name!r}..."
+        )
+        metrics = self._evaluator.evaluate()
+        figures = self._plotter.plot()
+        return Template(create_template()).render(
+            {
+                "y_true_name": state.y_true_name,
+                "y_pred_name": state.y_pred_name,
+                "count": f"{metrics['count']:,}",
+                "num_bins": f"{metrics['bin_count'].size:,}",
+                "strategy": (
+                    state.strategy if isinstance(state.bins, (int, np.integer)) else "fixed edges"
+                ),
+                "table": create_table(metrics),
+                "figure": figure2html(figures["binned_residual"], close_fig=True),
+            }
+        )
+
+    def get_args(self) -> dict:
+        return {"evaluator": self._evaluator, "plotter": self._plotter}
+
+    @classmethod
+    def from_state(cls, state: BinnedResidualState) -> BinnedResidualContentGenerator:
+        r"""Instantiate a ``BinnedResidualContentGenerator`` object from
+        a state.
+
+        Args:
+            state: The state with the data to analyze.
+
+        Returns:
+            The instantiated object.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.content import BinnedResidualContentGenerator
+        >>> from arkas.state import BinnedResidualState
+        >>> content = BinnedResidualContentGenerator.from_state(
+        ...     BinnedResidualState(
+        ...         y_true=np.array([1, 2, 3, 4, 5, 6]),
+        ...         y_pred=np.array([2, 2, 3, 3, 6, 8]),
+        ...         y_true_name="target",
+        ...         y_pred_name="pred",
+        ...         bins=3,
+        ...     )
+        ... )
+        >>> content
+        BinnedResidualContentGenerator(
+          (evaluator): BinnedResidualEvaluator(
+              (state): BinnedResidualState(y_true=(6,), y_pred=(6,), y_true_name='target', y_pred_name='pred', bins=3, strategy='quantile', nan_policy='propagate', figure_config=MatplotlibFigureConfig())
+            )
+          (plotter): BinnedResidualPlotter(
+              (state): BinnedResidualState(y_true=(6,), y_pred=(6,), y_true_name='target', y_pred_name='pred', bins=3, strategy='quantile', nan_policy='propagate', figure_config=MatplotlibFigureConfig())
+            )
+        )
+
+        ```
+        """
+        return cls(evaluator=BinnedResidualEvaluator(state), plotter=BinnedResidualPlotter(state))
+
+
+def create_template() -> str:
+    r"""Return the template of the content.
+
+    Returns:
+        The content template.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from arkas.content.binned_residual import create_template
+    >>> template = create_template()
+
+    ```
+    """
+    return """<p style="margin-top: 1rem;">
+This section analyzes the residuals <em>{{y_pred_name}} - {{y_true_name}}</em>
+binned by predicted value, to show how the error changes with the magnitude of the predictions.
+A positive bias means the model over-predicts in the bin.
+
+<ul>
+  <li> <b>target column</b>: {{y_true_name}} </li>
+  <li> <b>prediction column</b>: {{y_pred_name}} </li>
+  <li> <b>number of bins</b>: {{num_bins}} ({{strategy}}) </li>
+  <li> <b>number of samples</b>: {{count}} </li>
+</ul>
+
+{{figure}}
+
+<details>
+    <summary>[show statistics per bin]</summary>
+
+    <p style="margin-top: 1rem;">
+    The following table shows the statistics of the residuals of each bin. </p>
+
+    {{table}}
+</details>
+"""
+
+
+def create_table(metrics: dict[str, Any]) -> str:
+    r"""Return a HTML representation of a table with the statistics of
+    the residuals of each bin.
+
+    Args:
+        metrics: The binned residuals computed by
+            ``binned_residuals``.
+
+    Returns:
+        The HTML representation of the table.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.content.binned_residual import create_table
+    >>> table = create_table(
+    ...     {
+    ...         "bin_bias": np.array([0.5, -0.5, 1.5]),
+    ...         "bin_count": np.array([2, 2, 2]),
+    ...         "bin_edges": np.array([0.0, 3.0, 6.0, 9.0]),
+    ...         "bin_mae": np.array([0.5, 0.5, 1.5]),
+    ...         "bin_rmse": np.array([0.7, 0.7, 1.6]),
+    ...         "count": 6,
+    ...     }
+    ... )
+
+    ```
+    """
+    num_style = f'style="{get_tab_number_style()}"'
+    edges = metrics["bin_edges"]
+    rows = "\n".join(
+        Template("""<tr>
+    <th>[{{left}}, {{right}}{{close}}</th>
+    <td {{num_style}}>{{count}}</td>
+    <td {{num_style}}>{{bias}}</td>
+    <td {{num_style}}>{{mae}}</td>
+    <td {{num_style}}>{{rmse}}</td>
+</tr>""").render(
+            {
+                "num_style": num_style,
+                "left": float_to_str(edges[i]),
+                "right": float_to_str(edges[i + 1]),
+                # The last bin also includes its right edge.
+                "close": "]" if i == metrics["bin_count"].size - 1 else ")",
+                "count": f"{metrics['bin_count'][i]:,}",
+                "bias": float_to_str(metrics["bin_bias"][i]),
+                "mae": float_to_str(metrics["bin_mae"][i]),
+                "rmse": float_to_str(metrics["bin_rmse"][i]),
+            }
+        )
+        for i in range(metrics["bin_count"].size)
+    )
+    return Template("""<table class="table table-hover table-responsive w-auto" >
+    <thead class="thead table-group-divider">
+        <tr>
+            <th>bin</th>
+            <th>count</th>
+            <th>bias</th>
+            <th>MAE</th>
+            <th>RMSE</th>
+        </tr>
+    </thead>
+    <tbody class="tbody table-group-divider">
+        {{rows}}
+        <tr class="table-group-divider"></tr>
+    </tbody>
+</table>
+""").render({"rows": rows})
@@ -16,8 +16,10 @@ __all__ = [
     "BinaryPrecisionEvaluator",
     "BinaryRecallEvaluator",
     "BinaryRocAucEvaluator",
+    "DeLongEvaluator",
     "EnergyDistanceEvaluator",
     "EvaluatorDict",
+    "GroupedMetricsEvaluator",
     "JensenShannonDivergenceEvaluator",
     "KLDivEvaluator",
     "MeanAbsoluteErrorEvaluator",
@@ -40,7 +42,9 @@ __all__ = [
     "MultilabelPrecisionEvaluator",
     "MultilabelRecallEvaluator",
     "MultilabelRocAucEvaluator",
+    "MultioutputRegressionEvaluator",
     "PearsonCorrelationEvaluator",
+    "QueryRankingEvaluator",
     "R2ScoreEvaluator",
     "RootMeanSquaredErrorEvaluator",
     "SequentialEvaluator",
@@ -62,7 +66,9 @@ from arkas.evaluator.binary_jaccard import BinaryJaccardEvaluator
 from arkas.evaluator.binary_precision import BinaryPrecisionEvaluator
 from arkas.evaluator.binary_recall import BinaryRecallEvaluator
 from arkas.evaluator.binary_roc_auc import BinaryRocAucEvaluator
+from arkas.evaluator.delong import DeLongEvaluator
 from arkas.evaluator.energy import EnergyDistanceEvaluator
+from arkas.evaluator.grouped import GroupedMetricsEvaluator
 from arkas.evaluator.jensen_shannon import JensenShannonDivergenceEvaluator
 from arkas.evaluator.kl import KLDivEvaluator
 from arkas.evaluator.lazy import BaseLazyEvaluator
@@ -85,8 +91,10 @@ from arkas.evaluator.multilabel_fbeta import MultilabelFbetaScoreEvaluator
 from arkas.evaluator.multilabel_jaccard import MultilabelJaccardEvaluator
 from arkas.evaluator.multilabel_precision import MultilabelPrecisionEvaluator
 from arkas.evaluator.multilabel_recall import MultilabelRecallEvaluator
+from arkas.evaluator.multioutput_regression import MultioutputRegressionEvaluator
 from arkas.evaluator.multilabel_roc_auc import MultilabelRocAucEvaluator
 from arkas.evaluator.pearson import PearsonCorrelationEvaluator
+from arkas.evaluator.query_ranking import QueryRankingEvaluator
 from arkas.evaluator.r2 import R2ScoreEvaluator
 from arkas.evaluator.rmse import RootMeanSquaredErrorEvaluator
 from arkas.evaluator.sequential import SequentialEvaluator
@@ -12,7 +12,7 @@ from coola.utils.format import repr_mapping_line
 from arkas.evaluator.lazy import BaseLazyEvaluator
 from arkas.metric.utils import check_nan_policy
 from arkas.result import AccuracyResult, Result
-from arkas.utils.array import to_array
+from arkas.utils.labels import to_label_arrays
 
 if TYPE_CHECKING:
     import polars as pl
@@ -84,9 +84,10 @@ class AccuracyEvaluator(BaseLazyEvaluator[AccuracyResult]):
         return self._evaluate(data, lazy)
 
     def _compute_result(self, data: pl.DataFrame) -> AccuracyResult:
+        y_true, y_pred = to_label_arrays(data[self._y_true], data[self._y_pred])
         return AccuracyResult(
-            y_true=to_array(data[self._y_true]).ravel(),
-            y_pred=to_array(data[self._y_pred]).ravel(),
+            y_true=y_true,
+            y_pred=y_pred,
             nan_policy=self._nan_policy,
         )
 
@@ -0,0 +1,115 @@
+r"""Contain the evaluator that compares the ROC AUC of several score
+columns with the DeLong test."""
+
+from __future__ import annotations
+
+__all__ = ["DeLongEvaluator"]
+
+import logging
+from typing import TYPE_CHECKING
+
+from coola.utils.format import repr_mapping_line
+
+from arkas.evaluator.lazy import BaseLazyEvaluator
+from arkas.metric.utils import check_nan_policy
+from arkas.result import DeLongResult, Result
+from arkas.utils.array import to_array
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import polars as pl
+
+
+logger = logging.getLogger(__name__)
+
+
+class DeLongEvaluator(BaseLazyEvaluator[DeLongResult]):
+    r"""Implement the evaluator that compares the ROC AUC of several
+    score columns with the DeLong test.
+
+    Args:
+        y_true: The key or column name of the ground truth target
+            labels.
+        y_scores: The key or column names of the target scores. The
+            name of each column is used as prefix of its metrics.
+        confidence_level: The confidence level of the intervals.
+        drop_nulls: If ``True``, the rows with null values in the
+            ``y_true`` or ``y_scores`` columns are dropped.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from arkas.evaluator import DeLongEvaluator
+    >>> evaluator = DeLongEvaluator(y_true="target", y_scores=["a", "b"])
+    >>> evaluator
+    DeLongEvaluator(y_true='target', y_scores=('a', 'b'), confidence_level=0.95, drop_nulls=True, nan_policy='propagate')
+    >>> data = pl.DataFrame(
+    ...     {
+    ...         "a": [0.9, 0.2, 0.6, 0.8, 0.4, 0.1],
+    ...         "b": [0.8, 0.3, 0.1, 0.7, 0.2, 0.5],
+    ...         "target": [1, 0, 0, 1, 1, 0],
+    ...     }
+    ... )
+    >>> result = evaluator.evaluate(data)
+    >>> result
+    DeLongResult(y_true=(6,), y_scores=('a', 'b'), confidence_level=0.95, nan_policy='propagate')
+
+    ```
+    """
+
+    def __init__(
+        self,
+        y_true: str,
+        y_scores: Sequence[str],
+        confidence_level: float = 0.95,
+        *,
+        drop_nulls: bool = True,
+        nan_policy: str = "propagate",
+    ) -> None:
+        super().__init__(drop_nulls=drop_nulls)
+        self._y_true = y_true
+        self._y_scores = tuple(y_scores)
+
+        if not 0.0 < confidence_level < 1.0:
+            msg = f"Incorrect 'confidence_level': {confidence_level}. The value must be in (0, 1)"
+            raise ValueError(msg)
+        self._confidence_level = confidence_level
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "y_true": self._y_true,
+                "y_scores": self._y_scores,
+                "confidence_level": self._confidence_level,
+                "drop_nulls": self._drop_nulls,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    def evaluate(self, data: pl.DataFrame, lazy: bool = True) -> DeLongResult | Result:
+        logger.info(
+            f"Evaluating the DeLong test | y_true={self._y_true!r} | "
+            f"y_scores={self._y_scores} | confidence_level={self._confidence_level} | "
+            f"drop_nulls={self._drop_nulls} | nan_policy={self._nan_policy!r}"
+        )
+        return self._evaluate(data, lazy)
+
+    def _compute_result(self, data: pl.DataFrame) -> DeLongResult:
+        return DeLongResult(
+            y_true=to_array(data[self._y_true]).ravel(),
+            y_scores={name: to_array(data[name]).ravel() for name in self._y_scores},
+            confidence_level=self._confidence_level,
+            nan_policy=self._nan_policy,
+        )
+
+    def _get_columns(self) -> tuple[str, ...]:
+        return (self._y_true, *self._y_scores)
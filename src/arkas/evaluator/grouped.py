@@ -0,0 +1,135 @@
+r"""Contain the evaluator that computes the metrics of each group of
+rows."""
+
+from __future__ import annotations
+
+__all__ = ["GroupedMetricsEvaluator"]
+
+import logging
+from typing import TYPE_CHECKING
+
+from coola.utils.format import repr_mapping_line
+
+from arkas.evaluator.lazy import BaseLazyEvaluator
+from arkas.metric.utils import check_nan_policy
+from arkas.result import GroupedMetricsResult, Result
+from arkas.result.grouped import check_grouped_task
+from arkas.utils.array import to_array
+from arkas.utils.labels import to_label_arrays
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import polars as pl
+
+
+logger = logging.getLogger(__name__)
+
+
+class GroupedMetricsEvaluator(BaseLazyEvaluator[GroupedMetricsResult]):
+    r"""Implement the evaluator that computes the metrics of each group
+    of rows.
+
+    The group keys are factorized once and the metrics of all the
+    groups are computed in a single pass, so the DataFrame is not
+    filtered for each group.
+
+    Args:
+        groups: The column names that define the groups.
+        y_true: The key or column name of the ground truth target
+            labels or values.
+        y_pred: The key or column name of the predicted labels,
+            scores, or values.
+        task: The type of metrics to compute. The valid values are
+            ``'classification'``, ``'ranking'``, and
+            ``'regression'``.
+        drop_nulls: If ``True``, the rows with null values in the
+            group, ``y_true``, or ``y_pred`` columns are dropped.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from arkas.evaluator import GroupedMetricsEvaluator
+    >>> evaluator = GroupedMetricsEvaluator(
+    ...     groups=["country"], y_true="target", y_pred="pred", task="classification"
+    ... )
+    >>> evaluator
+    GroupedMetricsEvaluator(groups=('country',), y_true='target', y_pred='pred', task='classification', drop_nulls=True, nan_policy='propagate')
+    >>> data = pl.DataFrame(
+    ...     {
+    ...         "country": ["fr", "fr", "fr", "us", "us", "us"],
+    ...         "pred": [1, 0, 0, 1, 1, 0],
+    ...         "target": [1, 0, 1, 1, 0, 0],
+    ...     }
+    ... )
+    >>> result = evaluator.evaluate(data)
+    >>> result
+    GroupedMetricsResult(groups=('country',), y_true=(6,), y_pred=(6,), task='classification', nan_policy='propagate')
+
+    ```
+    """
+
+    def __init__(
+        self,
+        groups: Sequence[str],
+        y_true: str,
+        y_pred: str,
+        task: str,
+        *,
+        drop_nulls: bool = True,
+        nan_policy: str = "propagate",
+    ) -> None:
+        super().__init__(drop_nulls=drop_nulls)
+        self._groups = tuple(groups)
+        self._y_true = y_true
+        self._y_pred = y_pred
+
+        check_grouped_task(task)
+        self._task = task
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "groups": self._groups,
+                "y_true": self._y_true,
+                "y_pred": self._y_pred,
+                "task": self._task,
+                "drop_nulls": self._drop_nulls,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    def evaluate(self, data: pl.DataFrame, lazy: bool = True) -> GroupedMetricsResult | Result:
+        logger.info(
+            f"Evaluating the {self._task} metrics of each group | groups={self._groups} | "
+            f"y_true={self._y_true!r} | y_pred={self._y_pred!r} | "
+            f"drop_nulls={self._drop_nulls} | nan_policy={self._nan_policy!r}"
+        )
+        return self._evaluate(data, lazy)
+
+    def _compute_result(self, data: pl.DataFrame) -> GroupedMetricsResult:
+        if self._task == "classification":
+            y_true, y_pred = to_label_arrays(data[self._y_true], data[self._y_pred])
+        else:
+            y_true, y_pred = (
+                to_array(data[self._y_true]).ravel(),
+                to_array(data[self._y_pred]).ravel(),
+            )
+        return GroupedMetricsResult(
+            groups={name: to_array(data[name]).ravel() for name in self._groups},
+            y_true=y_true,
+            y_pred=y_pred,
+            task=self._task,
+            nan_policy=self._nan_policy,
+        )
+
+    def _get_columns(self) -> tuple[str, ...]:
+        return (*self._groups, self._y_true, self._y_pred)
@@ -12,7 +12,7 @@ from coola.utils.format import repr_mapping_line
 from arkas.evaluator.lazy import BaseLazyEvaluator
 from arkas.metric.utils import check_nan_policy
 from arkas.result import MulticlassConfusionMatrixResult, Result
-from arkas.utils.array import to_array
+from arkas.utils.labels import to_label_arrays
 
 if TYPE_CHECKING:
     import polars as pl
@@ -33,6 +33,10 @@ class MulticlassConfusionMatrixEvaluator(BaseLazyEvaluator[MulticlassConfusionMa
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        top_k: If not ``None``, the result only reports the ``top_k``
+            most frequent confused pairs instead of the dense
+            confusion matrix. It should be used when there are too
+            many classes to store a dense confusion matrix.
 
     Example usage:
 
@@ -42,11 +46,11 @@ class MulticlassConfusionMatrixEvaluator(BaseLazyEvaluator[MulticlassConfusionMa
     >>> from arkas.evaluator import MulticlassConfusionMatrixEvaluator
     >>> evaluator = MulticlassConfusionMatrixEvaluator(y_true="target", y_pred="pred")
     >>> evaluator
-    MulticlassConfusionMatrixEvaluator(y_true='target', y_pred='pred', drop_nulls=True, nan_policy='propagate')
+    MulticlassConfusionMatrixEvaluator(y_true='target', y_pred='pred', drop_nulls=True, nan_policy='propagate', top_k=None)
     >>> data = pl.DataFrame({"pred": [0, 0, 1, 1, 2, 2], "target": [0, 0, 1, 1, 2, 2]})
     >>> result = evaluator.evaluate(data)
     >>> result
-    MulticlassConfusionMatrixResult(y_true=(6,), y_pred=(6,), nan_policy='propagate')
+    MulticlassConfusionMatrixResult(y_true=(6,), y_pred=(6,), nan_policy='propagate', top_k=None)
 
     ```
     """
@@ -57,6 +61,7 @@ class MulticlassConfusionMatrixEvaluator(BaseLazyEvaluator[MulticlassConfusionMa
         y_pred: str,
         drop_nulls: bool = True,
         nan_policy: str = "propagate",
+        top_k: int | None = None,
     ) -> None:
         super().__init__(drop_nulls=drop_nulls)
         self._y_true = y_true
@@ -64,6 +69,7 @@ class MulticlassConfusionMatrixEvaluator(BaseLazyEvaluator[MulticlassConfusionMa
 
         check_nan_policy(nan_policy)
         self._nan_policy = nan_policy
+        self._top_k = top_k
 
     def __repr__(self) -> str:
         args = repr_mapping_line(
@@ -72,6 +78,7 @@ class MulticlassConfusionMatrixEvaluator(BaseLazyEvaluator[MulticlassConfusionMa
                 "y_pred": self._y_pred,
                 "drop_nulls": self._drop_nulls,
                 "nan_policy": self._nan_policy,
+                "top_k": self._top_k,
             }
         )
         return f"{self.__class__.__qualname__}({args})"
@@ -82,15 +89,17 @@ class MulticlassConfusionMatrixEvaluator(BaseLazyEvaluator[MulticlassConfusionMa
         logger.info(
             f"Evaluating the multiclass confusion matrix | y_true={self._y_true!r} | "
             f"y_pred={self._y_pred!r} | drop_nulls={self._drop_nulls} | "
-            f"nan_policy={self._nan_policy!r}"
+            f"nan_policy={self._nan_policy!r} | top_k={self._top_k}"
         )
         return self._evaluate(data, lazy)
 
     def _compute_result(self, data: pl.DataFrame) -> MulticlassConfusionMatrixResult:
+        y_true, y_pred = to_label_arrays(data[self._y_true], data[self._y_pred])
         return MulticlassConfusionMatrixResult(
-            y_true=to_array(data[self._y_true]).ravel(),
-            y_pred=to_array(data[self._y_pred]).ravel(),
+            y_true=y_true,
+            y_pred=y_pred,
             nan_policy=self._nan_policy,
+            top_k=self._top_k,
         )
 
     def _get_columns(self) -> tuple[str, ...]:
@@ -12,7 +12,7 @@ from coola.utils.format import repr_mapping_line
 from arkas.evaluator.lazy import BaseLazyEvaluator
 from arkas.metric.utils import check_nan_policy
 from arkas.result import MulticlassFbetaScoreResult, Result
-from arkas.utils.array import to_array
+from arkas.utils.labels import to_label_arrays
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -93,9 +93,10 @@ class MulticlassFbetaScoreEvaluator(BaseLazyEvaluator[MulticlassFbetaScoreResult
         return self._evaluate(data, lazy)
 
     def _compute_result(self, data: pl.DataFrame) -> MulticlassFbetaScoreResult:
+        y_true, y_pred = to_label_arrays(data[self._y_true], data[self._y_pred])
         return MulticlassFbetaScoreResult(
-            y_true=to_array(data[self._y_true]).ravel(),
-            y_pred=to_array(data[self._y_pred]).ravel(),
+            y_true=y_true,
+            y_pred=y_pred,
             betas=self._betas,
             nan_policy=self._nan_policy,
         )
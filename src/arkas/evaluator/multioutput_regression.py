@@ -0,0 +1,120 @@
+r"""Contain the multi-output regression evaluator."""
+
+from __future__ import annotations
+
+__all__ = ["MultioutputRegressionEvaluator"]
+
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+from coola.utils.format import repr_mapping_line
+
+from arkas.evaluator.lazy import BaseLazyEvaluator
+from arkas.metric.utils import check_nan_policy
+from arkas.result import MultioutputRegressionResult, Result
+from arkas.utils.array import to_array
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import polars as pl
+
+
+logger = logging.getLogger(__name__)
+
+
+class MultioutputRegressionEvaluator(BaseLazyEvaluator[MultioutputRegressionResult]):
+    r"""Implement the multi-output regression evaluator.
+
+    Each output is a pair of ground truth and predicted columns, for
+    example a step of a forecast horizon. The columns are stacked in
+    arrays of shape ``(n_samples, n_outputs)``, and the metrics of
+    all the outputs are computed in a single vectorized call.
+
+    Args:
+        columns: The ``(y_true, y_pred)`` column names of each output.
+        drop_nulls: If ``True``, the rows with null values in at
+            least one of the columns are dropped.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Raises:
+        ValueError: if ``columns`` is empty or if an item is not a
+            pair of column names.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from arkas.evaluator import MultioutputRegressionEvaluator
+    >>> evaluator = MultioutputRegressionEvaluator(
+    ...     columns=[("target_1", "pred_1"), ("target_2", "pred_2")]
+    ... )
+    >>> evaluator
+    MultioutputRegressionEvaluator(columns=(('target_1', 'pred_1'), ('target_2', 'pred_2')), drop_nulls=True, nan_policy='propagate')
+    >>> data = pl.DataFrame(
+    ...     {
+    ...         "pred_1": [1, 2, 4, 4],
+    ...         "pred_2": [3, 4, 6, 4],
+    ...         "target_1": [1, 2, 3, 4],
+    ...         "target_2": [2, 4, 6, 8],
+    ...     }
+    ... )
+    >>> result = evaluator.evaluate(data)
+    >>> result
+    MultioutputRegressionResult(y_true=(4, 2), y_pred=(4, 2), nan_policy='propagate')
+    >>> result.compute_metrics()["mean_absolute_error"]
+    array([0.25, 1.25])
+
+    ```
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[tuple[str, str]],
+        drop_nulls: bool = True,
+        nan_policy: str = "propagate",
+    ) -> None:
+        super().__init__(drop_nulls=drop_nulls)
+        self._columns = tuple(tuple(pair) for pair in columns)
+        if not self._columns:
+            msg = "'columns' must contain at least one pair of columns"
+            raise ValueError(msg)
+        if any(len(pair) != 2 for pair in self._columns):
+            msg = f"Incorrect 'columns': {self._columns}. Each item must be a (y_true, y_pred) pair"
+            raise ValueError(msg)
+
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "columns": self._columns,
+                "drop_nulls": self._drop_nulls,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    def evaluate(
+        self, data: pl.DataFrame, lazy: bool = True
+    ) -> MultioutputRegressionResult | Result:
+        logger.info(
+            f"Evaluating the multi-output regression metrics | columns={self._columns} | "
+            f"drop_nulls={self._drop_nulls} | nan_policy={self._nan_policy!r}"
+        )
+        return self._evaluate(data, lazy)
+
+    def _compute_result(self, data: pl.DataFrame) -> MultioutputRegressionResult:
+        return MultioutputRegressionResult(
+            y_true=np.column_stack([to_array(data[y_true]) for y_true, _ in self._columns]),
+            y_pred=np.column_stack([to_array(data[y_pred]) for _, y_pred in self._columns]),
+            nan_policy=self._nan_policy,
+        )
+
+    def _get_columns(self) -> tuple[str, ...]:
+        return tuple(dict.fromkeys(col for pair in self._columns for col in pair))
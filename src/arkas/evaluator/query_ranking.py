@@ -0,0 +1,119 @@
+r"""Contain the learning-to-rank evaluator for data grouped by query."""
+
+from __future__ import annotations
+
+__all__ = ["QueryRankingEvaluator"]
+
+import logging
+from typing import TYPE_CHECKING
+
+from coola.utils.format import repr_mapping_line
+
+from arkas.evaluator.lazy import BaseLazyEvaluator
+from arkas.metric.utils import check_nan_policy
+from arkas.result import QueryRankingResult, Result
+from arkas.utils.array import to_array
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import polars as pl
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryRankingEvaluator(BaseLazyEvaluator[QueryRankingResult]):
+    r"""Implement the learning-to-rank evaluator for data grouped by
+    query.
+
+    Each row of the DataFrame is a result of a query.
+
+    Args:
+        query_id: The key or column name of the query identifiers.
+        y_true: The key or column name of the relevance of each
+            result.
+        y_score: The key or column name of the predicted scores.
+        k: The numbers of top results used to compute the metrics
+            at a cutoff.
+        drop_nulls: If ``True``, the rows with null values in
+            ``query_id``, ``y_true``, or ``y_score`` columns are
+            dropped.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from arkas.evaluator import QueryRankingEvaluator
+    >>> evaluator = QueryRankingEvaluator(query_id="query", y_true="target", y_score="score")
+    >>> evaluator
+    QueryRankingEvaluator(query_id='query', y_true='target', y_score='score', k=(10,), drop_nulls=True, nan_policy='propagate')
+    >>> data = pl.DataFrame(
+    ...     {
+    ...         "query": ["a", "a", "a", "b", "b", "b", "b"],
+    ...         "score": [0.1, 0.2, 0.9, 0.5, 0.8, 0.3, 0.4],
+    ...         "target": [0, 1, 2, 1, 0, 0, 1],
+    ...     }
+    ... )
+    >>> result = evaluator.evaluate(data)
+    >>> result
+    QueryRankingResult(query_id=(7,), y_true=(7,), y_score=(7,), k=(10,), nan_policy='propagate')
+
+    ```
+    """
+
+    def __init__(
+        self,
+        query_id: str,
+        y_true: str,
+        y_score: str,
+        *,
+        k: Sequence[int] = (10,),
+        drop_nulls: bool = True,
+        nan_policy: str = "propagate",
+    ) -> None:
+        super().__init__(drop_nulls=drop_nulls)
+        self._query_id = query_id
+        self._y_true = y_true
+        self._y_score = y_score
+        self._k = tuple(k)
+
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "query_id": self._query_id,
+                "y_true": self._y_true,
+                "y_score": self._y_score,
+                "k": self._k,
+                "drop_nulls": self._drop_nulls,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    def evaluate(self, data: pl.DataFrame, lazy: bool = True) -> QueryRankingResult | Result:
+        logger.info(
+            f"Evaluating the learning-to-rank metrics | query_id={self._query_id!r} | "
+            f"y_true={self._y_true!r} | y_score={self._y_score!r} | k={self._k} | "
+            f"drop_nulls={self._drop_nulls} | nan_policy={self._nan_policy!r}"
+        )
+        return self._evaluate(data, lazy)
+
+    def _compute_result(self, data: pl.DataFrame) -> QueryRankingResult:
+        return QueryRankingResult(
+            query_id=to_array(data[self._query_id]).ravel(),
+            y_true=to_array(data[self._y_true]).ravel(),
+            y_score=to_array(data[self._y_score]).ravel(),
+            k=self._k,
+            nan_policy=self._nan_policy,
+        )
+
+    def _get_columns(self) -> tuple[str, ...]:
+        return (self._query_id, self._y_true, self._y_score)
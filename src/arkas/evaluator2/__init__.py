@@ -8,6 +8,7 @@ __all__ = [
     "BaseCachedEvaluator",
     "BaseEvaluator",
     "BaseStateCachedEvaluator",
+    "BinnedResidualEvaluator",
     "ColumnCooccurrenceEvaluator",
     "ColumnCorrelationEvaluator",
     "CorrelationEvaluator",
@@ -20,6 +21,7 @@ __all__ = [
 from arkas.evaluator2.accuracy import AccuracyEvaluator
 from arkas.evaluator2.balanced_accuracy import BalancedAccuracyEvaluator
 from arkas.evaluator2.base import BaseEvaluator
+from arkas.evaluator2.binned_residual import BinnedResidualEvaluator
 from arkas.evaluator2.caching import BaseCachedEvaluator, BaseStateCachedEvaluator
 from arkas.evaluator2.column_cooccurrence import ColumnCooccurrenceEvaluator
 from arkas.evaluator2.column_correlation import ColumnCorrelationEvaluator
@@ -0,0 +1,59 @@
+r"""Implement the binned residual evaluator."""
+
+from __future__ import annotations
+
+__all__ = ["BinnedResidualEvaluator"]
+
+from typing import Any
+
+from arkas.evaluator2.caching import BaseStateCachedEvaluator
+from arkas.metric import binned_residuals
+from arkas.state.binned_residual import BinnedResidualState
+
+
+class BinnedResidualEvaluator(BaseStateCachedEvaluator[BinnedResidualState]):
+    r"""Implement the binned residual evaluator.
+
+    Args:
+        state: The state containing the ground truth and predicted
+            values.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.evaluator2 import BinnedResidualEvaluator
+    >>> from arkas.state import BinnedResidualState
+    >>> evaluator = BinnedResidualEvaluator(
+    ...     BinnedResidualState(
+    ...         y_true=np.array([1, 2, 3, 4, 5, 6]),
+    ...         y_pred=np.array([2, 2, 3, 3, 6, 8]),
+    ...         y_true_name="target",
+    ...         y_pred_name="pred",
+    ...         bins=[0, 3, 6, 9],
+    ...     )
+    ... )
+    >>> evaluator
+    BinnedResidualEvaluator(
+      (state): BinnedResidualState(y_true=(6,), y_pred=(6,), y_true_name='target', y_pred_name='pred', bins=[0, 3, 6, 9], strategy='quantile', nan_policy='propagate', figure_config=MatplotlibFigureConfig())
+    )
+    >>> evaluator.evaluate()
+    {'bin_bias': array([ 0.5, -0.5,  1.5]),
+     'bin_count': array([2, 2, 2]),
+     'bin_edges': array([0., 3., 6., 9.]),
+     'bin_mae': array([0.5, 0.5, 1.5]),
+     'bin_rmse': array([0.70710678, 0.70710678, 1.58113883]),
+     'count': 6}
+
+    ```
+    """
+
+    def _evaluate(self) -> dict[str, Any]:
+        return binned_residuals(
+            y_true=self._state.y_true,
+            y_pred=self._state.y_pred,
+            bins=self._state.bins,
+            strategy=self._state.strategy,
+            nan_policy=self._state.nan_policy,
+        )
@@ -3,6 +3,32 @@ r"""Contain functions to compute metrics."""
 from __future__ import annotations
 
 __all__ = [
+    "AccuracyAccumulator",
+    "BalancedAccuracyAccumulator",
+    "BaseCalibrationAccumulator",
+    "BaseConfusionMatrixAccumulator",
+    "BaseRegressionAccumulator",
+    "BinaryScoreHistogram",
+    "BinaryScoreRanking",
+    "BrierScoreAccumulator",
+    "CalibrationErrorAccumulator",
+    "ConfusionMatrixAccumulator",
+    "ConfusionMatrixKernel",
+    "FbetaScoreAccumulator",
+    "GroupSegments",
+    "JaccardAccumulator",
+    "LogLossAccumulator",
+    "MeanAbsoluteErrorAccumulator",
+    "MeanAbsolutePercentageErrorAccumulator",
+    "MeanSquaredErrorAccumulator",
+    "MeanSquaredLogErrorAccumulator",
+    "MedianAbsoluteErrorAccumulator",
+    "PrecisionAccumulator",
+    "QuerySegments",
+    "R2ScoreAccumulator",
+    "RecallAccumulator",
+    "RegressionErrorAccumulator",
+    "RootMeanSquaredErrorAccumulator",
     "accuracy",
     "average_precision",
     "balanced_accuracy",
@@ -13,13 +39,28 @@ __all__ = [
     "binary_precision",
     "binary_recall",
     "binary_roc_auc",
+    "binary_threshold_sweep",
     "binary_top_k_accuracy",
+    "binned_residuals",
+    "bootstrap_metric",
+    "brier_score",
     "confusion_matrix",
+    "delong_roc_auc",
+    "delong_roc_auc_test",
     "energy_distance",
+    "expected_calibration_error",
+    "factorize_groups",
     "fbeta_score",
+    "find_best_threshold",
+    "find_threshold_at_precision",
+    "find_threshold_at_recall",
+    "grouped_classification_metrics",
+    "grouped_ranking_metrics",
+    "grouped_regression_metrics",
     "jaccard",
     "jensen_shannon_divergence",
     "kl_div",
+    "log_loss",
     "mean_absolute_error",
     "mean_absolute_percentage_error",
     "mean_squared_error",
@@ -33,6 +74,7 @@ __all__ = [
     "multiclass_precision",
     "multiclass_recall",
     "multiclass_roc_auc",
+    "multiclass_top_confused_pairs",
     "multiclass_top_k_accuracy",
     "multilabel_average_precision",
     "multilabel_confusion_matrix",
@@ -41,20 +83,36 @@ __all__ = [
     "multilabel_precision",
     "multilabel_recall",
     "multilabel_roc_auc",
+    "multilabel_threshold_curves",
+    "multioutput_regression_metrics",
     "ndcg",
     "pearsonr",
     "precision",
+    "query_ranking_metrics",
     "r2_score",
     "recall",
     "regression_errors",
+    "regression_metrics",
     "roc_auc",
     "root_mean_squared_error",
+    "sparse_multiclass_confusion_matrix",
     "spearmanr",
     "top_k_accuracy",
     "wasserstein_distance",
 ]
 
 
+from arkas.metric.bootstrap import bootstrap_metric
+from arkas.metric.classification.accumulator import (
+    AccuracyAccumulator,
+    BalancedAccuracyAccumulator,
+    BaseConfusionMatrixAccumulator,
+    ConfusionMatrixAccumulator,
+    FbetaScoreAccumulator,
+    JaccardAccumulator,
+    PrecisionAccumulator,
+    RecallAccumulator,
+)
 from arkas.metric.classification.accuracy import accuracy
 from arkas.metric.classification.ap import (
     average_precision,
@@ -63,12 +121,25 @@ from arkas.metric.classification.ap import (
     multilabel_average_precision,
 )
 from arkas.metric.classification.balanced_accuracy import balanced_accuracy
+from arkas.metric.classification.calibration import (
+    BaseCalibrationAccumulator,
+    BrierScoreAccumulator,
+    CalibrationErrorAccumulator,
+    LogLossAccumulator,
+    brier_score,
+    expected_calibration_error,
+    log_loss,
+)
 from arkas.metric.classification.confmat import (
     binary_confusion_matrix,
     confusion_matrix,
     multiclass_confusion_matrix,
+    multiclass_top_confused_pairs,
     multilabel_confusion_matrix,
+    sparse_multiclass_confusion_matrix,
 )
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
+from arkas.metric.classification.delong import delong_roc_auc, delong_roc_auc_test
 from arkas.metric.classification.fbeta import (
     binary_fbeta_score,
     fbeta_score,
@@ -88,6 +159,7 @@ from arkas.metric.classification.precision import (
     multilabel_precision,
     precision,
 )
+from arkas.metric.classification.query_ranking import QuerySegments, query_ranking_metrics
 from arkas.metric.classification.recall import (
     binary_recall,
     multiclass_recall,
@@ -100,6 +172,15 @@ from arkas.metric.classification.roc_auc import (
     multilabel_roc_auc,
     roc_auc,
 )
+from arkas.metric.classification.score_histogram import BinaryScoreHistogram
+from arkas.metric.classification.score_ranking import BinaryScoreRanking
+from arkas.metric.classification.threshold_curves import multilabel_threshold_curves
+from arkas.metric.classification.threshold_sweep import (
+    binary_threshold_sweep,
+    find_best_threshold,
+    find_threshold_at_precision,
+    find_threshold_at_recall,
+)
 from arkas.metric.classification.topk_accuracy import (
     binary_top_k_accuracy,
     multiclass_top_k_accuracy,
@@ -111,11 +192,34 @@ from arkas.metric.distribution.energy import energy_distance
 from arkas.metric.distribution.jensen_shannon import jensen_shannon_divergence
 from arkas.metric.distribution.kl import kl_div
 from arkas.metric.distribution.wasserstein import wasserstein_distance
+from arkas.metric.grouped import (
+    GroupSegments,
+    factorize_groups,
+    grouped_classification_metrics,
+    grouped_ranking_metrics,
+    grouped_regression_metrics,
+)
+from arkas.metric.regression.accumulator import (
+    BaseRegressionAccumulator,
+    MeanAbsoluteErrorAccumulator,
+    MeanAbsolutePercentageErrorAccumulator,
+    MeanSquaredErrorAccumulator,
+    MeanSquaredLogErrorAccumulator,
+    MedianAbsoluteErrorAccumulator,
+    R2ScoreAccumulator,
+    RegressionErrorAccumulator,
+    RootMeanSquaredErrorAccumulator,
+)
 from arkas.metric.regression.abs_error import mean_absolute_error, median_absolute_error
 from arkas.metric.regression.mape import mean_absolute_percentage_error
 from arkas.metric.regression.mse import mean_squared_error
 from arkas.metric.regression.msle import mean_squared_log_error
 from arkas.metric.regression.r2 import r2_score
+from arkas.metric.regression.residual import binned_residuals
 from arkas.metric.regression.rmse import root_mean_squared_error
 from arkas.metric.regression.tweedie_deviance import mean_tweedie_deviance
-from arkas.metric.regression.universal import regression_errors
+from arkas.metric.regression.universal import (
+    multioutput_regression_metrics,
+    regression_errors,
+    regression_metrics,
+)
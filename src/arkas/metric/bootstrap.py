@@ -0,0 +1,447 @@
+r"""Implement the bootstrap confidence intervals of the metrics."""
+
+from __future__ import annotations
+
+__all__ = ["bootstrap_metric", "check_bootstrap_method"]
+
+import inspect
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
+from arkas.metric.classification.score_histogram import BinaryScoreHistogram
+from arkas.metric.classification.score_ranking import BinaryScoreRanking
+from arkas.metric.utils import check_nan_policy, prepare_inputs
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+def bootstrap_metric(
+    metric: Callable,
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    n_resamples: int = 1000,
+    confidence_level: float = 0.95,
+    method: str = "poisson",
+    label_type: str = "auto",
+    n_bins: int | None = None,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+    seed: int | None = None,
+    n_jobs: int = 1,
+) -> dict[str, Any]:
+    r"""Return the metrics and their bootstrap confidence intervals.
+
+    The metric is called as ``metric(y_true, y_pred,
+    nan_policy=nan_policy)`` and must return a dictionary, or a
+    result object with a ``compute_metrics`` method, for example a
+    ``BaseResult`` class. The resampled arrays are not materialised
+    when the metric can be computed from counts:
+
+    - the metrics with a ``confmat`` argument, like ``accuracy`` or
+        ``binary_precision``, are computed from resampled confusion
+        matrices. The cost of a replicate does not depend on the
+        number of samples.
+    - the metrics with a ``ranking`` argument, like
+        ``binary_roc_auc``, are computed from the resampled counts of
+        positive and negative samples of each distinct score, so the
+        scores are sorted only once. If ``n_bins`` is not ``None``,
+        the scores are bucketed like in ``BinaryScoreHistogram``.
+
+    The other metrics are computed on resampled arrays, one replicate
+    at a time. Each replicate has its own random stream spawned from
+    ``seed``, so the result does not depend on ``n_jobs``.
+
+    Args:
+        metric: The metric function or result class.
+        y_true: The ground truth target labels or values.
+        y_pred: The predicted labels, scores, or values.
+        n_resamples: The number of bootstrap replicates.
+        confidence_level: The confidence level of the intervals.
+        method: The resampling method. ``'multinomial'`` draws
+            ``n_samples`` samples with replacement, and
+            ``'poisson'`` gives each sample a ``Poisson(1)`` weight,
+            so the number of samples varies between the replicates.
+        label_type: The label type of the confusion matrix used by the
+            metrics with a ``confmat`` argument. The valid values are
+            ``'binary'``, ``'multiclass'``, ``'multilabel'``, and
+            ``'auto'``. If ``'auto'``, the label type is the
+            ``label_type`` string attribute of the metric if it
+            exists, otherwise it is found from the prefix of the
+            function or class name (e.g. ``binary_precision`` or
+            ``BinaryPrecisionResult``), and is ``'multiclass'`` if
+            there is no prefix. The multilabel metrics are computed on
+            resampled arrays.
+        n_bins: If not ``None``, the metrics with a ``ranking``
+            argument are approximated with at most ``n_bins`` score
+            buckets.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+        seed: The random seed. If ``None``, the intervals are not
+            reproducible.
+        n_jobs: The number of processes used to compute the
+            replicates. If ``n_jobs > 1``, the metric must be
+            picklable.
+
+    Returns:
+        The metrics computed on all the samples, and the lower
+            (``*_ci_low``) and upper (``*_ci_high``) bounds of the
+            percentile confidence interval of each float metric.
+
+    Raises:
+        ValueError: if ``method``, ``label_type``, ``n_resamples``,
+            or ``confidence_level`` is not valid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import accuracy, bootstrap_metric
+    >>> y_true = np.array([1, 0, 0, 1, 1, 0, 1, 0, 1, 1] * 100)
+    >>> y_pred = np.array([1, 0, 1, 1, 1, 0, 0, 0, 1, 1] * 100)
+    >>> bootstrap_metric(accuracy, y_true, y_pred, n_resamples=200, seed=42)
+    {'accuracy': 0.8,
+     'accuracy_ci_low': 0.776...,
+     'accuracy_ci_high': 0.825...,
+     'count_correct': 800,
+     'count_incorrect': 200,
+     'count': 1000,
+     'error': 0.199...,
+     'error_ci_low': 0.174...,
+     'error_ci_high': 0.223...}
+
+    ```
+    """
+    check_bootstrap_method(method)
+    check_nan_policy(nan_policy)
+    if n_resamples < 1:
+        msg = f"Incorrect 'n_resamples': {n_resamples}. The value must be positive"
+        raise ValueError(msg)
+    if not 0.0 < confidence_level < 1.0:
+        msg = f"Incorrect 'confidence_level': {confidence_level}. The value must be in (0, 1)"
+        raise ValueError(msg)
+
+    engine = _create_engine(
+        metric,
+        y_true,
+        y_pred,
+        method=method,
+        label_type=label_type,
+        n_bins=n_bins,
+        nan_policy=nan_policy,
+    )
+    metrics = engine.compute()
+    seeds = np.random.SeedSequence(seed).spawn(n_resamples)
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            chunks = executor.map(
+                partial(_compute_replicates, engine), np.array_split(seeds, n_jobs)
+            )
+            replicates = [values for chunk in chunks for values in chunk]
+    else:
+        replicates = _compute_replicates(engine, seeds)
+
+    alpha = (1.0 - confidence_level) / 2.0
+    out = {}
+    for key, value in metrics.items():
+        out[f"{prefix}{key}{suffix}"] = value
+        if isinstance(value, float):
+            values = np.array([replicate[key] for replicate in replicates], dtype=float)
+            values = values[np.logical_not(np.isnan(values))]
+            low, high = (
+                np.quantile(values, [alpha, 1.0 - alpha]).tolist()
+                if values.size
+                else [float("nan"), float("nan")]
+            )
+            out[f"{prefix}{key}_ci_low{suffix}"] = low
+            out[f"{prefix}{key}_ci_high{suffix}"] = high
+    return out
+
+
+def check_bootstrap_method(method: str) -> None:
+    r"""Check the bootstrap resampling method.
+
+    Args:
+        method: The resampling method.
+
+    Raises:
+        ValueError: if ``method`` is not ``'multinomial'`` or
+            ``'poisson'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from arkas.metric.bootstrap import check_bootstrap_method
+    >>> check_bootstrap_method("poisson")
+
+    ```
+    """
+    if method not in {"multinomial", "poisson"}:
+        msg = f"Incorrect 'method': {method}. The valid values are: 'multinomial' and 'poisson'"
+        raise ValueError(msg)
+
+
+class _BaseEngine(ABC):
+    r"""Define the base class to compute a metric on bootstrap
+    replicates.
+
+    Args:
+        metric: The metric function or result class.
+        method: The resampling method.
+        nan_policy: The policy on how to handle NaN values.
+    """
+
+    def __init__(self, metric: Callable, method: str, nan_policy: str) -> None:
+        self._metric = metric
+        self._method = method
+        self._nan_policy = nan_policy
+
+    @abstractmethod
+    def compute(self) -> dict[str, Any]:
+        r"""Compute the metrics on all the samples.
+
+        Returns:
+            The computed metrics.
+        """
+
+    @abstractmethod
+    def compute_replicate(self, rng: np.random.Generator) -> dict[str, Any]:
+        r"""Compute the metrics on a bootstrap replicate.
+
+        Args:
+            rng: The random number generator of the replicate.
+
+        Returns:
+            The computed metrics.
+        """
+
+    def _call(self, y_true: np.ndarray, y_pred: np.ndarray, **kwargs: Any) -> dict[str, Any]:
+        out = self._metric(y_true, y_pred, nan_policy=self._nan_policy, **kwargs)
+        if not isinstance(out, Mapping):
+            out = out.compute_metrics()
+        return out
+
+    def _draw(self, counts: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        r"""Draw the resampled counts of each cell.
+
+        Args:
+            counts: The number of samples in each cell.
+            rng: The random number generator.
+
+        Returns:
+            The resampled counts, with the same shape as ``counts``.
+        """
+        if self._method == "poisson":
+            # The sum of ``k`` independent Poisson(1) weights follows Poisson(k).
+            return rng.poisson(counts)
+        total = counts.sum()
+        if total == 0:
+            return np.zeros_like(counts)
+        return rng.multinomial(total, counts.ravel() / total).reshape(counts.shape)
+
+
+class _ConfusionMatrixEngine(_BaseEngine):
+    r"""Compute the metrics from resampled confusion matrices."""
+
+    def __init__(
+        self, metric: Callable, kernel: ConfusionMatrixKernel, method: str, nan_policy: str
+    ) -> None:
+        super().__init__(metric=metric, method=method, nan_policy=nan_policy)
+        self._kernel = kernel
+
+    def compute(self) -> dict[str, Any]:
+        return self._call(np.array([]), np.array([]), confmat=self._kernel)
+
+    def compute_replicate(self, rng: np.random.Generator) -> dict[str, Any]:
+        if not self._kernel.is_valid:
+            return self.compute()
+        matrix = self._draw(self._kernel.matrix, rng)
+        kernel = ConfusionMatrixKernel.from_matrix(
+            matrix,
+            count=int(matrix.sum()),
+            label_type=self._kernel.label_type,
+            nan_policy=self._nan_policy,
+            labels=self._kernel.labels,
+        )
+        return self._call(np.array([]), np.array([]), confmat=kernel)
+
+
+class _RankingEngine(_BaseEngine):
+    r"""Compute the metrics from the resampled counts of positive and
+    negative samples of each distinct score."""
+
+    def __init__(
+        self,
+        metric: Callable,
+        ranking: BinaryScoreRanking | BinaryScoreHistogram,
+        method: str,
+        nan_policy: str,
+    ) -> None:
+        super().__init__(metric=metric, method=method, nan_policy=nan_policy)
+        self._ranking = ranking
+        tps, fps, self._thresholds = ranking.cumulative_counts()
+        self._counts = np.stack([np.diff(tps, prepend=0), np.diff(fps, prepend=0)])
+
+    def compute(self) -> dict[str, Any]:
+        return self._call(np.array([]), np.array([]), ranking=self._ranking)
+
+    def compute_replicate(self, rng: np.random.Generator) -> dict[str, Any]:
+        positives, negatives = self._draw(self._counts, rng)
+        ranking = BinaryScoreRanking.from_counts(
+            tps=np.cumsum(positives),
+            fps=np.cumsum(negatives),
+            thresholds=self._thresholds,
+            nan_policy=self._nan_policy,
+        )
+        return self._call(np.array([]), np.array([]), ranking=ranking)
+
+
+class _ResamplingEngine(_BaseEngine):
+    r"""Compute the metrics on resampled arrays."""
+
+    def __init__(
+        self,
+        metric: Callable,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        method: str,
+        nan_policy: str,
+    ) -> None:
+        super().__init__(metric=metric, method=method, nan_policy=nan_policy)
+        self._y_true = y_true
+        self._y_pred = y_pred
+
+    def compute(self) -> dict[str, Any]:
+        return self._call(self._y_true, self._y_pred)
+
+    def compute_replicate(self, rng: np.random.Generator) -> dict[str, Any]:
+        n_samples = self._y_true.shape[0]
+        if self._method == "poisson":
+            indices = np.repeat(np.arange(n_samples), rng.poisson(1.0, size=n_samples))
+        else:
+            indices = rng.integers(0, n_samples, size=n_samples)
+        return self._call(self._y_true[indices], self._y_pred[indices])
+
+
+def _compute_replicates(
+    engine: _BaseEngine, seeds: Sequence[np.random.SeedSequence]
+) -> list[dict[str, Any]]:
+    r"""Compute the metrics on the bootstrap replicates.
+
+    Args:
+        engine: The engine used to compute the metrics.
+        seeds: The seed sequence of each replicate.
+
+    Returns:
+        The metrics of each replicate.
+    """
+    return [engine.compute_replicate(np.random.default_rng(seed)) for seed in seeds]
+
+
+def _create_engine(
+    metric: Callable,
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    method: str,
+    label_type: str,
+    n_bins: int | None,
+    nan_policy: str,
+) -> _BaseEngine:
+    r"""Create the engine used to compute the metric on the bootstrap
+    replicates.
+
+    Args:
+        metric: The metric function or result class.
+        y_true: The ground truth target labels or values.
+        y_pred: The predicted labels, scores, or values.
+        method: The resampling method.
+        label_type: The label type of the confusion matrix.
+        n_bins: The maximum number of score buckets.
+        nan_policy: The policy on how to handle NaN values.
+
+    Returns:
+        The engine.
+    """
+    try:
+        parameters = inspect.signature(metric).parameters
+    except (TypeError, ValueError):
+        parameters = {}
+
+    if "confmat" in parameters:
+        label_type = _find_label_type(metric, label_type)
+        if label_type != "multilabel":
+            prepared = prepare_inputs(y_true, y_pred, nan_policy=nan_policy)
+            return _ConfusionMatrixEngine(
+                metric,
+                kernel=ConfusionMatrixKernel.from_prepared(prepared, label_type=label_type),
+                method=method,
+                nan_policy=nan_policy,
+            )
+    if "ranking" in parameters:
+        if n_bins is None:
+            prepared = prepare_inputs(y_true, y_pred, nan_policy=nan_policy, pred_name="y_score")
+            ranking = BinaryScoreRanking.from_prepared(prepared)
+        else:
+            ranking = BinaryScoreHistogram.from_scores(
+                y_true=y_true, y_score=y_pred, n_bins=n_bins, nan_policy=nan_policy
+            )
+        return _RankingEngine(metric, ranking=ranking, method=method, nan_policy=nan_policy)
+    return _ResamplingEngine(
+        metric, y_true=y_true, y_pred=y_pred, method=method, nan_policy=nan_policy
+    )
+
+
+def _find_label_type(metric: Callable, label_type: str) -> str:
+    r"""Find the label type of the confusion matrix used by a metric.
+
+    Args:
+        metric: The metric function or result class.
+        label_type: The label type. If ``'auto'``, the label type is
+            the ``label_type`` string attribute of the metric if it
+            exists, otherwise it is found from the prefix of the
+            function name (e.g. ``binary_precision``) or the class
+            name (e.g. ``BinaryPrecisionResult``).
+
+    Returns:
+        The label type.
+
+    Raises:
+        ValueError: if ``label_type`` is not valid.
+    """
+    if label_type not in {"binary", "multiclass", "multilabel", "auto"}:
+        msg = (
+            f"Incorrect 'label_type': {label_type}. The valid values are: 'binary', "
+            "'multiclass', 'multilabel', and 'auto'"
+        )
+        raise ValueError(msg)
+    if label_type != "auto":
+        return label_type
+    metric = getattr(metric, "func", metric)
+    explicit = getattr(metric, "label_type", None)
+    if isinstance(explicit, str):
+        return _find_label_type(metric, explicit)
+    name = getattr(metric, "__name__", "")
+    for prefix in ["binary", "multiclass", "multilabel"]:
+        # The functions use snake_case names like ``binary_precision``
+        # and the result classes CamelCase names like
+        # ``BinaryPrecisionResult``.
+        camel = prefix.capitalize()
+        if name.startswith(f"{prefix}_") or (
+            name.startswith(camel) and name[len(camel) : len(camel) + 1].isupper()
+        ):
+            return prefix
+    return "multiclass"
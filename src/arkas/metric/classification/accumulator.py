@@ -0,0 +1,642 @@
+r"""Implement mergeable accumulators to compute the label-based
+classification metrics on streams of data."""
+
+from __future__ import annotations
+
+__all__ = [
+    "AccuracyAccumulator",
+    "BalancedAccuracyAccumulator",
+    "BaseConfusionMatrixAccumulator",
+    "ConfusionMatrixAccumulator",
+    "FbetaScoreAccumulator",
+    "JaccardAccumulator",
+    "PrecisionAccumulator",
+    "RecallAccumulator",
+]
+
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import numpy as np
+from coola.utils.format import repr_mapping_line
+
+from arkas.metric.classification.accuracy import accuracy
+from arkas.metric.classification.balanced_accuracy import balanced_accuracy
+from arkas.metric.classification.confmat import (
+    binary_confusion_matrix,
+    multiclass_confusion_matrix,
+    multilabel_confusion_matrix,
+)
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
+from arkas.metric.classification.fbeta import (
+    binary_fbeta_score,
+    multiclass_fbeta_score,
+    multilabel_fbeta_score,
+)
+from arkas.metric.classification.jaccard import (
+    binary_jaccard,
+    multiclass_jaccard,
+    multilabel_jaccard,
+)
+from arkas.metric.classification.precision import (
+    binary_precision,
+    multiclass_precision,
+    multilabel_precision,
+)
+from arkas.metric.classification.recall import (
+    binary_recall,
+    multiclass_recall,
+    multilabel_recall,
+)
+from arkas.metric.utils import check_nan_policy
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+class BaseConfusionMatrixAccumulator:
+    r"""Define the base class to accumulate the confusion matrix over
+    several batches of data.
+
+    Only the confusion matrix and the number of samples are stored,
+    so the memory does not depend on the number of samples. The
+    accumulators computed on different shards of data, for example
+    in different worker processes, can be merged. The metrics are
+    computed by the same functions as the full-data metrics, so
+    they return the same keys and values.
+
+    Args:
+        label_type: The type of labels used to evaluate the metrics.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import PrecisionAccumulator
+    >>> accumulator = PrecisionAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    >>> accumulator.update(y_true=np.array([1, 1]), y_pred=np.array([0, 1]))
+    >>> accumulator.compute()
+    {'count': 5, 'precision': 0.666...}
+
+    ```
+    """
+
+    _metric_functions: ClassVar[dict[str, Callable[..., dict]]] = {}
+
+    def __init__(self, label_type: str = "binary", nan_policy: str = "propagate") -> None:
+        if label_type not in self._metric_functions:
+            msg = (
+                f"Incorrect 'label_type': {label_type}. The valid label types are: "
+                f"{', '.join(map(repr, self._metric_functions))}"
+            )
+            raise ValueError(msg)
+        self._label_type = label_type
+
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+        self._count = 0
+        self._has_nan = False
+        self._labels = None
+        self._matrix = None
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(self.get_args() | {"count": self._count})
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def count(self) -> int:
+        r"""The number of samples accumulated so far."""
+        return self._count
+
+    @property
+    def label_type(self) -> str:
+        return self._label_type
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    def compute(self, prefix: str = "", suffix: str = "") -> dict[str, Any]:
+        r"""Compute the metrics on the accumulated data.
+
+        Args:
+            prefix: The key prefix in the returned dictionary.
+            suffix: The key suffix in the returned dictionary.
+
+        Returns:
+            The computed metrics.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import AccuracyAccumulator
+        >>> accumulator = AccuracyAccumulator()
+        >>> accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+        >>> accumulator.compute()
+        {'accuracy': 0.666..., 'count_correct': 2, 'count_incorrect': 1, 'count': 3, 'error': 0.333...}
+
+        ```
+        """
+        kernel = self.to_kernel()
+        return self._metric_functions[self._label_type](
+            kernel.y_true,
+            kernel.y_pred,
+            prefix=prefix,
+            suffix=suffix,
+            nan_policy=self._nan_policy,
+            confmat=kernel,
+            **self._get_metric_kwargs(),
+        )
+
+    def get_args(self) -> dict:
+        r"""Get the arguments to instantiate an empty accumulator with
+        the same configuration.
+
+        Returns:
+            The arguments.
+        """
+        return {"label_type": self._label_type, "nan_policy": self._nan_policy}
+
+    def merge(self, other: BaseConfusionMatrixAccumulator) -> None:
+        r"""Merge the data accumulated by another accumulator in the
+        current accumulator.
+
+        Args:
+            other: The other accumulator. It must have the same label
+                type and NaN policy as the current accumulator.
+
+        Raises:
+            TypeError: if ``other`` is not a confusion matrix
+                accumulator.
+            ValueError: if ``other`` has a different label type or
+                NaN policy.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import RecallAccumulator
+        >>> accumulator1 = RecallAccumulator()
+        >>> accumulator1.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+        >>> accumulator2 = RecallAccumulator()
+        >>> accumulator2.update(y_true=np.array([1, 1]), y_pred=np.array([0, 1]))
+        >>> accumulator1.merge(accumulator2)
+        >>> accumulator1.compute()
+        {'count': 5, 'recall': 0.666...}
+
+        ```
+        """
+        if not isinstance(other, BaseConfusionMatrixAccumulator):
+            msg = f"Incorrect accumulator type: {type(other)}"
+            raise TypeError(msg)
+        if other.label_type != self._label_type or other.nan_policy != self._nan_policy:
+            msg = (
+                "The accumulators must have the same label type and NaN policy, but received "
+                f"({self._label_type!r}, {self._nan_policy!r}) and "
+                f"({other.label_type!r}, {other.nan_policy!r})"
+            )
+            raise ValueError(msg)
+        if other._matrix is None:
+            return
+        self._add(
+            matrix=other._matrix, labels=other._labels, count=other._count, has_nan=other._has_nan
+        )
+
+    def to_kernel(self) -> ConfusionMatrixKernel:
+        r"""Return a confusion matrix kernel with the accumulated
+        confusion matrix.
+
+        Returns:
+            The confusion matrix kernel.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import ConfusionMatrixAccumulator
+        >>> accumulator = ConfusionMatrixAccumulator()
+        >>> accumulator.update(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1]))
+        >>> accumulator.to_kernel().matrix
+        array([[1, 1], [1, 2]])
+
+        ```
+        """
+        matrix, labels = self._matrix, self._labels
+        if matrix is None:
+            matrix, labels = _empty_matrix(self._label_type)
+        return ConfusionMatrixKernel.from_matrix(
+            matrix=matrix,
+            count=self._count,
+            label_type=self._label_type,
+            nan_policy=self._nan_policy,
+            has_nan=self._has_nan,
+            labels=labels,
+        )
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        r"""Update the accumulator with a new batch of data.
+
+        Args:
+            y_true: The ground truth target labels of the batch.
+            y_pred: The predicted labels of the batch.
+
+        Raises:
+            ValueError: if the batch contains NaN values and
+                ``nan_policy`` is ``'raise'``.
+            ValueError: if the number of classes of a multilabel
+                batch is different from the previous batches.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import JaccardAccumulator
+        >>> accumulator = JaccardAccumulator()
+        >>> accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+        >>> accumulator.count
+        3
+
+        ```
+        """
+        kernel = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type=self._label_type, nan_policy=self._nan_policy
+        )
+        if kernel.count == 0:
+            # The empty batches are ignored, so they do not fix the
+            # number of classes of the multilabel confusion matrix.
+            return
+        self._add(
+            matrix=kernel.matrix, labels=kernel.labels, count=kernel.count, has_nan=kernel.has_nan
+        )
+
+    def _add(self, matrix: np.ndarray, labels: np.ndarray, count: int, has_nan: bool) -> None:
+        r"""Add a confusion matrix to the accumulated confusion matrix.
+
+        Args:
+            matrix: The confusion matrix to add.
+            labels: The labels associated to the confusion matrix.
+            count: The number of samples used to compute the
+                confusion matrix.
+            has_nan: ``True`` if the data used to compute the
+                confusion matrix contain NaN values.
+
+        Raises:
+            ValueError: if the multilabel confusion matrices have a
+                different number of classes.
+        """
+        if self._matrix is None:
+            self._matrix, self._labels = matrix.copy(), labels
+        elif self._label_type == "multiclass":
+            self._matrix, self._labels = _merge_multiclass_matrices(
+                self._matrix, self._labels, matrix, labels
+            )
+        else:
+            if matrix.shape != self._matrix.shape:
+                msg = (
+                    f"Incorrect number of classes: {matrix.shape[0]} but the previous batches "
+                    f"have {self._matrix.shape[0]} classes"
+                )
+                raise ValueError(msg)
+            self._matrix += matrix
+        self._count += count
+        self._has_nan = self._has_nan or has_nan
+
+    def _get_metric_kwargs(self) -> dict:
+        r"""Get the extra keyword arguments of the metric function.
+
+        Returns:
+            The keyword arguments.
+        """
+        return {}
+
+
+class AccuracyAccumulator(BaseConfusionMatrixAccumulator):
+    r"""Implement a mergeable accumulator to compute the accuracy
+    metrics.
+
+    Args:
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import AccuracyAccumulator
+    >>> accumulator = AccuracyAccumulator()
+    >>> accumulator.update(y_true=np.array([0, 1, 2]), y_pred=np.array([0, 1, 1]))
+    >>> accumulator.update(y_true=np.array([2, 1]), y_pred=np.array([2, 1]))
+    >>> accumulator.compute()
+    {'accuracy': 0.8, 'count_correct': 4, 'count_incorrect': 1, 'count': 5, 'error': 0.199...}
+
+    ```
+    """
+
+    _metric_functions: ClassVar[dict[str, Callable[..., dict]]] = {"multiclass": accuracy}
+
+    def __init__(self, nan_policy: str = "propagate") -> None:
+        super().__init__(label_type="multiclass", nan_policy=nan_policy)
+
+    def get_args(self) -> dict:
+        return {"nan_policy": self._nan_policy}
+
+
+class BalancedAccuracyAccumulator(BaseConfusionMatrixAccumulator):
+    r"""Implement a mergeable accumulator to compute the balanced
+    accuracy metrics.
+
+    Args:
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import BalancedAccuracyAccumulator
+    >>> accumulator = BalancedAccuracyAccumulator()
+    >>> accumulator.update(y_true=np.array([0, 1, 2]), y_pred=np.array([0, 1, 1]))
+    >>> accumulator.update(y_true=np.array([2, 1]), y_pred=np.array([2, 1]))
+    >>> accumulator.compute()
+    {'balanced_accuracy': 0.833..., 'count': 5}
+
+    ```
+    """
+
+    _metric_functions: ClassVar[dict[str, Callable[..., dict]]] = {"multiclass": balanced_accuracy}
+
+    def __init__(self, nan_policy: str = "propagate") -> None:
+        super().__init__(label_type="multiclass", nan_policy=nan_policy)
+
+    def get_args(self) -> dict:
+        return {"nan_policy": self._nan_policy}
+
+
+class ConfusionMatrixAccumulator(BaseConfusionMatrixAccumulator):
+    r"""Implement a mergeable accumulator to compute the confusion
+    matrix metrics.
+
+    Args:
+        label_type: The type of labels used to evaluate the metrics.
+            The valid values are: ``'binary'``, ``'multiclass'``,
+            and ``'multilabel'``.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import ConfusionMatrixAccumulator
+    >>> accumulator = ConfusionMatrixAccumulator(label_type="multiclass")
+    >>> accumulator.update(y_true=np.array([0, 1, 2]), y_pred=np.array([0, 1, 1]))
+    >>> accumulator.update(y_true=np.array([2, 1]), y_pred=np.array([2, 1]))
+    >>> accumulator.compute()
+    {'confusion_matrix': array([[1, 0, 0], [0, 2, 0], [0, 1, 1]]), 'count': 5}
+
+    ```
+    """
+
+    _metric_functions: ClassVar[dict[str, Callable[..., dict]]] = {
+        "binary": binary_confusion_matrix,
+        "multiclass": multiclass_confusion_matrix,
+        "multilabel": multilabel_confusion_matrix,
+    }
+
+
+class FbetaScoreAccumulator(BaseConfusionMatrixAccumulator):
+    r"""Implement a mergeable accumulator to compute the F-beta
+    metrics.
+
+    Args:
+        betas: The betas used to compute the F-beta scores.
+        label_type: The type of labels used to evaluate the metrics.
+            The valid values are: ``'binary'``, ``'multiclass'``,
+            and ``'multilabel'``.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import FbetaScoreAccumulator
+    >>> accumulator = FbetaScoreAccumulator(betas=[0.5, 1, 2])
+    >>> accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    >>> accumulator.update(y_true=np.array([1, 1]), y_pred=np.array([0, 1]))
+    >>> accumulator.compute()
+    {'count': 5, 'f0.5': 0.666..., 'f1': 0.666..., 'f2': 0.666...}
+
+    ```
+    """
+
+    _metric_functions: ClassVar[dict[str, Callable[..., dict]]] = {
+        "binary": binary_fbeta_score,
+        "multiclass": multiclass_fbeta_score,
+        "multilabel": multilabel_fbeta_score,
+    }
+
+    def __init__(
+        self,
+        betas: Sequence[float] = (1,),
+        label_type: str = "binary",
+        nan_policy: str = "propagate",
+    ) -> None:
+        super().__init__(label_type=label_type, nan_policy=nan_policy)
+        self._betas = tuple(betas)
+
+    @property
+    def betas(self) -> tuple[float, ...]:
+        return self._betas
+
+    def get_args(self) -> dict:
+        return {"betas": self._betas} | super().get_args()
+
+    def merge(self, other: BaseConfusionMatrixAccumulator) -> None:
+        if isinstance(other, FbetaScoreAccumulator) and other.betas != self._betas:
+            msg = (
+                "The accumulators must have the same betas, but received "
+                f"{self._betas} and {other.betas}"
+            )
+            raise ValueError(msg)
+        super().merge(other)
+
+    def _get_metric_kwargs(self) -> dict:
+        return {"betas": self._betas}
+
+
+class JaccardAccumulator(BaseConfusionMatrixAccumulator):
+    r"""Implement a mergeable accumulator to compute the Jaccard
+    metrics.
+
+    Args:
+        label_type: The type of labels used to evaluate the metrics.
+            The valid values are: ``'binary'``, ``'multiclass'``,
+            and ``'multilabel'``.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import JaccardAccumulator
+    >>> accumulator = JaccardAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    >>> accumulator.update(y_true=np.array([1, 1]), y_pred=np.array([0, 1]))
+    >>> accumulator.compute()
+    {'count': 5, 'jaccard': 0.5}
+
+    ```
+    """
+
+    _metric_functions: ClassVar[dict[str, Callable[..., dict]]] = {
+        "binary": binary_jaccard,
+        "multiclass": multiclass_jaccard,
+        "multilabel": multilabel_jaccard,
+    }
+
+
+class PrecisionAccumulator(BaseConfusionMatrixAccumulator):
+    r"""Implement a mergeable accumulator to compute the precision
+    metrics.
+
+    Args:
+        label_type: The type of labels used to evaluate the metrics.
+            The valid values are: ``'binary'``, ``'multiclass'``,
+            and ``'multilabel'``.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import PrecisionAccumulator
+    >>> accumulator = PrecisionAccumulator(label_type="multiclass")
+    >>> accumulator.update(y_true=np.array([0, 1, 2]), y_pred=np.array([0, 1, 1]))
+    >>> accumulator.update(y_true=np.array([2, 1]), y_pred=np.array([2, 1]))
+    >>> accumulator.compute()
+    {'count': 5,
+     'macro_precision': 0.888...,
+     'micro_precision': 0.8,
+     'precision': array([1. , 0.666..., 1. ]),
+     'weighted_precision': 0.866...}
+
+    ```
+    """
+
+    _metric_functions: ClassVar[dict[str, Callable[..., dict]]] = {
+        "binary": binary_precision,
+        "multiclass": multiclass_precision,
+        "multilabel": multilabel_precision,
+    }
+
+
+class RecallAccumulator(BaseConfusionMatrixAccumulator):
+    r"""Implement a mergeable accumulator to compute the recall
+    metrics.
+
+    Args:
+        label_type: The type of labels used to evaluate the metrics.
+            The valid values are: ``'binary'``, ``'multiclass'``,
+            and ``'multilabel'``.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import RecallAccumulator
+    >>> accumulator = RecallAccumulator(label_type="multilabel")
+    >>> accumulator.update(
+    ...     y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0]]),
+    ...     y_pred=np.array([[1, 0, 0], [0, 1, 1], [0, 1, 1]]),
+    ... )
+    >>> accumulator.update(
+    ...     y_true=np.array([[1, 0, 1], [1, 0, 1]]),
+    ...     y_pred=np.array([[1, 0, 0], [1, 0, 0]]),
+    ... )
+    >>> accumulator.compute()
+    {'count': 5,
+     'macro_recall': 0.666...,
+     'micro_recall': 0.625,
+     'recall': array([1., 1., 0.]),
+     'weighted_recall': 0.625}
+
+    ```
+    """
+
+    _metric_functions: ClassVar[dict[str, Callable[..., dict]]] = {
+        "binary": binary_recall,
+        "multiclass": multiclass_recall,
+        "multilabel": multilabel_recall,
+    }
+
+
+def _empty_matrix(label_type: str) -> tuple[np.ndarray, np.ndarray]:
+    r"""Return the confusion matrix and labels when no data was
+    accumulated.
+
+    Args:
+        label_type: The type of labels.
+
+    Returns:
+        A tuple with the empty confusion matrix and its labels.
+    """
+    if label_type == "binary":
+        return np.zeros((2, 2), dtype=np.int64), np.array([0, 1])
+    if label_type == "multiclass":
+        return np.zeros((0, 0), dtype=np.int64), np.array([])
+    return np.zeros((0, 2, 2), dtype=np.int64), np.array([], dtype=np.int64)
+
+
+def _merge_multiclass_matrices(
+    matrix1: np.ndarray, labels1: np.ndarray, matrix2: np.ndarray, labels2: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""Merge two multiclass confusion matrices with possibly different
+    labels.
+
+    Args:
+        matrix1: The first confusion matrix.
+        labels1: The sorted labels of the first confusion matrix.
+        matrix2: The second confusion matrix.
+        labels2: The sorted labels of the second confusion matrix.
+
+    Returns:
+        A tuple with the merged confusion matrix and its sorted
+            labels.
+    """
+    if labels1.shape == labels2.shape and np.array_equal(labels1, labels2):
+        return matrix1 + matrix2, labels1
+    labels = np.union1d(labels1, labels2)
+    matrix = np.zeros((labels.shape[0], labels.shape[0]), dtype=np.int64)
+    for mat, lab in [(matrix1, labels1), (matrix2, labels2)]:
+        idx = np.searchsorted(labels, lab)
+        matrix[np.ix_(idx, idx)] += mat
+    return matrix, labels
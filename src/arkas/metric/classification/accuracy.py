@@ -7,9 +7,7 @@ __all__ = ["accuracy"]
 
 from typing import TYPE_CHECKING
 
-from sklearn import metrics
-
-from arkas.metric.utils import contains_nan, preprocess_pred
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
 
 if TYPE_CHECKING:
     import numpy as np
@@ -22,6 +20,7 @@ def accuracy(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float]:
     r"""Return the accuracy metrics.
 
@@ -33,6 +32,11 @@ def accuracy(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional binary or multiclass confusion matrix
+            kernel built on the same ``y_true``, ``y_pred``, and
+            ``nan_policy``. It can be shared between several metrics
+            to compute the confusion matrix only once. If ``None``,
+            a new multiclass confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -48,16 +52,14 @@ def accuracy(
 
     ```
     """
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-
-    count = y_true.size
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="multiclass", nan_policy=nan_policy
+        )
+    count = confmat.count
     acc, correct = float("nan"), float("nan")
-    if count > 0 and not y_true_nan and not y_pred_nan:
-        correct = int(metrics.accuracy_score(y_true=y_true, y_pred=y_pred, normalize=False))
+    if confmat.is_valid:
+        correct = confmat.count_correct()
         acc = float(correct / count)
     return {
         f"{prefix}accuracy{suffix}": acc,
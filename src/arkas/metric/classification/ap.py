@@ -12,12 +12,22 @@ __all__ = [
 
 
 import numpy as np
-from sklearn import metrics
 
+from arkas.metric.classification.score_histogram import BinaryScoreHistogram
+from arkas.metric.classification.score_ranking import (
+    BinaryScoreRanking,
+    average_binary_scores,
+    binarize_multiclass_labels,
+    columnwise_average_precision,
+)
+from arkas.metric.classification.sparse import (
+    sparse_columnwise_average_precision,
+    sparse_micro_average_precision,
+)
 from arkas.metric.utils import (
     check_label_type,
     contains_nan,
-    preprocess_score_binary,
+    is_sparse,
     preprocess_score_multiclass,
     preprocess_score_multilabel,
 )
@@ -135,6 +145,8 @@ def binary_average_precision(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    ranking: BinaryScoreRanking | BinaryScoreHistogram | None = None,
+    n_bins: int | None = None,
 ) -> dict[str, float]:
     r"""Return the average precision metrics for binary labels.
 
@@ -150,6 +162,16 @@ def binary_average_precision(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        ranking: An optional ranking engine built on the same
+            ``y_true``, ``y_score``, and ``nan_policy``. It can be
+            shared between several metrics to sort the scores only
+            once. A ``BinaryScoreHistogram`` can be used to
+            approximate the metric in linear time. If ``None``, a new
+            ranking engine is created.
+        n_bins: If not ``None`` and ``ranking`` is ``None``, the
+            metric is approximated with a ``BinaryScoreHistogram``
+            with at most ``n_bins`` score buckets instead of sorting
+            the scores.
 
     Returns:
         The computed metrics.
@@ -168,17 +190,16 @@ def binary_average_precision(
 
     ```
     """
-    y_true, y_score = preprocess_score_binary(
-        y_true=y_true, y_score=y_score, drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_score_nan = contains_nan(arr=y_score, nan_policy=nan_policy, name="'y_score'")
-
-    count = y_true.size
-    ap = float("nan")
-    if count > 0 and not y_true_nan and not y_score_nan:
-        ap = float(metrics.average_precision_score(y_true=y_true, y_score=y_score))
-    return {f"{prefix}average_precision{suffix}": ap, f"{prefix}count{suffix}": count}
+    if ranking is None and n_bins is not None:
+        ranking = BinaryScoreHistogram.from_scores(
+            y_true=y_true, y_score=y_score, n_bins=n_bins, nan_policy=nan_policy
+        )
+    if ranking is None:
+        ranking = BinaryScoreRanking(y_true=y_true, y_score=y_score, nan_policy=nan_policy)
+    return {
+        f"{prefix}average_precision{suffix}": ranking.average_precision(),
+        f"{prefix}count{suffix}": ranking.count,
+    }
 
 
 def multiclass_average_precision(
@@ -305,7 +326,9 @@ def _average_precision(
 
     Args:
         y_true: The ground truth target labels. This input must
-            be an array of shape ``(n_samples, n_classes)``.
+            be an array of shape ``(n_samples, n_classes)`` for
+            multilabel labels or ``(n_samples,)`` for multiclass
+            labels.
         y_score: The target scores, can either be probability
             estimates of the positive class, confidence values,
             or non-thresholded measure of decisions. This input must
@@ -326,14 +349,19 @@ def _average_precision(
     macro, micro, weighted = float("nan"), float("nan"), float("nan")
     ap = np.array([])
     if n_samples > 0 and not y_true_nan and not y_score_nan:
-        macro = metrics.average_precision_score(y_true=y_true, y_score=y_score, average="macro")
-        micro = metrics.average_precision_score(y_true=y_true, y_score=y_score, average="micro")
-        weighted = metrics.average_precision_score(
-            y_true=y_true, y_score=y_score, average="weighted"
-        )
-        ap = np.asarray(
-            metrics.average_precision_score(y_true=y_true, y_score=y_score, average=None)
-        ).ravel()
+        if y_true.ndim == 1:
+            y_true = binarize_multiclass_labels(y_true, n_classes=y_score.shape[1])
+        # The per-class scores are computed once and the averages are derived from them.
+        if is_sparse(y_true):
+            ap = sparse_columnwise_average_precision(y_true=y_true, y_score=y_score)
+            micro = sparse_micro_average_precision(y_true=y_true, y_score=y_score)
+        else:
+            ap = columnwise_average_precision(y_true=y_true, y_score=y_score)
+            micro = BinaryScoreRanking(
+                y_true=y_true.ravel(), y_score=y_score.ravel()
+            ).average_precision()
+        averages = average_binary_scores(scores=ap, y_true=y_true)
+        macro, weighted = averages["macro"], averages["weighted"]
 
     return {
         f"{prefix}average_precision{suffix}": ap,
@@ -0,0 +1,789 @@
+r"""Implement the probabilistic classification metrics: the log loss,
+the Brier score, and the calibration errors.
+
+The predictions are processed in chunks of rows, and the logits are
+normalized with a stable log-sum-exp in each chunk, so the softmax of
+all the predictions is never materialized.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "BaseCalibrationAccumulator",
+    "BrierScoreAccumulator",
+    "CalibrationErrorAccumulator",
+    "LogLossAccumulator",
+    "brier_score",
+    "expected_calibration_error",
+    "log_loss",
+]
+
+from typing import Any, ClassVar
+
+import numpy as np
+from coola.utils.format import repr_mapping_line
+
+from arkas.metric.utils import (
+    check_nan_policy,
+    check_same_shape_score,
+    contains_nan,
+    preprocess_score_multiclass,
+)
+
+# Maximum number of values of a chunk, so the temporary arrays of a
+# chunk use at most 8 MB with float64 values.
+_CHUNK_NUM_VALUES = 2**20
+
+
+class BaseCalibrationAccumulator:
+    r"""Define the base class to accumulate the statistics of the
+    probabilistic classification metrics over several batches of
+    data.
+
+    Only the sums of the per-sample losses and the reliability bins
+    are stored, so the memory does not depend on the number of
+    samples. The batches are processed in chunks of rows, so the
+    temporary arrays do not depend on the batch size. The
+    accumulators computed on different shards of data can be merged.
+
+    The predictions are binary if ``y_score`` is an array of shape
+    ``(n_samples,)`` with the probability (or logit) of the positive
+    class, and multiclass if ``y_score`` is an array of shape
+    ``(n_samples, n_classes)`` with the probabilities (or logits) of
+    each class. The reliability bins use the confidence of the
+    predicted class (top-label calibration).
+
+    Args:
+        n_bins: The number of bins of the reliability diagram, over
+            the confidence range ``[0, 1]``.
+        from_logits: If ``True``, ``y_score`` contains logits and the
+            probabilities are computed with a sigmoid (binary) or a
+            softmax (multiclass). Otherwise, ``y_score`` contains
+            probabilities.
+        chunk_size: The number of rows of each chunk. If ``None``,
+            the number of rows is chosen so that a chunk has about
+            one million values.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Raises:
+        ValueError: if ``n_bins`` or ``chunk_size`` is not a positive
+            integer.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import BaseCalibrationAccumulator
+    >>> accumulator = BaseCalibrationAccumulator(n_bins=5)
+    >>> accumulator.update(y_true=np.array([1, 0, 0]), y_score=np.array([0.9, 0.2, 0.6]))
+    >>> accumulator.update(y_true=np.array([1, 1]), y_score=np.array([0.7, 0.8]))
+    >>> accumulator.compute()
+    {'count': 5,
+     'brier_score': 0.108...,
+     'expected_calibration_error': 0.159...,
+     'log_loss': 0.3649...,
+     'max_calibration_error': 0.166...}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = (
+        "brier_score",
+        "expected_calibration_error",
+        "log_loss",
+        "max_calibration_error",
+    )
+
+    def __init__(
+        self,
+        n_bins: int = 10,
+        from_logits: bool = False,
+        chunk_size: int | None = None,
+        nan_policy: str = "propagate",
+    ) -> None:
+        if n_bins < 1:
+            msg = f"Incorrect 'n_bins': {n_bins}. The number of bins must be greater than 0"
+            raise ValueError(msg)
+        self._n_bins = int(n_bins)
+        self._from_logits = bool(from_logits)
+        if chunk_size is not None and chunk_size < 1:
+            msg = f"Incorrect 'chunk_size': {chunk_size}. The chunk size must be greater than 0"
+            raise ValueError(msg)
+        self._chunk_size = chunk_size
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+        self._count = 0
+        self._has_nan = False
+        self._num_classes = None
+        self._log_loss_sum = 0.0
+        self._brier_score_sum = 0.0
+        self._bin_count = np.zeros(self._n_bins, dtype=np.int64)
+        self._bin_confidence = np.zeros(self._n_bins)
+        self._bin_correct = np.zeros(self._n_bins)
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(self.get_args() | {"count": self._count})
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def count(self) -> int:
+        r"""The number of samples accumulated so far."""
+        return self._count
+
+    @property
+    def from_logits(self) -> bool:
+        return self._from_logits
+
+    @property
+    def n_bins(self) -> int:
+        return self._n_bins
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    def compute(self, prefix: str = "", suffix: str = "") -> dict[str, Any]:
+        r"""Compute the metrics on the accumulated data.
+
+        Args:
+            prefix: The key prefix in the returned dictionary.
+            suffix: The key suffix in the returned dictionary.
+
+        Returns:
+            The computed metrics.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import LogLossAccumulator
+        >>> accumulator = LogLossAccumulator()
+        >>> accumulator.update(y_true=np.array([1, 0, 0]), y_score=np.array([0.9, 0.2, 0.6]))
+        >>> accumulator.compute()
+        {'count': 3, 'log_loss': 0.4149...}
+
+        ```
+        """
+        metrics = {
+            "brier_score": float("nan"),
+            "expected_calibration_error": float("nan"),
+            "log_loss": float("nan"),
+            "max_calibration_error": float("nan"),
+        }
+        num_samples = int(self._bin_count.sum())
+        if num_samples > 0 and not self._has_nan:
+            gap = np.abs(self._bin_correct - self._bin_confidence)
+            nonempty = self._bin_count > 0
+            metrics = {
+                "brier_score": self._brier_score_sum / num_samples,
+                "expected_calibration_error": float(gap.sum() / num_samples),
+                "log_loss": self._log_loss_sum / num_samples,
+                "max_calibration_error": float((gap[nonempty] / self._bin_count[nonempty]).max()),
+            }
+        out = {"count": self._count} | {name: metrics[name] for name in self._metric_names}
+        return {f"{prefix}{key}{suffix}": value for key, value in out.items()}
+
+    def get_args(self) -> dict:
+        r"""Get the arguments to instantiate an empty accumulator with
+        the same configuration.
+
+        Returns:
+            The arguments.
+        """
+        return {
+            "n_bins": self._n_bins,
+            "from_logits": self._from_logits,
+            "chunk_size": self._chunk_size,
+            "nan_policy": self._nan_policy,
+        }
+
+    def merge(self, other: BaseCalibrationAccumulator) -> None:
+        r"""Merge the data accumulated by another accumulator in the
+        current accumulator.
+
+        Args:
+            other: The other accumulator. It must have the same number
+                of bins and NaN policy as the current accumulator.
+
+        Raises:
+            TypeError: if ``other`` is not a calibration accumulator.
+            ValueError: if ``other`` has a different number of bins,
+                NaN policy, or number of classes.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BrierScoreAccumulator
+        >>> accumulator1 = BrierScoreAccumulator()
+        >>> accumulator1.update(y_true=np.array([1, 0, 0]), y_score=np.array([0.9, 0.2, 0.6]))
+        >>> accumulator2 = BrierScoreAccumulator()
+        >>> accumulator2.update(y_true=np.array([1, 1]), y_score=np.array([0.7, 0.8]))
+        >>> accumulator1.merge(accumulator2)
+        >>> accumulator1.compute()
+        {'count': 5, 'brier_score': 0.108...}
+
+        ```
+        """
+        if not isinstance(other, BaseCalibrationAccumulator):
+            msg = f"Incorrect accumulator type: {type(other)}"
+            raise TypeError(msg)
+        if other.n_bins != self._n_bins or other.nan_policy != self._nan_policy:
+            msg = (
+                "The accumulators must have the same number of bins and NaN policy, but "
+                f"received ({self._n_bins}, {self._nan_policy!r}) and "
+                f"({other.n_bins}, {other.nan_policy!r})"
+            )
+            raise ValueError(msg)
+        if other._num_classes is not None:
+            self._check_num_classes(other._num_classes)
+        self._count += other._count
+        self._has_nan = self._has_nan or other._has_nan
+        self._log_loss_sum += other._log_loss_sum
+        self._brier_score_sum += other._brier_score_sum
+        self._bin_count += other._bin_count
+        self._bin_confidence += other._bin_confidence
+        self._bin_correct += other._bin_correct
+
+    def update(self, y_true: np.ndarray, y_score: np.ndarray) -> None:
+        r"""Update the accumulator with a new batch of data.
+
+        Args:
+            y_true: The ground truth target labels of the batch. This
+                input must be an array of shape ``(n_samples,)`` with
+                values in ``{0, 1}`` (binary) or
+                ``{0, ..., n_classes - 1}`` (multiclass).
+            y_score: The predicted probabilities or logits of the
+                batch. This input must be an array of shape
+                ``(n_samples,)`` (binary) or
+                ``(n_samples, n_classes)`` (multiclass).
+
+        Raises:
+            RuntimeError: if ``y_true`` and ``y_score`` have
+                incompatible shapes.
+            ValueError: if ``y_score`` has no class column.
+            ValueError: if the batch contains NaN values and
+                ``nan_policy`` is ``'raise'``.
+            ValueError: if ``y_true`` contains an incorrect label.
+            ValueError: if the number of classes is different from the
+                previous batches.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import LogLossAccumulator
+        >>> accumulator = LogLossAccumulator(from_logits=True)
+        >>> accumulator.update(
+        ...     y_true=np.array([0, 2, 1]),
+        ...     y_score=np.array([[2.0, 0.5, -1.0], [0.1, 0.2, 3.0], [1.0, 1.0, 1.0]]),
+        ... )
+        >>> accumulator.count
+        3
+
+        ```
+        """
+        if y_score.ndim == 2 and y_score.shape[1] == 0:
+            msg = (
+                f"Incorrect 'y_score' shape: {y_score.shape}. "
+                "The number of classes must be greater than 0"
+            )
+            raise ValueError(msg)
+        if y_score.ndim == 1:
+            y_true = y_true.ravel()
+            check_same_shape_score(y_true, y_score)
+        else:
+            y_true, y_score = preprocess_score_multiclass(y_true, y_score)
+        if y_true.shape[0] == 0:
+            return
+        num_classes = 2 if y_score.ndim == 1 else y_score.shape[1]
+        self._check_num_classes(num_classes)
+        chunk_size = self._chunk_size or max(1, _CHUNK_NUM_VALUES // num_classes)
+        for start in range(0, y_true.shape[0], chunk_size):
+            self._update_chunk(
+                y_true[start : start + chunk_size], y_score[start : start + chunk_size]
+            )
+
+    def _check_num_classes(self, num_classes: int) -> None:
+        r"""Check the number of classes is the same as the previous
+        batches.
+
+        Args:
+            num_classes: The number of classes of the new data.
+
+        Raises:
+            ValueError: if the number of classes is different from the
+                previous batches.
+        """
+        if self._num_classes is None:
+            self._num_classes = num_classes
+        elif num_classes != self._num_classes:
+            msg = (
+                f"Incorrect number of classes: {num_classes} but the previous batches "
+                f"have {self._num_classes} classes"
+            )
+            raise ValueError(msg)
+
+    def _update_chunk(self, y_true: np.ndarray, y_score: np.ndarray) -> None:
+        r"""Update the accumulator with a chunk of rows.
+
+        Args:
+            y_true: The ground truth target labels of the chunk.
+            y_score: The predicted probabilities or logits of the
+                chunk.
+        """
+        isnan = np.isnan(y_true) if y_true.dtype.kind == "f" else np.zeros(y_true.shape, bool)
+        isnan |= np.isnan(y_score) if y_score.ndim == 1 else np.isnan(y_score).any(axis=1)
+        count = y_true.shape[0]
+        if isnan.any():
+            contains_nan(y_true, nan_policy=self._nan_policy, name="'y_true'")
+            contains_nan(y_score, nan_policy=self._nan_policy, name="'y_score'")
+            if self._nan_policy == "propagate":
+                self._has_nan = True
+            else:
+                count -= int(isnan.sum())
+            mask = np.logical_not(isnan)
+            y_true, y_score = y_true[mask], y_score[mask]
+        self._count += count
+
+        labels = _to_labels(y_true, num_classes=self._num_classes)
+        if y_score.ndim == 1:
+            stats = _binary_stats(labels, y_score, from_logits=self._from_logits)
+        else:
+            stats = _multiclass_stats(labels, y_score, from_logits=self._from_logits)
+        log_loss_, brier, confidence, correct = stats
+        self._log_loss_sum += float(log_loss_.sum())
+        self._brier_score_sum += float(brier.sum())
+        bins = np.minimum((confidence * self._n_bins).astype(np.int64), self._n_bins - 1)
+        self._bin_count += np.bincount(bins, minlength=self._n_bins)
+        self._bin_confidence += np.bincount(bins, weights=confidence, minlength=self._n_bins)
+        self._bin_correct += np.bincount(bins, weights=correct, minlength=self._n_bins)
+
+
+class BrierScoreAccumulator(BaseCalibrationAccumulator):
+    r"""Implement a mergeable accumulator to compute the Brier score.
+
+    The Brier score of a binary prediction is the squared error
+    between the probability of the positive class and the label. The
+    Brier score of a multiclass prediction is the sum over the classes
+    of the squared errors between the probabilities and the one-hot
+    encoded label.
+
+    Args:
+        from_logits: If ``True``, ``y_score`` contains logits.
+            Otherwise, ``y_score`` contains probabilities.
+        chunk_size: The number of rows of each chunk. If ``None``,
+            the number of rows is chosen so that a chunk has about
+            one million values.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import BrierScoreAccumulator
+    >>> accumulator = BrierScoreAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 0, 0]), y_score=np.array([0.9, 0.2, 0.6]))
+    >>> accumulator.update(y_true=np.array([1, 1]), y_score=np.array([0.7, 0.8]))
+    >>> accumulator.compute()
+    {'count': 5, 'brier_score': 0.108...}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = ("brier_score",)
+
+    def __init__(
+        self,
+        from_logits: bool = False,
+        chunk_size: int | None = None,
+        nan_policy: str = "propagate",
+    ) -> None:
+        super().__init__(from_logits=from_logits, chunk_size=chunk_size, nan_policy=nan_policy)
+
+    def get_args(self) -> dict:
+        return {
+            "from_logits": self._from_logits,
+            "chunk_size": self._chunk_size,
+            "nan_policy": self._nan_policy,
+        }
+
+
+class CalibrationErrorAccumulator(BaseCalibrationAccumulator):
+    r"""Implement a mergeable accumulator to compute the expected and
+    maximum calibration errors.
+
+    The samples are grouped in equal-width bins of confidence of the
+    predicted class. The expected calibration error is the average
+    over the bins of the absolute difference between the accuracy and
+    the mean confidence, weighted by the number of samples in each
+    bin. The maximum calibration error is the largest absolute
+    difference over the non-empty bins.
+
+    Args:
+        n_bins: The number of bins of the reliability diagram, over
+            the confidence range ``[0, 1]``.
+        from_logits: If ``True``, ``y_score`` contains logits.
+            Otherwise, ``y_score`` contains probabilities.
+        chunk_size: The number of rows of each chunk. If ``None``,
+            the number of rows is chosen so that a chunk has about
+            one million values.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import CalibrationErrorAccumulator
+    >>> accumulator = CalibrationErrorAccumulator(n_bins=5)
+    >>> accumulator.update(y_true=np.array([1, 0, 0]), y_score=np.array([0.9, 0.2, 0.6]))
+    >>> accumulator.update(y_true=np.array([1, 1]), y_score=np.array([0.7, 0.8]))
+    >>> accumulator.compute()
+    {'count': 5, 'expected_calibration_error': 0.159..., 'max_calibration_error': 0.166...}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = (
+        "expected_calibration_error",
+        "max_calibration_error",
+    )
+
+
+class LogLossAccumulator(BaseCalibrationAccumulator):
+    r"""Implement a mergeable accumulator to compute the log loss.
+
+    The probabilities are clipped to ``[eps, 1]`` before computing the
+    logarithm, where ``eps`` is the machine epsilon of float64. The
+    logits are not clipped.
+
+    Args:
+        from_logits: If ``True``, ``y_score`` contains logits.
+            Otherwise, ``y_score`` contains probabilities.
+        chunk_size: The number of rows of each chunk. If ``None``,
+            the number of rows is chosen so that a chunk has about
+            one million values.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import LogLossAccumulator
+    >>> accumulator = LogLossAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 0, 0]), y_score=np.array([0.9, 0.2, 0.6]))
+    >>> accumulator.update(y_true=np.array([1, 1]), y_score=np.array([0.7, 0.8]))
+    >>> accumulator.compute()
+    {'count': 5, 'log_loss': 0.3649...}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = ("log_loss",)
+
+    def __init__(
+        self,
+        from_logits: bool = False,
+        chunk_size: int | None = None,
+        nan_policy: str = "propagate",
+    ) -> None:
+        super().__init__(from_logits=from_logits, chunk_size=chunk_size, nan_policy=nan_policy)
+
+    def get_args(self) -> dict:
+        return {
+            "from_logits": self._from_logits,
+            "chunk_size": self._chunk_size,
+            "nan_policy": self._nan_policy,
+        }
+
+
+def brier_score(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    *,
+    from_logits: bool = False,
+    chunk_size: int | None = None,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> dict[str, float]:
+    r"""Return the Brier score.
+
+    Args:
+        y_true: The ground truth target labels. This input must be an
+            array of shape ``(n_samples,)`` with values in ``{0, 1}``
+            (binary) or ``{0, ..., n_classes - 1}`` (multiclass).
+        y_score: The predicted probabilities or logits. This input
+            must be an array of shape ``(n_samples,)`` (binary) or
+            ``(n_samples, n_classes)`` (multiclass).
+        from_logits: If ``True``, ``y_score`` contains logits.
+            Otherwise, ``y_score`` contains probabilities.
+        chunk_size: The number of rows of each chunk. If ``None``,
+            the number of rows is chosen so that a chunk has about
+            one million values.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import brier_score
+    >>> brier_score(y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.2, 0.6, 0.7, 0.8]))
+    {'count': 5, 'brier_score': 0.108...}
+    >>> brier_score(
+    ...     y_true=np.array([0, 2, 1]),
+    ...     y_score=np.array([[0.7, 0.2, 0.1], [0.1, 0.1, 0.8], [0.3, 0.4, 0.3]]),
+    ... )
+    {'count': 3, 'brier_score': 0.246...}
+
+    ```
+    """
+    accumulator = BrierScoreAccumulator(
+        from_logits=from_logits, chunk_size=chunk_size, nan_policy=nan_policy
+    )
+    accumulator.update(y_true=y_true, y_score=y_score)
+    return accumulator.compute(prefix=prefix, suffix=suffix)
+
+
+def expected_calibration_error(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    *,
+    n_bins: int = 10,
+    from_logits: bool = False,
+    chunk_size: int | None = None,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> dict[str, float]:
+    r"""Return the expected and maximum calibration errors.
+
+    The samples are grouped in ``n_bins`` equal-width bins of
+    confidence of the predicted class.
+
+    Args:
+        y_true: The ground truth target labels. This input must be an
+            array of shape ``(n_samples,)`` with values in ``{0, 1}``
+            (binary) or ``{0, ..., n_classes - 1}`` (multiclass).
+        y_score: The predicted probabilities or logits. This input
+            must be an array of shape ``(n_samples,)`` (binary) or
+            ``(n_samples, n_classes)`` (multiclass).
+        n_bins: The number of bins of the reliability diagram, over
+            the confidence range ``[0, 1]``.
+        from_logits: If ``True``, ``y_score`` contains logits.
+            Otherwise, ``y_score`` contains probabilities.
+        chunk_size: The number of rows of each chunk. If ``None``,
+            the number of rows is chosen so that a chunk has about
+            one million values.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import expected_calibration_error
+    >>> expected_calibration_error(
+    ...     y_true=np.array([1, 0, 0, 1, 1]),
+    ...     y_score=np.array([0.9, 0.2, 0.6, 0.7, 0.8]),
+    ...     n_bins=5,
+    ... )
+    {'count': 5, 'expected_calibration_error': 0.159..., 'max_calibration_error': 0.166...}
+
+    ```
+    """
+    accumulator = CalibrationErrorAccumulator(
+        n_bins=n_bins, from_logits=from_logits, chunk_size=chunk_size, nan_policy=nan_policy
+    )
+    accumulator.update(y_true=y_true, y_score=y_score)
+    return accumulator.compute(prefix=prefix, suffix=suffix)
+
+
+def log_loss(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    *,
+    from_logits: bool = False,
+    chunk_size: int | None = None,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> dict[str, float]:
+    r"""Return the log loss (cross-entropy).
+
+    Args:
+        y_true: The ground truth target labels. This input must be an
+            array of shape ``(n_samples,)`` with values in ``{0, 1}``
+            (binary) or ``{0, ..., n_classes - 1}`` (multiclass).
+        y_score: The predicted probabilities or logits. This input
+            must be an array of shape ``(n_samples,)`` (binary) or
+            ``(n_samples, n_classes)`` (multiclass).
+        from_logits: If ``True``, ``y_score`` contains logits.
+            Otherwise, ``y_score`` contains probabilities.
+        chunk_size: The number of rows of each chunk. If ``None``,
+            the number of rows is chosen so that a chunk has about
+            one million values.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import log_loss
+    >>> log_loss(y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.2, 0.6, 0.7, 0.8]))
+    {'count': 5, 'log_loss': 0.3649...}
+    >>> log_loss(
+    ...     y_true=np.array([0, 2, 1]),
+    ...     y_score=np.array([[2.0, 0.5, -1.0], [0.1, 0.2, 3.0], [1.0, 1.0, 1.0]]),
+    ...     from_logits=True,
+    ... )
+    {'count': 3, 'log_loss': 0.4831...}
+
+    ```
+    """
+    accumulator = LogLossAccumulator(
+        from_logits=from_logits, chunk_size=chunk_size, nan_policy=nan_policy
+    )
+    accumulator.update(y_true=y_true, y_score=y_score)
+    return accumulator.compute(prefix=prefix, suffix=suffix)
+
+
+def _binary_stats(
+    labels: np.ndarray, y_score: np.ndarray, from_logits: bool
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    r"""Compute the per-sample statistics of binary predictions.
+
+    Args:
+        labels: The labels as an integer array of shape
+            ``(n_samples,)``.
+        y_score: The probabilities or logits of the positive class.
+        from_logits: If ``True``, ``y_score`` contains logits.
+
+    Returns:
+        A tuple with the log loss, the Brier score, the confidence of
+            the predicted class, and the indicator that the prediction
+            is correct of each sample.
+    """
+    positive = labels == 1
+    y_score = np.asarray(y_score, dtype=float)
+    if from_logits:
+        # log(1 + exp(-z)) is the log loss of a positive sample.
+        log_loss_ = np.logaddexp(0.0, np.where(positive, -y_score, y_score))
+        prob = np.exp(-np.logaddexp(0.0, -y_score))
+        confidence = np.exp(-np.logaddexp(0.0, -np.abs(y_score)))
+        predicted = y_score > 0
+    else:
+        prob = y_score
+        eps = np.finfo(float).eps
+        log_loss_ = -np.log(np.clip(np.where(positive, prob, 1.0 - prob), eps, 1.0))
+        confidence = np.maximum(prob, 1.0 - prob)
+        predicted = prob > 0.5
+    return log_loss_, np.square(prob - positive), confidence, predicted == positive
+
+
+def _multiclass_stats(
+    labels: np.ndarray, y_score: np.ndarray, from_logits: bool
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    r"""Compute the per-sample statistics of multiclass predictions.
+
+    The logits are normalized in place in a single temporary array
+    with the shape of ``y_score``.
+
+    Args:
+        labels: The labels as an integer array of shape
+            ``(n_samples,)``.
+        y_score: The probabilities or logits of each class. This input
+            must be an array of shape ``(n_samples, n_classes)``.
+        from_logits: If ``True``, ``y_score`` contains logits.
+
+    Returns:
+        A tuple with the log loss, the Brier score, the confidence of
+            the predicted class, and the indicator that the prediction
+            is correct of each sample.
+    """
+    rows = np.arange(labels.shape[0])
+    correct = y_score.argmax(axis=1) == labels
+    if from_logits:
+        prob = np.subtract(y_score, y_score.max(axis=1, keepdims=True), dtype=float)
+        label_logit = prob[rows, labels]
+        np.exp(prob, out=prob)
+        norm = prob.sum(axis=1)
+        # Stable log-softmax of the label: z_y - max(z) - log(sum(exp(z - max(z)))).
+        log_loss_ = np.log(norm) - label_logit
+        prob /= norm[:, None]
+        # The maximum logit has the largest probability exp(0) / norm.
+        confidence = 1.0 / norm
+    else:
+        prob = np.asarray(y_score, dtype=float)
+        eps = np.finfo(float).eps
+        log_loss_ = -np.log(np.clip(prob[rows, labels], eps, 1.0))
+        confidence = prob.max(axis=1)
+    # sum_k (p_k - 1[k = y])^2 = sum_k p_k^2 - 2 p_y + 1
+    brier = np.einsum("ij,ij->i", prob, prob) - 2.0 * prob[rows, labels] + 1.0
+    return log_loss_, brier, confidence, correct
+
+
+def _to_labels(y_true: np.ndarray, num_classes: int) -> np.ndarray:
+    r"""Convert the target labels to an integer array and check the
+    values.
+
+    Args:
+        y_true: The ground truth target labels without NaN.
+        num_classes: The number of classes.
+
+    Returns:
+        The labels as an integer array.
+
+    Raises:
+        ValueError: if a label is not an integer in
+            ``{0, ..., num_classes - 1}``.
+    """
+    labels = y_true.astype(np.int64)
+    if labels.shape[0] and (
+        labels.min() < 0 or labels.max() >= num_classes or not np.array_equal(labels, y_true)
+    ):
+        msg = (
+            f"Incorrect 'y_true': the labels must be integers in [0, {num_classes - 1}] "
+            f"but received values in [{y_true.min()}, {y_true.max()}]"
+        )
+        raise ValueError(msg)
+    return labels
@@ -6,20 +6,26 @@ __all__ = [
     "binary_confusion_matrix",
     "confusion_matrix",
     "multiclass_confusion_matrix",
+    "multiclass_top_confused_pairs",
     "multilabel_confusion_matrix",
+    "sparse_multiclass_confusion_matrix",
 ]
 
 
+from typing import TYPE_CHECKING
+
 import numpy as np
-from sklearn import metrics
 
-from arkas.metric.classification.precision import find_label_type
-from arkas.metric.utils import (
-    check_label_type,
-    contains_nan,
-    preprocess_pred,
-    preprocess_pred_multilabel,
+from arkas.metric.classification.confmat_kernel import (
+    ConfusionMatrixKernel,
+    multiclass_confused_pairs,
 )
+from arkas.metric.classification.precision import find_label_type
+from arkas.metric.classification.sparse import sparse_multiclass_confusion_counts
+from arkas.metric.utils import check_label_type, prepare_inputs
+
+if TYPE_CHECKING:
+    from arkas.metric.utils import PreparedInputs
 
 
 def confusion_matrix(
@@ -114,6 +120,7 @@ def binary_confusion_matrix(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float | np.ndarray]:
     r"""Return the confusion matrix metrics for binary labels.
 
@@ -125,6 +132,11 @@ def binary_confusion_matrix(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'binary'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared between
+            several metrics to compute the confusion matrix only once.
+            If ``None``, a new confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -151,25 +163,17 @@ def binary_confusion_matrix(
 
     ```
     """
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-
-    count = y_true.size
-    if y_true_nan or y_pred_nan:
-        confmat = np.array([[np.nan, np.nan], [np.nan, np.nan]])
-    elif count > 0:
-        confmat = metrics.confusion_matrix(y_true=y_true, y_pred=y_pred)
-    else:
-        confmat = np.zeros((2, 2), dtype=np.int64)
-    tn, fp, fn, tp = confmat.ravel().tolist()
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="binary", nan_policy=nan_policy
+        )
+    matrix = np.array([[np.nan, np.nan], [np.nan, np.nan]]) if confmat.has_nan else confmat.matrix
+    tn, fp, fn, tp = matrix.ravel().tolist()
     neg = tn + fp
     pos = tp + fn
     return {
-        f"{prefix}confusion_matrix{suffix}": confmat,
-        f"{prefix}count{suffix}": count,
+        f"{prefix}confusion_matrix{suffix}": matrix,
+        f"{prefix}count{suffix}": confmat.count,
         f"{prefix}false_negative_rate{suffix}": fn / pos if pos > 0 else float("nan"),
         f"{prefix}false_negative{suffix}": fn,
         f"{prefix}false_positive_rate{suffix}": fp / neg if neg > 0 else float("nan"),
@@ -188,6 +192,7 @@ def multiclass_confusion_matrix(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float | np.ndarray]:
     r"""Return the confusion matrix metrics for multiclass labels.
 
@@ -199,6 +204,11 @@ def multiclass_confusion_matrix(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multiclass'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared between
+            several metrics to compute the confusion matrix only once.
+            If ``None``, a new confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -216,18 +226,14 @@ def multiclass_confusion_matrix(
 
     ```
     """
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-    if y_true_nan or y_pred_nan:
-        confmat = np.zeros((0, 0), dtype=np.int64)
-    else:
-        confmat = metrics.confusion_matrix(y_true=y_true, y_pred=y_pred)
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="multiclass", nan_policy=nan_policy
+        )
+    matrix = np.zeros((0, 0), dtype=np.int64) if confmat.has_nan else confmat.matrix
     return {
-        f"{prefix}confusion_matrix{suffix}": confmat,
-        f"{prefix}count{suffix}": y_true.size,
+        f"{prefix}confusion_matrix{suffix}": matrix,
+        f"{prefix}count{suffix}": confmat.count,
     }
 
 
@@ -238,6 +244,7 @@ def multilabel_confusion_matrix(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float | np.ndarray]:
     r"""Return the confusion matrix metrics for multilabel labels.
 
@@ -249,6 +256,11 @@ def multilabel_confusion_matrix(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multilabel'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared between
+            several metrics to compute the confusion matrix only once.
+            If ``None``, a new confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -270,16 +282,152 @@ def multilabel_confusion_matrix(
 
     ```
     """
-    y_true, y_pred = preprocess_pred_multilabel(y_true, y_pred, drop_nan=nan_policy == "omit")
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-
-    count = y_true.shape[0]
-    if count > 0 and not y_true_nan and not y_pred_nan:
-        if y_true.shape[1] > 1:
-            confmat = metrics.multilabel_confusion_matrix(y_true=y_true, y_pred=y_pred)
-        else:
-            confmat = metrics.confusion_matrix(y_true=y_true, y_pred=y_pred).reshape(1, 2, 2)
-    else:
-        confmat = np.zeros((0, 0, 0), dtype=np.int64)
-    return {f"{prefix}confusion_matrix{suffix}": confmat, f"{prefix}count{suffix}": count}
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="multilabel", nan_policy=nan_policy
+        )
+    matrix = confmat.matrix if confmat.is_valid else np.zeros((0, 0, 0), dtype=np.int64)
+    return {f"{prefix}confusion_matrix{suffix}": matrix, f"{prefix}count{suffix}": confmat.count}
+
+
+def multiclass_top_confused_pairs(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    k: int = 10,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+    prepared: PreparedInputs | None = None,
+) -> dict[str, int | np.ndarray]:
+    r"""Return the most frequent confusions between multiclass labels.
+
+    The confusion matrix is not materialized, so this function can be
+    used with a very large number of classes. The ``i``-th confused
+    pair is ``(top_confused_true[i], top_confused_pred[i])`` and
+    contains ``top_confused_count[i]`` samples. The pairs are sorted
+    by decreasing number of samples.
+
+    Args:
+        y_true: The ground truth target labels.
+        y_pred: The predicted labels.
+        k: The maximum number of confused pairs to return.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+        prepared: Optional inputs prepared with ``prepare_inputs``
+            on the same ``y_true`` and ``y_pred``. If given, the
+            inputs are not preprocessed again.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import multiclass_top_confused_pairs
+    >>> multiclass_top_confused_pairs(
+    ...     y_true=np.array([0, 0, 1, 1, 5, 5, 5]), y_pred=np.array([1, 1, 1, 5, 0, 5, 0]), k=2
+    ... )
+    {'count': 7,
+     'top_confused_count': array([2, 2]),
+     'top_confused_pred': array([1, 0]),
+     'top_confused_true': array([0, 5])}
+
+    ```
+    """
+    if prepared is None:
+        prepared = prepare_inputs(y_true, y_pred, nan_policy=nan_policy)
+    y_true, y_pred = prepared.y_true, prepared.y_pred
+    if not prepared.is_valid:
+        y_true, y_pred = y_true[:0], y_pred[:0]
+    true_labels, pred_labels, counts = multiclass_confused_pairs(y_true=y_true, y_pred=y_pred, k=k)
+    return {
+        f"{prefix}count{suffix}": prepared.count,
+        f"{prefix}top_confused_count{suffix}": counts,
+        f"{prefix}top_confused_pred{suffix}": pred_labels,
+        f"{prefix}top_confused_true{suffix}": true_labels,
+    }
+
+
+def sparse_multiclass_confusion_matrix(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+    prepared: PreparedInputs | None = None,
+) -> dict[str, int | np.ndarray]:
+    r"""Return the confusion matrix metrics for multiclass labels with
+    a sparse confusion matrix.
+
+    The confusion matrix is a ``scipy.sparse`` CSR array that only
+    stores the ``(true, predicted)`` pairs that appear in the samples,
+    so this function can be used with a very large number of classes.
+    The per-class precision and recall are derived from the sparse
+    confusion matrix, and are ``0`` for the classes that are never
+    predicted or never observed.
+
+    Args:
+        y_true: The ground truth target labels.
+        y_pred: The predicted labels.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+        prepared: Optional inputs prepared with ``prepare_inputs``
+            on the same ``y_true`` and ``y_pred``. If given, the
+            inputs are not preprocessed again.
+
+    Returns:
+        The computed metrics. ``labels`` contains the label of each
+            row and column of the confusion matrix.
+
+    Raises:
+        RuntimeError: if ``scipy`` is not installed.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import sparse_multiclass_confusion_matrix
+    >>> metrics = sparse_multiclass_confusion_matrix(
+    ...     y_true=np.array([0, 1, 1, 2, 2, 2]), y_pred=np.array([0, 1, 2, 2, 2, 1])
+    ... )
+    >>> metrics["confusion_matrix"].toarray()
+    array([[1, 0, 0], [0, 1, 1], [0, 1, 2]])
+    >>> metrics["labels"]
+    array([0, 1, 2])
+    >>> metrics["precision"]
+    array([1.        , 0.5       , 0.66666667])
+    >>> metrics["recall"]
+    array([1.        , 0.5       , 0.66666667])
+
+    ```
+    """
+    if prepared is None:
+        prepared = prepare_inputs(y_true, y_pred, nan_policy=nan_policy)
+    y_true, y_pred = prepared.y_true, prepared.y_pred
+    if not prepared.is_valid:
+        y_true, y_pred = y_true[:0], y_pred[:0]
+    matrix, labels = sparse_multiclass_confusion_counts(y_true=y_true, y_pred=y_pred)
+    tp = matrix.diagonal()
+    pred_sum = np.asarray(matrix.sum(axis=0)).ravel()
+    true_sum = np.asarray(matrix.sum(axis=1)).ravel()
+    precision, recall = np.zeros(tp.shape), np.zeros(tp.shape)
+    np.divide(tp, pred_sum, out=precision, where=pred_sum != 0)
+    np.divide(tp, true_sum, out=recall, where=true_sum != 0)
+    return {
+        f"{prefix}confusion_matrix{suffix}": matrix,
+        f"{prefix}count{suffix}": prepared.count,
+        f"{prefix}labels{suffix}": labels,
+        f"{prefix}precision{suffix}": precision,
+        f"{prefix}recall{suffix}": recall,
+    }
@@ -0,0 +1,858 @@
+r"""Implement a confusion matrix kernel to compute the label-based
+classification metrics."""
+
+from __future__ import annotations
+
+__all__ = [
+    "ConfusionMatrixKernel",
+    "binary_confusion_counts",
+    "multiclass_confused_pairs",
+    "multiclass_confusion_counts",
+    "multilabel_confusion_counts",
+]
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from coola.utils.format import repr_mapping_line
+
+from arkas.metric.classification.sparse import sparse_multilabel_confusion_counts
+from arkas.metric.utils import check_nan_policy, is_sparse, prepare_inputs, safe_divide
+from arkas.utils.labels import factorize_arrays
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from arkas.metric.utils import PreparedInputs
+
+# Maximum number of samples of a chunk, so the temporary int64 keys of
+# a chunk use at most 8 MB.
+_CHUNK_NUM_VALUES = 2**20
+
+
+class ConfusionMatrixKernel:
+    r"""Implement a confusion matrix kernel for label-based
+    classification metrics.
+
+    The inputs are preprocessed and the confusion matrix is computed
+    once, in a single ``bincount`` pass, the first time a metric is
+    requested. The accuracy, balanced accuracy, precision, recall,
+    F-beta, and Jaccard metrics are then derived from the same
+    counts. The same object can be shared by several results that
+    use the same ``(y_true, y_pred)`` pair.
+
+    The confusion matrix depends on the label type:
+
+    - binary: an array of shape ``(2, 2)`` organized as
+        ``[[tn, fp], [fn, tp]]`` where the positive label is ``1``.
+    - multiclass: an array of shape ``(n_classes, n_classes)`` where
+        the classes are the sorted unique values of ``y_true`` and
+        ``y_pred``.
+    - multilabel: an array of shape ``(n_classes, 2, 2)`` with one
+        binary confusion matrix per class.
+
+    Args:
+        y_true: The ground truth target labels.
+        y_pred: The predicted labels.
+        label_type: The type of labels used to evaluate the metrics.
+            The valid values are: ``'binary'``, ``'multiclass'``, and
+            ``'multilabel'``. The binary and multiclass inputs are
+            flattened. The multilabel inputs can be ``scipy.sparse``
+            arrays, then the confusion matrix is computed from the
+            stored values only.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import ConfusionMatrixKernel
+    >>> kernel = ConfusionMatrixKernel(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1])
+    ... )
+    >>> kernel
+    ConfusionMatrixKernel(y_true=(5,), y_pred=(5,), label_type='binary', nan_policy='propagate')
+    >>> kernel.matrix
+    array([[1, 1], [1, 2]])
+    >>> kernel.precision(average="binary")
+    0.666...
+    >>> kernel.recall(average="binary")
+    0.666...
+
+    ```
+    """
+
+    def __init__(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        label_type: str = "binary",
+        nan_policy: str = "propagate",
+    ) -> None:
+        self._y_true = y_true
+        self._y_pred = y_pred
+
+        if label_type not in {"binary", "multiclass", "multilabel"}:
+            msg = (
+                f"Incorrect 'label_type': {label_type}. The valid label types are: "
+                "'binary', 'multiclass', and 'multilabel'"
+            )
+            raise ValueError(msg)
+        self._label_type = label_type
+
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+        self._prepared = None
+        # The following attributes are lazily computed by ``_prepare``.
+        self._count = None
+        self._has_nan = None
+        self._labels = None
+        self._matrix = None
+
+    @classmethod
+    def from_matrix(
+        cls,
+        matrix: np.ndarray,
+        *,
+        count: int,
+        label_type: str = "binary",
+        nan_policy: str = "propagate",
+        has_nan: bool = False,
+        labels: np.ndarray | None = None,
+    ) -> ConfusionMatrixKernel:
+        r"""Instantiate a kernel from a precomputed confusion matrix.
+
+        The returned kernel has empty ``y_true`` and ``y_pred``
+        arrays. It is useful to compute the metrics from counts
+        accumulated over several batches of data.
+
+        Args:
+            matrix: The confusion matrix. Its shape must follow the
+                ``label_type`` convention.
+            count: The number of samples used to compute the
+                confusion matrix.
+            label_type: The type of labels used to evaluate the
+                metrics. The valid values are: ``'binary'``,
+                ``'multiclass'``, and ``'multilabel'``.
+            nan_policy: The policy on how to handle NaN values in the
+                input arrays. The following options are available:
+                ``'omit'``, ``'propagate'``, and ``'raise'``.
+            has_nan: ``True`` if the data used to compute the
+                confusion matrix contain NaN values.
+            labels: The labels associated to the confusion matrix.
+                If ``None``, the default labels of the label type are
+                used, i.e. the row indices for multiclass labels.
+
+        Returns:
+            The instantiated kernel.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import ConfusionMatrixKernel
+        >>> kernel = ConfusionMatrixKernel.from_matrix(np.array([[1, 1], [1, 2]]), count=5)
+        >>> kernel.precision(average="binary")
+        0.666...
+
+        ```
+        """
+        kernel = cls(
+            y_true=np.array([]),
+            y_pred=np.array([]),
+            label_type=label_type,
+            nan_policy=nan_policy,
+        )
+        if labels is None:
+            labels = np.array([0, 1]) if label_type == "binary" else np.arange(matrix.shape[0])
+        kernel._count = count
+        kernel._has_nan = has_nan
+        kernel._labels = labels
+        kernel._matrix = matrix
+        return kernel
+
+    @classmethod
+    def from_prepared(
+        cls, prepared: PreparedInputs, label_type: str = "binary"
+    ) -> ConfusionMatrixKernel:
+        r"""Instantiate a kernel from prepared inputs.
+
+        The inputs are not preprocessed again, so the same prepared
+        inputs can be shared with other metrics.
+
+        Args:
+            prepared: The inputs prepared with ``prepare_inputs``.
+                For the ``'multilabel'`` label type, the inputs must
+                be prepared with ``multilabel=True``.
+            label_type: The type of labels used to evaluate the
+                metrics. The valid values are: ``'binary'``,
+                ``'multiclass'``, and ``'multilabel'``.
+
+        Returns:
+            The instantiated kernel.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import ConfusionMatrixKernel
+        >>> from arkas.metric.utils import prepare_inputs
+        >>> prepared = prepare_inputs(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1])
+        ... )
+        >>> kernel = ConfusionMatrixKernel.from_prepared(prepared)
+        >>> kernel.precision(average="binary")
+        0.666...
+
+        ```
+        """
+        kernel = cls(
+            y_true=prepared.y_true,
+            y_pred=prepared.y_pred,
+            label_type=label_type,
+            nan_policy=prepared.nan_policy,
+        )
+        kernel._prepared = prepared
+        return kernel
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "y_true": self._y_true.shape,
+                "y_pred": self._y_pred.shape,
+                "label_type": self._label_type,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def count(self) -> int:
+        r"""The number of samples used to compute the metrics."""
+        self._prepare()
+        return self._count
+
+    @property
+    def has_nan(self) -> bool:
+        r"""``True`` if the inputs contain NaN values after the
+        preprocessing, otherwise ``False``."""
+        self._prepare()
+        return self._has_nan
+
+    @property
+    def is_valid(self) -> bool:
+        r"""``True`` if the metrics can be computed, i.e. there is at
+        least one sample and no NaN value, otherwise ``False``."""
+        return self.count > 0 and not self.has_nan
+
+    @property
+    def label_type(self) -> str:
+        return self._label_type
+
+    @property
+    def labels(self) -> np.ndarray:
+        r"""The labels associated to the confusion matrix.
+
+        The labels are ``[0, 1]`` for binary labels, the sorted unique
+        labels for multiclass labels, and the column indices for
+        multilabel labels.
+        """
+        self._prepare()
+        return self._labels
+
+    @property
+    def matrix(self) -> np.ndarray:
+        r"""The confusion matrix.
+
+        The matrix is only meaningful if ``is_valid`` is ``True``.
+        """
+        self._prepare()
+        return self._matrix
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    @property
+    def y_true(self) -> np.ndarray:
+        return self._y_true
+
+    @property
+    def y_pred(self) -> np.ndarray:
+        return self._y_pred
+
+    def count_correct(self) -> int:
+        r"""Return the number of correct predictions.
+
+        Returns:
+            The number of correct predictions. For multilabel labels,
+                each sample-class pair is counted.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import ConfusionMatrixKernel
+        >>> kernel = ConfusionMatrixKernel(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1])
+        ... )
+        >>> kernel.count_correct()
+        3
+
+        ```
+        """
+        matrix = self.matrix
+        if self._label_type == "multilabel":
+            return int(matrix[:, 0, 0].sum() + matrix[:, 1, 1].sum())
+        return int(np.trace(matrix))
+
+    def balanced_accuracy(self) -> float:
+        r"""Return the balanced accuracy.
+
+        The balanced accuracy is the average of the recall obtained
+        on each class. The classes without ground truth sample are
+        ignored.
+
+        Returns:
+            The balanced accuracy.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import ConfusionMatrixKernel
+        >>> kernel = ConfusionMatrixKernel(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1])
+        ... )
+        >>> kernel.balanced_accuracy()
+        0.583...
+
+        ```
+        """
+        matrix = self.matrix
+        if self._label_type == "multilabel":
+            matrix = matrix.sum(axis=0)
+        support = matrix.sum(axis=1)
+        valid = support > 0
+        if not valid.any():
+            return float("nan")
+        return float(np.mean(np.diag(matrix)[valid] / support[valid]))
+
+    def precision(self, average: str | None = None) -> np.ndarray | float:
+        r"""Return the precision.
+
+        Args:
+            average: The type of averaging. If ``None``, the scores
+                for each class are returned. The other valid values
+                are ``'binary'``, ``'macro'``, ``'micro'``, and
+                ``'weighted'``.
+
+        Returns:
+            The precision. The value is ``0`` for the classes without
+                positive prediction.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import ConfusionMatrixKernel
+        >>> kernel = ConfusionMatrixKernel(
+        ...     y_true=np.array([0, 0, 1, 1, 2, 2]),
+        ...     y_pred=np.array([0, 1, 1, 2, 2, 2]),
+        ...     label_type="multiclass",
+        ... )
+        >>> kernel.precision()
+        array([1.  , 0.5 , 0.666...])
+        >>> kernel.precision(average="macro")
+        0.722...
+
+        ```
+        """
+        tp, pred_sum, true_sum = self._class_counts(average)
+        return _average(tp, pred_sum, support=true_sum, average=average)
+
+    def recall(self, average: str | None = None) -> np.ndarray | float:
+        r"""Return the recall.
+
+        Args:
+            average: The type of averaging. If ``None``, the scores
+                for each class are returned. The other valid values
+                are ``'binary'``, ``'macro'``, ``'micro'``, and
+                ``'weighted'``.
+
+        Returns:
+            The recall. The value is ``0`` for the classes without
+                ground truth sample.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import ConfusionMatrixKernel
+        >>> kernel = ConfusionMatrixKernel(
+        ...     y_true=np.array([0, 0, 1, 1, 2, 2]),
+        ...     y_pred=np.array([0, 1, 1, 2, 2, 2]),
+        ...     label_type="multiclass",
+        ... )
+        >>> kernel.recall()
+        array([0.5, 0.5, 1. ])
+        >>> kernel.recall(average="macro")
+        0.666...
+
+        ```
+        """
+        tp, _, true_sum = self._class_counts(average)
+        return _average(tp, true_sum, support=true_sum, average=average)
+
+    def fbeta_score(self, beta: float = 1.0, average: str | None = None) -> np.ndarray | float:
+        r"""Return the F-beta score.
+
+        Args:
+            beta: The beta used to compute the F-beta score.
+            average: The type of averaging. If ``None``, the scores
+                for each class are returned. The other valid values
+                are ``'binary'``, ``'macro'``, ``'micro'``, and
+                ``'weighted'``.
+
+        Returns:
+            The F-beta score. The value is ``0`` for the classes
+                without ground truth sample and positive prediction.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import ConfusionMatrixKernel
+        >>> kernel = ConfusionMatrixKernel(
+        ...     y_true=np.array([0, 0, 1, 1, 2, 2]),
+        ...     y_pred=np.array([0, 1, 1, 2, 2, 2]),
+        ...     label_type="multiclass",
+        ... )
+        >>> kernel.fbeta_score()
+        array([0.666..., 0.5 , 0.8 ])
+        >>> kernel.fbeta_score(average="macro")
+        0.655...
+
+        ```
+        """
+        scores = self.fbeta_scores(betas=[beta], average=average)[0]
+        if average is None:
+            return scores
+        return float(scores)
+
+    def fbeta_scores(self, betas: Sequence[float], average: str | None = None) -> np.ndarray:
+        r"""Return the F-beta scores for several betas.
+
+        The per-class counts are computed once and the scores for all
+        the betas are computed with a single vectorized operation.
+
+        Args:
+            betas: The betas used to compute the F-beta scores.
+            average: The type of averaging. If ``None``, the scores
+                for each class are returned. The other valid values
+                are ``'binary'``, ``'macro'``, ``'micro'``, and
+                ``'weighted'``.
+
+        Returns:
+            The F-beta scores as an array of shape
+                ``(n_betas, n_classes)`` if ``average`` is ``None``,
+                otherwise an array of shape ``(n_betas,)``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import ConfusionMatrixKernel
+        >>> kernel = ConfusionMatrixKernel(
+        ...     y_true=np.array([0, 0, 1, 1, 2, 2]),
+        ...     y_pred=np.array([0, 1, 1, 2, 2, 2]),
+        ...     label_type="multiclass",
+        ... )
+        >>> kernel.fbeta_scores(betas=[0.5, 1, 2])
+        array([[0.833..., 0.5 , 0.714...],
+               [0.666..., 0.5 , 0.8 ],
+               [0.555..., 0.5 , 0.909...]])
+        >>> kernel.fbeta_scores(betas=[0.5, 1, 2], average="macro")
+        array([0.682..., 0.655..., 0.654...])
+
+        ```
+        """
+        tp, pred_sum, true_sum = self._class_counts(average)
+        beta2 = np.square(np.asarray(betas, dtype=float)).reshape(-1, 1)
+        return _average_scores(
+            (1 + beta2) * tp, beta2 * true_sum + pred_sum, support=true_sum, average=average
+        )
+
+    def jaccard(self, average: str | None = None) -> np.ndarray | float:
+        r"""Return the Jaccard score.
+
+        Args:
+            average: The type of averaging. If ``None``, the scores
+                for each class are returned. The other valid values
+                are ``'binary'``, ``'macro'``, ``'micro'``, and
+                ``'weighted'``.
+
+        Returns:
+            The Jaccard score. The value is ``0`` for the classes
+                without ground truth sample and positive prediction.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import ConfusionMatrixKernel
+        >>> kernel = ConfusionMatrixKernel(
+        ...     y_true=np.array([0, 0, 1, 1, 2, 2]),
+        ...     y_pred=np.array([0, 1, 1, 2, 2, 2]),
+        ...     label_type="multiclass",
+        ... )
+        >>> kernel.jaccard()
+        array([0.5 , 0.333..., 0.666...])
+        >>> kernel.jaccard(average="macro")
+        0.5
+
+        ```
+        """
+        tp, pred_sum, true_sum = self._class_counts(average)
+        return _average(tp, true_sum + pred_sum - tp, support=true_sum, average=average)
+
+    def _class_counts(self, average: str | None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        r"""Return the per-class counts.
+
+        For binary labels, only the positive class is returned. A
+        multilabel input with a single class is evaluated like binary
+        labels when the scores are averaged, so the averages are
+        computed over the labels ``0`` and ``1`` that are present in
+        the inputs. It follows the scikit-learn convention for a
+        single-column label indicator.
+
+        Args:
+            average: The type of averaging.
+
+        Returns:
+            A tuple with 3 arrays: the true positive counts, the
+                predicted positive counts, and the ground truth
+                positive counts.
+        """
+        matrix = self.matrix
+        if self._label_type == "multilabel" and matrix.shape[0] == 1 and average is not None:
+            matrix = matrix[0]
+            labels = np.flatnonzero(matrix.sum(axis=0) + matrix.sum(axis=1))
+            matrix = matrix[np.ix_(labels, labels)]
+        if matrix.ndim == 2 and self._label_type != "binary":
+            tp = np.diag(matrix)
+            return tp, matrix.sum(axis=0), matrix.sum(axis=1)
+        if self._label_type == "binary":
+            matrix = matrix.reshape(1, 2, 2)
+        tp = matrix[:, 1, 1]
+        return tp, tp + matrix[:, 0, 1], tp + matrix[:, 1, 0]
+
+    def _prepare(self) -> None:
+        r"""Preprocess the inputs and compute the confusion matrix if it
+        was not done before."""
+        if self._has_nan is not None:
+            return
+
+        prepared = self._prepared
+        if prepared is None:
+            prepared = prepare_inputs(
+                self._y_true,
+                self._y_pred,
+                nan_policy=self._nan_policy,
+                multilabel=self._label_type == "multilabel",
+            )
+        y_true, y_pred = prepared.y_true, prepared.y_pred
+        self._count = prepared.count
+        self._has_nan = prepared.has_nan
+
+        if self._has_nan:
+            # The metrics are not computed so the confusion matrix is empty.
+            y_true, y_pred = y_true[:0], y_pred[:0]
+        if self._label_type == "binary":
+            self._matrix = binary_confusion_counts(y_true=y_true, y_pred=y_pred)
+            self._labels = np.array([0, 1])
+        elif self._label_type == "multiclass":
+            self._matrix, self._labels = multiclass_confusion_counts(y_true=y_true, y_pred=y_pred)
+        else:
+            self._matrix = multilabel_confusion_counts(y_true=y_true, y_pred=y_pred)
+            self._labels = np.arange(self._matrix.shape[0])
+
+
+def binary_confusion_counts(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    r"""Compute the confusion matrix for binary labels.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples,)``. The positive label
+            is ``1``.
+        y_pred: The predicted labels. This input must be an array of
+            shape ``(n_samples,)``. The positive label is ``1``.
+
+    Returns:
+        The confusion matrix as an array of shape ``(2, 2)``
+            organized as ``[[tn, fp], [fn, tp]]``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.classification.confmat_kernel import binary_confusion_counts
+    >>> binary_confusion_counts(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1])
+    ... )
+    array([[1, 1], [1, 2]])
+
+    ```
+    """
+    # The counts are computed from boolean masks, so the only temporary
+    # arrays are two masks with one byte per sample.
+    true_pos, pred_pos = y_true.ravel() == 1, y_pred.ravel() == 1
+    num_true, num_pred = np.count_nonzero(true_pos), np.count_nonzero(pred_pos)
+    tp = np.count_nonzero(np.logical_and(true_pos, pred_pos, out=true_pos))
+    fn, fp = num_true - tp, num_pred - tp
+    return np.array([[true_pos.size - tp - fn - fp, fp], [fn, tp]])
+
+
+def multiclass_confusion_counts(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""Compute the confusion matrix for multiclass labels.
+
+    The labels are integer-coded and the confusion matrix is computed
+    with a single ``bincount`` pass. The labels are encoded with
+    ``arkas.utils.labels.factorize_arrays``, so the non-negative
+    integer labels, for example the codes returned by
+    ``arkas.utils.labels.factorize_labels``, are encoded without
+    sorting the samples.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples,)``.
+        y_pred: The predicted labels. This input must be an array of
+            shape ``(n_samples,)``.
+
+    Returns:
+        A tuple with the confusion matrix as an array of shape
+            ``(n_classes, n_classes)``, and the sorted labels
+            associated to the rows and columns.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.classification.confmat_kernel import multiclass_confusion_counts
+    >>> matrix, labels = multiclass_confusion_counts(
+    ...     y_true=np.array([0, 0, 1, 1, 5, 5]), y_pred=np.array([0, 1, 1, 5, 5, 5])
+    ... )
+    >>> matrix
+    array([[1, 1, 0], [0, 1, 1], [0, 0, 2]])
+    >>> labels
+    array([0, 1, 5])
+
+    ```
+    """
+    (y_true, y_pred), labels = factorize_arrays(y_true, y_pred)
+    n_classes = labels.size
+    matrix = np.zeros(n_classes * n_classes, dtype=np.int64)
+    # The codes are widened to int64 keys chunk by chunk, so the codes
+    # can keep a narrow dtype. Both operands are cast because mixing
+    # uint64 and int64 codes promotes the keys to float64.
+    for start in range(0, y_true.size, _CHUNK_NUM_VALUES):
+        chunk = slice(start, start + _CHUNK_NUM_VALUES)
+        keys = y_true[chunk].astype(np.int64) * n_classes + y_pred[chunk].astype(np.int64)
+        matrix += np.bincount(keys, minlength=n_classes * n_classes)
+    return matrix.reshape(n_classes, n_classes), labels
+
+
+def multiclass_confused_pairs(
+    y_true: np.ndarray, y_pred: np.ndarray, k: int = 10
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    r"""Find the most frequent confusions between multiclass labels.
+
+    Only the misclassified samples are used, and the confusion matrix
+    is never materialized, so the memory does not depend on
+    ``n_classes ** 2``.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples,)`` without NaN.
+        y_pred: The predicted labels. This input must be an array of
+            shape ``(n_samples,)`` without NaN.
+        k: The maximum number of pairs to return.
+
+    Returns:
+        A tuple with the true labels, the predicted labels, and the
+            number of samples of the ``k`` most frequent confused
+            pairs. The pairs are sorted by decreasing number of
+            samples, and by labels for the ties.
+
+    Raises:
+        ValueError: if ``k`` is negative.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.classification.confmat_kernel import multiclass_confused_pairs
+    >>> multiclass_confused_pairs(
+    ...     y_true=np.array([0, 0, 1, 1, 5, 5, 5]), y_pred=np.array([1, 1, 1, 5, 0, 5, 0]), k=2
+    ... )
+    (array([0, 5]), array([1, 0]), array([2, 2]))
+
+    ```
+    """
+    if k < 0:
+        msg = f"Incorrect 'k': {k}. The value must be positive or zero"
+        raise ValueError(msg)
+    (y_true, y_pred), labels = factorize_arrays(y_true, y_pred)
+    confused = y_true != y_pred
+    n_classes = labels.size
+    keys, counts = np.unique(
+        y_true[confused].astype(np.int64) * n_classes + y_pred[confused].astype(np.int64),
+        return_counts=True,
+    )
+    if k == 0:
+        keys, counts = keys[:0], counts[:0]
+    elif k < counts.size:
+        # Only the k largest counts are sorted. The keys are sorted, so
+        # the ties at the threshold keep the pairs with the smallest labels.
+        threshold = np.partition(counts, counts.size - k)[counts.size - k]
+        keep = counts > threshold
+        keep[np.flatnonzero(counts == threshold)[: k - int(keep.sum())]] = True
+        keys, counts = keys[keep], counts[keep]
+    order = np.lexsort((keys, -counts))
+    keys, counts = keys[order], counts[order]
+    return labels[keys // max(n_classes, 1)], labels[keys % max(n_classes, 1)], counts
+
+
+def multilabel_confusion_counts(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    r"""Compute the confusion matrix of each class for multilabel
+    labels.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples, n_classes)``. The
+            positive label is ``1``. It can be a ``scipy.sparse``
+            CSR array in canonical format.
+        y_pred: The predicted labels. This input must be an array of
+            shape ``(n_samples, n_classes)``. The positive label is
+            ``1``. It can be a ``scipy.sparse`` CSR array in
+            canonical format.
+
+    Returns:
+        The confusion matrices as an array of shape
+            ``(n_classes, 2, 2)``. Each matrix is organized as
+            ``[[tn, fp], [fn, tp]]``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.classification.confmat_kernel import multilabel_confusion_counts
+    >>> multilabel_confusion_counts(
+    ...     y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+    ...     y_pred=np.array([[1, 0, 0], [0, 1, 1], [0, 1, 1], [1, 0, 0], [1, 0, 0]]),
+    ... )
+    array([[[2, 0], [0, 3]],
+           [[3, 0], [0, 2]],
+           [[0, 2], [3, 0]]])
+
+    ```
+    """
+    if is_sparse(y_true) or is_sparse(y_pred):
+        return sparse_multilabel_confusion_counts(y_true=y_true, y_pred=y_pred)
+    if y_true.ndim == 1:
+        y_true, y_pred = y_true.reshape(-1, 1), y_pred.reshape(-1, 1)
+    n_classes = y_true.shape[1]
+    codes = 2 * (y_true == 1) + (y_pred == 1) + 4 * np.arange(n_classes)
+    return np.bincount(codes.ravel(), minlength=4 * n_classes).reshape(n_classes, 2, 2)
+
+
+def _average(
+    numerator: np.ndarray, denominator: np.ndarray, support: np.ndarray, average: str | None
+) -> np.ndarray | float:
+    r"""Compute the per-class scores and average them.
+
+    Args:
+        numerator: The per-class numerators.
+        denominator: The per-class denominators.
+        support: The per-class number of ground truth samples, which
+            is used to compute the weighted average.
+        average: The type of averaging. If ``None``, the scores for
+            each class are returned. The other valid values are
+            ``'binary'``, ``'macro'``, ``'micro'``, and ``'weighted'``.
+
+    Returns:
+        The per-class scores if ``average`` is ``None``, otherwise
+            the averaged score.
+
+    Raises:
+        ValueError: if ``average`` is not valid.
+    """
+    scores = _average_scores(numerator, denominator, support=support, average=average)
+    if average is None:
+        return scores
+    return float(scores)
+
+
+def _average_scores(
+    numerator: np.ndarray, denominator: np.ndarray, support: np.ndarray, average: str | None
+) -> np.ndarray:
+    r"""Compute the per-class scores and average them along the last
+    axis.
+
+    Args:
+        numerator: The per-class numerators. This input must be an
+            array of shape ``(*, n_classes)``.
+        denominator: The per-class denominators. This input must be
+            an array of shape ``(*, n_classes)``.
+        support: The per-class number of ground truth samples, which
+            is used to compute the weighted average. This input must
+            be an array of shape ``(n_classes,)``.
+        average: The type of averaging. If ``None``, the scores for
+            each class are returned. The other valid values are
+            ``'binary'``, ``'macro'``, ``'micro'``, and ``'weighted'``.
+
+    Returns:
+        The per-class scores of shape ``(*, n_classes)`` if
+            ``average`` is ``None``, otherwise the averaged scores of
+            shape ``(*)``.
+
+    Raises:
+        ValueError: if ``average`` is not valid.
+    """
+    if average == "micro":
+        return safe_divide(numerator.sum(axis=-1), denominator.sum(axis=-1))
+    scores = safe_divide(numerator, denominator)
+    if average is None:
+        return scores
+    if average == "binary":
+        return scores[..., -1]
+    if average == "macro":
+        return np.mean(scores, axis=-1)
+    if average == "weighted":
+        if support.sum() == 0:
+            return np.mean(scores, axis=-1)
+        return np.average(scores, weights=support, axis=-1)
+    msg = (
+        f"Incorrect 'average': {average}. The valid values are: None, 'binary', 'macro', "
+        "'micro', and 'weighted'"
+    )
+    raise ValueError(msg)
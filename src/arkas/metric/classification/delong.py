@@ -0,0 +1,295 @@
+r"""Implement the DeLong variance of the Area Under the Receiver
+Operating Characteristic Curve (ROC AUC) and the paired DeLong test."""
+
+from __future__ import annotations
+
+__all__ = ["delong_covariance", "delong_roc_auc", "delong_roc_auc_test"]
+
+import math
+from itertools import combinations
+from statistics import NormalDist
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from arkas.metric.utils import check_nan_policy, check_same_shape, contains_nan, multi_isnan
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+def delong_covariance(y_true: np.ndarray, y_score: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    r"""Return the ROC AUC of several score columns and their DeLong
+    covariance matrix.
+
+    The implementation follows the fast algorithm of Sun and Xu
+    (2014). The scores of each column are sorted only once, and the
+    midranks of the positive and negative samples are derived from
+    the same sort, so the complexity is ``O(n_samples log n_samples)``
+    instead of ``O(n_pos * n_neg)``.
+
+    Args:
+        y_true: The ground truth target labels. This input must be
+            an array of shape ``(n_samples,)`` with ``0`` and ``1``
+            values, and without NaN.
+        y_score: The target scores. This input must be an array of
+            shape ``(n_samples,)`` or ``(n_samples, n_columns)``
+            without NaN.
+
+    Returns:
+        A tuple with the ROC AUC of each column as an array of shape
+            ``(n_columns,)``, and the covariance matrix of the ROC AUCs
+            as an array of shape ``(n_columns, n_columns)``. The
+            values are NaN if there is only one class, and the
+            covariance matrix is NaN if there are less than two
+            positive or negative samples.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.classification.delong import delong_covariance
+    >>> auc, cov = delong_covariance(
+    ...     y_true=np.array([1, 0, 0, 1, 1, 0]),
+    ...     y_score=np.array([[0.9, 0.8], [0.2, 0.3], [0.6, 0.1], [0.8, 0.7], [0.4, 0.2], [0.1, 0.5]]),
+    ... )
+    >>> auc
+    array([0.888..., 0.777...])
+    >>> cov
+    array([[0.0246..., 0.0123...], [0.0123..., 0.0617...]])
+
+    ```
+    """
+    y_score = y_score.reshape(y_score.shape[0], -1).astype(float)
+    positive = y_true.ravel() == 1
+    num_pos = int(positive.sum())
+    num_neg = positive.shape[0] - num_pos
+    n_columns = y_score.shape[1]
+    if num_pos == 0 or num_neg == 0:
+        return np.full(n_columns, np.nan), np.full((n_columns, n_columns), np.nan)
+
+    # Structural components of the positive (v10) and negative (v01) samples.
+    v10 = np.empty((n_columns, num_pos))
+    v01 = np.empty((n_columns, num_neg))
+    ranks = np.empty(positive.shape[0])
+    class_ranks = np.empty(positive.shape[0])
+    for i in range(n_columns):
+        order = np.argsort(y_score[:, i], kind="mergesort")
+        scores, is_pos = y_score[order, i], positive[order]
+        # The ranks are scattered back to the sample order, so the
+        # structural components of all the columns are aligned.
+        ranks[order] = _midranks(scores)
+        # The positive and negative scores are still sorted after filtering.
+        class_ranks[order[is_pos]] = _midranks(scores[is_pos])
+        class_ranks[order[~is_pos]] = _midranks(scores[~is_pos])
+        v10[i] = (ranks[positive] - class_ranks[positive]) / num_neg
+        v01[i] = 1.0 - (ranks[~positive] - class_ranks[~positive]) / num_pos
+    auc = v10.mean(axis=1)
+    if num_pos < 2 or num_neg < 2:
+        return auc, np.full((n_columns, n_columns), np.nan)
+    cov = (
+        np.cov(v10).reshape(n_columns, n_columns) / num_pos
+        + np.cov(v01).reshape(n_columns, n_columns) / num_neg
+    )
+    return auc, cov
+
+
+def delong_roc_auc(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    *,
+    confidence_level: float = 0.95,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> dict[str, float]:
+    r"""Return the ROC AUC with its DeLong variance and confidence
+    interval.
+
+    The confidence interval uses the normal approximation and is
+    clipped to ``[0, 1]``.
+
+    Args:
+        y_true: The ground truth target labels. This input must be
+            an array of shape ``(n_samples,)`` with ``0`` and ``1``
+            values.
+        y_score: The target scores. This input must be an array of
+            shape ``(n_samples,)``.
+        confidence_level: The confidence level of the interval.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import delong_roc_auc
+    >>> delong_roc_auc(
+    ...     y_true=np.array([1, 0, 0, 1, 1, 0]),
+    ...     y_score=np.array([0.9, 0.2, 0.6, 0.8, 0.4, 0.1]),
+    ... )
+    {'count': 6,
+     'roc_auc': 0.888...,
+     'roc_auc_ci_high': 1.0,
+     'roc_auc_ci_low': 0.580...,
+     'roc_auc_variance': 0.0246...}
+
+    ```
+    """
+    return delong_roc_auc_test(
+        y_true=y_true,
+        y_scores={"": y_score},
+        confidence_level=confidence_level,
+        prefix=prefix,
+        suffix=suffix,
+        nan_policy=nan_policy,
+    )
+
+
+def delong_roc_auc_test(
+    y_true: np.ndarray,
+    y_scores: Mapping[str, np.ndarray],
+    *,
+    confidence_level: float = 0.95,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> dict[str, float]:
+    r"""Return the ROC AUC of several score columns and the paired
+    DeLong tests between all the pairs of columns.
+
+    The score columns must be computed on the same samples, so the
+    ROC AUCs are correlated. For each column ``{name}``, the metrics
+    are ``{name}_roc_auc``, ``{name}_roc_auc_variance``,
+    ``{name}_roc_auc_ci_low``, and ``{name}_roc_auc_ci_high``. For
+    each pair of columns ``{a}`` and ``{b}``, the metrics are
+    ``{a}_vs_{b}_roc_auc_diff`` (the ROC AUC of ``{a}`` minus the ROC
+    AUC of ``{b}``), ``{a}_vs_{b}_z_score``, and ``{a}_vs_{b}_pvalue``
+    (two-sided test that the ROC AUCs are equal).
+
+    Args:
+        y_true: The ground truth target labels. This input must be
+            an array of shape ``(n_samples,)`` with ``0`` and ``1``
+            values.
+        y_scores: The target scores of each column. Each input must
+            be an array of shape ``(n_samples,)``.
+        confidence_level: The confidence level of the intervals.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``. With ``'omit'``, the
+            samples with a NaN value in at least one column are
+            removed, so all the columns are compared on the same
+            samples.
+
+    Returns:
+        The computed metrics.
+
+    Raises:
+        ValueError: if ``confidence_level`` is not in ``(0, 1)``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import delong_roc_auc_test
+    >>> delong_roc_auc_test(
+    ...     y_true=np.array([1, 0, 0, 1, 1, 0]),
+    ...     y_scores={
+    ...         "a": np.array([0.9, 0.2, 0.6, 0.8, 0.4, 0.1]),
+    ...         "b": np.array([0.8, 0.3, 0.1, 0.7, 0.2, 0.5]),
+    ...     },
+    ... )
+    {'a_roc_auc': 0.888...,
+     'a_roc_auc_ci_high': 1.0,
+     'a_roc_auc_ci_low': 0.580...,
+     'a_roc_auc_variance': 0.0246...,
+     'a_vs_b_pvalue': 0.654...,
+     'a_vs_b_roc_auc_diff': 0.111...,
+     'a_vs_b_z_score': 0.447...,
+     'b_roc_auc': 0.777...,
+     'b_roc_auc_ci_high': 1.0,
+     'b_roc_auc_ci_low': 0.290...,
+     'b_roc_auc_variance': 0.0617...,
+     'count': 6}
+
+    ```
+    """
+    check_nan_policy(nan_policy)
+    if not 0.0 < confidence_level < 1.0:
+        msg = f"Incorrect 'confidence_level': {confidence_level}. The value must be in (0, 1)"
+        raise ValueError(msg)
+    names = list(y_scores)
+    y_true = y_true.ravel()
+    scores = [np.asarray(y_scores[name]).ravel() for name in names]
+    check_same_shape([y_true, *scores])
+    if nan_policy == "omit":
+        mask = np.logical_not(multi_isnan([y_true, *scores]))
+        y_true, scores = y_true[mask], [score[mask] for score in scores]
+    has_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
+    for name, score in zip(names, scores):
+        has_nan |= contains_nan(arr=score, nan_policy=nan_policy, name=f"'{name or 'y_score'}'")
+
+    count = y_true.shape[0]
+    if count == 0 or has_nan:
+        auc = np.full(len(names), np.nan)
+        cov = np.full((len(names), len(names)), np.nan)
+    else:
+        auc, cov = delong_covariance(y_true, np.stack(scores, axis=1))
+
+    z = NormalDist().inv_cdf(0.5 + confidence_level / 2.0)
+    out = {"count": count}
+    for i, name in enumerate(names):
+        key = f"{name}_roc_auc" if name else "roc_auc"
+        std = math.sqrt(cov[i, i]) if cov[i, i] >= 0 else float("nan")
+        out[key] = float(auc[i])
+        out[f"{key}_variance"] = float(cov[i, i])
+        out[f"{key}_ci_low"] = float(np.clip(auc[i] - z * std, 0.0, 1.0))
+        out[f"{key}_ci_high"] = float(np.clip(auc[i] + z * std, 0.0, 1.0))
+    for (i, name1), (j, name2) in combinations(enumerate(names), 2):
+        diff = float(auc[i] - auc[j])
+        variance = cov[i, i] + cov[j, j] - 2.0 * cov[i, j]
+        z_score, pvalue = float("nan"), float("nan")
+        if variance > 0:
+            z_score = diff / math.sqrt(variance)
+            pvalue = math.erfc(abs(z_score) / math.sqrt(2.0))
+        elif variance == 0 and diff == 0:
+            # The two columns give the same ranking of the samples.
+            z_score, pvalue = 0.0, 1.0
+        out[f"{name1}_vs_{name2}_roc_auc_diff"] = diff
+        out[f"{name1}_vs_{name2}_z_score"] = z_score
+        out[f"{name1}_vs_{name2}_pvalue"] = pvalue
+    return {f"{prefix}{key}{suffix}": value for key, value in sorted(out.items())}
+
+
+def _midranks(scores: np.ndarray) -> np.ndarray:
+    r"""Return the midranks of sorted scores.
+
+    The tied scores get the average of their ranks, and the ranks
+    start at ``1``.
+
+    Args:
+        scores: The scores sorted in increasing order. This input
+            must be an array of shape ``(n_samples,)``.
+
+    Returns:
+        The midrank of each score as an array of shape
+            ``(n_samples,)``.
+    """
+    n_samples = scores.shape[0]
+    is_start = np.ones(n_samples, dtype=bool)
+    is_start[1:] = scores[1:] != scores[:-1]
+    starts = np.flatnonzero(is_start)
+    ends = np.append(starts[1:], n_samples)
+    # The ranks of a block of tied scores are ``start + 1, ..., end``.
+    return np.repeat((starts + ends + 1) / 2.0, ends - starts)
@@ -12,15 +12,10 @@ __all__ = [
 from typing import TYPE_CHECKING
 
 import numpy as np
-from sklearn import metrics
 
 from arkas.metric.classification.precision import find_label_type
-from arkas.metric.utils import (
-    check_label_type,
-    contains_nan,
-    preprocess_pred,
-    preprocess_pred_multilabel,
-)
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
+from arkas.metric.utils import check_label_type
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -138,6 +133,7 @@ def binary_fbeta_score(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float]:
     r"""Return the F-beta metrics for binary labels.
 
@@ -152,6 +148,11 @@ def binary_fbeta_score(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'binary'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared between
+            several metrics to compute the confusion matrix only once.
+            If ``None``, a new confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -170,18 +171,15 @@ def binary_fbeta_score(
 
     ```
     """
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-
-    count = y_true.size
-    out = {f"{prefix}count{suffix}": count}
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="binary", nan_policy=nan_policy
+        )
+    out = {f"{prefix}count{suffix}": confmat.count}
     for beta in betas:
         score = float("nan")
-        if count > 0 and not y_true_nan and not y_pred_nan:
-            score = float(metrics.fbeta_score(y_true=y_true, y_pred=y_pred, beta=beta))
+        if confmat.is_valid:
+            score = confmat.fbeta_score(beta=beta, average="binary")
         out[f"{prefix}f{beta}{suffix}"] = score
     return out
 
@@ -194,6 +192,7 @@ def multiclass_fbeta_score(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float]:
     r"""Return the F-beta metrics for multiclass labels.
 
@@ -208,6 +207,11 @@ def multiclass_fbeta_score(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multiclass'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared between
+            several metrics to compute the confusion matrix only once.
+            If ``None``, a new confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -230,39 +234,11 @@ def multiclass_fbeta_score(
 
     ```
     """
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-
-    n_samples = y_true.shape[0]
-    out = {f"{prefix}count{suffix}": n_samples}
-    for beta in betas:
-        fbeta = np.array([])
-        macro, micro, weighted = float("nan"), float("nan"), float("nan")
-        if n_samples > 0 and not y_true_nan and not y_pred_nan:
-            macro = metrics.fbeta_score(
-                y_true=y_true, y_pred=y_pred, beta=beta, average="macro", zero_division=0.0
-            )
-            micro = metrics.fbeta_score(
-                y_true=y_true, y_pred=y_pred, beta=beta, average="micro", zero_division=0.0
-            )
-            weighted = metrics.fbeta_score(
-                y_true=y_true, y_pred=y_pred, beta=beta, average="weighted", zero_division=0.0
-            )
-            fbeta = np.asarray(
-                metrics.fbeta_score(
-                    y_true=y_true, y_pred=y_pred, beta=beta, average=None, zero_division=0.0
-                )
-            ).ravel()
-        out |= {
-            f"{prefix}f{beta}{suffix}": fbeta,
-            f"{prefix}macro_f{beta}{suffix}": float(macro),
-            f"{prefix}micro_f{beta}{suffix}": float(micro),
-            f"{prefix}weighted_f{beta}{suffix}": float(weighted),
-        }
-    return out
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="multiclass", nan_policy=nan_policy
+        )
+    return _multi_fbeta_score(confmat=confmat, betas=betas, prefix=prefix, suffix=suffix)
 
 
 def multilabel_fbeta_score(
@@ -273,6 +249,7 @@ def multilabel_fbeta_score(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float]:
     r"""Return the F-beta metrics for multilabel labels.
 
@@ -287,6 +264,11 @@ def multilabel_fbeta_score(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multilabel'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared between
+            several metrics to compute the confusion matrix only once.
+            If ``None``, a new confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -309,33 +291,45 @@ def multilabel_fbeta_score(
 
     ```
     """
-    y_true, y_pred = preprocess_pred_multilabel(y_true, y_pred, drop_nan=nan_policy == "omit")
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="multilabel", nan_policy=nan_policy
+        )
+    return _multi_fbeta_score(confmat=confmat, betas=betas, prefix=prefix, suffix=suffix)
 
-    n_samples = y_true.shape[0]
-    out = {f"{prefix}count{suffix}": n_samples}
-    for beta in betas:
-        fbeta = np.array([])
-        macro, micro, weighted = float("nan"), float("nan"), float("nan")
-        if n_samples > 0 and not y_true_nan and not y_pred_nan:
-            fbeta = np.array(
-                metrics.fbeta_score(
-                    y_true=y_true,
-                    y_pred=y_pred,
-                    beta=beta,
-                    average="binary" if y_pred.shape[1] == 1 else None,
-                )
-            ).ravel()
-            macro = metrics.fbeta_score(y_true=y_true, y_pred=y_pred, beta=beta, average="macro")
-            micro = metrics.fbeta_score(y_true=y_true, y_pred=y_pred, beta=beta, average="micro")
-            weighted = metrics.fbeta_score(
-                y_true=y_true, y_pred=y_pred, beta=beta, average="weighted"
-            )
+
+def _multi_fbeta_score(
+    confmat: ConfusionMatrixKernel,
+    betas: Sequence[float] = (1,),
+    prefix: str = "",
+    suffix: str = "",
+) -> dict[str, float | np.ndarray]:
+    r"""Return the F-beta metrics for multiclass or multilabel labels.
+
+    Args:
+        confmat: The multiclass or multilabel confusion matrix kernel.
+        betas: The betas used to compute the F-beta scores.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+
+    Returns:
+        The computed metrics.
+    """
+    out = {f"{prefix}count{suffix}": confmat.count}
+    n_betas = len(betas)
+    fbeta = [np.array([])] * n_betas
+    macro, micro, weighted = ([float("nan")] * n_betas for _ in range(3))
+    if confmat.is_valid:
+        # The scores for all the betas are computed at once from the per-class counts.
+        fbeta = list(confmat.fbeta_scores(betas=betas))
+        macro = confmat.fbeta_scores(betas=betas, average="macro").tolist()
+        micro = confmat.fbeta_scores(betas=betas, average="micro").tolist()
+        weighted = confmat.fbeta_scores(betas=betas, average="weighted").tolist()
+    for i, beta in enumerate(betas):
         out |= {
-            f"{prefix}f{beta}{suffix}": fbeta,
-            f"{prefix}macro_f{beta}{suffix}": float(macro),
-            f"{prefix}micro_f{beta}{suffix}": float(micro),
-            f"{prefix}weighted_f{beta}{suffix}": float(weighted),
+            f"{prefix}f{beta}{suffix}": fbeta[i],
+            f"{prefix}macro_f{beta}{suffix}": macro[i],
+            f"{prefix}micro_f{beta}{suffix}": micro[i],
+            f"{prefix}weighted_f{beta}{suffix}": weighted[i],
         }
     return out
@@ -11,15 +11,10 @@ __all__ = [
 
 
 import numpy as np
-from sklearn import metrics
 
 from arkas.metric.classification.precision import find_label_type
-from arkas.metric.utils import (
-    check_label_type,
-    contains_nan,
-    preprocess_pred,
-    preprocess_pred_multilabel,
-)
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
+from arkas.metric.utils import check_label_type
 
 
 def jaccard(
@@ -116,6 +111,7 @@ def binary_jaccard(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float]:
     r"""Return the Jaccard metrics for binary labels.
 
@@ -129,6 +125,11 @@ def binary_jaccard(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'binary'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared between
+            several metrics to compute the confusion matrix only once.
+            If ``None``, a new confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -144,16 +145,14 @@ def binary_jaccard(
 
     ```
     """
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-
-    count, score = y_true.size, float("nan")
-    if count > 0 and not y_true_nan and not y_pred_nan:
-        score = float(metrics.jaccard_score(y_true=y_true, y_pred=y_pred))
-    return {f"{prefix}count{suffix}": count, f"{prefix}jaccard{suffix}": score}
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="binary", nan_policy=nan_policy
+        )
+    score = float("nan")
+    if confmat.is_valid:
+        score = confmat.jaccard(average="binary")
+    return {f"{prefix}count{suffix}": confmat.count, f"{prefix}jaccard{suffix}": score}
 
 
 def multiclass_jaccard(
@@ -163,6 +162,7 @@ def multiclass_jaccard(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float | np.ndarray]:
     r"""Return the Jaccard metrics for multiclass labels.
 
@@ -176,6 +176,11 @@ def multiclass_jaccard(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multiclass'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared between
+            several metrics to compute the confusion matrix only once.
+            If ``None``, a new confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -197,35 +202,11 @@ def multiclass_jaccard(
 
     ```
     """
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-
-    per_class = np.array([])
-    macro, micro, weighted = float("nan"), float("nan"), float("nan")
-    n_samples = y_true.shape[0]
-    if n_samples > 0 and not y_true_nan and not y_pred_nan:
-        macro = metrics.jaccard_score(
-            y_true=y_true, y_pred=y_pred, average="macro", zero_division=0.0
-        )
-        micro = metrics.jaccard_score(
-            y_true=y_true, y_pred=y_pred, average="micro", zero_division=0.0
-        )
-        weighted = metrics.jaccard_score(
-            y_true=y_true, y_pred=y_pred, average="weighted", zero_division=0.0
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="multiclass", nan_policy=nan_policy
         )
-        per_class = np.asarray(
-            metrics.jaccard_score(y_true=y_true, y_pred=y_pred, average=None, zero_division=0.0)
-        ).ravel()
-    return {
-        f"{prefix}count{suffix}": n_samples,
-        f"{prefix}jaccard{suffix}": per_class,
-        f"{prefix}macro_jaccard{suffix}": float(macro),
-        f"{prefix}micro_jaccard{suffix}": float(micro),
-        f"{prefix}weighted_jaccard{suffix}": float(weighted),
-    }
+    return _multi_jaccard(confmat=confmat, prefix=prefix, suffix=suffix)
 
 
 def multilabel_jaccard(
@@ -235,6 +216,7 @@ def multilabel_jaccard(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float | np.ndarray]:
     r"""Return the Jaccard metrics for multilabel labels.
 
@@ -248,6 +230,11 @@ def multilabel_jaccard(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multilabel'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared between
+            several metrics to compute the confusion matrix only once.
+            If ``None``, a new confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -270,29 +257,37 @@ def multilabel_jaccard(
 
     ```
     """
-    y_true, y_pred = preprocess_pred_multilabel(y_true, y_pred, drop_nan=nan_policy == "omit")
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="multilabel", nan_policy=nan_policy
+        )
+    return _multi_jaccard(confmat=confmat, prefix=prefix, suffix=suffix)
+
+
+def _multi_jaccard(
+    confmat: ConfusionMatrixKernel, prefix: str = "", suffix: str = ""
+) -> dict[str, float | np.ndarray]:
+    r"""Return the jaccard metrics for multiclass or multilabel labels.
+
+    Args:
+        confmat: The multiclass or multilabel confusion matrix kernel.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
 
+    Returns:
+        The computed metrics.
+    """
     per_class = np.array([])
     macro, micro, weighted = float("nan"), float("nan"), float("nan")
-    n_samples = y_true.shape[0]
-    if n_samples > 0 and not y_true_nan and not y_pred_nan:
-        per_class = np.array(
-            metrics.jaccard_score(
-                y_true=y_true,
-                y_pred=y_pred,
-                average="binary" if y_pred.shape[1] == 1 else None,
-            )
-        ).ravel()
-        macro = metrics.jaccard_score(y_true=y_true, y_pred=y_pred, average="macro")
-        micro = metrics.jaccard_score(y_true=y_true, y_pred=y_pred, average="micro")
-        weighted = metrics.jaccard_score(y_true=y_true, y_pred=y_pred, average="weighted")
-
+    if confmat.is_valid:
+        per_class = confmat.jaccard()
+        macro = confmat.jaccard(average="macro")
+        micro = confmat.jaccard(average="micro")
+        weighted = confmat.jaccard(average="weighted")
     return {
-        f"{prefix}count{suffix}": n_samples,
+        f"{prefix}count{suffix}": confmat.count,
         f"{prefix}jaccard{suffix}": per_class,
-        f"{prefix}macro_jaccard{suffix}": float(macro),
-        f"{prefix}micro_jaccard{suffix}": float(micro),
-        f"{prefix}weighted_jaccard{suffix}": float(weighted),
+        f"{prefix}macro_jaccard{suffix}": macro,
+        f"{prefix}micro_jaccard{suffix}": micro,
+        f"{prefix}weighted_jaccard{suffix}": weighted,
     }
@@ -13,14 +13,9 @@ __all__ = [
 import math
 
 import numpy as np
-from sklearn import metrics
 
-from arkas.metric.utils import (
-    check_label_type,
-    contains_nan,
-    preprocess_pred,
-    preprocess_pred_multilabel,
-)
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
+from arkas.metric.utils import check_label_type, is_sparse
 
 
 def precision(
@@ -117,6 +112,7 @@ def binary_precision(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float]:
     r"""Return the precision metrics for binary labels.
 
@@ -130,6 +126,11 @@ def binary_precision(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'binary'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared between
+            several metrics to compute the confusion matrix only once.
+            If ``None``, a new confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -145,16 +146,14 @@ def binary_precision(
 
     ```
     """
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-
-    count, score = y_true.size, float("nan")
-    if count > 0 and not y_true_nan and not y_pred_nan:
-        score = float(metrics.precision_score(y_true=y_true, y_pred=y_pred))
-    return {f"{prefix}count{suffix}": count, f"{prefix}precision{suffix}": score}
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="binary", nan_policy=nan_policy
+        )
+    score = float("nan")
+    if confmat.is_valid:
+        score = confmat.precision(average="binary")
+    return {f"{prefix}count{suffix}": confmat.count, f"{prefix}precision{suffix}": score}
 
 
 def multiclass_precision(
@@ -164,6 +163,7 @@ def multiclass_precision(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float | np.ndarray]:
     r"""Return the precision metrics for multiclass labels.
 
@@ -177,6 +177,11 @@ def multiclass_precision(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multiclass'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared between
+            several metrics to compute the confusion matrix only once.
+            If ``None``, a new confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -198,35 +203,11 @@ def multiclass_precision(
 
     ```
     """
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
-
-    per_class = np.array([])
-    macro, micro, weighted = float("nan"), float("nan"), float("nan")
-    n_samples = y_true.shape[0]
-    if n_samples > 0 and not y_true_nan and not y_pred_nan:
-        macro = metrics.precision_score(
-            y_true=y_true, y_pred=y_pred, average="macro", zero_division=0.0
-        )
-        micro = metrics.precision_score(
-            y_true=y_true, y_pred=y_pred, average="micro", zero_division=0.0
-        )
-        weighted = metrics.precision_score(
-            y_true=y_true, y_pred=y_pred, average="weighted", zero_division=0.0
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="multiclass", nan_policy=nan_policy
         )
-        per_class = np.asarray(
-            metrics.precision_score(y_true=y_true, y_pred=y_pred, average=None, zero_division=0.0)
-        ).ravel()
-    return {
-        f"{prefix}count{suffix}": n_samples,
-        f"{prefix}macro_precision{suffix}": float(macro),
-        f"{prefix}micro_precision{suffix}": float(micro),
-        f"{prefix}precision{suffix}": per_class,
-        f"{prefix}weighted_precision{suffix}": float(weighted),
-    }
+    return _multi_precision(confmat=confmat, prefix=prefix, suffix=suffix)
 
 
 def multilabel_precision(
@@ -236,6 +217,7 @@ def multilabel_precision(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    confmat: ConfusionMatrixKernel | None = None,
 ) -> dict[str, float | np.ndarray]:
     r"""Return the precision metrics for multilabel labels.
 
@@ -249,6 +231,11 @@ def multilabel_precision(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multilabel'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared between
+            several metrics to compute the confusion matrix only once.
+            If ``None``, a new confusion matrix kernel is created.
 
     Returns:
         The computed metrics.
@@ -271,31 +258,39 @@ def multilabel_precision(
 
     ```
     """
-    y_true, y_pred = preprocess_pred_multilabel(y_true, y_pred, drop_nan=nan_policy == "omit")
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
+    if confmat is None:
+        confmat = ConfusionMatrixKernel(
+            y_true=y_true, y_pred=y_pred, label_type="multilabel", nan_policy=nan_policy
+        )
+    return _multi_precision(confmat=confmat, prefix=prefix, suffix=suffix)
+
+
+def _multi_precision(
+    confmat: ConfusionMatrixKernel, prefix: str = "", suffix: str = ""
+) -> dict[str, float | np.ndarray]:
+    r"""Return the precision metrics for multiclass or multilabel labels.
+
+    Args:
+        confmat: The multiclass or multilabel confusion matrix kernel.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
 
+    Returns:
+        The computed metrics.
+    """
     per_class = np.array([])
     macro, micro, weighted = float("nan"), float("nan"), float("nan")
-    n_samples = y_true.shape[0]
-    if n_samples > 0 and not y_true_nan and not y_pred_nan:
-        per_class = np.array(
-            metrics.precision_score(
-                y_true=y_true,
-                y_pred=y_pred,
-                average="binary" if y_pred.shape[1] == 1 else None,
-            )
-        ).ravel()
-        macro = metrics.precision_score(y_true=y_true, y_pred=y_pred, average="macro")
-        micro = metrics.precision_score(y_true=y_true, y_pred=y_pred, average="micro")
-        weighted = metrics.precision_score(y_true=y_true, y_pred=y_pred, average="weighted")
-
+    if confmat.is_valid:
+        per_class = confmat.precision()
+        macro = confmat.precision(average="macro")
+        micro = confmat.precision(average="micro")
+        weighted = confmat.precision(average="weighted")
     return {
-        f"{prefix}count{suffix}": n_samples,
-        f"{prefix}macro_precision{suffix}": float(macro),
-        f"{prefix}micro_precision{suffix}": float(micro),
+        f"{prefix}count{suffix}": confmat.count,
+        f"{prefix}macro_precision{suffix}": macro,
+        f"{prefix}micro_precision{suffix}": micro,
         f"{prefix}precision{suffix}": per_class,
-        f"{prefix}weighted_precision{suffix}": float(weighted),
+        f"{prefix}weighted_precision{suffix}": weighted,
     }
 
 
@@ -305,6 +300,7 @@ def find_label_type(y_true: np.ndarray, y_pred: np.ndarray) -> str:
 
     Note:
         NaN are used to indicate invalid/missing values.
+        The ``scipy.sparse`` arrays are always multilabel.
 
     Args:
         y_true: The ground truth target labels.
@@ -334,6 +330,9 @@ def find_label_type(y_true: np.ndarray, y_pred: np.ndarray) -> str:
 
     ```
     """
+    if is_sparse(y_true) or is_sparse(y_pred):
+        # only the multilabel metrics support the sparse arrays
+        return "multilabel"
     # remove NaNs because they indicate missing values
     unique = set(filter(lambda x: not math.isnan(x), np.unique(y_true).tolist()))
     if unique.issubset({0, 1}):
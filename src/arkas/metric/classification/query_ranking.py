@@ -0,0 +1,293 @@
+r"""Implement the learning-to-rank metrics for data grouped by query."""
+
+from __future__ import annotations
+
+__all__ = ["QuerySegments", "query_ranking_metrics"]
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from arkas.metric.utils import check_same_shape, contains_nan, multi_isnan, safe_divide
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def query_ranking_metrics(
+    query_id: np.ndarray,
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    *,
+    k: Sequence[int] = (10,),
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> dict[str, float]:
+    r"""Return the learning-to-rank metrics of data in long format.
+
+    Each row is a result of a query, and the results of a query are
+    ranked by decreasing score. The metrics do not depend on the order
+    of the rows. The NDCG, precision, and recall are averaged over
+    all the orderings of the tied scores, like ``ndcg``. The average
+    precision and reciprocal rank break the ties pessimistically,
+    i.e. the tied results are ranked by increasing relevance. The
+    following metrics are averaged over the queries:
+
+    - ``ndcg`` and ``ndcg_at_{k}``: the Normalized Discounted
+        Cumulative Gain with the relevance as gain. It is ``0`` for
+        a query without positive relevance.
+    - ``precision_at_{k}``: the fraction of relevant results in the
+        top ``k``, where a result is relevant if its relevance is
+        positive. The denominator is always ``k``.
+    - ``recall_at_{k}``: the fraction of the relevant results that
+        are in the top ``k``.
+    - ``map``: the mean average precision.
+    - ``mrr``: the mean reciprocal rank of the first relevant result.
+
+    The recall, average precision, and reciprocal rank are ``0`` for
+    a query without relevant result. All the results are sorted once
+    by query and score, then the metrics are computed with segment
+    reductions, so there is no loop over the queries.
+
+    Args:
+        query_id: The query identifiers. This input must be an array
+            of shape ``(n_samples,)``.
+        y_true: The relevance of each result. This input must be an
+            array of shape ``(n_samples,)``.
+        y_score: The predicted scores used to rank the results of
+            each query. This input must be an array of shape
+            ``(n_samples,)``.
+        k: The numbers of top results used to compute the metrics
+            at a cutoff.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import query_ranking_metrics
+    >>> query_ranking_metrics(
+    ...     query_id=np.array([1, 1, 1, 2, 2, 2, 2]),
+    ...     y_true=np.array([0, 1, 2, 1, 0, 0, 1]),
+    ...     y_score=np.array([0.1, 0.2, 0.9, 0.5, 0.8, 0.3, 0.4]),
+    ...     k=[1, 3],
+    ... )
+    {'count': 7,
+     'map': 0.791...,
+     'mrr': 0.75,
+     'ndcg': 0.846...,
+     'ndcg_at_1': 0.5,
+     'ndcg_at_3': 0.846...,
+     'num_queries': 2,
+     'precision_at_1': 0.5,
+     'precision_at_3': 0.666...,
+     'recall_at_1': 0.25,
+     'recall_at_3': 1.0}
+
+    ```
+    """
+    query_id, y_true, y_score = query_id.ravel(), y_true.ravel(), y_score.ravel()
+    check_same_shape([query_id, y_true, y_score])
+    if nan_policy == "omit":
+        mask = np.logical_not(multi_isnan([y_true, y_score]))
+        query_id, y_true, y_score = query_id[mask], y_true[mask], y_score[mask]
+    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
+    y_score_nan = contains_nan(arr=y_score, nan_policy=nan_policy, name="'y_score'")
+
+    count = y_true.size
+    metrics = dict.fromkeys(
+        ["map", "mrr", "ndcg"]
+        + [f"{name}_at_{_k}" for _k in k for name in ["ndcg", "precision", "recall"]],
+        float("nan"),
+    )
+    num_queries = 0
+    if count > 0 and not y_true_nan and not y_score_nan:
+        segments = QuerySegments(query_id=query_id, y_true=y_true, y_score=y_score)
+        num_queries = segments.num_queries
+        metrics = segments.compute_metrics(k)
+    out = {"count": count, "num_queries": num_queries} | metrics
+    return {f"{prefix}{key}{suffix}": value for key, value in sorted(out.items())}
+
+
+class QuerySegments:
+    r"""Implement the results of several queries, ranked by score and
+    stored in contiguous segments.
+
+    The tied scores of a query are ranked by increasing relevance, so
+    the ranking does not depend on the order of the rows. The NDCG,
+    precision, and recall are averaged over all the orderings of the
+    tied scores, whereas the average precision and reciprocal rank
+    use this pessimistic ranking.
+
+    Args:
+        query_id: The query identifiers. This input must be an array
+            of shape ``(n_samples,)``.
+        y_true: The relevance of each result. This input must be an
+            array of shape ``(n_samples,)`` without NaN values.
+        y_score: The predicted scores used to rank the results of
+            each query. This input must be an array of shape
+            ``(n_samples,)`` without NaN values.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.classification.query_ranking import QuerySegments
+    >>> segments = QuerySegments(
+    ...     query_id=np.array([1, 1, 1, 2, 2, 2, 2]),
+    ...     y_true=np.array([0, 1, 2, 1, 0, 0, 1]),
+    ...     y_score=np.array([0.1, 0.2, 0.9, 0.5, 0.8, 0.3, 0.4]),
+    ... )
+    >>> segments.num_queries
+    2
+    >>> segments.ndcg(k=3)
+    array([1.    , 0.693...])
+
+    ```
+    """
+
+    def __init__(self, query_id: np.ndarray, y_true: np.ndarray, y_score: np.ndarray) -> None:
+        y_score = np.asarray(y_score, dtype=float)
+        gain = y_true.astype(float)
+        # The tied scores are ranked by increasing relevance.
+        order = np.lexsort((gain, -y_score, query_id))
+        query_id, y_score = query_id[order], y_score[order]
+        self._gain = gain[order]
+
+        is_start = np.ones(query_id.shape[0], dtype=bool)
+        is_start[1:] = query_id[1:] != query_id[:-1]
+        self._starts = np.flatnonzero(is_start)
+        self._sizes = np.diff(np.append(self._starts, query_id.shape[0]))
+        self._position = np.arange(query_id.shape[0]) - np.repeat(self._starts, self._sizes)
+
+        # The gains of each query sorted in decreasing order, to compute the ideal DCG.
+        self._ideal_gain = self._gain[np.lexsort((-self._gain, query_id))]
+        self._discount = 1.0 / np.log2(self._position + 2)
+        self._relevant = self._gain > 0
+        self._num_relevant = self._sum(self._relevant)
+
+        # The gain and relevance averaged over the tied scores of each
+        # query. The metrics that are linear in the gain or relevance
+        # are averaged over all the orderings of the tied scores.
+        is_tie_start = is_start.copy()
+        is_tie_start[1:] |= y_score[1:] != y_score[:-1]
+        tie_starts = np.flatnonzero(is_tie_start)
+        tie_sizes = np.diff(np.append(tie_starts, query_id.shape[0]))
+        self._tie_gain = np.repeat(np.add.reduceat(self._gain, tie_starts) / tie_sizes, tie_sizes)
+        self._tie_relevant = np.repeat(
+            np.add.reduceat(self._relevant.astype(float), tie_starts) / tie_sizes, tie_sizes
+        )
+
+    @property
+    def num_queries(self) -> int:
+        r"""The number of queries."""
+        return self._starts.shape[0]
+
+    def compute_metrics(self, k: Sequence[int] = (10,)) -> dict[str, float]:
+        r"""Return the metrics averaged over the queries.
+
+        Args:
+            k: The numbers of top results used to compute the metrics
+                at a cutoff.
+
+        Returns:
+            The computed metrics.
+        """
+        metrics = {
+            "map": self.average_precision(),
+            "mrr": self.reciprocal_rank(),
+            "ndcg": self.ndcg(),
+        }
+        for _k in k:
+            metrics[f"ndcg_at_{_k}"] = self.ndcg(_k)
+            metrics[f"precision_at_{_k}"] = self.precision(_k)
+            metrics[f"recall_at_{_k}"] = self.recall(_k)
+        return {key: float(np.mean(value)) for key, value in metrics.items()}
+
+    def average_precision(self) -> np.ndarray:
+        r"""Return the average precision of each query.
+
+        Returns:
+            The average precision of each query as an array of shape
+                ``(n_queries,)``.
+        """
+        hits = np.cumsum(self._relevant)
+        offsets = hits[self._starts] - self._relevant[self._starts]
+        hits -= np.repeat(offsets, self._sizes)
+        precision = np.where(self._relevant, hits / (self._position + 1), 0.0)
+        return safe_divide(self._sum(precision), self._num_relevant)
+
+    def ndcg(self, k: int | None = None) -> np.ndarray:
+        r"""Return the Normalized Discounted Cumulative Gain (NDCG) of
+        each query.
+
+        Args:
+            k: Only consider the ``k`` top results of each query.
+                If ``None``, all the results are used.
+
+        Returns:
+            The NDCG of each query as an array of shape
+                ``(n_queries,)``.
+        """
+        discount = self._discount if k is None else self._discount * (self._position < k)
+        dcg = self._sum(self._tie_gain * discount)
+        ideal_dcg = self._sum(self._ideal_gain * discount)
+        return safe_divide(dcg, ideal_dcg)
+
+    def precision(self, k: int) -> np.ndarray:
+        r"""Return the precision at ``k`` of each query.
+
+        Args:
+            k: The number of top results of each query.
+
+        Returns:
+            The precision at ``k`` of each query as an array of shape
+                ``(n_queries,)``.
+        """
+        return self._sum(self._tie_relevant * (self._position < k)) / k
+
+    def recall(self, k: int) -> np.ndarray:
+        r"""Return the recall at ``k`` of each query.
+
+        Args:
+            k: The number of top results of each query.
+
+        Returns:
+            The recall at ``k`` of each query as an array of shape
+                ``(n_queries,)``.
+        """
+        return safe_divide(self._sum(self._tie_relevant * (self._position < k)), self._num_relevant)
+
+    def reciprocal_rank(self) -> np.ndarray:
+        r"""Return the reciprocal rank of the first relevant result of
+        each query.
+
+        Returns:
+            The reciprocal rank of each query as an array of shape
+                ``(n_queries,)``.
+        """
+        rank = np.where(self._relevant, self._position + 1.0, np.inf)
+        return 1.0 / np.minimum.reduceat(rank, self._starts)
+
+    def _sum(self, values: np.ndarray) -> np.ndarray:
+        r"""Return the sum of the values of each query.
+
+        Args:
+            values: The values sorted like the results. This input
+                must be an array of shape ``(n_samples,)``.
+
+        Returns:
+            The sum of each query as an array of shape
+                ``(n_queries,)``.
+        """
+        return np.add.reduceat(values.astype(float), self._starts)
@@ -10,16 +10,21 @@ __all__ = [
     "roc_auc",
 ]
 
-from typing import Any
-
 import numpy as np
-from sklearn import metrics
 
 from arkas.metric.classification.ap import find_label_type
+from arkas.metric.classification.score_histogram import BinaryScoreHistogram
+from arkas.metric.classification.score_ranking import (
+    BinaryScoreRanking,
+    average_binary_scores,
+    binarize_multiclass_labels,
+    columnwise_roc_auc,
+)
+from arkas.metric.classification.sparse import sparse_columnwise_roc_auc, sparse_micro_roc_auc
 from arkas.metric.utils import (
     check_label_type,
     contains_nan,
-    preprocess_score_binary,
+    is_sparse,
     preprocess_score_multiclass,
     preprocess_score_multilabel,
 )
@@ -148,6 +153,8 @@ def binary_roc_auc(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    ranking: BinaryScoreRanking | BinaryScoreHistogram | None = None,
+    n_bins: int | None = None,
 ) -> dict[str, float]:
     r"""Return the Area Under the Receiver Operating Characteristic Curve
     (ROC AUC) metrics for binary labels.
@@ -164,21 +171,27 @@ def binary_roc_auc(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        ranking: An optional ranking engine built on the same
+            ``y_true``, ``y_score``, and ``nan_policy``. It can be
+            shared between several metrics to sort the scores only
+            once. A ``BinaryScoreHistogram`` can be used to
+            approximate the metric in linear time. If ``None``, a new
+            ranking engine is created.
+        n_bins: If not ``None`` and ``ranking`` is ``None``, the
+            metric is approximated with a ``BinaryScoreHistogram``
+            with at most ``n_bins`` score buckets instead of sorting
+            the scores.
 
     Returns:
         The computed metrics.
     """
-    y_true, y_score = preprocess_score_binary(
-        y_true=y_true, y_score=y_score, drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_score_nan = contains_nan(arr=y_score, nan_policy=nan_policy, name="'y_score'")
-
-    count = y_true.size
-    roc_auc = float("nan")
-    if count > 0 and not y_true_nan and not y_score_nan:
-        roc_auc = float(metrics.roc_auc_score(y_true=y_true, y_score=y_score))
-    return {f"{prefix}count{suffix}": count, f"{prefix}roc_auc{suffix}": roc_auc}
+    if ranking is None and n_bins is not None:
+        ranking = BinaryScoreHistogram.from_scores(
+            y_true=y_true, y_score=y_score, n_bins=n_bins, nan_policy=nan_policy
+        )
+    if ranking is None:
+        ranking = BinaryScoreRanking(y_true=y_true, y_score=y_score, nan_policy=nan_policy)
+    return {f"{prefix}count{suffix}": ranking.count, f"{prefix}roc_auc{suffix}": ranking.roc_auc()}
 
 
 def multiclass_roc_auc(
@@ -215,7 +228,6 @@ def multiclass_roc_auc(
         prefix=prefix,
         suffix=suffix,
         nan_policy=nan_policy,
-        multi_class="ovr",
     )
 
 
@@ -253,7 +265,6 @@ def multilabel_roc_auc(
         prefix=prefix,
         suffix=suffix,
         nan_policy=nan_policy,
-        multi_class="ovr",
     )
 
 
@@ -264,14 +275,18 @@ def _multi_roc_auc(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
-    **kwargs: Any,
 ) -> dict[str, float | np.ndarray]:
     r"""Return the Area Under the Receiver Operating Characteristic Curve
     (ROC AUC) metrics for multilabel or multiclass labels.
 
+    The multiclass labels are evaluated with the one-vs-rest
+    strategy.
+
     Args:
         y_true: The ground truth target labels. This input must
-            be an array of shape ``(n_samples, n_classes)``.
+            be an array of shape ``(n_samples, n_classes)`` for
+            multilabel labels or ``(n_samples,)`` for multiclass
+            labels.
         y_score: The target scores, can either be probability
             estimates of the positive class, confidence values,
             or non-thresholded measure of decisions. This input must
@@ -281,11 +296,12 @@ def _multi_roc_auc(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
-        kwargs: Keyword arguments that are passed to
-            ``sklearn.metrics.roc_auc_score``.
 
     Returns:
         The computed metrics.
+
+    Raises:
+        ValueError: if the multiclass scores are not probabilities.
     """
     y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
     y_score_nan = contains_nan(arr=y_score, nan_policy=nan_policy, name="'y_score'")
@@ -294,14 +310,23 @@ def _multi_roc_auc(
     macro, micro, weighted = float("nan"), float("nan"), float("nan")
     scores = np.array([])
     if n_samples > 0 and not y_true_nan and not y_score_nan:
-        macro = metrics.roc_auc_score(y_true=y_true, y_score=y_score, average="macro", **kwargs)
-        micro = metrics.roc_auc_score(y_true=y_true, y_score=y_score, average="micro", **kwargs)
-        weighted = metrics.roc_auc_score(
-            y_true=y_true, y_score=y_score, average="weighted", **kwargs
-        )
-        scores = np.asarray(
-            metrics.roc_auc_score(y_true=y_true, y_score=y_score, average=None, **kwargs)
-        ).ravel()
+        if y_true.ndim == 1:
+            if not np.allclose(1, y_score.sum(axis=1)):
+                msg = (
+                    "Target scores need to be probabilities for multiclass roc_auc, "
+                    "i.e. they should sum up to 1.0 over classes"
+                )
+                raise ValueError(msg)
+            y_true = binarize_multiclass_labels(y_true, n_classes=y_score.shape[1])
+        # The per-class scores are computed once and the averages are derived from them.
+        if is_sparse(y_true):
+            scores = sparse_columnwise_roc_auc(y_true=y_true, y_score=y_score)
+            micro = sparse_micro_roc_auc(y_true=y_true, y_score=y_score)
+        else:
+            scores = columnwise_roc_auc(y_true=y_true, y_score=y_score)
+            micro = BinaryScoreRanking(y_true=y_true.ravel(), y_score=y_score.ravel()).roc_auc()
+        averages = average_binary_scores(scores=scores, y_true=y_true)
+        macro, weighted = averages["macro"], averages["weighted"]
 
     return {
         f"{prefix}count{suffix}": n_samples,
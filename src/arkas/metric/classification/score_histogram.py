@@ -0,0 +1,494 @@
+r"""Implement a histogram engine to approximate the score-based metrics
+for binary labels in linear time."""
+
+from __future__ import annotations
+
+__all__ = ["BinaryScoreHistogram"]
+
+import numpy as np
+from coola.utils.format import repr_mapping_line
+
+from arkas.metric.utils import check_nan_policy, contains_nan, preprocess_score_binary, safe_divide
+
+
+class BinaryScoreHistogram:
+    r"""Implement a histogram engine to approximate the score-based
+    metrics for binary labels.
+
+    The scores are not sorted. Instead, the number of positive and
+    negative samples is counted in each score bucket, which takes
+    ``O(n_samples)`` time and ``O(n_bins)`` memory. The average
+    precision and the Area Under the Receiver Operating
+    Characteristic Curve (ROC AUC) are then computed from the counts,
+    by considering that the scores in the same bucket are tied.
+    The approximation is exact if all the samples of a bucket have the
+    same score, for example when the scores are integers and the
+    ``integer`` buckets are used. ``average_precision_bounds`` and
+    ``roc_auc_bounds`` return an interval that contains the exact
+    value.
+
+    The bucket counts are additive, so a histogram can be updated
+    batch by batch, and histograms with the same buckets can be
+    merged.
+
+    Args:
+        bounds: The lower and upper bounds of the scores. The scores
+            outside the bounds are counted in the first or last
+            bucket.
+        n_bins: The number of buckets of equal width between the
+            bounds. It is ignored if ``integer`` is ``True``.
+        integer: If ``True``, the scores are expected to be integers
+            and one bucket is used for each integer value between the
+            bounds, included. The metrics are then exact.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Raises:
+        ValueError: if the bounds or the number of buckets are not
+            valid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import BinaryScoreHistogram
+    >>> histogram = BinaryScoreHistogram(n_bins=10)
+    >>> histogram
+    BinaryScoreHistogram(bounds=(0.0, 1.0), n_bins=10, integer=False, nan_policy='propagate', count=0)
+    >>> histogram.update(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.75, 0.4])
+    ... )
+    >>> histogram.average_precision()
+    1.0
+    >>> histogram.roc_auc()
+    1.0
+    >>> histogram.count
+    5
+
+    ```
+    """
+
+    def __init__(
+        self,
+        bounds: tuple[float, float] = (0.0, 1.0),
+        n_bins: int = 1000,
+        integer: bool = False,
+        nan_policy: str = "propagate",
+    ) -> None:
+        low, high = bounds
+        if not low < high:
+            msg = (
+                f"Incorrect 'bounds': {bounds}. The lower bound must be lower than the upper bound"
+            )
+            raise ValueError(msg)
+        if integer:
+            low, high = int(low), int(high)
+            n_bins = high - low + 1
+        if n_bins < 1:
+            msg = f"Incorrect 'n_bins': {n_bins}. The number of buckets must be positive"
+            raise ValueError(msg)
+        self._bounds = (low, high)
+        self._n_bins = int(n_bins)
+        self._integer = bool(integer)
+        # The bucket index of a score ``s`` is ``floor((s - low) / width)``.
+        self._width = 1.0 if integer else (high - low) / n_bins
+
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+        self._count = 0
+        self._has_nan = False
+        self._negatives = np.zeros(self._n_bins, dtype=np.int64)
+        self._positives = np.zeros(self._n_bins, dtype=np.int64)
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "bounds": self._bounds,
+                "n_bins": self._n_bins,
+                "integer": self._integer,
+                "nan_policy": self._nan_policy,
+                "count": self._count,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @classmethod
+    def from_scores(
+        cls,
+        y_true: np.ndarray,
+        y_score: np.ndarray,
+        n_bins: int = 1000,
+        nan_policy: str = "propagate",
+    ) -> BinaryScoreHistogram:
+        r"""Instantiate a histogram from arrays of labels and scores.
+
+        The bounds are the minimum and maximum finite scores. If all
+        the scores are integers and there are at most ``n_bins``
+        distinct integer values between the bounds, one bucket is
+        used for each integer value, so the metrics are exact.
+
+        Args:
+            y_true: The ground truth target labels. This input must
+                be an array of shape ``(n_samples, *)`` with ``0`` and
+                ``1`` values.
+            y_score: The target scores. This input must be an array
+                of shape ``(n_samples, *)``.
+            n_bins: The maximum number of buckets.
+            nan_policy: The policy on how to handle NaN values in the
+                input arrays. The following options are available:
+                ``'omit'``, ``'propagate'``, and ``'raise'``.
+
+        Returns:
+            The histogram updated with the input arrays.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreHistogram
+        >>> histogram = BinaryScoreHistogram.from_scores(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+        ... )
+        >>> histogram
+        BinaryScoreHistogram(bounds=(-1, 3), n_bins=5, integer=True, nan_policy='propagate', count=5)
+        >>> histogram.roc_auc()
+        1.0
+
+        ```
+        """
+        scores = y_score[np.isfinite(y_score)]
+        low, high = (float(scores.min()), float(scores.max())) if scores.size else (0.0, 1.0)
+        integer = bool(np.all(np.equal(np.mod(scores, 1), 0))) and high - low < n_bins
+        if low == high:
+            high = low + 1.0
+        histogram = cls(bounds=(low, high), n_bins=n_bins, integer=integer, nan_policy=nan_policy)
+        histogram.update(y_true=y_true, y_score=y_score)
+        return histogram
+
+    @property
+    def bounds(self) -> tuple[float, float]:
+        return self._bounds
+
+    @property
+    def count(self) -> int:
+        r"""The number of samples used to compute the metrics."""
+        return self._count
+
+    @property
+    def integer(self) -> bool:
+        return self._integer
+
+    @property
+    def n_bins(self) -> int:
+        return self._n_bins
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    @property
+    def negatives(self) -> np.ndarray:
+        r"""The number of negative samples in each bucket, by increasing
+        score."""
+        return self._negatives
+
+    @property
+    def positives(self) -> np.ndarray:
+        r"""The number of positive samples in each bucket, by increasing
+        score."""
+        return self._positives
+
+    def average_precision(self) -> float:
+        r"""Return the approximate average precision.
+
+        Returns:
+            The approximate average precision. The value is NaN if
+                there is no valid sample, or if the inputs contain NaN
+                values and ``nan_policy`` is ``'propagate'``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreHistogram
+        >>> histogram = BinaryScoreHistogram(n_bins=10)
+        >>> histogram.update(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.75, 0.4])
+        ... )
+        >>> histogram.average_precision()
+        1.0
+
+        ```
+        """
+        if not self._is_valid():
+            return float("nan")
+        tps, fps, _ = self.cumulative_counts()
+        if tps[-1] == 0:
+            return 0.0
+        precision = tps / (tps + fps)
+        recall = np.concatenate([tps[::-1] / tps[-1], [0.0]])
+        return max(0.0, float(-np.sum(np.diff(recall) * precision[::-1])))
+
+    def average_precision_bounds(self) -> tuple[float, float]:
+        r"""Return an interval that contains the exact average precision.
+
+        The exact average precision depends on the order of the
+        samples inside each bucket. For the positive samples of a
+        bucket, the precision is at most the precision obtained when
+        the positive samples are ranked before the negative samples
+        of the bucket, and at least the precision obtained when they
+        are ranked after. The lower bound uses an integral lower bound
+        of the sum of the increasing per-sample precisions.
+
+        Returns:
+            The lower and upper bounds of the exact average precision.
+                The values are NaN if the average precision cannot be
+                computed.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreHistogram
+        >>> histogram = BinaryScoreHistogram(n_bins=2)
+        >>> histogram.update(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.75, 0.4])
+        ... )
+        >>> histogram.average_precision_bounds()
+        (0.851..., 1.0)
+
+        ```
+        """
+        if not self._is_valid():
+            return float("nan"), float("nan")
+        pos, neg = self._positives[::-1], self._negatives[::-1]
+        num_pos = pos.sum()
+        if num_pos == 0:
+            return 0.0, 0.0
+        # The number of positive samples and samples ranked in the
+        # previous buckets.
+        prev_pos = np.cumsum(pos) - pos
+        prev_all = np.cumsum(pos + neg) - pos - neg
+        upper = safe_divide(pos * (prev_pos + pos), prev_all + pos).sum()
+        # sum_{k=1}^{p} (a + k) / (e + k) >= p - (e - a) * log(1 + p / e)
+        # where a (resp. e) is the number of positive (resp. all)
+        # samples ranked before the positive samples of the bucket.
+        offset = prev_all + neg
+        log_term = np.log1p(safe_divide(pos, offset))
+        lower = (pos - (offset - prev_pos) * log_term).sum()
+        return max(0.0, float(lower / num_pos)), min(1.0, float(upper / num_pos))
+
+    def roc_auc(self) -> float:
+        r"""Return the approximate Area Under the Receiver Operating
+        Characteristic Curve (ROC AUC).
+
+        Returns:
+            The approximate ROC AUC. The value is NaN if there is no
+                valid sample, if only one class is present in
+                ``y_true``, or if the inputs contain NaN values and
+                ``nan_policy`` is ``'propagate'``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreHistogram
+        >>> histogram = BinaryScoreHistogram(n_bins=10)
+        >>> histogram.update(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.75, 0.4])
+        ... )
+        >>> histogram.roc_auc()
+        1.0
+
+        ```
+        """
+        if not self._is_valid():
+            return float("nan")
+        pos, neg = self._positives, self._negatives
+        num_pos, num_neg = pos.sum(), neg.sum()
+        if num_pos == 0 or num_neg == 0:
+            return float("nan")
+        # Each negative sample is ranked below the positive samples of the
+        # upper buckets, and ties with the positive samples of its bucket.
+        upper_pos = num_pos - np.cumsum(pos)
+        area = np.sum(neg * (2 * upper_pos + pos))
+        return float(area / (2.0 * num_pos * num_neg))
+
+    def roc_auc_bounds(self) -> tuple[float, float]:
+        r"""Return an interval that contains the exact ROC AUC.
+
+        Only the pairs of positive and negative samples in the same
+        bucket are not ordered by the histogram. They count for
+        ``0.5`` in the approximate ROC AUC and for ``0``, ``0.5``,
+        or ``1`` in the exact ROC AUC, so the absolute error is at most
+        ``0.5 * sum(positives * negatives) / (n_pos * n_neg)``.
+
+        Returns:
+            The lower and upper bounds of the exact ROC AUC. The
+                values are NaN if the ROC AUC cannot be computed.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreHistogram
+        >>> histogram = BinaryScoreHistogram(n_bins=2)
+        >>> histogram.update(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.75, 0.4])
+        ... )
+        >>> histogram.roc_auc_bounds()
+        (0.666..., 1.0)
+
+        ```
+        """
+        auc = self.roc_auc()
+        if np.isnan(auc):
+            return float("nan"), float("nan")
+        pos, neg = self._positives, self._negatives
+        error = 0.5 * float(np.sum(pos * neg)) / (float(pos.sum()) * float(neg.sum()))
+        return max(0.0, auc - error), min(1.0, auc + error)
+
+    def cumulative_counts(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        r"""Return the cumulative true positive and false positive counts
+        for each non-empty bucket.
+
+        The output follows the convention of
+        ``BinaryScoreRanking.cumulative_counts`` where the threshold
+        of a bucket is its lower edge.
+
+        Returns:
+            A tuple with 3 arrays: the cumulative true positive counts,
+                the cumulative false positive counts, and the
+                decreasing thresholds. The arrays are empty if there is
+                no valid sample.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreHistogram
+        >>> histogram = BinaryScoreHistogram(n_bins=4)
+        >>> histogram.update(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.75, 0.4])
+        ... )
+        >>> tps, fps, thresholds = histogram.cumulative_counts()
+        >>> tps
+        array([2, 3, 3])
+        >>> fps
+        array([0, 1, 2])
+        >>> thresholds
+        array([0.75, 0.25, 0.  ])
+
+        ```
+        """
+        if not self._is_valid():
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([])
+        pos, neg = self._positives[::-1], self._negatives[::-1]
+        nonempty = (pos + neg) > 0
+        edges = self._bounds[0] + self._width * np.arange(self._n_bins)[::-1]
+        return np.cumsum(pos)[nonempty], np.cumsum(neg)[nonempty], edges[nonempty]
+
+    def merge(self, other: BinaryScoreHistogram) -> None:
+        r"""Merge the counts of another histogram in the current
+        histogram.
+
+        Args:
+            other: The other histogram. It must have the same buckets
+                and NaN policy as the current histogram.
+
+        Raises:
+            ValueError: if ``other`` has different buckets or NaN
+                policy.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreHistogram
+        >>> histogram1 = BinaryScoreHistogram(n_bins=10)
+        >>> histogram1.update(y_true=np.array([1, 0, 0]), y_score=np.array([0.9, 0.1, 0.35]))
+        >>> histogram2 = BinaryScoreHistogram(n_bins=10)
+        >>> histogram2.update(y_true=np.array([1, 1]), y_score=np.array([0.75, 0.4]))
+        >>> histogram1.merge(histogram2)
+        >>> histogram1.count
+        5
+        >>> histogram1.roc_auc()
+        1.0
+
+        ```
+        """
+        if (
+            other.bounds != self._bounds
+            or other.n_bins != self._n_bins
+            or other.integer != self._integer
+            or other.nan_policy != self._nan_policy
+        ):
+            msg = f"The histograms must have the same buckets and NaN policy: {self} and {other}"
+            raise ValueError(msg)
+        self._count += other._count
+        self._has_nan = self._has_nan or other._has_nan
+        self._negatives += other._negatives
+        self._positives += other._positives
+
+    def update(self, y_true: np.ndarray, y_score: np.ndarray) -> None:
+        r"""Update the histogram with a new batch of data.
+
+        Args:
+            y_true: The ground truth target labels. This input must
+                be an array of shape ``(n_samples, *)`` with ``0`` and
+                ``1`` values.
+            y_score: The target scores. This input must be an array
+                of shape ``(n_samples, *)``.
+
+        Raises:
+            ValueError: if the inputs contain NaN values and
+                ``nan_policy`` is ``'raise'``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreHistogram
+        >>> histogram = BinaryScoreHistogram(n_bins=4)
+        >>> histogram.update(y_true=np.array([1, 0, 0]), y_score=np.array([0.9, 0.1, 0.35]))
+        >>> histogram.positives
+        array([0, 0, 0, 1])
+        >>> histogram.negatives
+        array([1, 1, 0, 0])
+
+        ```
+        """
+        y_true, y_score = preprocess_score_binary(
+            y_true=y_true, y_score=y_score, drop_nan=self._nan_policy == "omit"
+        )
+        y_true_nan = contains_nan(arr=y_true, nan_policy=self._nan_policy, name="'y_true'")
+        y_score_nan = contains_nan(arr=y_score, nan_policy=self._nan_policy, name="'y_score'")
+        self._count += y_true.size
+        if y_true_nan or y_score_nan:
+            self._has_nan = True
+            return
+        bins = np.floor((y_score - self._bounds[0]) / self._width)
+        bins = np.clip(bins, 0, self._n_bins - 1).astype(np.int64)
+        counts = np.bincount(2 * bins + (y_true == 1), minlength=2 * self._n_bins)
+        self._negatives += counts[0::2]
+        self._positives += counts[1::2]
+
+    def _is_valid(self) -> bool:
+        r"""Indicate if the metrics can be computed.
+
+        Returns:
+            ``True`` if there is at least one sample and no NaN value,
+                otherwise ``False``.
+        """
+        return self._count > 0 and not self._has_nan
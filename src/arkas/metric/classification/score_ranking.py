@@ -0,0 +1,680 @@
+r"""Implement a ranking engine to compute the score-based metrics and
+curves for binary labels."""
+
+from __future__ import annotations
+
+__all__ = [
+    "BinaryScoreRanking",
+    "average_binary_scores",
+    "binarize_multiclass_labels",
+    "columnwise_average_precision",
+    "columnwise_roc_auc",
+]
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from coola.utils.format import repr_mapping_line
+
+from arkas.metric.utils import check_nan_policy, prepare_inputs, safe_divide
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from arkas.metric.utils import PreparedInputs
+
+# The maximum number of elements processed at once by the columnwise
+# functions. It bounds the memory used by the intermediate arrays.
+_MAX_CHUNK_SIZE = 2**22
+
+
+class BinaryScoreRanking:
+    r"""Implement a ranking engine for binary labels and scores.
+
+    The scores are sorted once, in decreasing order, the first time a
+    metric or a curve is requested. The average precision, the Area
+    Under the Receiver Operating Characteristic Curve (ROC AUC), the
+    precision-recall curve, and the ROC curve are then derived from
+    the same cumulative true positive and false positive counts. The
+    same object can be shared by several results or plotters that
+    use the same ``(y_true, y_score)`` pair.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples, *)`` with ``0`` and
+            ``1`` values.
+        y_score: The target scores, can either be probability
+            estimates of the positive class, confidence values,
+            or non-thresholded measure of decisions. This input must
+            be an array of shape ``(n_samples, *)``.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import BinaryScoreRanking
+    >>> ranking = BinaryScoreRanking(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+    ... )
+    >>> ranking
+    BinaryScoreRanking(y_true=(5,), y_score=(5,), nan_policy='propagate')
+    >>> ranking.average_precision()
+    1.0
+    >>> ranking.roc_auc()
+    1.0
+    >>> ranking.count
+    5
+
+    ```
+    """
+
+    def __init__(
+        self, y_true: np.ndarray, y_score: np.ndarray, nan_policy: str = "propagate"
+    ) -> None:
+        self._y_true = y_true
+        self._y_score = y_score
+
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+        self._prepared = None
+        # The following attributes are lazily computed by ``_prepare``.
+        self._count = None
+        self._is_valid = None
+        self._tps = None
+        self._fps = None
+        self._thresholds = None
+
+    @classmethod
+    def from_prepared(cls, prepared: PreparedInputs) -> BinaryScoreRanking:
+        r"""Instantiate a ranking from prepared inputs.
+
+        The inputs are not preprocessed again, so the same prepared
+        inputs can be shared with other metrics.
+
+        Args:
+            prepared: The inputs prepared with ``prepare_inputs``,
+                where ``y_pred`` contains the target scores.
+
+        Returns:
+            The instantiated ranking.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreRanking
+        >>> from arkas.metric.utils import prepare_inputs
+        >>> prepared = prepare_inputs(
+        ...     y_true=np.array([1, 0, 0, 1, 1]),
+        ...     y_pred=np.array([2, -1, 0, 3, 1]),
+        ...     pred_name="y_score",
+        ... )
+        >>> ranking = BinaryScoreRanking.from_prepared(prepared)
+        >>> ranking.average_precision()
+        1.0
+
+        ```
+        """
+        ranking = cls(
+            y_true=prepared.y_true, y_score=prepared.y_pred, nan_policy=prepared.nan_policy
+        )
+        ranking._prepared = prepared
+        return ranking
+
+    @classmethod
+    def from_counts(
+        cls,
+        tps: np.ndarray,
+        fps: np.ndarray,
+        thresholds: np.ndarray,
+        nan_policy: str = "propagate",
+    ) -> BinaryScoreRanking:
+        r"""Instantiate a ranking from cumulative counts.
+
+        The returned ranking has empty ``y_true`` and ``y_score``
+        arrays. The counts can be weighted, for example to compute
+        the metrics on a bootstrap replicate without materialising
+        the resampled arrays. Consecutive thresholds with the same
+        counts do not change the metrics.
+
+        Args:
+            tps: The cumulative true positive counts for each
+                threshold.
+            fps: The cumulative false positive counts for each
+                threshold.
+            thresholds: The decreasing thresholds.
+            nan_policy: The policy on how to handle NaN values in the
+                input arrays. The following options are available:
+                ``'omit'``, ``'propagate'``, and ``'raise'``.
+
+        Returns:
+            The instantiated ranking.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreRanking
+        >>> ranking = BinaryScoreRanking.from_counts(
+        ...     tps=np.array([1, 2, 3, 3, 3]),
+        ...     fps=np.array([0, 0, 0, 1, 2]),
+        ...     thresholds=np.array([3, 2, 1, 0, -1]),
+        ... )
+        >>> ranking.roc_auc()
+        1.0
+
+        ```
+        """
+        ranking = cls(y_true=np.array([]), y_score=np.array([]), nan_policy=nan_policy)
+        ranking._count = int(tps[-1] + fps[-1]) if tps.size else 0
+        ranking._is_valid = ranking._count > 0
+        ranking._tps, ranking._fps, ranking._thresholds = tps, fps, thresholds
+        return ranking
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "y_true": self._y_true.shape,
+                "y_score": self._y_score.shape,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def count(self) -> int:
+        r"""The number of samples used to compute the metrics."""
+        self._prepare()
+        return self._count
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    @property
+    def y_true(self) -> np.ndarray:
+        return self._y_true
+
+    @property
+    def y_score(self) -> np.ndarray:
+        return self._y_score
+
+    def average_precision(self) -> float:
+        r"""Return the average precision.
+
+        Returns:
+            The average precision. The value is NaN if there is no
+                valid sample, or if the inputs contain NaN values and
+                ``nan_policy`` is ``'propagate'``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreRanking
+        >>> ranking = BinaryScoreRanking(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+        ... )
+        >>> ranking.average_precision()
+        1.0
+
+        ```
+        """
+        if not self._prepare():
+            return float("nan")
+        tps, fps = self._tps, self._fps
+        precision = safe_divide(tps, tps + fps)
+        if tps[-1] == 0:
+            return 0.0
+        # Step function integral of the precision-recall curve. The sum is
+        # done by increasing recall to follow the scikit-learn implementation.
+        recall = np.concatenate([tps[::-1] / tps[-1], [0.0]])
+        return max(0.0, float(-np.sum(np.diff(recall) * precision[::-1])))
+
+    def roc_auc(self) -> float:
+        r"""Return the Area Under the Receiver Operating Characteristic
+        Curve (ROC AUC).
+
+        Returns:
+            The ROC AUC. The value is NaN if there is no valid sample,
+                if only one class is present in ``y_true``, or if the
+                inputs contain NaN values and ``nan_policy`` is
+                ``'propagate'``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreRanking
+        >>> ranking = BinaryScoreRanking(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+        ... )
+        >>> ranking.roc_auc()
+        1.0
+
+        ```
+        """
+        if not self._prepare():
+            return float("nan")
+        tps, fps = self._tps, self._fps
+        num_pos, num_neg = tps[-1], fps[-1]
+        if num_pos == 0 or num_neg == 0:
+            return float("nan")
+        # Trapezoidal rule on the integer counts to limit the rounding errors.
+        area = np.sum(np.diff(fps, prepend=0) * (tps + np.concatenate([[0], tps[:-1]])))
+        return float(area / (2.0 * num_pos * num_neg))
+
+    def cumulative_counts(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        r"""Return the cumulative true positive and false positive counts
+        for each distinct threshold.
+
+        Returns:
+            A tuple with 3 arrays: the cumulative true positive counts,
+                the cumulative false positive counts, and the
+                decreasing thresholds. The arrays are empty if there is
+                no valid sample.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreRanking
+        >>> ranking = BinaryScoreRanking(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+        ... )
+        >>> tps, fps, thresholds = ranking.cumulative_counts()
+        >>> tps
+        array([1, 2, 3, 3, 3])
+        >>> fps
+        array([0, 0, 0, 1, 2])
+        >>> thresholds
+        array([ 3,  2,  1,  0, -1])
+
+        ```
+        """
+        if not self._prepare():
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([])
+        return self._tps, self._fps, self._thresholds
+
+    def precision_recall_curve(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        r"""Return the precision-recall curve.
+
+        The output follows the convention of
+        ``sklearn.metrics.precision_recall_curve``.
+
+        Returns:
+            A tuple with 3 arrays: the precision values, the recall
+                values, and the increasing thresholds. The arrays are
+                empty if there is no valid sample.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreRanking
+        >>> ranking = BinaryScoreRanking(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+        ... )
+        >>> precision, recall, thresholds = ranking.precision_recall_curve()
+        >>> precision
+        array([0.6 , 0.75, 1.  , 1.  , 1.  , 1.  ])
+        >>> recall
+        array([1.        , 1.        , 1.        , 0.66666667, 0.33333333, 0.        ])
+        >>> thresholds
+        array([-1,  0,  1,  2,  3])
+
+        ```
+        """
+        if not self._prepare():
+            return np.array([]), np.array([]), np.array([])
+        tps, fps = self._tps, self._fps
+        precision = safe_divide(tps, tps + fps)
+        recall = np.ones(tps.shape, dtype=float) if tps[-1] == 0 else tps / tps[-1]
+        return (
+            np.concatenate([precision[::-1], [1.0]]),
+            np.concatenate([recall[::-1], [0.0]]),
+            self._thresholds[::-1],
+        )
+
+    def roc_curve(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        r"""Return the Receiver Operating Characteristic (ROC) curve.
+
+        The output follows the convention of
+        ``sklearn.metrics.roc_curve`` with
+        ``drop_intermediate=False``.
+
+        Returns:
+            A tuple with 3 arrays: the false positive rates, the true
+                positive rates, and the decreasing thresholds. The
+                arrays are empty if there is no valid sample.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import BinaryScoreRanking
+        >>> ranking = BinaryScoreRanking(
+        ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+        ... )
+        >>> fpr, tpr, thresholds = ranking.roc_curve()
+        >>> fpr
+        array([0. , 0. , 0. , 0. , 0.5, 1. ])
+        >>> tpr
+        array([0.        , 0.33333333, 0.66666667, 1.        , 1.        , 1.        ])
+        >>> thresholds
+        array([inf,  3.,  2.,  1.,  0., -1.])
+
+        ```
+        """
+        if not self._prepare():
+            return np.array([]), np.array([]), np.array([])
+        tps = np.concatenate([[0], self._tps])
+        fps = np.concatenate([[0], self._fps])
+        return (
+            safe_divide(fps, np.full(fps.shape, fps[-1]), default=float("nan")),
+            safe_divide(tps, np.full(tps.shape, tps[-1]), default=float("nan")),
+            np.concatenate([[np.inf], self._thresholds]),
+        )
+
+    def _prepare(self) -> bool:
+        r"""Preprocess the inputs and sort the scores if it was not done
+        before.
+
+        Returns:
+            ``True`` if the metrics can be computed, otherwise
+                ``False``.
+        """
+        if self._is_valid is not None:
+            return self._is_valid
+
+        prepared = self._prepared
+        if prepared is None:
+            prepared = prepare_inputs(
+                self._y_true, self._y_score, nan_policy=self._nan_policy, pred_name="y_score"
+            )
+        self._count = prepared.count
+        self._is_valid = prepared.is_valid
+        if self._is_valid:
+            self._tps, self._fps, self._thresholds = _cumulative_counts(
+                y_true=prepared.y_true, y_score=prepared.y_pred
+            )
+        return self._is_valid
+
+
+def average_binary_scores(scores: np.ndarray, y_true: np.ndarray) -> dict[str, float]:
+    r"""Return the macro and weighted averages of per-class scores.
+
+    The averages are derived from the per-class scores and the
+    supports, so the per-class scores are computed only once. The
+    classes without positive are ignored in the weighted average. They
+    follow the convention of ``sklearn.metrics.average_precision_score``
+    and ``sklearn.metrics.roc_auc_score``.
+
+    Args:
+        scores: The per-class scores. This input must be an array of
+            shape ``(n_classes,)``.
+        y_true: The binary ground truth target labels used to compute
+            the supports. This input must be an array of shape
+            ``(n_samples, n_classes)`` with ``0`` and ``1`` values.
+
+    Returns:
+        A dictionary with the ``'macro'`` and ``'weighted'`` averages.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.classification.score_ranking import average_binary_scores
+    >>> average_binary_scores(
+    ...     scores=np.array([1.0, 0.5, 0.0]),
+    ...     y_true=np.array([[1, 0, 1], [0, 1, 0], [1, 0, 0]]),
+    ... )
+    {'macro': 0.5, 'weighted': 0.625}
+
+    ```
+    """
+    support = np.sum(y_true == 1, axis=0)
+    # The classes without positive have a zero weight, but their score
+    # can be NaN, so they are removed before the weighted average.
+    mask = support > 0
+    weighted = 0.0
+    if mask.any():
+        weighted = float(np.average(scores[mask], weights=support[mask]))
+    return {"macro": float(np.mean(scores)), "weighted": weighted}
+
+
+def binarize_multiclass_labels(y_true: np.ndarray, n_classes: int) -> np.ndarray:
+    r"""Convert multiclass labels to binary indicators.
+
+    The classes are the sorted unique values of ``y_true``, so the
+    ``i``-th column corresponds to the ``i``-th smallest label.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples,)``.
+        n_classes: The expected number of classes.
+
+    Returns:
+        The binary indicators as an array of shape
+            ``(n_samples, n_classes)``.
+
+    Raises:
+        ValueError: if the number of classes in ``y_true`` is not
+            equal to ``n_classes``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.classification.score_ranking import binarize_multiclass_labels
+    >>> binarize_multiclass_labels(np.array([0, 2, 1, 1]), n_classes=3)
+    array([[1, 0, 0],
+           [0, 0, 1],
+           [0, 1, 0],
+           [0, 1, 0]])
+
+    ```
+    """
+    classes, indices = np.unique(y_true, return_inverse=True)
+    if classes.size != n_classes:
+        msg = (
+            f"Number of classes in y_true ({classes.size:,}) not equal to the number of "
+            f"columns in 'y_score' ({n_classes:,})"
+        )
+        raise ValueError(msg)
+    out = np.zeros((y_true.shape[0], n_classes), dtype=np.int64)
+    out[np.arange(y_true.shape[0]), indices.ravel()] = 1
+    return out
+
+
+def columnwise_average_precision(y_true: np.ndarray, y_score: np.ndarray) -> np.ndarray:
+    r"""Return the average precision of each column.
+
+    All the columns are sorted together, so it is equivalent to
+    calling ``BinaryScoreRanking.average_precision`` on each column
+    but without a Python loop over the columns.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples, n_classes)`` with
+            ``0`` and ``1`` values.
+        y_score: The target scores. This input must be an array of
+            shape ``(n_samples, n_classes)`` without NaN values.
+
+    Returns:
+        The average precision of each column as an array of shape
+            ``(n_classes,)``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.classification.score_ranking import columnwise_average_precision
+    >>> columnwise_average_precision(
+    ...     y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+    ...     y_score=np.array([[2, -1, -1], [-1, 1, 2], [0, 2, 3], [3, -2, -4], [1, -3, -5]]),
+    ... )
+    array([1.  , 1.  , 0.477...])
+
+    ```
+    """
+    out = np.zeros(y_true.shape[1])
+    for cols, (tps, prev_tps, _, _, is_last) in _iter_column_counts(y_true, y_score):
+        num_pos = tps[-1]
+        has_pos = num_pos > 0
+        rank = np.arange(1, tps.shape[0] + 1).reshape(-1, 1)
+        denominator = np.broadcast_to(num_pos, tps.shape)
+        recall_diff = safe_divide(tps, denominator) - safe_divide(prev_tps, denominator)
+        terms = np.where(is_last, recall_diff * (tps / rank), 0.0)
+        ap = np.sum(terms[::-1], axis=0)
+        out[cols] = np.where(has_pos, np.maximum(ap, 0.0), 0.0)
+    return out
+
+
+def columnwise_roc_auc(y_true: np.ndarray, y_score: np.ndarray) -> np.ndarray:
+    r"""Return the Area Under the Receiver Operating Characteristic
+    Curve (ROC AUC) of each column.
+
+    All the columns are sorted together, so it is equivalent to
+    calling ``BinaryScoreRanking.roc_auc`` on each column but without
+    a Python loop over the columns.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples, n_classes)`` with
+            ``0`` and ``1`` values.
+        y_score: The target scores. This input must be an array of
+            shape ``(n_samples, n_classes)`` without NaN values.
+
+    Returns:
+        The ROC AUC of each column as an array of shape
+            ``(n_classes,)``. The value is NaN if only one class is
+            present in the column.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.classification.score_ranking import columnwise_roc_auc
+    >>> columnwise_roc_auc(
+    ...     y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+    ...     y_score=np.array([[2, -1, -1], [-1, 1, 2], [0, 2, 3], [3, -2, -4], [1, -3, -5]]),
+    ... )
+    array([1., 1., 0.])
+
+    ```
+    """
+    out = np.full(y_true.shape[1], float("nan"))
+    for cols, (tps, prev_tps, fps, prev_fps, is_last) in _iter_column_counts(y_true, y_score):
+        num_pos, num_neg = tps[-1], fps[-1]
+        # Trapezoidal rule on the integer counts to limit the rounding errors.
+        area = np.sum(np.where(is_last, (fps - prev_fps) * (tps + prev_tps), 0), axis=0)
+        out[cols] = safe_divide(area, 2.0 * num_pos * num_neg, default=float("nan"))
+    return out
+
+
+def _iter_column_counts(
+    y_true: np.ndarray, y_score: np.ndarray
+) -> Iterator[tuple[slice, tuple[np.ndarray, ...]]]:
+    r"""Iterate over chunks of columns and return their cumulative
+    true positive and false positive counts.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples, n_classes)``.
+        y_score: The target scores. This input must be an array of
+            shape ``(n_samples, n_classes)``.
+
+    Returns:
+        An iterator over tuples with the slice of columns, and the
+            cumulative counts. The counts are a tuple with 5 arrays
+            of shape ``(n_samples, chunk_size)``: the cumulative true
+            positive counts, the cumulative true positive counts at
+            the previous threshold, the cumulative false positive
+            counts, the cumulative false positive counts at the
+            previous threshold, and a boolean mask to indicate the
+            last sample of each block of tied scores.
+    """
+    n_samples, n_classes = y_true.shape
+    if n_samples == 0:
+        return
+    chunk_size = max(1, _MAX_CHUNK_SIZE // n_samples)
+    rank = np.arange(1, n_samples + 1, dtype=np.int64).reshape(-1, 1)
+    for start in range(0, n_classes, chunk_size):
+        cols = slice(start, min(start + chunk_size, n_classes))
+        score = y_score[:, cols]
+        indices = np.argsort(score, axis=0, kind="mergesort")[::-1]
+        score = np.take_along_axis(score, indices, axis=0)
+        tps = np.cumsum(np.take_along_axis(y_true[:, cols], indices, axis=0) == 1, axis=0)
+        fps = rank - tps
+        # Keep the last index of each block of tied scores.
+        is_last = np.ones(score.shape, dtype=bool)
+        is_last[:-1] = score[:-1] != score[1:]
+        yield cols, (
+            tps,
+            _previous_count(tps, is_last),
+            fps,
+            _previous_count(fps, is_last),
+            is_last,
+        )
+
+
+def _previous_count(counts: np.ndarray, is_last: np.ndarray) -> np.ndarray:
+    r"""Return the cumulative counts at the previous threshold.
+
+    Args:
+        counts: The non-decreasing cumulative counts. This input must
+            be an array of shape ``(n_samples, n_classes)``.
+        is_last: A boolean mask to indicate the last sample of each
+            block of tied scores.
+
+    Returns:
+        The cumulative counts at the previous threshold.
+    """
+    out = np.zeros_like(counts)
+    out[1:] = np.maximum.accumulate(np.where(is_last, counts, 0), axis=0)[:-1]
+    return out
+
+
+def _cumulative_counts(
+    y_true: np.ndarray, y_score: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    r"""Return the cumulative true positive and false positive counts
+    for each distinct threshold.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples,)``.
+        y_score: The target scores. This input must be an array of
+            shape ``(n_samples,)``.
+
+    Returns:
+        A tuple with 3 arrays: the cumulative true positive counts,
+            the cumulative false positive counts, and the decreasing
+            thresholds.
+    """
+    indices = np.argsort(y_score, kind="mergesort")[::-1]
+    y_score = y_score[indices]
+    y_true = y_true[indices] == 1
+    # Keep the last index of each block of tied scores.
+    threshold_idxs = np.flatnonzero(np.diff(y_score))
+    threshold_idxs = np.append(threshold_idxs, y_true.size - 1)
+    tps = np.cumsum(y_true, dtype=np.int64)[threshold_idxs]
+    fps = threshold_idxs + 1 - tps
+    return tps, fps, y_score[threshold_idxs]
@@ -0,0 +1,455 @@
+r"""Implement functions to compute the classification metrics with
+``scipy.sparse`` arrays.
+
+The multilabel functions only use the explicitly stored values, so
+the memory and time complexities depend on the number of stored
+values and not on ``n_samples * n_classes``. The values that are not
+stored are zeros, i.e. negative labels or a score of ``0``. The
+multiclass confusion matrix is returned as a sparse array, so its
+memory depends on the number of distinct ``(true, predicted)`` pairs
+and not on ``n_classes ** 2``.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "sparse_columnwise_average_precision",
+    "sparse_columnwise_roc_auc",
+    "sparse_micro_average_precision",
+    "sparse_micro_roc_auc",
+    "sparse_multiclass_confusion_counts",
+    "sparse_multilabel_confusion_counts",
+]
+
+import numpy as np
+
+from arkas.metric.utils import safe_divide
+from arkas.utils.imports import check_scipy, is_scipy_available
+from arkas.utils.labels import factorize_arrays
+
+if is_scipy_available():
+    from scipy import sparse
+
+
+def sparse_multiclass_confusion_counts(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> tuple[sparse.csr_array, np.ndarray]:
+    r"""Compute the confusion matrix for multiclass labels as a sparse
+    array.
+
+    The labels are encoded with
+    ``arkas.utils.labels.factorize_arrays``, and only the
+    ``(true, predicted)`` pairs that appear in the samples are stored.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples,)`` without NaN.
+        y_pred: The predicted labels. This input must be an array of
+            shape ``(n_samples,)`` without NaN.
+
+    Returns:
+        A tuple with the confusion matrix as a CSR array of shape
+            ``(n_classes, n_classes)``, and the sorted labels
+            associated to the rows and columns.
+
+    Raises:
+        RuntimeError: if ``scipy`` is not installed.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.classification.sparse import sparse_multiclass_confusion_counts
+    >>> matrix, labels = sparse_multiclass_confusion_counts(
+    ...     y_true=np.array([0, 0, 1, 1, 5, 5]), y_pred=np.array([0, 1, 1, 5, 5, 5])
+    ... )
+    >>> matrix.toarray()
+    array([[1, 1, 0], [0, 1, 1], [0, 0, 2]])
+    >>> labels
+    array([0, 1, 5])
+
+    ```
+    """
+    check_scipy()
+    (y_true, y_pred), labels = factorize_arrays(y_true, y_pred)
+    n_classes = labels.size
+    keys, counts = np.unique(
+        y_true.astype(np.int64) * n_classes + y_pred.astype(np.int64), return_counts=True
+    )
+    matrix = sparse.csr_array(
+        (counts, (keys // max(n_classes, 1), keys % max(n_classes, 1))),
+        shape=(n_classes, n_classes),
+    )
+    return matrix, labels
+
+
+def sparse_multilabel_confusion_counts(
+    y_true: sparse.csr_array, y_pred: sparse.csr_array
+) -> np.ndarray:
+    r"""Compute the confusion matrix of each class for multilabel
+    labels stored in sparse arrays.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be a CSR array of shape ``(n_samples, n_classes)`` in
+            canonical format. The positive label is ``1``.
+        y_pred: The predicted labels. This input must be a CSR array
+            of shape ``(n_samples, n_classes)`` in canonical format.
+            The positive label is ``1``.
+
+    Returns:
+        The confusion matrices as an array of shape
+            ``(n_classes, 2, 2)``. Each matrix is organized as
+            ``[[tn, fp], [fn, tp]]``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from scipy import sparse
+    >>> from arkas.metric.classification.sparse import sparse_multilabel_confusion_counts
+    >>> sparse_multilabel_confusion_counts(
+    ...     y_true=sparse.csr_array(
+    ...         np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]])
+    ...     ),
+    ...     y_pred=sparse.csr_array(
+    ...         np.array([[1, 0, 0], [0, 1, 1], [0, 1, 1], [1, 0, 0], [1, 0, 0]])
+    ...     ),
+    ... )
+    array([[[2, 0], [0, 3]],
+           [[3, 0], [0, 2]],
+           [[0, 2], [3, 0]]])
+
+    ```
+    """
+    n_samples, n_classes = y_true.shape
+    y_true, y_pred = _positive_mask(y_true), _positive_mask(y_pred)
+    true_sum = np.bincount(y_true.indices, minlength=n_classes)
+    pred_sum = np.bincount(y_pred.indices, minlength=n_classes)
+    tp = np.bincount(y_true.multiply(y_pred).tocsr().indices, minlength=n_classes)
+    fp, fn = pred_sum - tp, true_sum - tp
+    tn = n_samples - tp - fp - fn
+    return np.stack([tn, fp, fn, tp], axis=1).reshape(n_classes, 2, 2)
+
+
+def sparse_columnwise_average_precision(
+    y_true: sparse.csr_array, y_score: sparse.csr_array
+) -> np.ndarray:
+    r"""Return the average precision of each column of sparse arrays.
+
+    It is equivalent to ``columnwise_average_precision`` on the dense
+    arrays, where the scores that are not stored are ``0``.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be a CSR array of shape ``(n_samples, n_classes)`` in
+            canonical format. The positive label is ``1``.
+        y_score: The target scores. This input must be a CSR array
+            of shape ``(n_samples, n_classes)`` in canonical format
+            and without NaN values.
+
+    Returns:
+        The average precision of each column as an array of shape
+            ``(n_classes,)``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from scipy import sparse
+    >>> from arkas.metric.classification.sparse import sparse_columnwise_average_precision
+    >>> sparse_columnwise_average_precision(
+    ...     y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]])),
+    ...     y_score=sparse.csr_array(
+    ...         np.array([[0.9, 0.0, 0.0], [0.0, 0.8, 0.0], [0.2, 0.5, 0.7], [0.0, 0.0, 0.0]])
+    ...     ),
+    ... )
+    array([0.75, 1.  , 0.5 ])
+
+    ```
+    """
+    columns, tps, prev_tps, fps, _, num_pos, _ = _block_counts(y_true, y_score, micro=False)
+    return _average_precision(columns, tps, prev_tps, fps, num_pos)
+
+
+def sparse_columnwise_roc_auc(y_true: sparse.csr_array, y_score: sparse.csr_array) -> np.ndarray:
+    r"""Return the Area Under the Receiver Operating Characteristic
+    Curve (ROC AUC) of each column of sparse arrays.
+
+    It is equivalent to ``columnwise_roc_auc`` on the dense arrays,
+    where the scores that are not stored are ``0``.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be a CSR array of shape ``(n_samples, n_classes)`` in
+            canonical format. The positive label is ``1``.
+        y_score: The target scores. This input must be a CSR array
+            of shape ``(n_samples, n_classes)`` in canonical format
+            and without NaN values.
+
+    Returns:
+        The ROC AUC of each column as an array of shape
+            ``(n_classes,)``. The value is NaN for the columns with a
+            single label.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from scipy import sparse
+    >>> from arkas.metric.classification.sparse import sparse_columnwise_roc_auc
+    >>> sparse_columnwise_roc_auc(
+    ...     y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]])),
+    ...     y_score=sparse.csr_array(
+    ...         np.array([[0.9, 0.0, 0.0], [0.0, 0.8, 0.0], [0.2, 0.5, 0.7], [0.0, 0.0, 0.0]])
+    ...     ),
+    ... )
+    array([0.625, 1.   , 0.25 ])
+
+    ```
+    """
+    columns, tps, prev_tps, fps, prev_fps, num_pos, num_neg = _block_counts(
+        y_true, y_score, micro=False
+    )
+    return _roc_auc(
+        columns, tps, prev_tps, fps, prev_fps=prev_fps, num_pos=num_pos, num_neg=num_neg
+    )
+
+
+def sparse_micro_average_precision(y_true: sparse.csr_array, y_score: sparse.csr_array) -> float:
+    r"""Return the average precision of all the values of sparse
+    arrays.
+
+    It is equivalent to the average precision of the flattened dense
+    arrays, where the scores that are not stored are ``0``.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be a CSR array of shape ``(n_samples, n_classes)`` in
+            canonical format. The positive label is ``1``.
+        y_score: The target scores. This input must be a CSR array
+            of shape ``(n_samples, n_classes)`` in canonical format
+            and without NaN values.
+
+    Returns:
+        The micro average precision.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from scipy import sparse
+    >>> from arkas.metric.classification.sparse import sparse_micro_average_precision
+    >>> sparse_micro_average_precision(
+    ...     y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]])),
+    ...     y_score=sparse.csr_array(
+    ...         np.array([[0.9, 0.0, 0.0], [0.0, 0.8, 0.0], [0.2, 0.5, 0.7], [0.0, 0.0, 0.0]])
+    ...     ),
+    ... )
+    0.708...
+
+    ```
+    """
+    columns, tps, prev_tps, fps, _, num_pos, _ = _block_counts(y_true, y_score, micro=True)
+    return float(_average_precision(columns, tps, prev_tps, fps, num_pos)[0])
+
+
+def sparse_micro_roc_auc(y_true: sparse.csr_array, y_score: sparse.csr_array) -> float:
+    r"""Return the Area Under the Receiver Operating Characteristic
+    Curve (ROC AUC) of all the values of sparse arrays.
+
+    It is equivalent to the ROC AUC of the flattened dense arrays,
+    where the scores that are not stored are ``0``.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be a CSR array of shape ``(n_samples, n_classes)`` in
+            canonical format. The positive label is ``1``.
+        y_score: The target scores. This input must be a CSR array
+            of shape ``(n_samples, n_classes)`` in canonical format
+            and without NaN values.
+
+    Returns:
+        The micro ROC AUC. The value is NaN if all the values have
+            the same label.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from scipy import sparse
+    >>> from arkas.metric.classification.sparse import sparse_micro_roc_auc
+    >>> sparse_micro_roc_auc(
+    ...     y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]])),
+    ...     y_score=sparse.csr_array(
+    ...         np.array([[0.9, 0.0, 0.0], [0.0, 0.8, 0.0], [0.2, 0.5, 0.7], [0.0, 0.0, 0.0]])
+    ...     ),
+    ... )
+    0.638...
+
+    ```
+    """
+    columns, tps, prev_tps, fps, prev_fps, num_pos, num_neg = _block_counts(
+        y_true, y_score, micro=True
+    )
+    auc = _roc_auc(columns, tps, prev_tps, fps, prev_fps=prev_fps, num_pos=num_pos, num_neg=num_neg)
+    return float(auc[0])
+
+
+def _positive_mask(arr: sparse.csr_array) -> sparse.csr_array:
+    r"""Return a CSR array with the stored values equal to ``1``.
+
+    Args:
+        arr: The CSR array in canonical format.
+
+    Returns:
+        A CSR array with ``1`` where the input is ``1``, and no other
+            stored value.
+    """
+    out = arr.copy()
+    out.data = (out.data == 1).astype(np.int64)
+    out.eliminate_zeros()
+    return out
+
+
+def _block_counts(
+    y_true: sparse.csr_array, y_score: sparse.csr_array, micro: bool
+) -> tuple[np.ndarray, ...]:
+    r"""Return the cumulative true positive and false positive counts
+    at each block of tied scores of each column.
+
+    The stored scores and the scores that are not stored are handled
+    separately: the stored scores are sorted by column and decreasing
+    score, and the scores that are not stored are added as one block
+    of ``0`` per column, weighted by their numbers of positive and
+    negative labels.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be a CSR array of shape ``(n_samples, n_classes)`` in
+            canonical format.
+        y_score: The target scores. This input must be a CSR array
+            of shape ``(n_samples, n_classes)`` in canonical format.
+        micro: If ``True``, all the values are in a single column.
+
+    Returns:
+        A tuple with 7 arrays: the column of each block, the
+            cumulative true positive counts, the cumulative true
+            positive counts at the previous block, the cumulative
+            false positive counts, the cumulative false positive
+            counts at the previous block, and the numbers of
+            positive and negative labels of each column.
+    """
+    n_samples, n_classes = y_true.shape
+    y_true = _positive_mask(y_true)
+    true_rows = np.repeat(np.arange(n_samples, dtype=np.int64), np.diff(y_true.indptr))
+    score_rows = np.repeat(np.arange(n_samples, dtype=np.int64), np.diff(y_score.indptr))
+    # Both arrays are in canonical format so the flat indices are sorted.
+    true_keys = true_rows * n_classes + y_true.indices
+    score_keys = score_rows * n_classes + y_score.indices
+    is_pos = np.zeros(score_keys.shape[0], dtype=np.int64)
+    if true_keys.size > 0:
+        loc = np.minimum(np.searchsorted(true_keys, score_keys), true_keys.size - 1)
+        is_pos = (true_keys[loc] == score_keys).astype(np.int64)
+
+    if micro:
+        n_columns, size = 1, n_samples * n_classes
+        columns = np.zeros(score_keys.shape[0], dtype=np.int64)
+        num_pos = np.array([true_keys.size])
+    else:
+        n_columns, size = n_classes, n_samples
+        columns = y_score.indices.astype(np.int64)
+        num_pos = np.bincount(y_true.indices, minlength=n_classes)
+    num_neg = size - num_pos
+
+    stored_pos = np.bincount(columns, weights=is_pos, minlength=n_columns).astype(np.int64)
+    stored = np.bincount(columns, minlength=n_columns)
+    implicit_pos = num_pos - stored_pos
+    implicit_neg = size - stored - implicit_pos
+
+    columns = np.concatenate([columns, np.arange(n_columns)])
+    scores = np.concatenate([y_score.data.astype(float), np.zeros(n_columns)])
+    pos = np.concatenate([is_pos, implicit_pos])
+    neg = np.concatenate([1 - is_pos, implicit_neg])
+    order = np.lexsort((-scores, columns))
+    columns, scores = columns[order], scores[order]
+
+    # Keep the last index of each block of tied scores.
+    is_last = np.ones(columns.shape[0], dtype=bool)
+    is_last[:-1] = (columns[:-1] != columns[1:]) | (scores[:-1] != scores[1:])
+    columns = columns[is_last]
+    # The counts are cumulated over all the columns, then the counts of
+    # the previous columns are removed.
+    offset_pos, offset_neg = np.cumsum(num_pos) - num_pos, np.cumsum(num_neg) - num_neg
+    tps = np.cumsum(pos[order])[is_last] - offset_pos[columns]
+    fps = np.cumsum(neg[order])[is_last] - offset_neg[columns]
+    is_first = np.ones(columns.shape[0], dtype=bool)
+    is_first[1:] = columns[1:] != columns[:-1]
+    prev_tps = np.where(is_first, 0, np.roll(tps, 1))
+    prev_fps = np.where(is_first, 0, np.roll(fps, 1))
+    return columns, tps, prev_tps, fps, prev_fps, num_pos, num_neg
+
+
+def _average_precision(
+    columns: np.ndarray,
+    tps: np.ndarray,
+    prev_tps: np.ndarray,
+    fps: np.ndarray,
+    num_pos: np.ndarray,
+) -> np.ndarray:
+    r"""Return the average precision of each column from the block
+    counts.
+
+    Args:
+        columns: The column of each block.
+        tps: The cumulative true positive counts.
+        prev_tps: The cumulative true positive counts at the
+            previous block.
+        fps: The cumulative false positive counts.
+        num_pos: The number of positive labels of each column.
+
+    Returns:
+        The average precision of each column. The value is ``0`` for
+            the columns without positive label.
+    """
+    precision = safe_divide(tps, tps + fps)
+    area = np.bincount(columns, weights=(tps - prev_tps) * precision, minlength=num_pos.size)
+    return safe_divide(area, num_pos)
+
+
+def _roc_auc(
+    columns: np.ndarray,
+    tps: np.ndarray,
+    prev_tps: np.ndarray,
+    fps: np.ndarray,
+    *,
+    prev_fps: np.ndarray,
+    num_pos: np.ndarray,
+    num_neg: np.ndarray,
+) -> np.ndarray:
+    r"""Return the ROC AUC of each column from the block counts.
+
+    Args:
+        columns: The column of each block.
+        tps: The cumulative true positive counts.
+        prev_tps: The cumulative true positive counts at the
+            previous block.
+        fps: The cumulative false positive counts.
+        prev_fps: The cumulative false positive counts at the
+            previous block.
+        num_pos: The number of positive labels of each column.
+        num_neg: The number of negative labels of each column.
+
+    Returns:
+        The ROC AUC of each column. The value is NaN for the columns
+            with a single label.
+    """
+    # Trapezoidal rule on the integer counts to limit the rounding errors.
+    area = np.bincount(columns, weights=(fps - prev_fps) * (tps + prev_tps), minlength=num_pos.size)
+    return safe_divide(area, 2.0 * num_pos * num_neg, default=float("nan"))
@@ -0,0 +1,158 @@
+r"""Implement functions to compute the operating curves of each label of
+a multilabel model."""
+
+from __future__ import annotations
+
+__all__ = ["multilabel_threshold_curves"]
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from arkas.metric.classification.score_ranking import BinaryScoreRanking
+from arkas.metric.classification.threshold_sweep import find_best_threshold
+from arkas.metric.utils import prepare_inputs, safe_divide
+
+
+def multilabel_threshold_curves(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    *,
+    beta: float = 1,
+    n_jobs: int = 1,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> dict[str, int | np.ndarray]:
+    r"""Return the precision-recall and ROC curves, and the optimal
+    thresholds of each label of a multilabel model.
+
+    The scores of each label are sorted only once, and the curves are
+    derived from the cumulative true positive and false positive
+    counts at each distinct score. The labels are processed on a
+    thread pool because NumPy releases the GIL while sorting.
+
+    The curves of all the labels are concatenated in compact arrays.
+    The curve of the ``i``-th label is stored between
+    ``curve_offsets[i]`` and ``curve_offsets[i + 1]``, and its
+    thresholds are in decreasing order. A sample is predicted positive
+    if its score is greater than or equal to the threshold. The
+    precision and recall are ``0`` when their denominator is zero,
+    and the false positive rate is NaN if there is no negative sample,
+    like in ``binary_threshold_sweep``.
+
+    For each label, ``best_f{beta}_threshold`` is the threshold that
+    maximizes the F-beta score, and ``best_youden_threshold`` is the
+    threshold that maximizes Youden's J statistic
+    (``recall - false_positive_rate``). The optimal values are NaN if
+    they cannot be computed.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples, n_labels)`` with ``0``
+            and ``1`` values.
+        y_score: The target scores, can either be probability
+            estimates of the positive class, confidence values,
+            or non-thresholded measure of decisions. This input must
+            be an array of shape ``(n_samples, n_labels)``.
+        beta: The beta used to find the threshold that maximizes the
+            F-beta score.
+        n_jobs: The number of threads used to compute the curves.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``. With ``'omit'``, the
+            samples with a NaN value in at least one label are
+            removed.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import multilabel_threshold_curves
+    >>> metrics = multilabel_threshold_curves(
+    ...     y_true=np.array([[1, 0], [0, 1], [0, 1], [1, 0], [1, 1]]),
+    ...     y_score=np.array([[0.9, 0.2], [0.1, 0.8], [0.35, 0.6], [0.3, 0.1], [0.8, 0.5]]),
+    ... )
+    >>> metrics["curve_offsets"]
+    array([ 0,  5, 10])
+    >>> metrics["threshold"]
+    array([0.9 , 0.8 , 0.35, 0.3 , 0.1 , 0.8 , 0.6 , 0.5 , 0.2 , 0.1 ])
+    >>> metrics["precision"]
+    array([1. , 1. , 0.666..., 0.75 , 0.6 , 1. , 1. , 1. , 0.75 , 0.6 ])
+    >>> metrics["best_f1_threshold"]
+    array([0.3, 0.5])
+    >>> metrics["best_youden_threshold"]
+    array([0.8, 0.5])
+
+    ```
+    """
+    if n_jobs < 1:
+        msg = f"Incorrect 'n_jobs': {n_jobs}. The value must be greater than 0"
+        raise ValueError(msg)
+    n_labels = y_true.shape[1] if y_true.ndim == 2 else 1
+    prepared = prepare_inputs(
+        y_true, y_score, nan_policy=nan_policy, multilabel=True, pred_name="y_score"
+    )
+    y_true, y_score = prepared.y_true, prepared.y_pred
+
+    def compute_curve(col: int) -> tuple[np.ndarray, ...]:
+        ranking = BinaryScoreRanking.from_prepared(
+            prepare_inputs(y_true[:, col], y_score[:, col], pred_name="y_score", trusted=True)
+        )
+        return ranking.cumulative_counts()
+
+    if not prepared.is_valid or y_true.shape[0] == 0:
+        empty = (np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([]))
+        curves = [empty] * n_labels
+    elif n_jobs > 1 and n_labels > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            curves = list(executor.map(compute_curve, range(n_labels)))
+    else:
+        curves = [compute_curve(col) for col in range(n_labels)]
+
+    sizes = np.array([curve[0].size for curve in curves], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    tps = np.concatenate([np.array([], dtype=np.int64)] + [curve[0] for curve in curves])
+    fps = np.concatenate([np.array([], dtype=np.int64)] + [curve[1] for curve in curves])
+    thresholds = np.concatenate([np.array([])] + [curve[2] for curve in curves])
+    # The numbers of positive and negative samples of each label are the
+    # last cumulative counts, and are repeated for each point of the curve.
+    last = np.maximum(offsets[1:] - 1, 0)
+    num_pos = np.repeat(tps[last] if tps.size else np.zeros(n_labels, dtype=np.int64), sizes)
+    num_neg = np.repeat(fps[last] if fps.size else np.zeros(n_labels, dtype=np.int64), sizes)
+
+    beta2 = beta**2
+    precision = safe_divide(tps, tps + fps)
+    recall = safe_divide(tps, num_pos)
+    fpr = safe_divide(fps, num_neg, default=float("nan"))
+    fbeta = safe_divide((1 + beta2) * tps, beta2 * num_pos + tps + fps)
+    # Youden's J statistic is undefined if there is no positive sample.
+    youden = safe_divide(tps, num_pos, default=float("nan")) - fpr
+    best_fbeta, best_fbeta_threshold = np.full(n_labels, np.nan), np.full(n_labels, np.nan)
+    best_youden_threshold = np.full(n_labels, np.nan)
+    for i in np.flatnonzero(sizes):
+        curve = slice(offsets[i], offsets[i + 1])
+        best_fbeta[i] = fbeta[curve].max()
+        best_fbeta_threshold[i] = find_best_threshold(thresholds[curve], fbeta[curve])
+        best_youden_threshold[i] = find_best_threshold(thresholds[curve], youden[curve])
+
+    out = {
+        f"best_f{beta}": best_fbeta,
+        f"best_f{beta}_threshold": best_fbeta_threshold,
+        "best_youden_threshold": best_youden_threshold,
+        "count": prepared.count,
+        "curve_offsets": offsets,
+        "false_positive": fps,
+        "false_positive_rate": fpr,
+        "precision": precision,
+        "recall": recall,
+        "threshold": thresholds,
+        "true_positive": tps,
+    }
+    return {f"{prefix}{key}{suffix}": value for key, value in sorted(out.items())}
@@ -0,0 +1,262 @@
+r"""Implement functions to evaluate binary predictions at many decision
+thresholds and to select an operating threshold."""
+
+from __future__ import annotations
+
+__all__ = [
+    "binary_threshold_sweep",
+    "find_best_threshold",
+    "find_threshold_at_precision",
+    "find_threshold_at_recall",
+]
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from arkas.metric.classification.score_ranking import BinaryScoreRanking
+from arkas.metric.utils import safe_divide
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from arkas.metric.classification.score_histogram import BinaryScoreHistogram
+
+
+def binary_threshold_sweep(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    *,
+    thresholds: np.ndarray | Sequence[float] | None = None,
+    betas: Sequence[float] = (1,),
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+    ranking: BinaryScoreRanking | BinaryScoreHistogram | None = None,
+) -> dict[str, int | np.ndarray]:
+    r"""Return the confusion counts and the label-based metrics for
+    many decision thresholds.
+
+    A sample is predicted positive if its score is greater than or
+    equal to the threshold. The scores are sorted only once, then the
+    metrics for all the thresholds are computed from the cumulative
+    true positive and false positive counts. The precision, recall,
+    and F-beta scores are ``0`` when their denominator is zero, and
+    the false positive rate is NaN if there is no negative sample,
+    like the binary metric functions.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples, *)`` with ``0`` and
+            ``1`` values.
+        y_score: The target scores, can either be probability
+            estimates of the positive class, confidence values,
+            or non-thresholded measure of decisions. This input must
+            be an array of shape ``(n_samples, *)``.
+        thresholds: The thresholds to evaluate. If ``None``, all the
+            distinct scores are used, in decreasing order.
+        betas: The betas used to compute the F-beta scores.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+        ranking: An optional ranking engine built on the same
+            ``y_true``, ``y_score``, and ``nan_policy``. It can be
+            shared with other metrics to sort the scores only once.
+            With a ``BinaryScoreHistogram``, the distinct thresholds
+            are the lower edges of the non-empty buckets and the
+            counts are approximate for the other thresholds. If
+            ``None``, a new ranking engine is created.
+
+    Returns:
+        The computed metrics. Each metric is an array with one value
+            per threshold. The arrays are empty if the metrics cannot
+            be computed.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import binary_threshold_sweep
+    >>> metrics = binary_threshold_sweep(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.3, 0.8])
+    ... )
+    >>> metrics
+    {'count': 5,
+     'f1': array([0.5 , 0.8 , 0.666..., 0.857..., 0.75 ]),
+     'false_negative': array([2, 1, 1, 0, 0]),
+     'false_positive': array([0, 0, 1, 1, 2]),
+     'false_positive_rate': array([0. , 0. , 0.5, 0.5, 1. ]),
+     'precision': array([1. , 1. , 0.666..., 0.75 , 0.6 ]),
+     'recall': array([0.333..., 0.666..., 0.666..., 1. , 1. ]),
+     'threshold': array([0.9 , 0.8 , 0.35, 0.3 , 0.1 ]),
+     'true_negative': array([2, 2, 1, 1, 0]),
+     'true_positive': array([1, 2, 2, 3, 3])}
+    >>> metrics = binary_threshold_sweep(
+    ...     y_true=np.array([1, 0, 0, 1, 1]),
+    ...     y_score=np.array([0.9, 0.1, 0.35, 0.3, 0.8]),
+    ...     thresholds=[0.25, 0.5, 0.75],
+    ... )
+    >>> metrics["precision"]
+    array([0.75, 1.  , 1.  ])
+
+    ```
+    """
+    if ranking is None:
+        ranking = BinaryScoreRanking(y_true=y_true, y_score=y_score, nan_policy=nan_policy)
+    tps, fps, distinct = ranking.cumulative_counts()
+    num_pos, num_neg = (int(tps[-1]), int(fps[-1])) if tps.size else (0, 0)
+    if tps.size == 0:
+        thresholds = np.array([])
+    elif thresholds is None:
+        thresholds = distinct
+    else:
+        thresholds = np.asarray(thresholds, dtype=float)
+        # The number of distinct scores greater than or equal to each threshold.
+        n_above = distinct.size - np.searchsorted(distinct[::-1], thresholds, side="left")
+        tps = np.concatenate([[0], tps])[n_above]
+        fps = np.concatenate([[0], fps])[n_above]
+    fns, tns = num_pos - tps, num_neg - fps
+
+    out = {
+        f"{prefix}count{suffix}": ranking.count,
+        f"{prefix}false_negative{suffix}": fns,
+        f"{prefix}false_positive{suffix}": fps,
+        f"{prefix}false_positive_rate{suffix}": safe_divide(fps, num_neg, default=float("nan")),
+        f"{prefix}precision{suffix}": safe_divide(tps, tps + fps),
+        f"{prefix}recall{suffix}": safe_divide(tps, num_pos),
+        f"{prefix}threshold{suffix}": thresholds,
+        f"{prefix}true_negative{suffix}": tns,
+        f"{prefix}true_positive{suffix}": tps,
+    }
+    for beta in betas:
+        beta2 = beta**2
+        out[f"{prefix}f{beta}{suffix}"] = safe_divide(
+            (1 + beta2) * tps, beta2 * num_pos + tps + fps
+        )
+    return dict(sorted(out.items()))
+
+
+def find_best_threshold(
+    thresholds: np.ndarray, values: np.ndarray, mask: np.ndarray | None = None
+) -> float:
+    r"""Return the threshold that maximizes a metric.
+
+    Args:
+        thresholds: The thresholds. This input must be an array of
+            shape ``(n_thresholds,)``.
+        values: The metric value for each threshold. This input must
+            be an array of shape ``(n_thresholds,)``. The NaN values
+            are ignored.
+        mask: An optional boolean mask to indicate the thresholds
+            that satisfy a constraint. The other thresholds are
+            ignored. This input must be an array of shape
+            ``(n_thresholds,)``.
+
+    Returns:
+        The threshold with the largest metric value. If several
+            thresholds have the largest value, the first one is
+            returned. The value is NaN if no threshold is valid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import binary_threshold_sweep, find_best_threshold
+    >>> metrics = binary_threshold_sweep(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.3, 0.8])
+    ... )
+    >>> find_best_threshold(metrics["threshold"], metrics["f1"])
+    0.3
+
+    ```
+    """
+    valid = ~np.isnan(values)
+    if mask is not None:
+        valid &= mask
+    if not valid.any():
+        return float("nan")
+    candidates = np.where(valid, values, -np.inf)
+    return float(thresholds[np.argmax(candidates)])
+
+
+def find_threshold_at_precision(
+    thresholds: np.ndarray, precision: np.ndarray, recall: np.ndarray, min_precision: float
+) -> float:
+    r"""Return the threshold that maximizes the recall with a minimum
+    precision.
+
+    Args:
+        thresholds: The thresholds. This input must be an array of
+            shape ``(n_thresholds,)``.
+        precision: The precision for each threshold. This input must
+            be an array of shape ``(n_thresholds,)``.
+        recall: The recall for each threshold. This input must be an
+            array of shape ``(n_thresholds,)``.
+        min_precision: The minimum precision.
+
+    Returns:
+        The threshold with the largest recall among the thresholds
+            with a precision greater than or equal to
+            ``min_precision``. The value is NaN if no threshold
+            satisfies the constraint.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import binary_threshold_sweep, find_threshold_at_precision
+    >>> metrics = binary_threshold_sweep(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.3, 0.8])
+    ... )
+    >>> find_threshold_at_precision(
+    ...     metrics["threshold"], metrics["precision"], metrics["recall"], min_precision=0.9
+    ... )
+    0.8
+
+    ```
+    """
+    return find_best_threshold(thresholds, recall, mask=precision >= min_precision)
+
+
+def find_threshold_at_recall(
+    thresholds: np.ndarray, precision: np.ndarray, recall: np.ndarray, min_recall: float
+) -> float:
+    r"""Return the threshold that maximizes the precision with a minimum
+    recall.
+
+    Args:
+        thresholds: The thresholds. This input must be an array of
+            shape ``(n_thresholds,)``.
+        precision: The precision for each threshold. This input must
+            be an array of shape ``(n_thresholds,)``.
+        recall: The recall for each threshold. This input must be an
+            array of shape ``(n_thresholds,)``.
+        min_recall: The minimum recall.
+
+    Returns:
+        The threshold with the largest precision among the thresholds
+            with a recall greater than or equal to ``min_recall``. The
+            value is NaN if no threshold satisfies the constraint.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import binary_threshold_sweep, find_threshold_at_recall
+    >>> metrics = binary_threshold_sweep(
+    ...     y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.3, 0.8])
+    ... )
+    >>> find_threshold_at_recall(
+    ...     metrics["threshold"], metrics["precision"], metrics["recall"], min_recall=1.0
+    ... )
+    0.3
+
+    ```
+    """
+    return find_best_threshold(thresholds, precision, mask=recall >= min_recall)
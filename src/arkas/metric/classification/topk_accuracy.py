@@ -3,11 +3,16 @@ metrics."""
 
 from __future__ import annotations
 
-__all__ = ["binary_top_k_accuracy", "multiclass_top_k_accuracy", "top_k_accuracy"]
+__all__ = [
+    "binary_top_k_accuracy",
+    "multiclass_top_k_accuracy",
+    "top_k_accuracy",
+    "true_class_ranks",
+]
 
 from typing import TYPE_CHECKING
 
-from sklearn import metrics
+import numpy as np
 
 from arkas.metric.utils import (
     contains_nan,
@@ -18,7 +23,8 @@ from arkas.metric.utils import (
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    import numpy as np
+# The maximum number of elements compared at once to compute the ranks.
+_MAX_CHUNK_SIZE = 2**22
 
 
 def top_k_accuracy(
@@ -214,12 +220,87 @@ def _top_k_accuracy(
     y_score_nan = contains_nan(arr=y_score, nan_policy=nan_policy, name="'y_score'")
 
     count = y_true.size
+    ranks = None
+    if count > 0 and not y_true_nan and not y_score_nan:
+        ranks = np.sort(true_class_ranks(y_true=y_true, y_score=y_score))
     out = {}
     for _k in k:
         top_k_accuracy = float("nan")
-        if count > 0 and not y_true_nan and not y_score_nan:
-            top_k_accuracy = float(
-                metrics.top_k_accuracy_score(y_true=y_true, y_score=y_score, k=_k)
-            )
+        if ranks is not None:
+            # The number of samples where fewer than k classes are ranked before the true class.
+            top_k_accuracy = float(np.searchsorted(ranks, _k, side="left") / count)
         out[f"{prefix}top_{_k}_accuracy{suffix}"] = top_k_accuracy
     return {f"{prefix}count{suffix}": count} | out
+
+
+def true_class_ranks(y_true: np.ndarray, y_score: np.ndarray) -> np.ndarray:
+    r"""Return the rank of the true class of each sample.
+
+    The rank is the number of classes ranked before the true class,
+    so the prediction is correct in the top-k if the rank is lower
+    than ``k``. The ties are broken like
+    ``sklearn.metrics.top_k_accuracy_score``: the class with the
+    largest index is ranked first. The classes are the sorted unique
+    values of ``y_true``. The ranks are computed by comparing the
+    scores in chunks of rows, so the scores are never sorted.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples,)``.
+        y_score: The target scores, can either be probability
+            estimates of the positive class, confidence values,
+            or non-thresholded measure of decisions. The binary case
+            expects scores with shape ``(n_samples,)`` while the
+            multiclass case expects scores with shape
+            ``(n_samples, n_classes)``. This input must not contain
+            NaN values.
+
+    Returns:
+        The rank of the true class of each sample as an array of
+            shape ``(n_samples,)``.
+
+    Raises:
+        ValueError: if the number of classes in ``y_true`` is not
+            equal to the number of classes in ``y_score``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.classification.topk_accuracy import true_class_ranks
+    >>> true_class_ranks(
+    ...     y_true=np.array([0, 1, 2, 2]),
+    ...     y_score=np.array(
+    ...         [[0.5, 0.2, 0.2], [0.3, 0.4, 0.2], [0.2, 0.4, 0.3], [0.7, 0.2, 0.1]]
+    ...     ),
+    ... )
+    array([0, 0, 1, 2])
+
+    ```
+    """
+    classes, y_true = np.unique(y_true, return_inverse=True)
+    y_true = y_true.ravel()
+    n_classes = y_score.shape[1] if y_score.ndim == 2 else 2
+    if classes.size != n_classes:
+        msg = (
+            f"Number of classes in 'y_true' ({classes.size:,}) not equal to the number of "
+            f"classes in 'y_score' ({n_classes:,})"
+        )
+        raise ValueError(msg)
+    if y_score.ndim == 1:
+        threshold = 0.5 if y_score.min() >= 0 and y_score.max() <= 1 else 0
+        return ((y_score > threshold) != y_true).astype(np.int64)
+
+    n_samples = y_true.shape[0]
+    ranks = np.empty(n_samples, dtype=np.int64)
+    chunk_size = max(1, _MAX_CHUNK_SIZE // n_classes)
+    columns = np.arange(n_classes)
+    for start in range(0, n_samples, chunk_size):
+        rows = slice(start, min(start + chunk_size, n_samples))
+        score, true = y_score[rows], y_true[rows, None]
+        true_score = np.take_along_axis(score, true, axis=1)
+        ranks[rows] = np.count_nonzero(score > true_score, axis=1) + np.count_nonzero(
+            (score == true_score) & (columns > true), axis=1
+        )
+    return ranks
@@ -14,12 +14,16 @@ from arkas.metric.utils import check_same_shape_pred
 if TYPE_CHECKING:
     import numpy as np
 
+    from arkas.metric.classification.score_ranking import BinaryScoreRanking
+
 
 def binary_precision_recall_curve(
     y_true: np.ndarray,
     y_pred: np.ndarray,
     name: str = "model",
     plot_chance_level: bool = True,
+    *,
+    ranking: BinaryScoreRanking | None = None,
     **kwargs: Any,
 ) -> plt.Figure | None:
     r"""Return a figure with the precision-recall curve for binary
@@ -35,8 +39,11 @@ def binary_precision_recall_curve(
         plot_chance_level: Whether to plot the chance level.
             The chance level is the prevalence of the positive label
             computed from the data.
+        ranking: An optional ranking engine built on ``y_true`` and
+            ``y_pred``. It can be shared with the results to avoid
+            sorting the predictions again.
         **kwargs: Arbitrary keyword arguments that are passed to
-            ``PrecisionRecallDisplay.from_predictions``.
+            ``arkas.plot.binary_precision_recall_curve``.
 
     Example usage:
 
@@ -61,6 +68,7 @@ def binary_precision_recall_curve(
         y_pred=y_pred,
         name=name,
         plot_chance_level=plot_chance_level,
+        ranking=ranking,
         **kwargs,
     )
     return fig
@@ -0,0 +1,546 @@
+r"""Implement the metrics computed for each group of rows in a single
+pass."""
+
+from __future__ import annotations
+
+__all__ = [
+    "GroupSegments",
+    "factorize_groups",
+    "grouped_classification_metrics",
+    "grouped_ranking_metrics",
+    "grouped_regression_metrics",
+]
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+
+from arkas.metric.classification.precision import find_label_type
+from arkas.metric.utils import check_label_type, check_nan_policy, check_same_shape, safe_divide
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+def factorize_groups(groups: Mapping[str, np.ndarray]) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    r"""Factorize the group keys into integer group codes.
+
+    The key columns are factorized with ``polars``, so a key column
+    can contain null values, for example an object array with
+    ``None``. The null values form their own group. The groups are
+    sorted in the lexicographic order of the key columns, and the null
+    values are sorted first.
+
+    Args:
+        groups: The key columns that define the groups. Each key
+            column must be an array of shape ``(n_samples,)``.
+
+    Returns:
+        A tuple with the group code of each row as an array of shape
+            ``(n_samples,)``, and the key values of each group as a
+            dictionary of arrays of shape ``(n_groups,)``.
+
+    Raises:
+        ValueError: if ``groups`` is empty.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.grouped import factorize_groups
+    >>> codes, keys = factorize_groups(
+    ...     {"country": np.array(["fr", "us", "fr", "us"]), "device": np.array([1, 1, 2, 1])}
+    ... )
+    >>> codes
+    array([0, 2, 1, 2])
+    >>> keys
+    {'country': array(['fr', 'fr', 'us'], dtype='<U2'), 'device': array([1, 2, 1])}
+
+    ```
+    """
+    if not groups:
+        msg = "'groups' cannot be empty"
+        raise ValueError(msg)
+    columns = {name: np.asarray(values).ravel() for name, values in groups.items()}
+    check_same_shape(columns.values())
+    codes = None
+    for values in columns.values():
+        # The null values have no rank, so they are encoded with 0 and
+        # form their own group before the other values.
+        ranks = _to_series(values).rank("dense")
+        inverse = ranks.fill_null(0).to_numpy().astype(np.int64)
+        if codes is not None:
+            # Combine the codes in mixed radix, then compress them to keep
+            # the codes small when there are many key columns.
+            inverse = codes * (int(ranks.max() or 0) + 1) + inverse
+        _, first, codes = np.unique(inverse, return_index=True, return_inverse=True)
+        codes = codes.ravel()
+    return codes, {name: values[first] for name, values in columns.items()}
+
+
+def grouped_classification_metrics(
+    groups: Mapping[str, np.ndarray],
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    label_type: str = "auto",
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> pl.DataFrame:
+    r"""Return the classification metrics of each group.
+
+    The true positives, support, and number of predictions of each
+    class of all the groups are computed with three ``np.bincount``
+    of size ``n_groups * n_classes``, so there is no loop over the
+    groups and the confusion matrices are not materialized.
+    The metrics of a group are the same as the metrics computed on
+    the rows of this group. The following metrics are computed:
+
+    - ``accuracy`` and ``balanced_accuracy``.
+    - binary labels: ``precision``, ``recall``, and ``f1`` of the
+        positive class ``1``.
+    - multiclass labels: ``macro_precision``, ``macro_recall``, and
+        ``macro_f1``, averaged over the classes present in the group.
+
+    Args:
+        groups: The key columns that define the groups. Each key
+            column must be an array of shape ``(n_samples,)``.
+        y_true: The ground truth target labels. This input must be
+            an array of shape ``(n_samples,)``.
+        y_pred: The predicted labels. This input must be an array of
+            shape ``(n_samples,)``.
+        label_type: The type of labels used to evaluate the metrics.
+            The valid values are: ``'binary'``, ``'multiclass'``,
+            and ``'auto'``. If ``'auto'``, it tries to find the label
+            type from the arrays' values.
+        prefix: The prefix of the metric column names.
+        suffix: The suffix of the metric column names.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``. If ``'propagate'``,
+            the metrics of a group with a NaN value are NaN.
+
+    Returns:
+        A DataFrame with the key columns and the metrics. Each row is
+            a group.
+
+    Raises:
+        ValueError: if the label type is ``'multilabel'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import grouped_classification_metrics
+    >>> frame = grouped_classification_metrics(
+    ...     groups={"country": np.array(["fr", "fr", "fr", "us", "us", "us"])},
+    ...     y_true=np.array([1, 0, 1, 1, 0, 0]),
+    ...     y_pred=np.array([1, 0, 0, 1, 1, 0]),
+    ... )
+    >>> frame.columns
+    ['country', 'count', 'accuracy', 'balanced_accuracy', 'precision', 'recall', 'f1']
+    >>> frame["accuracy"].to_list()
+    [0.666..., 0.666...]
+
+    ```
+    """
+    check_label_type(label_type)
+    segments = GroupSegments(groups, arrays=[y_true, y_pred], nan_policy=nan_policy)
+    y_true, y_pred = segments.arrays
+    if label_type == "auto":
+        label_type = find_label_type(y_true=y_true, y_pred=y_pred)
+    if label_type == "multilabel":
+        msg = "The grouped classification metrics do not support multilabel labels"
+        raise ValueError(msg)
+
+    _, labels = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+    labels = labels.ravel()
+    n_classes = max(int(labels.max(initial=-1)) + 1, 2 if label_type == "binary" else 1)
+    true_codes, pred_codes = labels[: y_true.shape[0]], labels[y_true.shape[0] :]
+    if label_type == "binary":
+        # The classes are 0 and 1, even if one class is missing.
+        true_codes, pred_codes = (y_true == 1).astype(int), (y_pred == 1).astype(int)
+    # The metrics only need the diagonal and the margins of the
+    # confusion matrix of each group, so the ``(n_groups, n_classes,
+    # n_classes)`` confusion matrices are never materialized.
+    shape = (segments.num_groups, n_classes)
+    size = shape[0] * shape[1]
+    true_keys = segments.codes * n_classes + true_codes
+    pred_keys = segments.codes * n_classes + pred_codes
+    tp = np.bincount(true_keys[true_codes == pred_codes], minlength=size).reshape(shape)
+    support = np.bincount(true_keys, minlength=size).reshape(shape)
+    predicted = np.bincount(pred_keys, minlength=size).reshape(shape)
+    count = support.sum(axis=1)
+    precision, recall = safe_divide(tp, predicted), safe_divide(tp, support)
+    f1 = safe_divide(2 * tp, support + predicted)
+    metrics = {
+        "accuracy": safe_divide(tp.sum(axis=1), count, default=float("nan")),
+        "balanced_accuracy": _masked_mean(recall, support > 0),
+    }
+    if label_type == "binary":
+        metrics |= {"precision": precision[:, 1], "recall": recall[:, 1], "f1": f1[:, 1]}
+    else:
+        present = (support + predicted) > 0
+        metrics |= {
+            "macro_precision": _masked_mean(precision, present),
+            "macro_recall": _masked_mean(recall, present),
+            "macro_f1": _masked_mean(f1, present),
+        }
+    return segments.to_frame(metrics, prefix=prefix, suffix=suffix)
+
+
+def grouped_ranking_metrics(
+    groups: Mapping[str, np.ndarray],
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    *,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> pl.DataFrame:
+    r"""Return the binary ranking metrics of each group.
+
+    The rows are sorted once by group and decreasing score, then the
+    metrics are computed with segment reductions, so there is no loop
+    over the groups. The following metrics are computed:
+
+    - ``average_precision``: the average precision. It is ``0`` for
+        a group without positive label.
+    - ``roc_auc``: the Area Under the Receiver Operating
+        Characteristic Curve. It is NaN for a group with only one
+        class.
+
+    Args:
+        groups: The key columns that define the groups. Each key
+            column must be an array of shape ``(n_samples,)``.
+        y_true: The ground truth target labels. This input must be
+            an array of shape ``(n_samples,)`` with values in
+            ``{0, 1}``.
+        y_score: The target scores. This input must be an array of
+            shape ``(n_samples,)``.
+        prefix: The prefix of the metric column names.
+        suffix: The suffix of the metric column names.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``. If ``'propagate'``,
+            the metrics of a group with a NaN value are NaN.
+
+    Returns:
+        A DataFrame with the key columns and the metrics. Each row is
+            a group.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import grouped_ranking_metrics
+    >>> frame = grouped_ranking_metrics(
+    ...     groups={"country": np.array(["fr", "fr", "fr", "us", "us", "us"])},
+    ...     y_true=np.array([1, 0, 1, 1, 0, 0]),
+    ...     y_score=np.array([0.9, 0.1, 0.4, 0.2, 0.8, 0.1]),
+    ... )
+    >>> frame
+    shape: (2, 4)
+    ┌─────────┬───────┬───────────────────┬─────────┐
+    │ country ┆ count ┆ average_precision ┆ roc_auc │
+    │ ---     ┆ ---   ┆ ---               ┆ ---     │
+    │ str     ┆ i64   ┆ f64               ┆ f64     │
+    ╞═════════╪═══════╪═══════════════════╪═════════╡
+    │ fr      ┆ 3     ┆ 1.0               ┆ 1.0     │
+    │ us      ┆ 3     ┆ 0.5               ┆ 0.5     │
+    └─────────┴───────┴───────────────────┴─────────┘
+
+    ```
+    """
+    segments = GroupSegments(
+        groups, arrays=[y_true, y_score], nan_policy=nan_policy, names=["y_true", "y_score"]
+    )
+    y_true, y_score = segments.arrays
+    codes = segments.codes
+    order = np.lexsort((-np.asarray(y_score, dtype=float), codes))
+    codes, y_score, positive = codes[order], y_score[order], y_true[order] == 1
+
+    # Keep the last index of each block of tied scores in a group.
+    is_last = np.ones(codes.shape[0], dtype=bool)
+    is_last[:-1] = (codes[1:] != codes[:-1]) | (y_score[1:] != y_score[:-1])
+    block_ends = np.flatnonzero(is_last)
+    block_codes = codes[block_ends]
+
+    num_rows = np.bincount(codes, minlength=segments.num_groups)
+    num_pos = np.bincount(codes, weights=positive, minlength=segments.num_groups)
+    group_starts = np.concatenate([[0], np.cumsum(num_rows)[:-1]])[block_codes]
+    # The cumulative counts are reset at the start of each group.
+    cum_tps = np.concatenate([[0], np.cumsum(positive, dtype=np.int64)])
+    tps = cum_tps[block_ends + 1] - cum_tps[group_starts]
+    fps = block_ends - group_starts + 1 - tps
+    is_first = np.ones(block_ends.shape[0], dtype=bool)
+    is_first[1:] = block_codes[1:] != block_codes[:-1]
+    prev_tps = np.where(is_first, 0, np.roll(tps, 1))
+    prev_fps = np.where(is_first, 0, np.roll(fps, 1))
+
+    precision = tps / (tps + fps)
+    ap = np.bincount(block_codes, weights=(tps - prev_tps) * precision, minlength=num_pos.size)
+    # Trapezoidal rule on the integer counts to limit the rounding errors.
+    area = np.bincount(
+        block_codes, weights=(fps - prev_fps) * (tps + prev_tps), minlength=num_pos.size
+    )
+    num_neg = num_rows - num_pos
+    metrics = {
+        "average_precision": safe_divide(ap, num_pos),
+        "roc_auc": safe_divide(area, 2.0 * num_pos * num_neg, default=float("nan")),
+    }
+    return segments.to_frame(metrics, prefix=prefix, suffix=suffix)
+
+
+def grouped_regression_metrics(
+    groups: Mapping[str, np.ndarray],
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> pl.DataFrame:
+    r"""Return the regression metrics of each group.
+
+    The sums of all the groups are computed with ``np.bincount``, so
+    there is no loop over the groups. The following metrics are
+    computed: ``mean_absolute_error``, ``mean_squared_error``,
+    ``root_mean_squared_error``, and ``r2_score``.
+
+    Args:
+        groups: The key columns that define the groups. Each key
+            column must be an array of shape ``(n_samples,)``.
+        y_true: The ground truth target values. This input must be
+            an array of shape ``(n_samples,)``.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples,)``.
+        prefix: The prefix of the metric column names.
+        suffix: The suffix of the metric column names.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``. If ``'propagate'``,
+            the metrics of a group with a NaN value are NaN.
+
+    Returns:
+        A DataFrame with the key columns and the metrics. Each row is
+            a group.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import grouped_regression_metrics
+    >>> frame = grouped_regression_metrics(
+    ...     groups={"country": np.array(["fr", "fr", "fr", "us", "us", "us"])},
+    ...     y_true=np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+    ...     y_pred=np.array([1.0, 2.0, 4.0, 4.0, 3.0, 6.0]),
+    ... )
+    >>> frame
+    shape: (2, 6)
+    ┌─────────┬───────┬─────────────────────┬────────────────────┬─────────────────────────┬──────────┐
+    │ country ┆ count ┆ mean_absolute_error ┆ mean_squared_error ┆ root_mean_squared_error ┆ r2_score │
+    │ ---     ┆ ---   ┆ ---                 ┆ ---                ┆ ---                     ┆ ---      │
+    │ str     ┆ i64   ┆ f64                 ┆ f64                ┆ f64                     ┆ f64      │
+    ╞═════════╪═══════╪═════════════════════╪════════════════════╪═════════════════════════╪══════════╡
+    │ fr      ┆ 3     ┆ 0.333333            ┆ 0.333333           ┆ 0.57735                 ┆ 0.5      │
+    │ us      ┆ 3     ┆ 0.666667            ┆ 1.333333           ┆ 1.154701                ┆ -1.0     │
+    └─────────┴───────┴─────────────────────┴────────────────────┴─────────────────────────┴──────────┘
+
+    ```
+    """
+    segments = GroupSegments(groups, arrays=[y_true, y_pred], nan_policy=nan_policy)
+    # The inputs are not converted, so the narrow arrays are only widened
+    # inside the element-wise operations.
+    y_true, y_pred = segments.arrays
+    codes, num_groups = segments.codes, segments.num_groups
+
+    count = np.bincount(codes, minlength=num_groups)
+    error = np.subtract(y_true, y_pred, dtype=float)
+    sum_abs = np.bincount(codes, weights=np.abs(error), minlength=num_groups)
+    sum_sq = np.bincount(codes, weights=np.square(error, out=error), minlength=num_groups)
+    mean = safe_divide(np.bincount(codes, weights=y_true, minlength=num_groups), count)
+    centered = np.subtract(y_true, mean[codes], out=error)
+    sum_sq_total = np.bincount(
+        codes, weights=np.square(centered, out=centered), minlength=num_groups
+    )
+
+    nan = float("nan")
+    mse = safe_divide(sum_sq, count, default=nan)
+    # Follow the scikit-learn convention for the perfect and constant targets.
+    r2 = np.where(
+        sum_sq_total == 0, (sum_sq == 0).astype(float), 1.0 - safe_divide(sum_sq, sum_sq_total)
+    )
+    metrics = {
+        "mean_absolute_error": safe_divide(sum_abs, count, default=nan),
+        "mean_squared_error": mse,
+        "root_mean_squared_error": np.sqrt(mse),
+        "r2_score": np.where(count < 2, nan, r2),
+    }
+    return segments.to_frame(metrics, prefix=prefix, suffix=suffix)
+
+
+class GroupSegments:
+    r"""Implement the rows of several groups with integer group codes.
+
+    The NaN values are handled once for all the groups. With the
+    ``'omit'`` policy, the rows with a NaN value are removed. With
+    the ``'propagate'`` policy, the rows with a NaN value are removed
+    and the groups that had a NaN value are marked, so their metrics
+    are set to NaN.
+
+    Args:
+        groups: The key columns that define the groups. Each key
+            column must be an array of shape ``(n_samples,)``.
+        arrays: The arrays used to compute the metrics. Each array
+            must be an array of shape ``(n_samples,)``.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+        names: The names of the arrays used in the error messages.
+            By default, the names are ``'y_true'`` and ``'y_pred'``.
+
+    Raises:
+        RuntimeError: if the key columns and arrays have different
+            shapes.
+        ValueError: if one of the arrays contains a NaN value and
+            ``nan_policy='raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.grouped import GroupSegments
+    >>> segments = GroupSegments(
+    ...     groups={"country": np.array(["fr", "fr", "us", "us"])},
+    ...     arrays=[np.array([1.0, 2.0, 3.0, 4.0]), np.array([1.0, float("nan"), 3.0, 5.0])],
+    ... )
+    >>> segments.num_groups
+    2
+    >>> segments.codes
+    array([0, 1, 1])
+    >>> segments.to_frame({"max": np.array([2.0, 4.0])})
+    shape: (2, 3)
+    ┌─────────┬───────┬─────┐
+    │ country ┆ count ┆ max │
+    │ ---     ┆ ---   ┆ --- │
+    │ str     ┆ i64   ┆ f64 │
+    ╞═════════╪═══════╪═════╡
+    │ fr      ┆ 2     ┆ NaN │
+    │ us      ┆ 2     ┆ 4.0 │
+    └─────────┴───────┴─────┘
+
+    ```
+    """
+
+    def __init__(
+        self,
+        groups: Mapping[str, np.ndarray],
+        arrays: list[np.ndarray],
+        nan_policy: str = "propagate",
+        names: list[str] | None = None,
+    ) -> None:
+        check_nan_policy(nan_policy)
+        arrays = [np.asarray(arr).ravel() for arr in arrays]
+        codes, self._keys = factorize_groups(groups)
+        check_same_shape([codes, *arrays])
+        self._num_groups = next(iter(self._keys.values())).shape[0]
+        self._count = np.bincount(codes, minlength=self._num_groups)
+
+        names = names or ["y_true", "y_pred"]
+        isnan = np.zeros(codes.shape[0], dtype=bool)
+        for name, arr in zip(names, arrays):
+            if np.issubdtype(arr.dtype, np.inexact):
+                arr_nan = np.isnan(arr)
+                if nan_policy == "raise" and arr_nan.any():
+                    msg = f"'{name}' contains at least one NaN value"
+                    raise ValueError(msg)
+                isnan |= arr_nan
+        self._nan_groups = np.zeros(self._num_groups, dtype=bool)
+        if isnan.any():
+            mask = np.logical_not(isnan)
+            if nan_policy == "propagate":
+                self._nan_groups[codes[isnan]] = True
+            else:
+                self._count = np.bincount(codes[mask], minlength=self._num_groups)
+            codes, arrays = codes[mask], [arr[mask] for arr in arrays]
+        self._codes = codes
+        self._arrays = arrays
+
+    @property
+    def arrays(self) -> list[np.ndarray]:
+        r"""The arrays without the rows with a NaN value."""
+        return self._arrays
+
+    @property
+    def codes(self) -> np.ndarray:
+        r"""The group code of each row without a NaN value."""
+        return self._codes
+
+    @property
+    def num_groups(self) -> int:
+        r"""The number of groups."""
+        return self._num_groups
+
+    def to_frame(
+        self, metrics: Mapping[str, np.ndarray], prefix: str = "", suffix: str = ""
+    ) -> pl.DataFrame:
+        r"""Return a DataFrame with the key columns, the number of rows,
+        and the metrics of each group.
+
+        Args:
+            metrics: The metrics of each group. Each value must be an
+                array of shape ``(n_groups,)``.
+            prefix: The prefix of the metric column names.
+            suffix: The suffix of the metric column names.
+
+        Returns:
+            A DataFrame where each row is a group.
+        """
+        columns = {name: _to_series(values) for name, values in self._keys.items()}
+        columns[f"{prefix}count{suffix}"] = pl.Series(self._count, dtype=pl.Int64)
+        for name, values in metrics.items():
+            columns[f"{prefix}{name}{suffix}"] = np.where(
+                self._nan_groups, float("nan"), np.asarray(values, dtype=float)
+            )
+        return pl.DataFrame(columns)
+
+
+def _masked_mean(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    r"""Return the mean of the masked values along the last axis.
+
+    Args:
+        values: The values. This input must be an array of shape
+            ``(n_groups, n_classes)``.
+        mask: The boolean mask of the values to use. This input must
+            be an array of shape ``(n_groups, n_classes)``.
+
+    Returns:
+        The mean of each row. The value is NaN if no value is used.
+    """
+    return safe_divide((values * mask).sum(axis=1), mask.sum(axis=1), default=float("nan"))
+
+
+def _to_series(values: np.ndarray) -> pl.Series:
+    r"""Convert a key column to a ``polars`` Series.
+
+    The object arrays are converted from a list, so the data type is
+    inferred from all the values and not only from the first one,
+    which can be ``None``.
+
+    Args:
+        values: The key column to convert.
+
+    Returns:
+        The key column as a Series.
+    """
+    if values.dtype == object:
+        return pl.Series(values=values.tolist())
+    return pl.Series(values=values, nan_to_null=False)
@@ -0,0 +1,608 @@
+r"""Implement mergeable accumulators to compute the regression metrics
+on streams of data."""
+
+from __future__ import annotations
+
+__all__ = [
+    "BaseRegressionAccumulator",
+    "MeanAbsoluteErrorAccumulator",
+    "MeanAbsolutePercentageErrorAccumulator",
+    "MeanSquaredErrorAccumulator",
+    "MeanSquaredLogErrorAccumulator",
+    "MedianAbsoluteErrorAccumulator",
+    "R2ScoreAccumulator",
+    "RegressionErrorAccumulator",
+    "RootMeanSquaredErrorAccumulator",
+]
+
+import math
+from typing import Any, ClassVar
+
+import numpy as np
+from coola.utils.format import repr_mapping_line
+
+from arkas.metric.regression.native import _float_dtype, _r2_from_sums
+from arkas.metric.utils import check_nan_policy, prepare_inputs
+from arkas.utils.sketch import KLLSketch
+
+# Maximum number of values of a chunk, so the temporary arrays of a
+# chunk use at most 8 MB with float64 values.
+_CHUNK_NUM_VALUES = 2**20
+
+
+class BaseRegressionAccumulator:
+    r"""Define the base class to accumulate the statistics of the
+    regression metrics over several batches of data.
+
+    Only a few running statistics are stored: the moments of the
+    squared errors and the targets, which are updated with the
+    Welford/Chan formulas for the mean squared error and the R^2
+    score, the running sums of the absolute, percentage, and
+    logarithmic errors, and a KLL sketch of the absolute errors for
+    the median absolute error. The memory does not depend on the
+    number of samples, and the accumulators computed on different
+    shards of data can be merged. The metrics have the same keys as
+    the ``arkas.metric`` regression functions.
+
+    The median absolute error is exact while the number of samples
+    is smaller than ``sketch_size``, and approximate otherwise. Like
+    ``regression_metrics``, the mean squared logarithmic error is NaN
+    if a value is less than or equal to ``-1``.
+
+    Args:
+        sketch_size: The size of the KLL sketch used to approximate
+            the median absolute error. See
+            ``arkas.utils.sketch.KLLSketch`` for more information.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Raises:
+        ValueError: if ``sketch_size`` is lower than 2.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import BaseRegressionAccumulator
+    >>> accumulator = BaseRegressionAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 3]))
+    >>> accumulator.update(y_true=np.array([4, 5]), y_pred=np.array([4, 1]))
+    >>> accumulator.compute()
+    {'count': 5,
+     'max_error': 4.0,
+     'mean_absolute_error': 1.0,
+     'mean_absolute_percentage_error': 0.36,
+     'mean_squared_error': 3.4...,
+     'mean_squared_log_error': 0.274...,
+     'median_absolute_error': 0.0,
+     'r2_score': -0.7,
+     'root_mean_squared_error': 1.843...}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = (
+        "max_error",
+        "mean_absolute_error",
+        "mean_absolute_percentage_error",
+        "mean_squared_error",
+        "mean_squared_log_error",
+        "median_absolute_error",
+        "r2_score",
+        "root_mean_squared_error",
+    )
+
+    def __init__(self, sketch_size: int = 1024, nan_policy: str = "propagate") -> None:
+        if sketch_size < 2:
+            msg = f"Incorrect 'sketch_size': {sketch_size}. The value must be greater than 1"
+            raise ValueError(msg)
+        self._sketch_size = int(sketch_size)
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+        self._count = 0
+        self._has_nan = False
+        self._num_samples = 0
+        self._max_error = 0.0
+        self._abs_error_sum = 0.0
+        self._abs_percentage_error_sum = 0.0
+        self._squared_log_error_sum = 0.0
+        self._log_out_of_domain = False
+        self._squared_error_mean = 0.0
+        self._y_true_mean = 0.0
+        self._y_true_m2 = 0.0
+        # The sketch is only updated if the median absolute error is
+        # computed, because it is the most expensive statistic.
+        self._sketch = (
+            KLLSketch(k=self._sketch_size)
+            if "median_absolute_error" in self._metric_names
+            else None
+        )
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(self.get_args() | {"count": self._count})
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def count(self) -> int:
+        r"""The number of samples accumulated so far."""
+        return self._count
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    @property
+    def sketch_size(self) -> int:
+        return self._sketch_size
+
+    def compute(self, prefix: str = "", suffix: str = "") -> dict[str, Any]:
+        r"""Compute the metrics on the accumulated data.
+
+        Args:
+            prefix: The key prefix in the returned dictionary.
+            suffix: The key suffix in the returned dictionary.
+
+        Returns:
+            The computed metrics.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import MeanSquaredErrorAccumulator
+        >>> accumulator = MeanSquaredErrorAccumulator()
+        >>> accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 5]))
+        >>> accumulator.compute()
+        {'count': 3, 'mean_squared_error': 1.666...}
+
+        ```
+        """
+        metrics = dict.fromkeys(self._metric_names, float("nan"))
+        num_samples = self._num_samples
+        if num_samples > 0 and not self._has_nan:
+            mse = self._squared_error_mean
+            metrics = {
+                "max_error": self._max_error,
+                "mean_absolute_error": self._abs_error_sum / num_samples,
+                "mean_absolute_percentage_error": self._abs_percentage_error_sum / num_samples,
+                "mean_squared_error": mse,
+                "mean_squared_log_error": (
+                    float("nan")
+                    if self._log_out_of_domain
+                    else self._squared_log_error_sum / num_samples
+                ),
+                "median_absolute_error": (
+                    self._sketch.quantile(0.5) if self._sketch is not None else float("nan")
+                ),
+                "r2_score": _r2_from_sums(mse * num_samples, self._y_true_m2, num_samples),
+                "root_mean_squared_error": math.sqrt(mse),
+            }
+        out = {"count": self._count} | {name: metrics[name] for name in self._metric_names}
+        return {f"{prefix}{key}{suffix}": value for key, value in out.items()}
+
+    def get_args(self) -> dict:
+        r"""Get the arguments to instantiate an empty accumulator with
+        the same configuration.
+
+        Returns:
+            The arguments.
+        """
+        return {"sketch_size": self._sketch_size, "nan_policy": self._nan_policy}
+
+    def merge(self, other: BaseRegressionAccumulator) -> None:
+        r"""Merge the data accumulated by another accumulator in the
+        current accumulator.
+
+        Args:
+            other: The other accumulator. It must have the same sketch
+                size and NaN policy as the current accumulator.
+
+        Raises:
+            TypeError: if ``other`` is not a regression accumulator.
+            ValueError: if ``other`` has a different sketch size or
+                NaN policy.
+            ValueError: if the current accumulator computes the median
+                absolute error and ``other`` does not.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import MedianAbsoluteErrorAccumulator
+        >>> accumulator1 = MedianAbsoluteErrorAccumulator()
+        >>> accumulator1.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 3]))
+        >>> accumulator2 = MedianAbsoluteErrorAccumulator()
+        >>> accumulator2.update(y_true=np.array([4, 5]), y_pred=np.array([4, 1]))
+        >>> accumulator1.merge(accumulator2)
+        >>> accumulator1.compute()
+        {'count': 5, 'median_absolute_error': 0.0}
+
+        ```
+        """
+        if not isinstance(other, BaseRegressionAccumulator):
+            msg = f"Incorrect accumulator type: {type(other)}"
+            raise TypeError(msg)
+        if other.sketch_size != self._sketch_size or other.nan_policy != self._nan_policy:
+            msg = (
+                "The accumulators must have the same sketch size and NaN policy, but "
+                f"received ({self._sketch_size}, {self._nan_policy!r}) and "
+                f"({other.sketch_size}, {other.nan_policy!r})"
+            )
+            raise ValueError(msg)
+        if self._sketch is not None and other._sketch is None and other._num_samples > 0:
+            msg = (
+                "The accumulators must compute the median absolute error, but "
+                f"{type(other).__qualname__} does not compute it"
+            )
+            raise ValueError(msg)
+        self._count += other._count
+        self._has_nan = self._has_nan or other._has_nan
+        if other._num_samples == 0:
+            return
+        if self._sketch is not None:
+            self._sketch.merge(other._sketch)
+        self._add_moments(
+            num_samples=other._num_samples,
+            squared_error_mean=other._squared_error_mean,
+            y_true_mean=other._y_true_mean,
+            y_true_m2=other._y_true_m2,
+        )
+        self._max_error = max(self._max_error, other._max_error)
+        self._abs_error_sum += other._abs_error_sum
+        self._abs_percentage_error_sum += other._abs_percentage_error_sum
+        self._squared_log_error_sum += other._squared_log_error_sum
+        self._log_out_of_domain = self._log_out_of_domain or other._log_out_of_domain
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        r"""Update the accumulator with a new batch of data.
+
+        Args:
+            y_true: The ground truth target values of the batch.
+            y_pred: The predicted values of the batch.
+
+        Raises:
+            RuntimeError: if ``y_true`` and ``y_pred`` have different
+                shapes.
+            ValueError: if the batch contains NaN values and
+                ``nan_policy`` is ``'raise'``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.metric import MeanAbsoluteErrorAccumulator
+        >>> accumulator = MeanAbsoluteErrorAccumulator()
+        >>> accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 5]))
+        >>> accumulator.count
+        3
+
+        ```
+        """
+        prepared = prepare_inputs(y_true, y_pred, nan_policy=self._nan_policy)
+        self._count += prepared.count
+        if not prepared.is_valid:
+            self._has_nan = True
+            return
+        y_true, y_pred = prepared.y_true, prepared.y_pred
+        for start in range(0, y_true.shape[0], _CHUNK_NUM_VALUES):
+            self._update_chunk(
+                y_true[start : start + _CHUNK_NUM_VALUES],
+                y_pred[start : start + _CHUNK_NUM_VALUES],
+            )
+
+    def _add_moments(
+        self, num_samples: int, squared_error_mean: float, y_true_mean: float, y_true_m2: float
+    ) -> None:
+        r"""Add the moments of a batch to the accumulated moments with
+        the parallel Welford update of Chan et al.
+
+        Args:
+            num_samples: The number of samples of the batch.
+            squared_error_mean: The mean squared error of the batch.
+            y_true_mean: The mean of the targets of the batch.
+            y_true_m2: The sum of the squared deviations of the
+                targets of the batch from their mean.
+        """
+        total = self._num_samples + num_samples
+        weight = num_samples / total
+        self._squared_error_mean += (squared_error_mean - self._squared_error_mean) * weight
+        delta = y_true_mean - self._y_true_mean
+        self._y_true_mean += delta * weight
+        self._y_true_m2 += y_true_m2 + delta**2 * self._num_samples * weight
+        self._num_samples = total
+
+    def _update_chunk(self, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        r"""Update the accumulator with a chunk of samples.
+
+        Args:
+            y_true: The ground truth target values of the chunk,
+                without NaN.
+            y_pred: The predicted values of the chunk, without NaN.
+        """
+        num_samples = y_true.shape[0]
+        if num_samples == 0:
+            return
+        dtype = _float_dtype(y_true, y_pred)
+        abs_error = np.subtract(y_pred, y_true, dtype=dtype)
+        squared_error_mean = float(np.dot(abs_error, abs_error)) / num_samples
+        np.abs(abs_error, out=abs_error)
+        self._max_error = max(self._max_error, float(abs_error.max()))
+        self._abs_error_sum += float(np.sum(abs_error, dtype=np.float64))
+        if self._sketch is not None:
+            self._sketch.update(abs_error)
+
+        buffer = np.abs(y_true, dtype=dtype)
+        np.maximum(buffer, np.finfo(np.float64).eps, out=buffer)
+        np.divide(abs_error, buffer, out=buffer)
+        self._abs_percentage_error_sum += float(np.sum(buffer, dtype=np.float64))
+
+        y_true_mean = float(np.mean(y_true, dtype=np.float64))
+        centered = np.subtract(y_true, y_true_mean, out=buffer)
+        self._add_moments(
+            num_samples=num_samples,
+            squared_error_mean=squared_error_mean,
+            y_true_mean=y_true_mean,
+            y_true_m2=float(np.dot(centered, centered)),
+        )
+
+        if self._log_out_of_domain or np.any(y_true <= -1) or np.any(y_pred <= -1):
+            self._log_out_of_domain = True
+        else:
+            log_error = np.log1p(y_true, out=buffer, dtype=dtype)
+            np.subtract(log_error, np.log1p(y_pred, out=abs_error, dtype=dtype), out=log_error)
+            self._squared_log_error_sum += float(np.dot(log_error, log_error))
+
+
+class MeanAbsoluteErrorAccumulator(BaseRegressionAccumulator):
+    r"""Implement a mergeable accumulator to compute the mean absolute
+    error.
+
+    Args:
+        sketch_size: The size of the KLL sketch. It is not used by
+            this accumulator, but it must be the same to merge
+            accumulators.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import MeanAbsoluteErrorAccumulator
+    >>> accumulator = MeanAbsoluteErrorAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 3]))
+    >>> accumulator.update(y_true=np.array([4, 5]), y_pred=np.array([4, 1]))
+    >>> accumulator.compute()
+    {'count': 5, 'mean_absolute_error': 1.0}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = ("mean_absolute_error",)
+
+
+class MeanAbsolutePercentageErrorAccumulator(BaseRegressionAccumulator):
+    r"""Implement a mergeable accumulator to compute the mean absolute
+    percentage error.
+
+    Args:
+        sketch_size: The size of the KLL sketch. It is not used by
+            this accumulator, but it must be the same to merge
+            accumulators.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import MeanAbsolutePercentageErrorAccumulator
+    >>> accumulator = MeanAbsolutePercentageErrorAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 3]))
+    >>> accumulator.update(y_true=np.array([4, 5]), y_pred=np.array([4, 1]))
+    >>> accumulator.compute()
+    {'count': 5, 'mean_absolute_percentage_error': 0.36}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = ("mean_absolute_percentage_error",)
+
+
+class MeanSquaredErrorAccumulator(BaseRegressionAccumulator):
+    r"""Implement a mergeable accumulator to compute the mean squared
+    error.
+
+    Args:
+        sketch_size: The size of the KLL sketch. It is not used by
+            this accumulator, but it must be the same to merge
+            accumulators.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import MeanSquaredErrorAccumulator
+    >>> accumulator = MeanSquaredErrorAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 3]))
+    >>> accumulator.update(y_true=np.array([4, 5]), y_pred=np.array([4, 1]))
+    >>> accumulator.compute()
+    {'count': 5, 'mean_squared_error': 3.4...}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = ("mean_squared_error",)
+
+
+class MeanSquaredLogErrorAccumulator(BaseRegressionAccumulator):
+    r"""Implement a mergeable accumulator to compute the mean squared
+    logarithmic error.
+
+    Args:
+        sketch_size: The size of the KLL sketch. It is not used by
+            this accumulator, but it must be the same to merge
+            accumulators.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import MeanSquaredLogErrorAccumulator
+    >>> accumulator = MeanSquaredLogErrorAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 3]))
+    >>> accumulator.update(y_true=np.array([4, 5]), y_pred=np.array([4, 1]))
+    >>> accumulator.compute()
+    {'count': 5, 'mean_squared_log_error': 0.274...}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = ("mean_squared_log_error",)
+
+
+class MedianAbsoluteErrorAccumulator(BaseRegressionAccumulator):
+    r"""Implement a mergeable accumulator to compute the median
+    absolute error.
+
+    The median absolute error is exact while the number of samples
+    is smaller than ``sketch_size``, and approximated with a KLL
+    sketch otherwise.
+
+    Args:
+        sketch_size: The size of the KLL sketch used to approximate
+            the median absolute error.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import MedianAbsoluteErrorAccumulator
+    >>> accumulator = MedianAbsoluteErrorAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 5]))
+    >>> accumulator.update(y_true=np.array([4, 5]), y_pred=np.array([6, 1]))
+    >>> accumulator.compute()
+    {'count': 5, 'median_absolute_error': 2.0}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = ("median_absolute_error",)
+
+
+class R2ScoreAccumulator(BaseRegressionAccumulator):
+    r"""Implement a mergeable accumulator to compute the R^2
+    (coefficient of determination) regression score.
+
+    Args:
+        sketch_size: The size of the KLL sketch. It is not used by
+            this accumulator, but it must be the same to merge
+            accumulators.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import R2ScoreAccumulator
+    >>> accumulator = R2ScoreAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 3]))
+    >>> accumulator.update(y_true=np.array([4, 5]), y_pred=np.array([4, 1]))
+    >>> accumulator.compute()
+    {'count': 5, 'r2_score': -0.7}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = ("r2_score",)
+
+
+class RegressionErrorAccumulator(BaseRegressionAccumulator):
+    r"""Implement a mergeable accumulator to compute the regression
+    error metrics of ``regression_errors``.
+
+    Args:
+        sketch_size: The size of the KLL sketch used to approximate
+            the median absolute error.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import RegressionErrorAccumulator
+    >>> accumulator = RegressionErrorAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 3]))
+    >>> accumulator.update(y_true=np.array([4, 5]), y_pred=np.array([4, 1]))
+    >>> accumulator.compute()
+    {'count': 5,
+     'mean_absolute_error': 1.0,
+     'median_absolute_error': 0.0,
+     'mean_squared_error': 3.4...}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = (
+        "mean_absolute_error",
+        "median_absolute_error",
+        "mean_squared_error",
+    )
+
+
+class RootMeanSquaredErrorAccumulator(BaseRegressionAccumulator):
+    r"""Implement a mergeable accumulator to compute the root mean
+    squared error.
+
+    Args:
+        sketch_size: The size of the KLL sketch. It is not used by
+            this accumulator, but it must be the same to merge
+            accumulators.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import RootMeanSquaredErrorAccumulator
+    >>> accumulator = RootMeanSquaredErrorAccumulator()
+    >>> accumulator.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 3]))
+    >>> accumulator.update(y_true=np.array([4, 5]), y_pred=np.array([4, 1]))
+    >>> accumulator.compute()
+    {'count': 5, 'root_mean_squared_error': 1.843...}
+
+    ```
+    """
+
+    _metric_names: ClassVar[tuple[str, ...]] = ("root_mean_squared_error",)
@@ -9,11 +9,14 @@ from typing import TYPE_CHECKING
 
 from sklearn import metrics
 
-from arkas.metric.utils import contains_nan, preprocess_pred
+from arkas.metric.regression.native import mean_squared_log_error_native, use_native_backend
+from arkas.metric.utils import prepare_inputs
 
 if TYPE_CHECKING:
     import numpy as np
 
+    from arkas.metric.utils import PreparedInputs
+
 
 def mean_squared_log_error(
     y_true: np.ndarray,
@@ -22,6 +25,8 @@ def mean_squared_log_error(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    prepared: PreparedInputs | None = None,
+    backend: str = "auto",
 ) -> dict[str, float]:
     r"""Return the mean squared logarithmic error (MSLE).
 
@@ -33,6 +38,14 @@ def mean_squared_log_error(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        prepared: Optional inputs prepared with ``prepare_inputs``
+            on the same ``y_true`` and ``y_pred``. If given, the
+            inputs are not preprocessed again.
+        backend: The backend used to compute the metric. The valid
+            values are ``'native'`` (NumPy-native kernel without the
+            ``sklearn`` input validation), ``'sklearn'``, and
+            ``'auto'`` (native kernel for the arrays with at most
+            ``2**20`` values).
 
     Returns:
         The computed metrics.
@@ -50,15 +63,15 @@ def mean_squared_log_error(
 
     ```
     """
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
+    if prepared is None:
+        prepared = prepare_inputs(y_true, y_pred, nan_policy=nan_policy)
+    y_true, y_pred = prepared.y_true, prepared.y_pred
 
     count = y_true.size
     error = float("nan")
-    if count > 0 and not y_true_nan and not y_pred_nan:
+    if use_native_backend(backend, size=count) and prepared.is_valid:
+        error = mean_squared_log_error_native(y_true=y_true, y_pred=y_pred)
+    elif prepared.is_valid:
         error = float(metrics.mean_squared_log_error(y_true=y_true, y_pred=y_pred))
     return {
         f"{prefix}count{suffix}": count,
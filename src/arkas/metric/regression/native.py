@@ -0,0 +1,812 @@
+r"""Implement NumPy-native kernels to compute the regression metrics.
+
+The kernels compute the same values as the ``sklearn.metrics``
+functions on 1d arrays without NaN, but they skip the input
+validation of ``sklearn`` (``check_array``, ``type_of_target``, ...),
+whose overhead dominates the computation time on small arrays.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "check_backend",
+    "mean_absolute_error_native",
+    "mean_absolute_percentage_error_native",
+    "mean_squared_error_native",
+    "mean_squared_log_error_native",
+    "mean_tweedie_deviance_native",
+    "mean_tweedie_deviance_powers_native",
+    "median_absolute_error_native",
+    "multioutput_regression_metrics_native",
+    "r2_score_native",
+    "regression_metrics_native",
+    "root_mean_squared_error_native",
+    "use_native_backend",
+]
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# The maximum number of values to use the native kernels with the
+# ``'auto'`` backend. The larger arrays are sent to ``sklearn``
+# because the validation overhead is negligible for them.
+_MAX_NATIVE_SIZE = 2**20
+
+# The number of values of a block of rows of the multi-output and
+# Tweedie power grid kernels, so the temporary arrays of a block fit
+# in the CPU cache.
+_BLOCK_NUM_VALUES = 2**16
+
+
+def check_backend(backend: str) -> None:
+    r"""Check the backend used to compute the regression metrics.
+
+    Args:
+        backend: The backend. The valid values are ``'auto'``,
+            ``'native'``, and ``'sklearn'``.
+
+    Raises:
+        ValueError: if the backend is not valid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from arkas.metric.regression.native import check_backend
+    >>> check_backend("auto")
+
+    ```
+    """
+    if backend not in {"auto", "native", "sklearn"}:
+        msg = (
+            f"Incorrect 'backend': {backend}. The valid values are: 'auto', 'native', "
+            "and 'sklearn'"
+        )
+        raise ValueError(msg)
+
+
+def use_native_backend(backend: str, size: int) -> bool:
+    r"""Indicate if the native kernels are used to compute the metrics.
+
+    Args:
+        backend: The backend. If ``'auto'``, the native kernels are
+            used for the arrays with at most ``2**20`` values.
+        size: The number of values in the arrays.
+
+    Returns:
+        ``True`` if the native kernels are used, ``False`` if the
+            ``sklearn`` functions are used.
+
+    Raises:
+        ValueError: if the backend is not valid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from arkas.metric.regression.native import use_native_backend
+    >>> use_native_backend("auto", size=1000)
+    True
+    >>> use_native_backend("sklearn", size=1000)
+    False
+
+    ```
+    """
+    check_backend(backend)
+    if backend == "auto":
+        return size <= _MAX_NATIVE_SIZE
+    return backend == "native"
+
+
+def mean_absolute_error_native(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    r"""Return the mean absolute error.
+
+    Args:
+        y_true: The ground truth target values. This input must be a
+            non-empty array of shape ``(n_samples,)`` without NaN.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples,)`` without NaN.
+
+    Returns:
+        The mean absolute error.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.regression.native import mean_absolute_error_native
+    >>> mean_absolute_error_native(np.array([1, 2, 3, 4, 5]), np.array([2, 2, 3, 4, 1]))
+    1.0
+
+    ```
+    """
+    diff = np.subtract(y_pred, y_true, dtype=_float_dtype(y_true, y_pred))
+    return float(np.mean(np.abs(diff, out=diff), dtype=np.float64))
+
+
+def mean_absolute_percentage_error_native(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    r"""Return the mean absolute percentage error.
+
+    Like ``sklearn``, the ``y_true`` values are clipped to the
+    machine epsilon to avoid a division by zero.
+
+    Args:
+        y_true: The ground truth target values. This input must be a
+            non-empty array of shape ``(n_samples,)`` without NaN.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples,)`` without NaN.
+
+    Returns:
+        The mean absolute percentage error.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.regression.native import mean_absolute_percentage_error_native
+    >>> mean_absolute_percentage_error_native(np.array([1, 2, 4]), np.array([2, 2, 3]))
+    0.416...
+
+    ```
+    """
+    dtype = _float_dtype(y_true, y_pred)
+    epsilon = np.finfo(np.float64).eps
+    diff = np.subtract(y_pred, y_true, dtype=dtype)
+    np.abs(diff, out=diff)
+    np.divide(diff, np.maximum(np.abs(y_true, dtype=dtype), epsilon), out=diff)
+    return float(np.mean(diff, dtype=np.float64))
+
+
+def mean_squared_error_native(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    r"""Return the mean squared error.
+
+    Args:
+        y_true: The ground truth target values. This input must be a
+            non-empty array of shape ``(n_samples,)`` without NaN.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples,)`` without NaN.
+
+    Returns:
+        The mean squared error.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.regression.native import mean_squared_error_native
+    >>> mean_squared_error_native(np.array([1, 2, 3, 4, 5]), np.array([2, 2, 3, 4, 1]))
+    3.4
+
+    ```
+    """
+    diff = np.subtract(y_true, y_pred, dtype=_float_dtype(y_true, y_pred))
+    return float(np.mean(np.square(diff, out=diff), dtype=np.float64))
+
+
+def mean_squared_log_error_native(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    r"""Return the mean squared logarithmic error.
+
+    Args:
+        y_true: The ground truth target values. This input must be a
+            non-empty array of shape ``(n_samples,)`` without NaN.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples,)`` without NaN.
+
+    Returns:
+        The mean squared logarithmic error.
+
+    Raises:
+        ValueError: if a value is less than or equal to ``-1``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.regression.native import mean_squared_log_error_native
+    >>> mean_squared_log_error_native(np.array([1, 2, 3, 4, 5]), np.array([2, 2, 3, 4, 1]))
+    0.274...
+
+    ```
+    """
+    if np.any(y_true <= -1) or np.any(y_pred <= -1):
+        msg = (
+            "Mean Squared Logarithmic Error cannot be used when targets contain values "
+            "less than or equal to -1."
+        )
+        raise ValueError(msg)
+    dtype = _float_dtype(y_true, y_pred)
+    return mean_squared_error_native(np.log1p(y_true, dtype=dtype), np.log1p(y_pred, dtype=dtype))
+
+
+def mean_tweedie_deviance_native(
+    y_true: np.ndarray, y_pred: np.ndarray, power: float = 0.0
+) -> float:
+    r"""Return the mean Tweedie deviance.
+
+    Args:
+        y_true: The ground truth target values. This input must be a
+            non-empty array of shape ``(n_samples,)`` without NaN.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples,)`` without NaN.
+        power: The Tweedie power parameter. It must be ``power <= 0``
+            or ``power >= 1``.
+
+    Returns:
+        The mean Tweedie deviance.
+
+    Raises:
+        ValueError: if the power is not valid or if the values are
+            not in the domain of the Tweedie distribution.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.regression.native import mean_tweedie_deviance_native
+    >>> mean_tweedie_deviance_native(
+    ...     np.array([2, 0, 1, 4]), np.array([0.5, 0.5, 2.0, 2.0]), power=1
+    ... )
+    1.426...
+
+    ```
+    """
+    y_true, y_pred = _as_float(y_true), _as_float(y_pred)
+    _check_tweedie_domain(_min(y_true), _min(y_pred), power)
+    return float(np.mean(_tweedie_deviance(y_true, y_pred, power)))
+
+
+def mean_tweedie_deviance_powers_native(
+    y_true: np.ndarray, y_pred: np.ndarray, powers: Sequence[float]
+) -> np.ndarray:
+    r"""Return the mean Tweedie deviance for several powers computed in
+    a single pass over the values.
+
+    The values are processed in blocks of rows, and the deviances of
+    all the powers of a block are computed with broadcasted operations
+    from the logarithms of the block, which are computed once for all
+    the powers. The memory usage is bounded by the block size, so a
+    grid of powers can be evaluated on large arrays.
+
+    Args:
+        y_true: The ground truth target values. This input must be an
+            array of shape ``(n_samples,)`` without NaN.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples,)`` without NaN.
+        powers: The Tweedie power parameters. Each power must be
+            ``power <= 0`` or ``power >= 1``.
+
+    Returns:
+        The mean Tweedie deviance of each power, as a ``float64``
+            array of shape ``(n_powers,)``. The values are NaN if
+            the inputs are empty.
+
+    Raises:
+        ValueError: if a power is not valid or if the values are not
+            in the domain of the Tweedie distribution of a power.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.regression.native import mean_tweedie_deviance_powers_native
+    >>> mean_tweedie_deviance_powers_native(
+    ...     np.array([2, 0, 1, 4]), np.array([0.5, 0.5, 2.0, 2.0]), powers=[0, 1, 1.5]
+    ... )
+    array([1.875     , 1.42601513, 1.77817459])
+
+    ```
+    """
+    y_true, y_pred = _as_float(y_true), _as_float(y_pred)
+    powers = np.asarray(powers, dtype=np.float64).ravel()
+    min_true, min_pred = _min(y_true), _min(y_pred)
+    for power in powers:
+        _check_tweedie_domain(min_true, min_pred, power)
+    count = y_true.size
+    if count == 0:
+        return np.full(powers.shape, np.nan)
+
+    # The powers 0, 1, and 2 have their own formulas. The other
+    # powers are computed together from the logarithms of the values.
+    special = np.isin(powers, (0, 1, 2))
+    general = ~special
+    exp_true, exp_pred = 2 - powers[general], 1 - powers[general]
+    sums = np.zeros(powers.shape)
+    block_size = max(1, _BLOCK_NUM_VALUES // max(exp_true.size, 1))
+    for start in range(0, count, block_size):
+        block_true = y_true[start : start + block_size]
+        block_pred = y_pred[start : start + block_size]
+        for i in np.flatnonzero(special):
+            sums[i] += _tweedie_deviance(block_true, block_pred, powers[i]).sum(dtype=np.float64)
+        if exp_true.size:
+            sums[general] += _tweedie_deviance_grid(block_true, block_pred, exp_true, exp_pred)
+    return sums / count
+
+
+def median_absolute_error_native(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    r"""Return the median absolute error.
+
+    Args:
+        y_true: The ground truth target values. This input must be a
+            non-empty array of shape ``(n_samples,)`` without NaN.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples,)`` without NaN.
+
+    Returns:
+        The median absolute error.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.regression.native import median_absolute_error_native
+    >>> median_absolute_error_native(np.array([1, 2, 3, 4, 5]), np.array([2, 2, 3, 4, 1]))
+    0.0
+
+    ```
+    """
+    diff = np.subtract(y_pred, y_true, dtype=_float_dtype(y_true, y_pred))
+    return _median_inplace(np.abs(diff, out=diff))
+
+
+def multioutput_regression_metrics_native(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> dict[str, np.ndarray]:
+    r"""Return several regression metrics of each output computed from
+    the same residuals.
+
+    This function is the vectorized version of
+    ``regression_metrics_native`` for arrays of shape
+    ``(n_samples, n_outputs)``: all the metrics are reduced along the
+    first axis, so the outputs are evaluated without a Python loop.
+    The rows are processed in blocks that fit in the CPU cache, and
+    only the absolute residuals are stored, in an array of shape
+    ``(n_outputs, n_samples)`` so the median of each output is found
+    in a contiguous row. The mean squared logarithmic error of an
+    output is NaN if one of its values is less than or equal to
+    ``-1``.
+
+    Args:
+        y_true: The ground truth target values. This input must be a
+            non-empty array of shape ``(n_samples, n_outputs)``
+            without NaN.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples, n_outputs)`` without NaN.
+
+    Returns:
+        A dictionary with the max error, mean absolute error, mean
+            absolute percentage error, mean squared error, mean
+            squared logarithmic error, median absolute error, R^2
+            score, and root mean squared error of each output.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.regression.native import multioutput_regression_metrics_native
+    >>> metrics = multioutput_regression_metrics_native(
+    ...     np.array([[1, 2], [2, 4], [3, 6], [4, 8]]),
+    ...     np.array([[1, 3], [2, 4], [4, 6], [4, 4]]),
+    ... )
+    >>> metrics["mean_absolute_error"]
+    array([0.25, 1.25])
+    >>> metrics["r2_score"]
+    array([0.8 , 0.15])
+
+    ```
+    """
+    dtype = _float_dtype(y_true, y_pred)
+    count, num_outputs = y_true.shape
+    y_true_mean = np.mean(y_true, axis=0, dtype=np.float64)
+    sum_squares = np.zeros(num_outputs)
+    sum_squares_total = np.zeros(num_outputs)
+    abs_error_sum = np.zeros(num_outputs)
+    abs_percentage_error_sum = np.zeros(num_outputs)
+    squared_log_error_sum = np.zeros(num_outputs)
+    max_error = np.zeros(num_outputs)
+    invalid = np.zeros(num_outputs, dtype=bool)
+    abs_errors = np.empty((num_outputs, count), dtype=dtype)
+
+    block_size = max(1, _BLOCK_NUM_VALUES // num_outputs)
+    for start in range(0, count, block_size):
+        block = slice(start, start + block_size)
+        block_true, block_pred = y_true[block], y_pred[block]
+        abs_error = np.subtract(block_pred, block_true, dtype=dtype)
+        sum_squares += np.einsum("ij,ij->j", abs_error, abs_error, dtype=np.float64)
+        np.abs(abs_error, out=abs_error)
+        abs_error_sum += abs_error.sum(axis=0, dtype=np.float64)
+        np.maximum(max_error, abs_error.max(axis=0), out=max_error)
+        abs_errors[:, block] = abs_error.T
+
+        buffer = np.abs(block_true, dtype=dtype)
+        np.maximum(buffer, np.finfo(np.float64).eps, out=buffer)
+        np.divide(abs_error, buffer, out=buffer)
+        abs_percentage_error_sum += buffer.sum(axis=0, dtype=np.float64)
+
+        centered = np.subtract(block_true, y_true_mean, out=buffer)
+        sum_squares_total += np.einsum("ij,ij->j", centered, centered, dtype=np.float64)
+
+        invalid |= np.any(block_true <= -1, axis=0) | np.any(block_pred <= -1, axis=0)
+        if invalid.all():
+            continue
+        with np.errstate(invalid="ignore", divide="ignore"):
+            log_error = np.log1p(block_true, out=buffer, dtype=dtype)
+            np.subtract(log_error, np.log1p(block_pred, out=abs_error, dtype=dtype), out=log_error)
+        squared_log_error_sum += np.einsum("ij,ij->j", log_error, log_error, dtype=np.float64)
+
+    r2 = np.full(num_outputs, np.nan)
+    if count >= 2:
+        # Like ``_r2_from_sums``, the perfect predictions have a score
+        # of 1 and the imperfect predictions of a constant target have
+        # a score of 0.
+        np.divide(sum_squares, sum_squares_total, out=r2, where=sum_squares_total != 0)
+        np.subtract(1.0, r2, out=r2)
+        r2[sum_squares_total == 0] = 0.0
+        r2[sum_squares == 0] = 1.0
+
+    msle = squared_log_error_sum / count
+    msle[invalid] = np.nan
+    mse = sum_squares / count
+    return {
+        "max_error": max_error,
+        "mean_absolute_error": abs_error_sum / count,
+        "mean_absolute_percentage_error": abs_percentage_error_sum / count,
+        "mean_squared_error": mse,
+        "mean_squared_log_error": msle,
+        "median_absolute_error": _median_inplace(abs_errors),
+        "r2_score": r2,
+        "root_mean_squared_error": np.sqrt(mse),
+    }
+
+
+def r2_score_native(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    r"""Return the R^2 (coefficient of determination) regression score.
+
+    Like ``sklearn``, the score is NaN if there is less than two
+    samples, ``1.0`` for perfect predictions, and ``0.0`` for
+    imperfect predictions of a constant target.
+
+    Args:
+        y_true: The ground truth target values. This input must be a
+            non-empty array of shape ``(n_samples,)`` without NaN.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples,)`` without NaN.
+
+    Returns:
+        The R^2 score.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.regression.native import r2_score_native
+    >>> r2_score_native(np.array([1, 2, 3, 4, 5]), np.array([2, 2, 3, 4, 1]))
+    -0.7
+
+    ```
+    """
+    if y_true.shape[0] < 2:
+        return float("nan")
+    diff = np.subtract(y_true, y_pred, dtype=_float_dtype(y_true, y_pred))
+    numerator = float(np.dot(diff, diff))
+    # The buffer of the errors is reused to center the targets.
+    centered = np.subtract(y_true, np.mean(y_true, dtype=np.float64), out=diff)
+    denominator = float(np.dot(centered, centered))
+    return _r2_from_sums(numerator, denominator, count=y_true.shape[0])
+
+
+def regression_metrics_native(y_true: np.ndarray, y_pred: np.ndarray) -> dict[str, float]:
+    r"""Return several regression metrics computed from the same
+    residuals.
+
+    The residuals are computed once, and the metrics are derived from
+    them with two temporary arrays: the absolute residuals, which are
+    partially sorted in place by a single ``numpy.partition`` call to
+    find the median absolute error, and a buffer used for the
+    percentage errors, the centered targets, and the logarithmic
+    errors. The metrics have the same values as the other native
+    kernels, except that the mean squared logarithmic error is NaN
+    instead of raising an error if a value is less than or equal to
+    ``-1``.
+
+    Args:
+        y_true: The ground truth target values. This input must be a
+            non-empty array of shape ``(n_samples,)`` without NaN.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples,)`` without NaN.
+
+    Returns:
+        A dictionary with the max error, mean absolute error, mean
+            absolute percentage error, mean squared error, mean
+            squared logarithmic error, median absolute error, R^2
+            score, and root mean squared error.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.regression.native import regression_metrics_native
+    >>> regression_metrics_native(np.array([1, 2, 3, 4, 5]), np.array([2, 2, 3, 4, 1]))
+    {'max_error': 4.0,
+     'mean_absolute_error': 1.0,
+     'mean_absolute_percentage_error': 0.36,
+     'mean_squared_error': 3.4,
+     'mean_squared_log_error': 0.274...,
+     'median_absolute_error': 0.0,
+     'r2_score': -0.7,
+     'root_mean_squared_error': 1.843...}
+
+    ```
+    """
+    dtype = _float_dtype(y_true, y_pred)
+    count = y_true.shape[0]
+    abs_error = np.subtract(y_pred, y_true, dtype=dtype)
+    sum_squares = float(np.dot(abs_error, abs_error))
+    np.abs(abs_error, out=abs_error)
+    mae = float(np.mean(abs_error, dtype=np.float64))
+    max_error = float(abs_error.max())
+
+    buffer = np.abs(y_true, dtype=dtype)
+    np.maximum(buffer, np.finfo(np.float64).eps, out=buffer)
+    np.divide(abs_error, buffer, out=buffer)
+    mape = float(np.mean(buffer, dtype=np.float64))
+
+    # The order of the absolute errors is not used after this point.
+    median = _median_inplace(abs_error)
+
+    centered = np.subtract(y_true, np.mean(y_true, dtype=np.float64), out=buffer)
+    sum_squares_total = float(np.dot(centered, centered))
+    r2 = _r2_from_sums(sum_squares, sum_squares_total, count=count)
+
+    msle = float("nan")
+    if not (np.any(y_true <= -1) or np.any(y_pred <= -1)):
+        log_error = np.log1p(y_true, out=buffer, dtype=dtype)
+        np.subtract(log_error, np.log1p(y_pred, out=abs_error, dtype=dtype), out=log_error)
+        msle = float(np.dot(log_error, log_error)) / count
+
+    mse = sum_squares / count
+    return {
+        "max_error": max_error,
+        "mean_absolute_error": mae,
+        "mean_absolute_percentage_error": mape,
+        "mean_squared_error": mse,
+        "mean_squared_log_error": msle,
+        "median_absolute_error": median,
+        "r2_score": r2,
+        "root_mean_squared_error": math.sqrt(mse),
+    }
+
+
+def root_mean_squared_error_native(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    r"""Return the root mean squared error.
+
+    Args:
+        y_true: The ground truth target values. This input must be a
+            non-empty array of shape ``(n_samples,)`` without NaN.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples,)`` without NaN.
+
+    Returns:
+        The root mean squared error.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.regression.native import root_mean_squared_error_native
+    >>> root_mean_squared_error_native(np.array([1, 2, 3, 4, 5]), np.array([2, 2, 3, 4, 1]))
+    1.843...
+
+    ```
+    """
+    return float(np.sqrt(mean_squared_error_native(y_true, y_pred)))
+
+
+def _as_float(arr: np.ndarray) -> np.ndarray:
+    r"""Convert an array to a floating point array, like ``sklearn``
+    does before computing the regression metrics.
+
+    Args:
+        arr: The input array.
+
+    Returns:
+        The input array if it has a floating point dtype, otherwise
+            a ``float64`` copy.
+    """
+    if np.issubdtype(arr.dtype, np.floating):
+        return arr
+    return arr.astype(np.float64)
+
+
+def _float_dtype(*arrays: np.ndarray) -> np.dtype:
+    r"""Return the floating point dtype used to compute the errors
+    between arrays.
+
+    The inputs are not converted, so the narrow arrays (e.g. ``bool``
+    or ``int8``) are only widened inside the element-wise operations.
+
+    Args:
+        *arrays: The input arrays.
+
+    Returns:
+        The dtype of the floating point arrays, and ``float64`` for
+            the other arrays, like in ``_as_float``.
+    """
+    return np.result_type(
+        *(arr.dtype if np.issubdtype(arr.dtype, np.floating) else np.float64 for arr in arrays)
+    )
+
+
+def _median_inplace(array: np.ndarray) -> np.ndarray | float:
+    r"""Return the median of the values along the last axis.
+
+    The array is partially sorted in place with a single ``kth``
+    value, which is much faster than the two ``kth`` values used by
+    ``numpy.median`` when the number of values is even. The lower
+    middle value is then the maximum of the left partition.
+
+    Args:
+        array: The array without NaN. It must have at least one value
+            along the last axis.
+
+    Returns:
+        The median, as a ``float`` for a 1d array, or as a ``float64``
+            array otherwise.
+    """
+    count = array.shape[-1]
+    k = count // 2
+    array.partition(k, axis=-1)
+    median = array[..., k].astype(np.float64)
+    if count % 2 == 0:
+        median = (median + array[..., :k].max(axis=-1)) / 2
+    return float(median) if array.ndim == 1 else median
+
+
+def _r2_from_sums(sum_squares: float, sum_squares_total: float, count: int) -> float:
+    r"""Return the R^2 score from the sums of squares.
+
+    Like ``sklearn``, the score is NaN if there is less than two
+    samples, ``1.0`` for perfect predictions, and ``0.0`` for
+    imperfect predictions of a constant target.
+
+    Args:
+        sum_squares: The residual sum of squares.
+        sum_squares_total: The total sum of squares of the targets.
+        count: The number of samples.
+
+    Returns:
+        The R^2 score.
+    """
+    if count < 2:
+        return float("nan")
+    if sum_squares == 0:
+        return 1.0
+    if sum_squares_total == 0:
+        return 0.0
+    return 1.0 - sum_squares / sum_squares_total
+
+
+def _min(arr: np.ndarray) -> float:
+    r"""Return the minimum value of an array.
+
+    Args:
+        arr: The input array.
+
+    Returns:
+        The minimum value, or ``inf`` if the array is empty.
+    """
+    return float(arr.min(initial=np.inf))
+
+
+def _tweedie_deviance(y_true: np.ndarray, y_pred: np.ndarray, power: float) -> np.ndarray:
+    r"""Return the Tweedie deviance of each value.
+
+    Args:
+        y_true: The ground truth target values.
+        y_pred: The predicted values.
+        power: The Tweedie power parameter.
+
+    Returns:
+        The Tweedie deviance of each value.
+    """
+    p = power
+    if p == 0:
+        return (y_true - y_pred) ** 2
+    if p == 1:
+        # ``xlogy(y_true, y_true / y_pred)`` without scipy.
+        ratio = np.ones_like(y_true)
+        np.divide(y_true, y_pred, out=ratio, where=y_true != 0)
+        return 2 * (y_true * np.log(ratio) - y_true + y_pred)
+    if p == 2:
+        return 2 * (np.log(y_pred / y_true) + y_true / y_pred - 1)
+    y_true_pos = np.maximum(y_true, 0) if p < 0 else y_true
+    return 2 * (
+        np.power(y_true_pos, 2 - p) / ((1 - p) * (2 - p))
+        - y_true * np.power(y_pred, 1 - p) / (1 - p)
+        + np.power(y_pred, 2 - p) / (2 - p)
+    )
+
+
+def _tweedie_deviance_grid(
+    y_true: np.ndarray, y_pred: np.ndarray, exp_true: np.ndarray, exp_pred: np.ndarray
+) -> np.ndarray:
+    r"""Return the sum of the Tweedie deviances of several powers.
+
+    The powers ``x ** e`` are computed as ``exp(e * log(x))`` with
+    the logarithms of the values, which are shared by all the powers,
+    so only two exponentials are computed for each value and power.
+    The powers must not be 0, 1, or 2.
+
+    Args:
+        y_true: The ground truth target values.
+        y_pred: The predicted values.
+        exp_true: The exponents ``2 - power`` of each power.
+        exp_pred: The exponents ``1 - power`` of each power.
+
+    Returns:
+        The sum of the Tweedie deviances of each power, as an array
+            of shape ``(n_powers,)``.
+    """
+    with np.errstate(divide="ignore"):
+        # The negative targets of the negative powers are replaced by
+        # 0, whose logarithm is ``-inf`` and ``exp(-inf) = 0``.
+        log_true = np.log(np.maximum(y_true, 0))
+        log_pred = np.log(y_pred)
+    exp_true, exp_pred = exp_true[:, None], exp_pred[:, None]
+    dev = np.multiply(exp_true, log_true)
+    np.exp(dev, out=dev)
+    dev /= exp_true * exp_pred
+    # ``y_pred ** (2 - p) = y_pred ** (1 - p) * y_pred``, so a single
+    # exponential of the predicted values is computed for each power.
+    pred_pow = np.multiply(exp_pred, log_pred)
+    np.exp(pred_pow, out=pred_pow)
+    buffer = np.divide(y_pred, exp_true)
+    buffer -= y_true / exp_pred
+    buffer *= pred_pow
+    dev += buffer
+    return 2 * dev.sum(axis=1, dtype=np.float64)
+
+
+def _check_tweedie_domain(min_true: float, min_pred: float, power: float) -> None:
+    r"""Check the power and the values used to compute the Tweedie
+    deviance.
+
+    Args:
+        min_true: The minimum ground truth target value.
+        min_pred: The minimum predicted value.
+        power: The Tweedie power parameter.
+
+    Raises:
+        ValueError: if the power is not valid or if the values are
+            not in the domain of the Tweedie distribution.
+    """
+    if 0 < power < 1:
+        msg = f"Incorrect 'power': {power}. The power must be <= 0 or >= 1"
+        raise ValueError(msg)
+    message = f"Mean Tweedie deviance error with power={power} can only be used on "
+    if power < 0:
+        if min_pred <= 0:
+            msg = message + "strictly positive y_pred."
+            raise ValueError(msg)
+    elif 1 <= power < 2:
+        if min_true < 0 or min_pred <= 0:
+            msg = message + "non-negative y and strictly positive y_pred."
+            raise ValueError(msg)
+    elif power >= 2 and (min_true <= 0 or min_pred <= 0):
+        msg = message + "strictly positive y and y_pred."
+        raise ValueError(msg)
@@ -0,0 +1,288 @@
+r"""Implement a binned profile of the residuals of a regression model.
+
+The samples are grouped in bins of predicted values, and the
+statistics of the residuals of each bin are computed with
+``numpy.bincount`` on blocks of rows, so the profile is computed in
+``O(n_samples)`` without sorting or grouping the samples.
+"""
+
+from __future__ import annotations
+
+__all__ = ["binned_residuals", "find_bin_edges"]
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from arkas.metric.utils import prepare_inputs
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# The number of values of a block of rows, so the temporary arrays of
+# a block fit in the CPU cache.
+_BLOCK_NUM_VALUES = 2**16
+
+# The maximum number of values used to estimate the quantile bin
+# edges. The larger arrays are subsampled with a fixed seed, so the
+# edges are deterministic.
+_MAX_QUANTILE_SAMPLES = 2**20
+
+# The maximum number of inner edges to find the bins of the values
+# with comparisons. ``numpy.searchsorted`` is used for more edges.
+_MAX_COMPARISON_EDGES = 32
+
+
+def binned_residuals(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    bins: int | Sequence[float] | np.ndarray = 10,
+    strategy: str = "quantile",
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> dict[str, Any]:
+    r"""Return the profile of the residuals of a regression model
+    binned by predicted value.
+
+    The residual of a sample is ``y_pred - y_true``, so a positive
+    bias means the model over-predicts in the bin. The bins are
+    half-open intervals ``[left, right)``, except the last bin which
+    also includes its right edge, like ``numpy.histogram``. The
+    empty bins have a NaN bias, mean absolute error, and root mean
+    squared error. If the inputs contain a NaN value and
+    ``nan_policy='propagate'``, the bins are empty and all the
+    statistics are NaN.
+
+    Args:
+        y_true: The ground truth target values.
+        y_pred: The predicted values.
+        bins: The number of bins, or the monotonically increasing bin
+            edges. If the bin edges are given, the samples whose
+            predicted value is outside of the edges are ignored.
+        strategy: The strategy to find the bin edges if ``bins`` is
+            the number of bins. The following options are available:
+            ``'quantile'`` and ``'uniform'``. See ``find_bin_edges``
+            for more information.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Returns:
+        The profile of the residuals. ``bin_edges`` is an array of
+            shape ``(n_bins + 1,)``, and ``bin_count``, ``bin_bias``,
+            ``bin_mae``, and ``bin_rmse`` are arrays of shape
+            ``(n_bins,)``. ``count`` is the number of samples.
+
+    Raises:
+        ValueError: if ``bins`` or ``strategy`` is not valid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import binned_residuals
+    >>> profile = binned_residuals(
+    ...     y_true=np.array([1, 2, 3, 4, 5, 6]),
+    ...     y_pred=np.array([2, 2, 3, 3, 6, 8]),
+    ...     bins=[0, 3, 6, 9],
+    ... )
+    >>> profile["count"]
+    6
+    >>> profile["bin_count"]
+    array([2, 2, 2])
+    >>> profile["bin_bias"]
+    array([ 0.5, -0.5,  1.5])
+    >>> profile["bin_rmse"]
+    array([0.70710678, 0.70710678, 1.58113883])
+
+    ```
+    """
+    prepared = prepare_inputs(y_true, y_pred, nan_policy=nan_policy)
+    y_true, y_pred = prepared.y_true, prepared.y_pred
+    if isinstance(bins, (int, np.integer)):
+        # The edges are NaN if the predicted values contain NaN.
+        bin_edges = find_bin_edges(
+            y_pred if prepared.is_valid else y_pred[:0], n_bins=int(bins), strategy=strategy
+        )
+        clip = False
+    else:
+        bin_edges = _check_bin_edges(bins)
+        clip = True
+
+    n_bins = bin_edges.size - 1
+    stats = np.zeros((4, n_bins))
+    if prepared.is_valid and prepared.count > 0:
+        stats = _bin_stats(y_true, y_pred, bin_edges=bin_edges, clip=clip)
+    count = stats[0].astype(np.int64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = stats[1:] / stats[0]
+    if not prepared.is_valid:
+        mean[:] = np.nan
+    out = {
+        "bin_bias": mean[0],
+        "bin_count": count,
+        "bin_edges": bin_edges,
+        "bin_mae": mean[1],
+        "bin_rmse": np.sqrt(mean[2]),
+        "count": prepared.count,
+    }
+    return {f"{prefix}{key}{suffix}": value for key, value in out.items()}
+
+
+def find_bin_edges(values: np.ndarray, n_bins: int, strategy: str = "quantile") -> np.ndarray:
+    r"""Find the bin edges of some values.
+
+    With the ``'quantile'`` strategy, the bins have about the same
+    number of values. The quantiles are estimated on a subsample of
+    ``2**20`` values if there are more values, and the duplicate
+    edges are removed, so there can be fewer bins than requested if
+    many values are equal. With the ``'uniform'`` strategy, the bins
+    have the same width between the minimum and maximum values.
+
+    Args:
+        values: The values to bin. The array is flattened and must
+            not contain NaN.
+        n_bins: The number of bins.
+        strategy: The strategy to find the bin edges. The following
+            options are available: ``'quantile'`` and ``'uniform'``.
+
+    Returns:
+        The monotonically increasing bin edges, as a ``float64`` array
+            of shape ``(n_bins + 1,)``. If ``values`` is empty, the
+            edges are NaN.
+
+    Raises:
+        ValueError: if ``n_bins`` is not a positive integer or
+            ``strategy`` is not valid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.regression.residual import find_bin_edges
+    >>> find_bin_edges(np.arange(101), n_bins=4)
+    array([  0.,  25.,  50.,  75., 100.])
+    >>> find_bin_edges(np.array([0, 0, 0, 0, 1, 9]), n_bins=4, strategy="uniform")
+    array([0.  , 2.25, 4.5 , 6.75, 9.  ])
+
+    ```
+    """
+    if n_bins < 1:
+        msg = f"Incorrect 'n_bins': {n_bins}. The number of bins must be greater than 0"
+        raise ValueError(msg)
+    if strategy not in {"quantile", "uniform"}:
+        msg = f"Incorrect 'strategy': {strategy!r}. The valid values are: 'quantile' and 'uniform'"
+        raise ValueError(msg)
+    values = values.ravel()
+    if values.dtype == np.bool_:
+        values = values.view(np.uint8)
+    if values.size == 0:
+        return np.full(n_bins + 1, np.nan)
+    if strategy == "uniform":
+        edges = np.linspace(values.min(), values.max(), n_bins + 1, dtype=np.float64)
+    elif values.size > _MAX_QUANTILE_SAMPLES:
+        rng = np.random.default_rng(0)
+        sample = values[rng.integers(0, values.size, size=_MAX_QUANTILE_SAMPLES)]
+        # The first and last edges are the extreme values of all the
+        # values, so the edges include all the values.
+        edges = np.quantile(sample, np.linspace(0.0, 1.0, n_bins + 1)[1:-1])
+        edges = np.concatenate([[values.min()], edges, [values.max()]])
+    else:
+        edges = np.quantile(values, np.linspace(0.0, 1.0, n_bins + 1))
+    edges = np.unique(edges.astype(np.float64))
+    if edges.size == 1:
+        # All the values are equal, so there is a single bin.
+        edges = np.repeat(edges, 2)
+    return edges
+
+
+def _bin_stats(
+    y_true: np.ndarray, y_pred: np.ndarray, bin_edges: np.ndarray, clip: bool
+) -> np.ndarray:
+    r"""Compute the sums of the residuals of each bin.
+
+    Args:
+        y_true: The ground truth target values, as a 1d array
+            without NaN.
+        y_pred: The predicted values, as a 1d array without NaN.
+        bin_edges: The bin edges.
+        clip: If ``True``, the samples whose predicted value is
+            outside of the edges are ignored. Otherwise, all the
+            predicted values must be inside the edges.
+
+    Returns:
+        An array of shape ``(4, n_bins)`` with the number of samples,
+            the sum of the residuals, the sum of the absolute
+            residuals, and the sum of the squared residuals of each
+            bin.
+    """
+    n_bins = bin_edges.size - 1
+    inner = bin_edges[1:-1]
+    # The ignored samples are counted in an extra bin, which is removed
+    # at the end, so the samples of a block are never copied.
+    minlength = n_bins + 1
+    stats = np.zeros((4, minlength))
+    for start in range(0, y_true.shape[0], _BLOCK_NUM_VALUES):
+        true = y_true[start : start + _BLOCK_NUM_VALUES]
+        pred = y_pred[start : start + _BLOCK_NUM_VALUES]
+        index = _digitize(pred, inner)
+        if clip:
+            outside = np.less(pred, bin_edges[0])
+            outside |= np.greater(pred, bin_edges[-1])
+            index[outside] = n_bins
+        residual = np.subtract(pred, true, dtype=np.float64)
+        stats[0] += np.bincount(index, minlength=minlength)
+        stats[1] += np.bincount(index, weights=residual, minlength=minlength)
+        stats[3] += np.bincount(index, weights=np.square(residual), minlength=minlength)
+        stats[2] += np.bincount(index, weights=np.abs(residual, out=residual), minlength=minlength)
+    return stats[:, :n_bins]
+
+
+def _digitize(values: np.ndarray, inner_edges: np.ndarray) -> np.ndarray:
+    r"""Return the bin index of each value.
+
+    Args:
+        values: The 1d array of values.
+        inner_edges: The inner bin edges, i.e. without the first and
+            last edges.
+
+    Returns:
+        The bin index of each value. The values smaller than the
+            first inner edge are in the bin ``0``.
+    """
+    if inner_edges.size > _MAX_COMPARISON_EDGES:
+        return np.searchsorted(inner_edges, values, side="right")
+    # A few vectorized comparisons are faster than a binary search.
+    index = np.zeros(values.shape, dtype=np.intp)
+    for edge in inner_edges:
+        index += values >= edge
+    return index
+
+
+def _check_bin_edges(bins: Sequence[float] | np.ndarray) -> np.ndarray:
+    r"""Check and convert the bin edges.
+
+    Args:
+        bins: The bin edges.
+
+    Returns:
+        The bin edges as a ``float64`` array.
+
+    Raises:
+        ValueError: if the bin edges are not a 1d array of at least
+            two monotonically increasing values.
+    """
+    edges = np.asarray(bins, dtype=np.float64)
+    if edges.ndim != 1 or edges.size < 2:
+        msg = f"Incorrect 'bins': {bins}. The bin edges must be a 1d array with at least 2 values"
+        raise ValueError(msg)
+    if not np.all(np.diff(edges) > 0):
+        msg = f"Incorrect 'bins': {bins}. The bin edges must increase monotonically"
+        raise ValueError(msg)
+    return edges
@@ -8,13 +8,19 @@ from typing import TYPE_CHECKING
 
 from sklearn import metrics
 
-from arkas.metric.utils import contains_nan, preprocess_pred
+from arkas.metric.regression.native import (
+    mean_tweedie_deviance_powers_native,
+    use_native_backend,
+)
+from arkas.metric.utils import prepare_inputs
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
     import numpy as np
 
+    from arkas.metric.utils import PreparedInputs
+
 
 def mean_tweedie_deviance(
     y_true: np.ndarray,
@@ -24,20 +30,31 @@ def mean_tweedie_deviance(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    prepared: PreparedInputs | None = None,
+    backend: str = "auto",
 ) -> dict[str, float]:
     r"""Return the mean Tweedie deviance regression loss.
 
     Args:
         y_true: The ground truth target values.
         y_pred: The predicted values.
-        powers: The Tweedie power parameter. The higher power the less
-            weight is given to extreme deviations between true and
-            predicted targets.
+        powers: The Tweedie power parameters. The higher power the
+            less weight is given to extreme deviations between true
+            and predicted targets. With the native backend, all the
+            powers are evaluated in a single pass over the values.
         prefix: The key prefix in the returned dictionary.
         suffix: The key suffix in the returned dictionary.
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        prepared: Optional inputs prepared with ``prepare_inputs``
+            on the same ``y_true`` and ``y_pred``. If given, the
+            inputs are not preprocessed again.
+        backend: The backend used to compute the metric. The valid
+            values are ``'native'`` (NumPy-native kernel without the
+            ``sklearn`` input validation), ``'sklearn'``, and
+            ``'auto'`` (native kernel for the arrays with at most
+            ``2**20`` values or for several powers).
 
     Returns:
         The computed metrics.
@@ -55,17 +72,25 @@ def mean_tweedie_deviance(
 
     ```
     """
-    y_true, y_pred = preprocess_pred(
-        y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=nan_policy == "omit"
-    )
-    y_true_nan = contains_nan(arr=y_true, nan_policy=nan_policy, name="'y_true'")
-    y_pred_nan = contains_nan(arr=y_pred, nan_policy=nan_policy, name="'y_pred'")
+    if prepared is None:
+        prepared = prepare_inputs(y_true, y_pred, nan_policy=nan_policy)
+    y_true, y_pred = prepared.y_true, prepared.y_pred
 
     count = y_true.size
+    # The native kernel evaluates all the powers in a single pass, so
+    # it is also used for the large arrays if there are several powers.
+    native = use_native_backend(backend, size=count) or (backend == "auto" and len(powers) > 1)
+    scores = [float("nan")] * len(powers)
+    if prepared.is_valid and native:
+        scores = mean_tweedie_deviance_powers_native(
+            y_true=y_true, y_pred=y_pred, powers=powers
+        ).tolist()
+    elif prepared.is_valid:
+        scores = [
+            metrics.mean_tweedie_deviance(y_true=y_true, y_pred=y_pred, power=power)
+            for power in powers
+        ]
     out = {f"{prefix}count{suffix}": count}
-    for power in powers:
-        score = float("nan")
-        if count > 0 and not y_true_nan and not y_pred_nan:
-            score = metrics.mean_tweedie_deviance(y_true=y_true, y_pred=y_pred, power=power)
+    for power, score in zip(powers, scores):
         out[f"{prefix}mean_tweedie_deviance_power_{power}{suffix}"] = float(score)
     return out
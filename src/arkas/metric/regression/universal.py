@@ -2,16 +2,106 @@ r"""Implement the regression error metrics."""
 
 from __future__ import annotations
 
-__all__ = ["regression_errors"]
+__all__ = ["multioutput_regression_metrics", "regression_errors", "regression_metrics"]
 
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from arkas.metric.regression.abs_error import mean_absolute_error, median_absolute_error
 from arkas.metric.regression.mse import mean_squared_error
+from arkas.metric.regression.native import (
+    multioutput_regression_metrics_native,
+    regression_metrics_native,
+    use_native_backend,
+)
+from arkas.metric.utils import prepare_inputs
 
 if TYPE_CHECKING:
-    import numpy as np
+    from arkas.metric.utils import PreparedInputs
+
+_METRIC_NAMES = (
+    "max_error",
+    "mean_absolute_error",
+    "mean_absolute_percentage_error",
+    "mean_squared_error",
+    "mean_squared_log_error",
+    "median_absolute_error",
+    "r2_score",
+    "root_mean_squared_error",
+)
+
+
+def multioutput_regression_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+) -> dict[str, float | np.ndarray]:
+    r"""Return several regression metrics of each output of a
+    multi-output regression model.
+
+    The metrics of ``regression_metrics`` are computed for each
+    output, i.e. each column, in a single vectorized call, instead of
+    flattening the inputs. For example, each output can be a step of
+    a forecast horizon. The ``macro_*`` metrics are the unweighted
+    means of the metrics of the outputs, like
+    ``multioutput='uniform_average'`` in ``sklearn``.
+
+    Args:
+        y_true: The ground truth target values. This input must be an
+            array of shape ``(n_samples, n_outputs)`` or
+            ``(n_samples,)``.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples, n_outputs)`` or ``(n_samples,)``.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``. With ``'omit'``, the
+            samples with a NaN value in at least one output are
+            removed.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import multioutput_regression_metrics
+    >>> metrics = multioutput_regression_metrics(
+    ...     y_true=np.array([[1, 2], [2, 4], [3, 6], [4, 8]]),
+    ...     y_pred=np.array([[1, 3], [2, 4], [4, 6], [4, 4]]),
+    ... )
+    >>> metrics["count"]
+    4
+    >>> metrics["mean_absolute_error"]
+    array([0.25, 1.25])
+    >>> metrics["macro_mean_absolute_error"]
+    0.75
+    >>> metrics["r2_score"]
+    array([0.8 , 0.15])
+
+    ```
+    """
+    num_outputs = y_true.shape[1] if y_true.ndim == 2 else 1
+    prepared = prepare_inputs(y_true, y_pred, nan_policy=nan_policy, multilabel=True)
+    if prepared.is_valid and prepared.count > 0:
+        metrics = multioutput_regression_metrics_native(
+            y_true=prepared.y_true, y_pred=prepared.y_pred
+        )
+    else:
+        metrics = {name: np.full(num_outputs, np.nan) for name in _METRIC_NAMES}
+    out = {"count": prepared.count}
+    for name, values in metrics.items():
+        out[name] = values
+        out[f"macro_{name}"] = float(values.mean()) if values.size else float("nan")
+    return {f"{prefix}{key}{suffix}": value for key, value in sorted(out.items())}
 
 
 def regression_errors(
@@ -21,6 +111,7 @@ def regression_errors(
     prefix: str = "",
     suffix: str = "",
     nan_policy: str = "propagate",
+    backend: str = "auto",
 ) -> dict[str, float]:
     r"""Return the regression error metrics.
 
@@ -32,6 +123,8 @@ def regression_errors(
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        backend: The backend used to compute the metrics. The valid
+            values are ``'native'``, ``'sklearn'``, and ``'auto'``.
 
     Returns:
         The computed metrics.
@@ -50,6 +143,19 @@ def regression_errors(
 
     ```
     """
+    # The inputs are prepared once and shared by all the metrics.
+    prepared = prepare_inputs(y_true, y_pred, nan_policy=nan_policy)
+    if use_native_backend(backend, size=prepared.count):
+        metrics = regression_metrics(y_true, y_pred, nan_policy=nan_policy, prepared=prepared)
+        return {
+            f"{prefix}{key}{suffix}": metrics[key]
+            for key in [
+                "count",
+                "mean_absolute_error",
+                "median_absolute_error",
+                "mean_squared_error",
+            ]
+        }
     return (
         mean_absolute_error(
             y_true=y_true,
@@ -57,6 +163,8 @@ def regression_errors(
             prefix=prefix,
             suffix=suffix,
             nan_policy=nan_policy,
+            prepared=prepared,
+            backend=backend,
         )
         | median_absolute_error(
             y_true=y_true,
@@ -64,6 +172,8 @@ def regression_errors(
             prefix=prefix,
             suffix=suffix,
             nan_policy=nan_policy,
+            prepared=prepared,
+            backend=backend,
         )
         | mean_squared_error(
             y_true=y_true,
@@ -71,5 +181,71 @@ def regression_errors(
             prefix=prefix,
             suffix=suffix,
             nan_policy=nan_policy,
+            prepared=prepared,
+            backend=backend,
         )
     )
+
+
+def regression_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    prefix: str = "",
+    suffix: str = "",
+    nan_policy: str = "propagate",
+    prepared: PreparedInputs | None = None,
+) -> dict[str, float]:
+    r"""Return several regression metrics computed in a single fused
+    kernel.
+
+    The residuals are computed once and the max error, mean absolute
+    error, mean absolute percentage error, mean squared error, mean
+    squared logarithmic error, median absolute error, R^2 score, and
+    root mean squared error are derived from them. See
+    ``arkas.metric.regression.native.regression_metrics_native`` for
+    more information. The mean squared logarithmic error is NaN if a
+    value is less than or equal to ``-1``.
+
+    Args:
+        y_true: The ground truth target values.
+        y_pred: The predicted values.
+        prefix: The key prefix in the returned dictionary.
+        suffix: The key suffix in the returned dictionary.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+        prepared: Optional inputs prepared with ``prepare_inputs``
+            on the same ``y_true`` and ``y_pred``. If given, the
+            inputs are not preprocessed again.
+
+    Returns:
+        The computed metrics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric import regression_metrics
+    >>> regression_metrics(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([2, 2, 3, 4, 1]))
+    {'count': 5,
+     'max_error': 4.0,
+     'mean_absolute_error': 1.0,
+     'mean_absolute_percentage_error': 0.36,
+     'mean_squared_error': 3.4,
+     'mean_squared_log_error': 0.274...,
+     'median_absolute_error': 0.0,
+     'r2_score': -0.7,
+     'root_mean_squared_error': 1.843...}
+
+    ```
+    """
+    if prepared is None:
+        prepared = prepare_inputs(y_true, y_pred, nan_policy=nan_policy)
+    if prepared.is_valid:
+        metrics = regression_metrics_native(y_true=prepared.y_true, y_pred=prepared.y_pred)
+    else:
+        metrics = dict.fromkeys(_METRIC_NAMES, float("nan"))
+    metrics["count"] = prepared.count
+    return {f"{prefix}{key}{suffix}": value for key, value in sorted(metrics.items())}
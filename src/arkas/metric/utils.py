@@ -3,6 +3,8 @@ r"""Contain utility functions to compute metrics."""
 from __future__ import annotations
 
 __all__ = [
+    "PreparedInputs",
+    "arrays_are_equal",
     "check_array_ndim",
     "check_label_type",
     "check_nan_policy",
@@ -11,22 +13,81 @@ __all__ = [
     "check_same_shape_pred",
     "check_same_shape_score",
     "contains_nan",
+    "is_sparse",
     "multi_isnan",
+    "prepare_inputs",
     "preprocess_pred",
     "preprocess_pred_multilabel",
     "preprocess_same_shape_arrays",
     "preprocess_score_binary",
     "preprocess_score_multiclass",
     "preprocess_score_multilabel",
+    "preprocess_sparse_multilabel",
+    "safe_divide",
 ]
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
+from coola import objects_are_equal
+from coola.utils.format import repr_mapping_line
+
+from arkas.utils.imports import is_scipy_available
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
 
+if is_scipy_available():
+    from scipy import sparse
+
+
+def arrays_are_equal(actual: Any, expected: Any, equal_nan: bool = False) -> bool:
+    r"""Indicate if two arrays are equal.
+
+    Unlike ``coola.objects_are_equal``, this function supports
+    ``scipy.sparse`` arrays. A sparse array is only equal to a sparse
+    array with the same shape and the same values, and the explicit
+    zeros are ignored.
+
+    Args:
+        actual: The actual array.
+        expected: The expected array.
+        equal_nan: If ``True``, then two ``NaN``s will be considered
+            as equal.
+
+    Returns:
+        ``True`` if the two arrays are equal, otherwise ``False``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from scipy import sparse
+    >>> from arkas.metric.utils import arrays_are_equal
+    >>> arrays_are_equal(np.array([1, 0, 1]), np.array([1, 0, 1]))
+    True
+    >>> arrays_are_equal(
+    ...     sparse.csr_array(np.array([[1, 0], [0, 1]])), sparse.csr_array(np.eye(2, dtype=int))
+    ... )
+    True
+
+    ```
+    """
+    if not is_sparse(actual) and not is_sparse(expected):
+        return objects_are_equal(actual, expected, equal_nan=equal_nan)
+    if not (is_sparse(actual) and is_sparse(expected)) or actual.shape != expected.shape:
+        return False
+    actual, expected = _canonical_csr(actual).copy(), _canonical_csr(expected).copy()
+    actual.eliminate_zeros()
+    expected.eliminate_zeros()
+    # The index dtype depends on how the array was built, so only the values are compared.
+    return (
+        np.array_equal(actual.indptr, expected.indptr)
+        and np.array_equal(actual.indices, expected.indices)
+        and objects_are_equal(actual.data, expected.data, equal_nan=equal_nan)
+    )
+
 
 def check_array_ndim(arr: np.ndarray, ndim: int) -> None:
     r"""Check if the number of array dimensions is matching the target
@@ -241,6 +302,9 @@ def contains_nan(arr: np.ndarray, nan_policy: str = "propagate", name: str = "in
             ``nan_policy`` is ``'raise'``.
     """
     check_nan_policy(nan_policy)
+    if is_sparse(arr):
+        # Only the explicitly stored values can be NaN.
+        arr = arr.data
     isnan = np.any(np.isnan(arr))
     if isnan and nan_policy == "raise":
         msg = f"{name} contains at least one NaN value"
@@ -248,6 +312,34 @@ def contains_nan(arr: np.ndarray, nan_policy: str = "propagate", name: str = "in
     return isnan
 
 
+def is_sparse(arr: Any) -> bool:
+    r"""Indicate if the input is a ``scipy.sparse`` array or matrix.
+
+    Args:
+        arr: The input to check.
+
+    Returns:
+        ``True`` if the input is a ``scipy.sparse`` array or matrix,
+            otherwise ``False``. It is always ``False`` if ``scipy``
+            is not installed.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from scipy import sparse
+    >>> from arkas.metric.utils import is_sparse
+    >>> is_sparse(np.eye(3))
+    False
+    >>> is_sparse(sparse.csr_array(np.eye(3)))
+    True
+
+    ```
+    """
+    return is_scipy_available() and sparse.issparse(arr)
+
+
 def multi_isnan(arrays: Sequence[np.ndarray]) -> np.ndarray:
     r"""Test element-wise for NaN for all input arrays and return result
     as a boolean array.
@@ -283,6 +375,236 @@ def multi_isnan(arrays: Sequence[np.ndarray]) -> np.ndarray:
     return mask
 
 
+def prepare_inputs(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    nan_policy: str = "propagate",
+    multilabel: bool = False,
+    pred_name: str = "y_pred",
+    trusted: bool = False,
+) -> PreparedInputs:
+    r"""Prepare ``y_true`` and ``y_pred`` arrays to compute metrics.
+
+    This function fuses the shape check, the NaN detection, the NaN
+    removal, and the NaN policy check that are usually done with a
+    ``preprocess_*`` function followed by two ``contains_nan`` calls.
+    Each array is scanned only once to find the NaN values, and the
+    arrays with a dtype that cannot represent NaN are not scanned.
+    The returned object can be shared by several metrics computed on
+    the same arrays.
+
+    Args:
+        y_true: The ground truth target values.
+        y_pred: The predicted values or scores.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+        multilabel: If ``True``, the inputs are preprocessed like in
+            ``preprocess_pred_multilabel``, i.e. the 1d arrays are
+            converted to 2d arrays and the rows with at least one NaN
+            value are removed. The inputs can be ``scipy.sparse``
+            arrays. If ``False``, the inputs are flattened.
+        pred_name: The name of the ``y_pred`` input used in the error
+            messages.
+        trusted: If ``True``, the inputs are assumed to be valid
+            and without NaN, so the shape check and the NaN
+            detection are skipped. It should only be used when the
+            caller has already validated the inputs.
+
+    Returns:
+        The prepared inputs.
+
+    Raises:
+        RuntimeError: ``'y_true'`` and ``'y_pred'`` have different
+            shapes.
+        ValueError: if one of the arrays contains a NaN value and
+            ``nan_policy='raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.utils import prepare_inputs
+    >>> prepared = prepare_inputs(
+    ...     y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+    ...     y_pred=np.array([0, 1, 0, 1, float("nan"), 1]),
+    ... )
+    >>> prepared
+    PreparedInputs(y_true=(6,), y_pred=(6,), nan_policy='propagate', y_true_nan=True, y_pred_nan=True)
+    >>> prepared.is_valid
+    False
+    >>> prepared = prepare_inputs(
+    ...     y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+    ...     y_pred=np.array([0, 1, 0, 1, float("nan"), 1]),
+    ...     nan_policy="omit",
+    ... )
+    >>> prepared.y_true, prepared.y_pred
+    (array([1., 0., 0., 1.]), array([0., 1., 0., 1.]))
+    >>> prepared.labels
+    array([0., 1.])
+
+    ```
+    """
+    check_nan_policy(nan_policy)
+    if multilabel and (is_sparse(y_true) or is_sparse(y_pred)):
+        return _prepare_sparse_inputs(
+            y_true, y_pred, nan_policy=nan_policy, pred_name=pred_name, trusted=trusted
+        )
+
+    if not multilabel:
+        y_true, y_pred = y_true.ravel(), y_pred.ravel()
+    elif y_true.size == 0 and y_pred.size == 0:
+        y_true, y_pred = np.array([]), np.array([])
+    else:
+        y_true = y_true.reshape((-1, 1)) if y_true.ndim == 1 else y_true
+        y_pred = y_pred.reshape((-1, 1)) if y_pred.ndim == 1 else y_pred
+        if not trusted and y_true.ndim != 2:
+            msg = (
+                f"'y_true' must be a 1d or 2d array but received an array of shape: "
+                f"{y_true.shape}"
+            )
+            raise RuntimeError(msg)
+    if trusted:
+        return PreparedInputs(y_true, y_pred, nan_policy=nan_policy)
+
+    if y_true.shape != y_pred.shape:
+        msg = f"'y_true' and '{pred_name}' have different shapes: {y_true.shape} vs {y_pred.shape}"
+        raise RuntimeError(msg)
+    return _prepare_dense_nan(
+        y_true, y_pred, nan_policy=nan_policy, multilabel=multilabel, pred_name=pred_name
+    )
+
+
+class PreparedInputs:
+    r"""Implement a container for the ``y_true`` and ``y_pred`` arrays
+    prepared to compute metrics.
+
+    The object is usually created with ``prepare_inputs``. The NaN
+    values are already handled with the NaN policy, so the metrics can
+    directly use the arrays if ``is_valid`` is ``True``. The labels
+    are computed the first time they are requested and then cached.
+
+    Args:
+        y_true: The prepared ground truth target values.
+        y_pred: The prepared predicted values or scores.
+        nan_policy: The policy used to handle the NaN values.
+        y_true_nan: ``True`` if ``y_true`` contains at least one NaN
+            value after the preparation.
+        y_pred_nan: ``True`` if ``y_pred`` contains at least one NaN
+            value after the preparation.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.utils import PreparedInputs
+    >>> prepared = PreparedInputs(y_true=np.array([1, 0, 0, 1]), y_pred=np.array([0, 1, 0, 1]))
+    >>> prepared
+    PreparedInputs(y_true=(4,), y_pred=(4,), nan_policy='propagate', y_true_nan=False, y_pred_nan=False)
+    >>> prepared.count
+    4
+    >>> prepared.is_integer
+    True
+
+    ```
+    """
+
+    def __init__(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        *,
+        nan_policy: str = "propagate",
+        y_true_nan: bool = False,
+        y_pred_nan: bool = False,
+    ) -> None:
+        self._y_true = y_true
+        self._y_pred = y_pred
+        self._nan_policy = nan_policy
+        self._y_true_nan = bool(y_true_nan)
+        self._y_pred_nan = bool(y_pred_nan)
+        self._labels = None
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "y_true": self._y_true.shape,
+                "y_pred": self._y_pred.shape,
+                "nan_policy": self._nan_policy,
+                "y_true_nan": self._y_true_nan,
+                "y_pred_nan": self._y_pred_nan,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def count(self) -> int:
+        r"""The number of samples."""
+        return self._y_true.shape[0]
+
+    @property
+    def dtype(self) -> np.dtype:
+        r"""The dtype that can represent the values of both arrays."""
+        return np.result_type(self._y_true.dtype, self._y_pred.dtype)
+
+    @property
+    def has_nan(self) -> bool:
+        r"""``True`` if one of the arrays contains a NaN value,
+        otherwise ``False``."""
+        return self._y_true_nan or self._y_pred_nan
+
+    @property
+    def is_integer(self) -> bool:
+        r"""``True`` if both arrays have an integer or boolean dtype,
+        otherwise ``False``."""
+        return np.issubdtype(self.dtype, np.integer) or self.dtype == np.bool_
+
+    @property
+    def is_valid(self) -> bool:
+        r"""``True`` if the metrics can be computed, i.e. there is at
+        least one sample and no NaN value, otherwise ``False``."""
+        return self.count > 0 and not self.has_nan
+
+    @property
+    def labels(self) -> np.ndarray:
+        r"""The sorted unique values of both arrays.
+
+        For ``scipy.sparse`` arrays, ``0`` is included if at least one
+        value is not stored.
+        """
+        if self._labels is None:
+            values = [self._y_true, self._y_pred]
+            if is_sparse(self._y_true):
+                values = [arr.data for arr in values] + [
+                    np.zeros(int(arr.nnz < np.prod(arr.shape)), dtype=arr.dtype) for arr in values
+                ]
+            self._labels = np.unique(np.concatenate([arr.ravel() for arr in values]))
+        return self._labels
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    @property
+    def y_true(self) -> np.ndarray:
+        return self._y_true
+
+    @property
+    def y_true_nan(self) -> bool:
+        return self._y_true_nan
+
+    @property
+    def y_pred(self) -> np.ndarray:
+        return self._y_pred
+
+    @property
+    def y_pred_nan(self) -> bool:
+        return self._y_pred_nan
+
+
 def preprocess_pred(
     y_true: np.ndarray, y_pred: np.ndarray, drop_nan: bool = False
 ) -> tuple[np.ndarray, np.ndarray]:
@@ -374,6 +696,8 @@ def preprocess_pred_multilabel(
 
     ```
     """
+    if is_sparse(y_true) or is_sparse(y_pred):
+        return preprocess_sparse_multilabel(y_true, y_pred, drop_nan=drop_nan)
     if y_true.size == 0 and y_pred.size == 0:
         return np.array([]), np.array([])
 
@@ -611,6 +935,8 @@ def preprocess_score_multilabel(
 
     ```
     """
+    if is_sparse(y_true) or is_sparse(y_score):
+        return preprocess_sparse_multilabel(y_true, y_score, drop_nan=drop_nan)
     if y_true.size == 0 and y_score.size == 0:
         return np.array([]), np.array([])
 
@@ -631,3 +957,227 @@ def preprocess_score_multilabel(
         np.logical_or(np.isnan(y_true).any(axis=1), np.isnan(y_score).any(axis=1))
     )
     return y_true[mask], y_score[mask]
+
+
+def preprocess_sparse_multilabel(
+    y_true: Any, y_pred: Any, drop_nan: bool = False
+) -> tuple[sparse.csr_array, sparse.csr_array]:
+    r"""Preprocess ``y_true`` and ``y_pred`` arrays for the multilabel
+    classification case when at least one of them is a
+    ``scipy.sparse`` array.
+
+    Both inputs are converted to CSR arrays in canonical format, so
+    the per-class counts can be computed from the explicitly stored
+    values only. The values that are not stored are zeros.
+
+    Args:
+        y_true: The ground truth target labels. This input must be a
+            sparse or dense array of shape ``(n_samples, n_classes)``.
+        y_pred: The predicted labels or the target scores. This input
+            must be a sparse or dense array of shape
+            ``(n_samples, n_classes)``.
+        drop_nan: If ``True``, the rows with at least one NaN value
+            are removed, otherwise they are kept.
+
+    Returns:
+        A tuple with the preprocessed ``y_true`` and ``y_pred`` CSR
+            arrays.
+
+    Raises:
+        RuntimeError: ``'y_true'`` and ``'y_pred'`` have different
+            shapes.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from scipy import sparse
+    >>> from arkas.metric.utils import preprocess_sparse_multilabel
+    >>> y_true = sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 0, 1]]))
+    >>> y_pred = sparse.csr_array(np.array([[1, 0, 0], [0, float("nan"), 0], [0, 0, 1]]))
+    >>> y_true, y_pred = preprocess_sparse_multilabel(y_true, y_pred, drop_nan=True)
+    >>> y_true.toarray()
+    array([[1, 0, 1],
+           [0, 0, 1]])
+    >>> y_pred.toarray()
+    array([[1., 0., 0.],
+           [0., 0., 1.]])
+
+    ```
+    """
+    if not is_sparse(y_true) and y_true.ndim == 1:
+        y_true = y_true.reshape((-1, 1))
+    if not is_sparse(y_pred) and y_pred.ndim == 1:
+        y_pred = y_pred.reshape((-1, 1))
+    y_true, y_pred = _canonical_csr(y_true), _canonical_csr(y_pred)
+    check_same_shape_pred(y_true, y_pred)
+    if not drop_nan:
+        return y_true, y_pred
+
+    nan_rows = np.concatenate(
+        [_sparse_rows(y_true)[np.isnan(y_true.data)], _sparse_rows(y_pred)[np.isnan(y_pred.data)]]
+    )
+    if nan_rows.size == 0:
+        return y_true, y_pred
+    keep = np.ones(y_true.shape[0], dtype=bool)
+    keep[nan_rows] = False
+    rows = np.flatnonzero(keep)
+    return y_true[rows], y_pred[rows]
+
+
+def safe_divide(
+    numerator: np.ndarray | float, denominator: np.ndarray | float, default: float = 0.0
+) -> np.ndarray:
+    r"""Divide two arrays element-wise and return a default value where
+    the denominator is zero.
+
+    The inputs are broadcast together, and no division by zero
+    warning is raised.
+
+    Args:
+        numerator: The numerator values.
+        denominator: The denominator values.
+        default: The value used when the denominator is zero.
+
+    Returns:
+        The element-wise division as a ``float`` array.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.metric.utils import safe_divide
+    >>> safe_divide(np.array([1, 2, 3]), np.array([2, 0, 4]))
+    array([0.5 , 0.  , 0.75])
+    >>> safe_divide(np.array([1, 2, 3]), np.array([2, 0, 4]), default=float("nan"))
+    array([0.5 ,  nan, 0.75])
+
+    ```
+    """
+    numerator, denominator = np.broadcast_arrays(numerator, denominator)
+    out = np.full(numerator.shape, default, dtype=float)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def _canonical_csr(arr: Any) -> sparse.csr_array:
+    r"""Convert an array to a CSR array in canonical format.
+
+    Args:
+        arr: The sparse or dense array to convert.
+
+    Returns:
+        The CSR array with sorted indices and without duplicates.
+    """
+    out = sparse.csr_array(arr)
+    if not out.has_canonical_format:
+        out = out.copy()
+        out.sum_duplicates()
+    return out
+
+
+def _sparse_rows(arr: sparse.csr_array) -> np.ndarray:
+    r"""Return the row index of each stored value of a CSR array.
+
+    Args:
+        arr: The CSR array.
+
+    Returns:
+        The row indices as an array of shape ``(nnz,)``.
+    """
+    return np.repeat(np.arange(arr.shape[0]), np.diff(arr.indptr))
+
+
+def _isnan_or_none(arr: np.ndarray) -> np.ndarray | None:
+    r"""Test element-wise for NaN.
+
+    Args:
+        arr: The input array.
+
+    Returns:
+        A boolean array with ``True`` where the input is NaN, or
+            ``None`` if the array dtype cannot represent NaN.
+    """
+    if np.issubdtype(arr.dtype, np.integer) or arr.dtype == np.bool_:
+        return None
+    return np.isnan(arr)
+
+
+def _prepare_dense_nan(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    nan_policy: str,
+    multilabel: bool,
+    pred_name: str,
+) -> PreparedInputs:
+    r"""Find the NaN values of dense arrays and handle them with the NaN
+    policy.
+
+    Args:
+        y_true: The ground truth target values.
+        y_pred: The predicted values or scores, with the same shape
+            as ``y_true``.
+        nan_policy: The policy on how to handle NaN values.
+        multilabel: If ``True``, the rows with at least one NaN value
+            are removed with ``nan_policy='omit'``.
+        pred_name: The name of the ``y_pred`` input used in the error
+            messages.
+
+    Returns:
+        The prepared inputs.
+    """
+    true_isnan, pred_isnan = _isnan_or_none(y_true), _isnan_or_none(y_pred)
+    y_true_nan = true_isnan is not None and bool(true_isnan.any())
+    y_pred_nan = pred_isnan is not None and bool(pred_isnan.any())
+    if nan_policy == "raise":
+        for name, isnan in [("'y_true'", y_true_nan), (f"'{pred_name}'", y_pred_nan)]:
+            if isnan:
+                msg = f"{name} contains at least one NaN value"
+                raise ValueError(msg)
+    if nan_policy == "omit" and (y_true_nan or y_pred_nan):
+        mask = np.zeros(y_true.shape, dtype=bool)
+        for isnan in [true_isnan, pred_isnan]:
+            if isnan is not None:
+                mask |= isnan
+        if multilabel:
+            mask = mask.any(axis=1)
+        keep = np.logical_not(mask)
+        y_true, y_pred = y_true[keep], y_pred[keep]
+        y_true_nan = y_pred_nan = False
+    return PreparedInputs(
+        y_true, y_pred, nan_policy=nan_policy, y_true_nan=y_true_nan, y_pred_nan=y_pred_nan
+    )
+
+
+def _prepare_sparse_inputs(
+    y_true: Any, y_pred: Any, *, nan_policy: str, pred_name: str, trusted: bool
+) -> PreparedInputs:
+    r"""Prepare multilabel inputs when at least one of them is a
+    ``scipy.sparse`` array.
+
+    Args:
+        y_true: The ground truth target labels.
+        y_pred: The predicted labels or the target scores.
+        nan_policy: The policy on how to handle NaN values.
+        pred_name: The name of the ``y_pred`` input used in the error
+            messages.
+        trusted: If ``True``, the NaN detection is skipped.
+
+    Returns:
+        The prepared inputs with CSR arrays.
+    """
+    y_true, y_pred = preprocess_sparse_multilabel(
+        y_true, y_pred, drop_nan=nan_policy == "omit" and not trusted
+    )
+    if trusted:
+        return PreparedInputs(y_true, y_pred, nan_policy=nan_policy)
+    return PreparedInputs(
+        y_true,
+        y_pred,
+        nan_policy=nan_policy,
+        y_true_nan=contains_nan(y_true, nan_policy=nan_policy, name="'y_true'"),
+        y_pred_nan=contains_nan(y_pred, nan_policy=nan_policy, name=f"'{pred_name}'"),
+    )
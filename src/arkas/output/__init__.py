@@ -7,6 +7,7 @@ __all__ = [
     "BalancedAccuracyOutput",
     "BaseLazyOutput",
     "BaseOutput",
+    "BinnedResidualOutput",
     "ColumnCooccurrenceOutput",
     "ColumnCorrelationOutput",
     "ContentOutput",
@@ -29,6 +30,7 @@ __all__ = [
 from arkas.output.accuracy import AccuracyOutput
 from arkas.output.balanced_accuracy import BalancedAccuracyOutput
 from arkas.output.base import BaseOutput
+from arkas.output.binned_residual import BinnedResidualOutput
 from arkas.output.column_cooccurrence import ColumnCooccurrenceOutput
 from arkas.output.column_correlation import ColumnCorrelationOutput
 from arkas.output.content import ContentOutput
@@ -0,0 +1,72 @@
+r"""Implement an output to analyze the residuals of a regression model
+binned by predicted value."""
+
+from __future__ import annotations
+
+__all__ = ["BinnedResidualOutput"]
+
+
+from arkas.content.binned_residual import BinnedResidualContentGenerator
+from arkas.evaluator2.binned_residual import BinnedResidualEvaluator
+from arkas.output.state import BaseStateOutput
+from arkas.plotter.binned_residual import BinnedResidualPlotter
+from arkas.state.binned_residual import BinnedResidualState
+
+
+class BinnedResidualOutput(BaseStateOutput[BinnedResidualState]):
+    r"""Implement an output to analyze the residuals of a regression
+    model binned by predicted value.
+
+    Args:
+        state: The state containing the ground truth and predicted
+            values.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.output import BinnedResidualOutput
+    >>> from arkas.state import BinnedResidualState
+    >>> output = BinnedResidualOutput(
+    ...     BinnedResidualState(
+    ...         y_true=np.array([1, 2, 3, 4, 5, 6]),
+    ...         y_pred=np.array([2, 2, 3, 3, 6, 8]),
+    ...         y_true_name="target",
+    ...         y_pred_name="pred",
+    ...         bins=3,
+    ...     )
+    ... )
+    >>> output
+    BinnedResidualOutput(
+      (state): BinnedResidualState(y_true=(6,), y_pred=(6,), y_true_name='target', y_pred_name='pred', bins=3, strategy='quantile', nan_policy='propagate', figure_config=MatplotlibFigureConfig())
+    )
+    >>> output.get_content_generator()
+    BinnedResidualContentGenerator(
+      (evaluator): BinnedResidualEvaluator(
+          (state): BinnedResidualState(y_true=(6,), y_pred=(6,), y_true_name='target', y_pred_name='pred', bins=3, strategy='quantile', nan_policy='propagate', figure_config=MatplotlibFigureConfig())
+        )
+      (plotter): BinnedResidualPlotter(
+          (state): BinnedResidualState(y_true=(6,), y_pred=(6,), y_true_name='target', y_pred_name='pred', bins=3, strategy='quantile', nan_policy='propagate', figure_config=MatplotlibFigureConfig())
+        )
+    )
+    >>> output.get_evaluator()
+    BinnedResidualEvaluator(
+      (state): BinnedResidualState(y_true=(6,), y_pred=(6,), y_true_name='target', y_pred_name='pred', bins=3, strategy='quantile', nan_policy='propagate', figure_config=MatplotlibFigureConfig())
+    )
+
+    ```
+    """
+
+    def __init__(self, state: BinnedResidualState) -> None:
+        super().__init__(state)
+        self._evaluator = BinnedResidualEvaluator(self._state)
+        self._content = BinnedResidualContentGenerator(
+            evaluator=self._evaluator, plotter=BinnedResidualPlotter(self._state)
+        )
+
+    def _get_content_generator(self) -> BinnedResidualContentGenerator:
+        return self._content
+
+    def _get_evaluator(self) -> BinnedResidualEvaluator:
+        return self._evaluator
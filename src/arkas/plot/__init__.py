@@ -11,6 +11,7 @@ __all__ = [
     "boxplot_continuous_temporal",
     "hist_continuous",
     "hist_continuous2",
+    "plot_binned_residuals",
     "plot_cdf",
     "plot_null_temporal",
 ]
@@ -25,4 +26,5 @@ from arkas.plot.continuous import (
 from arkas.plot.discrete import bar_discrete, bar_discrete_temporal
 from arkas.plot.null_temporal import plot_null_temporal
 from arkas.plot.pr import binary_precision_recall_curve
+from arkas.plot.residual import plot_binned_residuals
 from arkas.plot.roc import binary_roc_curve
@@ -8,18 +8,35 @@ from typing import TYPE_CHECKING, Any
 
 from sklearn.metrics import PrecisionRecallDisplay
 
+from arkas.metric.classification.score_ranking import BinaryScoreRanking
 from arkas.metric.utils import preprocess_pred
 
 if TYPE_CHECKING:
     import numpy as np
     from matplotlib.axes import Axes
 
+# The keyword arguments that are only accepted by
+# ``PrecisionRecallDisplay.from_predictions``.
+_FROM_PREDICTIONS_KWARGS = {"drop_intermediate", "pos_label", "sample_weight"}
+
 
 def binary_precision_recall_curve(
-    ax: Axes, y_true: np.ndarray, y_pred: np.ndarray, **kwargs: Any
+    ax: Axes,
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    ranking: BinaryScoreRanking | None = None,
+    **kwargs: Any,
 ) -> None:
     r"""Plot the precision-recall curve for binary labels.
 
+    By default, the curve is computed with a ``BinaryScoreRanking``
+    engine and the keyword arguments are passed to
+    ``PrecisionRecallDisplay.plot``. If ``pos_label``,
+    ``sample_weight``, or ``drop_intermediate`` is given, the curve is
+    computed by ``PrecisionRecallDisplay.from_predictions`` instead,
+    which receives all the keyword arguments.
+
     Args:
         ax: The axes of the matplotlib figure to update.
         y_true: The ground truth target labels. This input must
@@ -27,8 +44,19 @@ def binary_precision_recall_curve(
             ``1`` values.
         y_pred: The predicted labels. This input must be an array of
             shape ``(n_samples,)`` with ``0`` and ``1`` values.
+        ranking: An optional ranking engine built on ``y_true`` and
+            ``y_pred``. It can be shared with the results to avoid
+            sorting the predictions again. If ``None``, a new ranking
+            engine is created and the NaN values are omitted.
         **kwargs: Arbitrary keyword arguments that are passed to
-            ``PrecisionRecallDisplay.from_predictions``.
+            ``PrecisionRecallDisplay.plot``, or to
+            ``PrecisionRecallDisplay.from_predictions`` if they
+            contain ``pos_label``, ``sample_weight``, or
+            ``drop_intermediate``.
+
+    Raises:
+        ValueError: if ``ranking`` is given with ``pos_label``,
+            ``sample_weight``, or ``drop_intermediate``.
 
     Example usage:
 
@@ -44,5 +72,25 @@ def binary_precision_recall_curve(
 
     ```
     """
-    y_true, y_pred = preprocess_pred(y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=True)
-    PrecisionRecallDisplay.from_predictions(y_true=y_true, y_pred=y_pred, ax=ax, **kwargs)
+    if _FROM_PREDICTIONS_KWARGS.intersection(kwargs):
+        if ranking is not None:
+            msg = (
+                "'ranking' cannot be used with the keyword arguments "
+                f"{sorted(_FROM_PREDICTIONS_KWARGS.intersection(kwargs))}"
+            )
+            raise ValueError(msg)
+        y_true, y_pred = preprocess_pred(
+            y_true=y_true.ravel(), y_pred=y_pred.ravel(), drop_nan=True
+        )
+        PrecisionRecallDisplay.from_predictions(y_true=y_true, y_pred=y_pred, ax=ax, **kwargs)
+        return
+    if ranking is None:
+        ranking = BinaryScoreRanking(y_true=y_true, y_score=y_pred, nan_policy="omit")
+    precision, recall, _ = ranking.precision_recall_curve()
+    tps, _, _ = ranking.cumulative_counts()
+    PrecisionRecallDisplay(
+        precision=precision,
+        recall=recall,
+        average_precision=ranking.average_precision(),
+        prevalence_pos_label=tps[-1] / ranking.count if tps.size else None,
+    ).plot(ax=ax, **kwargs)
@@ -0,0 +1,90 @@
+r"""Contain functionalities to plot the binned profile of the residuals
+of a regression model."""
+
+from __future__ import annotations
+
+__all__ = ["plot_binned_residuals"]
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from arkas.metric.regression.residual import binned_residuals
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from matplotlib.axes import Axes
+
+
+def plot_binned_residuals(
+    ax: Axes,
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    *,
+    bins: int | Sequence[float] | np.ndarray = 10,
+    strategy: str = "quantile",
+    profile: dict[str, Any] | None = None,
+) -> None:
+    r"""Plot the bias, mean absolute error, and root mean squared error
+    of the residuals binned by predicted value.
+
+    The statistics are plotted at the center of each non-empty bin,
+    and the number of samples of each bin is shown with bars on a
+    secondary y-axis.
+
+    Args:
+        ax: The axes of the matplotlib figure to update.
+        y_true: The ground truth target values.
+        y_pred: The predicted values.
+        bins: The number of bins, or the monotonically increasing bin
+            edges.
+        strategy: The strategy to find the bin edges if ``bins`` is
+            the number of bins. The following options are available:
+            ``'quantile'`` and ``'uniform'``.
+        profile: An optional profile computed by ``binned_residuals``
+            on ``y_true`` and ``y_pred``. It can be shared with the
+            evaluators to avoid binning the residuals again. If
+            ``None``, a new profile is computed and the NaN values are
+            omitted.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from matplotlib import pyplot as plt
+    >>> from arkas.plot import plot_binned_residuals
+    >>> fig, ax = plt.subplots()
+    >>> plot_binned_residuals(
+    ...     ax, y_true=np.array([1, 2, 3, 4, 5, 6]), y_pred=np.array([2, 2, 3, 3, 6, 8]), bins=3
+    ... )
+
+    ```
+    """
+    if profile is None:
+        profile = binned_residuals(
+            y_true=y_true, y_pred=y_pred, bins=bins, strategy=strategy, nan_policy="omit"
+        )
+    edges, counts = profile["bin_edges"], profile["bin_count"]
+    nonempty = counts > 0
+    if not nonempty.any():
+        return
+
+    centers = (edges[:-1] + edges[1:]) * 0.5
+    ax.axhline(0.0, color="black", linestyle="--", linewidth=1)
+    ax.plot(centers[nonempty], profile["bin_bias"][nonempty], "o-", label="bias")
+    ax.plot(centers[nonempty], profile["bin_mae"][nonempty], "s-", label="MAE")
+    ax.plot(centers[nonempty], profile["bin_rmse"][nonempty], "^-", label="RMSE")
+    ax.set_xlabel("predicted value")
+    ax.set_ylabel("residual (y_pred - y_true)")
+    ax.legend()
+
+    ax2 = ax.twinx()
+    color = "tab:gray"
+    ax2.bar(centers, counts, width=np.diff(edges), color=color, alpha=0.2, edgecolor="white")
+    ax2.set_ylabel("number of samples", color=color)
+    ax2.tick_params(axis="y", labelcolor=color)
+    # The statistics are drawn above the bars of the secondary y-axis.
+    ax.set_zorder(ax2.get_zorder() + 1)
+    ax.patch.set_visible(False)
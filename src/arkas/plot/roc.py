@@ -9,17 +9,36 @@ from typing import TYPE_CHECKING, Any
 
 from sklearn.metrics import RocCurveDisplay
 
+from arkas.metric.classification.score_ranking import BinaryScoreRanking
 from arkas.metric.utils import preprocess_score_binary
 
 if TYPE_CHECKING:
     import numpy as np
     from matplotlib.axes import Axes
 
+# The keyword arguments that are only accepted by
+# ``RocCurveDisplay.from_predictions``.
+_FROM_PREDICTIONS_KWARGS = {"drop_intermediate", "pos_label", "sample_weight"}
 
-def binary_roc_curve(ax: Axes, y_true: np.ndarray, y_score: np.ndarray, **kwargs: Any) -> None:
+
+def binary_roc_curve(
+    ax: Axes,
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    *,
+    ranking: BinaryScoreRanking | None = None,
+    **kwargs: Any,
+) -> None:
     r"""Plot the Receiver Operating Characteristic Curve (ROC) for binary
     labels.
 
+    By default, the curve is computed with a ``BinaryScoreRanking``
+    engine and the keyword arguments are passed to
+    ``RocCurveDisplay.plot``. If ``pos_label``, ``sample_weight``, or
+    ``drop_intermediate`` is given, the curve is computed by
+    ``RocCurveDisplay.from_predictions`` instead, which receives all
+    the keyword arguments.
+
     Args:
         ax: The axes of the matplotlib figure to update.
         y_true: The ground truth target labels. This input must
@@ -28,8 +47,18 @@ def binary_roc_curve(ax: Axes, y_true: np.ndarray, y_score: np.ndarray, **kwargs
             estimates of the positive class, confidence values,
             or non-thresholded measure of decisions. This input must
             be an array of shape ``(n_samples,)``.
+        ranking: An optional ranking engine built on ``y_true`` and
+            ``y_score``. It can be shared with the results to avoid
+            sorting the scores again. If ``None``, a new ranking
+            engine is created and the NaN values are omitted.
         **kwargs: Arbitrary keyword arguments that are passed to
-            ``RocCurveDisplay.from_predictions``.
+            ``RocCurveDisplay.plot``, or to
+            ``RocCurveDisplay.from_predictions`` if they contain
+            ``pos_label``, ``sample_weight``, or ``drop_intermediate``.
+
+    Raises:
+        ValueError: if ``ranking`` is given with ``pos_label``,
+            ``sample_weight``, or ``drop_intermediate``.
 
     Example usage:
 
@@ -45,7 +74,19 @@ def binary_roc_curve(ax: Axes, y_true: np.ndarray, y_score: np.ndarray, **kwargs
 
     ```
     """
-    y_true, y_score = preprocess_score_binary(
-        y_true=y_true.ravel(), y_score=y_score.ravel(), drop_nan=True
-    )
-    RocCurveDisplay.from_predictions(y_true=y_true, y_pred=y_score, ax=ax, **kwargs)
+    if _FROM_PREDICTIONS_KWARGS.intersection(kwargs):
+        if ranking is not None:
+            msg = (
+                "'ranking' cannot be used with the keyword arguments "
+                f"{sorted(_FROM_PREDICTIONS_KWARGS.intersection(kwargs))}"
+            )
+            raise ValueError(msg)
+        y_true, y_score = preprocess_score_binary(
+            y_true=y_true.ravel(), y_score=y_score.ravel(), drop_nan=True
+        )
+        RocCurveDisplay.from_predictions(y_true=y_true, y_pred=y_score, ax=ax, **kwargs)
+        return
+    if ranking is None:
+        ranking = BinaryScoreRanking(y_true=y_true, y_score=y_score, nan_policy="omit")
+    fpr, tpr, _ = ranking.roc_curve()
+    RocCurveDisplay(fpr=fpr, tpr=tpr, roc_auc=ranking.roc_auc()).plot(ax=ax, **kwargs)
@@ -6,6 +6,7 @@ __all__ = [
     "BaseCachedPlotter",
     "BasePlotter",
     "BaseStateCachedPlotter",
+    "BinnedResidualPlotter",
     "ColumnCooccurrencePlotter",
     "ContinuousSeriesPlotter",
     "CorrelationPlotter",
@@ -20,6 +21,7 @@ __all__ = [
 ]
 
 from arkas.plotter.base import BasePlotter
+from arkas.plotter.binned_residual import BinnedResidualPlotter
 from arkas.plotter.caching import BaseCachedPlotter, BaseStateCachedPlotter
 from arkas.plotter.column_cooccurrence import ColumnCooccurrencePlotter
 from arkas.plotter.continuous_series import ContinuousSeriesPlotter
@@ -0,0 +1,148 @@
+r"""Contain the implementation of a plotter that shows the binned
+residuals of a regression model."""
+
+from __future__ import annotations
+
+__all__ = ["BaseFigureCreator", "BinnedResidualPlotter", "MatplotlibFigureCreator"]
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+import matplotlib.pyplot as plt
+
+from arkas.figure.creator import FigureCreatorRegistry
+from arkas.figure.html import HtmlFigure
+from arkas.figure.matplotlib import MatplotlibFigure, MatplotlibFigureConfig
+from arkas.figure.utils import MISSING_FIGURE_MESSAGE
+from arkas.metric import binned_residuals
+from arkas.plot import plot_binned_residuals
+from arkas.plotter.caching import BaseStateCachedPlotter
+from arkas.state.binned_residual import BinnedResidualState
+
+if TYPE_CHECKING:
+    from arkas.figure.base import BaseFigure
+
+
+class BaseFigureCreator(ABC):
+    r"""Define the base class to create a figure with the binned
+    residuals."""
+
+    @abstractmethod
+    def create(self, state: BinnedResidualState) -> BaseFigure:
+        r"""Create a figure with the binned residuals.
+
+        Args:
+            state: The state containing the ground truth and predicted
+                values.
+
+        Returns:
+            The generated figure.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.plotter.binned_residual import MatplotlibFigureCreator
+        >>> from arkas.state import BinnedResidualState
+        >>> creator = MatplotlibFigureCreator()
+        >>> fig = creator.create(
+        ...     BinnedResidualState(
+        ...         y_true=np.array([1, 2, 3, 4, 5, 6]),
+        ...         y_pred=np.array([2, 2, 3, 3, 6, 8]),
+        ...         y_true_name="target",
+        ...         y_pred_name="pred",
+        ...         bins=3,
+        ...     )
+        ... )
+
+        ```
+        """
+
+
+class MatplotlibFigureCreator(BaseFigureCreator):
+    r"""Create a matplotlib figure with the binned residuals.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.plotter.binned_residual import MatplotlibFigureCreator
+    >>> from arkas.state import BinnedResidualState
+    >>> creator = MatplotlibFigureCreator()
+    >>> fig = creator.create(
+    ...     BinnedResidualState(
+    ...         y_true=np.array([1, 2, 3, 4, 5, 6]),
+    ...         y_pred=np.array([2, 2, 3, 3, 6, 8]),
+    ...         y_true_name="target",
+    ...         y_pred_name="pred",
+    ...         bins=3,
+    ...     )
+    ... )
+
+    ```
+    """
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}()"
+
+    def create(self, state: BinnedResidualState) -> BaseFigure:
+        profile = binned_residuals(
+            y_true=state.y_true,
+            y_pred=state.y_pred,
+            bins=state.bins,
+            strategy=state.strategy,
+            nan_policy=state.nan_policy,
+        )
+        if not profile["bin_count"].any():
+            return HtmlFigure(MISSING_FIGURE_MESSAGE)
+
+        fig, ax = plt.subplots(**state.figure_config.get_arg("init", {}))
+        plot_binned_residuals(ax=ax, y_true=state.y_true, y_pred=state.y_pred, profile=profile)
+        ax.set_xlabel(state.y_pred_name)
+        ax.set_title(f"residuals of {state.y_pred_name!r} binned by predicted value")
+        if xscale := state.figure_config.get_arg("xscale"):
+            ax.set_xscale(xscale)
+        fig.tight_layout()
+        return MatplotlibFigure(fig)
+
+
+class BinnedResidualPlotter(BaseStateCachedPlotter[BinnedResidualState]):
+    r"""Implement a plotter that shows the bias, mean absolute error, and
+    root mean squared error of the residuals binned by predicted value.
+
+    Args:
+        state: The state containing the ground truth and predicted
+            values.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.plotter import BinnedResidualPlotter
+    >>> from arkas.state import BinnedResidualState
+    >>> plotter = BinnedResidualPlotter(
+    ...     BinnedResidualState(
+    ...         y_true=np.array([1, 2, 3, 4, 5, 6]),
+    ...         y_pred=np.array([2, 2, 3, 3, 6, 8]),
+    ...         y_true_name="target",
+    ...         y_pred_name="pred",
+    ...     )
+    ... )
+    >>> plotter
+    BinnedResidualPlotter(
+      (state): BinnedResidualState(y_true=(6,), y_pred=(6,), y_true_name='target', y_pred_name='pred', bins=10, strategy='quantile', nan_policy='propagate', figure_config=MatplotlibFigureConfig())
+    )
+
+    ```
+    """
+
+    registry = FigureCreatorRegistry[BaseFigureCreator](
+        {MatplotlibFigureConfig.backend(): MatplotlibFigureCreator()}
+    )
+
+    def _plot(self) -> dict:
+        figure = self.registry.find_creator(self._state.figure_config.backend()).create(self._state)
+        return {"binned_residual": figure}
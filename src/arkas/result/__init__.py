@@ -15,8 +15,10 @@ __all__ = [
     "BinaryPrecisionResult",
     "BinaryRecallResult",
     "BinaryRocAucResult",
+    "DeLongResult",
     "EmptyResult",
     "EnergyDistanceResult",
+    "GroupedMetricsResult",
     "JensenShannonDivergenceResult",
     "KLDivResult",
     "MappingResult",
@@ -40,11 +42,15 @@ __all__ = [
     "MultilabelPrecisionResult",
     "MultilabelRecallResult",
     "MultilabelRocAucResult",
+    "MultilabelThresholdCurvesResult",
+    "MultioutputRegressionResult",
     "PearsonCorrelationResult",
     "PrecisionResult",
+    "QueryRankingResult",
     "R2ScoreResult",
     "RecallResult",
     "RegressionErrorResult",
+    "RegressionMetricsResult",
     "Result",
     "RootMeanSquaredErrorResult",
     "SequentialResult",
@@ -67,12 +73,14 @@ from arkas.result.confmat import (
     MulticlassConfusionMatrixResult,
     MultilabelConfusionMatrixResult,
 )
+from arkas.result.delong import DeLongResult
 from arkas.result.energy import EnergyDistanceResult
 from arkas.result.fbeta import (
     BinaryFbetaScoreResult,
     MulticlassFbetaScoreResult,
     MultilabelFbetaScoreResult,
 )
+from arkas.result.grouped import GroupedMetricsResult
 from arkas.result.jaccard import (
     BinaryJaccardResult,
     MulticlassJaccardResult,
@@ -93,6 +101,7 @@ from arkas.result.precision import (
     MultilabelPrecisionResult,
     PrecisionResult,
 )
+from arkas.result.query_ranking import QueryRankingResult
 from arkas.result.r2 import R2ScoreResult
 from arkas.result.recall import (
     BinaryRecallResult,
@@ -100,7 +109,11 @@ from arkas.result.recall import (
     MultilabelRecallResult,
     RecallResult,
 )
-from arkas.result.regression import RegressionErrorResult
+from arkas.result.regression import (
+    MultioutputRegressionResult,
+    RegressionErrorResult,
+    RegressionMetricsResult,
+)
 from arkas.result.rmse import RootMeanSquaredErrorResult
 from arkas.result.roc_auc import (
     BinaryRocAucResult,
@@ -109,6 +122,7 @@ from arkas.result.roc_auc import (
 )
 from arkas.result.sequential import SequentialResult
 from arkas.result.spearman import SpearmanCorrelationResult
+from arkas.result.threshold_curves import MultilabelThresholdCurvesResult
 from arkas.result.tweedie_deviance import MeanTweedieDevianceResult
 from arkas.result.vanilla import EmptyResult, Result
 from arkas.result.wasserstein import WassersteinDistanceResult
@@ -13,7 +13,6 @@ __all__ = [
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
-from coola import objects_are_equal
 from coola.utils.format import repr_mapping_line
 
 from arkas.metric.classification.ap import (
@@ -23,7 +22,10 @@ from arkas.metric.classification.ap import (
     multiclass_average_precision,
     multilabel_average_precision,
 )
+from arkas.metric.classification.score_histogram import BinaryScoreHistogram
+from arkas.metric.classification.score_ranking import BinaryScoreRanking
 from arkas.metric.utils import (
+    arrays_are_equal,
     check_label_type,
     check_nan_policy,
     check_same_shape_score,
@@ -194,8 +196,8 @@ class AveragePrecisionResult(BaseResult):
         if not isinstance(other, self.__class__):
             return False
         return (
-            objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
-            and objects_are_equal(self.y_score, other.y_score, equal_nan=equal_nan)
+            arrays_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and arrays_are_equal(self.y_score, other.y_score, equal_nan=equal_nan)
             and self.label_type == other.label_type
             and self.nan_policy == other.nan_policy
         )
@@ -297,8 +299,8 @@ class BaseAveragePrecisionResult(BaseResult):
         if not isinstance(other, self.__class__):
             return False
         return (
-            objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
-            and objects_are_equal(self.y_score, other.y_score, equal_nan=equal_nan)
+            arrays_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and arrays_are_equal(self.y_score, other.y_score, equal_nan=equal_nan)
             and self.nan_policy == other.nan_policy
         )
 
@@ -317,6 +319,15 @@ class BinaryAveragePrecisionResult(BaseAveragePrecisionResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        ranking: An optional ranking engine built on the same
+            ``y_true``, ``y_score``, and ``nan_policy``. It can be
+            shared with other results to sort the scores only once.
+            If ``None``, a new ranking engine is created.
+        n_bins: If not ``None`` and ``ranking`` is ``None``, the
+            metric is approximated in linear time by counting the
+            samples in at most ``n_bins`` score buckets. It is useful
+            for very large arrays. The metric is exact if the scores
+            are integers with at most ``n_bins`` distinct values.
 
     Example usage:
 
@@ -340,9 +351,34 @@ class BinaryAveragePrecisionResult(BaseAveragePrecisionResult):
         y_true: np.ndarray,
         y_score: np.ndarray,
         nan_policy: str = "propagate",
+        ranking: BinaryScoreRanking | BinaryScoreHistogram | None = None,
+        n_bins: int | None = None,
     ) -> None:
         check_same_shape_score(y_true, y_score)
         super().__init__(y_true=y_true.ravel(), y_score=y_score.ravel(), nan_policy=nan_policy)
+        self._n_bins = n_bins
+        # The histogram is built on first use like the lazy exact ranking,
+        # because counting the samples in the bins is a full pass.
+        if ranking is None and n_bins is None:
+            ranking = BinaryScoreRanking(
+                y_true=self._y_true, y_score=self._y_score, nan_policy=self._nan_policy
+            )
+        self._ranking = ranking
+
+    @property
+    def n_bins(self) -> int | None:
+        return self._n_bins
+
+    @property
+    def ranking(self) -> BinaryScoreRanking | BinaryScoreHistogram:
+        if self._ranking is None:
+            self._ranking = BinaryScoreHistogram.from_scores(
+                y_true=self._y_true,
+                y_score=self._y_score,
+                n_bins=self._n_bins,
+                nan_policy=self._nan_policy,
+            )
+        return self._ranking
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return binary_average_precision(
@@ -351,8 +387,12 @@ class BinaryAveragePrecisionResult(BaseAveragePrecisionResult):
             prefix=prefix,
             suffix=suffix,
             nan_policy=self._nan_policy,
+            ranking=self.ranking,
         )
 
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        return super().equal(other, equal_nan=equal_nan) and self.n_bins == other.n_bins
+
     def generate_figures(
         self,
         prefix: str = "",  # noqa: ARG002
@@ -10,6 +10,7 @@ from coola import objects_are_equal
 from coola.utils.format import repr_mapping_line
 
 from arkas.metric.classification.balanced_accuracy import balanced_accuracy
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
 from arkas.metric.utils import check_nan_policy, check_same_shape_pred
 from arkas.result.base import BaseResult
 
@@ -30,6 +31,11 @@ class BalancedAccuracyResult(BaseResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multiclass'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
 
     Example usage:
 
@@ -53,6 +59,7 @@ class BalancedAccuracyResult(BaseResult):
         y_true: np.ndarray,
         y_pred: np.ndarray,
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
     ) -> None:
         self._y_true = y_true.ravel()
         self._y_pred = y_pred.ravel()
@@ -60,6 +67,12 @@ class BalancedAccuracyResult(BaseResult):
 
         check_nan_policy(nan_policy)
         self._nan_policy = nan_policy
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="multiclass",
+            nan_policy=self._nan_policy,
+        )
 
     def __repr__(self) -> str:
         args = repr_mapping_line(
@@ -83,6 +96,10 @@ class BalancedAccuracyResult(BaseResult):
     def nan_policy(self) -> str:
         return self._nan_policy
 
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
+
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return balanced_accuracy(
             y_true=self._y_true,
@@ -90,6 +107,7 @@ class BalancedAccuracyResult(BaseResult):
             prefix=prefix,
             suffix=suffix,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING, Any
 from coola import objects_are_equal
 from coola.utils.format import repr_mapping_line
 
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
+from arkas.metric.classification.score_ranking import BinaryScoreRanking
 from arkas.metric.utils import check_nan_policy
 from arkas.result.accuracy import AccuracyResult
 from arkas.result.ap import BinaryAveragePrecisionResult
@@ -101,38 +103,73 @@ class BinaryClassificationResult(BaseResult):
         check_nan_policy(nan_policy)
         self._nan_policy = nan_policy
 
+        # The confusion matrix is computed once and shared by the label-based results.
+        confmat = ConfusionMatrixKernel(
+            y_true=self._y_true, y_pred=self._y_pred, nan_policy=self._nan_policy
+        )
         results = [
-            AccuracyResult(y_true=self._y_true, y_pred=self._y_pred, nan_policy=self._nan_policy),
+            AccuracyResult(
+                y_true=self._y_true,
+                y_pred=self._y_pred,
+                nan_policy=self._nan_policy,
+                confmat=confmat,
+            ),
             BalancedAccuracyResult(
-                y_true=self._y_true, y_pred=self._y_pred, nan_policy=self._nan_policy
+                y_true=self._y_true,
+                y_pred=self._y_pred,
+                nan_policy=self._nan_policy,
+                confmat=confmat,
             ),
             BinaryConfusionMatrixResult(
-                y_true=self._y_true, y_pred=self._y_pred, nan_policy=self._nan_policy
+                y_true=self._y_true,
+                y_pred=self._y_pred,
+                nan_policy=self._nan_policy,
+                confmat=confmat,
             ),
             BinaryFbetaScoreResult(
                 y_true=self._y_true,
                 y_pred=self._y_pred,
                 betas=self._betas,
                 nan_policy=self._nan_policy,
+                confmat=confmat,
             ),
             BinaryJaccardResult(
-                y_true=self._y_true, y_pred=self._y_pred, nan_policy=self._nan_policy
+                y_true=self._y_true,
+                y_pred=self._y_pred,
+                nan_policy=self._nan_policy,
+                confmat=confmat,
             ),
             BinaryPrecisionResult(
-                y_true=self._y_true, y_pred=self._y_pred, nan_policy=self._nan_policy
+                y_true=self._y_true,
+                y_pred=self._y_pred,
+                nan_policy=self._nan_policy,
+                confmat=confmat,
             ),
             BinaryRecallResult(
-                y_true=self._y_true, y_pred=self._y_pred, nan_policy=self._nan_policy
+                y_true=self._y_true,
+                y_pred=self._y_pred,
+                nan_policy=self._nan_policy,
+                confmat=confmat,
             ),
         ]
         if self._y_score is not None:
+            # The scores are sorted once and shared by the score-based results.
+            ranking = BinaryScoreRanking(
+                y_true=self._y_true, y_score=self._y_score, nan_policy=self._nan_policy
+            )
             results.extend(
                 [
                     BinaryAveragePrecisionResult(
-                        y_true=self._y_true, y_score=self._y_score, nan_policy=self._nan_policy
+                        y_true=self._y_true,
+                        y_score=self._y_score,
+                        nan_policy=self._nan_policy,
+                        ranking=ranking,
                     ),
                     BinaryRocAucResult(
-                        y_true=self._y_true, y_score=self._y_score, nan_policy=self._nan_policy
+                        y_true=self._y_true,
+                        y_score=self._y_score,
+                        nan_policy=self._nan_policy,
+                        ranking=ranking,
                     ),
                 ]
             )
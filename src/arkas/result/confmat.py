@@ -11,19 +11,29 @@ __all__ = [
 
 from typing import TYPE_CHECKING, Any
 
-from coola import objects_are_equal
 from coola.utils.format import repr_mapping_line
 
 from arkas.metric.classification.confmat import (
     binary_confusion_matrix,
     multiclass_confusion_matrix,
+    multiclass_top_confused_pairs,
     multilabel_confusion_matrix,
+    sparse_multiclass_confusion_matrix,
+)
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
+from arkas.metric.utils import (
+    arrays_are_equal,
+    check_nan_policy,
+    check_same_shape_pred,
+    prepare_inputs,
 )
-from arkas.metric.utils import check_nan_policy, check_same_shape_pred
 from arkas.result.base import BaseResult
 
 if TYPE_CHECKING:
     import numpy as np
+    from scipy import sparse
+
+    from arkas.metric.utils import PreparedInputs
 
 
 class BaseConfusionMatrixResult(BaseResult):
@@ -101,8 +111,8 @@ class BaseConfusionMatrixResult(BaseResult):
         if not isinstance(other, self.__class__):
             return False
         return (
-            objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
-            and objects_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
+            arrays_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and arrays_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
             and self.nan_policy == other.nan_policy
         )
 
@@ -119,6 +129,11 @@ class BinaryConfusionMatrixResult(BaseConfusionMatrixResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'binary'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
 
     Example usage:
 
@@ -151,9 +166,20 @@ class BinaryConfusionMatrixResult(BaseConfusionMatrixResult):
         y_true: np.ndarray,
         y_pred: np.ndarray,
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
     ) -> None:
         check_same_shape_pred(y_true, y_pred)
         super().__init__(y_true=y_true.ravel(), y_pred=y_pred.ravel(), nan_policy=nan_policy)
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="binary",
+            nan_policy=self._nan_policy,
+        )
+
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return binary_confusion_matrix(
@@ -162,6 +188,7 @@ class BinaryConfusionMatrixResult(BaseConfusionMatrixResult):
             prefix=prefix,
             suffix=suffix,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
     def generate_figures(
@@ -185,6 +212,18 @@ class MulticlassConfusionMatrixResult(BaseConfusionMatrixResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multiclass'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
+        top_k: If ``None``, the metrics contain the dense confusion
+            matrix. Otherwise, the dense confusion matrix is never
+            computed and the metrics only contain the ``top_k`` most
+            frequent confused pairs. It should be used when there
+            are too many classes to store a dense confusion matrix.
+            The sparse confusion matrix is available with the
+            ``sparse_confusion_matrix`` property.
 
     Example usage:
 
@@ -197,9 +236,21 @@ class MulticlassConfusionMatrixResult(BaseConfusionMatrixResult):
     ...     y_pred=np.array([0, 1, 1, 2, 2, 2]),
     ... )
     >>> result
-    MulticlassConfusionMatrixResult(y_true=(6,), y_pred=(6,), nan_policy='propagate')
+    MulticlassConfusionMatrixResult(y_true=(6,), y_pred=(6,), nan_policy='propagate', top_k=None)
     >>> result.compute_metrics()
     {'confusion_matrix': array([[1, 0, 0], [0, 2, 0], [0, 0, 3]]), 'count': 6}
+    >>> result = MulticlassConfusionMatrixResult(
+    ...     y_true=np.array([0, 1, 1, 2, 2, 2]),
+    ...     y_pred=np.array([0, 2, 1, 1, 2, 1]),
+    ...     top_k=1,
+    ... )
+    >>> result.compute_metrics()
+    {'count': 6,
+     'top_confused_count': array([2]),
+     'top_confused_pred': array([1]),
+     'top_confused_true': array([2])}
+    >>> result.sparse_confusion_matrix[0].toarray()
+    array([[1, 0, 0], [0, 1, 1], [0, 2, 1]])
 
     ```
     """
@@ -209,19 +260,84 @@ class MulticlassConfusionMatrixResult(BaseConfusionMatrixResult):
         y_true: np.ndarray,
         y_pred: np.ndarray,
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
+        top_k: int | None = None,
     ) -> None:
         check_same_shape_pred(y_true, y_pred)
         super().__init__(y_true=y_true.ravel(), y_pred=y_pred.ravel(), nan_policy=nan_policy)
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="multiclass",
+            nan_policy=self._nan_policy,
+        )
+        if top_k is not None and top_k < 0:
+            msg = f"Incorrect 'top_k': {top_k}. The value must be positive or zero"
+            raise ValueError(msg)
+        self._top_k = top_k
+        self._prepared = None
+        self._sparse_confusion_matrix = None
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "y_true": self._y_true.shape,
+                "y_pred": self._y_pred.shape,
+                "nan_policy": self._nan_policy,
+                "top_k": self._top_k,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
+
+    @property
+    def sparse_confusion_matrix(self) -> tuple[sparse.csr_array, np.ndarray]:
+        r"""The sparse confusion matrix as a CSR array, and the label of
+        each row and column.
+
+        The sparse confusion matrix is computed only once, and
+        requires ``scipy``.
+        """
+        if self._sparse_confusion_matrix is None:
+            metrics = sparse_multiclass_confusion_matrix(
+                y_true=self._y_true,
+                y_pred=self._y_pred,
+                nan_policy=self._nan_policy,
+                prepared=self._prepare(),
+            )
+            self._sparse_confusion_matrix = (metrics["confusion_matrix"], metrics["labels"])
+        return self._sparse_confusion_matrix
+
+    @property
+    def top_k(self) -> int | None:
+        return self._top_k
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
+        if self._top_k is not None:
+            return multiclass_top_confused_pairs(
+                y_true=self._y_true,
+                y_pred=self._y_pred,
+                k=self._top_k,
+                prefix=prefix,
+                suffix=suffix,
+                nan_policy=self._nan_policy,
+                prepared=self._prepare(),
+            )
         return multiclass_confusion_matrix(
             y_true=self._y_true,
             y_pred=self._y_pred,
             prefix=prefix,
             suffix=suffix,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        return super().equal(other, equal_nan=equal_nan) and self.top_k == other.top_k
+
     def generate_figures(
         self,
         prefix: str = "",  # noqa: ARG002
@@ -229,6 +345,12 @@ class MulticlassConfusionMatrixResult(BaseConfusionMatrixResult):
     ) -> dict[str, float]:
         return {}
 
+    def _prepare(self) -> PreparedInputs:
+        r"""Return the prepared inputs, which are computed only once."""
+        if self._prepared is None:
+            self._prepared = prepare_inputs(self._y_true, self._y_pred, nan_policy=self._nan_policy)
+        return self._prepared
+
 
 class MultilabelConfusionMatrixResult(BaseConfusionMatrixResult):
     r"""Implement the confusion matrix result for multilabel labels.
@@ -243,6 +365,11 @@ class MultilabelConfusionMatrixResult(BaseConfusionMatrixResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multilabel'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
 
     Example usage:
 
@@ -270,9 +397,20 @@ class MultilabelConfusionMatrixResult(BaseConfusionMatrixResult):
         y_true: np.ndarray,
         y_pred: np.ndarray,
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
     ) -> None:
         check_same_shape_pred(y_true, y_pred)
         super().__init__(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="multilabel",
+            nan_policy=self._nan_policy,
+        )
+
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return multilabel_confusion_matrix(
@@ -281,6 +419,7 @@ class MultilabelConfusionMatrixResult(BaseConfusionMatrixResult):
             prefix=prefix,
             suffix=suffix,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
     def generate_figures(
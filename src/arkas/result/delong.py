@@ -0,0 +1,144 @@
+r"""Implement the result with the DeLong comparison of the ROC AUC of
+several score columns."""
+
+from __future__ import annotations
+
+__all__ = ["DeLongResult"]
+
+from typing import TYPE_CHECKING, Any
+
+from coola import objects_are_equal
+from coola.utils.format import repr_mapping_line
+
+from arkas.metric.classification.delong import delong_roc_auc_test
+from arkas.metric.utils import check_nan_policy, check_same_shape
+from arkas.result.base import BaseResult
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import numpy as np
+
+
+class DeLongResult(BaseResult):
+    r"""Implement the result with the DeLong comparison of the ROC AUC
+    of several score columns.
+
+    The result contains the ROC AUC of each score column with its
+    DeLong variance and confidence interval, and the paired DeLong
+    test between each pair of score columns.
+
+    Args:
+        y_true: The ground truth target labels. This input must be an
+            array of shape ``(n_samples,)`` with ``0`` and ``1``
+            values.
+        y_scores: The target scores of each column. Each input must
+            be an array of shape ``(n_samples,)``.
+        confidence_level: The confidence level of the intervals.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.result import DeLongResult
+    >>> result = DeLongResult(
+    ...     y_true=np.array([1, 0, 0, 1, 1, 0]),
+    ...     y_scores={
+    ...         "a": np.array([0.9, 0.2, 0.6, 0.8, 0.4, 0.1]),
+    ...         "b": np.array([0.8, 0.3, 0.1, 0.7, 0.2, 0.5]),
+    ...     },
+    ... )
+    >>> result
+    DeLongResult(y_true=(6,), y_scores=('a', 'b'), confidence_level=0.95, nan_policy='propagate')
+    >>> result.compute_metrics()
+    {'a_roc_auc': 0.888...,
+     'a_roc_auc_ci_high': 1.0,
+     'a_roc_auc_ci_low': 0.580...,
+     'a_roc_auc_variance': 0.0246...,
+     'a_vs_b_pvalue': 0.654...,
+     'a_vs_b_roc_auc_diff': 0.111...,
+     'a_vs_b_z_score': 0.447...,
+     'b_roc_auc': 0.777...,
+     'b_roc_auc_ci_high': 1.0,
+     'b_roc_auc_ci_low': 0.290...,
+     'b_roc_auc_variance': 0.0617...,
+     'count': 6}
+
+    ```
+    """
+
+    def __init__(
+        self,
+        y_true: np.ndarray,
+        y_scores: Mapping[str, np.ndarray],
+        confidence_level: float = 0.95,
+        nan_policy: str = "propagate",
+    ) -> None:
+        self._y_true = y_true.ravel()
+        self._y_scores = {name: score.ravel() for name, score in y_scores.items()}
+        check_same_shape([self._y_true, *self._y_scores.values()])
+
+        if not 0.0 < confidence_level < 1.0:
+            msg = f"Incorrect 'confidence_level': {confidence_level}. The value must be in (0, 1)"
+            raise ValueError(msg)
+        self._confidence_level = confidence_level
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "y_true": self._y_true.shape,
+                "y_scores": tuple(self._y_scores),
+                "confidence_level": self._confidence_level,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def confidence_level(self) -> float:
+        return self._confidence_level
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    @property
+    def y_true(self) -> np.ndarray:
+        return self._y_true
+
+    @property
+    def y_scores(self) -> dict[str, np.ndarray]:
+        return self._y_scores
+
+    def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
+        return delong_roc_auc_test(
+            y_true=self._y_true,
+            y_scores=self._y_scores,
+            confidence_level=self._confidence_level,
+            prefix=prefix,
+            suffix=suffix,
+            nan_policy=self._nan_policy,
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and objects_are_equal(self.y_scores, other.y_scores, equal_nan=equal_nan)
+            and self.confidence_level == other.confidence_level
+            and self.nan_policy == other.nan_policy
+        )
+
+    def generate_figures(
+        self,
+        prefix: str = "",  # noqa: ARG002
+        suffix: str = "",  # noqa: ARG002
+    ) -> dict[str, float]:
+        return {}
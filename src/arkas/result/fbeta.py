@@ -14,12 +14,13 @@ from typing import TYPE_CHECKING, Any
 from coola import objects_are_equal
 from coola.utils.format import repr_mapping_line
 
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
 from arkas.metric.classification.fbeta import (
     binary_fbeta_score,
     multiclass_fbeta_score,
     multilabel_fbeta_score,
 )
-from arkas.metric.utils import check_nan_policy, check_same_shape_pred
+from arkas.metric.utils import arrays_are_equal, check_nan_policy, check_same_shape_pred
 from arkas.result.base import BaseResult
 
 if TYPE_CHECKING:
@@ -101,8 +102,8 @@ class BaseFbetaScoreResult(BaseResult):
         if not isinstance(other, self.__class__):
             return False
         return (
-            objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
-            and objects_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
+            arrays_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and arrays_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
             and objects_are_equal(self.betas, other.betas, equal_nan=equal_nan)
             and self.nan_policy == other.nan_policy
         )
@@ -121,6 +122,11 @@ class BinaryFbetaScoreResult(BaseFbetaScoreResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'binary'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
 
     Example usage:
 
@@ -145,11 +151,22 @@ class BinaryFbetaScoreResult(BaseFbetaScoreResult):
         y_pred: np.ndarray,
         betas: Sequence[float] = (1,),
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
     ) -> None:
         check_same_shape_pred(y_true, y_pred)
         super().__init__(
             y_true=y_true.ravel(), y_pred=y_pred.ravel(), betas=betas, nan_policy=nan_policy
         )
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="binary",
+            nan_policy=self._nan_policy,
+        )
+
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return binary_fbeta_score(
@@ -159,6 +176,7 @@ class BinaryFbetaScoreResult(BaseFbetaScoreResult):
             suffix=suffix,
             betas=self._betas,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
     def generate_figures(
@@ -183,6 +201,11 @@ class MulticlassFbetaScoreResult(BaseFbetaScoreResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multiclass'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
 
     Example usage:
 
@@ -212,11 +235,22 @@ class MulticlassFbetaScoreResult(BaseFbetaScoreResult):
         y_pred: np.ndarray,
         betas: Sequence[float] = (1,),
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
     ) -> None:
         check_same_shape_pred(y_true, y_pred)
         super().__init__(
             y_true=y_true.ravel(), y_pred=y_pred.ravel(), betas=betas, nan_policy=nan_policy
         )
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="multiclass",
+            nan_policy=self._nan_policy,
+        )
+
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return multiclass_fbeta_score(
@@ -226,6 +260,7 @@ class MulticlassFbetaScoreResult(BaseFbetaScoreResult):
             suffix=suffix,
             betas=self._betas,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
     def generate_figures(
@@ -250,6 +285,11 @@ class MultilabelFbetaScoreResult(BaseFbetaScoreResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multilabel'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
 
     Example usage:
 
@@ -279,9 +319,20 @@ class MultilabelFbetaScoreResult(BaseFbetaScoreResult):
         y_pred: np.ndarray,
         betas: Sequence[float] = (1,),
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
     ) -> None:
         check_same_shape_pred(y_true, y_pred)
         super().__init__(y_true=y_true, y_pred=y_pred, betas=betas, nan_policy=nan_policy)
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="multilabel",
+            nan_policy=self._nan_policy,
+        )
+
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return multilabel_fbeta_score(
@@ -291,6 +342,7 @@ class MultilabelFbetaScoreResult(BaseFbetaScoreResult):
             suffix=suffix,
             betas=self._betas,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
     def generate_figures(
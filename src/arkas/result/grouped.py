@@ -0,0 +1,190 @@
+r"""Implement the result with the metrics of each group of rows."""
+
+from __future__ import annotations
+
+__all__ = ["GroupedMetricsResult", "check_grouped_task"]
+
+from typing import TYPE_CHECKING, Any
+
+from coola import objects_are_equal
+from coola.utils.format import repr_mapping_line
+
+from arkas.metric.grouped import (
+    grouped_classification_metrics,
+    grouped_ranking_metrics,
+    grouped_regression_metrics,
+)
+from arkas.metric.utils import check_nan_policy, check_same_shape
+from arkas.result.base import BaseResult
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import numpy as np
+    import polars as pl
+
+
+class GroupedMetricsResult(BaseResult):
+    r"""Implement the result with the metrics of each group of rows.
+
+    The metrics of all the groups are computed in a single pass and
+    returned as a DataFrame where each row is a group.
+
+    Args:
+        groups: The key columns that define the groups. Each key
+            column must be an array of shape ``(n_samples,)``.
+        y_true: The ground truth target labels or values. This input
+            must be an array of shape ``(n_samples,)``.
+        y_pred: The predicted labels, scores, or values. This input
+            must be an array of shape ``(n_samples,)``.
+        task: The type of metrics to compute. The valid values are
+            ``'classification'``, ``'ranking'``, and
+            ``'regression'``.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.result import GroupedMetricsResult
+    >>> result = GroupedMetricsResult(
+    ...     groups={"country": np.array(["fr", "fr", "fr", "us", "us", "us"])},
+    ...     y_true=np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+    ...     y_pred=np.array([1.0, 2.0, 4.0, 4.0, 3.0, 6.0]),
+    ...     task="regression",
+    ... )
+    >>> result
+    GroupedMetricsResult(groups=('country',), y_true=(6,), y_pred=(6,), task='regression', nan_policy='propagate')
+    >>> result.compute_metrics()["grouped_metrics"]
+    shape: (2, 6)
+    ┌─────────┬───────┬─────────────────────┬────────────────────┬─────────────────────────┬──────────┐
+    │ country ┆ count ┆ mean_absolute_error ┆ mean_squared_error ┆ root_mean_squared_error ┆ r2_score │
+    │ ---     ┆ ---   ┆ ---                 ┆ ---                ┆ ---                     ┆ ---      │
+    │ str     ┆ i64   ┆ f64                 ┆ f64                ┆ f64                     ┆ f64      │
+    ╞═════════╪═══════╪═════════════════════╪════════════════════╪═════════════════════════╪══════════╡
+    │ fr      ┆ 3     ┆ 0.333333            ┆ 0.333333           ┆ 0.57735                 ┆ 0.5      │
+    │ us      ┆ 3     ┆ 0.666667            ┆ 1.333333           ┆ 1.154701                ┆ -1.0     │
+    └─────────┴───────┴─────────────────────┴────────────────────┴─────────────────────────┴──────────┘
+
+    ```
+    """
+
+    def __init__(
+        self,
+        groups: Mapping[str, np.ndarray],
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        task: str,
+        nan_policy: str = "propagate",
+    ) -> None:
+        self._groups = {name: values.ravel() for name, values in groups.items()}
+        self._y_true = y_true.ravel()
+        self._y_pred = y_pred.ravel()
+        check_same_shape([*self._groups.values(), self._y_true, self._y_pred])
+
+        check_grouped_task(task)
+        self._task = task
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "groups": tuple(self._groups),
+                "y_true": self._y_true.shape,
+                "y_pred": self._y_pred.shape,
+                "task": self._task,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def groups(self) -> dict[str, np.ndarray]:
+        return self._groups
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    @property
+    def task(self) -> str:
+        return self._task
+
+    @property
+    def y_true(self) -> np.ndarray:
+        return self._y_true
+
+    @property
+    def y_pred(self) -> np.ndarray:
+        return self._y_pred
+
+    def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, pl.DataFrame]:
+        return {f"{prefix}grouped_metrics{suffix}": self.compute_frame()}
+
+    def compute_frame(self) -> pl.DataFrame:
+        r"""Compute the metrics of each group.
+
+        Returns:
+            A DataFrame with the key columns and the metrics. Each row
+                is a group.
+        """
+        if self._task == "classification":
+            return grouped_classification_metrics(
+                self._groups, y_true=self._y_true, y_pred=self._y_pred, nan_policy=self._nan_policy
+            )
+        if self._task == "ranking":
+            return grouped_ranking_metrics(
+                self._groups, y_true=self._y_true, y_score=self._y_pred, nan_policy=self._nan_policy
+            )
+        return grouped_regression_metrics(
+            self._groups, y_true=self._y_true, y_pred=self._y_pred, nan_policy=self._nan_policy
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            objects_are_equal(self.groups, other.groups, equal_nan=equal_nan)
+            and objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and objects_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
+            and self.task == other.task
+            and self.nan_policy == other.nan_policy
+        )
+
+    def generate_figures(
+        self,
+        prefix: str = "",  # noqa: ARG002
+        suffix: str = "",  # noqa: ARG002
+    ) -> dict[str, float]:
+        return {}
+
+
+def check_grouped_task(task: str) -> None:
+    r"""Check the type of grouped metrics.
+
+    Args:
+        task: The type of metrics to compute.
+
+    Raises:
+        ValueError: if ``task`` is not ``'classification'``,
+            ``'ranking'``, or ``'regression'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from arkas.result.grouped import check_grouped_task
+    >>> check_grouped_task("regression")
+
+    ```
+    """
+    if task not in {"classification", "ranking", "regression"}:
+        msg = (
+            f"Incorrect 'task': {task}. The valid values are: 'classification', 'ranking', "
+            "and 'regression'"
+        )
+        raise ValueError(msg)
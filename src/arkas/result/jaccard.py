@@ -11,15 +11,15 @@ __all__ = [
 
 from typing import TYPE_CHECKING, Any
 
-from coola import objects_are_equal
 from coola.utils.format import repr_mapping_line
 
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
 from arkas.metric.classification.jaccard import (
     binary_jaccard,
     multiclass_jaccard,
     multilabel_jaccard,
 )
-from arkas.metric.utils import check_nan_policy, check_same_shape_pred
+from arkas.metric.utils import arrays_are_equal, check_nan_policy, check_same_shape_pred
 from arkas.result.base import BaseResult
 
 if TYPE_CHECKING:
@@ -91,8 +91,8 @@ class BaseJaccardResult(BaseResult):
         if not isinstance(other, self.__class__):
             return False
         return (
-            objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
-            and objects_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
+            arrays_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and arrays_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
             and self.nan_policy == other.nan_policy
         )
 
@@ -109,6 +109,11 @@ class BinaryJaccardResult(BaseJaccardResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'binary'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
 
     Example usage:
 
@@ -132,9 +137,20 @@ class BinaryJaccardResult(BaseJaccardResult):
         y_true: np.ndarray,
         y_pred: np.ndarray,
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
     ) -> None:
         check_same_shape_pred(y_true, y_pred)
         super().__init__(y_true=y_true.ravel(), y_pred=y_pred.ravel(), nan_policy=nan_policy)
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="binary",
+            nan_policy=self._nan_policy,
+        )
+
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return binary_jaccard(
@@ -143,6 +159,7 @@ class BinaryJaccardResult(BaseJaccardResult):
             prefix=prefix,
             suffix=suffix,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
     def generate_figures(
@@ -166,6 +183,11 @@ class MulticlassJaccardResult(BaseJaccardResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multiclass'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
 
     Example usage:
 
@@ -194,9 +216,20 @@ class MulticlassJaccardResult(BaseJaccardResult):
         y_true: np.ndarray,
         y_pred: np.ndarray,
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
     ) -> None:
         check_same_shape_pred(y_true, y_pred)
         super().__init__(y_true=y_true.ravel(), y_pred=y_pred.ravel(), nan_policy=nan_policy)
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="multiclass",
+            nan_policy=self._nan_policy,
+        )
+
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return multiclass_jaccard(
@@ -205,6 +238,7 @@ class MulticlassJaccardResult(BaseJaccardResult):
             prefix=prefix,
             suffix=suffix,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
     def generate_figures(
@@ -228,6 +262,11 @@ class MultilabelJaccardResult(BaseJaccardResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multilabel'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
 
     Example usage:
 
@@ -256,9 +295,20 @@ class MultilabelJaccardResult(BaseJaccardResult):
         y_true: np.ndarray,
         y_pred: np.ndarray,
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
     ) -> None:
         check_same_shape_pred(y_true, y_pred)
         super().__init__(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="multilabel",
+            nan_policy=self._nan_policy,
+        )
+
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return multilabel_jaccard(
@@ -267,6 +317,7 @@ class MultilabelJaccardResult(BaseJaccardResult):
             prefix=prefix,
             suffix=suffix,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
     def generate_figures(
@@ -12,9 +12,9 @@ __all__ = [
 
 from typing import TYPE_CHECKING, Any
 
-from coola import objects_are_equal
 from coola.utils.format import repr_mapping_line
 
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
 from arkas.metric.classification.precision import (
     binary_precision,
     find_label_type,
@@ -23,7 +23,12 @@ from arkas.metric.classification.precision import (
     precision,
 )
 from arkas.metric.figure import binary_precision_recall_curve
-from arkas.metric.utils import check_label_type, check_nan_policy, check_same_shape_pred
+from arkas.metric.utils import (
+    arrays_are_equal,
+    check_label_type,
+    check_nan_policy,
+    check_same_shape_pred,
+)
 from arkas.result.base import BaseResult
 
 if TYPE_CHECKING:
@@ -172,8 +177,8 @@ class PrecisionResult(BaseResult):
         if not isinstance(other, self.__class__):
             return False
         return (
-            objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
-            and objects_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
+            arrays_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and arrays_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
             and self.label_type == other.label_type
             and self.nan_policy == other.nan_policy
         )
@@ -266,8 +271,8 @@ class BasePrecisionResult(BaseResult):
         if not isinstance(other, self.__class__):
             return False
         return (
-            objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
-            and objects_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
+            arrays_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and arrays_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
             and self.nan_policy == other.nan_policy
         )
 
@@ -284,6 +289,11 @@ class BinaryPrecisionResult(BasePrecisionResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'binary'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
 
     Example usage:
 
@@ -307,9 +317,20 @@ class BinaryPrecisionResult(BasePrecisionResult):
         y_true: np.ndarray,
         y_pred: np.ndarray,
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
     ) -> None:
         check_same_shape_pred(y_true, y_pred)
         super().__init__(y_true=y_true.ravel(), y_pred=y_pred.ravel(), nan_policy=nan_policy)
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="binary",
+            nan_policy=self._nan_policy,
+        )
+
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return binary_precision(
@@ -318,6 +339,7 @@ class BinaryPrecisionResult(BasePrecisionResult):
             prefix=prefix,
             suffix=suffix,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
     def generate_figures(self, prefix: str = "", suffix: str = "") -> dict[str, plt.Figure]:
@@ -343,6 +365,11 @@ class MulticlassPrecisionResult(BasePrecisionResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multiclass'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
 
     Example usage:
 
@@ -371,9 +398,20 @@ class MulticlassPrecisionResult(BasePrecisionResult):
         y_true: np.ndarray,
         y_pred: np.ndarray,
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
     ) -> None:
         check_same_shape_pred(y_true, y_pred)
         super().__init__(y_true=y_true.ravel(), y_pred=y_pred.ravel(), nan_policy=nan_policy)
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="multiclass",
+            nan_policy=self._nan_policy,
+        )
+
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return multiclass_precision(
@@ -382,6 +420,7 @@ class MulticlassPrecisionResult(BasePrecisionResult):
             prefix=prefix,
             suffix=suffix,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
     def generate_figures(
@@ -405,6 +444,11 @@ class MultilabelPrecisionResult(BasePrecisionResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        confmat: An optional confusion matrix kernel with the
+            ``'multilabel'`` label type, built on the same ``y_true``,
+            ``y_pred``, and ``nan_policy``. It can be shared with other
+            results to compute the confusion matrix only once. If
+            ``None``, a new confusion matrix kernel is created.
 
     Example usage:
 
@@ -433,9 +477,20 @@ class MultilabelPrecisionResult(BasePrecisionResult):
         y_true: np.ndarray,
         y_pred: np.ndarray,
         nan_policy: str = "propagate",
+        confmat: ConfusionMatrixKernel | None = None,
     ) -> None:
         check_same_shape_pred(y_true, y_pred)
         super().__init__(y_true=y_true, y_pred=y_pred, nan_policy=nan_policy)
+        self._confmat = confmat or ConfusionMatrixKernel(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            label_type="multilabel",
+            nan_policy=self._nan_policy,
+        )
+
+    @property
+    def confmat(self) -> ConfusionMatrixKernel:
+        return self._confmat
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return multilabel_precision(
@@ -444,6 +499,7 @@ class MultilabelPrecisionResult(BasePrecisionResult):
             prefix=prefix,
             suffix=suffix,
             nan_policy=self._nan_policy,
+            confmat=self._confmat,
         )
 
     def generate_figures(
@@ -0,0 +1,145 @@
+r"""Implement the learning-to-rank result for data grouped by query."""
+
+from __future__ import annotations
+
+__all__ = ["QueryRankingResult"]
+
+from typing import TYPE_CHECKING, Any
+
+from coola import objects_are_equal
+from coola.utils.format import repr_mapping_line
+
+from arkas.metric.classification.query_ranking import query_ranking_metrics
+from arkas.metric.utils import check_nan_policy, check_same_shape
+from arkas.result.base import BaseResult
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+
+
+class QueryRankingResult(BaseResult):
+    r"""Implement the learning-to-rank result for data grouped by query.
+
+    Args:
+        query_id: The query identifiers. This input must be an array
+            of shape ``(n_samples,)``.
+        y_true: The relevance of each result. This input must be an
+            array of shape ``(n_samples,)``.
+        y_score: The predicted scores used to rank the results of
+            each query. This input must be an array of shape
+            ``(n_samples,)``.
+        k: The numbers of top results used to compute the metrics
+            at a cutoff.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.result import QueryRankingResult
+    >>> result = QueryRankingResult(
+    ...     query_id=np.array([1, 1, 1, 2, 2, 2, 2]),
+    ...     y_true=np.array([0, 1, 2, 1, 0, 0, 1]),
+    ...     y_score=np.array([0.1, 0.2, 0.9, 0.5, 0.8, 0.3, 0.4]),
+    ...     k=[1, 3],
+    ... )
+    >>> result
+    QueryRankingResult(query_id=(7,), y_true=(7,), y_score=(7,), k=(1, 3), nan_policy='propagate')
+    >>> result.compute_metrics()
+    {'count': 7,
+     'map': 0.791...,
+     'mrr': 0.75,
+     'ndcg': 0.846...,
+     'ndcg_at_1': 0.5,
+     'ndcg_at_3': 0.846...,
+     'num_queries': 2,
+     'precision_at_1': 0.5,
+     'precision_at_3': 0.666...,
+     'recall_at_1': 0.25,
+     'recall_at_3': 1.0}
+
+    ```
+    """
+
+    def __init__(
+        self,
+        query_id: np.ndarray,
+        y_true: np.ndarray,
+        y_score: np.ndarray,
+        k: Sequence[int] = (10,),
+        nan_policy: str = "propagate",
+    ) -> None:
+        self._query_id = query_id.ravel()
+        self._y_true = y_true.ravel()
+        self._y_score = y_score.ravel()
+        check_same_shape([self._query_id, self._y_true, self._y_score])
+        self._k = tuple(k)
+
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "query_id": self._query_id.shape,
+                "y_true": self._y_true.shape,
+                "y_score": self._y_score.shape,
+                "k": self._k,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def k(self) -> tuple[int, ...]:
+        return self._k
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    @property
+    def query_id(self) -> np.ndarray:
+        return self._query_id
+
+    @property
+    def y_true(self) -> np.ndarray:
+        return self._y_true
+
+    @property
+    def y_score(self) -> np.ndarray:
+        return self._y_score
+
+    def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
+        return query_ranking_metrics(
+            query_id=self._query_id,
+            y_true=self._y_true,
+            y_score=self._y_score,
+            k=self._k,
+            prefix=prefix,
+            suffix=suffix,
+            nan_policy=self._nan_policy,
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            objects_are_equal(self.query_id, other.query_id, equal_nan=equal_nan)
+            and objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and objects_are_equal(self.y_score, other.y_score, equal_nan=equal_nan)
+            and self.k == other.k
+            and self.nan_policy == other.nan_policy
+        )
+
+    def generate_figures(
+        self,
+        prefix: str = "",  # noqa: ARG002
+        suffix: str = "",  # noqa: ARG002
+    ) -> dict[str, float]:
+        return {}
@@ -1,15 +1,19 @@
-r"""Implement the regression error result."""
+r"""Implement the regression error results."""
 
 from __future__ import annotations
 
-__all__ = ["RegressionErrorResult"]
+__all__ = ["MultioutputRegressionResult", "RegressionErrorResult", "RegressionMetricsResult"]
 
 from typing import TYPE_CHECKING, Any
 
 from coola import objects_are_equal
 from coola.utils.format import repr_mapping_line
 
-from arkas.metric.regression.universal import regression_errors
+from arkas.metric.regression.universal import (
+    multioutput_regression_metrics,
+    regression_errors,
+    regression_metrics,
+)
 from arkas.metric.utils import check_nan_policy, check_same_shape_pred
 from arkas.result.base import BaseResult
 
@@ -17,6 +21,106 @@ if TYPE_CHECKING:
     import numpy as np
 
 
+class MultioutputRegressionResult(BaseResult):
+    r"""Implement a result with the regression metrics of each output
+    of a multi-output regression model.
+
+    The metrics of all the outputs are computed in a single
+    vectorized call. See ``arkas.metric.multioutput_regression_metrics``
+    for more information.
+
+    Args:
+        y_true: The ground truth target values. This input must be an
+            array of shape ``(n_samples, n_outputs)`` or
+            ``(n_samples,)``.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples, n_outputs)`` or ``(n_samples,)``.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.result import MultioutputRegressionResult
+    >>> result = MultioutputRegressionResult(
+    ...     y_true=np.array([[1, 2], [2, 4], [3, 6], [4, 8]]),
+    ...     y_pred=np.array([[1, 3], [2, 4], [4, 6], [4, 4]]),
+    ... )
+    >>> result
+    MultioutputRegressionResult(y_true=(4, 2), y_pred=(4, 2), nan_policy='propagate')
+    >>> metrics = result.compute_metrics()
+    >>> metrics["mean_absolute_error"]
+    array([0.25, 1.25])
+    >>> metrics["macro_mean_absolute_error"]
+    0.75
+
+    ```
+    """
+
+    def __init__(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        nan_policy: str = "propagate",
+    ) -> None:
+        check_same_shape_pred(y_true=y_true, y_pred=y_pred)
+        self._y_true = y_true
+        self._y_pred = y_pred
+
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "y_true": self._y_true.shape,
+                "y_pred": self._y_pred.shape,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    @property
+    def y_true(self) -> np.ndarray:
+        return self._y_true
+
+    @property
+    def y_pred(self) -> np.ndarray:
+        return self._y_pred
+
+    def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float | np.ndarray]:
+        return multioutput_regression_metrics(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            prefix=prefix,
+            suffix=suffix,
+            nan_policy=self._nan_policy,
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and objects_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
+            and self.nan_policy == other.nan_policy
+        )
+
+    def generate_figures(
+        self,
+        prefix: str = "",  # noqa: ARG002
+        suffix: str = "",  # noqa: ARG002
+    ) -> dict[str, float]:
+        return {}
+
+
 class RegressionErrorResult(BaseResult):
     r"""Implement a "universal" regression error result.
 
@@ -106,3 +210,105 @@ class RegressionErrorResult(BaseResult):
         suffix: str = "",  # noqa: ARG002
     ) -> dict[str, float]:
         return {}
+
+
+class RegressionMetricsResult(BaseResult):
+    r"""Implement a result with several regression metrics computed in
+    a single fused kernel.
+
+    The residuals are computed once and the max error, mean absolute
+    error, mean absolute percentage error, mean squared error, mean
+    squared logarithmic error, median absolute error, R^2 score, and
+    root mean squared error are derived from them.
+
+    Args:
+        y_true: The ground truth target values.
+        y_pred: The predicted values.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.result import RegressionMetricsResult
+    >>> result = RegressionMetricsResult(
+    ...     y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([2, 2, 3, 4, 1])
+    ... )
+    >>> result
+    RegressionMetricsResult(y_true=(5,), y_pred=(5,), nan_policy='propagate')
+    >>> result.compute_metrics()
+    {'count': 5,
+     'max_error': 4.0,
+     'mean_absolute_error': 1.0,
+     'mean_absolute_percentage_error': 0.36,
+     'mean_squared_error': 3.4,
+     'mean_squared_log_error': 0.274...,
+     'median_absolute_error': 0.0,
+     'r2_score': -0.7,
+     'root_mean_squared_error': 1.843...}
+
+    ```
+    """
+
+    def __init__(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        nan_policy: str = "propagate",
+    ) -> None:
+        self._y_true = y_true.ravel()
+        self._y_pred = y_pred.ravel()
+        check_same_shape_pred(y_true=self._y_true, y_pred=self._y_pred)
+
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "y_true": self._y_true.shape,
+                "y_pred": self._y_pred.shape,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    @property
+    def y_true(self) -> np.ndarray:
+        return self._y_true
+
+    @property
+    def y_pred(self) -> np.ndarray:
+        return self._y_pred
+
+    def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
+        return regression_metrics(
+            y_true=self._y_true,
+            y_pred=self._y_pred,
+            prefix=prefix,
+            suffix=suffix,
+            nan_policy=self._nan_policy,
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and objects_are_equal(self.y_pred, other.y_pred, equal_nan=equal_nan)
+            and self.nan_policy == other.nan_policy
+        )
+
+    def generate_figures(
+        self,
+        prefix: str = "",  # noqa: ARG002
+        suffix: str = "",  # noqa: ARG002
+    ) -> dict[str, float]:
+        return {}
@@ -12,7 +12,6 @@ __all__ = [
 
 from typing import TYPE_CHECKING, Any
 
-from coola import objects_are_equal
 from coola.utils.format import repr_mapping_line
 
 from arkas.metric.classification.roc_auc import (
@@ -20,7 +19,9 @@ from arkas.metric.classification.roc_auc import (
     multiclass_roc_auc,
     multilabel_roc_auc,
 )
-from arkas.metric.utils import check_nan_policy, check_same_shape_score
+from arkas.metric.classification.score_histogram import BinaryScoreHistogram
+from arkas.metric.classification.score_ranking import BinaryScoreRanking
+from arkas.metric.utils import arrays_are_equal, check_nan_policy, check_same_shape_score
 from arkas.result.base import BaseResult
 
 if TYPE_CHECKING:
@@ -96,8 +97,8 @@ class BaseRocAucResult(BaseResult):
         if not isinstance(other, self.__class__):
             return False
         return (
-            objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
-            and objects_are_equal(self.y_score, other.y_score, equal_nan=equal_nan)
+            arrays_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and arrays_are_equal(self.y_score, other.y_score, equal_nan=equal_nan)
             and self.nan_policy == other.nan_policy
         )
 
@@ -117,6 +118,15 @@ class BinaryRocAucResult(BaseRocAucResult):
         nan_policy: The policy on how to handle NaN values in the input
             arrays. The following options are available: ``'omit'``,
             ``'propagate'``, and ``'raise'``.
+        ranking: An optional ranking engine built on the same
+            ``y_true``, ``y_score``, and ``nan_policy``. It can be
+            shared with other results to sort the scores only once.
+            If ``None``, a new ranking engine is created.
+        n_bins: If not ``None`` and ``ranking`` is ``None``, the
+            metric is approximated in linear time by counting the
+            samples in at most ``n_bins`` score buckets. It is useful
+            for very large arrays. The metric is exact if the scores
+            are integers with at most ``n_bins`` distinct values.
 
     Example usage:
 
@@ -140,9 +150,34 @@ class BinaryRocAucResult(BaseRocAucResult):
         y_true: np.ndarray,
         y_score: np.ndarray,
         nan_policy: str = "propagate",
+        ranking: BinaryScoreRanking | BinaryScoreHistogram | None = None,
+        n_bins: int | None = None,
     ) -> None:
         check_same_shape_score(y_true, y_score)
         super().__init__(y_true=y_true.ravel(), y_score=y_score.ravel(), nan_policy=nan_policy)
+        self._n_bins = n_bins
+        # The histogram is built on first use like the lazy exact ranking,
+        # because counting the samples in the bins is a full pass.
+        if ranking is None and n_bins is None:
+            ranking = BinaryScoreRanking(
+                y_true=self._y_true, y_score=self._y_score, nan_policy=self._nan_policy
+            )
+        self._ranking = ranking
+
+    @property
+    def n_bins(self) -> int | None:
+        return self._n_bins
+
+    @property
+    def ranking(self) -> BinaryScoreRanking | BinaryScoreHistogram:
+        if self._ranking is None:
+            self._ranking = BinaryScoreHistogram.from_scores(
+                y_true=self._y_true,
+                y_score=self._y_score,
+                n_bins=self._n_bins,
+                nan_policy=self._nan_policy,
+            )
+        return self._ranking
 
     def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
         return binary_roc_auc(
@@ -151,8 +186,12 @@ class BinaryRocAucResult(BaseRocAucResult):
             prefix=prefix,
             suffix=suffix,
             nan_policy=self._nan_policy,
+            ranking=self.ranking,
         )
 
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        return super().equal(other, equal_nan=equal_nan) and self.n_bins == other.n_bins
+
     def generate_figures(
         self,
         prefix: str = "",  # noqa: ARG002
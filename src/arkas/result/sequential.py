@@ -9,16 +9,25 @@ from typing import TYPE_CHECKING, Any
 from coola import objects_are_equal
 from coola.utils import str_indent, str_sequence
 
+from arkas.metric.classification.confmat_kernel import ConfusionMatrixKernel
 from arkas.result import BaseResult
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Hashable, Sequence
+
+    import numpy as np
 
 
 class SequentialResult(BaseResult):
     r"""Implement a result to merge multiple result objects into a single
     result object.
 
+    The results with a confusion matrix kernel (e.g.
+    ``AccuracyResult`` or ``BinaryPrecisionResult``) that are computed
+    on the same ``y_true`` and ``y_pred`` arrays, with the same label
+    type and NaN policy, share a single kernel, so the confusion
+    matrix is computed only once for all these results.
+
     Args:
         results: The results to merge. This order is used to merge
             the metrics and figures if they have duplicate keys,
@@ -46,6 +55,7 @@ class SequentialResult(BaseResult):
 
     def __init__(self, results: Sequence[BaseResult]) -> None:
         self._results = tuple(results)
+        _share_confusion_matrices(self._results)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}(count={len(self._results):,})"
@@ -70,3 +80,48 @@ class SequentialResult(BaseResult):
         for result in self._results:
             out |= result.generate_figures(prefix=prefix, suffix=suffix)
         return out
+
+
+def _share_confusion_matrices(results: Sequence[BaseResult]) -> None:
+    r"""Share the confusion matrix kernel of the results computed on
+    the same inputs.
+
+    The kernels are lazy, so replacing a kernel that was not used yet
+    does not compute anything.
+
+    Args:
+        results: The results. The results with a ``confmat`` kernel
+            are updated in-place.
+    """
+    kernels = {}
+    for result in results:
+        kernel = getattr(result, "confmat", None)
+        if not isinstance(kernel, ConfusionMatrixKernel):
+            continue
+        key = (
+            _array_key(kernel.y_true),
+            _array_key(kernel.y_pred),
+            kernel.label_type,
+            kernel.nan_policy,
+        )
+        result._confmat = kernels.setdefault(key, kernel)
+
+
+def _array_key(arr: np.ndarray) -> Hashable:
+    r"""Return a key that identifies the memory of an array.
+
+    Two arrays have the same key if they are views of the same memory
+    with the same shape, strides, and dtype, so the values are not
+    compared.
+
+    Args:
+        arr: The array.
+
+    Returns:
+        The key of the array.
+    """
+    interface = getattr(arr, "__array_interface__", None)
+    if interface is None:
+        # For example the ``scipy.sparse`` arrays.
+        return id(arr)
+    return (interface["data"][0], arr.shape, interface["strides"], arr.dtype.str)
@@ -0,0 +1,143 @@
+r"""Implement the result with the operating curves of each label of a
+multilabel model."""
+
+from __future__ import annotations
+
+__all__ = ["MultilabelThresholdCurvesResult"]
+
+from typing import TYPE_CHECKING, Any
+
+from coola import objects_are_equal
+from coola.utils.format import repr_mapping_line
+
+from arkas.metric.classification.threshold_curves import multilabel_threshold_curves
+from arkas.metric.utils import check_nan_policy, check_same_shape_score
+from arkas.result.base import BaseResult
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class MultilabelThresholdCurvesResult(BaseResult):
+    r"""Implement the result with the precision-recall and ROC curves,
+    and the optimal thresholds of each label of a multilabel model.
+
+    The curves of all the labels are concatenated in compact arrays,
+    and the curve of the ``i``-th label is stored between
+    ``curve_offsets[i]`` and ``curve_offsets[i + 1]``. See
+    ``arkas.metric.multilabel_threshold_curves`` for more
+    information.
+
+    Args:
+        y_true: The ground truth target labels. This input must
+            be an array of shape ``(n_samples, n_labels)`` with ``0``
+            and ``1`` values.
+        y_score: The target scores. This input must be an array of
+            shape ``(n_samples, n_labels)``.
+        beta: The beta used to find the threshold that maximizes the
+            F-beta score.
+        n_jobs: The number of threads used to compute the curves.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.result import MultilabelThresholdCurvesResult
+    >>> result = MultilabelThresholdCurvesResult(
+    ...     y_true=np.array([[1, 0], [0, 1], [0, 1], [1, 0], [1, 1]]),
+    ...     y_score=np.array([[0.9, 0.2], [0.1, 0.8], [0.35, 0.6], [0.3, 0.1], [0.8, 0.5]]),
+    ... )
+    >>> result
+    MultilabelThresholdCurvesResult(y_true=(5, 2), y_score=(5, 2), beta=1, n_jobs=1, nan_policy='propagate')
+    >>> metrics = result.compute_metrics()
+    >>> metrics["best_f1_threshold"]
+    array([0.3, 0.5])
+    >>> metrics["best_youden_threshold"]
+    array([0.8, 0.5])
+
+    ```
+    """
+
+    def __init__(
+        self,
+        y_true: np.ndarray,
+        y_score: np.ndarray,
+        beta: float = 1,
+        n_jobs: int = 1,
+        nan_policy: str = "propagate",
+    ) -> None:
+        check_same_shape_score(y_true, y_score)
+        self._y_true = y_true
+        self._y_score = y_score
+        self._beta = beta
+
+        if n_jobs < 1:
+            msg = f"Incorrect 'n_jobs': {n_jobs}. The value must be greater than 0"
+            raise ValueError(msg)
+        self._n_jobs = n_jobs
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {
+                "y_true": self._y_true.shape,
+                "y_score": self._y_score.shape,
+                "beta": self._beta,
+                "n_jobs": self._n_jobs,
+                "nan_policy": self._nan_policy,
+            }
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def beta(self) -> float:
+        return self._beta
+
+    @property
+    def n_jobs(self) -> int:
+        return self._n_jobs
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    @property
+    def y_true(self) -> np.ndarray:
+        return self._y_true
+
+    @property
+    def y_score(self) -> np.ndarray:
+        return self._y_score
+
+    def compute_metrics(self, prefix: str = "", suffix: str = "") -> dict[str, float]:
+        return multilabel_threshold_curves(
+            y_true=self._y_true,
+            y_score=self._y_score,
+            beta=self._beta,
+            n_jobs=self._n_jobs,
+            prefix=prefix,
+            suffix=suffix,
+            nan_policy=self._nan_policy,
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            objects_are_equal(self.y_true, other.y_true, equal_nan=equal_nan)
+            and objects_are_equal(self.y_score, other.y_score, equal_nan=equal_nan)
+            and self.beta == other.beta
+            and self.nan_policy == other.nan_policy
+        )
+
+    def generate_figures(
+        self,
+        prefix: str = "",  # noqa: ARG002
+        suffix: str = "",  # noqa: ARG002
+    ) -> dict[str, float]:
+        return {}
@@ -6,6 +6,7 @@ __all__ = [
     "AccuracyState",
     "BaseArgState",
     "BaseState",
+    "BinnedResidualState",
     "ColumnCooccurrenceState",
     "DataFrameState",
     "NullValueState",
@@ -21,6 +22,7 @@ __all__ = [
 from arkas.state.accuracy import AccuracyState
 from arkas.state.arg import BaseArgState
 from arkas.state.base import BaseState
+from arkas.state.binned_residual import BinnedResidualState
 from arkas.state.column_cooccurrence import ColumnCooccurrenceState
 from arkas.state.columns import TwoColumnDataFrameState
 from arkas.state.dataframe import DataFrameState
@@ -0,0 +1,131 @@
+r"""Implement the state to analyze the binned residuals of a regression
+model."""
+
+from __future__ import annotations
+
+__all__ = ["BinnedResidualState"]
+
+from typing import TYPE_CHECKING, Any
+
+from arkas.figure.utils import get_default_config
+from arkas.metric.utils import check_nan_policy, check_same_shape_pred
+from arkas.state.arg import BaseArgState
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+
+    from arkas.figure.base import BaseFigureConfig
+
+
+class BinnedResidualState(BaseArgState):
+    r"""Implement the state to analyze the binned residuals of a
+    regression model.
+
+    Args:
+        y_true: The ground truth target values. This input must be an
+            array of shape ``(n_samples,)``.
+        y_pred: The predicted values. This input must be an array of
+            shape ``(n_samples,)``.
+        y_true_name: The name associated to the ground truth target
+            values.
+        y_pred_name: The name associated to the predicted values.
+        bins: The number of bins, or the monotonically increasing bin
+            edges of the predicted values.
+        strategy: The strategy to find the bin edges if ``bins`` is
+            the number of bins. The following options are available:
+            ``'quantile'`` and ``'uniform'``.
+        nan_policy: The policy on how to handle NaN values in the input
+            arrays. The following options are available: ``'omit'``,
+            ``'propagate'``, and ``'raise'``.
+        figure_config: An optional figure configuration.
+        **kwargs: Additional keyword arguments.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.state import BinnedResidualState
+    >>> state = BinnedResidualState(
+    ...     y_true=np.array([1, 2, 3, 4, 5, 6]),
+    ...     y_pred=np.array([2, 2, 3, 3, 6, 8]),
+    ...     y_true_name="target",
+    ...     y_pred_name="pred",
+    ... )
+    >>> state
+    BinnedResidualState(y_true=(6,), y_pred=(6,), y_true_name='target', y_pred_name='pred', bins=10, strategy='quantile', nan_policy='propagate', figure_config=MatplotlibFigureConfig())
+
+    ```
+    """
+
+    def __init__(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        y_true_name: str,
+        y_pred_name: str,
+        bins: int | Sequence[float] | np.ndarray = 10,
+        strategy: str = "quantile",
+        nan_policy: str = "propagate",
+        figure_config: BaseFigureConfig | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._y_true = y_true.ravel()
+        self._y_pred = y_pred.ravel()
+        check_same_shape_pred(y_true=self._y_true, y_pred=self._y_pred)
+
+        self._y_true_name = y_true_name
+        self._y_pred_name = y_pred_name
+        self._bins = bins
+        self._strategy = strategy
+
+        check_nan_policy(nan_policy)
+        self._nan_policy = nan_policy
+        self._figure_config = figure_config or get_default_config()
+
+    @property
+    def y_true(self) -> np.ndarray:
+        return self._y_true
+
+    @property
+    def y_pred(self) -> np.ndarray:
+        return self._y_pred
+
+    @property
+    def y_true_name(self) -> str:
+        return self._y_true_name
+
+    @property
+    def y_pred_name(self) -> str:
+        return self._y_pred_name
+
+    @property
+    def bins(self) -> int | Sequence[float] | np.ndarray:
+        return self._bins
+
+    @property
+    def strategy(self) -> str:
+        return self._strategy
+
+    @property
+    def nan_policy(self) -> str:
+        return self._nan_policy
+
+    @property
+    def figure_config(self) -> BaseFigureConfig | None:
+        return self._figure_config
+
+    def get_args(self) -> dict:
+        return {
+            "y_true": self._y_true,
+            "y_pred": self._y_pred,
+            "y_true_name": self._y_true_name,
+            "y_pred_name": self._y_pred_name,
+            "bins": self._bins,
+            "strategy": self._strategy,
+            "nan_policy": self._nan_policy,
+            "figure_config": self._figure_config,
+        } | super().get_args()
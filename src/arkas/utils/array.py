@@ -87,6 +87,9 @@ def nonnan(array: np.ndarray) -> np.ndarray:
 
     ```
     """
+    if np.issubdtype(array.dtype, np.integer) or array.dtype == np.bool_:
+        # The arrays with a dtype that cannot represent NaN are not scanned.
+        return array.ravel()
     mask = np.isnan(array)
     return array[~mask]
 
@@ -130,6 +133,12 @@ def rand_replace(
 def to_array(data: Any) -> np.ndarray:
     r"""Convert the input to a ``numpy.ndarray``.
 
+    The ``polars`` data keep their narrow dtype, and the numeric
+    columns without null values are converted without copy when
+    possible. The boolean columns with null values are converted to
+    ``float32`` values with NaN for the null values, instead of an
+    object array.
+
     Args:
         data: The data to convert to a NumPy array.
 
@@ -148,11 +157,18 @@ def to_array(data: Any) -> np.ndarray:
     array([1, 2, 3, 4, 5])
     >>> to_array(pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": [0, 1, 0, 1, 0]}))
     array([[1, 0], [2, 1], [3, 0], [4, 1], [5, 0]])
+    >>> to_array(pl.Series([True, False, None]))
+    array([ 1.,  0., nan], dtype=float32)
 
     ```
     """
     if isinstance(data, pl.Series):
+        if data.dtype == pl.Boolean and data.null_count() > 0:
+            data = data.cast(pl.Float32)
         return data.to_numpy()
     if isinstance(data, pl.DataFrame):
+        columns = [s.name for s in data.iter_columns() if s.dtype == pl.Boolean and s.null_count()]
+        if columns:
+            data = data.with_columns(pl.col(columns).cast(pl.Float32))
         return data.to_numpy()
     return coola_to_array(data)
@@ -0,0 +1,296 @@
+r"""Implement some utility functions to encode the label columns."""
+
+from __future__ import annotations
+
+__all__ = ["factorize_arrays", "factorize_labels", "is_string_like", "to_label_arrays"]
+
+import numpy as np
+import polars as pl
+
+from arkas.utils.array import to_array
+
+# The maximum label value to encode non-negative integer labels with a
+# lookup table when there are only a few samples.
+_MAX_DIRECT_LABEL = 1024
+
+
+def factorize_arrays(*arrays: np.ndarray) -> tuple[tuple[np.ndarray, ...], np.ndarray]:
+    r"""Encode several label arrays into dense integer codes with a
+    shared vocabulary.
+
+    The non-negative integer labels smaller than
+    ``max(1024, n_values)`` are encoded with a lookup table, so the
+    samples are not sorted. It includes the boolean labels and the
+    floating point labels with integer values, which are first
+    converted to the narrowest integer dtype. The integer arrays that
+    are already dense codes are returned without copy, and the other
+    codes use the narrowest unsigned integer dtype. The other labels
+    are encoded with ``numpy.unique``.
+
+    Args:
+        *arrays: The label arrays to encode. The arrays are
+            flattened and must not contain NaN.
+
+    Returns:
+        A tuple with the codes of each array, and the sorted labels
+            of the vocabulary.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.utils.labels import factorize_arrays
+    >>> (y_true, y_pred), labels = factorize_arrays(
+    ...     np.array([0, 0, 1, 1, 5, 5]), np.array([0, 1, 1, 5, 5, 5])
+    ... )
+    >>> y_true, y_pred
+    (array([0, 0, 1, 1, 2, 2], dtype=uint8), array([0, 1, 1, 2, 2, 2], dtype=uint8))
+    >>> labels
+    array([0, 1, 5])
+
+    ```
+    """
+    arrays = tuple(arr.ravel() for arr in arrays)
+    size = sum(arr.size for arr in arrays)
+    codes = _small_integer_codes(arrays, bound=max(_MAX_DIRECT_LABEL, size))
+    if codes is not None:
+        present = np.zeros(int(max(code.max() for code in codes if code.size)) + 1, dtype=bool)
+        for code in codes:
+            present[code] = True
+        labels = np.flatnonzero(present).astype(np.result_type(*arrays))
+        if labels.size < present.size:
+            # Remap the sparse labels to dense codes without sorting the samples.
+            lookup = np.cumsum(present, dtype=np.int64) - 1
+            lookup = lookup.astype(np.min_scalar_type(labels.size))
+            codes = tuple(lookup[code] for code in codes)
+        return codes, labels
+
+    labels, inverse = np.unique(np.concatenate(arrays), return_inverse=True)
+    inverse = inverse.ravel()
+    codes, start = [], 0
+    for arr in arrays:
+        codes.append(inverse[start : start + arr.size])
+        start += arr.size
+    return tuple(codes), labels
+
+
+def factorize_labels(*series: pl.Series) -> tuple[tuple[np.ndarray, ...], np.ndarray]:
+    r"""Encode several label columns into dense integer codes with a
+    shared vocabulary.
+
+    The vocabulary contains the sorted unique non-null values of all
+    the columns, so the code of a label is the same in all the
+    columns, and the classes keep the same order as with the original
+    labels. The string and categorical columns are encoded from the
+    physical codes of a ``polars`` categorical column, so only the
+    categories are sorted, not the rows. The other columns are
+    encoded with ``numpy.unique``.
+
+    Args:
+        *series: The label columns to encode.
+
+    Returns:
+        A tuple with the codes of each column, and the vocabulary.
+            The codes are ``int32`` arrays of shape ``(n_samples,)``
+            where ``codes[i]`` is the index of the label in the
+            vocabulary. If a column contains null values, its codes
+            are ``float64`` values and the null values are encoded
+            as NaN.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from arkas.utils.labels import factorize_labels
+    >>> (y_true, y_pred), vocabulary = factorize_labels(
+    ...     pl.Series(["cat", "dog", "cat", "bird"]), pl.Series(["cat", "cat", "dog", "bird"])
+    ... )
+    >>> y_true
+    array([1, 2, 1, 0], dtype=int32)
+    >>> y_pred
+    array([1, 1, 2, 0], dtype=int32)
+    >>> vocabulary
+    array(['bird', 'cat', 'dog'], dtype=object)
+
+    ```
+    """
+    if any(is_string_like(s.dtype) for s in series):
+        return _factorize_categorical(series)
+    nulls = [s.is_null().to_numpy() for s in series]
+    # The null values are dropped before the conversion, so the integer
+    # columns with null values are not upcast to float.
+    nonnull = np.concatenate([s.drop_nulls().to_numpy() for s in series])
+    vocabulary, inverse = np.unique(nonnull, return_inverse=True)
+    inverse = inverse.astype(np.int32)
+    codes, start = [], 0
+    for mask in nulls:
+        column = np.zeros(mask.shape, dtype=np.int32)
+        column[~mask] = inverse[start : start + column.size - int(mask.sum())]
+        codes.append(_fill_nulls(column, mask))
+        start += column.size - int(mask.sum())
+    return tuple(codes), vocabulary
+
+
+def is_string_like(dtype: pl.DataType) -> bool:
+    r"""Indicate if a ``polars`` data type contains string labels.
+
+    Args:
+        dtype: The data type to check.
+
+    Returns:
+        ``True`` if the data type is a string, categorical, or enum
+            data type, otherwise ``False``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from arkas.utils.labels import is_string_like
+    >>> is_string_like(pl.String)
+    True
+    >>> is_string_like(pl.Int64)
+    False
+
+    ```
+    """
+    return dtype.base_type() in {pl.String, pl.Categorical, pl.Enum}
+
+
+def to_label_arrays(*series: pl.Series) -> tuple[np.ndarray, ...]:
+    r"""Convert label columns to NumPy arrays that can be used by the
+    classification metrics.
+
+    The columns are encoded into dense integer codes with
+    ``factorize_labels`` if at least one column contains string
+    labels, so the metrics do not work on object arrays. Otherwise,
+    the columns are converted with ``to_array``.
+
+    Args:
+        *series: The label columns to convert.
+
+    Returns:
+        The arrays of each column.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from arkas.utils.labels import to_label_arrays
+    >>> to_label_arrays(pl.Series(["b", "a", "c"]), pl.Series(["b", "b", "c"]))
+    (array([1, 0, 2], dtype=int32), array([1, 1, 2], dtype=int32))
+    >>> to_label_arrays(pl.Series([1, 0, 2]), pl.Series([1, 1, 2]))
+    (array([1, 0, 2]), array([1, 1, 2]))
+
+    ```
+    """
+    if any(is_string_like(s.dtype) for s in series):
+        return factorize_labels(*series)[0]
+    return tuple(to_array(s).ravel() for s in series)
+
+
+def _factorize_categorical(
+    series: tuple[pl.Series, ...],
+) -> tuple[tuple[np.ndarray, ...], np.ndarray]:
+    r"""Encode label columns into dense integer codes with the physical
+    codes of ``polars`` categorical columns.
+
+    Args:
+        series: The label columns to encode.
+
+    Returns:
+        A tuple with the codes of each column, and the vocabulary.
+    """
+    physicals, categories, used = [], [], []
+    for s in series:
+        if s.dtype.base_type() not in {pl.Categorical, pl.Enum}:
+            s = s.cast(pl.String).cast(pl.Categorical)  # noqa: PLW2901
+        cats = s.cat.get_categories().to_numpy()
+        physical = s.to_physical()
+        nulls = physical.is_null().to_numpy()
+        physical = physical.fill_null(0).to_numpy()
+        # The categories can be shared by several columns, so only
+        # the categories used by the column are kept.
+        mask = np.bincount(physical[~nulls], minlength=cats.size) > 0
+        physicals.append((physical, nulls))
+        categories.append(cats)
+        used.append(mask)
+
+    vocabulary = np.unique(np.concatenate([cats[mask] for cats, mask in zip(categories, used)]))
+    codes = []
+    for (physical, nulls), cats, mask in zip(physicals, categories, used):
+        lookup = np.zeros(cats.size, dtype=np.int32)
+        lookup[mask] = np.searchsorted(vocabulary, cats[mask])
+        codes.append(_fill_nulls(lookup[physical], nulls))
+    return tuple(codes), vocabulary
+
+
+def _small_integer_codes(
+    arrays: tuple[np.ndarray, ...], bound: int
+) -> tuple[np.ndarray, ...] | None:
+    r"""Return the label arrays as integer arrays if all the labels are
+    non-negative integers smaller than a bound.
+
+    The integer arrays are returned without copy, the boolean arrays
+    are viewed as ``uint8`` arrays, and the floating point arrays are
+    converted to the narrowest unsigned integer dtype.
+
+    Args:
+        arrays: The 1d label arrays.
+        bound: The exclusive upper bound of the labels.
+
+    Returns:
+        The integer arrays, or ``None`` if at least one label is not
+            a non-negative integer smaller than the bound, or if all
+            the arrays are empty.
+    """
+    codes = []
+    for arr in arrays:
+        if arr.dtype == np.bool_:
+            arr = arr.view(np.uint8)  # noqa: PLW2901
+        elif arr.size == 0 and not np.issubdtype(arr.dtype, np.integer):
+            arr = np.zeros(0, dtype=np.int64)  # noqa: PLW2901
+        elif np.issubdtype(arr.dtype, np.floating):
+            low, high = arr.min(), arr.max()
+            # The comparisons are False if the array contains NaN.
+            if not (low >= 0 and high < bound):
+                return None
+            code = arr.astype(np.min_scalar_type(int(high)))
+            if not np.array_equal(code, arr):
+                return None
+            arr = code  # noqa: PLW2901
+        elif not np.issubdtype(arr.dtype, np.integer):
+            return None
+        codes.append(arr)
+
+    nonempty = [code for code in codes if code.size > 0]
+    if (
+        nonempty
+        and min(code.min() for code in nonempty) >= 0
+        and max(code.max() for code in nonempty) < bound
+    ):
+        return tuple(codes)
+    return None
+
+
+def _fill_nulls(codes: np.ndarray, nulls: np.ndarray) -> np.ndarray:
+    r"""Return the codes of a column with NaN for the null values.
+
+    Args:
+        codes: The codes of all the values. The codes of the null
+            values are ignored.
+        nulls: The mask of the null values.
+
+    Returns:
+        The codes as an ``int32`` array if there is no null value,
+            otherwise a ``float64`` array with NaN for the null
+            values.
+    """
+    if not nulls.any():
+        return codes
+    out = np.full(nulls.shape, np.nan)
+    out[~nulls] = codes[~nulls]
+    return out
@@ -0,0 +1,258 @@
+r"""Implement a mergeable quantile sketch."""
+
+from __future__ import annotations
+
+__all__ = ["KLLSketch"]
+
+import math
+from typing import Any
+
+import numpy as np
+from coola import objects_are_equal
+from coola.utils.format import repr_mapping_line
+
+
+class KLLSketch:
+    r"""Implement a KLL sketch to approximate the quantiles of a stream
+    of values.
+
+    The sketch stores the values in a hierarchy of compactors. The
+    values of the ``h``-th compactor have a weight of ``2 ** h``.
+    When the sketch is full, the lowest compactor that exceeds its
+    capacity is sorted and every other value is promoted to the next
+    compactor, so the memory is ``O(k)`` values and does not depend
+    on the number of values. The compactors of two sketches can be
+    merged, so the sketches computed on different shards of data give
+    the same guarantees as one sketch computed on all the data.
+
+    The quantiles are exact while the number of values is smaller
+    than ``k``. Otherwise, the rank error of a quantile is about
+    ``1.7 / k`` of the number of values. The compactions alternate
+    the kept values of each compactor, so the sketch is
+    deterministic.
+
+    Reference: Karnin, Lang, and Liberty. Optimal Quantile
+        Approximation in Streams. FOCS 2016.
+
+    Args:
+        k: The capacity of the largest compactor, which controls the
+            accuracy and the memory of the sketch.
+
+    Raises:
+        ValueError: if ``k`` is lower than 2.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from arkas.utils.sketch import KLLSketch
+    >>> sketch = KLLSketch(k=200)
+    >>> sketch.update(np.array([1.0, 2.0, 3.0, 4.0]))
+    >>> sketch.update(np.array([5.0]))
+    >>> sketch.count
+    5
+    >>> sketch.quantile(0.5)
+    3.0
+
+    ```
+    """
+
+    # The ratio between the capacities of two consecutive compactors.
+    _CAPACITY_RATIO = 2 / 3
+
+    def __init__(self, k: int = 1024) -> None:
+        if k < 2:
+            msg = f"Incorrect 'k': {k}. The value must be greater than 1"
+            raise ValueError(msg)
+        self._k = int(k)
+        self._compactors = [np.array([], dtype=np.float64)]
+        # The offset of the next compaction of each compactor.
+        self._offsets = [0]
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line(
+            {"k": self._k, "count": self.count, "num_retained": self.num_retained}
+        )
+        return f"{self.__class__.__qualname__}({args})"
+
+    @property
+    def count(self) -> int:
+        r"""The number of values added to the sketch."""
+        return sum(compactor.size << level for level, compactor in enumerate(self._compactors))
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def num_retained(self) -> int:
+        r"""The number of values stored in the sketch."""
+        return sum(compactor.size for compactor in self._compactors)
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        r"""Indicate if two sketches are equal or not.
+
+        Args:
+            other: The other object to compare.
+            equal_nan: Whether to compare NaN's as equal. If ``True``,
+                NaN's in both objects will be considered equal.
+
+        Returns:
+            ``True`` if the sketches are equal, otherwise ``False``.
+        """
+        if not isinstance(other, self.__class__):
+            return False
+        return self._k == other._k and objects_are_equal(
+            self._compactors, other._compactors, equal_nan=equal_nan
+        )
+
+    def merge(self, other: KLLSketch) -> None:
+        r"""Merge the values of another sketch in the current sketch.
+
+        Args:
+            other: The other sketch. It must have the same ``k`` as
+                the current sketch.
+
+        Raises:
+            ValueError: if ``other`` has a different ``k``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.utils.sketch import KLLSketch
+        >>> sketch1 = KLLSketch()
+        >>> sketch1.update(np.array([1.0, 2.0, 3.0]))
+        >>> sketch2 = KLLSketch()
+        >>> sketch2.update(np.array([4.0, 5.0]))
+        >>> sketch1.merge(sketch2)
+        >>> sketch1.quantile(0.5)
+        3.0
+
+        ```
+        """
+        if other.k != self._k:
+            msg = f"The sketches must have the same 'k', but received {self._k} and {other.k}"
+            raise ValueError(msg)
+        for level, compactor in enumerate(other._compactors):
+            self._add(level, compactor)
+        self._compress()
+
+    def quantile(self, q: float) -> float:
+        r"""Return an approximation of a quantile of the values.
+
+        If the sketch has never been compacted, the quantile is
+        computed exactly with ``numpy.quantile``. Otherwise, the
+        quantile is the smallest stored value whose weighted rank is
+        greater than or equal to ``q`` times the number of values.
+
+        Args:
+            q: The probability of the quantile, in ``[0, 1]``.
+
+        Returns:
+            The quantile, or NaN if the sketch is empty.
+
+        Raises:
+            ValueError: if ``q`` is not in ``[0, 1]``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.utils.sketch import KLLSketch
+        >>> sketch = KLLSketch(k=100)
+        >>> sketch.update(np.arange(100_000, dtype=float))
+        >>> sketch.num_retained < 1_000
+        True
+        >>> abs(sketch.quantile(0.5) - 50_000) < 2_000
+        True
+
+        ```
+        """
+        if not 0 <= q <= 1:
+            msg = f"Incorrect 'q': {q}. The value must be in [0, 1]"
+            raise ValueError(msg)
+        if self.num_retained == 0:
+            return float("nan")
+        if len(self._compactors) == 1:
+            return float(np.quantile(self._compactors[0], q))
+        values = np.concatenate(self._compactors)
+        weights = np.concatenate(
+            [
+                np.full(compactor.size, 1 << level, dtype=np.int64)
+                for level, compactor in enumerate(self._compactors)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        ranks = np.cumsum(weights[order])
+        index = min(int(np.searchsorted(ranks, q * ranks[-1])), order.size - 1)
+        return float(values[order[index]])
+
+    def update(self, values: np.ndarray) -> None:
+        r"""Add values to the sketch.
+
+        Args:
+            values: The values to add. The array is flattened and
+                must not contain NaN.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from arkas.utils.sketch import KLLSketch
+        >>> sketch = KLLSketch()
+        >>> sketch.update(np.array([3.0, 1.0, 2.0]))
+        >>> sketch.count
+        3
+
+        ```
+        """
+        self._add(0, np.asarray(values, dtype=np.float64).ravel())
+        self._compress()
+
+    def _add(self, level: int, values: np.ndarray) -> None:
+        r"""Add values to a compactor.
+
+        Args:
+            level: The level of the compactor.
+            values: The values to add.
+        """
+        while len(self._compactors) <= level:
+            self._compactors.append(np.array([], dtype=np.float64))
+            self._offsets.append(0)
+        if values.size:
+            self._compactors[level] = np.concatenate([self._compactors[level], values])
+
+    def _capacity(self, level: int) -> int:
+        r"""Return the capacity of a compactor.
+
+        Args:
+            level: The level of the compactor.
+
+        Returns:
+            The capacity of the compactor.
+        """
+        depth = len(self._compactors) - level - 1
+        return max(2, math.ceil(self._k * self._CAPACITY_RATIO**depth))
+
+    def _compress(self) -> None:
+        r"""Compact the compactors until the number of stored values
+        is lower than or equal to the capacity of the sketch."""
+        while self.num_retained > sum(map(self._capacity, range(len(self._compactors)))):
+            level = next(
+                level
+                for level, compactor in enumerate(self._compactors)
+                if compactor.size > self._capacity(level)
+            )
+            values = np.sort(self._compactors[level])
+            # If the number of values is odd, the largest value stays in
+            # the compactor so the total weight is preserved.
+            num_promoted = values.size - values.size % 2
+            offset = self._offsets[level]
+            self._offsets[level] = 1 - offset
+            self._compactors[level] = values[num_promoted:]
+            self._add(level + 1, values[offset:num_promoted:2])
@@ -9,11 +9,11 @@ __all__ = [
     "quantile",
 ]
 
+import math
 from typing import TYPE_CHECKING
 
 import numpy as np
 import polars as pl
-from scipy.stats import kurtosis, skew
 
 from arkas.utils.array import nonnan
 
@@ -76,7 +76,11 @@ def compute_statistics_continuous_array(array: np.ndarray) -> dict[str, float]:
 
     ```
     """
-    array = array.ravel().astype(np.float64)
+    array = array.ravel()
+    if array.dtype == np.bool_:
+        # The boolean values are viewed as integers to compute the
+        # statistics without copy.
+        array = array.view(np.uint8)
     array_nonnan = nonnan(array)
     stats = {
         "count": int(array.size),
@@ -108,29 +112,33 @@ def compute_statistics_continuous_array(array: np.ndarray) -> dict[str, float]:
             "=0": 0,
         }
     quantiles = quantile(
-        array_nonnan, q=[0.001, 0.01, 0.05, 0.1, 0.25, 0.75, 0.9, 0.95, 0.99, 0.999]
+        array_nonnan, q=[0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 0.999]
     )
+    mean = np.mean(array_nonnan, dtype=np.float64).item()
+    m2, m3, m4 = _central_moments(array_nonnan, mean)
+    # Like scipy, the shape statistics are NaN for (almost) constant data.
+    constant = m2 <= (np.finfo(np.float64).eps * mean) ** 2
     return stats | {
-        "mean": np.mean(array_nonnan).item(),
-        "std": np.std(array_nonnan).item(),
-        "skewness": float(skew(array_nonnan)),
-        "kurtosis": float(kurtosis(array_nonnan)),
-        "min": np.min(array_nonnan).item(),
+        "mean": mean,
+        "std": math.sqrt(m2),
+        "skewness": float("nan") if constant else m3 / m2**1.5,
+        "kurtosis": float("nan") if constant else m4 / m2**2 - 3.0,
+        "min": float(np.min(array_nonnan)),
         "q001": quantiles[0.001],
         "q01": quantiles[0.01],
         "q05": quantiles[0.05],
         "q10": quantiles[0.1],
         "q25": quantiles[0.25],
-        "median": np.median(array_nonnan).item(),
+        "median": quantiles[0.5],
         "q75": quantiles[0.75],
         "q90": quantiles[0.9],
         "q95": quantiles[0.95],
         "q99": quantiles[0.99],
         "q999": quantiles[0.999],
-        "max": np.max(array_nonnan).item(),
-        ">0": (array > 0).sum().item(),
-        "<0": (array < 0).sum().item(),
-        "=0": (array == 0).sum().item(),
+        "max": float(np.max(array_nonnan)),
+        ">0": int(np.count_nonzero(array > 0)),
+        "<0": int(np.count_nonzero(array < 0)),
+        "=0": int(np.count_nonzero(array == 0)),
     }
 
 
@@ -194,4 +202,35 @@ def quantile(array: np.ndarray, q: Sequence[float]) -> dict[float, float]:
     array = array.ravel()
     if array.size == 0:
         return {v: float("nan") for v in q}
-    return dict(zip(q, np.quantile(array.astype(np.float64), q).tolist()))
+    if array.dtype == np.bool_:
+        array = array.view(np.uint8)
+    # ``numpy.quantile`` partitions a copy of the array, so the array
+    # is not converted to ``float64`` to keep the copy narrow.
+    return dict(zip(q, np.quantile(array, q).tolist()))
+
+
+def _central_moments(
+    array: np.ndarray, mean: float, chunk_size: int = 1_048_576
+) -> tuple[float, float, float]:
+    r"""Compute the second, third, and fourth central moments of the
+    data.
+
+    The array is processed in chunks, so only the chunks are widened
+    to ``float64`` and the input can keep a narrow dtype.
+
+    Args:
+        array: The data without NaN.
+        mean: The mean of the data.
+        chunk_size: The number of values in each chunk.
+
+    Returns:
+        A tuple with the second, third, and fourth central moments.
+    """
+    m2 = m3 = m4 = 0.0
+    for start in range(0, array.size, chunk_size):
+        diff = np.subtract(array[start : start + chunk_size], mean, dtype=np.float64)
+        square = diff * diff
+        m2 += float(square.sum())
+        m3 += float(np.dot(square, diff))
+        m4 += float(np.dot(square, square))
+    return m2 / array.size, m3 / array.size, m4 / array.size
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import polars as pl
+import pytest
+from grizz.exceptions import ColumnNotFoundError, ColumnNotFoundWarning
+
+from arkas.analyzer import BinnedResidualAnalyzer
+from arkas.figure import MatplotlibFigureConfig
+from arkas.output import BinnedResidualOutput, EmptyOutput, Output
+from arkas.state import BinnedResidualState
+
+
+@pytest.fixture
+def dataframe() -> pl.DataFrame:
+    return pl.DataFrame(
+        {"pred": [2.0, 2.0, 3.0, 3.0, 6.0, 8.0], "target": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]}
+    )
+
+
+############################################
+#     Tests for BinnedResidualAnalyzer     #
+############################################
+
+
+def test_binned_residual_analyzer_repr() -> None:
+    assert repr(BinnedResidualAnalyzer(y_true="target", y_pred="pred")).startswith(
+        "BinnedResidualAnalyzer("
+    )
+
+
+def test_binned_residual_analyzer_str() -> None:
+    assert str(BinnedResidualAnalyzer(y_true="target", y_pred="pred")).startswith(
+        "BinnedResidualAnalyzer("
+    )
+
+
+def test_binned_residual_analyzer_analyze(dataframe: pl.DataFrame) -> None:
+    assert (
+        BinnedResidualAnalyzer(y_true="target", y_pred="pred")
+        .analyze(dataframe)
+        .equal(
+            BinnedResidualOutput(
+                state=BinnedResidualState(
+                    y_true=np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+                    y_pred=np.array([2.0, 2.0, 3.0, 3.0, 6.0, 8.0]),
+                    y_true_name="target",
+                    y_pred_name="pred",
+                )
+            )
+        )
+    )
+
+
+def test_binned_residual_analyzer_analyze_args(dataframe: pl.DataFrame) -> None:
+    assert (
+        BinnedResidualAnalyzer(
+            y_true="target",
+            y_pred="pred",
+            bins=[0, 4, 8],
+            strategy="uniform",
+            figure_config=MatplotlibFigureConfig(dpi=50),
+        )
+        .analyze(dataframe)
+        .equal(
+            BinnedResidualOutput(
+                state=BinnedResidualState(
+                    y_true=np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+                    y_pred=np.array([2.0, 2.0, 3.0, 3.0, 6.0, 8.0]),
+                    y_true_name="target",
+                    y_pred_name="pred",
+                    bins=[0, 4, 8],
+                    strategy="uniform",
+                    figure_config=MatplotlibFigureConfig(dpi=50),
+                )
+            )
+        )
+    )
+
+
+def test_binned_residual_analyzer_analyze_lazy_false(dataframe: pl.DataFrame) -> None:
+    assert isinstance(
+        BinnedResidualAnalyzer(y_true="target", y_pred="pred").analyze(dataframe, lazy=False),
+        Output,
+    )
+
+
+def test_binned_residual_analyzer_analyze_drop_nulls() -> None:
+    assert (
+        BinnedResidualAnalyzer(y_true="target", y_pred="pred")
+        .analyze(
+            pl.DataFrame(
+                {
+                    "pred": [3, 2, 0, 1, 0, None, 1, None],
+                    "target": [1, 2, 3, 2, 1, 2, None, None],
+                    "col": [1, None, 3, 4, 5, None, 7, None],
+                }
+            )
+        )
+        .equal(
+            BinnedResidualOutput(
+                state=BinnedResidualState(
+                    y_true=np.array([1, 2, 3, 2, 1]),
+                    y_pred=np.array([3, 2, 0, 1, 0]),
+                    y_true_name="target",
+                    y_pred_name="pred",
+                )
+            )
+        )
+    )
+
+
+def test_binned_residual_analyzer_analyze_drop_nulls_false() -> None:
+    assert (
+        BinnedResidualAnalyzer(y_true="target", y_pred="pred", drop_nulls=False)
+        .analyze(
+            pl.DataFrame(
+                {
+                    "pred": [3, 2, 0, 1, 0, None, 1, None],
+                    "target": [1, 2, 3, 2, 1, 2, None, None],
+                }
+            )
+        )
+        .equal(
+            BinnedResidualOutput(
+                state=BinnedResidualState(
+                    y_true=np.array([1.0, 2.0, 3.0, 2.0, 1.0, 2.0, float("nan"), float("nan")]),
+                    y_pred=np.array([3.0, 2.0, 0.0, 1.0, 0.0, float("nan"), 1.0, float("nan")]),
+                    y_true_name="target",
+                    y_pred_name="pred",
+                )
+            ),
+            equal_nan=True,
+        )
+    )
+
+
+@pytest.mark.parametrize("nan_policy", ["omit", "propagate", "raise"])
+def test_binned_residual_analyzer_analyze_nan_policy(
+    dataframe: pl.DataFrame, nan_policy: str
+) -> None:
+    assert (
+        BinnedResidualAnalyzer(y_true="target", y_pred="pred", nan_policy=nan_policy)
+        .analyze(dataframe)
+        .equal(
+            BinnedResidualOutput(
+                state=BinnedResidualState(
+                    y_true=np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+                    y_pred=np.array([2.0, 2.0, 3.0, 3.0, 6.0, 8.0]),
+                    y_true_name="target",
+                    y_pred_name="pred",
+                    nan_policy=nan_policy,
+                )
+            )
+        )
+    )
+
+
+def test_binned_residual_analyzer_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        BinnedResidualAnalyzer(y_true="target", y_pred="pred", nan_policy="incorrect")
+
+
+def test_binned_residual_analyzer_analyze_missing_policy_ignore(dataframe: pl.DataFrame) -> None:
+    analyzer = BinnedResidualAnalyzer(y_true="gt", y_pred="prob", missing_policy="ignore")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        out = analyzer.analyze(dataframe)
+    assert out.equal(EmptyOutput())
+
+
+def test_binned_residual_analyzer_analyze_missing_policy_raise(dataframe: pl.DataFrame) -> None:
+    analyzer = BinnedResidualAnalyzer(y_true="gt", y_pred="pred")
+    with pytest.raises(ColumnNotFoundError, match="column 'gt' is missing in the DataFrame"):
+        analyzer.analyze(dataframe)
+
+
+def test_binned_residual_analyzer_analyze_missing_policy_warn(dataframe: pl.DataFrame) -> None:
+    analyzer = BinnedResidualAnalyzer(y_true="target", y_pred="prob", missing_policy="warn")
+    with pytest.warns(
+        ColumnNotFoundWarning, match="column 'prob' is missing in the DataFrame and will be ignored"
+    ):
+        out = analyzer.analyze(dataframe)
+    assert out.equal(EmptyOutput())
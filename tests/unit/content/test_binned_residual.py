@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from arkas.content import BinnedResidualContentGenerator, ContentGenerator
+from arkas.content.binned_residual import create_table, create_template
+from arkas.evaluator2 import BinnedResidualEvaluator
+from arkas.plotter import BinnedResidualPlotter
+from arkas.state import BinnedResidualState
+
+
+@pytest.fixture
+def state() -> BinnedResidualState:
+    return BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+        y_pred=np.array([2.0, 2.0, 3.0, 3.0, 6.0, 8.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+        bins=3,
+    )
+
+
+####################################################
+#     Tests for BinnedResidualContentGenerator     #
+####################################################
+
+
+def test_binned_residual_content_generator_repr(state: BinnedResidualState) -> None:
+    assert repr(BinnedResidualContentGenerator.from_state(state)).startswith(
+        "BinnedResidualContentGenerator("
+    )
+
+
+def test_binned_residual_content_generator_str(state: BinnedResidualState) -> None:
+    assert str(BinnedResidualContentGenerator.from_state(state)).startswith(
+        "BinnedResidualContentGenerator("
+    )
+
+
+def test_binned_residual_content_generator_compute(state: BinnedResidualState) -> None:
+    assert isinstance(BinnedResidualContentGenerator.from_state(state).compute(), ContentGenerator)
+
+
+def test_binned_residual_content_generator_equal_true(state: BinnedResidualState) -> None:
+    assert BinnedResidualContentGenerator(
+        evaluator=BinnedResidualEvaluator(state), plotter=BinnedResidualPlotter(state)
+    ).equal(
+        BinnedResidualContentGenerator(
+            evaluator=BinnedResidualEvaluator(state), plotter=BinnedResidualPlotter(state)
+        )
+    )
+
+
+def test_binned_residual_content_generator_equal_false_different_evaluator(
+    state: BinnedResidualState,
+) -> None:
+    state2 = BinnedResidualState(
+        y_true=np.array([1.0, 2.0]), y_pred=np.array([1.0, 3.0]), y_true_name="a", y_pred_name="b"
+    )
+    assert not BinnedResidualContentGenerator(
+        evaluator=BinnedResidualEvaluator(state), plotter=BinnedResidualPlotter(state)
+    ).equal(
+        BinnedResidualContentGenerator(
+            evaluator=BinnedResidualEvaluator(state2), plotter=BinnedResidualPlotter(state)
+        )
+    )
+
+
+def test_binned_residual_content_generator_equal_false_different_plotter(
+    state: BinnedResidualState,
+) -> None:
+    state2 = BinnedResidualState(
+        y_true=np.array([1.0, 2.0]), y_pred=np.array([1.0, 3.0]), y_true_name="a", y_pred_name="b"
+    )
+    assert not BinnedResidualContentGenerator(
+        evaluator=BinnedResidualEvaluator(state), plotter=BinnedResidualPlotter(state)
+    ).equal(
+        BinnedResidualContentGenerator(
+            evaluator=BinnedResidualEvaluator(state), plotter=BinnedResidualPlotter(state2)
+        )
+    )
+
+
+def test_binned_residual_content_generator_equal_false_different_type(
+    state: BinnedResidualState,
+) -> None:
+    assert not BinnedResidualContentGenerator.from_state(state).equal(42)
+
+
+def test_binned_residual_content_generator_generate_content(state: BinnedResidualState) -> None:
+    assert isinstance(BinnedResidualContentGenerator.from_state(state).generate_content(), str)
+
+
+def test_binned_residual_content_generator_generate_content_fixed_edges() -> None:
+    content = BinnedResidualContentGenerator.from_state(
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([1.0, 3.0, 5.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+            bins=[0, 2, 4, 6, 8],
+        )
+    ).generate_content()
+    assert "fixed edges" in content
+
+
+def test_binned_residual_content_generator_generate_content_empty() -> None:
+    assert isinstance(
+        BinnedResidualContentGenerator.from_state(
+            BinnedResidualState(
+                y_true=np.array([]), y_pred=np.array([]), y_true_name="target", y_pred_name="pred"
+            )
+        ).generate_content(),
+        str,
+    )
+
+
+def test_binned_residual_content_generator_generate_body(state: BinnedResidualState) -> None:
+    assert isinstance(BinnedResidualContentGenerator.from_state(state).generate_body(), str)
+
+
+def test_binned_residual_content_generator_generate_body_args(state: BinnedResidualState) -> None:
+    assert isinstance(
+        BinnedResidualContentGenerator.from_state(state).generate_body(
+            number="1.", tags=["meow"], depth=1
+        ),
+        str,
+    )
+
+
+def test_binned_residual_content_generator_generate_toc(state: BinnedResidualState) -> None:
+    assert isinstance(BinnedResidualContentGenerator.from_state(state).generate_toc(), str)
+
+
+def test_binned_residual_content_generator_generate_toc_args(state: BinnedResidualState) -> None:
+    assert isinstance(
+        BinnedResidualContentGenerator.from_state(state).generate_toc(
+            number="1.", tags=["meow"], depth=1
+        ),
+        str,
+    )
+
+
+def test_binned_residual_content_generator_from_state(state: BinnedResidualState) -> None:
+    assert BinnedResidualContentGenerator.from_state(state).equal(
+        BinnedResidualContentGenerator(
+            evaluator=BinnedResidualEvaluator(state), plotter=BinnedResidualPlotter(state)
+        )
+    )
+
+
+#####################################
+#     Tests for create_template     #
+#####################################
+
+
+def test_create_template() -> None:
+    assert isinstance(create_template(), str)
+
+
+##################################
+#     Tests for create_table     #
+##################################
+
+
+def test_create_table() -> None:
+    table = create_table(
+        {
+            "bin_bias": np.array([0.5, -0.5, np.nan]),
+            "bin_count": np.array([2, 2, 0]),
+            "bin_edges": np.array([0.0, 3.0, 6.0, 9.0]),
+            "bin_mae": np.array([0.5, 0.5, np.nan]),
+            "bin_rmse": np.array([0.7, 0.7, np.nan]),
+            "count": 4,
+        }
+    )
+    assert isinstance(table, str)
+    assert "[0, 3)" in table
+    assert "[6, 9]" in table
+
+
+def test_create_table_empty() -> None:
+    assert isinstance(
+        create_table(
+            {
+                "bin_bias": np.array([]),
+                "bin_count": np.array([], dtype=int),
+                "bin_edges": np.array([np.nan]),
+                "bin_mae": np.array([]),
+                "bin_rmse": np.array([]),
+                "count": 0,
+            }
+        ),
+        str,
+    )
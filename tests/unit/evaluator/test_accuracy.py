@@ -49,6 +49,21 @@ def test_accuracy_evaluator_evaluate_lazy_false() -> None:
     )
 
 
+def test_accuracy_evaluator_evaluate_string_labels() -> None:
+    assert (
+        AccuracyEvaluator(y_true="target", y_pred="pred")
+        .evaluate(
+            pl.DataFrame({"pred": ["d", "c", "a", "b", "a"], "target": ["b", "c", "d", "c", "b"]})
+        )
+        .equal(
+            AccuracyResult(
+                y_true=np.array([1, 2, 3, 2, 1], dtype=np.int32),
+                y_pred=np.array([3, 2, 0, 1, 0], dtype=np.int32),
+            )
+        )
+    )
+
+
 def test_accuracy_evaluator_evaluate_missing_keys() -> None:
     assert (
         AccuracyEvaluator(y_true="target", y_pred="prediction")
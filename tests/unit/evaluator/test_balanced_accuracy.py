@@ -44,6 +44,19 @@ def test_balanced_accuracy_evaluator_evaluate_lazy_false() -> None:
     )
 
 
+def test_balanced_accuracy_evaluator_evaluate_string_labels() -> None:
+    assert (
+        BalancedAccuracyEvaluator(y_true="target", y_pred="pred")
+        .evaluate(
+            pl.DataFrame(
+                {"pred": ["cat", "dog", "dog", "bird"], "target": ["cat", "cat", "dog", "bird"]}
+            ),
+            lazy=False,
+        )
+        .equal(Result(metrics={"balanced_accuracy": 5 / 6, "count": 4}))
+    )
+
+
 def test_balanced_accuracy_evaluator_evaluate_missing_keys() -> None:
     assert (
         BalancedAccuracyEvaluator(y_true="target", y_pred="prediction")
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_allclose
+
+from arkas.evaluator import DeLongEvaluator
+from arkas.result import DeLongResult, EmptyResult, Result
+
+
+@pytest.fixture
+def data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "a": [0.9, 0.2, 0.6, 0.8, 0.4, 0.1],
+            "b": [0.8, 0.3, 0.1, 0.7, 0.2, 0.5],
+            "target": [1, 0, 0, 1, 1, 0],
+        }
+    )
+
+
+#####################################
+#     Tests for DeLongEvaluator     #
+#####################################
+
+
+def test_delong_evaluator_repr() -> None:
+    assert repr(DeLongEvaluator(y_true="target", y_scores=["a", "b"])).startswith(
+        "DeLongEvaluator("
+    )
+
+
+def test_delong_evaluator_str() -> None:
+    assert str(DeLongEvaluator(y_true="target", y_scores=["a", "b"])).startswith("DeLongEvaluator(")
+
+
+def test_delong_evaluator_incorrect_confidence_level() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect 'confidence_level': 2\.0"):
+        DeLongEvaluator(y_true="target", y_scores=["a", "b"], confidence_level=2.0)
+
+
+def test_delong_evaluator_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        DeLongEvaluator(y_true="target", y_scores=["a", "b"], nan_policy="incorrect")
+
+
+def test_delong_evaluator_evaluate(data: pl.DataFrame) -> None:
+    assert (
+        DeLongEvaluator(y_true="target", y_scores=["a", "b"])
+        .evaluate(data)
+        .equal(
+            DeLongResult(
+                y_true=np.array([1, 0, 0, 1, 1, 0]),
+                y_scores={
+                    "a": np.array([0.9, 0.2, 0.6, 0.8, 0.4, 0.1]),
+                    "b": np.array([0.8, 0.3, 0.1, 0.7, 0.2, 0.5]),
+                },
+            )
+        )
+    )
+
+
+def test_delong_evaluator_evaluate_lazy_false(data: pl.DataFrame) -> None:
+    result = DeLongEvaluator(y_true="target", y_scores=["a", "b"]).evaluate(data, lazy=False)
+    assert isinstance(result, Result)
+    assert objects_are_allclose(
+        result.compute_metrics(),
+        {
+            "a_roc_auc": 8 / 9,
+            "a_roc_auc_ci_high": 1.0,
+            "a_roc_auc_ci_low": 0.5809102612556272,
+            "a_roc_auc_variance": 2 / 81,
+            "a_vs_b_pvalue": 0.6547208460185772,
+            "a_vs_b_roc_auc_diff": 1 / 9,
+            "a_vs_b_z_score": 0.44721359549995776,
+            "b_roc_auc": 7 / 9,
+            "b_roc_auc_ci_high": 1.0,
+            "b_roc_auc_ci_low": 0.2908208107907881,
+            "b_roc_auc_variance": 5 / 81,
+            "count": 6,
+        },
+    )
+
+
+def test_delong_evaluator_evaluate_missing_keys(data: pl.DataFrame) -> None:
+    assert (
+        DeLongEvaluator(y_true="target", y_scores=["a", "missing"])
+        .evaluate(data)
+        .equal(EmptyResult())
+    )
+
+
+def test_delong_evaluator_evaluate_lazy_false_missing_keys(data: pl.DataFrame) -> None:
+    assert (
+        DeLongEvaluator(y_true="missing", y_scores=["a", "b"])
+        .evaluate(data, lazy=False)
+        .equal(EmptyResult())
+    )
+
+
+def test_delong_evaluator_evaluate_drop_nulls() -> None:
+    assert (
+        DeLongEvaluator(y_true="target", y_scores=["a", "b"])
+        .evaluate(
+            pl.DataFrame(
+                {
+                    "a": [0.9, 0.2, None, 0.8, 0.4],
+                    "b": [0.8, 0.3, 0.1, None, 0.2],
+                    "target": [1, 0, 0, 1, 1],
+                }
+            )
+        )
+        .equal(
+            DeLongResult(
+                y_true=np.array([1, 0, 1]),
+                y_scores={"a": np.array([0.9, 0.2, 0.4]), "b": np.array([0.8, 0.3, 0.2])},
+            )
+        )
+    )
+
+
+def test_delong_evaluator_evaluate_drop_nulls_false() -> None:
+    assert (
+        DeLongEvaluator(y_true="target", y_scores=["a", "b"], drop_nulls=False)
+        .evaluate(
+            pl.DataFrame(
+                {
+                    "a": [0.9, 0.2, None, 0.8],
+                    "b": [0.8, 0.3, 0.1, 0.7],
+                    "target": [1, 0, 0, 1],
+                }
+            )
+        )
+        .equal(
+            DeLongResult(
+                y_true=np.array([1, 0, 0, 1]),
+                y_scores={
+                    "a": np.array([0.9, 0.2, float("nan"), 0.8]),
+                    "b": np.array([0.8, 0.3, 0.1, 0.7]),
+                },
+            ),
+            equal_nan=True,
+        )
+    )
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from arkas.evaluator import GroupedMetricsEvaluator
+from arkas.result import EmptyResult, GroupedMetricsResult, Result
+
+
+@pytest.fixture
+def data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "country": ["fr", "fr", "fr", "us", "us", "us"],
+            "device": [1, 1, 2, 1, 1, 1],
+            "pred": [1, 0, 0, 1, 1, 0],
+            "target": [1, 0, 1, 1, 0, 0],
+        }
+    )
+
+
+#############################################
+#     Tests for GroupedMetricsEvaluator     #
+#############################################
+
+
+def test_grouped_metrics_evaluator_repr() -> None:
+    assert repr(
+        GroupedMetricsEvaluator(
+            groups=["country"], y_true="target", y_pred="pred", task="classification"
+        )
+    ).startswith("GroupedMetricsEvaluator(")
+
+
+def test_grouped_metrics_evaluator_str() -> None:
+    assert str(
+        GroupedMetricsEvaluator(
+            groups=["country"], y_true="target", y_pred="pred", task="classification"
+        )
+    ).startswith("GroupedMetricsEvaluator(")
+
+
+def test_grouped_metrics_evaluator_incorrect_task() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'task': incorrect"):
+        GroupedMetricsEvaluator(
+            groups=["country"], y_true="target", y_pred="pred", task="incorrect"
+        )
+
+
+def test_grouped_metrics_evaluator_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        GroupedMetricsEvaluator(
+            groups=["country"],
+            y_true="target",
+            y_pred="pred",
+            task="regression",
+            nan_policy="incorrect",
+        )
+
+
+def test_grouped_metrics_evaluator_evaluate(data: pl.DataFrame) -> None:
+    assert (
+        GroupedMetricsEvaluator(
+            groups=["country", "device"], y_true="target", y_pred="pred", task="classification"
+        )
+        .evaluate(data)
+        .equal(
+            GroupedMetricsResult(
+                groups={
+                    "country": np.array(["fr", "fr", "fr", "us", "us", "us"], dtype=object),
+                    "device": np.array([1, 1, 2, 1, 1, 1]),
+                },
+                y_true=np.array([1, 0, 1, 1, 0, 0]),
+                y_pred=np.array([1, 0, 0, 1, 1, 0]),
+                task="classification",
+            )
+        )
+    )
+
+
+def test_grouped_metrics_evaluator_evaluate_lazy_false(data: pl.DataFrame) -> None:
+    result = GroupedMetricsEvaluator(
+        groups=["country", "device"], y_true="target", y_pred="pred", task="classification"
+    ).evaluate(data, lazy=False)
+    assert isinstance(result, Result)
+    assert_frame_equal(
+        result.compute_metrics()["grouped_metrics"],
+        pl.DataFrame(
+            {
+                "country": ["fr", "fr", "us"],
+                "device": [1, 2, 1],
+                "count": [2, 1, 3],
+                "accuracy": [1.0, 0.0, 2 / 3],
+                "balanced_accuracy": [1.0, 0.0, 0.75],
+                "precision": [1.0, 0.0, 0.5],
+                "recall": [1.0, 0.0, 1.0],
+                "f1": [1.0, 0.0, 2 / 3],
+            }
+        ),
+    )
+
+
+def test_grouped_metrics_evaluator_evaluate_string_labels(data: pl.DataFrame) -> None:
+    data = data.with_columns(
+        pl.col("pred").replace_strict({0: "no", 1: "yes"}),
+        pl.col("target").replace_strict({0: "no", 1: "yes"}),
+    )
+    assert (
+        GroupedMetricsEvaluator(
+            groups=["country"], y_true="target", y_pred="pred", task="classification"
+        )
+        .evaluate(data)
+        .equal(
+            GroupedMetricsResult(
+                groups={"country": np.array(["fr", "fr", "fr", "us", "us", "us"], dtype=object)},
+                y_true=np.array([1, 0, 1, 1, 0, 0], dtype=np.int32),
+                y_pred=np.array([1, 0, 0, 1, 1, 0], dtype=np.int32),
+                task="classification",
+            )
+        )
+    )
+
+
+def test_grouped_metrics_evaluator_evaluate_missing_keys(data: pl.DataFrame) -> None:
+    assert (
+        GroupedMetricsEvaluator(
+            groups=["missing"], y_true="target", y_pred="pred", task="classification"
+        )
+        .evaluate(data)
+        .equal(EmptyResult())
+    )
+
+
+def test_grouped_metrics_evaluator_evaluate_lazy_false_missing_keys(data: pl.DataFrame) -> None:
+    assert (
+        GroupedMetricsEvaluator(
+            groups=["country"], y_true="target", y_pred="missing", task="classification"
+        )
+        .evaluate(data, lazy=False)
+        .equal(EmptyResult())
+    )
+
+
+def test_grouped_metrics_evaluator_evaluate_drop_nulls() -> None:
+    assert (
+        GroupedMetricsEvaluator(groups=["group"], y_true="target", y_pred="pred", task="regression")
+        .evaluate(
+            pl.DataFrame(
+                {
+                    "group": [1, 1, None, 2, 2],
+                    "pred": [1.0, 2.0, 3.0, None, 5.0],
+                    "target": [1.0, 2.0, 3.0, 4.0, 5.0],
+                }
+            )
+        )
+        .equal(
+            GroupedMetricsResult(
+                groups={"group": np.array([1, 1, 2])},
+                y_true=np.array([1.0, 2.0, 5.0]),
+                y_pred=np.array([1.0, 2.0, 5.0]),
+                task="regression",
+            )
+        )
+    )
+
+
+def test_grouped_metrics_evaluator_evaluate_drop_nulls_false_null_key() -> None:
+    frame = (
+        GroupedMetricsEvaluator(
+            groups=["group"],
+            y_true="target",
+            y_pred="pred",
+            task="classification",
+            drop_nulls=False,
+        )
+        .evaluate(
+            pl.DataFrame(
+                {
+                    "group": ["fr", None, "us", "fr", None],
+                    "pred": [1, 1, 1, 0, 0],
+                    "target": [1, 0, 1, 1, 0],
+                }
+            )
+        )
+        .compute_metrics()["grouped_metrics"]
+    )
+    assert frame["group"].to_list() == [None, "fr", "us"]
+    assert frame["count"].to_list() == [2, 2, 1]
+    assert frame["accuracy"].to_list() == [0.5, 0.5, 1.0]
+
+
+def test_grouped_metrics_evaluator_evaluate_drop_nulls_false() -> None:
+    assert (
+        GroupedMetricsEvaluator(
+            groups=["group"], y_true="target", y_pred="pred", task="regression", drop_nulls=False
+        )
+        .evaluate(
+            pl.DataFrame(
+                {
+                    "group": [1, 1, 2, 2],
+                    "pred": [1.0, 2.0, None, 5.0],
+                    "target": [1.0, 2.0, 4.0, 5.0],
+                }
+            )
+        )
+        .equal(
+            GroupedMetricsResult(
+                groups={"group": np.array([1, 1, 2, 2])},
+                y_true=np.array([1.0, 2.0, 4.0, 5.0]),
+                y_pred=np.array([1.0, 2.0, float("nan"), 5.0]),
+                task="regression",
+            ),
+            equal_nan=True,
+        )
+    )
@@ -54,6 +54,47 @@ def test_multiclass_confusion_matrix_evaluator_evaluate_lazy_false() -> None:
     )
 
 
+def test_multiclass_confusion_matrix_evaluator_evaluate_categorical_labels() -> None:
+    assert (
+        MulticlassConfusionMatrixEvaluator(y_true="target", y_pred="pred")
+        .evaluate(
+            pl.DataFrame(
+                {"pred": ["a", "b", "b", "c", "c", "c"], "target": ["a", "b", "b", "c", "c", "c"]},
+                schema={"pred": pl.Categorical, "target": pl.Categorical},
+            ),
+            lazy=False,
+        )
+        .equal(
+            Result(
+                {
+                    "confusion_matrix": np.array([[1, 0, 0], [0, 2, 0], [0, 0, 3]]),
+                    "count": 6,
+                }
+            )
+        )
+    )
+
+
+def test_multiclass_confusion_matrix_evaluator_evaluate_top_k() -> None:
+    assert (
+        MulticlassConfusionMatrixEvaluator(y_true="target", y_pred="pred", top_k=1)
+        .evaluate(
+            pl.DataFrame({"pred": [0, 2, 1, 1, 2, 1], "target": [0, 1, 1, 2, 2, 2]}),
+            lazy=False,
+        )
+        .equal(
+            Result(
+                {
+                    "count": 6,
+                    "top_confused_count": np.array([2]),
+                    "top_confused_pred": np.array([1]),
+                    "top_confused_true": np.array([2]),
+                }
+            )
+        )
+    )
+
+
 def test_multiclass_confusion_matrix_evaluator_evaluate_missing_keys() -> None:
     assert (
         MulticlassConfusionMatrixEvaluator(y_true="target", y_pred="prediction")
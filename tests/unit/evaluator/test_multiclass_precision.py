@@ -57,6 +57,29 @@ def test_multiclass_precision_evaluator_evaluate_lazy_false() -> None:
     )
 
 
+def test_multiclass_precision_evaluator_evaluate_string_labels() -> None:
+    assert (
+        MulticlassPrecisionEvaluator(y_true="target", y_pred="pred")
+        .evaluate(
+            pl.DataFrame(
+                {"pred": ["x", "x", "y", "y", "z", "z"], "target": ["x", "x", "y", "y", "z", "z"]}
+            ),
+            lazy=False,
+        )
+        .equal(
+            Result(
+                {
+                    "precision": np.array([1.0, 1.0, 1.0]),
+                    "count": 6,
+                    "macro_precision": 1.0,
+                    "micro_precision": 1.0,
+                    "weighted_precision": 1.0,
+                }
+            )
+        )
+    )
+
+
 def test_multiclass_precision_evaluator_evaluate_missing_keys() -> None:
     assert (
         MulticlassPrecisionEvaluator(y_true="target", y_pred="prediction")
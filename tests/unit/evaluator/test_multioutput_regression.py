@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_allclose
+
+from arkas.evaluator import MultioutputRegressionEvaluator
+from arkas.result import EmptyResult, MultioutputRegressionResult, Result
+
+COLUMNS = [("target_1", "pred_1"), ("target_2", "pred_2")]
+
+
+@pytest.fixture
+def dataframe() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "pred_1": [1, 2, 4, 4],
+            "pred_2": [3, 4, 6, 4],
+            "target_1": [1, 2, 3, 4],
+            "target_2": [2, 4, 6, 8],
+        }
+    )
+
+
+####################################################
+#     Tests for MultioutputRegressionEvaluator     #
+####################################################
+
+
+def test_multioutput_regression_evaluator_repr() -> None:
+    assert repr(MultioutputRegressionEvaluator(columns=COLUMNS)) == (
+        "MultioutputRegressionEvaluator(columns=(('target_1', 'pred_1'), ('target_2', 'pred_2')), "
+        "drop_nulls=True, nan_policy='propagate')"
+    )
+
+
+def test_multioutput_regression_evaluator_str() -> None:
+    assert str(MultioutputRegressionEvaluator(columns=COLUMNS)).startswith(
+        "MultioutputRegressionEvaluator("
+    )
+
+
+def test_multioutput_regression_evaluator_columns_list() -> None:
+    assert repr(MultioutputRegressionEvaluator(columns=[["target", "pred"]])).startswith(
+        "MultioutputRegressionEvaluator(columns=(('target', 'pred'),)"
+    )
+
+
+def test_multioutput_regression_evaluator_empty_columns() -> None:
+    with pytest.raises(ValueError, match="'columns' must contain at least one pair of columns"):
+        MultioutputRegressionEvaluator(columns=[])
+
+
+def test_multioutput_regression_evaluator_incorrect_columns() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'columns'"):
+        MultioutputRegressionEvaluator(columns=[("target", "pred", "col")])
+
+
+def test_multioutput_regression_evaluator_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        MultioutputRegressionEvaluator(columns=COLUMNS, nan_policy="incorrect")
+
+
+def test_multioutput_regression_evaluator_evaluate(dataframe: pl.DataFrame) -> None:
+    assert (
+        MultioutputRegressionEvaluator(columns=COLUMNS)
+        .evaluate(dataframe)
+        .equal(
+            MultioutputRegressionResult(
+                y_true=np.array([[1, 2], [2, 4], [3, 6], [4, 8]]),
+                y_pred=np.array([[1, 3], [2, 4], [4, 6], [4, 4]]),
+            )
+        )
+    )
+
+
+def test_multioutput_regression_evaluator_evaluate_lazy_false(dataframe: pl.DataFrame) -> None:
+    result = MultioutputRegressionEvaluator(columns=COLUMNS).evaluate(dataframe, lazy=False)
+    assert isinstance(result, Result)
+    metrics = result.compute_metrics()
+    assert metrics["count"] == 4
+    assert objects_are_allclose(metrics["mean_absolute_error"], np.array([0.25, 1.25]))
+    assert objects_are_allclose(metrics["macro_mean_absolute_error"], 0.75)
+
+
+def test_multioutput_regression_evaluator_evaluate_shared_target(
+    dataframe: pl.DataFrame,
+) -> None:
+    assert (
+        MultioutputRegressionEvaluator(columns=[("target_1", "pred_1"), ("target_1", "pred_2")])
+        .evaluate(dataframe)
+        .equal(
+            MultioutputRegressionResult(
+                y_true=np.array([[1, 1], [2, 2], [3, 3], [4, 4]]),
+                y_pred=np.array([[1, 3], [2, 4], [4, 6], [4, 4]]),
+            )
+        )
+    )
+
+
+def test_multioutput_regression_evaluator_evaluate_missing_keys(
+    dataframe: pl.DataFrame,
+) -> None:
+    assert (
+        MultioutputRegressionEvaluator(columns=[*COLUMNS, ("target_3", "missing")])
+        .evaluate(dataframe)
+        .equal(EmptyResult())
+    )
+
+
+def test_multioutput_regression_evaluator_evaluate_lazy_false_missing_keys(
+    dataframe: pl.DataFrame,
+) -> None:
+    assert (
+        MultioutputRegressionEvaluator(columns=[*COLUMNS, ("target_3", "missing")])
+        .evaluate(dataframe, lazy=False)
+        .equal(EmptyResult())
+    )
+
+
+def test_multioutput_regression_evaluator_evaluate_drop_nulls() -> None:
+    assert (
+        MultioutputRegressionEvaluator(columns=COLUMNS)
+        .evaluate(
+            pl.DataFrame(
+                {
+                    "pred_1": [1, 2, None, 4],
+                    "pred_2": [3, 4, 6, 4],
+                    "target_1": [1, 2, 3, 4],
+                    "target_2": [2, None, 6, 8],
+                    "col": [None, None, None, None],
+                }
+            )
+        )
+        .equal(
+            MultioutputRegressionResult(
+                y_true=np.array([[1, 2], [4, 8]]), y_pred=np.array([[1, 3], [4, 4]])
+            )
+        )
+    )
+
+
+def test_multioutput_regression_evaluator_evaluate_drop_nulls_false() -> None:
+    assert (
+        MultioutputRegressionEvaluator(columns=COLUMNS, drop_nulls=False)
+        .evaluate(
+            pl.DataFrame(
+                {
+                    "pred_1": [1, 2, None, 4],
+                    "pred_2": [3, 4, 6, 4],
+                    "target_1": [1, 2, 3, 4],
+                    "target_2": [2, None, 6, 8],
+                }
+            )
+        )
+        .equal(
+            MultioutputRegressionResult(
+                y_true=np.array([[1.0, 2.0], [2.0, float("nan")], [3.0, 6.0], [4.0, 8.0]]),
+                y_pred=np.array([[1.0, 3.0], [2.0, 4.0], [float("nan"), 6.0], [4.0, 4.0]]),
+            ),
+            equal_nan=True,
+        )
+    )
+
+
+@pytest.mark.parametrize("nan_policy", ["omit", "propagate", "raise"])
+def test_multioutput_regression_evaluator_evaluate_nan_policy(
+    dataframe: pl.DataFrame, nan_policy: str
+) -> None:
+    assert (
+        MultioutputRegressionEvaluator(columns=COLUMNS, nan_policy=nan_policy)
+        .evaluate(dataframe)
+        .equal(
+            MultioutputRegressionResult(
+                y_true=np.array([[1, 2], [2, 4], [3, 6], [4, 8]]),
+                y_pred=np.array([[1, 3], [2, 4], [4, 6], [4, 4]]),
+                nan_policy=nan_policy,
+            )
+        )
+    )
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from arkas.evaluator import QueryRankingEvaluator
+from arkas.result import EmptyResult, QueryRankingResult, Result
+
+
+@pytest.fixture
+def data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "query": ["a", "a", "a", "b", "b", "b", "b"],
+            "score": [0.1, 0.2, 0.9, 0.5, 0.8, 0.3, 0.4],
+            "target": [0, 1, 2, 1, 0, 0, 1],
+        }
+    )
+
+
+###########################################
+#     Tests for QueryRankingEvaluator     #
+###########################################
+
+
+def test_query_ranking_evaluator_repr() -> None:
+    assert repr(
+        QueryRankingEvaluator(query_id="query", y_true="target", y_score="score")
+    ).startswith("QueryRankingEvaluator(")
+
+
+def test_query_ranking_evaluator_str() -> None:
+    assert str(
+        QueryRankingEvaluator(query_id="query", y_true="target", y_score="score")
+    ).startswith("QueryRankingEvaluator(")
+
+
+def test_query_ranking_evaluator_evaluate(data: pl.DataFrame) -> None:
+    assert (
+        QueryRankingEvaluator(query_id="query", y_true="target", y_score="score", k=[1, 3])
+        .evaluate(data)
+        .equal(
+            QueryRankingResult(
+                query_id=np.array(["a", "a", "a", "b", "b", "b", "b"], dtype=object),
+                y_true=np.array([0, 1, 2, 1, 0, 0, 1]),
+                y_score=np.array([0.1, 0.2, 0.9, 0.5, 0.8, 0.3, 0.4]),
+                k=[1, 3],
+            )
+        )
+    )
+
+
+def test_query_ranking_evaluator_evaluate_lazy_false(data: pl.DataFrame) -> None:
+    assert (
+        QueryRankingEvaluator(query_id="query", y_true="target", y_score="score", k=[1])
+        .evaluate(data, lazy=False)
+        .equal(
+            Result(
+                {
+                    "count": 7,
+                    "map": 0.7916666666666666,
+                    "mrr": 0.75,
+                    "ndcg": 0.8467132018086354,
+                    "ndcg_at_1": 0.5,
+                    "num_queries": 2,
+                    "precision_at_1": 0.5,
+                    "recall_at_1": 0.25,
+                }
+            )
+        )
+    )
+
+
+def test_query_ranking_evaluator_evaluate_missing_keys(data: pl.DataFrame) -> None:
+    assert (
+        QueryRankingEvaluator(query_id="missing", y_true="target", y_score="score")
+        .evaluate(data)
+        .equal(EmptyResult())
+    )
+
+
+def test_query_ranking_evaluator_evaluate_lazy_false_missing_keys(data: pl.DataFrame) -> None:
+    assert (
+        QueryRankingEvaluator(query_id="query", y_true="target", y_score="missing")
+        .evaluate(data, lazy=False)
+        .equal(EmptyResult())
+    )
+
+
+def test_query_ranking_evaluator_evaluate_drop_nulls() -> None:
+    assert (
+        QueryRankingEvaluator(query_id="query", y_true="target", y_score="score")
+        .evaluate(
+            pl.DataFrame(
+                {
+                    "query": [1, 1, None, 2, 2],
+                    "score": [0.1, 0.2, 0.9, None, 0.8],
+                    "target": [0, 1, 2, 1, None],
+                }
+            )
+        )
+        .equal(
+            QueryRankingResult(
+                query_id=np.array([1, 1]), y_true=np.array([0, 1]), y_score=np.array([0.1, 0.2])
+            )
+        )
+    )
+
+
+def test_query_ranking_evaluator_evaluate_drop_nulls_false() -> None:
+    assert (
+        QueryRankingEvaluator(query_id="query", y_true="target", y_score="score", drop_nulls=False)
+        .evaluate(
+            pl.DataFrame(
+                {
+                    "query": [1, 1, 2, 2],
+                    "score": [0.1, 0.2, None, 0.8],
+                    "target": [0, 1, 1, None],
+                }
+            )
+        )
+        .equal(
+            QueryRankingResult(
+                query_id=np.array([1, 1, 2, 2]),
+                y_true=np.array([0.0, 1.0, 1.0, float("nan")]),
+                y_score=np.array([0.1, 0.2, float("nan"), 0.8]),
+            ),
+            equal_nan=True,
+        )
+    )
+
+
+@pytest.mark.parametrize("nan_policy", ["omit", "propagate", "raise"])
+def test_query_ranking_evaluator_evaluate_nan_policy(data: pl.DataFrame, nan_policy: str) -> None:
+    assert (
+        QueryRankingEvaluator(
+            query_id="query", y_true="target", y_score="score", nan_policy=nan_policy
+        )
+        .evaluate(data)
+        .equal(
+            QueryRankingResult(
+                query_id=np.array(["a", "a", "a", "b", "b", "b", "b"], dtype=object),
+                y_true=np.array([0, 1, 2, 1, 0, 0, 1]),
+                y_score=np.array([0.1, 0.2, 0.9, 0.5, 0.8, 0.3, 0.4]),
+                nan_policy=nan_policy,
+            )
+        )
+    )
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose
+
+from arkas.evaluator2 import BinnedResidualEvaluator, Evaluator
+from arkas.state import BinnedResidualState
+
+
+@pytest.fixture
+def state() -> BinnedResidualState:
+    return BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+        y_pred=np.array([2.0, 2.0, 3.0, 3.0, 6.0, 8.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+        bins=[0, 3, 6, 9],
+    )
+
+
+#############################################
+#     Tests for BinnedResidualEvaluator     #
+#############################################
+
+
+def test_binned_residual_evaluator_repr(state: BinnedResidualState) -> None:
+    assert repr(BinnedResidualEvaluator(state)).startswith("BinnedResidualEvaluator(")
+
+
+def test_binned_residual_evaluator_str(state: BinnedResidualState) -> None:
+    assert str(BinnedResidualEvaluator(state)).startswith("BinnedResidualEvaluator(")
+
+
+def test_binned_residual_evaluator_state(state: BinnedResidualState) -> None:
+    assert BinnedResidualEvaluator(state).state.equal(state)
+
+
+def test_binned_residual_evaluator_equal_true(state: BinnedResidualState) -> None:
+    assert BinnedResidualEvaluator(state).equal(BinnedResidualEvaluator(state))
+
+
+def test_binned_residual_evaluator_equal_false_different_state(
+    state: BinnedResidualState,
+) -> None:
+    assert not BinnedResidualEvaluator(state).equal(
+        BinnedResidualEvaluator(
+            BinnedResidualState(
+                y_true=np.array([1.0, 2.0, 3.0]),
+                y_pred=np.array([2.0, 2.0, 4.0]),
+                y_true_name="target",
+                y_pred_name="pred",
+            )
+        )
+    )
+
+
+def test_binned_residual_evaluator_equal_false_different_type(
+    state: BinnedResidualState,
+) -> None:
+    assert not BinnedResidualEvaluator(state).equal(42)
+
+
+def test_binned_residual_evaluator_evaluate(state: BinnedResidualState) -> None:
+    assert objects_are_allclose(
+        BinnedResidualEvaluator(state).evaluate(),
+        {
+            "bin_bias": np.array([0.5, -0.5, 1.5]),
+            "bin_count": np.array([2, 2, 2]),
+            "bin_edges": np.array([0.0, 3.0, 6.0, 9.0]),
+            "bin_mae": np.array([0.5, 0.5, 1.5]),
+            "bin_rmse": np.array([np.sqrt(0.5), np.sqrt(0.5), np.sqrt(2.5)]),
+            "count": 6,
+        },
+    )
+
+
+def test_binned_residual_evaluator_evaluate_prefix_suffix(state: BinnedResidualState) -> None:
+    assert objects_are_allclose(
+        BinnedResidualEvaluator(state).evaluate(prefix="prefix_", suffix="_suffix"),
+        {
+            "prefix_bin_bias_suffix": np.array([0.5, -0.5, 1.5]),
+            "prefix_bin_count_suffix": np.array([2, 2, 2]),
+            "prefix_bin_edges_suffix": np.array([0.0, 3.0, 6.0, 9.0]),
+            "prefix_bin_mae_suffix": np.array([0.5, 0.5, 1.5]),
+            "prefix_bin_rmse_suffix": np.array([np.sqrt(0.5), np.sqrt(0.5), np.sqrt(2.5)]),
+            "prefix_count_suffix": 6,
+        },
+    )
+
+
+def test_binned_residual_evaluator_evaluate_strategy() -> None:
+    metrics = BinnedResidualEvaluator(
+        BinnedResidualState(
+            y_true=np.zeros(6),
+            y_pred=np.array([0.0, 0.0, 0.0, 0.0, 1.0, 9.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+            bins=3,
+            strategy="uniform",
+        )
+    ).evaluate()
+    assert objects_are_allclose(metrics["bin_edges"], np.array([0.0, 3.0, 6.0, 9.0]))
+
+
+def test_binned_residual_evaluator_evaluate_nan_omit() -> None:
+    metrics = BinnedResidualEvaluator(
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0, np.nan]),
+            y_pred=np.array([2.0, 2.0, 4.0, 5.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+            bins=[0, 3, 6],
+            nan_policy="omit",
+        )
+    ).evaluate()
+    assert metrics["count"] == 3
+    assert objects_are_allclose(metrics["bin_bias"], np.array([0.5, 1.0]))
+
+
+def test_binned_residual_evaluator_compute(state: BinnedResidualState) -> None:
+    assert isinstance(BinnedResidualEvaluator(state).compute(), Evaluator)
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from arkas.metric import (
+    AccuracyAccumulator,
+    BalancedAccuracyAccumulator,
+    ConfusionMatrixAccumulator,
+    FbetaScoreAccumulator,
+    JaccardAccumulator,
+    PrecisionAccumulator,
+    RecallAccumulator,
+    accuracy,
+    balanced_accuracy,
+    binary_confusion_matrix,
+    binary_fbeta_score,
+    binary_jaccard,
+    binary_precision,
+    binary_recall,
+    multiclass_confusion_matrix,
+    multiclass_fbeta_score,
+    multiclass_jaccard,
+    multiclass_precision,
+    multiclass_recall,
+    multilabel_confusion_matrix,
+    multilabel_fbeta_score,
+    multilabel_jaccard,
+    multilabel_precision,
+    multilabel_recall,
+)
+
+FUNCTIONS = {
+    "binary": {
+        ConfusionMatrixAccumulator: binary_confusion_matrix,
+        FbetaScoreAccumulator: binary_fbeta_score,
+        JaccardAccumulator: binary_jaccard,
+        PrecisionAccumulator: binary_precision,
+        RecallAccumulator: binary_recall,
+    },
+    "multiclass": {
+        ConfusionMatrixAccumulator: multiclass_confusion_matrix,
+        FbetaScoreAccumulator: multiclass_fbeta_score,
+        JaccardAccumulator: multiclass_jaccard,
+        PrecisionAccumulator: multiclass_precision,
+        RecallAccumulator: multiclass_recall,
+    },
+    "multilabel": {
+        ConfusionMatrixAccumulator: multilabel_confusion_matrix,
+        FbetaScoreAccumulator: multilabel_fbeta_score,
+        JaccardAccumulator: multilabel_jaccard,
+        PrecisionAccumulator: multilabel_precision,
+        RecallAccumulator: multilabel_recall,
+    },
+}
+CASES = [
+    (label_type, accumulator_cls, function)
+    for label_type, functions in FUNCTIONS.items()
+    for accumulator_cls, function in functions.items()
+]
+
+
+def make_data(label_type: str, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    if label_type == "multilabel":
+        return rng.integers(0, 2, size=(100, 4)), rng.integers(0, 2, size=(100, 4))
+    high = 2 if label_type == "binary" else 5
+    return rng.integers(0, high, size=100), rng.integers(0, high, size=100)
+
+
+####################################################
+#     Tests for BaseConfusionMatrixAccumulator     #
+####################################################
+
+
+def test_accumulator_repr() -> None:
+    assert repr(PrecisionAccumulator()) == (
+        "PrecisionAccumulator(label_type='binary', nan_policy='propagate', count=0)"
+    )
+
+
+def test_accumulator_str() -> None:
+    assert str(PrecisionAccumulator()).startswith("PrecisionAccumulator(")
+
+
+def test_accumulator_incorrect_label_type() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'label_type': auto"):
+        PrecisionAccumulator(label_type="auto")
+
+
+def test_accumulator_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        PrecisionAccumulator(nan_policy="incorrect")
+
+
+def test_accumulator_count() -> None:
+    accumulator = PrecisionAccumulator()
+    accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    accumulator.update(y_true=np.array([1, 1]), y_pred=np.array([0, 1]))
+    assert accumulator.count == 5
+
+
+@pytest.mark.parametrize(("label_type", "accumulator_cls", "function"), CASES)
+def test_accumulator_update_same_as_function(
+    label_type: str, accumulator_cls: type, function: callable
+) -> None:
+    y_true, y_pred = make_data(label_type)
+    accumulator = accumulator_cls(label_type=label_type)
+    for i in range(0, 100, 30):
+        accumulator.update(y_true=y_true[i : i + 30], y_pred=y_pred[i : i + 30])
+    assert objects_are_allclose(
+        accumulator.compute(prefix="prefix_", suffix="_suffix"),
+        function(y_true, y_pred, prefix="prefix_", suffix="_suffix"),
+    )
+
+
+@pytest.mark.parametrize(("label_type", "accumulator_cls", "function"), CASES)
+def test_accumulator_merge_same_as_function(
+    label_type: str, accumulator_cls: type, function: callable
+) -> None:
+    y_true, y_pred = make_data(label_type, seed=1)
+    accumulators = []
+    for i in range(0, 100, 40):
+        accumulator = accumulator_cls(label_type=label_type)
+        accumulator.update(y_true=y_true[i : i + 40], y_pred=y_pred[i : i + 40])
+        accumulators.append(accumulator)
+    accumulator = accumulator_cls(label_type=label_type)
+    for other in accumulators:
+        accumulator.merge(other)
+    assert objects_are_allclose(accumulator.compute(), function(y_true, y_pred))
+
+
+@pytest.mark.parametrize(("label_type", "accumulator_cls", "function"), CASES)
+def test_accumulator_empty_same_as_function(
+    label_type: str, accumulator_cls: type, function: callable
+) -> None:
+    y_true, y_pred = make_data(label_type)
+    assert objects_are_allclose(
+        accumulator_cls(label_type=label_type).compute(),
+        function(y_true[:0], y_pred[:0]),
+        equal_nan=True,
+    )
+
+
+def test_accumulator_multiclass_different_labels() -> None:
+    accumulator = ConfusionMatrixAccumulator(label_type="multiclass")
+    accumulator.update(y_true=np.array([0, 5]), y_pred=np.array([0, 5]))
+    accumulator.update(y_true=np.array([2, 7, 5]), y_pred=np.array([2, 5, 7]))
+    assert objects_are_equal(
+        accumulator.compute(),
+        multiclass_confusion_matrix(
+            y_true=np.array([0, 5, 2, 7, 5]), y_pred=np.array([0, 5, 2, 5, 7])
+        ),
+    )
+    assert objects_are_equal(accumulator.to_kernel().labels, np.array([0, 2, 5, 7]))
+
+
+def test_accumulator_multilabel_incorrect_number_of_classes() -> None:
+    accumulator = PrecisionAccumulator(label_type="multilabel")
+    accumulator.update(y_true=np.ones((2, 3)), y_pred=np.ones((2, 3)))
+    with pytest.raises(ValueError, match="Incorrect number of classes: 2"):
+        accumulator.update(y_true=np.ones((2, 2)), y_pred=np.ones((2, 2)))
+
+
+def test_accumulator_multilabel_empty_batch() -> None:
+    accumulator = ConfusionMatrixAccumulator(label_type="multilabel")
+    accumulator.update(y_true=np.zeros((0, 3)), y_pred=np.zeros((0, 3)))
+    accumulator.update(
+        y_true=np.array([[1, 0, 1], [0, 1, 1]]), y_pred=np.array([[1, 1, 0], [0, 1, 1]])
+    )
+    accumulator.update(y_true=np.zeros((0, 3)), y_pred=np.zeros((0, 3)))
+    assert objects_are_equal(
+        accumulator.compute(),
+        multilabel_confusion_matrix(
+            y_true=np.array([[1, 0, 1], [0, 1, 1]]), y_pred=np.array([[1, 1, 0], [0, 1, 1]])
+        ),
+    )
+
+
+def test_accumulator_multilabel_merge_empty_batch() -> None:
+    accumulator1 = ConfusionMatrixAccumulator(label_type="multilabel")
+    accumulator1.update(y_true=np.zeros((0, 3)), y_pred=np.zeros((0, 3)))
+    accumulator2 = ConfusionMatrixAccumulator(label_type="multilabel")
+    accumulator2.update(
+        y_true=np.array([[1, 0, 1], [0, 1, 1]]), y_pred=np.array([[1, 1, 0], [0, 1, 1]])
+    )
+    accumulator1.merge(accumulator2)
+    accumulator2.merge(accumulator1)
+    assert accumulator1.count == 2
+    assert accumulator2.count == 4
+
+
+def test_accumulator_nan_omit() -> None:
+    accumulator = PrecisionAccumulator(nan_policy="omit")
+    accumulator.update(y_true=np.array([1, 0, float("nan")]), y_pred=np.array([1, 0, 1]))
+    accumulator.update(y_true=np.array([1, 1]), y_pred=np.array([float("nan"), 1]))
+    assert objects_are_equal(
+        accumulator.compute(),
+        binary_precision(
+            y_true=np.array([1, 0, float("nan"), 1, 1]),
+            y_pred=np.array([1, 0, 1, float("nan"), 1]),
+            nan_policy="omit",
+        ),
+    )
+
+
+def test_accumulator_nan_propagate() -> None:
+    accumulator = PrecisionAccumulator()
+    accumulator.update(y_true=np.array([1, 0, float("nan")]), y_pred=np.array([1, 0, 1]))
+    accumulator.update(y_true=np.array([1, 1]), y_pred=np.array([0, 1]))
+    assert objects_are_equal(
+        accumulator.compute(), {"count": 5, "precision": float("nan")}, equal_nan=True
+    )
+
+
+def test_accumulator_nan_raise() -> None:
+    accumulator = PrecisionAccumulator(nan_policy="raise")
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        accumulator.update(y_true=np.array([1, 0, float("nan")]), y_pred=np.array([1, 0, 1]))
+
+
+def test_accumulator_merge_empty() -> None:
+    accumulator = PrecisionAccumulator()
+    accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    accumulator.merge(PrecisionAccumulator())
+    assert objects_are_equal(accumulator.compute(), {"count": 3, "precision": 0.5})
+
+
+def test_accumulator_merge_does_not_share_state() -> None:
+    accumulator1 = PrecisionAccumulator()
+    accumulator2 = PrecisionAccumulator()
+    accumulator2.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    accumulator1.merge(accumulator2)
+    accumulator1.update(y_true=np.array([1, 1]), y_pred=np.array([1, 1]))
+    assert objects_are_equal(accumulator2.compute(), {"count": 3, "precision": 0.5})
+
+
+def test_accumulator_merge_incorrect_type() -> None:
+    with pytest.raises(TypeError, match="Incorrect accumulator type"):
+        PrecisionAccumulator().merge(binary_precision)
+
+
+def test_accumulator_merge_different_label_type() -> None:
+    with pytest.raises(ValueError, match="The accumulators must have the same label type"):
+        PrecisionAccumulator().merge(PrecisionAccumulator(label_type="multiclass"))
+
+
+def test_accumulator_merge_different_nan_policy() -> None:
+    with pytest.raises(ValueError, match="The accumulators must have the same label type"):
+        PrecisionAccumulator().merge(PrecisionAccumulator(nan_policy="omit"))
+
+
+def test_accumulator_pickle() -> None:
+    accumulator = PrecisionAccumulator()
+    accumulator.update(y_true=np.array([1, 0, 0]), y_pred=np.array([1, 0, 1]))
+    assert objects_are_equal(
+        pickle.loads(pickle.dumps(accumulator)).compute(),  # noqa: S301
+        {"count": 3, "precision": 0.5},
+    )
+
+
+#########################################
+#     Tests for AccuracyAccumulator     #
+#########################################
+
+
+def test_accuracy_accumulator_repr() -> None:
+    assert repr(AccuracyAccumulator()) == ("AccuracyAccumulator(nan_policy='propagate', count=0)")
+
+
+def test_accuracy_accumulator_label_type() -> None:
+    assert AccuracyAccumulator().label_type == "multiclass"
+
+
+@pytest.mark.parametrize("label_type", ["binary", "multiclass"])
+def test_accuracy_accumulator_same_as_function(label_type: str) -> None:
+    y_true, y_pred = make_data(label_type)
+    accumulator = AccuracyAccumulator()
+    for i in range(0, 100, 30):
+        accumulator.update(y_true=y_true[i : i + 30], y_pred=y_pred[i : i + 30])
+    assert objects_are_equal(
+        accumulator.compute(prefix="prefix_", suffix="_suffix"),
+        accuracy(y_true, y_pred, prefix="prefix_", suffix="_suffix"),
+    )
+
+
+#################################################
+#     Tests for BalancedAccuracyAccumulator     #
+#################################################
+
+
+def test_balanced_accuracy_accumulator_repr() -> None:
+    assert repr(BalancedAccuracyAccumulator()) == (
+        "BalancedAccuracyAccumulator(nan_policy='propagate', count=0)"
+    )
+
+
+@pytest.mark.parametrize("label_type", ["binary", "multiclass"])
+def test_balanced_accuracy_accumulator_same_as_function(label_type: str) -> None:
+    y_true, y_pred = make_data(label_type)
+    accumulator = BalancedAccuracyAccumulator()
+    for i in range(0, 100, 30):
+        accumulator.update(y_true=y_true[i : i + 30], y_pred=y_pred[i : i + 30])
+    assert objects_are_allclose(
+        accumulator.compute(prefix="prefix_", suffix="_suffix"),
+        balanced_accuracy(y_true, y_pred, prefix="prefix_", suffix="_suffix"),
+    )
+
+
+###########################################
+#     Tests for FbetaScoreAccumulator     #
+###########################################
+
+
+def test_fbeta_score_accumulator_repr() -> None:
+    assert repr(FbetaScoreAccumulator(betas=[1, 2])) == (
+        "FbetaScoreAccumulator(betas=(1, 2), label_type='binary', nan_policy='propagate', "
+        "count=0)"
+    )
+
+
+@pytest.mark.parametrize("label_type", ["binary", "multiclass", "multilabel"])
+def test_fbeta_score_accumulator_betas(label_type: str) -> None:
+    y_true, y_pred = make_data(label_type)
+    accumulator = FbetaScoreAccumulator(betas=[0.5, 1, 2], label_type=label_type)
+    for i in range(0, 100, 30):
+        accumulator.update(y_true=y_true[i : i + 30], y_pred=y_pred[i : i + 30])
+    assert objects_are_allclose(
+        accumulator.compute(),
+        FUNCTIONS[label_type][FbetaScoreAccumulator](y_true, y_pred, betas=[0.5, 1, 2]),
+    )
+
+
+def test_fbeta_score_accumulator_merge_different_betas() -> None:
+    with pytest.raises(ValueError, match="The accumulators must have the same betas"):
+        FbetaScoreAccumulator(betas=[1]).merge(FbetaScoreAccumulator(betas=[2]))
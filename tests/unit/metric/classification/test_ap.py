@@ -5,6 +5,7 @@ import pytest
 from coola import objects_are_allclose, objects_are_equal
 
 from arkas.metric import (
+    BinaryScoreHistogram,
     average_precision,
     binary_average_precision,
     multiclass_average_precision,
@@ -521,6 +522,37 @@ def test_binary_average_precision_nan_raise_y_score() -> None:
         )
 
 
+def test_binary_average_precision_n_bins() -> None:
+    assert objects_are_equal(
+        binary_average_precision(
+            y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), n_bins=10
+        ),
+        {"count": 5, "average_precision": 1.0},
+    )
+
+
+def test_binary_average_precision_n_bins_approximate() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=1000)
+    y_score = rng.random(size=1000) + 0.5 * y_true
+    assert objects_are_allclose(
+        binary_average_precision(y_true=y_true, y_score=y_score, n_bins=1000),
+        binary_average_precision(y_true=y_true, y_score=y_score),
+        atol=1e-3,
+    )
+
+
+def test_binary_average_precision_histogram() -> None:
+    histogram = BinaryScoreHistogram(n_bins=10)
+    histogram.update(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.75, 0.4])
+    )
+    assert objects_are_equal(
+        binary_average_precision(y_true=np.array([]), y_score=np.array([]), ranking=histogram),
+        {"count": 5, "average_precision": 1.0},
+    )
+
+
 ##################################################
 #     Tests for multiclass_average_precision     #
 ##################################################
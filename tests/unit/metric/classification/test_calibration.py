@@ -0,0 +1,601 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+from sklearn import metrics
+
+from arkas.metric import (
+    BaseCalibrationAccumulator,
+    BrierScoreAccumulator,
+    CalibrationErrorAccumulator,
+    LogLossAccumulator,
+    brier_score,
+    expected_calibration_error,
+    log_loss,
+)
+
+Y_TRUE = np.array([1, 0, 0, 1, 1])
+Y_SCORE = np.array([0.9, 0.2, 0.6, 0.7, 0.8])
+Y_TRUE_MC = np.array([0, 2, 1])
+Y_LOGIT_MC = np.array([[2.0, 0.5, -1.0], [0.1, 0.2, 3.0], [1.0, 1.0, 1.0]])
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+def sigmoid(logits: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-logits))
+
+
+################################################
+#     Tests for BaseCalibrationAccumulator     #
+################################################
+
+
+def test_base_calibration_accumulator_repr() -> None:
+    assert repr(BaseCalibrationAccumulator()).startswith("BaseCalibrationAccumulator(")
+
+
+def test_base_calibration_accumulator_str() -> None:
+    assert str(BaseCalibrationAccumulator()).startswith("BaseCalibrationAccumulator(")
+
+
+def test_base_calibration_accumulator_properties() -> None:
+    accumulator = BaseCalibrationAccumulator(n_bins=5, from_logits=True, nan_policy="omit")
+    assert accumulator.count == 0
+    assert accumulator.n_bins == 5
+    assert accumulator.from_logits
+    assert accumulator.nan_policy == "omit"
+
+
+def test_base_calibration_accumulator_incorrect_n_bins() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'n_bins': 0"):
+        BaseCalibrationAccumulator(n_bins=0)
+
+
+def test_base_calibration_accumulator_incorrect_chunk_size() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'chunk_size': 0"):
+        BaseCalibrationAccumulator(chunk_size=0)
+
+
+def test_base_calibration_accumulator_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        BaseCalibrationAccumulator(nan_policy="incorrect")
+
+
+def test_base_calibration_accumulator_compute() -> None:
+    accumulator = BaseCalibrationAccumulator(n_bins=5)
+    accumulator.update(y_true=Y_TRUE, y_score=Y_SCORE)
+    assert objects_are_allclose(
+        accumulator.compute(),
+        {
+            "count": 5,
+            "brier_score": 0.108,
+            "expected_calibration_error": 0.16,
+            "log_loss": 0.3649226588198266,
+            "max_calibration_error": 1 / 6,
+        },
+    )
+
+
+def test_base_calibration_accumulator_compute_prefix_suffix() -> None:
+    accumulator = BaseCalibrationAccumulator(n_bins=5)
+    accumulator.update(y_true=Y_TRUE, y_score=Y_SCORE)
+    assert objects_are_allclose(
+        accumulator.compute(prefix="prefix_", suffix="_suffix"),
+        {
+            "prefix_count_suffix": 5,
+            "prefix_brier_score_suffix": 0.108,
+            "prefix_expected_calibration_error_suffix": 0.16,
+            "prefix_log_loss_suffix": 0.3649226588198266,
+            "prefix_max_calibration_error_suffix": 1 / 6,
+        },
+    )
+
+
+def test_base_calibration_accumulator_compute_empty() -> None:
+    assert objects_are_equal(
+        BaseCalibrationAccumulator().compute(),
+        {
+            "count": 0,
+            "brier_score": float("nan"),
+            "expected_calibration_error": float("nan"),
+            "log_loss": float("nan"),
+            "max_calibration_error": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+def test_base_calibration_accumulator_update_batches() -> None:
+    accumulator = BaseCalibrationAccumulator()
+    accumulator.update(y_true=Y_TRUE[:2], y_score=Y_SCORE[:2])
+    accumulator.update(y_true=Y_TRUE[2:], y_score=Y_SCORE[2:])
+    assert accumulator.count == 5
+    expected = BaseCalibrationAccumulator()
+    expected.update(y_true=Y_TRUE, y_score=Y_SCORE)
+    assert objects_are_allclose(accumulator.compute(), expected.compute())
+
+
+def test_base_calibration_accumulator_update_empty() -> None:
+    accumulator = BaseCalibrationAccumulator()
+    accumulator.update(y_true=np.array([]), y_score=np.array([]))
+    assert accumulator.count == 0
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+def test_base_calibration_accumulator_chunk_size(chunk_size: int) -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.integers(0, 7, size=50)
+    logits = rng.normal(size=(50, 7))
+    accumulator = BaseCalibrationAccumulator(from_logits=True, chunk_size=chunk_size)
+    accumulator.update(y_true=y_true, y_score=logits)
+    expected = BaseCalibrationAccumulator(from_logits=True)
+    expected.update(y_true=y_true, y_score=logits)
+    assert objects_are_allclose(accumulator.compute(), expected.compute())
+
+
+def test_base_calibration_accumulator_update_incorrect_num_classes() -> None:
+    accumulator = BaseCalibrationAccumulator()
+    accumulator.update(y_true=Y_TRUE_MC, y_score=softmax(Y_LOGIT_MC))
+    with pytest.raises(ValueError, match="Incorrect number of classes: 2"):
+        accumulator.update(y_true=Y_TRUE, y_score=Y_SCORE)
+
+
+def test_base_calibration_accumulator_update_incorrect_label_binary() -> None:
+    accumulator = BaseCalibrationAccumulator()
+    with pytest.raises(ValueError, match="Incorrect 'y_true'"):
+        accumulator.update(y_true=np.array([0, 1, 2]), y_score=np.array([0.1, 0.2, 0.3]))
+
+
+def test_base_calibration_accumulator_update_incorrect_label_multiclass() -> None:
+    accumulator = BaseCalibrationAccumulator()
+    with pytest.raises(ValueError, match="Incorrect 'y_true'"):
+        accumulator.update(y_true=np.array([0, 3, 1]), y_score=softmax(Y_LOGIT_MC))
+
+
+def test_base_calibration_accumulator_update_non_integer_label() -> None:
+    accumulator = BaseCalibrationAccumulator()
+    with pytest.raises(ValueError, match="Incorrect 'y_true'"):
+        accumulator.update(y_true=np.array([0.0, 0.5, 1.0]), y_score=np.array([0.1, 0.2, 0.3]))
+
+
+def test_base_calibration_accumulator_update_incorrect_shape() -> None:
+    accumulator = BaseCalibrationAccumulator()
+    with pytest.raises(RuntimeError, match="different first dimension"):
+        accumulator.update(y_true=np.array([0, 1]), y_score=softmax(Y_LOGIT_MC))
+
+
+def test_base_calibration_accumulator_nan_omit() -> None:
+    accumulator = BaseCalibrationAccumulator(nan_policy="omit")
+    accumulator.update(
+        y_true=np.array([1, 0, 0, 1, 1, float("nan"), 1]),
+        y_score=np.array([0.9, 0.2, 0.6, 0.7, 0.8, 0.5, float("nan")]),
+    )
+    expected = BaseCalibrationAccumulator()
+    expected.update(y_true=Y_TRUE, y_score=Y_SCORE)
+    assert objects_are_allclose(accumulator.compute(), expected.compute())
+
+
+def test_base_calibration_accumulator_nan_omit_multiclass() -> None:
+    accumulator = BaseCalibrationAccumulator(nan_policy="omit", from_logits=True)
+    accumulator.update(
+        y_true=np.array([0, 2, 1, 0]),
+        y_score=np.array(
+            [[2.0, 0.5, -1.0], [0.1, 0.2, 3.0], [1.0, 1.0, 1.0], [1.0, float("nan"), 1.0]]
+        ),
+    )
+    expected = BaseCalibrationAccumulator(from_logits=True)
+    expected.update(y_true=Y_TRUE_MC, y_score=Y_LOGIT_MC)
+    assert objects_are_allclose(accumulator.compute(), expected.compute())
+
+
+def test_base_calibration_accumulator_nan_propagate() -> None:
+    accumulator = BaseCalibrationAccumulator()
+    accumulator.update(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.2, 0.6, 0.7, float("nan")])
+    )
+    assert objects_are_equal(
+        accumulator.compute(),
+        {
+            "count": 5,
+            "brier_score": float("nan"),
+            "expected_calibration_error": float("nan"),
+            "log_loss": float("nan"),
+            "max_calibration_error": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+def test_base_calibration_accumulator_nan_raise() -> None:
+    accumulator = BaseCalibrationAccumulator(nan_policy="raise")
+    with pytest.raises(ValueError, match="'y_score' contains at least one NaN value"):
+        accumulator.update(
+            y_true=np.array([1, 0, 0, 1, 1]),
+            y_score=np.array([0.9, 0.2, 0.6, 0.7, float("nan")]),
+        )
+
+
+def test_base_calibration_accumulator_merge() -> None:
+    accumulator1 = BaseCalibrationAccumulator()
+    accumulator1.update(y_true=Y_TRUE[:2], y_score=Y_SCORE[:2])
+    accumulator2 = BaseCalibrationAccumulator()
+    accumulator2.update(y_true=Y_TRUE[2:], y_score=Y_SCORE[2:])
+    accumulator1.merge(accumulator2)
+    expected = BaseCalibrationAccumulator()
+    expected.update(y_true=Y_TRUE, y_score=Y_SCORE)
+    assert objects_are_allclose(accumulator1.compute(), expected.compute())
+
+
+def test_base_calibration_accumulator_merge_empty() -> None:
+    accumulator = BaseCalibrationAccumulator()
+    accumulator.update(y_true=Y_TRUE, y_score=Y_SCORE)
+    accumulator.merge(BaseCalibrationAccumulator())
+    assert accumulator.count == 5
+
+
+def test_base_calibration_accumulator_merge_incorrect_type() -> None:
+    with pytest.raises(TypeError, match="Incorrect accumulator type"):
+        BaseCalibrationAccumulator().merge(42)
+
+
+def test_base_calibration_accumulator_merge_incorrect_n_bins() -> None:
+    with pytest.raises(ValueError, match="same number of bins and NaN policy"):
+        BaseCalibrationAccumulator(n_bins=5).merge(BaseCalibrationAccumulator(n_bins=10))
+
+
+def test_base_calibration_accumulator_merge_incorrect_num_classes() -> None:
+    accumulator1 = BaseCalibrationAccumulator()
+    accumulator1.update(y_true=Y_TRUE, y_score=Y_SCORE)
+    accumulator2 = BaseCalibrationAccumulator()
+    accumulator2.update(y_true=Y_TRUE_MC, y_score=softmax(Y_LOGIT_MC))
+    with pytest.raises(ValueError, match="Incorrect number of classes: 3"):
+        accumulator1.merge(accumulator2)
+
+
+def test_base_calibration_accumulator_get_args() -> None:
+    assert objects_are_equal(
+        BaseCalibrationAccumulator(n_bins=5, chunk_size=10).get_args(),
+        {"n_bins": 5, "from_logits": False, "chunk_size": 10, "nan_policy": "propagate"},
+    )
+
+
+###########################################
+#     Tests for BrierScoreAccumulator     #
+###########################################
+
+
+def test_brier_score_accumulator_repr() -> None:
+    assert repr(BrierScoreAccumulator()).startswith("BrierScoreAccumulator(")
+
+
+def test_brier_score_accumulator_compute() -> None:
+    accumulator = BrierScoreAccumulator()
+    accumulator.update(y_true=Y_TRUE, y_score=Y_SCORE)
+    assert objects_are_allclose(accumulator.compute(), {"count": 5, "brier_score": 0.108})
+
+
+def test_brier_score_accumulator_get_args() -> None:
+    assert objects_are_equal(
+        BrierScoreAccumulator(from_logits=True).get_args(),
+        {"from_logits": True, "chunk_size": None, "nan_policy": "propagate"},
+    )
+
+
+#################################################
+#     Tests for CalibrationErrorAccumulator     #
+#################################################
+
+
+def test_calibration_error_accumulator_repr() -> None:
+    assert repr(CalibrationErrorAccumulator()).startswith("CalibrationErrorAccumulator(")
+
+
+def test_calibration_error_accumulator_compute() -> None:
+    accumulator = CalibrationErrorAccumulator(n_bins=5)
+    accumulator.update(y_true=Y_TRUE, y_score=Y_SCORE)
+    assert objects_are_allclose(
+        accumulator.compute(),
+        {"count": 5, "expected_calibration_error": 0.16, "max_calibration_error": 1 / 6},
+    )
+
+
+def test_calibration_error_accumulator_get_args() -> None:
+    assert objects_are_equal(
+        CalibrationErrorAccumulator(n_bins=5).get_args(),
+        {"n_bins": 5, "from_logits": False, "chunk_size": None, "nan_policy": "propagate"},
+    )
+
+
+########################################
+#     Tests for LogLossAccumulator     #
+########################################
+
+
+def test_log_loss_accumulator_repr() -> None:
+    assert repr(LogLossAccumulator()).startswith("LogLossAccumulator(")
+
+
+def test_log_loss_accumulator_compute() -> None:
+    accumulator = LogLossAccumulator()
+    accumulator.update(y_true=Y_TRUE, y_score=Y_SCORE)
+    assert objects_are_allclose(accumulator.compute(), {"count": 5, "log_loss": 0.3649226588198266})
+
+
+def test_log_loss_accumulator_get_args() -> None:
+    assert objects_are_equal(
+        LogLossAccumulator(chunk_size=10).get_args(),
+        {"from_logits": False, "chunk_size": 10, "nan_policy": "propagate"},
+    )
+
+
+#################################
+#     Tests for brier_score     #
+#################################
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_brier_score_binary_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, size=100)
+    y_score = rng.random(100)
+    assert objects_are_allclose(
+        brier_score(y_true=y_true, y_score=y_score),
+        {"count": 100, "brier_score": float(metrics.brier_score_loss(y_true, y_score))},
+    )
+
+
+def test_brier_score_binary_logits() -> None:
+    logits = np.array([2.0, -1.0, 0.5, 1.0, 1.5])
+    assert objects_are_allclose(
+        brier_score(y_true=Y_TRUE, y_score=logits, from_logits=True),
+        brier_score(y_true=Y_TRUE, y_score=sigmoid(logits)),
+    )
+
+
+def test_brier_score_multiclass() -> None:
+    assert objects_are_allclose(
+        brier_score(
+            y_true=Y_TRUE_MC, y_score=np.array([[0.7, 0.2, 0.1], [0.1, 0.1, 0.8], [0.3, 0.4, 0.3]])
+        ),
+        {"count": 3, "brier_score": 0.74 / 3},
+    )
+
+
+def test_brier_score_multiclass_logits() -> None:
+    assert objects_are_allclose(
+        brier_score(y_true=Y_TRUE_MC, y_score=Y_LOGIT_MC, from_logits=True),
+        brier_score(y_true=Y_TRUE_MC, y_score=softmax(Y_LOGIT_MC)),
+    )
+
+
+def test_brier_score_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        brier_score(y_true=Y_TRUE, y_score=Y_SCORE, prefix="prefix_", suffix="_suffix"),
+        {"prefix_count_suffix": 5, "prefix_brier_score_suffix": 0.108},
+    )
+
+
+def test_brier_score_empty() -> None:
+    assert objects_are_equal(
+        brier_score(y_true=np.array([]), y_score=np.array([])),
+        {"count": 0, "brier_score": float("nan")},
+        equal_nan=True,
+    )
+
+
+################################################
+#     Tests for expected_calibration_error     #
+################################################
+
+
+def test_expected_calibration_error_binary() -> None:
+    assert objects_are_allclose(
+        expected_calibration_error(y_true=Y_TRUE, y_score=Y_SCORE, n_bins=5),
+        {"count": 5, "expected_calibration_error": 0.16, "max_calibration_error": 1 / 6},
+    )
+
+
+def test_expected_calibration_error_perfect() -> None:
+    assert objects_are_allclose(
+        expected_calibration_error(
+            y_true=np.array([0, 1, 2]),
+            y_score=np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0, 0, 1]]),
+        ),
+        {"count": 3, "expected_calibration_error": 0.0, "max_calibration_error": 0.0},
+    )
+
+
+def test_expected_calibration_error_multiclass() -> None:
+    # confidence: 0.7 (correct), 0.8 (correct), 0.4 (correct)
+    assert objects_are_allclose(
+        expected_calibration_error(
+            y_true=Y_TRUE_MC,
+            y_score=np.array([[0.7, 0.2, 0.1], [0.1, 0.1, 0.8], [0.3, 0.4, 0.3]]),
+            n_bins=10,
+        ),
+        {"count": 3, "expected_calibration_error": 1.1 / 3, "max_calibration_error": 0.6},
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_expected_calibration_error_naive(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 5, size=200)
+    prob = softmax(rng.normal(size=(200, 5)) * 2.0)
+    confidence, correct = prob.max(axis=1), prob.argmax(axis=1) == y_true
+    edges = np.linspace(0.0, 1.0, 16)
+    ece, mce = 0.0, 0.0
+    for low, high in zip(edges[:-1], edges[1:]):
+        mask = (confidence >= low) & (confidence < high)
+        if mask.any():
+            gap = abs(correct[mask].mean() - confidence[mask].mean())
+            ece += gap * mask.sum() / 200
+            mce = max(mce, gap)
+    assert objects_are_allclose(
+        expected_calibration_error(y_true=y_true, y_score=prob, n_bins=15),
+        {
+            "count": 200,
+            "expected_calibration_error": float(ece),
+            "max_calibration_error": float(mce),
+        },
+    )
+
+
+def test_expected_calibration_error_logits() -> None:
+    assert objects_are_allclose(
+        expected_calibration_error(y_true=Y_TRUE_MC, y_score=Y_LOGIT_MC, from_logits=True),
+        expected_calibration_error(y_true=Y_TRUE_MC, y_score=softmax(Y_LOGIT_MC)),
+    )
+
+
+def test_expected_calibration_error_incorrect_n_bins() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'n_bins': 0"):
+        expected_calibration_error(y_true=Y_TRUE, y_score=Y_SCORE, n_bins=0)
+
+
+##############################
+#     Tests for log_loss     #
+##############################
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_log_loss_binary_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, size=100)
+    y_score = rng.random(100)
+    assert objects_are_allclose(
+        log_loss(y_true=y_true, y_score=y_score),
+        {"count": 100, "log_loss": metrics.log_loss(y_true, y_score)},
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_log_loss_multiclass_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.permutation(np.arange(100) % 6)
+    prob = softmax(rng.normal(size=(100, 6)))
+    assert objects_are_allclose(
+        log_loss(y_true=y_true, y_score=prob),
+        {"count": 100, "log_loss": metrics.log_loss(y_true, prob)},
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_log_loss_multiclass_logits_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.permutation(np.arange(100) % 6)
+    logits = rng.normal(size=(100, 6)) * 3.0
+    assert objects_are_allclose(
+        log_loss(y_true=y_true, y_score=logits, from_logits=True, chunk_size=7),
+        {"count": 100, "log_loss": metrics.log_loss(y_true, softmax(logits))},
+    )
+
+
+def test_log_loss_binary_logits() -> None:
+    logits = np.array([2.0, -1.0, 0.5, 1.0, 1.5])
+    assert objects_are_allclose(
+        log_loss(y_true=Y_TRUE, y_score=logits, from_logits=True),
+        log_loss(y_true=Y_TRUE, y_score=sigmoid(logits)),
+    )
+
+
+def test_log_loss_binary_logits_large() -> None:
+    assert objects_are_allclose(
+        log_loss(
+            y_true=np.array([1, 0, 1, 0]),
+            y_score=np.array([1000.0, -1000.0, -1000.0, 1000.0]),
+            from_logits=True,
+        ),
+        {"count": 4, "log_loss": 500.0},
+    )
+
+
+def test_log_loss_multiclass_logits_large() -> None:
+    assert objects_are_allclose(
+        log_loss(
+            y_true=np.array([0, 1]),
+            y_score=np.array([[1000.0, 0.0, -1000.0], [1000.0, 0.0, -1000.0]]),
+            from_logits=True,
+        ),
+        {"count": 2, "log_loss": 500.0},
+    )
+
+
+def test_log_loss_multiclass_logits_float32() -> None:
+    assert objects_are_allclose(
+        log_loss(y_true=Y_TRUE_MC, y_score=Y_LOGIT_MC.astype(np.float32), from_logits=True),
+        log_loss(y_true=Y_TRUE_MC, y_score=Y_LOGIT_MC, from_logits=True),
+        rtol=1e-6,
+    )
+
+
+def test_log_loss_clip() -> None:
+    assert objects_are_allclose(
+        log_loss(y_true=np.array([1, 0]), y_score=np.array([0.0, 1.0])),
+        {"count": 2, "log_loss": float(-np.log(np.finfo(float).eps))},
+    )
+
+
+def test_log_loss_2d_y_true() -> None:
+    assert objects_are_allclose(
+        log_loss(y_true=Y_TRUE_MC.reshape(3, 1), y_score=Y_LOGIT_MC, from_logits=True),
+        log_loss(y_true=Y_TRUE_MC, y_score=Y_LOGIT_MC, from_logits=True),
+    )
+
+
+def test_log_loss_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        log_loss(y_true=Y_TRUE, y_score=Y_SCORE, prefix="prefix_", suffix="_suffix"),
+        {"prefix_count_suffix": 5, "prefix_log_loss_suffix": 0.3649226588198266},
+    )
+
+
+def test_log_loss_nan_omit() -> None:
+    assert objects_are_allclose(
+        log_loss(
+            y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+            y_score=np.array([0.9, 0.2, 0.6, 0.7, 0.8, 0.5]),
+            nan_policy="omit",
+        ),
+        {"count": 5, "log_loss": 0.3649226588198266},
+    )
+
+
+def test_log_loss_nan_propagate() -> None:
+    assert objects_are_equal(
+        log_loss(
+            y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+            y_score=np.array([0.9, 0.2, 0.6, 0.7, 0.8, 0.5]),
+        ),
+        {"count": 6, "log_loss": float("nan")},
+        equal_nan=True,
+    )
+
+
+def test_log_loss_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        log_loss(
+            y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+            y_score=np.array([0.9, 0.2, 0.6, 0.7, 0.8, 0.5]),
+            nan_policy="raise",
+        )
+
+
+def test_log_loss_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_score' have different shapes"):
+        log_loss(y_true=Y_TRUE, y_score=np.array([0.5, 0.5]))
+
+
+def test_log_loss_no_class() -> None:
+    with pytest.raises(ValueError, match="The number of classes must be greater than 0"):
+        log_loss(y_true=np.array([0, 1]), y_score=np.zeros((2, 0)))
+
+
+def test_log_loss_no_class_empty() -> None:
+    with pytest.raises(ValueError, match="The number of classes must be greater than 0"):
+        log_loss(y_true=np.array([]), y_score=np.zeros((0, 0)))
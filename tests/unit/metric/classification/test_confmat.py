@@ -3,13 +3,17 @@ from __future__ import annotations
 import numpy as np
 import pytest
 from coola import objects_are_allclose, objects_are_equal
+from sklearn import metrics
 
 from arkas.metric import (
     binary_confusion_matrix,
     confusion_matrix,
     multiclass_confusion_matrix,
+    multiclass_top_confused_pairs,
     multilabel_confusion_matrix,
+    sparse_multiclass_confusion_matrix,
 )
+from arkas.testing import scipy_available
 
 ######################################
 #     Tests for confusion_matrix     #
@@ -632,6 +636,16 @@ def test_multiclass_confusion_matrix_empty() -> None:
     )
 
 
+def test_multiclass_confusion_matrix_uint64() -> None:
+    assert objects_are_equal(
+        multiclass_confusion_matrix(
+            y_true=np.array([0, 1, 2, 2], dtype=np.uint64),
+            y_pred=np.array([0, 1, 2, 2], dtype=np.uint64),
+        ),
+        {"confusion_matrix": np.array([[1, 0, 0], [0, 1, 0], [0, 0, 2]]), "count": 4},
+    )
+
+
 def test_multiclass_confusion_matrix_correct_prefix_suffix() -> None:
     assert objects_are_equal(
         multiclass_confusion_matrix(
@@ -955,3 +969,188 @@ def test_multilabel_confusion_matrix_nan_raise_y_pred() -> None:
             y_pred=np.array([[1, 0, float("nan")], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
             nan_policy="raise",
         )
+
+
+###################################################
+#     Tests for multiclass_top_confused_pairs     #
+###################################################
+
+
+def test_multiclass_top_confused_pairs() -> None:
+    assert objects_are_equal(
+        multiclass_top_confused_pairs(
+            y_true=np.array([0, 0, 1, 1, 5, 5, 5]), y_pred=np.array([1, 1, 1, 5, 0, 5, 0])
+        ),
+        {
+            "count": 7,
+            "top_confused_count": np.array([2, 2, 1]),
+            "top_confused_pred": np.array([1, 0, 5]),
+            "top_confused_true": np.array([0, 5, 1]),
+        },
+    )
+
+
+def test_multiclass_top_confused_pairs_uint64() -> None:
+    assert objects_are_equal(
+        multiclass_top_confused_pairs(
+            y_true=np.array([0, 1, 2, 2], dtype=np.uint64),
+            y_pred=np.array([0, 1, 1, 1], dtype=np.uint64),
+        ),
+        {
+            "count": 4,
+            "top_confused_count": np.array([2]),
+            "top_confused_pred": np.array([1], dtype=np.uint64),
+            "top_confused_true": np.array([2], dtype=np.uint64),
+        },
+    )
+
+
+def test_multiclass_top_confused_pairs_k() -> None:
+    assert objects_are_equal(
+        multiclass_top_confused_pairs(
+            y_true=np.array([0, 0, 1, 1, 5, 5, 5]),
+            y_pred=np.array([1, 1, 1, 5, 0, 5, 0]),
+            k=1,
+        ),
+        {
+            "count": 7,
+            "top_confused_count": np.array([2]),
+            "top_confused_pred": np.array([1]),
+            "top_confused_true": np.array([0]),
+        },
+    )
+
+
+def test_multiclass_top_confused_pairs_prefix_suffix() -> None:
+    assert objects_are_equal(
+        multiclass_top_confused_pairs(
+            y_true=np.array([0, 1, 1]),
+            y_pred=np.array([1, 1, 1]),
+            prefix="prefix_",
+            suffix="_suffix",
+        ),
+        {
+            "prefix_count_suffix": 3,
+            "prefix_top_confused_count_suffix": np.array([1]),
+            "prefix_top_confused_pred_suffix": np.array([1]),
+            "prefix_top_confused_true_suffix": np.array([0]),
+        },
+    )
+
+
+def test_multiclass_top_confused_pairs_nan_omit() -> None:
+    assert objects_are_equal(
+        multiclass_top_confused_pairs(
+            y_true=np.array([0, 1, 1, float("nan")]),
+            y_pred=np.array([1, 1, 1, 0]),
+            nan_policy="omit",
+        ),
+        {
+            "count": 3,
+            "top_confused_count": np.array([1]),
+            "top_confused_pred": np.array([1.0]),
+            "top_confused_true": np.array([0.0]),
+        },
+    )
+
+
+def test_multiclass_top_confused_pairs_nan_propagate() -> None:
+    out = multiclass_top_confused_pairs(
+        y_true=np.array([0, 1, 1, float("nan")]), y_pred=np.array([1, 1, 1, 0])
+    )
+    assert out["count"] == 4
+    assert out["top_confused_count"].shape == (0,)
+
+
+def test_multiclass_top_confused_pairs_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        multiclass_top_confused_pairs(
+            y_true=np.array([0, 1, 1, float("nan")]),
+            y_pred=np.array([1, 1, 1, 0]),
+            nan_policy="raise",
+        )
+
+
+########################################################
+#     Tests for sparse_multiclass_confusion_matrix     #
+########################################################
+
+
+@scipy_available
+def test_sparse_multiclass_confusion_matrix() -> None:
+    out = sparse_multiclass_confusion_matrix(
+        y_true=np.array([0, 1, 1, 2, 2, 2]), y_pred=np.array([0, 1, 2, 2, 2, 1])
+    )
+    assert objects_are_allclose(
+        {key: value for key, value in out.items() if key != "confusion_matrix"},
+        {
+            "count": 6,
+            "labels": np.array([0, 1, 2]),
+            "precision": np.array([1.0, 0.5, 2 / 3]),
+            "recall": np.array([1.0, 0.5, 2 / 3]),
+        },
+    )
+    assert objects_are_equal(
+        out["confusion_matrix"].toarray(), np.array([[1, 0, 0], [0, 1, 1], [0, 1, 2]])
+    )
+
+
+@scipy_available
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sparse_multiclass_confusion_matrix_same_as_dense(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true, y_pred = rng.integers(0, 10, size=500), rng.integers(0, 12, size=500)
+    out = sparse_multiclass_confusion_matrix(y_true=y_true, y_pred=y_pred)
+    matrix = multiclass_confusion_matrix(y_true=y_true, y_pred=y_pred)["confusion_matrix"]
+    assert objects_are_equal(out["confusion_matrix"].toarray(), matrix)
+    assert objects_are_allclose(
+        out["precision"], metrics.precision_score(y_true, y_pred, average=None, zero_division=0)
+    )
+    assert objects_are_allclose(
+        out["recall"], metrics.recall_score(y_true, y_pred, average=None, zero_division=0)
+    )
+
+
+@scipy_available
+def test_sparse_multiclass_confusion_matrix_prefix_suffix() -> None:
+    out = sparse_multiclass_confusion_matrix(
+        y_true=np.array([0, 1]), y_pred=np.array([0, 1]), prefix="prefix_", suffix="_suffix"
+    )
+    assert set(out) == {
+        "prefix_confusion_matrix_suffix",
+        "prefix_count_suffix",
+        "prefix_labels_suffix",
+        "prefix_precision_suffix",
+        "prefix_recall_suffix",
+    }
+
+
+@scipy_available
+def test_sparse_multiclass_confusion_matrix_nan_omit() -> None:
+    out = sparse_multiclass_confusion_matrix(
+        y_true=np.array([0, 1, 1, float("nan")]),
+        y_pred=np.array([0, 1, 0, 1]),
+        nan_policy="omit",
+    )
+    assert out["count"] == 3
+    assert objects_are_equal(out["confusion_matrix"].toarray(), np.array([[1, 0], [1, 1]]))
+
+
+@scipy_available
+def test_sparse_multiclass_confusion_matrix_nan_propagate() -> None:
+    out = sparse_multiclass_confusion_matrix(
+        y_true=np.array([0, 1, 1, float("nan")]), y_pred=np.array([0, 1, 0, 1])
+    )
+    assert out["count"] == 4
+    assert out["confusion_matrix"].shape == (0, 0)
+    assert out["precision"].shape == (0,)
+
+
+@scipy_available
+def test_sparse_multiclass_confusion_matrix_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        sparse_multiclass_confusion_matrix(
+            y_true=np.array([0, 1, 1, float("nan")]),
+            y_pred=np.array([0, 1, 0, 1]),
+            nan_policy="raise",
+        )
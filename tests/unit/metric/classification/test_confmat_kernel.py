@@ -0,0 +1,652 @@
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+from sklearn import metrics
+
+from arkas.metric import ConfusionMatrixKernel
+from arkas.metric.classification import confmat_kernel
+from arkas.metric.classification.confmat_kernel import (
+    binary_confusion_counts,
+    multiclass_confused_pairs,
+    multiclass_confusion_counts,
+    multilabel_confusion_counts,
+)
+from arkas.metric.utils import prepare_inputs
+
+###########################################
+#     Tests for ConfusionMatrixKernel     #
+###########################################
+
+
+def test_confusion_matrix_kernel_repr() -> None:
+    assert repr(
+        ConfusionMatrixKernel(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]))
+    ).startswith("ConfusionMatrixKernel(")
+
+
+def test_confusion_matrix_kernel_str() -> None:
+    assert str(
+        ConfusionMatrixKernel(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]))
+    ).startswith("ConfusionMatrixKernel(")
+
+
+def test_confusion_matrix_kernel_incorrect_label_type() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'label_type': auto"):
+        ConfusionMatrixKernel(
+            y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]), label_type="auto"
+        )
+
+
+def test_confusion_matrix_kernel_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        ConfusionMatrixKernel(
+            y_true=np.array([1, 0, 0, 1, 1]),
+            y_pred=np.array([1, 0, 0, 1, 1]),
+            nan_policy="incorrect",
+        )
+
+
+def test_confusion_matrix_kernel_binary() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1])
+    )
+    assert kernel.count == 5
+    assert kernel.is_valid
+    assert objects_are_equal(kernel.matrix, np.array([[1, 1], [1, 2]]))
+    assert kernel.count_correct() == 3
+    assert objects_are_allclose(kernel.balanced_accuracy(), 0.5833333333333333)
+    assert objects_are_allclose(kernel.precision(average="binary"), 0.6666666666666666)
+    assert objects_are_allclose(kernel.recall(average="binary"), 0.6666666666666666)
+    assert objects_are_allclose(kernel.fbeta_score(average="binary"), 0.6666666666666666)
+    assert objects_are_allclose(kernel.jaccard(average="binary"), 0.5)
+
+
+def test_confusion_matrix_kernel_binary_2d() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([[1, 0, 0], [1, 1, 1]]), y_pred=np.array([[1, 0, 1], [0, 1, 1]])
+    )
+    assert kernel.count == 6
+    assert objects_are_equal(kernel.matrix, np.array([[1, 1], [1, 3]]))
+
+
+def test_confusion_matrix_kernel_binary_one_label() -> None:
+    kernel = ConfusionMatrixKernel(y_true=np.array([1, 1, 1]), y_pred=np.array([1, 1, 1]))
+    assert objects_are_equal(kernel.matrix, np.array([[0, 0], [0, 3]]))
+    assert kernel.balanced_accuracy() == 1.0
+    assert kernel.precision(average="binary") == 1.0
+
+
+def test_confusion_matrix_kernel_binary_nan_omit() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+        y_pred=np.array([1, 0, 1, 0, float("nan"), 1]),
+        nan_policy="omit",
+    )
+    assert kernel.count == 4
+    assert not kernel.has_nan
+    assert objects_are_equal(kernel.matrix, np.array([[1, 1], [1, 1]]))
+
+
+def test_confusion_matrix_kernel_binary_nan_propagate() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+        y_pred=np.array([1, 0, 1, 0, float("nan"), 1]),
+    )
+    assert kernel.count == 6
+    assert kernel.has_nan
+    assert not kernel.is_valid
+
+
+def test_confusion_matrix_kernel_binary_nan_raise() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+        y_pred=np.array([1, 0, 1, 0, 1, 1]),
+        nan_policy="raise",
+    )
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        kernel.precision(average="binary")
+
+
+def test_confusion_matrix_kernel_binary_empty() -> None:
+    kernel = ConfusionMatrixKernel(y_true=np.array([]), y_pred=np.array([]))
+    assert kernel.count == 0
+    assert not kernel.is_valid
+    assert objects_are_equal(kernel.matrix, np.zeros((2, 2), dtype=np.int64))
+
+
+def test_confusion_matrix_kernel_multiclass() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([0, 0, 1, 1, 2, 2]),
+        y_pred=np.array([0, 1, 1, 2, 2, 2]),
+        label_type="multiclass",
+    )
+    assert kernel.count == 6
+    assert objects_are_equal(kernel.matrix, np.array([[1, 1, 0], [0, 1, 1], [0, 0, 2]]))
+    assert kernel.count_correct() == 4
+    assert objects_are_allclose(kernel.balanced_accuracy(), 0.6666666666666666)
+    assert objects_are_allclose(kernel.precision(), np.array([1.0, 0.5, 0.6666666666666666]))
+    assert objects_are_allclose(kernel.recall(), np.array([0.5, 0.5, 1.0]))
+    assert objects_are_allclose(
+        kernel.jaccard(), np.array([0.5, 0.3333333333333333, 0.6666666666666666])
+    )
+
+
+def test_confusion_matrix_kernel_multiclass_uint64() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([0, 1, 2, 2], dtype=np.uint64),
+        y_pred=np.array([0, 1, 1, 1], dtype=np.uint64),
+        label_type="multiclass",
+    )
+    assert objects_are_equal(kernel.matrix, np.array([[1, 0, 0], [0, 1, 0], [0, 2, 0]]))
+    assert kernel.count_correct() == 2
+
+
+def test_confusion_matrix_kernel_multilabel() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+        y_pred=np.array([[1, 0, 0], [0, 1, 1], [0, 1, 1], [1, 0, 0], [1, 0, 0]]),
+        label_type="multilabel",
+    )
+    assert kernel.count == 5
+    assert objects_are_equal(
+        kernel.matrix,
+        np.array([[[2, 0], [0, 3]], [[3, 0], [0, 2]], [[0, 2], [3, 0]]]),
+    )
+    assert kernel.count_correct() == 10
+    assert objects_are_equal(kernel.precision(), np.array([1.0, 1.0, 0.0]))
+    assert objects_are_allclose(kernel.precision(average="micro"), 0.7142857142857143)
+
+
+def test_confusion_matrix_kernel_multilabel_nan_omit() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, float("nan")]]),
+        y_pred=np.array([[1, 0, 0], [0, 1, 1], [0, 1, 1], [1, 0, 0], [1, 0, 0]]),
+        label_type="multilabel",
+        nan_policy="omit",
+    )
+    assert kernel.count == 4
+    assert objects_are_equal(
+        kernel.matrix,
+        np.array([[[2, 0], [0, 2]], [[2, 0], [0, 2]], [[0, 2], [2, 0]]]),
+    )
+
+
+def test_confusion_matrix_kernel_incorrect_average() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1])
+    )
+    with pytest.raises(ValueError, match="Incorrect 'average': incorrect"):
+        kernel.precision(average="incorrect")
+
+
+def test_confusion_matrix_kernel_compute_once() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1])
+    )
+    matrix = kernel.matrix
+    kernel.precision(average="binary")
+    kernel.recall(average="binary")
+    assert kernel.matrix is matrix
+
+
+def test_confusion_matrix_kernel_fbeta_scores() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([0, 0, 1, 1, 2, 2]),
+        y_pred=np.array([0, 1, 1, 2, 2, 2]),
+        label_type="multiclass",
+    )
+    assert objects_are_allclose(
+        kernel.fbeta_scores(betas=[0.5, 1, 2]),
+        np.array(
+            [
+                [0.8333333333333334, 0.5, 0.7142857142857143],
+                [0.6666666666666666, 0.5, 0.8],
+                [0.5555555555555556, 0.5, 0.9090909090909091],
+            ]
+        ),
+    )
+
+
+def test_confusion_matrix_kernel_fbeta_scores_binary() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1])
+    )
+    assert objects_are_allclose(
+        kernel.fbeta_scores(betas=[1, 2], average="binary"),
+        np.array([0.6666666666666666, 0.6666666666666666]),
+    )
+
+
+def test_confusion_matrix_kernel_fbeta_scores_empty_betas() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([0, 0, 1, 1, 2, 2]),
+        y_pred=np.array([0, 1, 1, 2, 2, 2]),
+        label_type="multiclass",
+    )
+    assert kernel.fbeta_scores(betas=[]).shape == (0, 3)
+
+
+@pytest.mark.parametrize("average", [None, "macro", "micro", "weighted"])
+@pytest.mark.parametrize("label_type", ["multiclass", "multilabel"])
+def test_confusion_matrix_kernel_fbeta_scores_same_as_fbeta_score(
+    average: str | None, label_type: str
+) -> None:
+    rng = np.random.default_rng(0)
+    size = (200,) if label_type == "multiclass" else (200, 6)
+    high = 6 if label_type == "multiclass" else 2
+    kernel = ConfusionMatrixKernel(
+        y_true=rng.integers(0, high, size=size),
+        y_pred=rng.integers(0, high, size=size),
+        label_type=label_type,
+    )
+    betas = [0.5, 1, 2, 3]
+    assert objects_are_allclose(
+        kernel.fbeta_scores(betas=betas, average=average),
+        np.array([kernel.fbeta_score(beta=beta, average=average) for beta in betas]),
+    )
+
+
+@pytest.mark.parametrize("average", ["macro", "micro", "weighted"])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_confusion_matrix_kernel_multiclass_sklearn(average: str, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 5, size=200)
+    y_pred = rng.integers(0, 5, size=200)
+    kernel = ConfusionMatrixKernel(y_true=y_true, y_pred=y_pred, label_type="multiclass")
+    assert objects_are_allclose(
+        kernel.balanced_accuracy(), float(metrics.balanced_accuracy_score(y_true, y_pred))
+    )
+    assert objects_are_allclose(
+        kernel.precision(average=average),
+        float(metrics.precision_score(y_true, y_pred, average=average, zero_division=0.0)),
+    )
+    assert objects_are_allclose(
+        kernel.recall(average=average),
+        float(metrics.recall_score(y_true, y_pred, average=average, zero_division=0.0)),
+    )
+    assert objects_are_allclose(
+        kernel.fbeta_score(beta=2, average=average),
+        float(metrics.fbeta_score(y_true, y_pred, beta=2, average=average, zero_division=0.0)),
+    )
+    assert objects_are_allclose(
+        kernel.jaccard(average=average),
+        float(metrics.jaccard_score(y_true, y_pred, average=average, zero_division=0.0)),
+    )
+
+
+@pytest.mark.parametrize("average", ["macro", "micro", "weighted"])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_confusion_matrix_kernel_multilabel_sklearn(average: str, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, size=(200, 4))
+    y_pred = rng.integers(0, 2, size=(200, 4))
+    kernel = ConfusionMatrixKernel(y_true=y_true, y_pred=y_pred, label_type="multilabel")
+    assert objects_are_allclose(
+        kernel.precision(average=average),
+        float(metrics.precision_score(y_true, y_pred, average=average)),
+    )
+    assert objects_are_allclose(
+        kernel.recall(average=average),
+        float(metrics.recall_score(y_true, y_pred, average=average)),
+    )
+    assert objects_are_allclose(
+        kernel.fbeta_score(beta=0.5, average=average),
+        float(metrics.fbeta_score(y_true, y_pred, beta=0.5, average=average)),
+    )
+    assert objects_are_allclose(
+        kernel.jaccard(average=average),
+        float(metrics.jaccard_score(y_true, y_pred, average=average)),
+    )
+
+
+#############################################
+#     Tests for binary_confusion_counts     #
+#############################################
+
+
+def test_binary_confusion_counts() -> None:
+    assert objects_are_equal(
+        binary_confusion_counts(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1])),
+        np.array([[1, 1], [1, 2]]),
+    )
+
+
+@pytest.mark.parametrize("dtype", [bool, np.int8, np.float32])
+def test_binary_confusion_counts_narrow_dtype(dtype: np.dtype) -> None:
+    assert objects_are_equal(
+        binary_confusion_counts(
+            y_true=np.array([1, 0, 0, 1, 1], dtype=dtype),
+            y_pred=np.array([1, 0, 1, 0, 1], dtype=dtype),
+        ),
+        np.array([[1, 1], [1, 2]]),
+    )
+
+
+def test_binary_confusion_counts_empty() -> None:
+    assert objects_are_equal(
+        binary_confusion_counts(y_true=np.array([]), y_pred=np.array([])),
+        np.zeros((2, 2), dtype=np.int64),
+    )
+
+
+###############################################
+#     Tests for multiclass_confused_pairs     #
+###############################################
+
+
+def test_multiclass_confused_pairs() -> None:
+    assert objects_are_equal(
+        multiclass_confused_pairs(
+            y_true=np.array([0, 0, 1, 1, 5, 5, 5]), y_pred=np.array([1, 1, 1, 5, 0, 5, 0])
+        ),
+        (np.array([0, 5, 1]), np.array([1, 0, 5]), np.array([2, 2, 1])),
+    )
+
+
+def test_multiclass_confused_pairs_uint64() -> None:
+    assert objects_are_equal(
+        multiclass_confused_pairs(
+            y_true=np.array([0, 0, 1, 1, 2, 2, 2], dtype=np.uint64),
+            y_pred=np.array([1, 1, 1, 2, 0, 2, 0], dtype=np.uint64),
+        ),
+        (
+            np.array([0, 2, 1], dtype=np.uint64),
+            np.array([1, 0, 2], dtype=np.uint64),
+            np.array([2, 2, 1]),
+        ),
+    )
+
+
+def test_multiclass_confused_pairs_k() -> None:
+    assert objects_are_equal(
+        multiclass_confused_pairs(
+            y_true=np.array([0, 0, 1, 1, 5, 5, 5]),
+            y_pred=np.array([1, 1, 1, 5, 0, 5, 0]),
+            k=1,
+        ),
+        (np.array([0]), np.array([1]), np.array([2])),
+    )
+
+
+def test_multiclass_confused_pairs_k_0() -> None:
+    true_labels, pred_labels, counts = multiclass_confused_pairs(
+        y_true=np.array([0, 1]), y_pred=np.array([1, 0]), k=0
+    )
+    assert true_labels.shape == (0,)
+    assert pred_labels.shape == (0,)
+    assert counts.shape == (0,)
+
+
+def test_multiclass_confused_pairs_string() -> None:
+    assert objects_are_equal(
+        multiclass_confused_pairs(
+            y_true=np.array(["cat", "dog", "dog", "bird"]),
+            y_pred=np.array(["dog", "cat", "cat", "bird"]),
+        ),
+        (
+            np.array(["dog", "cat"], dtype="<U4"),
+            np.array(["cat", "dog"], dtype="<U4"),
+            np.array([2, 1]),
+        ),
+    )
+
+
+def test_multiclass_confused_pairs_correct() -> None:
+    true_labels, pred_labels, counts = multiclass_confused_pairs(
+        y_true=np.array([0, 1, 2]), y_pred=np.array([0, 1, 2])
+    )
+    assert true_labels.shape == (0,)
+    assert pred_labels.shape == (0,)
+    assert counts.shape == (0,)
+
+
+def test_multiclass_confused_pairs_empty() -> None:
+    true_labels, pred_labels, counts = multiclass_confused_pairs(
+        y_true=np.array([]), y_pred=np.array([])
+    )
+    assert true_labels.shape == (0,)
+    assert pred_labels.shape == (0,)
+    assert counts.shape == (0,)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_multiclass_confused_pairs_same_as_dense(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true, y_pred = rng.integers(0, 10, size=500), rng.integers(0, 10, size=500)
+    matrix = metrics.confusion_matrix(y_true, y_pred)
+    np.fill_diagonal(matrix, 0)
+    rows, cols = np.nonzero(matrix)
+    order = np.lexsort((cols, rows, -matrix[rows, cols]))[:5]
+    assert objects_are_equal(
+        multiclass_confused_pairs(y_true=y_true, y_pred=y_pred, k=5),
+        (rows[order], cols[order], matrix[rows[order], cols[order]]),
+    )
+
+
+def test_multiclass_confused_pairs_incorrect_k() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'k': -1"):
+        multiclass_confused_pairs(y_true=np.array([0, 1]), y_pred=np.array([1, 0]), k=-1)
+
+
+#################################################
+#     Tests for multiclass_confusion_counts     #
+#################################################
+
+
+def test_multiclass_confusion_counts() -> None:
+    assert objects_are_equal(
+        multiclass_confusion_counts(
+            y_true=np.array([0, 0, 1, 1, 5, 5]), y_pred=np.array([0, 1, 1, 5, 5, 5])
+        ),
+        (np.array([[1, 1, 0], [0, 1, 1], [0, 0, 2]]), np.array([0, 1, 5])),
+    )
+
+
+def test_multiclass_confusion_counts_float() -> None:
+    assert objects_are_equal(
+        multiclass_confusion_counts(
+            y_true=np.array([0.0, 0.0, 1.0, 1.0, 5.0, 5.0]),
+            y_pred=np.array([0.0, 1.0, 1.0, 5.0, 5.0, 5.0]),
+        ),
+        (np.array([[1, 1, 0], [0, 1, 1], [0, 0, 2]]), np.array([0.0, 1.0, 5.0])),
+    )
+
+
+def test_multiclass_confusion_counts_negative() -> None:
+    assert objects_are_equal(
+        multiclass_confusion_counts(y_true=np.array([-1, 1, 1]), y_pred=np.array([-1, -1, 1])),
+        (np.array([[1, 0], [1, 1]]), np.array([-1, 1])),
+    )
+
+
+def test_multiclass_confusion_counts_large_labels() -> None:
+    assert objects_are_equal(
+        multiclass_confusion_counts(
+            y_true=np.array([0, 100_000, 100_000]), y_pred=np.array([0, 0, 100_000])
+        ),
+        (np.array([[1, 0], [1, 1]]), np.array([0, 100_000])),
+    )
+
+
+def test_multiclass_confusion_counts_sparse_labels() -> None:
+    assert objects_are_equal(
+        multiclass_confusion_counts(
+            y_true=np.array([7, 3000, 3000], dtype=np.int32),
+            y_pred=np.array([7, 7, 3000], dtype=np.int32),
+        ),
+        (np.array([[1, 0], [1, 1]]), np.array([7, 3000], dtype=np.int32)),
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_multiclass_confusion_counts_sparse_labels_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.choice([3, 50, 1999, 2000], size=2500)
+    y_pred = rng.choice([3, 50, 1999, 2000], size=2500)
+    assert objects_are_equal(
+        multiclass_confusion_counts(y_true=y_true, y_pred=y_pred),
+        (metrics.confusion_matrix(y_true, y_pred), np.array([3, 50, 1999, 2000])),
+    )
+
+
+@pytest.mark.parametrize("dtype", [bool, np.int8, np.float32])
+def test_multiclass_confusion_counts_narrow_dtype(dtype: np.dtype) -> None:
+    matrix, labels = multiclass_confusion_counts(
+        y_true=np.array([1, 0, 0, 1, 1], dtype=dtype), y_pred=np.array([1, 0, 1, 0, 1], dtype=dtype)
+    )
+    assert objects_are_equal(matrix, np.array([[1, 1], [1, 2]]))
+    assert objects_are_equal(labels, np.array([0, 1], dtype=dtype))
+
+
+@pytest.mark.parametrize(
+    "y_true",
+    [np.array([0, 1, 2, 2], dtype=np.uint64), pl.Series([0, 1, 2, 2], dtype=pl.UInt64).to_numpy()],
+)
+def test_multiclass_confusion_counts_uint64(y_true: np.ndarray) -> None:
+    matrix, labels = multiclass_confusion_counts(y_true=y_true, y_pred=y_true)
+    assert objects_are_equal(matrix, np.array([[1, 0, 0], [0, 1, 0], [0, 0, 2]]))
+    assert objects_are_equal(labels, np.array([0, 1, 2], dtype=np.uint64))
+
+
+def test_multiclass_confusion_counts_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(confmat_kernel, "_CHUNK_NUM_VALUES", 7)
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 5, size=100)
+    y_pred = rng.integers(0, 5, size=100)
+    assert objects_are_equal(
+        multiclass_confusion_counts(y_true=y_true, y_pred=y_pred)[0],
+        metrics.confusion_matrix(y_true, y_pred),
+    )
+
+
+def test_multiclass_confusion_counts_empty() -> None:
+    matrix, labels = multiclass_confusion_counts(y_true=np.array([]), y_pred=np.array([]))
+    assert matrix.shape == (0, 0)
+    assert labels.shape == (0,)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_multiclass_confusion_counts_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 10, size=500)
+    y_pred = rng.integers(0, 10, size=500)
+    assert objects_are_equal(
+        multiclass_confusion_counts(y_true=y_true, y_pred=y_pred)[0],
+        metrics.confusion_matrix(y_true, y_pred),
+    )
+
+
+#################################################
+#     Tests for multilabel_confusion_counts     #
+#################################################
+
+
+def test_multilabel_confusion_counts() -> None:
+    assert objects_are_equal(
+        multilabel_confusion_counts(
+            y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+            y_pred=np.array([[1, 0, 0], [0, 1, 1], [0, 1, 1], [1, 0, 0], [1, 0, 0]]),
+        ),
+        np.array([[[2, 0], [0, 3]], [[3, 0], [0, 2]], [[0, 2], [3, 0]]]),
+    )
+
+
+def test_multilabel_confusion_counts_1d() -> None:
+    assert objects_are_equal(
+        multilabel_confusion_counts(
+            y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1])
+        ),
+        np.array([[[1, 1], [1, 2]]]),
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_multilabel_confusion_counts_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, size=(500, 5))
+    y_pred = rng.integers(0, 2, size=(500, 5))
+    assert objects_are_equal(
+        multilabel_confusion_counts(y_true=y_true, y_pred=y_pred),
+        metrics.multilabel_confusion_matrix(y_true, y_pred),
+    )
+
+
+def test_confusion_matrix_kernel_labels_binary() -> None:
+    kernel = ConfusionMatrixKernel(y_true=np.array([1, 1, 1]), y_pred=np.array([1, 1, 1]))
+    assert objects_are_equal(kernel.labels, np.array([0, 1]))
+
+
+def test_confusion_matrix_kernel_labels_multiclass() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.array([0, 5, 5]), y_pred=np.array([0, 2, 5]), label_type="multiclass"
+    )
+    assert objects_are_equal(kernel.labels, np.array([0, 2, 5]))
+
+
+def test_confusion_matrix_kernel_labels_multilabel() -> None:
+    kernel = ConfusionMatrixKernel(
+        y_true=np.ones((2, 3)), y_pred=np.ones((2, 3)), label_type="multilabel"
+    )
+    assert objects_are_equal(kernel.labels, np.array([0, 1, 2]))
+
+
+def test_confusion_matrix_kernel_from_matrix() -> None:
+    kernel = ConfusionMatrixKernel.from_matrix(np.array([[1, 1], [1, 2]]), count=5)
+    assert kernel.count == 5
+    assert kernel.is_valid
+    assert objects_are_equal(kernel.labels, np.array([0, 1]))
+    assert objects_are_allclose(kernel.precision(average="binary"), 0.6666666666666666)
+
+
+def test_confusion_matrix_kernel_from_matrix_multiclass() -> None:
+    kernel = ConfusionMatrixKernel.from_matrix(
+        np.array([[1, 1, 0], [0, 1, 1], [0, 0, 2]]),
+        count=6,
+        label_type="multiclass",
+        labels=np.array([0, 2, 5]),
+    )
+    assert objects_are_equal(kernel.labels, np.array([0, 2, 5]))
+    assert objects_are_allclose(kernel.recall(), np.array([0.5, 0.5, 1.0]))
+
+
+def test_confusion_matrix_kernel_from_matrix_has_nan() -> None:
+    kernel = ConfusionMatrixKernel.from_matrix(
+        np.zeros((2, 2), dtype=np.int64), count=5, has_nan=True
+    )
+    assert kernel.has_nan
+    assert not kernel.is_valid
+
+
+def test_confusion_matrix_kernel_from_prepared() -> None:
+    kernel = ConfusionMatrixKernel.from_prepared(
+        prepare_inputs(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1]))
+    )
+    assert kernel.count == 5
+    assert objects_are_equal(kernel.matrix, np.array([[1, 1], [1, 2]]))
+
+
+def test_confusion_matrix_kernel_from_prepared_multilabel() -> None:
+    kernel = ConfusionMatrixKernel.from_prepared(
+        prepare_inputs(
+            y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, float("nan")]]),
+            y_pred=np.array([[1, 0, 0], [0, 1, 0], [0, 1, 1]]),
+            nan_policy="omit",
+            multilabel=True,
+        ),
+        label_type="multilabel",
+    )
+    assert kernel.count == 2
+    assert objects_are_equal(
+        kernel.matrix, np.array([[[1, 0], [0, 1]], [[1, 0], [0, 1]], [[1, 0], [1, 0]]])
+    )
+
+
+def test_confusion_matrix_kernel_from_prepared_has_nan() -> None:
+    kernel = ConfusionMatrixKernel.from_prepared(
+        prepare_inputs(y_true=np.array([1, 0, float("nan")]), y_pred=np.array([1, 0, 1]))
+    )
+    assert kernel.count == 3
+    assert kernel.has_nan
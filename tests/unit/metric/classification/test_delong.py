@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose
+from sklearn.metrics import roc_auc_score
+
+from arkas.metric import delong_roc_auc, delong_roc_auc_test
+from arkas.metric.classification.delong import _midranks, delong_covariance
+
+Y_TRUE = np.array([1, 0, 0, 1, 1, 0])
+Y_SCORE_A = np.array([0.9, 0.2, 0.6, 0.8, 0.4, 0.1])
+Y_SCORE_B = np.array([0.8, 0.3, 0.1, 0.7, 0.2, 0.5])
+
+
+def naive_delong_covariance(y_true: np.ndarray, y_score: np.ndarray) -> np.ndarray:
+    r"""Compute the DeLong covariance matrix with the ``O(n_pos *
+    n_neg)`` definition."""
+    pos, neg = y_score[y_true == 1], y_score[y_true == 0]
+    # psi has shape (n_columns, n_pos, n_neg)
+    psi = (pos[:, None, :] > neg[None, :, :]).astype(float) + 0.5 * (
+        pos[:, None, :] == neg[None, :, :]
+    )
+    psi = psi.transpose(2, 0, 1)
+    v10, v01 = psi.mean(axis=2), psi.mean(axis=1)
+    n_columns = y_score.shape[1]
+    return (
+        np.cov(v10).reshape(n_columns, n_columns) / pos.shape[0]
+        + np.cov(v01).reshape(n_columns, n_columns) / neg.shape[0]
+    )
+
+
+###############################
+#     Tests for _midranks     #
+###############################
+
+
+def test_midranks() -> None:
+    assert objects_are_allclose(
+        _midranks(np.array([0.1, 0.2, 0.2, 0.5, 0.7, 0.7, 0.7])),
+        np.array([1.0, 2.5, 2.5, 4.0, 6.0, 6.0, 6.0]),
+    )
+
+
+def test_midranks_no_ties() -> None:
+    assert objects_are_allclose(_midranks(np.array([1.0, 2.0, 3.0])), np.array([1.0, 2.0, 3.0]))
+
+
+def test_midranks_empty() -> None:
+    assert objects_are_allclose(_midranks(np.array([])), np.array([]))
+
+
+#######################################
+#     Tests for delong_covariance     #
+#######################################
+
+
+def test_delong_covariance() -> None:
+    auc, cov = delong_covariance(Y_TRUE, np.stack([Y_SCORE_A, Y_SCORE_B], axis=1))
+    assert objects_are_allclose(auc, np.array([8 / 9, 7 / 9]))
+    assert objects_are_allclose(cov, np.array([[2 / 81, 1 / 81], [1 / 81, 5 / 81]]))
+
+
+def test_delong_covariance_1d() -> None:
+    auc, cov = delong_covariance(Y_TRUE, Y_SCORE_A)
+    assert objects_are_allclose(auc, np.array([8 / 9]))
+    assert objects_are_allclose(cov, np.array([[2 / 81]]))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_delong_covariance_sklearn_and_naive(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, size=200)
+    # Rounded scores to have many ties.
+    y_score = np.round(y_true[:, None] * 0.3 + rng.random((200, 3)), decimals=1)
+    auc, cov = delong_covariance(y_true, y_score)
+    assert objects_are_allclose(
+        auc, np.array([roc_auc_score(y_true, y_score[:, i]) for i in range(3)])
+    )
+    assert objects_are_allclose(cov, naive_delong_covariance(y_true, y_score))
+
+
+def test_delong_covariance_one_class() -> None:
+    auc, cov = delong_covariance(np.array([1, 1, 1]), np.array([0.1, 0.2, 0.3]))
+    assert objects_are_allclose(auc, np.array([float("nan")]), equal_nan=True)
+    assert objects_are_allclose(cov, np.array([[float("nan")]]), equal_nan=True)
+
+
+def test_delong_covariance_one_positive() -> None:
+    auc, cov = delong_covariance(np.array([1, 0, 0]), np.array([0.5, 0.2, 0.6]))
+    assert objects_are_allclose(auc, np.array([0.5]))
+    assert objects_are_allclose(cov, np.array([[float("nan")]]), equal_nan=True)
+
+
+####################################
+#     Tests for delong_roc_auc     #
+####################################
+
+
+def test_delong_roc_auc() -> None:
+    assert objects_are_allclose(
+        delong_roc_auc(y_true=Y_TRUE, y_score=Y_SCORE_A),
+        {
+            "count": 6,
+            "roc_auc": 8 / 9,
+            "roc_auc_ci_high": 1.0,
+            "roc_auc_ci_low": 0.5809102612556272,
+            "roc_auc_variance": 2 / 81,
+        },
+    )
+
+
+def test_delong_roc_auc_perfect() -> None:
+    assert objects_are_allclose(
+        delong_roc_auc(y_true=np.array([1, 0, 0, 1]), y_score=np.array([0.9, 0.1, 0.2, 0.8])),
+        {
+            "count": 4,
+            "roc_auc": 1.0,
+            "roc_auc_ci_high": 1.0,
+            "roc_auc_ci_low": 1.0,
+            "roc_auc_variance": 0.0,
+        },
+    )
+
+
+def test_delong_roc_auc_confidence_level() -> None:
+    std = math.sqrt(2 / 81)
+    assert objects_are_allclose(
+        delong_roc_auc(y_true=Y_TRUE, y_score=Y_SCORE_A, confidence_level=0.5),
+        {
+            "count": 6,
+            "roc_auc": 8 / 9,
+            "roc_auc_ci_high": 8 / 9 + 0.6744897501960817 * std,
+            "roc_auc_ci_low": 8 / 9 - 0.6744897501960817 * std,
+            "roc_auc_variance": 2 / 81,
+        },
+    )
+
+
+def test_delong_roc_auc_2d() -> None:
+    assert objects_are_allclose(
+        delong_roc_auc(y_true=Y_TRUE.reshape(2, 3), y_score=Y_SCORE_A.reshape(2, 3)),
+        delong_roc_auc(y_true=Y_TRUE, y_score=Y_SCORE_A),
+    )
+
+
+def test_delong_roc_auc_empty() -> None:
+    assert objects_are_allclose(
+        delong_roc_auc(y_true=np.array([]), y_score=np.array([])),
+        {
+            "count": 0,
+            "roc_auc": float("nan"),
+            "roc_auc_ci_high": float("nan"),
+            "roc_auc_ci_low": float("nan"),
+            "roc_auc_variance": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+def test_delong_roc_auc_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        delong_roc_auc(y_true=Y_TRUE, y_score=Y_SCORE_A, prefix="prefix_", suffix="_suffix"),
+        {
+            "prefix_count_suffix": 6,
+            "prefix_roc_auc_suffix": 8 / 9,
+            "prefix_roc_auc_ci_high_suffix": 1.0,
+            "prefix_roc_auc_ci_low_suffix": 0.5809102612556272,
+            "prefix_roc_auc_variance_suffix": 2 / 81,
+        },
+    )
+
+
+def test_delong_roc_auc_incorrect_confidence_level() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect 'confidence_level': 1\.0"):
+        delong_roc_auc(y_true=Y_TRUE, y_score=Y_SCORE_A, confidence_level=1.0)
+
+
+def test_delong_roc_auc_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="arrays have different shapes"):
+        delong_roc_auc(y_true=Y_TRUE, y_score=np.array([0.1, 0.2]))
+
+
+def test_delong_roc_auc_nan_omit() -> None:
+    assert objects_are_allclose(
+        delong_roc_auc(
+            y_true=np.array([1, 0, 0, 1, 1, 0, float("nan"), 1]),
+            y_score=np.array([0.9, 0.2, 0.6, 0.8, 0.4, 0.1, 0.5, float("nan")]),
+            nan_policy="omit",
+        ),
+        delong_roc_auc(y_true=Y_TRUE, y_score=Y_SCORE_A),
+    )
+
+
+def test_delong_roc_auc_nan_propagate() -> None:
+    assert objects_are_allclose(
+        delong_roc_auc(
+            y_true=np.array([1, 0, 0, 1, 1, 0]),
+            y_score=np.array([0.9, 0.2, 0.6, 0.8, 0.4, float("nan")]),
+        ),
+        {
+            "count": 6,
+            "roc_auc": float("nan"),
+            "roc_auc_ci_high": float("nan"),
+            "roc_auc_ci_low": float("nan"),
+            "roc_auc_variance": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+def test_delong_roc_auc_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_score' contains at least one NaN value"):
+        delong_roc_auc(
+            y_true=np.array([1, 0, 0, 1, 1, 0]),
+            y_score=np.array([0.9, 0.2, 0.6, 0.8, 0.4, float("nan")]),
+            nan_policy="raise",
+        )
+
+
+def test_delong_roc_auc_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        delong_roc_auc(y_true=Y_TRUE, y_score=Y_SCORE_A, nan_policy="incorrect")
+
+
+#########################################
+#     Tests for delong_roc_auc_test     #
+#########################################
+
+
+def test_delong_roc_auc_test() -> None:
+    assert objects_are_allclose(
+        delong_roc_auc_test(y_true=Y_TRUE, y_scores={"a": Y_SCORE_A, "b": Y_SCORE_B}),
+        {
+            "a_roc_auc": 8 / 9,
+            "a_roc_auc_ci_high": 1.0,
+            "a_roc_auc_ci_low": 0.5809102612556272,
+            "a_roc_auc_variance": 2 / 81,
+            "a_vs_b_pvalue": 0.6547208460185772,
+            "a_vs_b_roc_auc_diff": 1 / 9,
+            "a_vs_b_z_score": 0.44721359549995776,
+            "b_roc_auc": 7 / 9,
+            "b_roc_auc_ci_high": 1.0,
+            "b_roc_auc_ci_low": 0.2908208107907881,
+            "b_roc_auc_variance": 5 / 81,
+            "count": 6,
+        },
+    )
+
+
+def test_delong_roc_auc_test_three_columns() -> None:
+    out = delong_roc_auc_test(
+        y_true=Y_TRUE, y_scores={"a": Y_SCORE_A, "b": Y_SCORE_B, "c": 1.0 - Y_SCORE_A}
+    )
+    assert len(out) == 1 + 3 * 4 + 3 * 3
+    assert objects_are_allclose(out["a_vs_c_roc_auc_diff"], 7 / 9)
+    assert objects_are_allclose(out["b_vs_c_roc_auc_diff"], 2 / 3)
+    assert "c_vs_b_roc_auc_diff" not in out
+
+
+def test_delong_roc_auc_test_same_ranking() -> None:
+    out = delong_roc_auc_test(y_true=Y_TRUE, y_scores={"a": Y_SCORE_A, "b": 2.0 * Y_SCORE_A})
+    assert out["a_vs_b_roc_auc_diff"] == 0.0
+    assert out["a_vs_b_z_score"] == 0.0
+    assert out["a_vs_b_pvalue"] == 1.0
+
+
+def test_delong_roc_auc_test_symmetric() -> None:
+    out1 = delong_roc_auc_test(y_true=Y_TRUE, y_scores={"a": Y_SCORE_A, "b": Y_SCORE_B})
+    out2 = delong_roc_auc_test(y_true=Y_TRUE, y_scores={"b": Y_SCORE_B, "a": Y_SCORE_A})
+    assert objects_are_allclose(out1["a_vs_b_roc_auc_diff"], -out2["b_vs_a_roc_auc_diff"])
+    assert objects_are_allclose(out1["a_vs_b_z_score"], -out2["b_vs_a_z_score"])
+    assert objects_are_allclose(out1["a_vs_b_pvalue"], out2["b_vs_a_pvalue"])
+
+
+def test_delong_roc_auc_test_large_difference() -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.integers(0, 2, size=2000)
+    out = delong_roc_auc_test(
+        y_true=y_true,
+        y_scores={"good": y_true + rng.normal(size=2000), "random": rng.normal(size=2000)},
+    )
+    assert out["good_vs_random_roc_auc_diff"] > 0.2
+    assert out["good_vs_random_pvalue"] < 1e-6
+
+
+def test_delong_roc_auc_test_nan_omit() -> None:
+    assert objects_are_allclose(
+        delong_roc_auc_test(
+            y_true=np.array([1, 0, 0, 1, 1, 0, 1, 0]),
+            y_scores={
+                "a": np.append(Y_SCORE_A, [float("nan"), 0.5]),
+                "b": np.append(Y_SCORE_B, [0.5, float("nan")]),
+            },
+            nan_policy="omit",
+        ),
+        delong_roc_auc_test(y_true=Y_TRUE, y_scores={"a": Y_SCORE_A, "b": Y_SCORE_B}),
+    )
+
+
+def test_delong_roc_auc_test_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'b' contains at least one NaN value"):
+        delong_roc_auc_test(
+            y_true=Y_TRUE,
+            y_scores={"a": Y_SCORE_A, "b": np.append(Y_SCORE_B[:5], float("nan"))},
+            nan_policy="raise",
+        )
+
+
+def test_delong_roc_auc_test_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="have different shapes"):
+        delong_roc_auc_test(y_true=Y_TRUE, y_scores={"a": Y_SCORE_A, "b": Y_SCORE_B[:4]})
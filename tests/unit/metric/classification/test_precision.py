@@ -11,6 +11,11 @@ from arkas.metric import (
     precision,
 )
 from arkas.metric.classification.precision import find_label_type
+from arkas.testing import scipy_available
+from arkas.utils.imports import is_scipy_available
+
+if is_scipy_available():
+    from scipy import sparse
 
 ###############################
 #     Tests for precision     #
@@ -1012,3 +1017,14 @@ def test_find_label_type_multilabel_y_pred_nan() -> None:
         )
         == "multilabel"
     )
+
+
+@scipy_available
+def test_find_label_type_multilabel_sparse() -> None:
+    assert (
+        find_label_type(
+            y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]])),
+            y_pred=sparse.csr_array(np.array([[1, 0, 0], [0, 1, 1], [0, 1, 1], [1, 0, 0]])),
+        )
+        == "multilabel"
+    )
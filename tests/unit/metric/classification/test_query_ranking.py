@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+from sklearn.metrics import ndcg_score
+
+from arkas.metric import QuerySegments, query_ranking_metrics
+
+QUERY_ID = np.array([1, 1, 1, 2, 2, 2, 2])
+Y_TRUE = np.array([0, 1, 2, 1, 0, 0, 1])
+Y_SCORE = np.array([0.1, 0.2, 0.9, 0.5, 0.8, 0.3, 0.4])
+
+
+###########################################
+#     Tests for query_ranking_metrics     #
+###########################################
+
+
+def test_query_ranking_metrics() -> None:
+    assert objects_are_allclose(
+        query_ranking_metrics(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE, k=[1, 3]),
+        {
+            "count": 7,
+            "map": 0.7916666666666666,
+            "mrr": 0.75,
+            "ndcg": 0.8467132018086354,
+            "ndcg_at_1": 0.5,
+            "ndcg_at_3": 0.8467132018086354,
+            "num_queries": 2,
+            "precision_at_1": 0.5,
+            "precision_at_3": 0.6666666666666666,
+            "recall_at_1": 0.25,
+            "recall_at_3": 1.0,
+        },
+    )
+
+
+def test_query_ranking_metrics_perfect() -> None:
+    assert objects_are_allclose(
+        query_ranking_metrics(
+            query_id=np.array(["a", "a", "b", "b", "b"]),
+            y_true=np.array([1, 0, 0, 1, 1]),
+            y_score=np.array([2, 1, 0, 3, 4]),
+            k=[2],
+        ),
+        {
+            "count": 5,
+            "map": 1.0,
+            "mrr": 1.0,
+            "ndcg": 1.0,
+            "ndcg_at_2": 1.0,
+            "num_queries": 2,
+            "precision_at_2": 0.75,
+            "recall_at_2": 1.0,
+        },
+    )
+
+
+def test_query_ranking_metrics_unsorted_queries() -> None:
+    order = np.array([6, 0, 3, 5, 1, 4, 2])
+    assert objects_are_equal(
+        query_ranking_metrics(
+            query_id=QUERY_ID[order], y_true=Y_TRUE[order], y_score=Y_SCORE[order], k=[1, 3]
+        ),
+        query_ranking_metrics(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE, k=[1, 3]),
+    )
+
+
+@pytest.mark.parametrize("k", [1, 3, 8])
+def test_query_ranking_metrics_ndcg_same_as_sklearn(k: int) -> None:
+    rng = np.random.default_rng(k)
+    y_true = rng.integers(0, 4, size=(50, 8))
+    y_score = rng.random(size=(50, 8))
+    metrics = query_ranking_metrics(
+        query_id=np.repeat(np.arange(50), 8), y_true=y_true.ravel(), y_score=y_score.ravel(), k=[k]
+    )
+    assert objects_are_allclose(metrics[f"ndcg_at_{k}"], float(ndcg_score(y_true, y_score, k=k)))
+    assert objects_are_allclose(metrics["ndcg"], float(ndcg_score(y_true, y_score)))
+
+
+def test_query_ranking_metrics_no_relevant() -> None:
+    assert objects_are_equal(
+        query_ranking_metrics(
+            query_id=np.array([1, 1, 2, 2]),
+            y_true=np.array([0, 0, 1, 0]),
+            y_score=np.array([0.2, 0.1, 0.9, 0.5]),
+            k=[1],
+        ),
+        {
+            "count": 4,
+            "map": 0.5,
+            "mrr": 0.5,
+            "ndcg": 0.5,
+            "ndcg_at_1": 0.5,
+            "num_queries": 2,
+            "precision_at_1": 0.5,
+            "recall_at_1": 0.5,
+        },
+    )
+
+
+def test_query_ranking_metrics_prefix_suffix() -> None:
+    assert list(
+        query_ranking_metrics(
+            query_id=QUERY_ID,
+            y_true=Y_TRUE,
+            y_score=Y_SCORE,
+            k=[2],
+            prefix="prefix_",
+            suffix="_suffix",
+        )
+    ) == [
+        "prefix_count_suffix",
+        "prefix_map_suffix",
+        "prefix_mrr_suffix",
+        "prefix_ndcg_suffix",
+        "prefix_ndcg_at_2_suffix",
+        "prefix_num_queries_suffix",
+        "prefix_precision_at_2_suffix",
+        "prefix_recall_at_2_suffix",
+    ]
+
+
+def test_query_ranking_metrics_empty() -> None:
+    assert objects_are_equal(
+        query_ranking_metrics(
+            query_id=np.array([]), y_true=np.array([]), y_score=np.array([]), k=[1]
+        ),
+        {
+            "count": 0,
+            "map": float("nan"),
+            "mrr": float("nan"),
+            "ndcg": float("nan"),
+            "ndcg_at_1": float("nan"),
+            "num_queries": 0,
+            "precision_at_1": float("nan"),
+            "recall_at_1": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+def test_query_ranking_metrics_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="arrays have different shapes"):
+        query_ranking_metrics(
+            query_id=np.array([1, 1, 2]), y_true=np.array([1, 0]), y_score=np.array([0.5, 0.1])
+        )
+
+
+def test_query_ranking_metrics_nan_omit() -> None:
+    assert objects_are_equal(
+        query_ranking_metrics(
+            query_id=np.array([1, 1, 1, 2, 2]),
+            y_true=np.array([1, 0, float("nan"), 0, 1]),
+            y_score=np.array([0.9, 0.5, 0.7, float("nan"), 0.2]),
+            k=[1],
+            nan_policy="omit",
+        ),
+        {
+            "count": 3,
+            "map": 1.0,
+            "mrr": 1.0,
+            "ndcg": 1.0,
+            "ndcg_at_1": 1.0,
+            "num_queries": 2,
+            "precision_at_1": 1.0,
+            "recall_at_1": 1.0,
+        },
+    )
+
+
+def test_query_ranking_metrics_nan_propagate() -> None:
+    metrics = query_ranking_metrics(
+        query_id=np.array([1, 1, 2]),
+        y_true=np.array([1, 0, float("nan")]),
+        y_score=np.array([0.9, 0.5, 0.7]),
+        k=[1],
+    )
+    assert metrics["count"] == 3
+    assert np.isnan(metrics["ndcg"])
+
+
+def test_query_ranking_metrics_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_score' contains at least one NaN value"):
+        query_ranking_metrics(
+            query_id=np.array([1, 1, 2]),
+            y_true=np.array([1, 0, 1]),
+            y_score=np.array([0.9, float("nan"), 0.7]),
+            nan_policy="raise",
+        )
+
+
+###################################
+#     Tests for QuerySegments     #
+###################################
+
+
+def test_query_segments_num_queries() -> None:
+    assert QuerySegments(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).num_queries == 2
+
+
+def test_query_segments_average_precision() -> None:
+    assert objects_are_allclose(
+        QuerySegments(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).average_precision(),
+        np.array([1.0, 0.5833333333333333]),
+    )
+
+
+def test_query_segments_ndcg() -> None:
+    assert objects_are_allclose(
+        QuerySegments(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).ndcg(k=3),
+        np.array([1.0, 0.6934264036172708]),
+    )
+
+
+def test_query_segments_precision() -> None:
+    assert objects_are_allclose(
+        QuerySegments(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).precision(k=2),
+        np.array([1.0, 0.5]),
+    )
+
+
+def test_query_segments_recall() -> None:
+    assert objects_are_allclose(
+        QuerySegments(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).recall(k=2),
+        np.array([1.0, 0.5]),
+    )
+
+
+def test_query_segments_reciprocal_rank() -> None:
+    assert objects_are_allclose(
+        QuerySegments(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).reciprocal_rank(),
+        np.array([1.0, 0.5]),
+    )
+
+
+def test_query_segments_ties_pessimistic() -> None:
+    segments = QuerySegments(
+        query_id=np.array([1, 1, 1]), y_true=np.array([0, 1, 0]), y_score=np.array([0.5, 0.5, 0.5])
+    )
+    assert objects_are_allclose(segments.reciprocal_rank(), np.array([1 / 3]))
+    assert objects_are_allclose(segments.average_precision(), np.array([1 / 3]))
+
+
+def test_query_segments_ties_averaged() -> None:
+    segments = QuerySegments(
+        query_id=np.array([1, 1, 1]), y_true=np.array([0, 1, 0]), y_score=np.array([0.5, 0.5, 0.5])
+    )
+    assert objects_are_allclose(segments.precision(k=1), np.array([1 / 3]))
+    assert objects_are_allclose(segments.recall(k=2), np.array([2 / 3]))
+    assert objects_are_allclose(
+        segments.ndcg(k=2), np.array([ndcg_score([[0, 1, 0]], [[0.5, 0.5, 0.5]], k=2)])
+    )
+
+
+@pytest.mark.parametrize("y_true", [[1, 0, 0], [0, 1, 0]])
+def test_query_ranking_metrics_ties(y_true: list[int]) -> None:
+    assert objects_are_allclose(
+        query_ranking_metrics(
+            query_id=np.array([1, 1, 1]),
+            y_true=np.array(y_true),
+            y_score=np.array([0.5, 0.5, 0.1]),
+            k=[1],
+        ),
+        {
+            "count": 3,
+            "map": 0.5,
+            "mrr": 0.5,
+            "ndcg": float(ndcg_score([y_true], [[0.5, 0.5, 0.1]])),
+            "ndcg_at_1": 0.5,
+            "num_queries": 1,
+            "precision_at_1": 0.5,
+            "recall_at_1": 0.5,
+        },
+    )
+
+
+def test_query_ranking_metrics_ties_row_order() -> None:
+    rng = np.random.default_rng(42)
+    query_id = rng.integers(0, 20, size=500)
+    y_true = rng.integers(0, 3, size=500)
+    y_score = rng.integers(0, 5, size=500) / 4
+    perm = rng.permutation(500)
+    assert objects_are_allclose(
+        query_ranking_metrics(query_id, y_true, y_score, k=[1, 3, 10]),
+        query_ranking_metrics(query_id[perm], y_true[perm], y_score[perm], k=[1, 3, 10]),
+    )
+
+
+def test_query_ranking_metrics_ties_ndcg_same_as_sklearn() -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.integers(0, 3, size=(8, 12))
+    y_score = rng.integers(0, 4, size=(8, 12)) / 3
+    metrics = query_ranking_metrics(
+        query_id=np.repeat(np.arange(8), 12), y_true=y_true.ravel(), y_score=y_score.ravel(), k=[3]
+    )
+    assert objects_are_allclose(
+        metrics["ndcg_at_3"],
+        float(np.mean([ndcg_score([t], [s], k=3) for t, s in zip(y_true, y_score)])),
+    )
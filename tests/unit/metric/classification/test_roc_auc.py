@@ -4,7 +4,13 @@ import numpy as np
 import pytest
 from coola import objects_are_allclose, objects_are_equal
 
-from arkas.metric import binary_roc_auc, multiclass_roc_auc, multilabel_roc_auc, roc_auc
+from arkas.metric import (
+    BinaryScoreHistogram,
+    binary_roc_auc,
+    multiclass_roc_auc,
+    multilabel_roc_auc,
+    roc_auc,
+)
 
 #############################
 #     Tests for roc_auc     #
@@ -513,6 +519,37 @@ def test_binary_roc_auc_nan_raise_y_score() -> None:
         )
 
 
+def test_binary_roc_auc_n_bins() -> None:
+    assert objects_are_equal(
+        binary_roc_auc(
+            y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), n_bins=10
+        ),
+        {"count": 5, "roc_auc": 1.0},
+    )
+
+
+def test_binary_roc_auc_n_bins_approximate() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=1000)
+    y_score = rng.random(size=1000) + 0.5 * y_true
+    assert objects_are_allclose(
+        binary_roc_auc(y_true=y_true, y_score=y_score, n_bins=1000),
+        binary_roc_auc(y_true=y_true, y_score=y_score),
+        atol=1e-3,
+    )
+
+
+def test_binary_roc_auc_histogram() -> None:
+    histogram = BinaryScoreHistogram(n_bins=10)
+    histogram.update(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.75, 0.4])
+    )
+    assert objects_are_equal(
+        binary_roc_auc(y_true=np.array([]), y_score=np.array([]), ranking=histogram),
+        {"count": 5, "roc_auc": 1.0},
+    )
+
+
 ########################################
 #     Tests for multiclass_roc_auc     #
 ########################################
@@ -842,6 +879,14 @@ def test_multiclass_roc_auc_nan_raise_y_score() -> None:
         )
 
 
+def test_multiclass_roc_auc_not_probabilities() -> None:
+    with pytest.raises(ValueError, match="Target scores need to be probabilities"):
+        multiclass_roc_auc(
+            y_true=np.array([0, 1, 2]),
+            y_score=np.array([[2.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 2.0]]),
+        )
+
+
 ########################################
 #     Tests for multilabel_roc_auc     #
 ########################################
@@ -895,6 +940,23 @@ def test_multilabel_roc_auc_3_classes() -> None:
     )
 
 
+def test_multilabel_roc_auc_class_without_positive() -> None:
+    assert objects_are_allclose(
+        multilabel_roc_auc(
+            y_true=np.array([[0, 1, 0], [0, 0, 1], [0, 1, 1], [0, 0, 0]]),
+            y_score=np.array([[0.1, 0.9, 0.2], [0.2, 0.3, 0.8], [0.3, 0.6, 0.4], [0.5, 0.2, 0.1]]),
+        ),
+        {
+            "count": 4,
+            "macro_roc_auc": float("nan"),
+            "micro_roc_auc": 0.96875,
+            "roc_auc": np.array([float("nan"), 1.0, 1.0]),
+            "weighted_roc_auc": 1.0,
+        },
+        equal_nan=True,
+    )
+
+
 def test_multilabel_roc_auc_empty_1d() -> None:
     assert objects_are_equal(
         multilabel_roc_auc(y_true=np.array([]), y_score=np.array([])),
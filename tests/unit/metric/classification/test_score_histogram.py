@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from arkas.metric import BinaryScoreHistogram, BinaryScoreRanking
+
+##########################################
+#     Tests for BinaryScoreHistogram     #
+##########################################
+
+
+def test_binary_score_histogram_repr() -> None:
+    assert repr(BinaryScoreHistogram(n_bins=10)) == (
+        "BinaryScoreHistogram(bounds=(0.0, 1.0), n_bins=10, integer=False, "
+        "nan_policy='propagate', count=0)"
+    )
+
+
+def test_binary_score_histogram_str() -> None:
+    assert str(BinaryScoreHistogram()).startswith("BinaryScoreHistogram(")
+
+
+def test_binary_score_histogram_incorrect_bounds() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'bounds'"):
+        BinaryScoreHistogram(bounds=(1.0, 0.0))
+
+
+def test_binary_score_histogram_incorrect_n_bins() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'n_bins': 0"):
+        BinaryScoreHistogram(n_bins=0)
+
+
+def test_binary_score_histogram_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        BinaryScoreHistogram(nan_policy="incorrect")
+
+
+def test_binary_score_histogram_integer() -> None:
+    histogram = BinaryScoreHistogram(bounds=(-2, 3), integer=True)
+    assert histogram.bounds == (-2, 3)
+    assert histogram.n_bins == 6
+    assert histogram.integer
+
+
+def test_binary_score_histogram_update() -> None:
+    histogram = BinaryScoreHistogram(n_bins=4)
+    histogram.update(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.75, 0.4])
+    )
+    assert histogram.count == 5
+    assert objects_are_equal(histogram.positives, np.array([0, 1, 0, 2]))
+    assert objects_are_equal(histogram.negatives, np.array([1, 1, 0, 0]))
+
+
+def test_binary_score_histogram_update_out_of_bounds() -> None:
+    histogram = BinaryScoreHistogram(n_bins=2)
+    histogram.update(y_true=np.array([1, 0, 1]), y_score=np.array([2.0, -1.0, 1.0]))
+    assert objects_are_equal(histogram.positives, np.array([0, 2]))
+    assert objects_are_equal(histogram.negatives, np.array([1, 0]))
+
+
+def test_binary_score_histogram_integer_exact() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=1000)
+    y_score = rng.integers(-5, 20, size=1000) + y_true * 3
+    histogram = BinaryScoreHistogram(bounds=(-5, 22), integer=True)
+    histogram.update(y_true=y_true, y_score=y_score)
+    ranking = BinaryScoreRanking(y_true=y_true, y_score=y_score)
+    assert objects_are_allclose(histogram.average_precision(), ranking.average_precision())
+    assert objects_are_allclose(histogram.roc_auc(), ranking.roc_auc())
+
+
+def test_binary_score_histogram_cumulative_counts() -> None:
+    histogram = BinaryScoreHistogram(n_bins=4)
+    histogram.update(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.75, 0.4])
+    )
+    tps, fps, thresholds = histogram.cumulative_counts()
+    assert objects_are_equal(tps, np.array([2, 3, 3]))
+    assert objects_are_equal(fps, np.array([0, 1, 2]))
+    assert objects_are_allclose(thresholds, np.array([0.75, 0.25, 0.0]))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("n_bins", [10, 100, 1000])
+def test_binary_score_histogram_bounds_contain_exact(seed: int, n_bins: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, size=2000)
+    y_score = np.clip(rng.normal(size=2000) * 0.15 + 0.4 + 0.2 * y_true, 0.0, 1.0)
+    histogram = BinaryScoreHistogram(n_bins=n_bins)
+    histogram.update(y_true=y_true, y_score=y_score)
+    ranking = BinaryScoreRanking(y_true=y_true, y_score=y_score)
+
+    ap_low, ap_high = histogram.average_precision_bounds()
+    assert ap_low <= ranking.average_precision() <= ap_high
+    assert ap_low <= histogram.average_precision() <= ap_high
+    auc_low, auc_high = histogram.roc_auc_bounds()
+    assert auc_low <= ranking.roc_auc() <= auc_high
+    assert auc_low <= histogram.roc_auc() <= auc_high
+
+
+def test_binary_score_histogram_error_decreases_with_n_bins() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=10000)
+    y_score = rng.random(size=10000) * 0.5 + 0.5 * y_true * rng.random(size=10000)
+    errors = []
+    for n_bins in [10, 100, 1000]:
+        histogram = BinaryScoreHistogram(n_bins=n_bins)
+        histogram.update(y_true=y_true, y_score=y_score)
+        low, high = histogram.roc_auc_bounds()
+        errors.append(high - low)
+    assert errors[0] > errors[1] > errors[2]
+    assert errors[2] < 0.01
+
+
+def test_binary_score_histogram_one_class() -> None:
+    histogram = BinaryScoreHistogram()
+    histogram.update(y_true=np.array([1, 1, 1]), y_score=np.array([0.2, 0.5, 0.8]))
+    assert histogram.average_precision() == 1.0
+    assert objects_are_equal(histogram.roc_auc(), float("nan"), equal_nan=True)
+    assert objects_are_equal(
+        histogram.roc_auc_bounds(), (float("nan"), float("nan")), equal_nan=True
+    )
+
+
+def test_binary_score_histogram_no_positive() -> None:
+    histogram = BinaryScoreHistogram()
+    histogram.update(y_true=np.array([0, 0, 0]), y_score=np.array([0.2, 0.5, 0.8]))
+    assert histogram.average_precision() == 0.0
+    assert histogram.average_precision_bounds() == (0.0, 0.0)
+
+
+def test_binary_score_histogram_empty() -> None:
+    histogram = BinaryScoreHistogram()
+    assert histogram.count == 0
+    assert objects_are_equal(histogram.average_precision(), float("nan"), equal_nan=True)
+    assert objects_are_equal(histogram.roc_auc(), float("nan"), equal_nan=True)
+    assert objects_are_equal(
+        histogram.average_precision_bounds(), (float("nan"), float("nan")), equal_nan=True
+    )
+    assert objects_are_equal(
+        histogram.cumulative_counts(),
+        (np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([])),
+    )
+
+
+def test_binary_score_histogram_nan_omit() -> None:
+    histogram = BinaryScoreHistogram(nan_policy="omit")
+    histogram.update(
+        y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+        y_score=np.array([0.9, 0.1, 0.35, float("nan"), 0.4, 0.5]),
+    )
+    assert histogram.count == 4
+    assert histogram.roc_auc() == 1.0
+
+
+def test_binary_score_histogram_nan_propagate() -> None:
+    histogram = BinaryScoreHistogram()
+    histogram.update(
+        y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+        y_score=np.array([0.9, 0.1, 0.35, 0.75, 0.4, 0.5]),
+    )
+    histogram.update(y_true=np.array([1, 0]), y_score=np.array([0.9, 0.1]))
+    assert histogram.count == 8
+    assert objects_are_equal(histogram.average_precision(), float("nan"), equal_nan=True)
+    assert objects_are_equal(histogram.roc_auc(), float("nan"), equal_nan=True)
+
+
+def test_binary_score_histogram_nan_raise() -> None:
+    histogram = BinaryScoreHistogram(nan_policy="raise")
+    with pytest.raises(ValueError, match="'y_score' contains at least one NaN value"):
+        histogram.update(y_true=np.array([1, 0]), y_score=np.array([0.9, float("nan")]))
+
+
+def test_binary_score_histogram_merge() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=1000)
+    y_score = rng.random(size=1000)
+    histogram = BinaryScoreHistogram(n_bins=50)
+    histogram.update(y_true=y_true, y_score=y_score)
+    histogram1 = BinaryScoreHistogram(n_bins=50)
+    histogram1.update(y_true=y_true[:300], y_score=y_score[:300])
+    histogram2 = BinaryScoreHistogram(n_bins=50)
+    histogram2.update(y_true=y_true[300:], y_score=y_score[300:])
+    histogram1.merge(histogram2)
+    assert histogram1.count == 1000
+    assert objects_are_equal(histogram1.positives, histogram.positives)
+    assert objects_are_equal(histogram1.negatives, histogram.negatives)
+    assert histogram1.roc_auc() == histogram.roc_auc()
+
+
+def test_binary_score_histogram_merge_different_buckets() -> None:
+    with pytest.raises(ValueError, match="The histograms must have the same buckets"):
+        BinaryScoreHistogram(n_bins=10).merge(BinaryScoreHistogram(n_bins=20))
+
+
+def test_binary_score_histogram_from_scores() -> None:
+    histogram = BinaryScoreHistogram.from_scores(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.75, 0.4]), n_bins=8
+    )
+    assert histogram.bounds == (0.1, 0.9)
+    assert histogram.n_bins == 8
+    assert not histogram.integer
+    assert histogram.count == 5
+
+
+def test_binary_score_histogram_from_scores_integer() -> None:
+    histogram = BinaryScoreHistogram.from_scores(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+    )
+    assert histogram.bounds == (-1, 3)
+    assert histogram.integer
+    assert histogram.average_precision() == 1.0
+    assert histogram.roc_auc() == 1.0
+
+
+def test_binary_score_histogram_from_scores_integer_too_many_values() -> None:
+    histogram = BinaryScoreHistogram.from_scores(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([200, -1, 0, 3, 1]), n_bins=10
+    )
+    assert not histogram.integer
+    assert histogram.n_bins == 10
+
+
+def test_binary_score_histogram_from_scores_constant() -> None:
+    histogram = BinaryScoreHistogram.from_scores(
+        y_true=np.array([1, 0, 0, 1]), y_score=np.array([0.5, 0.5, 0.5, 0.5])
+    )
+    assert histogram.roc_auc() == 0.5
+
+
+def test_binary_score_histogram_from_scores_empty() -> None:
+    histogram = BinaryScoreHistogram.from_scores(y_true=np.array([]), y_score=np.array([]))
+    assert histogram.count == 0
+    assert histogram.bounds == (0, 1)
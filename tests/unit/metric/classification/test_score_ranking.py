@@ -0,0 +1,425 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+from sklearn import metrics
+
+from arkas.metric import BinaryScoreRanking
+from arkas.metric.classification import score_ranking
+from arkas.metric.classification.score_ranking import (
+    average_binary_scores,
+    binarize_multiclass_labels,
+    columnwise_average_precision,
+    columnwise_roc_auc,
+)
+from arkas.metric.utils import prepare_inputs
+
+########################################
+#     Tests for BinaryScoreRanking     #
+########################################
+
+
+def test_binary_score_ranking_repr() -> None:
+    assert repr(
+        BinaryScoreRanking(y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]))
+    ).startswith("BinaryScoreRanking(")
+
+
+def test_binary_score_ranking_str() -> None:
+    assert str(
+        BinaryScoreRanking(y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]))
+    ).startswith("BinaryScoreRanking(")
+
+
+def test_binary_score_ranking_nan_policy_default() -> None:
+    assert (
+        BinaryScoreRanking(
+            y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+        ).nan_policy
+        == "propagate"
+    )
+
+
+def test_binary_score_ranking_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        BinaryScoreRanking(
+            y_true=np.array([1, 0, 0, 1, 1]),
+            y_score=np.array([2, -1, 0, 3, 1]),
+            nan_policy="incorrect",
+        )
+
+
+def test_binary_score_ranking_from_prepared() -> None:
+    ranking = BinaryScoreRanking.from_prepared(
+        prepare_inputs(
+            y_true=np.array([1, 0, 0, 1, 1, 0]),
+            y_pred=np.array([2, -1, 0, 3, 1, float("nan")]),
+            nan_policy="omit",
+            pred_name="y_score",
+        )
+    )
+    assert ranking.count == 5
+    assert ranking.nan_policy == "omit"
+    assert ranking.average_precision() == 1.0
+
+
+def test_binary_score_ranking_from_counts() -> None:
+    y_true, y_score = np.array([1, 0, 0, 1, 1, 0]), np.array([0.9, 0.8, 0.1, 0.7, 0.4, 0.4])
+    ranking = BinaryScoreRanking(y_true=y_true, y_score=y_score)
+    tps, fps, thresholds = ranking.cumulative_counts()
+    other = BinaryScoreRanking.from_counts(tps=tps, fps=fps, thresholds=thresholds)
+    assert other.count == 6
+    assert objects_are_allclose(other.average_precision(), ranking.average_precision())
+    assert objects_are_allclose(other.roc_auc(), ranking.roc_auc())
+
+
+def test_binary_score_ranking_from_counts_repeated_counts() -> None:
+    ranking = BinaryScoreRanking.from_counts(
+        tps=np.array([0, 1, 1, 2, 2]),
+        fps=np.array([0, 0, 0, 0, 1]),
+        thresholds=np.array([4, 3, 2, 1, 0]),
+    )
+    assert ranking.count == 3
+    assert ranking.average_precision() == 1.0
+    assert ranking.roc_auc() == 1.0
+
+
+def test_binary_score_ranking_from_counts_empty() -> None:
+    ranking = BinaryScoreRanking.from_counts(
+        tps=np.array([], dtype=int), fps=np.array([], dtype=int), thresholds=np.array([])
+    )
+    assert ranking.count == 0
+    assert np.isnan(ranking.roc_auc())
+
+
+def test_binary_score_ranking_count() -> None:
+    assert (
+        BinaryScoreRanking(
+            y_true=np.array([[1, 0, 0], [1, 1, 0]]), y_score=np.array([[2, -1, 0], [3, 1, -2]])
+        ).count
+        == 6
+    )
+
+
+def test_binary_score_ranking_count_nan_omit() -> None:
+    assert (
+        BinaryScoreRanking(
+            y_true=np.array([1, 0, 0, 1, float("nan")]),
+            y_score=np.array([float("nan"), -1, 0, 3, 1]),
+            nan_policy="omit",
+        ).count
+        == 3
+    )
+
+
+def test_binary_score_ranking_average_precision_correct() -> None:
+    assert (
+        BinaryScoreRanking(
+            y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+        ).average_precision()
+        == 1.0
+    )
+
+
+def test_binary_score_ranking_average_precision_incorrect() -> None:
+    assert objects_are_allclose(
+        BinaryScoreRanking(
+            y_true=np.array([1, 0, 0, 1]), y_score=np.array([-1, 1, 0, -2])
+        ).average_precision(),
+        0.41666666666666663,
+    )
+
+
+def test_binary_score_ranking_average_precision_no_positive() -> None:
+    assert (
+        BinaryScoreRanking(
+            y_true=np.array([0, 0, 0, 0]), y_score=np.array([-1, 1, 0, -2])
+        ).average_precision()
+        == 0.0
+    )
+
+
+def test_binary_score_ranking_average_precision_empty() -> None:
+    assert objects_are_equal(
+        BinaryScoreRanking(y_true=np.array([]), y_score=np.array([])).average_precision(),
+        float("nan"),
+        equal_nan=True,
+    )
+
+
+def test_binary_score_ranking_average_precision_nan_propagate() -> None:
+    assert objects_are_equal(
+        BinaryScoreRanking(
+            y_true=np.array([1, 0, 0, 1, float("nan")]),
+            y_score=np.array([float("nan"), -1, 0, 3, 1]),
+        ).average_precision(),
+        float("nan"),
+        equal_nan=True,
+    )
+
+
+def test_binary_score_ranking_average_precision_nan_raise() -> None:
+    ranking = BinaryScoreRanking(
+        y_true=np.array([1, 0, 0, 1, float("nan")]),
+        y_score=np.array([float("nan"), -1, 0, 3, 1]),
+        nan_policy="raise",
+    )
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        ranking.average_precision()
+
+
+def test_binary_score_ranking_roc_auc_correct() -> None:
+    assert (
+        BinaryScoreRanking(
+            y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+        ).roc_auc()
+        == 1.0
+    )
+
+
+def test_binary_score_ranking_roc_auc_incorrect() -> None:
+    assert (
+        BinaryScoreRanking(
+            y_true=np.array([1, 0, 0, 1]), y_score=np.array([-1, 1, 0, -2])
+        ).roc_auc()
+        == 0.0
+    )
+
+
+def test_binary_score_ranking_roc_auc_ties() -> None:
+    assert (
+        BinaryScoreRanking(y_true=np.array([1, 0, 0, 1]), y_score=np.array([1, 1, 0, 0])).roc_auc()
+        == 0.5
+    )
+
+
+def test_binary_score_ranking_roc_auc_one_class() -> None:
+    assert objects_are_equal(
+        BinaryScoreRanking(y_true=np.array([1, 1, 1]), y_score=np.array([2, -1, 0])).roc_auc(),
+        float("nan"),
+        equal_nan=True,
+    )
+
+
+def test_binary_score_ranking_roc_auc_nan_omit() -> None:
+    assert (
+        BinaryScoreRanking(
+            y_true=np.array([1, 0, 0, 1, float("nan")]),
+            y_score=np.array([float("nan"), -1, 0, 3, 1]),
+            nan_policy="omit",
+        ).roc_auc()
+        == 1.0
+    )
+
+
+def test_binary_score_ranking_cumulative_counts() -> None:
+    assert objects_are_equal(
+        BinaryScoreRanking(
+            y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, 0, 0, 3, 1])
+        ).cumulative_counts(),
+        (np.array([1, 2, 3, 3]), np.array([0, 0, 0, 2]), np.array([3, 2, 1, 0])),
+    )
+
+
+def test_binary_score_ranking_cumulative_counts_empty() -> None:
+    assert objects_are_equal(
+        BinaryScoreRanking(y_true=np.array([]), y_score=np.array([])).cumulative_counts(),
+        (np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([])),
+    )
+
+
+def test_binary_score_ranking_precision_recall_curve_empty() -> None:
+    assert objects_are_equal(
+        BinaryScoreRanking(y_true=np.array([]), y_score=np.array([])).precision_recall_curve(),
+        (np.array([]), np.array([]), np.array([])),
+    )
+
+
+def test_binary_score_ranking_roc_curve_empty() -> None:
+    assert objects_are_equal(
+        BinaryScoreRanking(y_true=np.array([]), y_score=np.array([])).roc_curve(),
+        (np.array([]), np.array([]), np.array([])),
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_binary_score_ranking_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, size=500)
+    y_score = rng.integers(0, 20, size=500).astype(float)
+    ranking = BinaryScoreRanking(y_true=y_true, y_score=y_score)
+    assert objects_are_allclose(
+        ranking.average_precision(), float(metrics.average_precision_score(y_true, y_score))
+    )
+    assert objects_are_allclose(ranking.roc_auc(), float(metrics.roc_auc_score(y_true, y_score)))
+    assert objects_are_allclose(
+        ranking.precision_recall_curve(), metrics.precision_recall_curve(y_true, y_score)
+    )
+    assert objects_are_allclose(
+        ranking.roc_curve(), metrics.roc_curve(y_true, y_score, drop_intermediate=False)
+    )
+
+
+def test_binary_score_ranking_sort_once() -> None:
+    ranking = BinaryScoreRanking(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+    )
+    tps, _, _ = ranking.cumulative_counts()
+    ranking.average_precision()
+    ranking.roc_auc()
+    assert ranking.cumulative_counts()[0] is tps
+
+
+###########################################
+#     Tests for average_binary_scores     #
+###########################################
+
+
+def test_average_binary_scores() -> None:
+    assert objects_are_equal(
+        average_binary_scores(
+            scores=np.array([1.0, 0.5, 0.0]), y_true=np.array([[1, 0, 1], [0, 1, 0], [1, 0, 0]])
+        ),
+        {"macro": 0.5, "weighted": 0.625},
+    )
+
+
+def test_average_binary_scores_no_positive() -> None:
+    assert objects_are_equal(
+        average_binary_scores(scores=np.array([0.0, 0.0]), y_true=np.array([[0, 0], [0, 0]])),
+        {"macro": 0.0, "weighted": 0.0},
+    )
+
+
+def test_average_binary_scores_nan_without_positive() -> None:
+    assert objects_are_equal(
+        average_binary_scores(
+            scores=np.array([float("nan"), 1.0, 0.5]),
+            y_true=np.array([[0, 1, 0], [0, 0, 1], [0, 1, 1]]),
+        ),
+        {"macro": float("nan"), "weighted": 0.75},
+        equal_nan=True,
+    )
+
+
+################################################
+#     Tests for binarize_multiclass_labels     #
+################################################
+
+
+def test_binarize_multiclass_labels() -> None:
+    assert objects_are_equal(
+        binarize_multiclass_labels(np.array([0, 2, 1, 1]), n_classes=3),
+        np.array([[1, 0, 0], [0, 0, 1], [0, 1, 0], [0, 1, 0]]),
+    )
+
+
+def test_binarize_multiclass_labels_float() -> None:
+    assert objects_are_equal(
+        binarize_multiclass_labels(np.array([3.0, 5.0, 3.0]), n_classes=2),
+        np.array([[1, 0], [0, 1], [1, 0]]),
+    )
+
+
+def test_binarize_multiclass_labels_incorrect_n_classes() -> None:
+    with pytest.raises(ValueError, match="Number of classes in y_true"):
+        binarize_multiclass_labels(np.array([0, 1, 1]), n_classes=3)
+
+
+##################################################
+#     Tests for columnwise_average_precision     #
+##################################################
+
+
+def test_columnwise_average_precision() -> None:
+    assert objects_are_allclose(
+        columnwise_average_precision(
+            y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+            y_score=np.array([[2, -1, -1], [-1, 1, 2], [0, 2, 3], [3, -2, -4], [1, -3, -5]]),
+        ),
+        np.array([1.0, 1.0, 0.4777777777777778]),
+    )
+
+
+def test_columnwise_average_precision_no_positive() -> None:
+    assert objects_are_equal(
+        columnwise_average_precision(
+            y_true=np.array([[0, 1], [0, 0], [0, 1]]), y_score=np.array([[1, 2], [2, 1], [3, 3]])
+        ),
+        np.array([0.0, 1.0]),
+    )
+
+
+def test_columnwise_average_precision_empty() -> None:
+    assert objects_are_equal(
+        columnwise_average_precision(y_true=np.zeros((0, 3)), y_score=np.zeros((0, 3))),
+        np.zeros(3),
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_columnwise_average_precision_ranking(seed: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(score_ranking, "_MAX_CHUNK_SIZE", 7)
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, size=(50, 5))
+    y_score = rng.integers(0, 10, size=(50, 5)).astype(float)
+    assert objects_are_allclose(
+        columnwise_average_precision(y_true=y_true, y_score=y_score),
+        np.array(
+            [
+                BinaryScoreRanking(y_true=y_true[:, i], y_score=y_score[:, i]).average_precision()
+                for i in range(5)
+            ]
+        ),
+    )
+
+
+########################################
+#     Tests for columnwise_roc_auc     #
+########################################
+
+
+def test_columnwise_roc_auc() -> None:
+    assert objects_are_equal(
+        columnwise_roc_auc(
+            y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+            y_score=np.array([[2, -1, -1], [-1, 1, 2], [0, 2, 3], [3, -2, -4], [1, -3, -5]]),
+        ),
+        np.array([1.0, 1.0, 0.0]),
+    )
+
+
+def test_columnwise_roc_auc_one_class() -> None:
+    assert objects_are_equal(
+        columnwise_roc_auc(
+            y_true=np.array([[0, 1], [0, 0], [0, 1]]), y_score=np.array([[1, 2], [2, 1], [3, 3]])
+        ),
+        np.array([float("nan"), 1.0]),
+        equal_nan=True,
+    )
+
+
+def test_columnwise_roc_auc_empty() -> None:
+    assert objects_are_equal(
+        columnwise_roc_auc(y_true=np.zeros((0, 2)), y_score=np.zeros((0, 2))),
+        np.array([float("nan"), float("nan")]),
+        equal_nan=True,
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_columnwise_roc_auc_ranking(seed: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(score_ranking, "_MAX_CHUNK_SIZE", 7)
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, size=(50, 5))
+    y_score = rng.integers(0, 10, size=(50, 5)).astype(float)
+    assert objects_are_allclose(
+        columnwise_roc_auc(y_true=y_true, y_score=y_score),
+        np.array(
+            [
+                BinaryScoreRanking(y_true=y_true[:, i], y_score=y_score[:, i]).roc_auc()
+                for i in range(5)
+            ]
+        ),
+    )
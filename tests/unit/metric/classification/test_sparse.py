@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from arkas.metric import (
+    multilabel_average_precision,
+    multilabel_confusion_matrix,
+    multilabel_precision,
+    multilabel_recall,
+    multilabel_roc_auc,
+)
+from arkas.metric.classification.confmat_kernel import (
+    multiclass_confusion_counts,
+    multilabel_confusion_counts,
+)
+from arkas.metric.classification.score_ranking import (
+    BinaryScoreRanking,
+    columnwise_average_precision,
+    columnwise_roc_auc,
+)
+from arkas.metric.classification.sparse import (
+    sparse_columnwise_average_precision,
+    sparse_columnwise_roc_auc,
+    sparse_micro_average_precision,
+    sparse_micro_roc_auc,
+    sparse_multiclass_confusion_counts,
+    sparse_multilabel_confusion_counts,
+)
+from arkas.testing import scipy_available
+from arkas.utils.imports import is_scipy_available
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+if is_scipy_available():
+    from scipy import sparse
+
+
+def random_sparse_arrays(seed: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    y_true = (rng.random((100, 8)) < 0.2).astype(int)
+    # round the scores to create ties, and use negative scores
+    y_score = np.round(rng.normal(size=(100, 8)), decimals=1) * (rng.random((100, 8)) < 0.3)
+    y_pred = (y_score > 0.5).astype(int)
+    return y_true, y_pred, y_score
+
+
+########################################################
+#     Tests for sparse_multiclass_confusion_counts     #
+########################################################
+
+
+@scipy_available
+def test_sparse_multiclass_confusion_counts() -> None:
+    matrix, labels = sparse_multiclass_confusion_counts(
+        y_true=np.array([0, 0, 1, 1, 5, 5]), y_pred=np.array([0, 1, 1, 5, 5, 5])
+    )
+    assert isinstance(matrix, sparse.csr_array)
+    assert matrix.nnz == 5
+    assert objects_are_equal(matrix.toarray(), np.array([[1, 1, 0], [0, 1, 1], [0, 0, 2]]))
+    assert objects_are_equal(labels, np.array([0, 1, 5]))
+
+
+@scipy_available
+def test_sparse_multiclass_confusion_counts_string() -> None:
+    matrix, labels = sparse_multiclass_confusion_counts(
+        y_true=np.array(["cat", "dog", "dog"]), y_pred=np.array(["dog", "dog", "bird"])
+    )
+    assert objects_are_equal(matrix.toarray(), np.array([[0, 0, 0], [0, 0, 1], [1, 0, 1]]))
+    assert objects_are_equal(labels, np.array(["bird", "cat", "dog"]))
+
+
+@scipy_available
+def test_sparse_multiclass_confusion_counts_uint64() -> None:
+    matrix, labels = sparse_multiclass_confusion_counts(
+        y_true=np.array([0, 1, 2, 2], dtype=np.uint64),
+        y_pred=np.array([0, 1, 1, 2], dtype=np.uint64),
+    )
+    assert objects_are_equal(matrix.indices.dtype.kind, "i")
+    assert objects_are_equal(matrix.toarray(), np.array([[1, 0, 0], [0, 1, 0], [0, 1, 1]]))
+    assert objects_are_equal(labels, np.array([0, 1, 2], dtype=np.uint64))
+
+
+@scipy_available
+def test_sparse_multiclass_confusion_counts_many_classes() -> None:
+    y_true = np.arange(200_000)
+    y_pred = np.roll(y_true, 1)
+    matrix, labels = sparse_multiclass_confusion_counts(y_true=y_true, y_pred=y_pred)
+    assert matrix.shape == (200_000, 200_000)
+    assert matrix.nnz == 200_000
+    assert matrix[1, 0] == 1
+    assert matrix[0, 199_999] == 1
+    assert objects_are_equal(labels, y_true)
+
+
+@scipy_available
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sparse_multiclass_confusion_counts_same_as_dense(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true, y_pred = rng.integers(0, 20, size=500), rng.integers(0, 20, size=500)
+    matrix, labels = sparse_multiclass_confusion_counts(y_true=y_true, y_pred=y_pred)
+    assert objects_are_equal(
+        (matrix.toarray(), labels), multiclass_confusion_counts(y_true=y_true, y_pred=y_pred)
+    )
+
+
+@scipy_available
+def test_sparse_multiclass_confusion_counts_empty() -> None:
+    matrix, labels = sparse_multiclass_confusion_counts(y_true=np.array([]), y_pred=np.array([]))
+    assert matrix.shape == (0, 0)
+    assert labels.shape == (0,)
+
+
+########################################################
+#     Tests for sparse_multilabel_confusion_counts     #
+########################################################
+
+
+@scipy_available
+def test_sparse_multilabel_confusion_counts() -> None:
+    assert objects_are_equal(
+        sparse_multilabel_confusion_counts(
+            y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]])),
+            y_pred=sparse.csr_array(np.array([[1, 0, 0], [0, 1, 0], [0, 1, 1], [0, 0, 0]])),
+        ),
+        multilabel_confusion_counts(
+            y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]]),
+            y_pred=np.array([[1, 0, 0], [0, 1, 0], [0, 1, 1], [0, 0, 0]]),
+        ),
+    )
+
+
+@scipy_available
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sparse_multilabel_confusion_counts_same_as_dense(seed: int) -> None:
+    y_true, y_pred, _ = random_sparse_arrays(seed)
+    assert objects_are_equal(
+        sparse_multilabel_confusion_counts(sparse.csr_array(y_true), sparse.csr_array(y_pred)),
+        multilabel_confusion_counts(y_true, y_pred),
+    )
+
+
+@scipy_available
+def test_sparse_multilabel_confusion_counts_empty() -> None:
+    assert objects_are_equal(
+        sparse_multilabel_confusion_counts(
+            sparse.csr_array((0, 3), dtype=int), sparse.csr_array((0, 3), dtype=int)
+        ),
+        multilabel_confusion_counts(np.zeros((0, 3), dtype=int), np.zeros((0, 3), dtype=int)),
+    )
+
+
+#########################################################
+#     Tests for sparse_columnwise_average_precision     #
+#########################################################
+
+
+@scipy_available
+def test_sparse_columnwise_average_precision() -> None:
+    assert objects_are_allclose(
+        sparse_columnwise_average_precision(
+            y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]])),
+            y_score=sparse.csr_array(
+                np.array([[0.9, 0.0, 0.0], [0.0, 0.8, 0.0], [0.2, 0.5, 0.7], [0.0, 0.0, 0.0]])
+            ),
+        ),
+        np.array([0.75, 1.0, 0.5]),
+    )
+
+
+@scipy_available
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sparse_columnwise_average_precision_same_as_dense(seed: int) -> None:
+    y_true, _, y_score = random_sparse_arrays(seed)
+    assert objects_are_allclose(
+        sparse_columnwise_average_precision(sparse.csr_array(y_true), sparse.csr_array(y_score)),
+        columnwise_average_precision(y_true, y_score),
+    )
+
+
+###############################################
+#     Tests for sparse_columnwise_roc_auc     #
+###############################################
+
+
+@scipy_available
+def test_sparse_columnwise_roc_auc() -> None:
+    assert objects_are_allclose(
+        sparse_columnwise_roc_auc(
+            y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]])),
+            y_score=sparse.csr_array(
+                np.array([[0.9, 0.0, 0.0], [0.0, 0.8, 0.0], [0.2, 0.5, 0.7], [0.0, 0.0, 0.0]])
+            ),
+        ),
+        np.array([0.625, 1.0, 0.25]),
+    )
+
+
+@scipy_available
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sparse_columnwise_roc_auc_same_as_dense(seed: int) -> None:
+    y_true, _, y_score = random_sparse_arrays(seed)
+    assert objects_are_allclose(
+        sparse_columnwise_roc_auc(sparse.csr_array(y_true), sparse.csr_array(y_score)),
+        columnwise_roc_auc(y_true, y_score),
+    )
+
+
+@scipy_available
+def test_sparse_columnwise_roc_auc_single_label() -> None:
+    assert objects_are_allclose(
+        sparse_columnwise_roc_auc(
+            y_true=sparse.csr_array(np.array([[1, 0], [1, 1], [1, 0]])),
+            y_score=sparse.csr_array(np.array([[0.9, 0.0], [0.2, 0.5], [0.0, 0.1]])),
+        ),
+        np.array([float("nan"), 1.0]),
+        equal_nan=True,
+    )
+
+
+####################################################
+#     Tests for sparse_micro_average_precision     #
+####################################################
+
+
+@scipy_available
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sparse_micro_average_precision_same_as_dense(seed: int) -> None:
+    y_true, _, y_score = random_sparse_arrays(seed)
+    assert objects_are_allclose(
+        sparse_micro_average_precision(sparse.csr_array(y_true), sparse.csr_array(y_score)),
+        BinaryScoreRanking(y_true.ravel(), y_score.ravel()).average_precision(),
+    )
+
+
+##########################################
+#     Tests for sparse_micro_roc_auc     #
+##########################################
+
+
+@scipy_available
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sparse_micro_roc_auc_same_as_dense(seed: int) -> None:
+    y_true, _, y_score = random_sparse_arrays(seed)
+    assert objects_are_allclose(
+        sparse_micro_roc_auc(sparse.csr_array(y_true), sparse.csr_array(y_score)),
+        BinaryScoreRanking(y_true.ravel(), y_score.ravel()).roc_auc(),
+    )
+
+
+########################################
+#     Tests for multilabel metrics     #
+########################################
+
+
+@scipy_available
+@pytest.mark.parametrize(
+    "metric",
+    [multilabel_confusion_matrix, multilabel_precision, multilabel_recall],
+)
+def test_multilabel_pred_metric_sparse_same_as_dense(metric: Callable) -> None:
+    y_true, y_pred, _ = random_sparse_arrays(0)
+    assert objects_are_allclose(
+        metric(sparse.csr_array(y_true), sparse.csr_array(y_pred)),
+        metric(y_true, y_pred),
+        equal_nan=True,
+    )
+
+
+@scipy_available
+@pytest.mark.parametrize("metric", [multilabel_average_precision, multilabel_roc_auc])
+def test_multilabel_score_metric_sparse_same_as_dense(metric: Callable) -> None:
+    y_true, _, y_score = random_sparse_arrays(0)
+    assert objects_are_allclose(
+        metric(sparse.csr_array(y_true), sparse.csr_array(y_score)),
+        metric(y_true, y_score),
+        equal_nan=True,
+    )
+
+
+@scipy_available
+def test_multilabel_average_precision_sparse_drop_nan() -> None:
+    y_score = np.array([[0.9, 0.0], [float("nan"), 0.5], [0.2, 0.0], [0.0, 0.7]])
+    assert objects_are_allclose(
+        multilabel_average_precision(
+            sparse.csr_array(np.array([[1, 0], [0, 1], [0, 1], [1, 1]])),
+            sparse.csr_array(y_score),
+            nan_policy="omit",
+        ),
+        multilabel_average_precision(
+            np.array([[1, 0], [0, 1], [1, 1]]), y_score[[0, 2, 3]], nan_policy="omit"
+        ),
+    )
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+from sklearn import metrics
+
+from arkas.metric import binary_threshold_sweep, multilabel_threshold_curves
+
+
+def random_arrays(seed: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    y_true = (rng.random((200, 6)) < 0.3).astype(int)
+    # round the scores to create ties
+    y_score = np.round(rng.random((200, 6)), decimals=2)
+    return y_true, y_score
+
+
+#################################################
+#     Tests for multilabel_threshold_curves     #
+#################################################
+
+
+def test_multilabel_threshold_curves() -> None:
+    assert objects_are_allclose(
+        multilabel_threshold_curves(
+            y_true=np.array([[1, 0], [0, 1], [0, 1], [1, 0], [1, 1]]),
+            y_score=np.array([[0.9, 0.2], [0.1, 0.8], [0.35, 0.6], [0.3, 0.1], [0.8, 0.5]]),
+        ),
+        {
+            "best_f1": np.array([6 / 7, 1.0]),
+            "best_f1_threshold": np.array([0.3, 0.5]),
+            "best_youden_threshold": np.array([0.8, 0.5]),
+            "count": 5,
+            "curve_offsets": np.array([0, 5, 10]),
+            "false_positive": np.array([0, 0, 1, 1, 2, 0, 0, 0, 1, 2]),
+            "false_positive_rate": np.array([0.0, 0.0, 0.5, 0.5, 1.0, 0.0, 0.0, 0.0, 0.5, 1.0]),
+            "precision": np.array([1.0, 1.0, 2 / 3, 0.75, 0.6, 1.0, 1.0, 1.0, 0.75, 0.6]),
+            "recall": np.array([1 / 3, 2 / 3, 2 / 3, 1.0, 1.0, 1 / 3, 2 / 3, 1.0, 1.0, 1.0]),
+            "threshold": np.array([0.9, 0.8, 0.35, 0.3, 0.1, 0.8, 0.6, 0.5, 0.2, 0.1]),
+            "true_positive": np.array([1, 2, 2, 3, 3, 1, 2, 3, 3, 3]),
+        },
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_multilabel_threshold_curves_same_as_binary_sweep(seed: int) -> None:
+    y_true, y_score = random_arrays(seed)
+    out = multilabel_threshold_curves(y_true=y_true, y_score=y_score)
+    offsets = out["curve_offsets"]
+    for i in range(y_true.shape[1]):
+        sweep = binary_threshold_sweep(y_true=y_true[:, i], y_score=y_score[:, i])
+        curve = slice(offsets[i], offsets[i + 1])
+        for key in ["false_positive_rate", "precision", "recall", "threshold", "true_positive"]:
+            assert objects_are_allclose(out[key][curve], sweep[key])
+        assert objects_are_allclose(float(out["best_f1"][i]), float(sweep["f1"].max()))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_multilabel_threshold_curves_same_as_sklearn(seed: int) -> None:
+    y_true, y_score = random_arrays(seed)
+    out = multilabel_threshold_curves(y_true=y_true, y_score=y_score)
+    offsets = out["curve_offsets"]
+    for i in range(y_true.shape[1]):
+        curve = slice(offsets[i], offsets[i + 1])
+        fpr, tpr, thresholds = metrics.roc_curve(
+            y_true[:, i], y_score[:, i], drop_intermediate=False
+        )
+        assert objects_are_allclose(out["threshold"][curve], thresholds[1:])
+        assert objects_are_allclose(out["false_positive_rate"][curve], fpr[1:])
+        assert objects_are_allclose(out["recall"][curve], tpr[1:])
+        youden = tpr[1:] - fpr[1:]
+        assert objects_are_allclose(
+            float(out["best_youden_threshold"][i]), float(thresholds[1:][np.argmax(youden)])
+        )
+
+
+@pytest.mark.parametrize("n_jobs", [2, 4])
+def test_multilabel_threshold_curves_n_jobs(n_jobs: int) -> None:
+    y_true, y_score = random_arrays(0)
+    assert objects_are_equal(
+        multilabel_threshold_curves(y_true=y_true, y_score=y_score, n_jobs=n_jobs),
+        multilabel_threshold_curves(y_true=y_true, y_score=y_score),
+    )
+
+
+def test_multilabel_threshold_curves_beta() -> None:
+    out = multilabel_threshold_curves(
+        y_true=np.array([[1, 0], [0, 1], [0, 1], [1, 0], [1, 1]]),
+        y_score=np.array([[0.9, 0.2], [0.1, 0.8], [0.35, 0.6], [0.3, 0.1], [0.8, 0.5]]),
+        beta=0.5,
+    )
+    assert objects_are_allclose(out["best_f0.5"], np.array([10 / 11, 1.0]))
+    assert objects_are_allclose(out["best_f0.5_threshold"], np.array([0.8, 0.5]))
+
+
+def test_multilabel_threshold_curves_prefix_suffix() -> None:
+    out = multilabel_threshold_curves(
+        y_true=np.array([[1, 0], [0, 1]]),
+        y_score=np.array([[0.9, 0.2], [0.1, 0.8]]),
+        prefix="prefix_",
+        suffix="_suffix",
+    )
+    assert set(out) == {
+        "prefix_best_f1_suffix",
+        "prefix_best_f1_threshold_suffix",
+        "prefix_best_youden_threshold_suffix",
+        "prefix_count_suffix",
+        "prefix_curve_offsets_suffix",
+        "prefix_false_positive_suffix",
+        "prefix_false_positive_rate_suffix",
+        "prefix_precision_suffix",
+        "prefix_recall_suffix",
+        "prefix_threshold_suffix",
+        "prefix_true_positive_suffix",
+    }
+
+
+def test_multilabel_threshold_curves_one_class() -> None:
+    out = multilabel_threshold_curves(
+        y_true=np.array([[1, 0], [1, 0], [1, 0]]),
+        y_score=np.array([[0.9, 0.2], [0.1, 0.8], [0.5, 0.6]]),
+    )
+    assert objects_are_allclose(out["best_f1"], np.array([1.0, 0.0]))
+    assert objects_are_allclose(out["best_f1_threshold"], np.array([0.1, 0.8]))
+    assert objects_are_allclose(
+        out["best_youden_threshold"], np.array([float("nan"), float("nan")]), equal_nan=True
+    )
+
+
+def test_multilabel_threshold_curves_empty() -> None:
+    out = multilabel_threshold_curves(y_true=np.zeros((0, 3)), y_score=np.zeros((0, 3)))
+    assert out["count"] == 0
+    assert objects_are_equal(out["curve_offsets"], np.array([0, 0, 0, 0]))
+    assert out["threshold"].shape == (0,)
+    assert objects_are_equal(out["best_f1_threshold"], np.array([float("nan")] * 3), equal_nan=True)
+
+
+def test_multilabel_threshold_curves_nan_omit() -> None:
+    out = multilabel_threshold_curves(
+        y_true=np.array([[1, 0], [0, 1], [0, 1], [1, float("nan")]]),
+        y_score=np.array([[0.9, 0.2], [0.1, 0.8], [0.35, 0.6], [0.3, 0.1]]),
+        nan_policy="omit",
+    )
+    assert out["count"] == 3
+    assert objects_are_equal(out["curve_offsets"], np.array([0, 3, 6]))
+    assert objects_are_allclose(out["best_f1_threshold"], np.array([0.9, 0.6]))
+
+
+def test_multilabel_threshold_curves_nan_propagate() -> None:
+    out = multilabel_threshold_curves(
+        y_true=np.array([[1, 0], [0, 1], [0, 1], [1, 0]]),
+        y_score=np.array([[0.9, 0.2], [0.1, 0.8], [0.35, float("nan")], [0.3, 0.1]]),
+    )
+    assert out["count"] == 4
+    assert objects_are_equal(out["curve_offsets"], np.array([0, 0, 0]))
+    assert objects_are_equal(out["best_f1"], np.array([float("nan")] * 2), equal_nan=True)
+
+
+def test_multilabel_threshold_curves_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_score' contains at least one NaN value"):
+        multilabel_threshold_curves(
+            y_true=np.array([[1, 0], [0, 1]]),
+            y_score=np.array([[0.9, float("nan")], [0.1, 0.8]]),
+            nan_policy="raise",
+        )
+
+
+def test_multilabel_threshold_curves_incorrect_n_jobs() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'n_jobs': 0"):
+        multilabel_threshold_curves(
+            y_true=np.array([[1, 0], [0, 1]]), y_score=np.array([[0.9, 0.2], [0.1, 0.8]]), n_jobs=0
+        )
+
+
+def test_multilabel_threshold_curves_1d() -> None:
+    out = multilabel_threshold_curves(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.3, 0.8])
+    )
+    assert objects_are_equal(out["curve_offsets"], np.array([0, 5]))
+    assert objects_are_allclose(out["best_f1_threshold"], np.array([0.3]))
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from arkas.metric import (
+    BinaryScoreHistogram,
+    BinaryScoreRanking,
+    binary_confusion_matrix,
+    binary_fbeta_score,
+    binary_precision,
+    binary_recall,
+    binary_threshold_sweep,
+    find_best_threshold,
+    find_threshold_at_precision,
+    find_threshold_at_recall,
+)
+
+
+def per_threshold_metrics(
+    y_true: np.ndarray, y_score: np.ndarray, thresholds: np.ndarray
+) -> dict[str, np.ndarray]:
+    rows = []
+    for threshold in thresholds:
+        y_pred = (y_score >= threshold).astype(int)
+        rows.append(
+            binary_confusion_matrix(y_true, y_pred)
+            | binary_precision(y_true, y_pred)
+            | binary_recall(y_true, y_pred)
+            | binary_fbeta_score(y_true, y_pred, betas=[0.5, 2])
+        )
+    keys = [
+        "f0.5",
+        "f2",
+        "false_negative",
+        "false_positive",
+        "false_positive_rate",
+        "precision",
+        "recall",
+        "true_negative",
+        "true_positive",
+    ]
+    return {key: np.array([row[key] for row in rows]) for key in keys}
+
+
+############################################
+#     Tests for binary_threshold_sweep     #
+############################################
+
+
+def test_binary_threshold_sweep() -> None:
+    assert objects_are_allclose(
+        binary_threshold_sweep(
+            y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.9, 0.1, 0.35, 0.3, 0.8])
+        ),
+        {
+            "count": 5,
+            "f1": np.array([0.5, 0.8, 0.6666666666666666, 0.8571428571428571, 0.75]),
+            "false_negative": np.array([2, 1, 1, 0, 0]),
+            "false_positive": np.array([0, 0, 1, 1, 2]),
+            "false_positive_rate": np.array([0.0, 0.0, 0.5, 0.5, 1.0]),
+            "precision": np.array([1.0, 1.0, 0.6666666666666666, 0.75, 0.6]),
+            "recall": np.array([0.3333333333333333, 0.6666666666666666, 0.6666666666666666, 1, 1]),
+            "threshold": np.array([0.9, 0.8, 0.35, 0.3, 0.1]),
+            "true_negative": np.array([2, 2, 1, 1, 0]),
+            "true_positive": np.array([1, 2, 2, 3, 3]),
+        },
+    )
+
+
+def test_binary_threshold_sweep_ties() -> None:
+    metrics = binary_threshold_sweep(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.5, 0.5, 0.2, 0.2, 0.9])
+    )
+    assert objects_are_equal(metrics["threshold"], np.array([0.9, 0.5, 0.2]))
+    assert objects_are_equal(metrics["true_positive"], np.array([1, 2, 3]))
+    assert objects_are_equal(metrics["false_positive"], np.array([0, 1, 2]))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_binary_threshold_sweep_same_as_binary_metrics(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, size=200)
+    y_score = np.round(rng.random(size=200), decimals=2)
+    metrics = binary_threshold_sweep(y_true=y_true, y_score=y_score, betas=[0.5, 2])
+    expected = per_threshold_metrics(y_true, y_score, metrics["threshold"])
+    assert objects_are_allclose({key: metrics[key] for key in expected}, expected, equal_nan=True)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_binary_threshold_sweep_grid_same_as_binary_metrics(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, size=200)
+    y_score = rng.random(size=200)
+    thresholds = np.array([1.5, 0.9, 0.25, 0.5, 0.0, -1.0, float(y_score[0])])
+    metrics = binary_threshold_sweep(
+        y_true=y_true, y_score=y_score, thresholds=thresholds, betas=[0.5, 2]
+    )
+    assert objects_are_equal(metrics["threshold"], thresholds)
+    expected = per_threshold_metrics(y_true, y_score, thresholds)
+    assert objects_are_allclose({key: metrics[key] for key in expected}, expected, equal_nan=True)
+
+
+def test_binary_threshold_sweep_only_positive() -> None:
+    metrics = binary_threshold_sweep(y_true=np.array([1, 1]), y_score=np.array([0.2, 0.8]))
+    assert objects_are_equal(
+        metrics["false_positive_rate"], np.array([float("nan"), float("nan")]), equal_nan=True
+    )
+    assert objects_are_equal(metrics["recall"], np.array([0.5, 1.0]))
+
+
+def test_binary_threshold_sweep_prefix_suffix() -> None:
+    metrics = binary_threshold_sweep(
+        y_true=np.array([1, 0, 0, 1, 1]),
+        y_score=np.array([0.9, 0.1, 0.35, 0.3, 0.8]),
+        prefix="prefix_",
+        suffix="_suffix",
+    )
+    assert list(metrics) == [
+        "prefix_count_suffix",
+        "prefix_f1_suffix",
+        "prefix_false_negative_suffix",
+        "prefix_false_positive_rate_suffix",
+        "prefix_false_positive_suffix",
+        "prefix_precision_suffix",
+        "prefix_recall_suffix",
+        "prefix_threshold_suffix",
+        "prefix_true_negative_suffix",
+        "prefix_true_positive_suffix",
+    ]
+
+
+def test_binary_threshold_sweep_empty() -> None:
+    metrics = binary_threshold_sweep(y_true=np.array([]), y_score=np.array([]), thresholds=[0.5])
+    assert metrics["count"] == 0
+    assert all(value.shape == (0,) for key, value in metrics.items() if key != "count")
+
+
+def test_binary_threshold_sweep_nan_omit() -> None:
+    metrics = binary_threshold_sweep(
+        y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+        y_score=np.array([0.9, 0.1, 0.35, float("nan"), 0.8, 0.5]),
+        nan_policy="omit",
+    )
+    assert metrics["count"] == 4
+    assert objects_are_equal(metrics["threshold"], np.array([0.9, 0.8, 0.35, 0.1]))
+
+
+def test_binary_threshold_sweep_nan_propagate() -> None:
+    metrics = binary_threshold_sweep(
+        y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+        y_score=np.array([0.9, 0.1, 0.35, 0.3, 0.8, 0.5]),
+    )
+    assert metrics["count"] == 6
+    assert metrics["precision"].shape == (0,)
+
+
+def test_binary_threshold_sweep_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        binary_threshold_sweep(
+            y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+            y_score=np.array([0.9, 0.1, 0.35, 0.3, 0.8, 0.5]),
+            nan_policy="raise",
+        )
+
+
+def test_binary_threshold_sweep_ranking() -> None:
+    y_true, y_score = np.array([1, 0, 0, 1, 1]), np.array([0.9, 0.1, 0.35, 0.3, 0.8])
+    ranking = BinaryScoreRanking(y_true=y_true, y_score=y_score)
+    assert objects_are_equal(
+        binary_threshold_sweep(y_true=y_true, y_score=y_score, ranking=ranking),
+        binary_threshold_sweep(y_true=y_true, y_score=y_score),
+    )
+
+
+def test_binary_threshold_sweep_histogram() -> None:
+    histogram = BinaryScoreHistogram(n_bins=10)
+    histogram.update(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([0.95, 0.15, 0.35, 0.35, 0.85])
+    )
+    metrics = binary_threshold_sweep(
+        y_true=np.array([]), y_score=np.array([]), thresholds=[0.3, 0.8], ranking=histogram
+    )
+    assert objects_are_equal(metrics["true_positive"], np.array([3, 2]))
+    assert objects_are_equal(metrics["false_positive"], np.array([1, 0]))
+
+
+#########################################
+#     Tests for find_best_threshold     #
+#########################################
+
+
+def test_find_best_threshold() -> None:
+    assert find_best_threshold(np.array([0.9, 0.5, 0.1]), values=np.array([0.2, 0.8, 0.5])) == 0.5
+
+
+def test_find_best_threshold_ties() -> None:
+    assert find_best_threshold(np.array([0.9, 0.5, 0.1]), values=np.array([0.8, 0.8, 0.5])) == 0.9
+
+
+def test_find_best_threshold_nan() -> None:
+    assert (
+        find_best_threshold(np.array([0.9, 0.5, 0.1]), values=np.array([float("nan"), 0.2, 0.5]))
+        == 0.1
+    )
+
+
+def test_find_best_threshold_mask() -> None:
+    assert (
+        find_best_threshold(
+            np.array([0.9, 0.5, 0.1]),
+            values=np.array([0.2, 0.8, 0.5]),
+            mask=np.array([True, False, True]),
+        )
+        == 0.1
+    )
+
+
+def test_find_best_threshold_no_valid() -> None:
+    assert np.isnan(
+        find_best_threshold(
+            np.array([0.9, 0.5]), values=np.array([0.2, 0.8]), mask=np.array([False, False])
+        )
+    )
+
+
+def test_find_best_threshold_empty() -> None:
+    assert np.isnan(find_best_threshold(np.array([]), values=np.array([])))
+
+
+#################################################
+#     Tests for find_threshold_at_precision     #
+#################################################
+
+
+def test_find_threshold_at_precision() -> None:
+    assert (
+        find_threshold_at_precision(
+            np.array([0.9, 0.8, 0.35, 0.3, 0.1]),
+            precision=np.array([1.0, 1.0, 0.6666666666666666, 0.75, 0.6]),
+            recall=np.array([0.3333333333333333, 0.6666666666666666, 0.6666666666666666, 1, 1]),
+            min_precision=0.7,
+        )
+        == 0.3
+    )
+
+
+def test_find_threshold_at_precision_no_valid() -> None:
+    assert np.isnan(
+        find_threshold_at_precision(
+            np.array([0.9, 0.1]),
+            precision=np.array([0.5, 0.4]),
+            recall=np.array([0.5, 1.0]),
+            min_precision=0.7,
+        )
+    )
+
+
+##############################################
+#     Tests for find_threshold_at_recall     #
+##############################################
+
+
+def test_find_threshold_at_recall() -> None:
+    assert (
+        find_threshold_at_recall(
+            np.array([0.9, 0.8, 0.35, 0.3, 0.1]),
+            precision=np.array([1.0, 1.0, 0.6666666666666666, 0.75, 0.6]),
+            recall=np.array([0.3333333333333333, 0.6666666666666666, 0.6666666666666666, 1, 1]),
+            min_recall=0.5,
+        )
+        == 0.8
+    )
+
+
+def test_find_threshold_at_recall_no_valid() -> None:
+    assert np.isnan(
+        find_threshold_at_recall(
+            np.array([0.9, 0.1]),
+            precision=np.array([0.5, 0.4]),
+            recall=np.array([0.5, 0.8]),
+            min_recall=0.9,
+        )
+    )
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import numpy as np
 import pytest
-from coola import objects_are_equal
+from coola import objects_are_allclose, objects_are_equal
+from sklearn import metrics
 
 from arkas.metric import (
     binary_top_k_accuracy,
     multiclass_top_k_accuracy,
     top_k_accuracy,
 )
+from arkas.metric.classification.topk_accuracy import true_class_ranks
 
 ####################################
 #     Tests for top_k_accuracy     #
@@ -477,3 +481,91 @@ def test_multiclass_top_k_accuracy_nan_raise_y_score() -> None:
             ),
             nan_policy="raise",
         )
+
+
+@pytest.mark.filterwarnings("ignore::sklearn.exceptions.UndefinedMetricWarning")
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_multiclass_top_k_accuracy_same_as_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 20, size=500)
+    # Round the scores to create many ties.
+    y_score = np.round(rng.random(size=(500, 20)), decimals=1)
+    k = [1, 2, 5, 19, 20, 25]
+    assert objects_are_allclose(
+        multiclass_top_k_accuracy(y_true=y_true, y_score=y_score, k=k),
+        {"count": 500}
+        | {
+            f"top_{_k}_accuracy": float(
+                metrics.top_k_accuracy_score(y_true=y_true, y_score=y_score, k=_k)
+            )
+            for _k in k
+        },
+    )
+
+
+def test_multiclass_top_k_accuracy_chunks() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 10, size=100)
+    y_score = rng.random(size=(100, 10))
+    expected = multiclass_top_k_accuracy(y_true=y_true, y_score=y_score, k=[1, 3, 5])
+    with patch("arkas.metric.classification.topk_accuracy._MAX_CHUNK_SIZE", 32):
+        assert objects_are_equal(
+            multiclass_top_k_accuracy(y_true=y_true, y_score=y_score, k=[1, 3, 5]), expected
+        )
+
+
+def test_multiclass_top_k_accuracy_incorrect_classes() -> None:
+    with pytest.raises(ValueError, match="Number of classes in 'y_true'"):
+        multiclass_top_k_accuracy(
+            y_true=np.array([0, 1, 1]),
+            y_score=np.array([[0.5, 0.2, 0.3], [0.3, 0.4, 0.3], [0.1, 0.2, 0.7]]),
+        )
+
+
+######################################
+#     Tests for true_class_ranks     #
+######################################
+
+
+def test_true_class_ranks_binary() -> None:
+    assert objects_are_equal(
+        true_class_ranks(y_true=np.array([1, 0, 0, 1]), y_score=np.array([0.9, 0.6, 0.1, 0.2])),
+        np.array([0, 1, 0, 1]),
+    )
+
+
+def test_true_class_ranks_binary_decision() -> None:
+    assert objects_are_equal(
+        true_class_ranks(y_true=np.array([1, 0, 0, 1]), y_score=np.array([2, 1, -1, -2])),
+        np.array([0, 1, 0, 1]),
+    )
+
+
+def test_true_class_ranks_multiclass() -> None:
+    assert objects_are_equal(
+        true_class_ranks(
+            y_true=np.array([0, 1, 2, 2]),
+            y_score=np.array([[0.5, 0.2, 0.2], [0.3, 0.4, 0.2], [0.2, 0.4, 0.3], [0.7, 0.2, 0.1]]),
+        ),
+        np.array([0, 0, 1, 2]),
+    )
+
+
+def test_true_class_ranks_multiclass_ties() -> None:
+    assert objects_are_equal(
+        true_class_ranks(
+            y_true=np.array([0, 1, 2]),
+            y_score=np.array([[0.5, 0.5, 0.5], [0.5, 0.5, 0.5], [0.5, 0.5, 0.5]]),
+        ),
+        np.array([2, 1, 0]),
+    )
+
+
+def test_true_class_ranks_multiclass_labels() -> None:
+    assert objects_are_equal(
+        true_class_ranks(
+            y_true=np.array([3, 5, 7]),
+            y_score=np.array([[0.5, 0.2, 0.3], [0.3, 0.4, 0.3], [0.1, 0.2, 0.7]]),
+        ),
+        np.array([0, 0, 0]),
+    )
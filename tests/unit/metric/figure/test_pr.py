@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 from matplotlib import pyplot as plt
 
+from arkas.metric import BinaryScoreRanking
 from arkas.metric.figure import binary_precision_recall_curve
 
 ###################################################
@@ -31,3 +32,22 @@ def test_binary_precision_recall_curve_nan() -> None:
         ),
         plt.Figure,
     )
+
+
+def test_binary_precision_recall_curve_ranking() -> None:
+    y_true, y_pred = np.array([1, 0, 0, 1, 1]), np.array([0.9, 0.2, 0.6, 0.7, 0.8])
+    assert isinstance(
+        binary_precision_recall_curve(
+            y_true=y_true, y_pred=y_pred, ranking=BinaryScoreRanking(y_true, y_pred)
+        ),
+        plt.Figure,
+    )
+
+
+def test_binary_precision_recall_curve_pos_label() -> None:
+    assert isinstance(
+        binary_precision_recall_curve(
+            y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]), pos_label=1
+        ),
+        plt.Figure,
+    )
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose
+
+from arkas.metric import (
+    BaseRegressionAccumulator,
+    MeanAbsoluteErrorAccumulator,
+    MeanAbsolutePercentageErrorAccumulator,
+    MeanSquaredErrorAccumulator,
+    MeanSquaredLogErrorAccumulator,
+    MedianAbsoluteErrorAccumulator,
+    R2ScoreAccumulator,
+    RegressionErrorAccumulator,
+    RootMeanSquaredErrorAccumulator,
+    mean_absolute_error,
+    mean_absolute_percentage_error,
+    mean_squared_error,
+    mean_squared_log_error,
+    median_absolute_error,
+    r2_score,
+    regression_errors,
+    regression_metrics,
+    root_mean_squared_error,
+)
+
+Y_TRUE = np.array([1, 2, 3, 4, 5])
+Y_PRED = np.array([2, 2, 3, 4, 1])
+
+
+def make_data(num_samples: int = 1000, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    y_true = rng.uniform(0, 10, size=num_samples)
+    y_pred = y_true + rng.normal(0, 1, size=num_samples)
+    return y_true, np.maximum(y_pred, 0)
+
+
+###############################################
+#     Tests for BaseRegressionAccumulator     #
+###############################################
+
+
+def test_base_regression_accumulator_repr() -> None:
+    assert repr(BaseRegressionAccumulator()).startswith("BaseRegressionAccumulator(")
+
+
+def test_base_regression_accumulator_str() -> None:
+    assert str(BaseRegressionAccumulator()).startswith("BaseRegressionAccumulator(")
+
+
+def test_base_regression_accumulator_args() -> None:
+    accumulator = BaseRegressionAccumulator(sketch_size=100, nan_policy="omit")
+    assert accumulator.sketch_size == 100
+    assert accumulator.nan_policy == "omit"
+    assert accumulator.count == 0
+    assert accumulator.get_args() == {"sketch_size": 100, "nan_policy": "omit"}
+
+
+def test_base_regression_accumulator_incorrect_sketch_size() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'sketch_size': 1"):
+        BaseRegressionAccumulator(sketch_size=1)
+
+
+def test_base_regression_accumulator_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        BaseRegressionAccumulator(nan_policy="incorrect")
+
+
+def test_base_regression_accumulator_compute() -> None:
+    accumulator = BaseRegressionAccumulator()
+    accumulator.update(y_true=Y_TRUE[:3], y_pred=Y_PRED[:3])
+    accumulator.update(y_true=Y_TRUE[3:], y_pred=Y_PRED[3:])
+    assert objects_are_allclose(accumulator.compute(), regression_metrics(Y_TRUE, Y_PRED))
+
+
+def test_base_regression_accumulator_compute_same_keys() -> None:
+    accumulator = BaseRegressionAccumulator()
+    accumulator.update(y_true=Y_TRUE, y_pred=Y_PRED)
+    assert list(accumulator.compute()) == list(regression_metrics(Y_TRUE, Y_PRED))
+
+
+@pytest.mark.parametrize("num_batches", [1, 3, 17])
+def test_base_regression_accumulator_compute_batches(num_batches: int) -> None:
+    y_true, y_pred = make_data()
+    accumulator = BaseRegressionAccumulator(sketch_size=2048)
+    for batch_true, batch_pred in zip(
+        np.array_split(y_true, num_batches), np.array_split(y_pred, num_batches)
+    ):
+        accumulator.update(y_true=batch_true, y_pred=batch_pred)
+    assert objects_are_allclose(accumulator.compute(), regression_metrics(y_true, y_pred))
+
+
+def test_base_regression_accumulator_compute_float32() -> None:
+    y_true, y_pred = make_data()
+    accumulator = BaseRegressionAccumulator(sketch_size=2048)
+    accumulator.update(y_true=y_true.astype(np.float32), y_pred=y_pred.astype(np.float32))
+    assert objects_are_allclose(
+        accumulator.compute(),
+        regression_metrics(y_true.astype(np.float32), y_pred.astype(np.float32)),
+        rtol=1e-5,
+    )
+
+
+def test_base_regression_accumulator_compute_2d() -> None:
+    accumulator = BaseRegressionAccumulator()
+    accumulator.update(y_true=Y_TRUE.reshape(5, 1), y_pred=Y_PRED.reshape(5, 1))
+    assert objects_are_allclose(accumulator.compute(), regression_metrics(Y_TRUE, Y_PRED))
+
+
+def test_base_regression_accumulator_compute_large_values() -> None:
+    # The R^2 score is computed from centered moments, so it is stable
+    # with a large offset.
+    y_true, y_pred = make_data()
+    accumulator = BaseRegressionAccumulator()
+    for batch_true, batch_pred in zip(np.array_split(y_true, 7), np.array_split(y_pred, 7)):
+        accumulator.update(y_true=batch_true + 1e8, y_pred=batch_pred + 1e8)
+    assert math.isclose(
+        accumulator.compute()["r2_score"], r2_score(y_true, y_pred)["r2_score"], rel_tol=1e-6
+    )
+
+
+def test_base_regression_accumulator_compute_median_approximate() -> None:
+    y_true, y_pred = make_data(num_samples=100_000)
+    accumulator = BaseRegressionAccumulator(sketch_size=200)
+    for batch_true, batch_pred in zip(np.array_split(y_true, 10), np.array_split(y_pred, 10)):
+        accumulator.update(y_true=batch_true, y_pred=batch_pred)
+    median = accumulator.compute()["median_absolute_error"]
+    # The rank error of the sketch is about 1.7 / sketch_size.
+    assert abs(np.mean(np.abs(y_pred - y_true) < median) - 0.5) < 0.01
+
+
+def test_base_regression_accumulator_compute_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("arkas.metric.regression.accumulator._CHUNK_NUM_VALUES", 7)
+    y_true, y_pred = make_data(num_samples=100)
+    accumulator = BaseRegressionAccumulator()
+    accumulator.update(y_true=y_true, y_pred=y_pred)
+    assert objects_are_allclose(accumulator.compute(), regression_metrics(y_true, y_pred))
+
+
+def test_base_regression_accumulator_compute_empty() -> None:
+    assert objects_are_allclose(
+        BaseRegressionAccumulator().compute(),
+        regression_metrics(np.array([]), np.array([])),
+        equal_nan=True,
+    )
+
+
+def test_base_regression_accumulator_compute_one_sample() -> None:
+    accumulator = BaseRegressionAccumulator()
+    accumulator.update(y_true=np.array([3.0]), y_pred=np.array([2.0]))
+    assert objects_are_allclose(
+        accumulator.compute(),
+        regression_metrics(np.array([3.0]), np.array([2.0])),
+        equal_nan=True,
+    )
+
+
+def test_base_regression_accumulator_compute_prefix_suffix() -> None:
+    accumulator = BaseRegressionAccumulator()
+    accumulator.update(y_true=Y_TRUE, y_pred=Y_PRED)
+    assert objects_are_allclose(
+        accumulator.compute(prefix="prefix_", suffix="_suffix"),
+        regression_metrics(Y_TRUE, Y_PRED, prefix="prefix_", suffix="_suffix"),
+    )
+
+
+def test_base_regression_accumulator_compute_msle_out_of_domain() -> None:
+    accumulator = BaseRegressionAccumulator()
+    accumulator.update(y_true=Y_TRUE, y_pred=Y_PRED)
+    accumulator.update(y_true=np.array([-2.0]), y_pred=np.array([1.0]))
+    accumulator.update(y_true=Y_TRUE, y_pred=Y_PRED)
+    metrics = accumulator.compute()
+    assert math.isnan(metrics["mean_squared_log_error"])
+    assert metrics["count"] == 11
+    assert metrics["max_error"] == 4.0
+
+
+def test_base_regression_accumulator_nan_omit() -> None:
+    accumulator = BaseRegressionAccumulator(nan_policy="omit")
+    accumulator.update(
+        y_true=np.array([1.0, 2.0, float("nan"), 3.0]),
+        y_pred=np.array([2.0, float("nan"), 3.0, 3.0]),
+    )
+    accumulator.update(y_true=np.array([4.0, 5.0]), y_pred=np.array([4.0, 1.0]))
+    assert objects_are_allclose(
+        accumulator.compute(),
+        regression_metrics(np.array([1.0, 3.0, 4.0, 5.0]), np.array([2.0, 3.0, 4.0, 1.0])),
+    )
+
+
+def test_base_regression_accumulator_nan_propagate() -> None:
+    accumulator = BaseRegressionAccumulator()
+    accumulator.update(y_true=np.array([1.0, float("nan")]), y_pred=np.array([2.0, 2.0]))
+    accumulator.update(y_true=Y_TRUE, y_pred=Y_PRED)
+    metrics = accumulator.compute()
+    assert metrics["count"] == 7
+    assert all(math.isnan(value) for key, value in metrics.items() if key != "count")
+
+
+def test_base_regression_accumulator_nan_raise() -> None:
+    accumulator = BaseRegressionAccumulator(nan_policy="raise")
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        accumulator.update(y_true=np.array([1.0, float("nan")]), y_pred=np.array([2.0, 2.0]))
+
+
+def test_base_regression_accumulator_update_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_pred' have different shapes"):
+        BaseRegressionAccumulator().update(y_true=np.array([1, 2]), y_pred=np.array([1, 2, 3]))
+
+
+def test_base_regression_accumulator_update_does_not_modify_inputs() -> None:
+    y_true, y_pred = make_data(num_samples=10)
+    y_true_copy, y_pred_copy = y_true.copy(), y_pred.copy()
+    BaseRegressionAccumulator().update(y_true=y_true, y_pred=y_pred)
+    assert np.array_equal(y_true, y_true_copy)
+    assert np.array_equal(y_pred, y_pred_copy)
+
+
+def test_base_regression_accumulator_merge() -> None:
+    y_true, y_pred = make_data()
+    accumulators = []
+    for batch_true, batch_pred in zip(np.array_split(y_true, 5), np.array_split(y_pred, 5)):
+        accumulator = BaseRegressionAccumulator(sketch_size=2048)
+        accumulator.update(y_true=batch_true, y_pred=batch_pred)
+        accumulators.append(accumulator)
+    for accumulator in accumulators[1:]:
+        accumulators[0].merge(accumulator)
+    assert objects_are_allclose(accumulators[0].compute(), regression_metrics(y_true, y_pred))
+
+
+def test_base_regression_accumulator_merge_empty() -> None:
+    accumulator = BaseRegressionAccumulator()
+    accumulator.update(y_true=Y_TRUE, y_pred=Y_PRED)
+    accumulator.merge(BaseRegressionAccumulator())
+    assert objects_are_allclose(accumulator.compute(), regression_metrics(Y_TRUE, Y_PRED))
+
+
+def test_base_regression_accumulator_merge_into_empty() -> None:
+    accumulator = BaseRegressionAccumulator()
+    other = BaseRegressionAccumulator()
+    other.update(y_true=Y_TRUE, y_pred=Y_PRED)
+    accumulator.merge(other)
+    assert objects_are_allclose(accumulator.compute(), regression_metrics(Y_TRUE, Y_PRED))
+
+
+def test_base_regression_accumulator_merge_nan() -> None:
+    accumulator = BaseRegressionAccumulator()
+    accumulator.update(y_true=Y_TRUE, y_pred=Y_PRED)
+    other = BaseRegressionAccumulator()
+    other.update(y_true=np.array([float("nan")]), y_pred=np.array([1.0]))
+    accumulator.merge(other)
+    metrics = accumulator.compute()
+    assert metrics["count"] == 6
+    assert math.isnan(metrics["mean_absolute_error"])
+
+
+def test_base_regression_accumulator_merge_subclass() -> None:
+    accumulator = MeanSquaredErrorAccumulator()
+    other = BaseRegressionAccumulator()
+    other.update(y_true=Y_TRUE, y_pred=Y_PRED)
+    accumulator.merge(other)
+    assert objects_are_allclose(accumulator.compute(), mean_squared_error(Y_TRUE, Y_PRED))
+
+
+def test_base_regression_accumulator_merge_without_sketch() -> None:
+    accumulator = BaseRegressionAccumulator()
+    other = MeanSquaredErrorAccumulator()
+    other.update(y_true=Y_TRUE, y_pred=Y_PRED)
+    with pytest.raises(ValueError, match="must compute the median absolute error"):
+        accumulator.merge(other)
+
+
+def test_base_regression_accumulator_merge_incorrect_type() -> None:
+    with pytest.raises(TypeError, match="Incorrect accumulator type"):
+        BaseRegressionAccumulator().merge(42)
+
+
+def test_base_regression_accumulator_merge_different_sketch_size() -> None:
+    with pytest.raises(ValueError, match="must have the same sketch size and NaN policy"):
+        BaseRegressionAccumulator().merge(BaseRegressionAccumulator(sketch_size=10))
+
+
+def test_base_regression_accumulator_merge_different_nan_policy() -> None:
+    with pytest.raises(ValueError, match="must have the same sketch size and NaN policy"):
+        BaseRegressionAccumulator().merge(BaseRegressionAccumulator(nan_policy="omit"))
+
+
+#############################################
+#     Tests for the metric accumulators     #
+#############################################
+
+
+@pytest.mark.parametrize(
+    ("accumulator_cls", "metric"),
+    [
+        (MeanAbsoluteErrorAccumulator, mean_absolute_error),
+        (MeanAbsolutePercentageErrorAccumulator, mean_absolute_percentage_error),
+        (MeanSquaredErrorAccumulator, mean_squared_error),
+        (MeanSquaredLogErrorAccumulator, mean_squared_log_error),
+        (MedianAbsoluteErrorAccumulator, median_absolute_error),
+        (R2ScoreAccumulator, r2_score),
+        (RegressionErrorAccumulator, regression_errors),
+        (RootMeanSquaredErrorAccumulator, root_mean_squared_error),
+    ],
+)
+def test_regression_accumulator_same_as_metric(
+    accumulator_cls: type[BaseRegressionAccumulator], metric: callable
+) -> None:
+    y_true, y_pred = make_data()
+    accumulator = accumulator_cls()
+    for batch_true, batch_pred in zip(np.array_split(y_true, 4), np.array_split(y_pred, 4)):
+        accumulator.update(y_true=batch_true, y_pred=batch_pred)
+    metrics = accumulator.compute(prefix="p_", suffix="_s")
+    expected = metric(y_true, y_pred, prefix="p_", suffix="_s")
+    assert list(metrics) == list(expected)
+    assert objects_are_allclose(metrics, expected)
+
+
+@pytest.mark.parametrize(
+    "accumulator_cls",
+    [
+        MeanAbsoluteErrorAccumulator,
+        MeanAbsolutePercentageErrorAccumulator,
+        MeanSquaredErrorAccumulator,
+        MeanSquaredLogErrorAccumulator,
+        R2ScoreAccumulator,
+        RootMeanSquaredErrorAccumulator,
+    ],
+)
+def test_regression_accumulator_without_sketch(
+    accumulator_cls: type[BaseRegressionAccumulator],
+) -> None:
+    accumulator = accumulator_cls()
+    accumulator.update(y_true=Y_TRUE, y_pred=Y_PRED)
+    assert accumulator._sketch is None
+
+
+def test_median_absolute_error_accumulator_merge() -> None:
+    accumulator1 = MedianAbsoluteErrorAccumulator()
+    accumulator1.update(y_true=np.array([1, 2, 3]), y_pred=np.array([2, 2, 5]))
+    accumulator2 = MedianAbsoluteErrorAccumulator()
+    accumulator2.update(y_true=np.array([4, 5]), y_pred=np.array([6, 1]))
+    accumulator1.merge(accumulator2)
+    assert accumulator1.compute() == {"count": 5, "median_absolute_error": 2.0}
@@ -5,6 +5,7 @@ import pytest
 from coola import objects_are_equal
 
 from arkas.metric import mean_squared_error
+from arkas.metric.utils import prepare_inputs
 
 ########################################
 #     Tests for mean_squared_error     #
@@ -148,3 +149,15 @@ def test_mean_squared_error_nan_raise_y_pred() -> None:
             y_pred=np.array([1, 2, 3, 4, 5, float("nan")]),
             nan_policy="raise",
         )
+
+
+def test_mean_squared_error_prepared() -> None:
+    prepared = prepare_inputs(
+        y_true=np.array([1, 2, 3, 4, 5, float("nan")]),
+        y_pred=np.array([3, 5, 1, 2, 3, 1]),
+        nan_policy="omit",
+    )
+    assert objects_are_equal(
+        mean_squared_error(y_true=np.array([]), y_pred=np.array([]), prepared=prepared),
+        {"count": 5, "mean_squared_error": 5.0},
+    )
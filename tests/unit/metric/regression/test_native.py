@@ -0,0 +1,525 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose
+from sklearn import metrics
+
+from arkas.metric import mean_squared_error, mean_tweedie_deviance, r2_score
+from arkas.metric.regression import native
+from arkas.metric.regression.native import (
+    check_backend,
+    mean_absolute_error_native,
+    mean_absolute_percentage_error_native,
+    mean_squared_error_native,
+    mean_squared_log_error_native,
+    mean_tweedie_deviance_native,
+    mean_tweedie_deviance_powers_native,
+    median_absolute_error_native,
+    multioutput_regression_metrics_native,
+    r2_score_native,
+    regression_metrics_native,
+    root_mean_squared_error_native,
+    use_native_backend,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+KERNELS = [
+    (mean_absolute_error_native, metrics.mean_absolute_error),
+    (mean_absolute_percentage_error_native, metrics.mean_absolute_percentage_error),
+    (mean_squared_error_native, metrics.mean_squared_error),
+    (mean_squared_log_error_native, metrics.mean_squared_log_error),
+    (median_absolute_error_native, metrics.median_absolute_error),
+    (r2_score_native, metrics.r2_score),
+    (root_mean_squared_error_native, metrics.root_mean_squared_error),
+]
+
+
+def random_arrays(seed: int, n_samples: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    y_true = rng.random(size=(n_samples,)) * 10
+    y_pred = y_true + rng.normal(size=(n_samples,))
+    return y_true, np.abs(y_pred)
+
+
+###################################
+#     Tests for check_backend     #
+###################################
+
+
+@pytest.mark.parametrize("backend", ["auto", "native", "sklearn"])
+def test_check_backend_valid(backend: str) -> None:
+    check_backend(backend)
+
+
+def test_check_backend_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'backend': incorrect"):
+        check_backend("incorrect")
+
+
+########################################
+#     Tests for use_native_backend     #
+########################################
+
+
+def test_use_native_backend_auto_small() -> None:
+    assert use_native_backend("auto", size=1000)
+
+
+def test_use_native_backend_auto_large(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(native, "_MAX_NATIVE_SIZE", 10)
+    assert not use_native_backend("auto", size=11)
+
+
+def test_use_native_backend_native() -> None:
+    assert use_native_backend("native", size=2**30)
+
+
+def test_use_native_backend_sklearn() -> None:
+    assert not use_native_backend("sklearn", size=10)
+
+
+def test_use_native_backend_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'backend': incorrect"):
+        use_native_backend("incorrect", size=10)
+
+
+############################################
+#     Tests for the native kernels         #
+############################################
+
+
+@pytest.mark.parametrize(("kernel", "expected"), KERNELS)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("n_samples", [2, 10, 1000])
+def test_native_kernel_same_as_sklearn(
+    kernel: Callable, expected: Callable, seed: int, n_samples: int
+) -> None:
+    y_true, y_pred = random_arrays(seed, n_samples)
+    assert objects_are_allclose(kernel(y_true, y_pred), float(expected(y_true, y_pred)))
+
+
+@pytest.mark.parametrize(("kernel", "expected"), KERNELS)
+def test_native_kernel_same_as_sklearn_int(kernel: Callable, expected: Callable) -> None:
+    y_true, y_pred = np.array([1, 2, 3, 4, 5]), np.array([2, 2, 3, 4, 1])
+    assert objects_are_allclose(kernel(y_true, y_pred), float(expected(y_true, y_pred)))
+
+
+@pytest.mark.parametrize(("kernel", "expected"), KERNELS)
+def test_native_kernel_same_as_sklearn_float32(kernel: Callable, expected: Callable) -> None:
+    y_true, y_pred = random_arrays(0, 100)
+    y_true, y_pred = y_true.astype(np.float32), y_pred.astype(np.float32)
+    assert objects_are_allclose(kernel(y_true, y_pred), float(expected(y_true, y_pred)), rtol=1e-5)
+
+
+@pytest.mark.parametrize(("kernel", "expected"), KERNELS)
+@pytest.mark.parametrize("dtype", [np.int8, np.uint8, np.int32])
+def test_native_kernel_same_as_sklearn_narrow_int(
+    kernel: Callable, expected: Callable, dtype: np.dtype
+) -> None:
+    y_true = np.array([1, 2, 3, 4, 5, 100], dtype=dtype)
+    y_pred = np.array([2, 2, 3, 4, 1, 0], dtype=dtype)
+    assert objects_are_allclose(
+        kernel(y_true, y_pred), float(expected(y_true.astype(float), y_pred.astype(float)))
+    )
+
+
+@pytest.mark.parametrize(("kernel", "expected"), KERNELS)
+def test_native_kernel_same_as_sklearn_bool(kernel: Callable, expected: Callable) -> None:
+    y_true = np.array([True, False, True, True, False])
+    y_pred = np.array([True, True, False, True, False])
+    assert objects_are_allclose(
+        kernel(y_true, y_pred), float(expected(y_true.astype(float), y_pred.astype(float)))
+    )
+
+
+def test_mean_absolute_error_native_int8_no_overflow() -> None:
+    y_true, y_pred = np.array([-128, 127], dtype=np.int8), np.array([127, -128], dtype=np.int8)
+    assert mean_absolute_error_native(y_true, y_pred) == 255.0
+    assert mean_squared_error_native(y_true, y_pred) == 65025.0
+
+
+@pytest.mark.parametrize(("kernel", "expected"), KERNELS)
+def test_native_kernel_same_as_sklearn_perfect(kernel: Callable, expected: Callable) -> None:
+    y_true = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    assert objects_are_allclose(kernel(y_true, y_true), float(expected(y_true, y_true)))
+
+
+def test_mean_absolute_percentage_error_native_zero() -> None:
+    y_true, y_pred = np.array([0.0, 1.0, 2.0]), np.array([1.0, 1.0, 3.0])
+    assert objects_are_allclose(
+        mean_absolute_percentage_error_native(y_true, y_pred),
+        metrics.mean_absolute_percentage_error(y_true, y_pred),
+    )
+
+
+def test_mean_squared_log_error_native_incorrect() -> None:
+    with pytest.raises(ValueError, match="less than or equal to -1"):
+        mean_squared_log_error_native(np.array([1.0, -1.0]), np.array([1.0, 2.0]))
+
+
+@pytest.mark.parametrize(
+    ("y_true", "y_pred"),
+    [
+        (np.array([3.0, 3.0, 3.0]), np.array([3.0, 3.0, 3.0])),
+        (np.array([3.0, 3.0, 3.0]), np.array([1.0, 2.0, 3.0])),
+        (np.array([1.0, 2.0, 3.0]), np.array([3.0, 2.0, 1.0])),
+    ],
+)
+def test_r2_score_native_same_as_sklearn_edge_cases(y_true: np.ndarray, y_pred: np.ndarray) -> None:
+    assert objects_are_allclose(r2_score_native(y_true, y_pred), metrics.r2_score(y_true, y_pred))
+
+
+def test_r2_score_native_one_sample() -> None:
+    assert np.isnan(r2_score_native(np.array([1.0]), np.array([2.0])))
+
+
+@pytest.mark.parametrize("power", [-1.5, -1, 0, 1, 1.5, 2, 3, 4.5])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_mean_tweedie_deviance_native_same_as_sklearn(power: float, seed: int) -> None:
+    y_true, y_pred = random_arrays(seed, 100)
+    y_true[:5] = 0.0 if 0 <= power < 2 else 0.5
+    y_pred = y_pred + 0.1
+    assert objects_are_allclose(
+        mean_tweedie_deviance_native(y_true, y_pred, power=power),
+        metrics.mean_tweedie_deviance(y_true, y_pred, power=power),
+    )
+
+
+def test_mean_tweedie_deviance_native_incorrect_power() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect 'power': 0.5"):
+        mean_tweedie_deviance_native(np.array([1.0, 2.0]), np.array([1.0, 2.0]), power=0.5)
+
+
+@pytest.mark.parametrize(
+    ("power", "y_true", "message"),
+    [
+        (-1, np.array([1.0, 2.0]), "strictly positive y_pred"),
+        (1, np.array([-1.0, 2.0]), "non-negative y and strictly positive y_pred"),
+        (2, np.array([0.0, 2.0]), "strictly positive y and y_pred"),
+    ],
+)
+def test_mean_tweedie_deviance_native_incorrect_domain(
+    power: float, y_true: np.ndarray, message: str
+) -> None:
+    y_pred = np.array([0.0, 1.0]) if power < 0 else np.array([1.0, 1.0])
+    with pytest.raises(ValueError, match=message):
+        mean_tweedie_deviance_native(y_true, y_pred, power=power)
+
+
+POWERS = [-2.5, -1, 0, 1, 1.2, 1.5, 1.8, 2, 2.5, 3, 4.5]
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_mean_tweedie_deviance_powers_native_same_as_sklearn(seed: int) -> None:
+    y_true, y_pred = random_arrays(seed, 100)
+    y_pred = y_pred + 0.1
+    assert objects_are_allclose(
+        mean_tweedie_deviance_powers_native(y_true, y_pred, powers=POWERS),
+        np.array([metrics.mean_tweedie_deviance(y_true, y_pred, power=p) for p in POWERS]),
+    )
+
+
+def test_mean_tweedie_deviance_powers_native_zero_and_negative_targets() -> None:
+    y_true, y_pred = random_arrays(0, 100)
+    y_true[:5] = 0.0
+    y_pred = y_pred + 0.1
+    powers = [-2.5, -1, 0, 1, 1.5]
+    assert objects_are_allclose(
+        mean_tweedie_deviance_powers_native(y_true, y_pred, powers=powers),
+        np.array([metrics.mean_tweedie_deviance(y_true, y_pred, power=p) for p in powers]),
+    )
+    y_true[:5] = -1.0
+    assert objects_are_allclose(
+        mean_tweedie_deviance_powers_native(y_true, y_pred, powers=[-2.5, -1, 0]),
+        np.array([metrics.mean_tweedie_deviance(y_true, y_pred, power=p) for p in [-2.5, -1, 0]]),
+    )
+
+
+def test_mean_tweedie_deviance_powers_native_same_as_single_power() -> None:
+    y_true, y_pred = random_arrays(0, 100)
+    y_pred = y_pred + 0.1
+    assert objects_are_allclose(
+        mean_tweedie_deviance_powers_native(y_true, y_pred, powers=POWERS),
+        np.array([mean_tweedie_deviance_native(y_true, y_pred, power=p) for p in POWERS]),
+    )
+
+
+@pytest.mark.parametrize("block_num_values", [1, 7, 64])
+def test_mean_tweedie_deviance_powers_native_blocks(
+    monkeypatch: pytest.MonkeyPatch, block_num_values: int
+) -> None:
+    y_true, y_pred = random_arrays(0, 100)
+    y_pred = y_pred + 0.1
+    expected = mean_tweedie_deviance_powers_native(y_true, y_pred, powers=POWERS)
+    monkeypatch.setattr(native, "_BLOCK_NUM_VALUES", block_num_values)
+    assert objects_are_allclose(
+        mean_tweedie_deviance_powers_native(y_true, y_pred, powers=POWERS), expected
+    )
+
+
+def test_mean_tweedie_deviance_powers_native_int() -> None:
+    assert objects_are_allclose(
+        mean_tweedie_deviance_powers_native(
+            np.array([2, 0, 1, 4]), np.array([1, 1, 2, 2]), powers=[0, 1, 1.5]
+        ),
+        np.array(
+            [
+                metrics.mean_tweedie_deviance([2, 0, 1, 4], [1, 1, 2, 2], power=p)
+                for p in [0, 1, 1.5]
+            ]
+        ),
+    )
+
+
+def test_mean_tweedie_deviance_powers_native_empty() -> None:
+    assert objects_are_allclose(
+        mean_tweedie_deviance_powers_native(np.array([]), np.array([]), powers=[0, 1.5]),
+        np.array([float("nan"), float("nan")]),
+        equal_nan=True,
+    )
+
+
+def test_mean_tweedie_deviance_powers_native_no_powers() -> None:
+    assert objects_are_allclose(
+        mean_tweedie_deviance_powers_native(np.array([1.0, 2.0]), np.array([1.0, 2.0]), powers=[]),
+        np.array([]),
+    )
+
+
+def test_mean_tweedie_deviance_powers_native_incorrect_power() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect 'power': 0.5"):
+        mean_tweedie_deviance_powers_native(
+            np.array([1.0, 2.0]), np.array([1.0, 2.0]), powers=[0, 0.5]
+        )
+
+
+def test_mean_tweedie_deviance_powers_native_incorrect_domain() -> None:
+    with pytest.raises(ValueError, match="strictly positive y and y_pred"):
+        mean_tweedie_deviance_powers_native(
+            np.array([0.0, 2.0]), np.array([1.0, 1.0]), powers=[0, 1, 2]
+        )
+
+
+####################################################
+#     Tests for the backend of the metrics         #
+####################################################
+
+
+@pytest.mark.parametrize("backend", ["auto", "native", "sklearn"])
+def test_mean_squared_error_backend(backend: str) -> None:
+    y_true, y_pred = random_arrays(0, 100)
+    assert objects_are_allclose(
+        mean_squared_error(y_true=y_true, y_pred=y_pred, backend=backend),
+        {"count": 100, "mean_squared_error": float(metrics.mean_squared_error(y_true, y_pred))},
+    )
+
+
+@pytest.mark.parametrize("backend", ["native", "sklearn"])
+def test_r2_score_backend(backend: str) -> None:
+    y_true, y_pred = random_arrays(0, 100)
+    assert objects_are_allclose(
+        r2_score(y_true=y_true, y_pred=y_pred, backend=backend),
+        {"count": 100, "r2_score": float(metrics.r2_score(y_true, y_pred))},
+    )
+
+
+@pytest.mark.parametrize("backend", ["native", "sklearn"])
+def test_mean_tweedie_deviance_backend(backend: str) -> None:
+    y_true, y_pred = random_arrays(0, 100)
+    assert objects_are_allclose(
+        mean_tweedie_deviance(y_true=y_true, y_pred=y_pred + 0.1, powers=[0, 1.5], backend=backend),
+        mean_tweedie_deviance(y_true=y_true, y_pred=y_pred + 0.1, powers=[0, 1.5]),
+    )
+
+
+def test_mean_squared_error_backend_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'backend': incorrect"):
+        mean_squared_error(y_true=np.array([]), y_pred=np.array([]), backend="incorrect")
+
+
+###############################################
+#     Tests for regression_metrics_native     #
+###############################################
+
+FUSED_METRICS = {
+    "max_error": metrics.max_error,
+    "mean_absolute_error": metrics.mean_absolute_error,
+    "mean_absolute_percentage_error": metrics.mean_absolute_percentage_error,
+    "mean_squared_error": metrics.mean_squared_error,
+    "mean_squared_log_error": metrics.mean_squared_log_error,
+    "median_absolute_error": metrics.median_absolute_error,
+    "r2_score": metrics.r2_score,
+    "root_mean_squared_error": metrics.root_mean_squared_error,
+}
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("n_samples", [2, 3, 10, 1001])
+def test_regression_metrics_native_same_as_sklearn(seed: int, n_samples: int) -> None:
+    y_true, y_pred = random_arrays(seed, n_samples)
+    assert objects_are_allclose(
+        regression_metrics_native(y_true, y_pred),
+        {key: float(func(y_true, y_pred)) for key, func in FUSED_METRICS.items()},
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.int64, np.float32])
+def test_regression_metrics_native_same_as_sklearn_dtype(dtype: np.dtype) -> None:
+    y_true = np.array([1, 2, 3, 4, 5, 100], dtype=dtype)
+    y_pred = np.array([2, 2, 3, 4, 1, 0], dtype=dtype)
+    assert objects_are_allclose(
+        regression_metrics_native(y_true, y_pred),
+        {
+            key: float(func(y_true.astype(float), y_pred.astype(float)))
+            for key, func in FUSED_METRICS.items()
+        },
+        rtol=1e-5,
+    )
+
+
+def test_regression_metrics_native_same_as_kernels() -> None:
+    y_true, y_pred = random_arrays(0, 100)
+    assert objects_are_allclose(
+        regression_metrics_native(y_true, y_pred),
+        {
+            "max_error": float(np.max(np.abs(y_true - y_pred))),
+            "mean_absolute_error": mean_absolute_error_native(y_true, y_pred),
+            "mean_absolute_percentage_error": mean_absolute_percentage_error_native(y_true, y_pred),
+            "mean_squared_error": mean_squared_error_native(y_true, y_pred),
+            "mean_squared_log_error": mean_squared_log_error_native(y_true, y_pred),
+            "median_absolute_error": median_absolute_error_native(y_true, y_pred),
+            "r2_score": r2_score_native(y_true, y_pred),
+            "root_mean_squared_error": root_mean_squared_error_native(y_true, y_pred),
+        },
+    )
+
+
+def test_regression_metrics_native_does_not_modify_inputs() -> None:
+    y_true, y_pred = np.array([3.0, 1.0, 2.0]), np.array([1.0, 1.0, 5.0])
+    regression_metrics_native(y_true, y_pred)
+    assert objects_are_allclose(
+        (y_true, y_pred), (np.array([3.0, 1.0, 2.0]), np.array([1.0, 1.0, 5.0]))
+    )
+
+
+def test_regression_metrics_native_perfect() -> None:
+    y_true = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    assert objects_are_allclose(
+        regression_metrics_native(y_true, y_true),
+        {
+            "max_error": 0.0,
+            "mean_absolute_error": 0.0,
+            "mean_absolute_percentage_error": 0.0,
+            "mean_squared_error": 0.0,
+            "mean_squared_log_error": 0.0,
+            "median_absolute_error": 0.0,
+            "r2_score": 1.0,
+            "root_mean_squared_error": 0.0,
+        },
+    )
+
+
+def test_regression_metrics_native_one_sample() -> None:
+    assert objects_are_allclose(
+        regression_metrics_native(np.array([2.0]), np.array([4.0])),
+        {
+            "max_error": 2.0,
+            "mean_absolute_error": 2.0,
+            "mean_absolute_percentage_error": 1.0,
+            "mean_squared_error": 4.0,
+            "mean_squared_log_error": float(np.log(5 / 3) ** 2),
+            "median_absolute_error": 2.0,
+            "r2_score": float("nan"),
+            "root_mean_squared_error": 2.0,
+        },
+        equal_nan=True,
+    )
+
+
+def test_regression_metrics_native_msle_out_of_domain() -> None:
+    out = regression_metrics_native(np.array([-2.0, 1.0, 3.0]), np.array([1.0, 1.0, 2.0]))
+    assert math.isnan(out["mean_squared_log_error"])
+    assert out["mean_squared_error"] == 10 / 3
+
+
+###########################################################
+#     Tests for multioutput_regression_metrics_native     #
+###########################################################
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+@pytest.mark.parametrize("shape", [(2, 1), (3, 4), (10, 3), (1001, 96)])
+def test_multioutput_regression_metrics_native_same_as_sklearn(
+    seed: int, shape: tuple[int, int]
+) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.uniform(0, 10, size=shape)
+    y_pred = rng.uniform(0, 10, size=shape)
+    expected = {
+        key: np.array([float(func(y_true[:, i], y_pred[:, i])) for i in range(shape[1])])
+        for key, func in FUSED_METRICS.items()
+    }
+    assert objects_are_allclose(multioutput_regression_metrics_native(y_true, y_pred), expected)
+
+
+def test_multioutput_regression_metrics_native_same_as_fused_kernel() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(size=(100, 5))
+    y_pred = rng.normal(size=(100, 5))
+    out = multioutput_regression_metrics_native(y_true, y_pred)
+    for i in range(5):
+        expected = regression_metrics_native(y_true[:, i], y_pred[:, i])
+        assert objects_are_allclose(
+            {key: float(value[i]) for key, value in out.items()}, expected, equal_nan=True
+        )
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.int64, np.int8, np.bool_])
+def test_multioutput_regression_metrics_native_dtype(dtype: np.dtype) -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=(100, 3)).astype(dtype)
+    y_pred = rng.integers(0, 2, size=(100, 3)).astype(dtype)
+    out = multioutput_regression_metrics_native(y_true, y_pred)
+    expected = multioutput_regression_metrics_native(
+        y_true.astype(np.float64), y_pred.astype(np.float64)
+    )
+    assert objects_are_allclose(out, expected, rtol=1e-5)
+    assert all(value.dtype == np.float64 for value in out.values())
+
+
+def test_multioutput_regression_metrics_native_does_not_modify_inputs() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(size=(10, 3))
+    y_pred = rng.normal(size=(10, 3))
+    y_true_copy, y_pred_copy = y_true.copy(), y_pred.copy()
+    multioutput_regression_metrics_native(y_true, y_pred)
+    assert np.array_equal(y_true, y_true_copy)
+    assert np.array_equal(y_pred, y_pred_copy)
+
+
+def test_multioutput_regression_metrics_native_r2_special_cases() -> None:
+    out = multioutput_regression_metrics_native(
+        np.array([[1.0, 2.0, 2.0], [2.0, 2.0, 2.0], [3.0, 2.0, 2.0]]),
+        np.array([[1.0, 2.0, 1.0], [2.0, 2.0, 2.0], [3.0, 2.0, 3.0]]),
+    )
+    assert objects_are_allclose(out["r2_score"], np.array([1.0, 1.0, 0.0]))
+
+
+def test_multioutput_regression_metrics_native_one_sample() -> None:
+    out = multioutput_regression_metrics_native(np.array([[1.0, 2.0]]), np.array([[2.0, 2.0]]))
+    assert objects_are_allclose(out["mean_absolute_error"], np.array([1.0, 0.0]))
+    assert np.isnan(out["r2_score"]).all()
+
+
+def test_multioutput_regression_metrics_native_msle_out_of_domain() -> None:
+    out = multioutput_regression_metrics_native(
+        np.array([[1.0, -2.0], [2.0, 3.0]]), np.array([[1.0, 2.0], [3.0, 3.0]])
+    )
+    assert math.isclose(out["mean_squared_log_error"][0], (np.log(3) - np.log(4)) ** 2 / 2)
+    assert math.isnan(out["mean_squared_log_error"][1])
@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from arkas.metric import binned_residuals
+from arkas.metric.regression import residual
+from arkas.metric.regression.residual import find_bin_edges
+
+
+def reference_binned_residuals(
+    y_true: np.ndarray, y_pred: np.ndarray, bin_edges: np.ndarray
+) -> dict[str, np.ndarray]:
+    residuals = y_pred.astype(float) - y_true.astype(float)
+    index = np.clip(np.digitize(y_pred, bin_edges[1:-1]), 0, bin_edges.size - 2)
+    inside = np.logical_and(y_pred >= bin_edges[0], y_pred <= bin_edges[-1])
+    n_bins = bin_edges.size - 1
+    out = {
+        "bin_bias": np.full(n_bins, np.nan),
+        "bin_count": np.zeros(n_bins, dtype=np.int64),
+        "bin_mae": np.full(n_bins, np.nan),
+        "bin_rmse": np.full(n_bins, np.nan),
+    }
+    for i in range(n_bins):
+        res = residuals[np.logical_and(inside, index == i)]
+        out["bin_count"][i] = res.size
+        if res.size:
+            out["bin_bias"][i] = res.mean()
+            out["bin_mae"][i] = np.abs(res).mean()
+            out["bin_rmse"][i] = np.sqrt(np.square(res).mean())
+    return out
+
+
+######################################
+#     Tests for binned_residuals     #
+######################################
+
+
+def test_binned_residuals_fixed_edges() -> None:
+    assert objects_are_allclose(
+        binned_residuals(
+            y_true=np.array([1, 2, 3, 4, 5, 6]),
+            y_pred=np.array([2, 2, 3, 3, 6, 8]),
+            bins=[0, 3, 6, 9],
+        ),
+        {
+            "bin_bias": np.array([0.5, -0.5, 1.5]),
+            "bin_count": np.array([2, 2, 2]),
+            "bin_edges": np.array([0.0, 3.0, 6.0, 9.0]),
+            "bin_mae": np.array([0.5, 0.5, 1.5]),
+            "bin_rmse": np.array([np.sqrt(0.5), np.sqrt(0.5), np.sqrt(2.5)]),
+            "count": 6,
+        },
+    )
+
+
+def test_binned_residuals_fixed_edges_outside() -> None:
+    assert objects_are_allclose(
+        binned_residuals(
+            y_true=np.array([1.0, 2.0, 3.0, 4.0, 5.0]),
+            y_pred=np.array([-1.0, 2.0, 4.0, 6.0, 7.0]),
+            bins=np.array([0.0, 3.0, 6.0]),
+        ),
+        {
+            "bin_bias": np.array([0.0, 1.5]),
+            "bin_count": np.array([1, 2]),
+            "bin_edges": np.array([0.0, 3.0, 6.0]),
+            "bin_mae": np.array([0.0, 1.5]),
+            "bin_rmse": np.array([0.0, np.sqrt(2.5)]),
+            "count": 5,
+        },
+    )
+
+
+def test_binned_residuals_fixed_edges_empty_bin() -> None:
+    assert objects_are_allclose(
+        binned_residuals(
+            y_true=np.array([1.0, 2.0, 3.0]), y_pred=np.array([1.0, 3.0, 5.0]), bins=[0, 2, 4, 6, 8]
+        ),
+        {
+            "bin_bias": np.array([0.0, 1.0, 2.0, np.nan]),
+            "bin_count": np.array([1, 1, 1, 0]),
+            "bin_edges": np.array([0.0, 2.0, 4.0, 6.0, 8.0]),
+            "bin_mae": np.array([0.0, 1.0, 2.0, np.nan]),
+            "bin_rmse": np.array([0.0, 1.0, 2.0, np.nan]),
+            "count": 3,
+        },
+        equal_nan=True,
+    )
+
+
+def test_binned_residuals_last_bin_includes_right_edge() -> None:
+    assert objects_are_equal(
+        binned_residuals(
+            y_true=np.array([0.0, 0.0, 0.0, 0.0]),
+            y_pred=np.array([0.0, 1.0, 2.0, 3.0]),
+            bins=[0.0, 1.0, 2.0, 3.0],
+        )["bin_count"],
+        np.array([1, 1, 2]),
+    )
+
+
+def test_binned_residuals_quantile() -> None:
+    metrics = binned_residuals(y_true=np.zeros(100), y_pred=np.arange(100), bins=4)
+    assert objects_are_allclose(metrics["bin_edges"], np.array([0.0, 24.75, 49.5, 74.25, 99.0]))
+    assert objects_are_equal(metrics["bin_count"], np.array([25, 25, 25, 25]))
+    assert objects_are_allclose(metrics["bin_bias"], np.array([12.0, 37.0, 62.0, 87.0]))
+
+
+def test_binned_residuals_uniform() -> None:
+    metrics = binned_residuals(
+        y_true=np.zeros(6), y_pred=np.array([0, 0, 0, 0, 1, 9]), bins=3, strategy="uniform"
+    )
+    assert objects_are_allclose(metrics["bin_edges"], np.array([0.0, 3.0, 6.0, 9.0]))
+    assert objects_are_equal(metrics["bin_count"], np.array([5, 0, 1]))
+
+
+@pytest.mark.parametrize("strategy", ["quantile", "uniform"])
+@pytest.mark.parametrize("bins", [1, 5, 10, 50])
+def test_binned_residuals_reference(strategy: str, bins: int) -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.normal(size=1000)
+    y_pred = y_true + rng.normal(size=1000)
+    metrics = binned_residuals(y_true=y_true, y_pred=y_pred, bins=bins, strategy=strategy)
+    assert metrics["count"] == 1000
+    assert metrics["bin_count"].sum() == 1000
+    assert objects_are_allclose(
+        {key: val for key, val in metrics.items() if key not in {"bin_edges", "count"}},
+        reference_binned_residuals(y_true, y_pred, bin_edges=metrics["bin_edges"]),
+        equal_nan=True,
+    )
+
+
+def test_binned_residuals_reference_fixed_edges_many_bins() -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.normal(size=1000)
+    y_pred = y_true + rng.normal(size=1000)
+    bin_edges = np.linspace(-2.0, 2.0, 51)
+    metrics = binned_residuals(y_true=y_true, y_pred=y_pred, bins=bin_edges)
+    assert objects_are_allclose(
+        {key: val for key, val in metrics.items() if key not in {"bin_edges", "count"}},
+        reference_binned_residuals(y_true, y_pred, bin_edges=bin_edges),
+        equal_nan=True,
+    )
+
+
+def test_binned_residuals_multiple_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(residual, "_BLOCK_NUM_VALUES", 7)
+    rng = np.random.default_rng(42)
+    y_true = rng.normal(size=100)
+    y_pred = y_true + rng.normal(size=100)
+    metrics = binned_residuals(y_true=y_true, y_pred=y_pred, bins=5)
+    assert objects_are_allclose(
+        {key: val for key, val in metrics.items() if key not in {"bin_edges", "count"}},
+        reference_binned_residuals(y_true, y_pred, bin_edges=metrics["bin_edges"]),
+    )
+
+
+def test_binned_residuals_constant_predictions() -> None:
+    assert objects_are_allclose(
+        binned_residuals(y_true=np.array([1.0, 2.0, 3.0]), y_pred=np.array([2.0, 2.0, 2.0])),
+        {
+            "bin_bias": np.array([0.0]),
+            "bin_count": np.array([3]),
+            "bin_edges": np.array([2.0, 2.0]),
+            "bin_mae": np.array([2.0 / 3.0]),
+            "bin_rmse": np.array([np.sqrt(2.0 / 3.0)]),
+            "count": 3,
+        },
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.int64, np.float32, np.float64])
+def test_binned_residuals_dtype(dtype: np.dtype) -> None:
+    assert objects_are_allclose(
+        binned_residuals(
+            y_true=np.array([1, 2, 3, 4, 5, 6], dtype=dtype),
+            y_pred=np.array([2, 2, 3, 3, 6, 8], dtype=dtype),
+            bins=[0, 3, 6, 9],
+        )["bin_bias"],
+        np.array([0.5, -0.5, 1.5]),
+    )
+
+
+def test_binned_residuals_bool() -> None:
+    assert objects_are_allclose(
+        binned_residuals(
+            y_true=np.array([True, False, True, False]),
+            y_pred=np.array([True, True, False, False]),
+            bins=2,
+        ),
+        {
+            "bin_bias": np.array([-0.5, 0.5]),
+            "bin_count": np.array([2, 2]),
+            "bin_edges": np.array([0.0, 0.5, 1.0]),
+            "bin_mae": np.array([0.5, 0.5]),
+            "bin_rmse": np.array([np.sqrt(0.5), np.sqrt(0.5)]),
+            "count": 4,
+        },
+    )
+
+
+def test_binned_residuals_empty() -> None:
+    assert objects_are_equal(
+        binned_residuals(y_true=np.array([]), y_pred=np.array([]), bins=2),
+        {
+            "bin_bias": np.array([np.nan, np.nan]),
+            "bin_count": np.array([0, 0]),
+            "bin_edges": np.array([np.nan, np.nan, np.nan]),
+            "bin_mae": np.array([np.nan, np.nan]),
+            "bin_rmse": np.array([np.nan, np.nan]),
+            "count": 0,
+        },
+        equal_nan=True,
+    )
+
+
+def test_binned_residuals_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        binned_residuals(
+            y_true=np.array([1, 2, 3, 4, 5, 6]),
+            y_pred=np.array([2, 2, 3, 3, 6, 8]),
+            bins=[0, 3, 6, 9],
+            prefix="prefix_",
+            suffix="_suffix",
+        ),
+        {
+            "prefix_bin_bias_suffix": np.array([0.5, -0.5, 1.5]),
+            "prefix_bin_count_suffix": np.array([2, 2, 2]),
+            "prefix_bin_edges_suffix": np.array([0.0, 3.0, 6.0, 9.0]),
+            "prefix_bin_mae_suffix": np.array([0.5, 0.5, 1.5]),
+            "prefix_bin_rmse_suffix": np.array([np.sqrt(0.5), np.sqrt(0.5), np.sqrt(2.5)]),
+            "prefix_count_suffix": 6,
+        },
+    )
+
+
+def test_binned_residuals_nan_omit() -> None:
+    assert objects_are_allclose(
+        binned_residuals(
+            y_true=np.array([1.0, 2.0, 3.0, 4.0, np.nan, 6.0, 7.0]),
+            y_pred=np.array([2.0, 2.0, 3.0, 3.0, 6.0, 8.0, np.nan]),
+            bins=[0, 3, 6, 9],
+            nan_policy="omit",
+        ),
+        {
+            "bin_bias": np.array([0.5, -0.5, 2.0]),
+            "bin_count": np.array([2, 2, 1]),
+            "bin_edges": np.array([0.0, 3.0, 6.0, 9.0]),
+            "bin_mae": np.array([0.5, 0.5, 2.0]),
+            "bin_rmse": np.array([np.sqrt(0.5), np.sqrt(0.5), 2.0]),
+            "count": 5,
+        },
+    )
+
+
+def test_binned_residuals_nan_propagate() -> None:
+    assert objects_are_equal(
+        binned_residuals(
+            y_true=np.array([1.0, 2.0, 3.0, 4.0]),
+            y_pred=np.array([2.0, 2.0, 3.0, np.nan]),
+            bins=2,
+        ),
+        {
+            "bin_bias": np.array([np.nan, np.nan]),
+            "bin_count": np.array([0, 0]),
+            "bin_edges": np.array([np.nan, np.nan, np.nan]),
+            "bin_mae": np.array([np.nan, np.nan]),
+            "bin_rmse": np.array([np.nan, np.nan]),
+            "count": 4,
+        },
+        equal_nan=True,
+    )
+
+
+def test_binned_residuals_nan_propagate_fixed_edges() -> None:
+    assert objects_are_equal(
+        binned_residuals(
+            y_true=np.array([1.0, 2.0, 3.0, np.nan]),
+            y_pred=np.array([2.0, 2.0, 3.0, 4.0]),
+            bins=[0, 3, 6],
+        ),
+        {
+            "bin_bias": np.array([np.nan, np.nan]),
+            "bin_count": np.array([0, 0]),
+            "bin_edges": np.array([0.0, 3.0, 6.0]),
+            "bin_mae": np.array([np.nan, np.nan]),
+            "bin_rmse": np.array([np.nan, np.nan]),
+            "count": 4,
+        },
+        equal_nan=True,
+    )
+
+
+def test_binned_residuals_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_pred' contains at least one NaN value"):
+        binned_residuals(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([1.0, np.nan, 3.0]),
+            nan_policy="raise",
+        )
+
+
+def test_binned_residuals_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_pred' have different shapes"):
+        binned_residuals(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2]))
+
+
+@pytest.mark.parametrize("bins", [[1.0], [[0.0, 1.0], [2.0, 3.0]]])
+def test_binned_residuals_incorrect_bin_edges_shape(bins: list) -> None:
+    with pytest.raises(ValueError, match="The bin edges must be a 1d array with at least 2 values"):
+        binned_residuals(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2, 3]), bins=bins)
+
+
+@pytest.mark.parametrize("bins", [[0.0, 2.0, 1.0], [0.0, 1.0, 1.0]])
+def test_binned_residuals_incorrect_bin_edges_order(bins: list) -> None:
+    with pytest.raises(ValueError, match="The bin edges must increase monotonically"):
+        binned_residuals(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2, 3]), bins=bins)
+
+
+def test_binned_residuals_incorrect_n_bins() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'n_bins': 0"):
+        binned_residuals(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2, 3]), bins=0)
+
+
+def test_binned_residuals_incorrect_strategy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'strategy': 'kmeans'"):
+        binned_residuals(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2, 3]), strategy="kmeans")
+
+
+def test_binned_residuals_incorrect_strategy_nan() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'strategy': 'kmeans'"):
+        binned_residuals(
+            y_true=np.array([1.0, 2.0, 3.0]), y_pred=np.array([1.0, np.nan, 3.0]), strategy="kmeans"
+        )
+
+
+####################################
+#     Tests for find_bin_edges     #
+####################################
+
+
+def test_find_bin_edges_quantile() -> None:
+    assert objects_are_equal(
+        find_bin_edges(np.arange(101), n_bins=4), np.array([0.0, 25.0, 50.0, 75.0, 100.0])
+    )
+
+
+def test_find_bin_edges_quantile_duplicate_edges() -> None:
+    assert objects_are_equal(
+        find_bin_edges(np.array([0, 0, 0, 0, 0, 0, 1, 2]), n_bins=4), np.array([0.0, 0.25, 2.0])
+    )
+
+
+def test_find_bin_edges_quantile_subsample(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(residual, "_MAX_QUANTILE_SAMPLES", 100)
+    values = np.random.default_rng(42).normal(size=10_000)
+    edges = find_bin_edges(values, n_bins=4)
+    assert edges.shape == (5,)
+    assert edges[0] == values.min()
+    assert edges[-1] == values.max()
+    assert np.all(np.diff(edges) > 0)
+    assert objects_are_equal(edges, find_bin_edges(values, n_bins=4))
+
+
+def test_find_bin_edges_uniform() -> None:
+    assert objects_are_equal(
+        find_bin_edges(np.array([0, 0, 0, 0, 1, 9]), n_bins=4, strategy="uniform"),
+        np.array([0.0, 2.25, 4.5, 6.75, 9.0]),
+    )
+
+
+@pytest.mark.parametrize("strategy", ["quantile", "uniform"])
+def test_find_bin_edges_constant(strategy: str) -> None:
+    assert objects_are_equal(
+        find_bin_edges(np.array([3, 3, 3]), n_bins=4, strategy=strategy), np.array([3.0, 3.0])
+    )
+
+
+def test_find_bin_edges_2d() -> None:
+    assert objects_are_equal(
+        find_bin_edges(np.array([[0, 1], [2, 3], [4, 5], [6, 8]]), n_bins=2),
+        np.array([0.0, 3.5, 8.0]),
+    )
+
+
+def test_find_bin_edges_empty() -> None:
+    assert objects_are_equal(
+        find_bin_edges(np.array([]), n_bins=2), np.array([np.nan, np.nan, np.nan]), equal_nan=True
+    )
+
+
+def test_find_bin_edges_incorrect_n_bins() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'n_bins': 0"):
+        find_bin_edges(np.arange(10), n_bins=0)
+
+
+def test_find_bin_edges_incorrect_strategy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'strategy': 'kmeans'"):
+        find_bin_edges(np.arange(10), n_bins=2, strategy="kmeans")
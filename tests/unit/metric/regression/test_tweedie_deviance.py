@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import numpy as np
 import pytest
-from coola import objects_are_equal
+from coola import objects_are_allclose, objects_are_equal
+from sklearn import metrics
 
 from arkas.metric import mean_tweedie_deviance
+from arkas.metric.regression import native
 
 ###########################################
 #     Tests for mean_tweedie_deviance     #
@@ -48,6 +50,39 @@ def test_mean_tweedie_deviance_powers() -> None:
     )
 
 
+def test_mean_tweedie_deviance_powers_grid() -> None:
+    rng = np.random.default_rng(42)
+    y_true = rng.random(size=(1000,)) * 10
+    y_pred = rng.random(size=(1000,)) * 10 + 0.1
+    powers = [-1, 0, 1, 1.5, 2, 3]
+    assert objects_are_allclose(
+        mean_tweedie_deviance(y_true=y_true, y_pred=y_pred, powers=powers),
+        {"count": 1000}
+        | {
+            f"mean_tweedie_deviance_power_{power}": metrics.mean_tweedie_deviance(
+                y_true, y_pred, power=power
+            )
+            for power in powers
+        },
+    )
+
+
+def test_mean_tweedie_deviance_powers_large_auto(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(native, "_MAX_NATIVE_SIZE", 2)
+    y_true, y_pred = np.array([1.0, 2.0, 3.0, 4.0]), np.array([2.0, 2.0, 3.0, 3.0])
+    assert objects_are_allclose(
+        mean_tweedie_deviance(y_true=y_true, y_pred=y_pred, powers=[0, 1.5]),
+        mean_tweedie_deviance(y_true=y_true, y_pred=y_pred, powers=[0, 1.5], backend="sklearn"),
+    )
+
+
+def test_mean_tweedie_deviance_powers_incorrect_domain() -> None:
+    with pytest.raises(ValueError, match="strictly positive y and y_pred"):
+        mean_tweedie_deviance(
+            y_true=np.array([0.0, 2.0]), y_pred=np.array([1.0, 1.0]), powers=[0, 1, 2]
+        )
+
+
 def test_mean_tweedie_deviance_empty() -> None:
     assert objects_are_equal(
         mean_tweedie_deviance(y_true=np.array([]), y_pred=np.array([])),
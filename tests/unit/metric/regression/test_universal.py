@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import math
+
 import numpy as np
 import pytest
-from coola import objects_are_equal
+from coola import objects_are_allclose, objects_are_equal
 
-from arkas.metric import regression_errors
+from arkas.metric import (
+    mean_absolute_error,
+    mean_squared_error,
+    median_absolute_error,
+    multioutput_regression_metrics,
+    regression_errors,
+    regression_metrics,
+)
+from arkas.metric.utils import prepare_inputs
 
 #######################################
 #     Tests for regression_errors     #
@@ -203,3 +213,268 @@ def test_regression_errors_nan_raise_y_pred() -> None:
             y_pred=np.array([1, 2, 3, 4, 5, float("nan")]),
             nan_policy="raise",
         )
+
+
+def test_regression_errors_same_as_individual_metrics() -> None:
+    y_true = np.array([1.0, 2.0, 3.0, 4.0, float("nan")])
+    y_pred = np.array([3.0, 5.0, 1.0, 2.0, 1.0])
+    assert objects_are_equal(
+        regression_errors(y_true=y_true, y_pred=y_pred, nan_policy="omit"),
+        mean_absolute_error(y_true=y_true, y_pred=y_pred, nan_policy="omit")
+        | median_absolute_error(y_true=y_true, y_pred=y_pred, nan_policy="omit")
+        | mean_squared_error(y_true=y_true, y_pred=y_pred, nan_policy="omit"),
+    )
+
+
+@pytest.mark.parametrize("backend", ["native", "sklearn"])
+def test_regression_errors_backend(backend: str) -> None:
+    assert objects_are_allclose(
+        regression_errors(
+            y_true=np.array([1.0, 2.0, 3.0, 4.0]),
+            y_pred=np.array([3.0, 5.0, 1.0, 2.0]),
+            backend=backend,
+        ),
+        {
+            "count": 4,
+            "mean_absolute_error": 2.25,
+            "median_absolute_error": 2.0,
+            "mean_squared_error": 5.25,
+        },
+    )
+
+
+########################################
+#     Tests for regression_metrics     #
+########################################
+
+
+def test_regression_metrics_correct() -> None:
+    assert objects_are_allclose(
+        regression_metrics(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([2, 2, 3, 4, 1])),
+        {
+            "count": 5,
+            "max_error": 4.0,
+            "mean_absolute_error": 1.0,
+            "mean_absolute_percentage_error": 0.36,
+            "mean_squared_error": 3.4,
+            "mean_squared_log_error": 0.27427018294114947,
+            "median_absolute_error": 0.0,
+            "r2_score": -0.7,
+            "root_mean_squared_error": 1.8439088914585775,
+        },
+    )
+
+
+def test_regression_metrics_correct_2d() -> None:
+    assert objects_are_equal(
+        regression_metrics(
+            y_true=np.array([[1, 2, 3], [4, 5, 6]]), y_pred=np.array([[1, 2, 3], [4, 5, 6]])
+        ),
+        {
+            "count": 6,
+            "max_error": 0.0,
+            "mean_absolute_error": 0.0,
+            "mean_absolute_percentage_error": 0.0,
+            "mean_squared_error": 0.0,
+            "mean_squared_log_error": 0.0,
+            "median_absolute_error": 0.0,
+            "r2_score": 1.0,
+            "root_mean_squared_error": 0.0,
+        },
+    )
+
+
+def test_regression_metrics_empty() -> None:
+    assert objects_are_equal(
+        regression_metrics(y_true=np.array([]), y_pred=np.array([])),
+        {
+            "count": 0,
+            "max_error": float("nan"),
+            "mean_absolute_error": float("nan"),
+            "mean_absolute_percentage_error": float("nan"),
+            "mean_squared_error": float("nan"),
+            "mean_squared_log_error": float("nan"),
+            "median_absolute_error": float("nan"),
+            "r2_score": float("nan"),
+            "root_mean_squared_error": float("nan"),
+        },
+        equal_nan=True,
+    )
+
+
+def test_regression_metrics_prefix_suffix() -> None:
+    out = regression_metrics(
+        y_true=np.array([1, 2, 3, 4, 5]),
+        y_pred=np.array([1, 2, 3, 4, 5]),
+        prefix="prefix_",
+        suffix="_suffix",
+    )
+    assert list(out) == [
+        "prefix_count_suffix",
+        "prefix_max_error_suffix",
+        "prefix_mean_absolute_error_suffix",
+        "prefix_mean_absolute_percentage_error_suffix",
+        "prefix_mean_squared_error_suffix",
+        "prefix_mean_squared_log_error_suffix",
+        "prefix_median_absolute_error_suffix",
+        "prefix_r2_score_suffix",
+        "prefix_root_mean_squared_error_suffix",
+    ]
+
+
+def test_regression_metrics_nan_omit() -> None:
+    assert objects_are_allclose(
+        regression_metrics(
+            y_true=np.array([1.0, 2.0, 3.0, 4.0, float("nan")]),
+            y_pred=np.array([3.0, 5.0, 1.0, 2.0, 1.0]),
+            nan_policy="omit",
+        ),
+        regression_metrics(y_true=np.array([1, 2, 3, 4]), y_pred=np.array([3, 5, 1, 2])),
+    )
+
+
+def test_regression_metrics_nan_propagate() -> None:
+    out = regression_metrics(
+        y_true=np.array([1.0, 2.0, 3.0, 4.0, float("nan")]),
+        y_pred=np.array([3.0, 5.0, 1.0, 2.0, 1.0]),
+    )
+    assert out["count"] == 5
+    assert all(math.isnan(value) for key, value in out.items() if key != "count")
+
+
+def test_regression_metrics_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_pred' contains at least one NaN value"):
+        regression_metrics(
+            y_true=np.array([1, 2, 3, 4, 5]),
+            y_pred=np.array([1, 2, 3, 4, float("nan")]),
+            nan_policy="raise",
+        )
+
+
+def test_regression_metrics_prepared() -> None:
+    y_true, y_pred = np.array([1, 2, 3, 4, 5]), np.array([2, 2, 3, 4, 1])
+    assert objects_are_equal(
+        regression_metrics(y_true, y_pred, prepared=prepare_inputs(y_true, y_pred)),
+        regression_metrics(y_true, y_pred),
+    )
+
+
+def test_regression_metrics_same_as_individual_metrics() -> None:
+    y_true = np.array([1.0, 2.0, 3.0, 4.0, float("nan")])
+    y_pred = np.array([3.0, 5.0, 1.0, 2.0, 1.0])
+    out = regression_metrics(y_true=y_true, y_pred=y_pred, nan_policy="omit")
+    keys = ["count", "mean_absolute_error", "median_absolute_error", "mean_squared_error"]
+    assert objects_are_allclose(
+        {key: out[key] for key in keys},
+        mean_absolute_error(y_true=y_true, y_pred=y_pred, nan_policy="omit")
+        | median_absolute_error(y_true=y_true, y_pred=y_pred, nan_policy="omit")
+        | mean_squared_error(y_true=y_true, y_pred=y_pred, nan_policy="omit"),
+    )
+
+
+####################################################
+#     Tests for multioutput_regression_metrics     #
+####################################################
+
+Y_TRUE_2D = np.array([[1, 2], [2, 4], [3, 6], [4, 8]])
+Y_PRED_2D = np.array([[1, 3], [2, 4], [4, 6], [4, 4]])
+
+
+def test_multioutput_regression_metrics() -> None:
+    assert objects_are_allclose(
+        multioutput_regression_metrics(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D),
+        {
+            "count": 4,
+            "macro_max_error": 2.5,
+            "macro_mean_absolute_error": 0.75,
+            "macro_mean_absolute_percentage_error": 0.16666666666666666,
+            "macro_mean_squared_error": 2.25,
+            "macro_mean_squared_log_error": 0.05975589784250316,
+            "macro_median_absolute_error": 0.25,
+            "macro_r2_score": 0.475,
+            "macro_root_mean_squared_error": 1.2807764064044151,
+            "max_error": np.array([1.0, 4.0]),
+            "mean_absolute_error": np.array([0.25, 1.25]),
+            "mean_absolute_percentage_error": np.array([0.08333333333333333, 0.25]),
+            "mean_squared_error": np.array([0.25, 4.25]),
+            "mean_squared_log_error": np.array([0.012448258350637118, 0.1070635373343892]),
+            "median_absolute_error": np.array([0.0, 0.5]),
+            "r2_score": np.array([0.8, 0.15]),
+            "root_mean_squared_error": np.array([0.5, 2.0615528128088303]),
+        },
+    )
+
+
+def test_multioutput_regression_metrics_same_as_regression_metrics() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.uniform(0, 10, size=(50, 4))
+    y_pred = rng.uniform(0, 10, size=(50, 4))
+    out = multioutput_regression_metrics(y_true=y_true, y_pred=y_pred)
+    for i in range(4):
+        expected = regression_metrics(y_true=y_true[:, i], y_pred=y_pred[:, i])
+        assert objects_are_allclose(
+            {key: float(out[key][i]) if key != "count" else out[key] for key in expected},
+            expected,
+        )
+
+
+def test_multioutput_regression_metrics_macro() -> None:
+    out = multioutput_regression_metrics(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D)
+    for key in ["mean_absolute_error", "r2_score", "root_mean_squared_error"]:
+        assert math.isclose(out[f"macro_{key}"], out[key].mean())
+
+
+def test_multioutput_regression_metrics_1d() -> None:
+    out = multioutput_regression_metrics(y_true=np.array([1, 2, 3]), y_pred=np.array([1, 2, 4]))
+    assert objects_are_allclose(out["mean_absolute_error"], np.array([1 / 3]))
+    assert math.isclose(out["macro_mean_absolute_error"], 1 / 3)
+
+
+def test_multioutput_regression_metrics_empty() -> None:
+    out = multioutput_regression_metrics(y_true=np.zeros((0, 3)), y_pred=np.zeros((0, 3)))
+    assert out["count"] == 0
+    assert objects_are_equal(out["mean_squared_error"], np.full(3, np.nan), equal_nan=True)
+    assert math.isnan(out["macro_mean_squared_error"])
+
+
+def test_multioutput_regression_metrics_prefix_suffix() -> None:
+    out = multioutput_regression_metrics(
+        y_true=Y_TRUE_2D, y_pred=Y_PRED_2D, prefix="prefix_", suffix="_suffix"
+    )
+    assert len(out) == 17
+    assert all(key.startswith("prefix_") and key.endswith("_suffix") for key in out)
+    assert objects_are_allclose(out["prefix_mean_absolute_error_suffix"], np.array([0.25, 1.25]))
+
+
+def test_multioutput_regression_metrics_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_pred' have different shapes"):
+        multioutput_regression_metrics(y_true=np.ones((4, 2)), y_pred=np.ones((4, 3)))
+
+
+def test_multioutput_regression_metrics_nan_omit() -> None:
+    out = multioutput_regression_metrics(
+        y_true=np.array([[1.0, 2.0], [2.0, float("nan")], [3.0, 6.0], [4.0, 8.0]]),
+        y_pred=np.array([[1.0, 3.0], [2.0, 4.0], [4.0, 6.0], [4.0, 4.0]]),
+        nan_policy="omit",
+    )
+    assert out["count"] == 3
+    assert objects_are_allclose(out["max_error"], np.array([1.0, 4.0]))
+
+
+def test_multioutput_regression_metrics_nan_propagate() -> None:
+    out = multioutput_regression_metrics(
+        y_true=np.array([[1.0, 2.0], [2.0, float("nan")], [3.0, 6.0], [4.0, 8.0]]),
+        y_pred=np.array([[1.0, 3.0], [2.0, 4.0], [4.0, 6.0], [4.0, 4.0]]),
+    )
+    assert out["count"] == 4
+    assert np.isnan(out["mean_absolute_error"]).all()
+    assert math.isnan(out["macro_mean_absolute_error"])
+
+
+def test_multioutput_regression_metrics_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        multioutput_regression_metrics(
+            y_true=np.array([[1.0, float("nan")], [2.0, 3.0]]),
+            y_pred=np.array([[1.0, 3.0], [2.0, 4.0]]),
+            nan_policy="raise",
+        )
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+from functools import partial
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from arkas.metric import (
+    accuracy,
+    binary_average_precision,
+    binary_precision,
+    binary_roc_auc,
+    bootstrap_metric,
+    mean_squared_error,
+    multiclass_recall,
+    multilabel_precision,
+)
+from arkas.metric.bootstrap import _find_label_type, check_bootstrap_method
+from arkas.result import (
+    AccuracyResult,
+    BinaryConfusionMatrixResult,
+    BinaryPrecisionResult,
+    MulticlassRecallResult,
+    MultilabelPrecisionResult,
+)
+
+NAN = float("nan")
+Y_TRUE = np.array([1, 0, 0, 1, 1, 0, 1, 0, 1, 1] * 20)
+Y_PRED = np.array([1, 0, 1, 1, 1, 0, 0, 0, 1, 1] * 20)
+Y_SCORE = np.array([0.9, 0.1, 0.6, 0.8, 0.7, 0.2, 0.3, 0.4, 0.9, 0.5] * 20)
+
+
+def accuracy_without_confmat(
+    y_true: np.ndarray, y_pred: np.ndarray, nan_policy: str = "propagate"
+) -> dict[str, float]:
+    return accuracy(y_true, y_pred, nan_policy=nan_policy)
+
+
+######################################
+#     Tests for bootstrap_metric     #
+######################################
+
+
+@pytest.mark.parametrize("method", ["multinomial", "poisson"])
+def test_bootstrap_metric_confmat(method: str) -> None:
+    out = bootstrap_metric(accuracy, Y_TRUE, Y_PRED, n_resamples=100, method=method, seed=42)
+    assert list(out) == [
+        "accuracy",
+        "accuracy_ci_low",
+        "accuracy_ci_high",
+        "count_correct",
+        "count_incorrect",
+        "count",
+        "error",
+        "error_ci_low",
+        "error_ci_high",
+    ]
+    assert objects_are_allclose(
+        {key: out[key] for key in ["accuracy", "count_correct", "count", "error"]},
+        {"accuracy": 0.8, "count_correct": 160, "count": 200, "error": 0.2},
+    )
+    assert out["accuracy_ci_low"] < 0.8 < out["accuracy_ci_high"]
+    assert objects_are_allclose(out["accuracy_ci_low"], 1.0 - out["error_ci_high"])
+
+
+@pytest.mark.parametrize("method", ["multinomial", "poisson"])
+def test_bootstrap_metric_confmat_same_as_resampling(method: str) -> None:
+    # The resampled confusion matrices follow the same distribution as the
+    # confusion matrices of the resampled arrays.
+    out1 = bootstrap_metric(accuracy, Y_TRUE, Y_PRED, n_resamples=2000, method=method, seed=0)
+    out2 = bootstrap_metric(
+        accuracy_without_confmat, Y_TRUE, Y_PRED, n_resamples=2000, method=method, seed=1
+    )
+    assert objects_are_allclose(out1["accuracy_ci_low"], out2["accuracy_ci_low"], atol=0.02)
+    assert objects_are_allclose(out1["accuracy_ci_high"], out2["accuracy_ci_high"], atol=0.02)
+
+
+def test_bootstrap_metric_binary_label_type() -> None:
+    out = bootstrap_metric(binary_precision, Y_TRUE, Y_PRED, n_resamples=50, seed=42)
+    assert objects_are_allclose(out["precision"], 0.8333333333333334)
+    assert out["precision_ci_low"] < out["precision"] < out["precision_ci_high"]
+
+
+def test_bootstrap_metric_multiclass_label_type() -> None:
+    out = bootstrap_metric(
+        multiclass_recall,
+        np.array([0, 1, 2, 0, 1, 2] * 20),
+        np.array([0, 1, 1, 0, 2, 2] * 20),
+        n_resamples=50,
+        seed=42,
+    )
+    assert objects_are_allclose(out["macro_recall"], 2 / 3)
+    assert out["macro_recall_ci_low"] < out["macro_recall"] < out["macro_recall_ci_high"]
+
+
+def test_bootstrap_metric_label_type_binary() -> None:
+    out = bootstrap_metric(
+        binary_precision, Y_TRUE, Y_PRED, n_resamples=50, label_type="binary", seed=42
+    )
+    assert objects_are_allclose(out["precision"], 0.8333333333333334)
+
+
+def test_bootstrap_metric_multilabel() -> None:
+    y_true = np.array([[1, 0], [0, 1], [1, 1], [0, 0]] * 10)
+    y_pred = np.array([[1, 0], [0, 0], [1, 1], [1, 0]] * 10)
+    out = bootstrap_metric(multilabel_precision, y_true, y_pred, n_resamples=50, seed=42)
+    assert objects_are_allclose(out["macro_precision"], 0.8333333333333333)
+    assert out["macro_precision_ci_low"] <= out["macro_precision_ci_high"]
+
+
+@pytest.mark.parametrize("method", ["multinomial", "poisson"])
+def test_bootstrap_metric_ranking(method: str) -> None:
+    out = bootstrap_metric(binary_roc_auc, Y_TRUE, Y_SCORE, n_resamples=100, method=method, seed=42)
+    assert list(out) == ["count", "roc_auc", "roc_auc_ci_low", "roc_auc_ci_high"]
+    assert objects_are_allclose(out["roc_auc"], 0.875)
+    assert out["roc_auc_ci_low"] < 0.875 < out["roc_auc_ci_high"]
+
+
+def test_bootstrap_metric_ranking_average_precision() -> None:
+    out = bootstrap_metric(binary_average_precision, Y_TRUE, Y_SCORE, n_resamples=100, seed=42)
+    assert objects_are_allclose(out["average_precision"], 0.9305555555555556)
+    assert out["average_precision_ci_low"] < 0.93 < out["average_precision_ci_high"]
+
+
+def test_bootstrap_metric_ranking_n_bins() -> None:
+    out = bootstrap_metric(binary_roc_auc, Y_TRUE, Y_SCORE, n_resamples=100, n_bins=10, seed=42)
+    assert objects_are_allclose(
+        out,
+        bootstrap_metric(binary_roc_auc, Y_TRUE, Y_SCORE, n_resamples=100, seed=42),
+    )
+
+
+def test_bootstrap_metric_resampling() -> None:
+    y_true = np.arange(100, dtype=float)
+    out = bootstrap_metric(mean_squared_error, y_true, y_true + 1.0, n_resamples=20, seed=42)
+    assert objects_are_allclose(
+        out,
+        {
+            "count": 100,
+            "mean_squared_error": 1.0,
+            "mean_squared_error_ci_low": 1.0,
+            "mean_squared_error_ci_high": 1.0,
+        },
+    )
+
+
+def test_bootstrap_metric_result() -> None:
+    out = bootstrap_metric(AccuracyResult, Y_TRUE, Y_PRED, n_resamples=50, seed=42)
+    assert objects_are_allclose(out["accuracy"], 0.8)
+    assert out["accuracy_ci_low"] < 0.8 < out["accuracy_ci_high"]
+
+
+def test_bootstrap_metric_result_binary_label_type() -> None:
+    out = bootstrap_metric(BinaryPrecisionResult, Y_TRUE, Y_PRED, n_resamples=50, seed=42)
+    assert objects_are_allclose(out["precision"], 0.8333333333333334)
+    assert out["precision_ci_low"] < out["precision"] < out["precision_ci_high"]
+
+
+def test_bootstrap_metric_single_class_binary() -> None:
+    y = np.zeros(50, dtype=int)
+    assert objects_are_equal(
+        bootstrap_metric(binary_precision, y, y, n_resamples=20, seed=0),
+        bootstrap_metric(BinaryPrecisionResult, y, y, n_resamples=20, seed=0),
+    )
+    out = bootstrap_metric(BinaryPrecisionResult, y, y, n_resamples=20, seed=0)
+    assert out["precision"] == binary_precision(y, y)["precision"] == 0.0
+    assert out["precision_ci_low"] == out["precision_ci_high"] == 0.0
+
+
+def test_bootstrap_metric_single_class_binary_confusion_matrix() -> None:
+    y = np.zeros(50, dtype=int)
+    out = bootstrap_metric(BinaryConfusionMatrixResult, y, y, n_resamples=20, seed=0)
+    assert objects_are_equal(out["confusion_matrix"], np.array([[50, 0], [0, 0]]))
+    assert out["true_negative_rate"] == 1.0
+
+
+@pytest.mark.parametrize(
+    ("metric", "label_type"),
+    [
+        (binary_precision, "binary"),
+        (multiclass_recall, "multiclass"),
+        (multilabel_precision, "multilabel"),
+        (accuracy, "multiclass"),
+        (BinaryPrecisionResult, "binary"),
+        (BinaryConfusionMatrixResult, "binary"),
+        (MulticlassRecallResult, "multiclass"),
+        (MultilabelPrecisionResult, "multilabel"),
+        (AccuracyResult, "multiclass"),
+        (partial(BinaryPrecisionResult), "binary"),
+    ],
+)
+def test_find_label_type_auto(metric: callable, label_type: str) -> None:
+    assert _find_label_type(metric, "auto") == label_type
+
+
+def test_find_label_type_attribute() -> None:
+    def metric(y_true: np.ndarray, y_pred: np.ndarray) -> dict:
+        return accuracy(y_true, y_pred)
+
+    metric.label_type = "binary"
+    assert _find_label_type(metric, "auto") == "binary"
+
+
+def test_find_label_type_explicit() -> None:
+    assert _find_label_type(BinaryPrecisionResult, "multiclass") == "multiclass"
+
+
+def test_bootstrap_metric_partial() -> None:
+    out = bootstrap_metric(partial(binary_precision, prefix="p_"), Y_TRUE, Y_PRED, seed=42)
+    assert out["p_precision_ci_low"] < out["p_precision"] < out["p_precision_ci_high"]
+
+
+def test_bootstrap_metric_prefix_suffix() -> None:
+    out = bootstrap_metric(
+        binary_roc_auc, Y_TRUE, Y_SCORE, n_resamples=10, prefix="prefix_", suffix="_suffix"
+    )
+    assert list(out) == [
+        "prefix_count_suffix",
+        "prefix_roc_auc_suffix",
+        "prefix_roc_auc_ci_low_suffix",
+        "prefix_roc_auc_ci_high_suffix",
+    ]
+
+
+def test_bootstrap_metric_confidence_level() -> None:
+    out1 = bootstrap_metric(accuracy, Y_TRUE, Y_PRED, confidence_level=0.5, seed=42)
+    out2 = bootstrap_metric(accuracy, Y_TRUE, Y_PRED, confidence_level=0.99, seed=42)
+    assert out2["accuracy_ci_low"] < out1["accuracy_ci_low"]
+    assert out1["accuracy_ci_high"] < out2["accuracy_ci_high"]
+
+
+@pytest.mark.parametrize("metric", [accuracy, binary_roc_auc, accuracy_without_confmat])
+def test_bootstrap_metric_seed(metric: callable) -> None:
+    assert objects_are_equal(
+        bootstrap_metric(metric, Y_TRUE, Y_SCORE, n_resamples=20, seed=42),
+        bootstrap_metric(metric, Y_TRUE, Y_SCORE, n_resamples=20, seed=42),
+    )
+
+
+def test_bootstrap_metric_different_seeds() -> None:
+    assert not objects_are_equal(
+        bootstrap_metric(binary_roc_auc, Y_TRUE, Y_SCORE, n_resamples=20, seed=1),
+        bootstrap_metric(binary_roc_auc, Y_TRUE, Y_SCORE, n_resamples=20, seed=2),
+    )
+
+
+@pytest.mark.parametrize("metric", [accuracy, binary_roc_auc])
+def test_bootstrap_metric_n_jobs(metric: callable) -> None:
+    assert objects_are_equal(
+        bootstrap_metric(metric, Y_TRUE, Y_SCORE, n_resamples=20, seed=42, n_jobs=2),
+        bootstrap_metric(metric, Y_TRUE, Y_SCORE, n_resamples=20, seed=42),
+    )
+
+
+def test_bootstrap_metric_nan_propagate() -> None:
+    out = bootstrap_metric(
+        accuracy, np.array([1.0, 0.0, NAN, 1.0]), np.array([1.0, 0.0, 1.0, 0.0]), n_resamples=10
+    )
+    assert objects_are_equal(
+        {key: out[key] for key in ["accuracy", "accuracy_ci_low", "accuracy_ci_high"]},
+        {"accuracy": NAN, "accuracy_ci_low": NAN, "accuracy_ci_high": NAN},
+        equal_nan=True,
+    )
+
+
+def test_bootstrap_metric_nan_omit() -> None:
+    out = bootstrap_metric(
+        binary_roc_auc,
+        np.array([1.0, 0.0, NAN, 1.0, 0.0]),
+        np.array([0.9, 0.1, 0.5, 0.8, NAN]),
+        n_resamples=10,
+        nan_policy="omit",
+        seed=42,
+    )
+    assert objects_are_equal(
+        out, {"count": 3, "roc_auc": 1.0, "roc_auc_ci_low": 1.0, "roc_auc_ci_high": 1.0}
+    )
+
+
+def test_bootstrap_metric_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        bootstrap_metric(accuracy, np.array([1.0, NAN]), np.array([1.0, 0.0]), nan_policy="raise")
+
+
+def test_bootstrap_metric_empty() -> None:
+    out = bootstrap_metric(binary_roc_auc, np.array([]), np.array([]), n_resamples=10)
+    assert objects_are_equal(
+        out,
+        {"count": 0, "roc_auc": NAN, "roc_auc_ci_low": NAN, "roc_auc_ci_high": NAN},
+        equal_nan=True,
+    )
+
+
+def test_bootstrap_metric_incorrect_method() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'method': incorrect"):
+        bootstrap_metric(accuracy, Y_TRUE, Y_PRED, method="incorrect")
+
+
+def test_bootstrap_metric_incorrect_label_type() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'label_type': incorrect"):
+        bootstrap_metric(accuracy, Y_TRUE, Y_PRED, label_type="incorrect")
+
+
+@pytest.mark.parametrize("n_resamples", [0, -1])
+def test_bootstrap_metric_incorrect_n_resamples(n_resamples: int) -> None:
+    with pytest.raises(ValueError, match="Incorrect 'n_resamples'"):
+        bootstrap_metric(accuracy, Y_TRUE, Y_PRED, n_resamples=n_resamples)
+
+
+@pytest.mark.parametrize("confidence_level", [0.0, 1.0, 1.5])
+def test_bootstrap_metric_incorrect_confidence_level(confidence_level: float) -> None:
+    with pytest.raises(ValueError, match="Incorrect 'confidence_level'"):
+        bootstrap_metric(accuracy, Y_TRUE, Y_PRED, confidence_level=confidence_level)
+
+
+############################################
+#     Tests for check_bootstrap_method     #
+############################################
+
+
+@pytest.mark.parametrize("method", ["multinomial", "poisson"])
+def test_check_bootstrap_method_valid(method: str) -> None:
+    check_bootstrap_method(method)
+
+
+def test_check_bootstrap_method_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'method': incorrect"):
+        check_bootstrap_method("incorrect")
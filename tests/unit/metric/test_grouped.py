@@ -0,0 +1,539 @@
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+from polars.testing import assert_frame_equal
+from sklearn import metrics
+
+from arkas.metric import (
+    GroupSegments,
+    factorize_groups,
+    grouped_classification_metrics,
+    grouped_ranking_metrics,
+    grouped_regression_metrics,
+)
+
+NAN = float("nan")
+
+
+def assert_same_as_sklearn(
+    frame: pl.DataFrame, groups: np.ndarray, y_true: np.ndarray, y_pred: np.ndarray, funcs: dict
+) -> None:
+    for row in frame.iter_rows(named=True):
+        mask = groups == row["group"]
+        assert row["count"] == mask.sum()
+        for name, func in funcs.items():
+            assert objects_are_allclose(row[name], float(func(y_true[mask], y_pred[mask])))
+
+
+######################################
+#     Tests for factorize_groups     #
+######################################
+
+
+def test_factorize_groups_1_column() -> None:
+    assert objects_are_equal(
+        factorize_groups({"group": np.array(["b", "a", "c", "a"])}),
+        (np.array([1, 0, 2, 0]), {"group": np.array(["a", "b", "c"])}),
+    )
+
+
+def test_factorize_groups_2_columns() -> None:
+    assert objects_are_equal(
+        factorize_groups(
+            {"country": np.array(["fr", "us", "fr", "us"]), "device": np.array([1, 1, 2, 1])}
+        ),
+        (
+            np.array([0, 2, 1, 2]),
+            {"country": np.array(["fr", "fr", "us"]), "device": np.array([1, 2, 1])},
+        ),
+    )
+
+
+def test_factorize_groups_3_columns() -> None:
+    codes, keys = factorize_groups(
+        {
+            "a": np.array([1, 1, 1, 1, 2]),
+            "b": np.array([1, 1, 2, 2, 1]),
+            "c": np.array([1, 2, 1, 1, 1]),
+        }
+    )
+    assert objects_are_equal(codes, np.array([0, 1, 2, 2, 3]))
+    assert objects_are_equal(
+        keys,
+        {"a": np.array([1, 1, 1, 2]), "b": np.array([1, 1, 2, 1]), "c": np.array([1, 2, 1, 1])},
+    )
+
+
+def test_factorize_groups_object() -> None:
+    codes, keys = factorize_groups({"group": np.array(["b", "a", "b"], dtype=object)})
+    assert objects_are_equal(codes, np.array([1, 0, 1]))
+    assert keys["group"].tolist() == ["a", "b"]
+
+
+def test_factorize_groups_null() -> None:
+    codes, keys = factorize_groups(
+        {
+            "country": np.array(["fr", None, "us", "fr", None], dtype=object),
+            "device": np.array([1, 2, 1, 1, 1]),
+        }
+    )
+    assert objects_are_equal(codes, np.array([2, 1, 3, 2, 0]))
+    assert keys["country"].tolist() == [None, None, "fr", "us"]
+    assert objects_are_equal(keys["device"], np.array([1, 2, 1, 1]))
+
+
+def test_factorize_groups_null_first() -> None:
+    codes, keys = factorize_groups({"group": np.array([None, "b", "a", None], dtype=object)})
+    assert objects_are_equal(codes, np.array([0, 2, 1, 0]))
+    assert keys["group"].tolist() == [None, "a", "b"]
+
+
+def test_factorize_groups_empty_rows() -> None:
+    codes, keys = factorize_groups({"group": np.array([], dtype=int)})
+    assert codes.shape == (0,)
+    assert keys["group"].shape == (0,)
+
+
+def test_factorize_groups_empty() -> None:
+    with pytest.raises(ValueError, match="'groups' cannot be empty"):
+        factorize_groups({})
+
+
+def test_factorize_groups_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="arrays have different shapes"):
+        factorize_groups({"a": np.array([1, 2, 3]), "b": np.array([1, 2])})
+
+
+###################################
+#     Tests for GroupSegments     #
+###################################
+
+
+def test_group_segments() -> None:
+    segments = GroupSegments(
+        groups={"group": np.array([2, 1, 2, 1])},
+        arrays=[np.array([1, 2, 3, 4]), np.array([5, 6, 7, 8])],
+    )
+    assert segments.num_groups == 2
+    assert objects_are_equal(segments.codes, np.array([1, 0, 1, 0]))
+    assert objects_are_equal(segments.arrays, [np.array([1, 2, 3, 4]), np.array([5, 6, 7, 8])])
+
+
+def test_group_segments_to_frame() -> None:
+    segments = GroupSegments(
+        groups={"group": np.array([2, 1, 2, 1])},
+        arrays=[np.array([1, 2, 3, 4]), np.array([5, 6, 7, 8])],
+    )
+    assert_frame_equal(
+        segments.to_frame({"metric": np.array([0.5, 1.0])}, prefix="p_", suffix="_s"),
+        pl.DataFrame(
+            {"group": [1, 2], "p_count_s": [2, 2], "p_metric_s": [0.5, 1.0]},
+            schema={"group": pl.Int64, "p_count_s": pl.Int64, "p_metric_s": pl.Float64},
+        ),
+    )
+
+
+def test_group_segments_nan_propagate() -> None:
+    segments = GroupSegments(
+        groups={"group": np.array([1, 1, 2, 2])},
+        arrays=[np.array([1.0, NAN, 3.0, 4.0]), np.array([5.0, 6.0, 7.0, 8.0])],
+    )
+    assert objects_are_equal(segments.codes, np.array([0, 1, 1]))
+    assert objects_are_equal(
+        segments.to_frame({"metric": np.array([0.5, 1.0])}),
+        pl.DataFrame({"group": [1, 2], "count": [2, 2], "metric": [NAN, 1.0]}),
+        equal_nan=True,
+    )
+
+
+def test_group_segments_nan_omit() -> None:
+    segments = GroupSegments(
+        groups={"group": np.array([1, 1, 2, 2])},
+        arrays=[np.array([1.0, NAN, 3.0, 4.0]), np.array([5.0, 6.0, 7.0, NAN])],
+        nan_policy="omit",
+    )
+    assert objects_are_equal(segments.arrays, [np.array([1.0, 3.0]), np.array([5.0, 7.0])])
+    assert objects_are_equal(
+        segments.to_frame({"metric": np.array([0.5, 1.0])}),
+        pl.DataFrame({"group": [1, 2], "count": [1, 1], "metric": [0.5, 1.0]}),
+    )
+
+
+def test_group_segments_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_score' contains at least one NaN value"):
+        GroupSegments(
+            groups={"group": np.array([1, 2])},
+            arrays=[np.array([1.0, 0.0]), np.array([NAN, 1.0])],
+            nan_policy="raise",
+            names=["y_true", "y_score"],
+        )
+
+
+def test_group_segments_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        GroupSegments(
+            groups={"group": np.array([1, 2])},
+            arrays=[np.array([1, 0]), np.array([1, 0])],
+            nan_policy="incorrect",
+        )
+
+
+def test_group_segments_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="arrays have different shapes"):
+        GroupSegments(
+            groups={"group": np.array([1, 2, 3])}, arrays=[np.array([1, 0]), np.array([1, 0])]
+        )
+
+
+####################################################
+#     Tests for grouped_classification_metrics     #
+####################################################
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_grouped_classification_metrics_binary_same_as_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    groups = rng.integers(0, 20, size=500)
+    y_true, y_pred = rng.integers(0, 2, size=500), rng.integers(0, 2, size=500)
+    frame = grouped_classification_metrics({"group": groups}, y_true=y_true, y_pred=y_pred)
+    assert frame.shape == (20, 7)
+    assert_same_as_sklearn(
+        frame,
+        groups,
+        y_true,
+        y_pred,
+        funcs={
+            "accuracy": metrics.accuracy_score,
+            "balanced_accuracy": metrics.balanced_accuracy_score,
+            "precision": metrics.precision_score,
+            "recall": metrics.recall_score,
+            "f1": metrics.f1_score,
+        },
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_grouped_classification_metrics_multiclass_same_as_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    groups = rng.integers(0, 20, size=500)
+    y_true, y_pred = rng.integers(0, 5, size=500), rng.integers(0, 5, size=500)
+    frame = grouped_classification_metrics({"group": groups}, y_true=y_true, y_pred=y_pred)
+    assert frame.shape == (20, 7)
+    assert_same_as_sklearn(
+        frame,
+        groups,
+        y_true,
+        y_pred,
+        funcs={
+            "accuracy": metrics.accuracy_score,
+            "balanced_accuracy": metrics.balanced_accuracy_score,
+            "macro_precision": lambda y_true, y_pred: metrics.precision_score(
+                y_true, y_pred, average="macro", zero_division=0.0
+            ),
+            "macro_recall": lambda y_true, y_pred: metrics.recall_score(
+                y_true, y_pred, average="macro", zero_division=0.0
+            ),
+            "macro_f1": lambda y_true, y_pred: metrics.f1_score(
+                y_true, y_pred, average="macro", zero_division=0.0
+            ),
+        },
+    )
+
+
+def test_grouped_classification_metrics_many_groups_and_classes() -> None:
+    # The dense confusion matrices would have 30k * 100 * 100 cells.
+    rng = np.random.default_rng(42)
+    groups = rng.integers(0, 30_000, size=60_000)
+    y_true, y_pred = rng.integers(0, 100, size=60_000), rng.integers(0, 100, size=60_000)
+    frame = grouped_classification_metrics({"group": groups}, y_true=y_true, y_pred=y_pred)
+    assert frame["count"].sum() == 60_000
+    mask = groups == frame["group"][0]
+    assert objects_are_allclose(
+        frame["macro_f1"][0],
+        float(metrics.f1_score(y_true[mask], y_pred[mask], average="macro", zero_division=0.0)),
+    )
+
+
+def test_grouped_classification_metrics_binary() -> None:
+    assert_frame_equal(
+        grouped_classification_metrics(
+            groups={"country": np.array(["fr", "fr", "fr", "us", "us", "us"])},
+            y_true=np.array([1, 0, 1, 0, 0, 0]),
+            y_pred=np.array([1, 0, 1, 1, 0, 0]),
+            prefix="p_",
+            suffix="_s",
+        ),
+        pl.DataFrame(
+            {
+                "country": ["fr", "us"],
+                "p_count_s": [3, 3],
+                "p_accuracy_s": [1.0, 2 / 3],
+                "p_balanced_accuracy_s": [1.0, 2 / 3],
+                "p_precision_s": [1.0, 0.0],
+                "p_recall_s": [1.0, 0.0],
+                "p_f1_s": [1.0, 0.0],
+            }
+        ),
+    )
+
+
+def test_grouped_classification_metrics_label_type_multiclass() -> None:
+    frame = grouped_classification_metrics(
+        groups={"group": np.array([1, 1, 2, 2])},
+        y_true=np.array([1, 0, 1, 1]),
+        y_pred=np.array([1, 0, 1, 0]),
+        label_type="multiclass",
+    )
+    assert frame.columns == [
+        "group",
+        "count",
+        "accuracy",
+        "balanced_accuracy",
+        "macro_precision",
+        "macro_recall",
+        "macro_f1",
+    ]
+    assert objects_are_allclose(frame["macro_recall"].to_list(), [1.0, 0.25])
+
+
+def test_grouped_classification_metrics_nan_propagate() -> None:
+    frame = grouped_classification_metrics(
+        groups={"group": np.array([1, 1, 2, 2])},
+        y_true=np.array([1.0, 0.0, 1.0, 1.0]),
+        y_pred=np.array([1.0, NAN, 1.0, 0.0]),
+    )
+    assert objects_are_equal(frame["count"].to_list(), [2, 2])
+    assert objects_are_equal(frame["accuracy"].to_list(), [NAN, 0.5], equal_nan=True)
+
+
+def test_grouped_classification_metrics_nan_omit() -> None:
+    frame = grouped_classification_metrics(
+        groups={"group": np.array([1, 1, 2, 2])},
+        y_true=np.array([1.0, 0.0, 1.0, 1.0]),
+        y_pred=np.array([1.0, NAN, 1.0, 0.0]),
+        nan_policy="omit",
+    )
+    assert objects_are_equal(frame["count"].to_list(), [1, 2])
+    assert objects_are_equal(frame["accuracy"].to_list(), [1.0, 0.5])
+
+
+def test_grouped_classification_metrics_nan_raise() -> None:
+    with pytest.raises(ValueError, match="'y_pred' contains at least one NaN value"):
+        grouped_classification_metrics(
+            groups={"group": np.array([1, 2])},
+            y_true=np.array([1.0, 0.0]),
+            y_pred=np.array([1.0, NAN]),
+            nan_policy="raise",
+        )
+
+
+def test_grouped_classification_metrics_multilabel() -> None:
+    with pytest.raises(ValueError, match="do not support multilabel"):
+        grouped_classification_metrics(
+            groups={"group": np.array([1, 2])},
+            y_true=np.array([1, 0]),
+            y_pred=np.array([1, 0]),
+            label_type="multilabel",
+        )
+
+
+def test_grouped_classification_metrics_incorrect_label_type() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'label_type': incorrect"):
+        grouped_classification_metrics(
+            groups={"group": np.array([1, 2])},
+            y_true=np.array([1, 0]),
+            y_pred=np.array([1, 0]),
+            label_type="incorrect",
+        )
+
+
+#############################################
+#     Tests for grouped_ranking_metrics     #
+#############################################
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_grouped_ranking_metrics_same_as_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    groups = rng.integers(0, 20, size=1000)
+    y_true = rng.integers(0, 2, size=1000)
+    # Round the scores to have tied scores.
+    y_score = np.round(rng.random(size=1000), decimals=1)
+    frame = grouped_ranking_metrics({"group": groups}, y_true=y_true, y_score=y_score)
+    assert frame.shape == (20, 4)
+    assert_same_as_sklearn(
+        frame,
+        groups,
+        y_true,
+        y_score,
+        funcs={
+            "average_precision": metrics.average_precision_score,
+            "roc_auc": metrics.roc_auc_score,
+        },
+    )
+
+
+def test_grouped_ranking_metrics() -> None:
+    assert_frame_equal(
+        grouped_ranking_metrics(
+            groups={"country": np.array(["fr", "fr", "fr", "us", "us", "us"])},
+            y_true=np.array([1, 0, 1, 1, 0, 0]),
+            y_score=np.array([0.9, 0.1, 0.4, 0.2, 0.8, 0.1]),
+            prefix="p_",
+            suffix="_s",
+        ),
+        pl.DataFrame(
+            {
+                "country": ["fr", "us"],
+                "p_count_s": [3, 3],
+                "p_average_precision_s": [1.0, 0.5],
+                "p_roc_auc_s": [1.0, 0.5],
+            }
+        ),
+    )
+
+
+def test_grouped_ranking_metrics_one_class() -> None:
+    frame = grouped_ranking_metrics(
+        groups={"group": np.array([1, 1, 2, 2])},
+        y_true=np.array([0, 0, 1, 1]),
+        y_score=np.array([0.2, 0.1, 0.3, 0.4]),
+    )
+    assert objects_are_equal(frame["average_precision"].to_list(), [0.0, 1.0])
+    assert objects_are_equal(frame["roc_auc"].to_list(), [NAN, NAN], equal_nan=True)
+
+
+def test_grouped_ranking_metrics_nan_omit() -> None:
+    frame = grouped_ranking_metrics(
+        groups={"group": np.array([1, 1, 1, 2, 2])},
+        y_true=np.array([1, 0, 0, 1, 0]),
+        y_score=np.array([0.1, 0.2, NAN, 0.5, 0.3]),
+        nan_policy="omit",
+    )
+    assert objects_are_equal(frame["count"].to_list(), [2, 2])
+    assert objects_are_equal(frame["roc_auc"].to_list(), [0.0, 1.0])
+
+
+def test_grouped_ranking_metrics_nan_propagate() -> None:
+    frame = grouped_ranking_metrics(
+        groups={"group": np.array([1, 1, 1, 2, 2])},
+        y_true=np.array([1, 0, 0, 1, 0]),
+        y_score=np.array([0.1, 0.2, NAN, 0.5, 0.3]),
+    )
+    assert objects_are_equal(frame["count"].to_list(), [3, 2])
+    assert objects_are_equal(frame["roc_auc"].to_list(), [NAN, 1.0], equal_nan=True)
+
+
+################################################
+#     Tests for grouped_regression_metrics     #
+################################################
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_grouped_regression_metrics_same_as_sklearn(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    groups = rng.integers(0, 20, size=500)
+    y_true = rng.normal(size=500)
+    y_pred = y_true + rng.normal(size=500)
+    frame = grouped_regression_metrics({"group": groups}, y_true=y_true, y_pred=y_pred)
+    assert frame.shape == (20, 6)
+    assert_same_as_sklearn(
+        frame,
+        groups,
+        y_true,
+        y_pred,
+        funcs={
+            "mean_absolute_error": metrics.mean_absolute_error,
+            "mean_squared_error": metrics.mean_squared_error,
+            "root_mean_squared_error": metrics.root_mean_squared_error,
+            "r2_score": metrics.r2_score,
+        },
+    )
+
+
+def test_grouped_regression_metrics() -> None:
+    assert_frame_equal(
+        grouped_regression_metrics(
+            groups={"country": np.array(["fr", "fr", "fr", "us", "us", "us"])},
+            y_true=np.array([1, 2, 3, 4, 5, 6]),
+            y_pred=np.array([1, 2, 4, 4, 3, 6]),
+            prefix="p_",
+            suffix="_s",
+        ),
+        pl.DataFrame(
+            {
+                "country": ["fr", "us"],
+                "p_count_s": [3, 3],
+                "p_mean_absolute_error_s": [1 / 3, 2 / 3],
+                "p_mean_squared_error_s": [1 / 3, 4 / 3],
+                "p_root_mean_squared_error_s": [np.sqrt(1 / 3), np.sqrt(4 / 3)],
+                "p_r2_score_s": [0.5, -1.0],
+            }
+        ),
+    )
+
+
+def test_grouped_regression_metrics_narrow_dtypes() -> None:
+    groups = {"country": np.array(["fr", "fr", "fr", "us", "us", "us"])}
+    assert_frame_equal(
+        grouped_regression_metrics(
+            groups=groups,
+            y_true=np.array([1, 0, 1, 1, 0, 0], dtype=np.int8),
+            y_pred=np.array([True, False, False, True, True, False]),
+        ),
+        grouped_regression_metrics(
+            groups=groups,
+            y_true=np.array([1.0, 0.0, 1.0, 1.0, 0.0, 0.0]),
+            y_pred=np.array([1.0, 0.0, 0.0, 1.0, 1.0, 0.0]),
+        ),
+    )
+
+
+def test_grouped_regression_metrics_r2_edge_cases() -> None:
+    frame = grouped_regression_metrics(
+        groups={"group": np.array([1, 2, 2, 3, 3])},
+        y_true=np.array([1.0, 2.0, 2.0, 3.0, 3.0]),
+        y_pred=np.array([1.0, 2.0, 2.0, 3.0, 4.0]),
+    )
+    assert objects_are_equal(frame["r2_score"].to_list(), [NAN, 1.0, 0.0], equal_nan=True)
+
+
+def test_grouped_regression_metrics_multiple_groups() -> None:
+    frame = grouped_regression_metrics(
+        groups={"a": np.array([1, 1, 2, 2]), "b": np.array(["x", "y", "x", "x"])},
+        y_true=np.array([1.0, 2.0, 3.0, 4.0]),
+        y_pred=np.array([1.0, 3.0, 3.0, 6.0]),
+    )
+    assert frame["a"].to_list() == [1, 1, 2]
+    assert frame["b"].to_list() == ["x", "y", "x"]
+    assert objects_are_equal(frame["mean_absolute_error"].to_list(), [0.0, 1.0, 1.0])
+
+
+def test_grouped_regression_metrics_nan_omit() -> None:
+    frame = grouped_regression_metrics(
+        groups={"group": np.array([1, 1, 2, 2])},
+        y_true=np.array([1.0, NAN, 3.0, 4.0]),
+        y_pred=np.array([2.0, 2.0, 3.0, 4.0]),
+        nan_policy="omit",
+    )
+    assert objects_are_equal(frame["count"].to_list(), [1, 2])
+    assert objects_are_equal(frame["mean_absolute_error"].to_list(), [1.0, 0.0])
+
+
+def test_grouped_regression_metrics_nan_propagate() -> None:
+    frame = grouped_regression_metrics(
+        groups={"group": np.array([1, 1, 2, 2])},
+        y_true=np.array([1.0, NAN, 3.0, 4.0]),
+        y_pred=np.array([2.0, 2.0, 3.0, 4.0]),
+    )
+    assert objects_are_equal(frame["mean_absolute_error"].to_list(), [NAN, 0.0], equal_nan=True)
+
+
+def test_grouped_regression_metrics_empty() -> None:
+    frame = grouped_regression_metrics(
+        groups={"group": np.array([])}, y_true=np.array([]), y_pred=np.array([])
+    )
+    assert frame.shape == (0, 6)
@@ -5,6 +5,8 @@ import pytest
 from coola import objects_are_equal
 
 from arkas.metric.utils import (
+    PreparedInputs,
+    arrays_are_equal,
     check_array_ndim,
     check_label_type,
     check_nan_policy,
@@ -13,14 +15,23 @@ from arkas.metric.utils import (
     check_same_shape_pred,
     check_same_shape_score,
     contains_nan,
+    is_sparse,
     multi_isnan,
+    prepare_inputs,
     preprocess_pred,
     preprocess_pred_multilabel,
     preprocess_same_shape_arrays,
     preprocess_score_binary,
     preprocess_score_multiclass,
     preprocess_score_multilabel,
+    preprocess_sparse_multilabel,
+    safe_divide,
 )
+from arkas.testing import scipy_available
+from arkas.utils.imports import is_scipy_available
+
+if is_scipy_available():
+    from scipy import sparse
 
 NAN_POLICIES = ["omit", "propagate", "raise"]
 
@@ -986,3 +997,328 @@ def test_preprocess_score_multilabel_incorrect_ndim_y_true() -> None:
         RuntimeError, match="'y_true' must be a 1d or 2d array but received an array of shape"
     ):
         preprocess_score_multilabel(y_true=np.ones((5, 3, 1)), y_score=np.ones((5, 3)))
+
+
+######################################
+#     Tests for arrays_are_equal     #
+######################################
+
+
+def test_arrays_are_equal_true() -> None:
+    assert arrays_are_equal(np.array([1, 0, 1]), np.array([1, 0, 1]))
+
+
+def test_arrays_are_equal_false() -> None:
+    assert not arrays_are_equal(np.array([1, 0, 1]), np.array([1, 0, 0]))
+
+
+@scipy_available
+def test_arrays_are_equal_sparse_true() -> None:
+    assert arrays_are_equal(
+        sparse.csr_array(np.array([[1, 0], [0, 1]])), sparse.csr_array(np.eye(2, dtype=int))
+    )
+
+
+@scipy_available
+def test_arrays_are_equal_sparse_explicit_zeros() -> None:
+    assert arrays_are_equal(
+        sparse.csr_array((np.array([1, 0]), (np.array([0, 1]), np.array([0, 1]))), shape=(2, 2)),
+        sparse.csr_array(np.array([[1, 0], [0, 0]])),
+    )
+
+
+@scipy_available
+def test_arrays_are_equal_sparse_false() -> None:
+    assert not arrays_are_equal(
+        sparse.csr_array(np.array([[1, 0], [0, 1]])), sparse.csr_array(np.array([[1, 0], [1, 1]]))
+    )
+
+
+@scipy_available
+def test_arrays_are_equal_sparse_different_shapes() -> None:
+    assert not arrays_are_equal(sparse.csr_array(np.eye(2)), sparse.csr_array(np.eye(3)))
+
+
+@scipy_available
+def test_arrays_are_equal_sparse_dense() -> None:
+    assert not arrays_are_equal(sparse.csr_array(np.eye(2)), np.eye(2))
+
+
+@scipy_available
+def test_arrays_are_equal_sparse_equal_nan() -> None:
+    arr = sparse.csr_array(np.array([[1.0, 0.0], [0.0, float("nan")]]))
+    assert not arrays_are_equal(arr, arr.copy())
+    assert arrays_are_equal(arr, arr.copy(), equal_nan=True)
+
+
+###############################
+#     Tests for is_sparse     #
+###############################
+
+
+def test_is_sparse_false() -> None:
+    assert not is_sparse(np.eye(3))
+
+
+@scipy_available
+def test_is_sparse_true() -> None:
+    assert is_sparse(sparse.csr_array(np.eye(3)))
+
+
+@scipy_available
+def test_is_sparse_matrix() -> None:
+    assert is_sparse(sparse.coo_matrix(np.eye(3)))
+
+
+@scipy_available
+def test_contains_nan_sparse() -> None:
+    assert contains_nan(sparse.csr_array(np.array([[1.0, 0.0], [0.0, float("nan")]])))
+
+
+@scipy_available
+def test_contains_nan_sparse_false() -> None:
+    assert not contains_nan(sparse.csr_array(np.eye(3)))
+
+
+##################################################
+#     Tests for preprocess_sparse_multilabel     #
+##################################################
+
+
+@scipy_available
+def test_preprocess_sparse_multilabel() -> None:
+    y_true, y_pred = preprocess_sparse_multilabel(
+        sparse.coo_array(np.array([[1, 0, 1], [0, 1, 0]])), np.array([[1, 0, 0], [0, 1, 1]])
+    )
+    assert isinstance(y_true, sparse.csr_array)
+    assert isinstance(y_pred, sparse.csr_array)
+    assert objects_are_equal(y_true.toarray(), np.array([[1, 0, 1], [0, 1, 0]]))
+    assert objects_are_equal(y_pred.toarray(), np.array([[1, 0, 0], [0, 1, 1]]))
+
+
+@scipy_available
+def test_preprocess_sparse_multilabel_1d() -> None:
+    y_true, y_pred = preprocess_sparse_multilabel(
+        sparse.csr_array(np.array([[1], [0], [1]])), np.array([1, 1, 0])
+    )
+    assert y_true.shape == (3, 1)
+    assert objects_are_equal(y_pred.toarray(), np.array([[1], [1], [0]]))
+
+
+@scipy_available
+def test_preprocess_sparse_multilabel_keep_nan() -> None:
+    y_true, y_pred = preprocess_sparse_multilabel(
+        sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 0, 1]])),
+        sparse.csr_array(np.array([[1, 0, 0], [0, float("nan"), 0], [0, 0, 1]])),
+    )
+    assert y_true.shape == (3, 3)
+    assert y_pred.shape == (3, 3)
+
+
+@scipy_available
+def test_preprocess_sparse_multilabel_drop_nan() -> None:
+    y_true, y_pred = preprocess_sparse_multilabel(
+        sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [float("nan"), 0, 1], [1, 1, 0]])),
+        sparse.csr_array(np.array([[1, 0, 0], [0, float("nan"), 0], [0, 0, 1], [1, 0, 0]])),
+        drop_nan=True,
+    )
+    assert objects_are_equal(y_true.toarray(), np.array([[1.0, 0.0, 1.0], [1.0, 1.0, 0.0]]))
+    assert objects_are_equal(y_pred.toarray(), np.array([[1.0, 0.0, 0.0], [1.0, 0.0, 0.0]]))
+
+
+@scipy_available
+def test_preprocess_sparse_multilabel_incorrect_shapes() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_pred' have different shapes"):
+        preprocess_sparse_multilabel(sparse.csr_array(np.eye(3)), sparse.csr_array(np.eye(2)))
+
+
+####################################
+#     Tests for prepare_inputs     #
+####################################
+
+
+def test_prepare_inputs() -> None:
+    prepared = prepare_inputs(y_true=np.array([1, 0, 0, 1]), y_pred=np.array([[0, 1], [0, 1]]))
+    assert objects_are_equal(prepared.y_true, np.array([1, 0, 0, 1]))
+    assert objects_are_equal(prepared.y_pred, np.array([0, 1, 0, 1]))
+    assert prepared.count == 4
+    assert not prepared.has_nan
+    assert prepared.is_valid
+
+
+@pytest.mark.parametrize("nan_policy", NAN_POLICIES)
+def test_prepare_inputs_same_as_preprocess_pred(nan_policy: str) -> None:
+    y_true = np.array([1, 0, 0, 1, 1, 2])
+    y_pred = np.array([0, 1, 0, 1, 1, 2])
+    prepared = prepare_inputs(y_true, y_pred, nan_policy=nan_policy)
+    assert objects_are_equal(
+        (prepared.y_true, prepared.y_pred),
+        preprocess_pred(y_true, y_pred, drop_nan=nan_policy == "omit"),
+    )
+
+
+def test_prepare_inputs_nan_propagate() -> None:
+    prepared = prepare_inputs(
+        y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+        y_pred=np.array([0, 1, 0, 1, 1, 1]),
+    )
+    assert prepared.count == 6
+    assert prepared.y_true_nan
+    assert not prepared.y_pred_nan
+    assert prepared.has_nan
+    assert not prepared.is_valid
+
+
+def test_prepare_inputs_nan_omit() -> None:
+    prepared = prepare_inputs(
+        y_true=np.array([1, 0, 0, 1, 1, float("nan")]),
+        y_pred=np.array([0, 1, 0, 1, float("nan"), 1]),
+        nan_policy="omit",
+    )
+    assert objects_are_equal(prepared.y_true, np.array([1.0, 0.0, 0.0, 1.0]))
+    assert objects_are_equal(prepared.y_pred, np.array([0.0, 1.0, 0.0, 1.0]))
+    assert not prepared.has_nan
+
+
+def test_prepare_inputs_nan_raise_y_true() -> None:
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        prepare_inputs(
+            y_true=np.array([1, 0, float("nan")]), y_pred=np.array([0, 1, 0]), nan_policy="raise"
+        )
+
+
+def test_prepare_inputs_nan_raise_y_score() -> None:
+    with pytest.raises(ValueError, match="'y_score' contains at least one NaN value"):
+        prepare_inputs(
+            y_true=np.array([1, 0, 1]),
+            y_pred=np.array([0, 1, float("nan")]),
+            nan_policy="raise",
+            pred_name="y_score",
+        )
+
+
+def test_prepare_inputs_incorrect_shapes() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_pred' have different shapes"):
+        prepare_inputs(y_true=np.array([1, 0, 0, 1]), y_pred=np.array([1, 0, 0]))
+
+
+def test_prepare_inputs_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        prepare_inputs(np.array([1, 0]), np.array([1, 0]), nan_policy="incorrect")
+
+
+def test_prepare_inputs_multilabel_drop_nan() -> None:
+    prepared = prepare_inputs(
+        y_true=np.array([[1, float("nan"), 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, 1]]),
+        y_pred=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1], [1, 0, float("nan")]]),
+        nan_policy="omit",
+        multilabel=True,
+    )
+    assert objects_are_equal(
+        prepared.y_true, np.array([[0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [1.0, 0.0, 1.0]])
+    )
+    assert objects_are_equal(
+        prepared.y_pred, np.array([[0.0, 1.0, 0.0], [0.0, 1.0, 0.0], [1.0, 0.0, 1.0]])
+    )
+    assert prepared.count == 3
+
+
+def test_prepare_inputs_multilabel_1d() -> None:
+    prepared = prepare_inputs(
+        y_true=np.array([1, 0, 1]), y_pred=np.array([1, 1, 0]), multilabel=True
+    )
+    assert prepared.y_true.shape == (3, 1)
+    assert prepared.y_pred.shape == (3, 1)
+
+
+@scipy_available
+def test_prepare_inputs_multilabel_sparse() -> None:
+    prepared = prepare_inputs(
+        y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 0, 1]])),
+        y_pred=sparse.csr_array(np.array([[1, 0, 0], [0, float("nan"), 0], [0, 0, 1]])),
+        nan_policy="omit",
+        multilabel=True,
+    )
+    assert isinstance(prepared.y_true, sparse.csr_array)
+    assert prepared.count == 2
+    assert not prepared.has_nan
+    assert objects_are_equal(prepared.labels, np.array([0.0, 1.0]))
+
+
+def test_prepare_inputs_trusted() -> None:
+    prepared = prepare_inputs(
+        y_true=np.array([1, 0, float("nan")]),
+        y_pred=np.array([0, 1, 0]),
+        nan_policy="raise",
+        trusted=True,
+    )
+    assert prepared.count == 3
+    assert not prepared.has_nan
+
+
+def test_prepare_inputs_empty() -> None:
+    prepared = prepare_inputs(y_true=np.array([]), y_pred=np.array([]))
+    assert prepared.count == 0
+    assert not prepared.is_valid
+
+
+####################################
+#     Tests for PreparedInputs     #
+####################################
+
+
+def test_prepared_inputs_repr() -> None:
+    assert repr(PreparedInputs(y_true=np.array([1, 0]), y_pred=np.array([0, 1]))).startswith(
+        "PreparedInputs("
+    )
+
+
+def test_prepared_inputs_labels() -> None:
+    prepared = PreparedInputs(y_true=np.array([5, 0, 0, 1]), y_pred=np.array([0, 1, 3, 1]))
+    assert objects_are_equal(prepared.labels, np.array([0, 1, 3, 5]))
+
+
+def test_prepared_inputs_dtype() -> None:
+    prepared = PreparedInputs(
+        y_true=np.array([1, 0], dtype=np.int32), y_pred=np.array([0.5, 1.0], dtype=np.float32)
+    )
+    assert prepared.dtype == np.float64
+    assert not prepared.is_integer
+
+
+def test_prepared_inputs_is_integer() -> None:
+    assert PreparedInputs(y_true=np.array([1, 0]), y_pred=np.array([True, False])).is_integer
+
+
+#################################
+#     Tests for safe_divide     #
+#################################
+
+
+def test_safe_divide() -> None:
+    assert objects_are_equal(
+        safe_divide(np.array([1, 2, 3]), np.array([2, 0, 4])), np.array([0.5, 0.0, 0.75])
+    )
+
+
+def test_safe_divide_default() -> None:
+    assert objects_are_equal(
+        safe_divide(np.array([1, 2, 3]), np.array([2, 0, 4]), default=float("nan")),
+        np.array([0.5, float("nan"), 0.75]),
+        equal_nan=True,
+    )
+
+
+def test_safe_divide_broadcast() -> None:
+    assert objects_are_equal(
+        safe_divide(np.array([[1, 2], [3, 4]]), np.array([2, 0])),
+        np.array([[0.5, 0.0], [1.5, 0.0]]),
+    )
+
+
+def test_safe_divide_scalar() -> None:
+    assert objects_are_equal(safe_divide(3, 0, default=-1.0), np.array(-1.0))
+
+
+def test_safe_divide_empty() -> None:
+    assert objects_are_equal(safe_divide(np.array([]), np.array([])), np.array([]))
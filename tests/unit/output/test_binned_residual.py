@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose
+
+from arkas.content import BinnedResidualContentGenerator, ContentGenerator
+from arkas.evaluator2 import BinnedResidualEvaluator
+from arkas.output import BinnedResidualOutput, Output
+from arkas.state import BinnedResidualState
+
+
+@pytest.fixture
+def state() -> BinnedResidualState:
+    return BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+        y_pred=np.array([2.0, 2.0, 3.0, 3.0, 6.0, 8.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+        bins=[0, 3, 6, 9],
+    )
+
+
+##########################################
+#     Tests for BinnedResidualOutput     #
+##########################################
+
+
+def test_binned_residual_output_repr(state: BinnedResidualState) -> None:
+    assert repr(BinnedResidualOutput(state)).startswith("BinnedResidualOutput(")
+
+
+def test_binned_residual_output_str(state: BinnedResidualState) -> None:
+    assert str(BinnedResidualOutput(state)).startswith("BinnedResidualOutput(")
+
+
+def test_binned_residual_output_compute(state: BinnedResidualState) -> None:
+    assert isinstance(BinnedResidualOutput(state).compute(), Output)
+
+
+def test_binned_residual_output_equal_true(state: BinnedResidualState) -> None:
+    assert BinnedResidualOutput(state).equal(BinnedResidualOutput(state))
+
+
+def test_binned_residual_output_equal_false_different_state(state: BinnedResidualState) -> None:
+    assert not BinnedResidualOutput(state).equal(
+        BinnedResidualOutput(
+            BinnedResidualState(
+                y_true=np.array([]), y_pred=np.array([]), y_true_name="target", y_pred_name="pred"
+            )
+        )
+    )
+
+
+def test_binned_residual_output_equal_false_different_type(state: BinnedResidualState) -> None:
+    assert not BinnedResidualOutput(state).equal(42)
+
+
+def test_binned_residual_output_get_content_generator_lazy_true(
+    state: BinnedResidualState,
+) -> None:
+    assert (
+        BinnedResidualOutput(state)
+        .get_content_generator()
+        .equal(BinnedResidualContentGenerator.from_state(state))
+    )
+
+
+def test_binned_residual_output_get_content_generator_lazy_false(
+    state: BinnedResidualState,
+) -> None:
+    assert isinstance(
+        BinnedResidualOutput(state).get_content_generator(lazy=False), ContentGenerator
+    )
+
+
+def test_binned_residual_output_get_evaluator_lazy_true(state: BinnedResidualState) -> None:
+    assert BinnedResidualOutput(state).get_evaluator().equal(BinnedResidualEvaluator(state))
+
+
+def test_binned_residual_output_get_evaluator_lazy_false(state: BinnedResidualState) -> None:
+    assert objects_are_allclose(
+        BinnedResidualOutput(state).get_evaluator(lazy=False).evaluate(),
+        {
+            "bin_bias": np.array([0.5, -0.5, 1.5]),
+            "bin_count": np.array([2, 2, 2]),
+            "bin_edges": np.array([0.0, 3.0, 6.0, 9.0]),
+            "bin_mae": np.array([0.5, 0.5, 1.5]),
+            "bin_rmse": np.array([np.sqrt(0.5), np.sqrt(0.5), np.sqrt(2.5)]),
+            "count": 6,
+        },
+    )
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 from matplotlib import pyplot as plt
 
+from arkas.metric import BinaryScoreRanking
 from arkas.plot import binary_precision_recall_curve
 
 ###################################################
@@ -31,3 +33,35 @@ def test_binary_precision_recall_curve_nan() -> None:
         y_true=np.array([1, 0, 0, 1, 1, float("nan"), float("nan"), 1]),
         y_pred=np.array([1, 0, 0, 1, 1, float("nan"), 1, float("nan")]),
     )
+
+
+def test_binary_precision_recall_curve_ranking() -> None:
+    y_true, y_pred = np.array([1, 0, 0, 1, 1]), np.array([0.9, 0.2, 0.6, 0.7, 0.8])
+    _fig, ax = plt.subplots()
+    binary_precision_recall_curve(
+        ax, y_true=y_true, y_pred=y_pred, ranking=BinaryScoreRanking(y_true, y_pred)
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"pos_label": 1}, {"sample_weight": np.ones(5)}, {"drop_intermediate": True}],
+)
+def test_binary_precision_recall_curve_from_predictions_kwargs(kwargs: dict) -> None:
+    _fig, ax = plt.subplots()
+    binary_precision_recall_curve(
+        ax, y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([0.9, 0.2, 0.6, 0.7, 0.8]), **kwargs
+    )
+
+
+def test_binary_precision_recall_curve_from_predictions_kwargs_ranking() -> None:
+    y_true, y_pred = np.array([1, 0, 0, 1, 1]), np.array([0.9, 0.2, 0.6, 0.7, 0.8])
+    _fig, ax = plt.subplots()
+    with pytest.raises(ValueError, match="'ranking' cannot be used with the keyword arguments"):
+        binary_precision_recall_curve(
+            ax,
+            y_true=y_true,
+            y_pred=y_pred,
+            ranking=BinaryScoreRanking(y_true, y_pred),
+            pos_label=1,
+        )
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import numpy as np
+from matplotlib import pyplot as plt
+
+from arkas.metric import binned_residuals
+from arkas.plot import plot_binned_residuals
+
+###########################################
+#     Tests for plot_binned_residuals     #
+###########################################
+
+
+def test_plot_binned_residuals() -> None:
+    _fig, ax = plt.subplots()
+    plot_binned_residuals(
+        ax, y_true=np.array([1, 2, 3, 4, 5, 6]), y_pred=np.array([2, 2, 3, 3, 6, 8]), bins=3
+    )
+
+
+def test_plot_binned_residuals_uniform() -> None:
+    _fig, ax = plt.subplots()
+    plot_binned_residuals(
+        ax,
+        y_true=np.array([1, 2, 3, 4, 5, 6]),
+        y_pred=np.array([2, 2, 3, 3, 6, 8]),
+        bins=3,
+        strategy="uniform",
+    )
+
+
+def test_plot_binned_residuals_empty_bins() -> None:
+    _fig, ax = plt.subplots()
+    plot_binned_residuals(
+        ax, y_true=np.array([1, 2, 3]), y_pred=np.array([1, 3, 5]), bins=[0, 2, 4, 6, 8]
+    )
+
+
+def test_plot_binned_residuals_profile() -> None:
+    y_true, y_pred = np.array([1, 2, 3, 4, 5, 6]), np.array([2, 2, 3, 3, 6, 8])
+    _fig, ax = plt.subplots()
+    plot_binned_residuals(
+        ax, y_true=y_true, y_pred=y_pred, profile=binned_residuals(y_true, y_pred, bins=2)
+    )
+
+
+def test_plot_binned_residuals_empty() -> None:
+    _fig, ax = plt.subplots()
+    plot_binned_residuals(ax, y_true=np.array([]), y_pred=np.array([]))
+
+
+def test_plot_binned_residuals_nan() -> None:
+    _fig, ax = plt.subplots()
+    plot_binned_residuals(
+        ax, y_true=np.array([1.0, 2.0, np.nan, 4.0]), y_pred=np.array([1.0, np.nan, 3.0, 5.0])
+    )
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 from matplotlib import pyplot as plt
 
+from arkas.metric import BinaryScoreRanking
 from arkas.plot import binary_roc_curve
 
 ######################################
@@ -27,3 +29,35 @@ def test_binary_roc_curve_nan() -> None:
         y_true=np.array([1, 0, 0, 1, 1, float("nan"), float("nan"), 1]),
         y_score=np.array([2, -1, 0, 3, 1, float("nan"), 1, float("nan")]),
     )
+
+
+def test_binary_roc_curve_ranking() -> None:
+    y_true, y_score = np.array([1, 0, 0, 1, 1]), np.array([2, -1, 0, 3, 1])
+    _fig, ax = plt.subplots()
+    binary_roc_curve(
+        ax, y_true=y_true, y_score=y_score, ranking=BinaryScoreRanking(y_true, y_score)
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"pos_label": 1}, {"sample_weight": np.ones(5)}, {"drop_intermediate": False}],
+)
+def test_binary_roc_curve_from_predictions_kwargs(kwargs: dict) -> None:
+    _fig, ax = plt.subplots()
+    binary_roc_curve(
+        ax, y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), **kwargs
+    )
+
+
+def test_binary_roc_curve_from_predictions_kwargs_ranking() -> None:
+    y_true, y_score = np.array([1, 0, 0, 1, 1]), np.array([2, -1, 0, 3, 1])
+    _fig, ax = plt.subplots()
+    with pytest.raises(ValueError, match="'ranking' cannot be used with the keyword arguments"):
+        binary_roc_curve(
+            ax,
+            y_true=y_true,
+            y_score=y_score,
+            ranking=BinaryScoreRanking(y_true, y_score),
+            sample_weight=np.ones(5),
+        )
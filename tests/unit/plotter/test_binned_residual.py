@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from arkas.figure import HtmlFigure, MatplotlibFigure, MatplotlibFigureConfig
+from arkas.figure.utils import MISSING_FIGURE_MESSAGE
+from arkas.plotter import BinnedResidualPlotter, Plotter
+from arkas.plotter.binned_residual import MatplotlibFigureCreator
+from arkas.state import BinnedResidualState
+
+
+@pytest.fixture
+def state() -> BinnedResidualState:
+    return BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+        y_pred=np.array([2.0, 2.0, 3.0, 3.0, 6.0, 8.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+        bins=3,
+    )
+
+
+###########################################
+#     Tests for BinnedResidualPlotter     #
+###########################################
+
+
+def test_binned_residual_plotter_repr(state: BinnedResidualState) -> None:
+    assert repr(BinnedResidualPlotter(state)).startswith("BinnedResidualPlotter(")
+
+
+def test_binned_residual_plotter_str(state: BinnedResidualState) -> None:
+    assert str(BinnedResidualPlotter(state)).startswith("BinnedResidualPlotter(")
+
+
+def test_binned_residual_plotter_state(state: BinnedResidualState) -> None:
+    assert BinnedResidualPlotter(state).state.equal(state)
+
+
+def test_binned_residual_plotter_compute(state: BinnedResidualState) -> None:
+    assert isinstance(BinnedResidualPlotter(state).compute(), Plotter)
+
+
+def test_binned_residual_plotter_equal_true(state: BinnedResidualState) -> None:
+    assert BinnedResidualPlotter(state).equal(BinnedResidualPlotter(state))
+
+
+def test_binned_residual_plotter_equal_false_different_state(state: BinnedResidualState) -> None:
+    assert not BinnedResidualPlotter(state).equal(
+        BinnedResidualPlotter(
+            BinnedResidualState(
+                y_true=np.array([]), y_pred=np.array([]), y_true_name="target", y_pred_name="pred"
+            )
+        )
+    )
+
+
+def test_binned_residual_plotter_equal_false_different_type(state: BinnedResidualState) -> None:
+    assert not BinnedResidualPlotter(state).equal(42)
+
+
+def test_binned_residual_plotter_plot(state: BinnedResidualState) -> None:
+    figures = BinnedResidualPlotter(state).plot()
+    assert len(figures) == 1
+    assert isinstance(figures["binned_residual"], MatplotlibFigure)
+
+
+def test_binned_residual_plotter_plot_prefix_suffix(state: BinnedResidualState) -> None:
+    figures = BinnedResidualPlotter(state).plot(prefix="prefix_", suffix="_suffix")
+    assert len(figures) == 1
+    assert isinstance(figures["prefix_binned_residual_suffix"], MatplotlibFigure)
+
+
+#############################################
+#     Tests for MatplotlibFigureCreator     #
+#############################################
+
+
+def test_matplotlib_figure_creator_repr() -> None:
+    assert repr(MatplotlibFigureCreator()).startswith("MatplotlibFigureCreator(")
+
+
+def test_matplotlib_figure_creator_str() -> None:
+    assert str(MatplotlibFigureCreator()).startswith("MatplotlibFigureCreator(")
+
+
+def test_matplotlib_figure_creator_create(state: BinnedResidualState) -> None:
+    assert isinstance(MatplotlibFigureCreator().create(state), MatplotlibFigure)
+
+
+def test_matplotlib_figure_creator_create_figure_config() -> None:
+    assert isinstance(
+        MatplotlibFigureCreator().create(
+            BinnedResidualState(
+                y_true=np.array([1.0, 2.0, 3.0, 4.0]),
+                y_pred=np.array([1.0, 2.0, 4.0, 8.0]),
+                y_true_name="target",
+                y_pred_name="pred",
+                figure_config=MatplotlibFigureConfig(xscale="log", init={"figsize": (7, 3)}),
+            )
+        ),
+        MatplotlibFigure,
+    )
+
+
+def test_matplotlib_figure_creator_create_empty() -> None:
+    figure = MatplotlibFigureCreator().create(
+        BinnedResidualState(
+            y_true=np.array([]), y_pred=np.array([]), y_true_name="target", y_pred_name="pred"
+        )
+    )
+    assert isinstance(figure, HtmlFigure)
+    assert figure.equal(HtmlFigure(MISSING_FIGURE_MESSAGE))
+
+
+def test_matplotlib_figure_creator_create_nan_propagate() -> None:
+    assert isinstance(
+        MatplotlibFigureCreator().create(
+            BinnedResidualState(
+                y_true=np.array([1.0, 2.0, np.nan]),
+                y_pred=np.array([1.0, 2.0, 3.0]),
+                y_true_name="target",
+                y_pred_name="pred",
+            )
+        ),
+        HtmlFigure,
+    )
+
+
+def test_matplotlib_figure_creator_create_nan_omit() -> None:
+    assert isinstance(
+        MatplotlibFigureCreator().create(
+            BinnedResidualState(
+                y_true=np.array([1.0, 2.0, np.nan]),
+                y_pred=np.array([1.0, 2.0, 3.0]),
+                y_true_name="target",
+                y_pred_name="pred",
+                nan_policy="omit",
+            )
+        ),
+        MatplotlibFigure,
+    )
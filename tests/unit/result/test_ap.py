@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+from unittest.mock import Mock
+
 import numpy as np
 import pytest
 from coola import objects_are_allclose, objects_are_equal
 
+from arkas.metric import BinaryScoreHistogram
 from arkas.result import (
     AveragePrecisionResult,
     BinaryAveragePrecisionResult,
     MulticlassAveragePrecisionResult,
     MultilabelAveragePrecisionResult,
 )
+from arkas.testing import scipy_available
+from arkas.utils.imports import is_scipy_available
+
+if is_scipy_available():
+    from scipy import sparse
 
 ############################################
 #     Tests for AveragePrecisionResult     #
@@ -736,6 +744,16 @@ def test_binary_average_precision_result_equal_false_different_nan_policy() -> N
     )
 
 
+def test_binary_average_precision_result_equal_false_different_n_bins() -> None:
+    assert not BinaryAveragePrecisionResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+    ).equal(
+        BinaryAveragePrecisionResult(
+            y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), n_bins=10
+        )
+    )
+
+
 def test_binary_average_precision_result_equal_false_different_type() -> None:
     assert not BinaryAveragePrecisionResult(
         y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
@@ -788,6 +806,52 @@ def test_binary_average_precision_result_compute_metrics_prefix_suffix() -> None
     )
 
 
+def test_binary_average_precision_result_n_bins() -> None:
+    result = BinaryAveragePrecisionResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), n_bins=10
+    )
+    assert result.n_bins == 10
+    assert isinstance(result.ranking, BinaryScoreHistogram)
+    assert objects_are_equal(result.compute_metrics(), {"count": 5, "average_precision": 1.0})
+
+
+def test_binary_average_precision_result_n_bins_lazy(monkeypatch: pytest.MonkeyPatch) -> None:
+    from_scores = Mock(wraps=BinaryScoreHistogram.from_scores)
+    monkeypatch.setattr(BinaryScoreHistogram, "from_scores", from_scores)
+    result = BinaryAveragePrecisionResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), n_bins=10
+    )
+    from_scores.assert_not_called()
+    result.compute_metrics()
+    result.compute_metrics()
+    from_scores.assert_called_once()
+
+
+def test_binary_average_precision_result_n_bins_nan_raise() -> None:
+    result = BinaryAveragePrecisionResult(
+        y_true=np.array([1, 0, 0, 1, float("nan")]),
+        y_score=np.array([2, -1, 0, 3, 1]),
+        n_bins=10,
+        nan_policy="raise",
+    )
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        result.compute_metrics()
+
+
+def test_binary_average_precision_result_n_bins_approximate() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=1000)
+    y_score = rng.random(size=1000) + 0.5 * y_true
+    metrics = BinaryAveragePrecisionResult(
+        y_true=y_true, y_score=y_score, n_bins=1000
+    ).compute_metrics()
+    assert objects_are_allclose(
+        metrics,
+        BinaryAveragePrecisionResult(y_true=y_true, y_score=y_score).compute_metrics(),
+        atol=1e-3,
+    )
+
+
 def test_binary_average_precision_result_compute_metrics_nan_omit() -> None:
     result = BinaryAveragePrecisionResult(
         y_true=np.array([1, 0, 0, 1, float("nan")]),
@@ -1529,6 +1593,49 @@ def test_multilabel_average_precision_result_equal_nan_true() -> None:
     )
 
 
+@scipy_available
+def test_multilabel_average_precision_result_equal_sparse_true() -> None:
+    assert MultilabelAveragePrecisionResult(
+        y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]])),
+        y_score=sparse.csr_array(np.array([[0.9, 0, 0], [0, 0.8, 0], [0.2, 0.5, 0.7], [0, 0, 0]])),
+    ).equal(
+        MultilabelAveragePrecisionResult(
+            y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]])),
+            y_score=sparse.csr_array(
+                np.array([[0.9, 0, 0], [0, 0.8, 0], [0.2, 0.5, 0.7], [0, 0, 0]])
+            ),
+        )
+    )
+
+
+@scipy_available
+def test_multilabel_average_precision_result_equal_false_sparse_dense() -> None:
+    assert not MultilabelAveragePrecisionResult(
+        y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]])),
+        y_score=sparse.csr_array(np.array([[0.9, 0, 0], [0, 0.8, 0], [0.2, 0.5, 0.7], [0, 0, 0]])),
+    ).equal(
+        MultilabelAveragePrecisionResult(
+            y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]]),
+            y_score=np.array([[0.9, 0, 0], [0, 0.8, 0], [0.2, 0.5, 0.7], [0, 0, 0]]),
+        )
+    )
+
+
+@scipy_available
+def test_multilabel_average_precision_result_compute_metrics_sparse() -> None:
+    result = MultilabelAveragePrecisionResult(
+        y_true=sparse.csr_array(np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]])),
+        y_score=sparse.csr_array(np.array([[0.9, 0, 0], [0, 0.8, 0], [0.2, 0.5, 0.7], [0, 0, 0]])),
+    )
+    assert objects_are_allclose(
+        result.compute_metrics(),
+        MultilabelAveragePrecisionResult(
+            y_true=np.array([[1, 0, 1], [0, 1, 0], [0, 1, 0], [1, 0, 1]]),
+            y_score=np.array([[0.9, 0, 0], [0, 0.8, 0], [0.2, 0.5, 0.7], [0, 0, 0]]),
+        ).compute_metrics(),
+    )
+
+
 def test_multilabel_average_precision_result_compute_metrics_1_class_1d() -> None:
     result = MultilabelAveragePrecisionResult(
         y_true=np.array([1, 0, 0, 1, 1]),
@@ -328,6 +328,15 @@ def test_binary_classification_result_compute_metrics_without_y_score() -> None:
     )
 
 
+def test_binary_classification_result_shared_confmat() -> None:
+    result = BinaryClassificationResult(
+        y_true=np.array([1, 0, 0, 1, 1]),
+        y_pred=np.array([1, 0, 0, 1, 1]),
+    )
+    confmats = {id(res.confmat) for res in result._results._results if hasattr(res, "confmat")}
+    assert len(confmats) == 1
+
+
 def test_binary_classification_result_compute_metrics_beta() -> None:
     result = BinaryClassificationResult(
         y_true=np.array([1, 0, 0, 1, 1]),
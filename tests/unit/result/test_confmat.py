@@ -9,6 +9,7 @@ from arkas.result import (
     MulticlassConfusionMatrixResult,
     MultilabelConfusionMatrixResult,
 )
+from arkas.testing import scipy_available
 
 #################################################
 #     Tests for BinaryConfusionMatrixResult     #
@@ -567,6 +568,112 @@ def test_multiclass_confusion_matrix_result_compute_metrics_multiclass_nan_raise
         result.compute_metrics()
 
 
+def test_multiclass_confusion_matrix_result_top_k() -> None:
+    assert (
+        MulticlassConfusionMatrixResult(
+            y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 2, 2]), top_k=5
+        ).top_k
+        == 5
+    )
+
+
+def test_multiclass_confusion_matrix_result_top_k_default() -> None:
+    assert (
+        MulticlassConfusionMatrixResult(
+            y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 2, 2])
+        ).top_k
+        is None
+    )
+
+
+def test_multiclass_confusion_matrix_result_incorrect_top_k() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'top_k': -1"):
+        MulticlassConfusionMatrixResult(
+            y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 2, 2]), top_k=-1
+        )
+
+
+def test_multiclass_confusion_matrix_result_equal_false_different_top_k() -> None:
+    assert not MulticlassConfusionMatrixResult(
+        y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 2, 2]), top_k=5
+    ).equal(
+        MulticlassConfusionMatrixResult(
+            y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 2, 2]), top_k=3
+        )
+    )
+
+
+def test_multiclass_confusion_matrix_result_compute_metrics_top_k() -> None:
+    result = MulticlassConfusionMatrixResult(
+        y_true=np.array([0, 1, 1, 2, 2, 2]), y_pred=np.array([0, 2, 1, 1, 2, 1]), top_k=2
+    )
+    assert objects_are_equal(
+        result.compute_metrics(),
+        {
+            "count": 6,
+            "top_confused_count": np.array([2, 1]),
+            "top_confused_pred": np.array([1, 2]),
+            "top_confused_true": np.array([2, 1]),
+        },
+    )
+
+
+def test_multiclass_confusion_matrix_result_compute_metrics_top_k_uint64() -> None:
+    result = MulticlassConfusionMatrixResult(
+        y_true=np.array([0, 1, 1, 2, 2, 2], dtype=np.uint64),
+        y_pred=np.array([0, 2, 1, 1, 2, 1], dtype=np.uint64),
+        top_k=2,
+    )
+    assert objects_are_equal(
+        result.compute_metrics(),
+        {
+            "count": 6,
+            "top_confused_count": np.array([2, 1]),
+            "top_confused_pred": np.array([1, 2], dtype=np.uint64),
+            "top_confused_true": np.array([2, 1], dtype=np.uint64),
+        },
+    )
+
+
+def test_multiclass_confusion_matrix_result_compute_metrics_top_k_prefix_suffix() -> None:
+    result = MulticlassConfusionMatrixResult(
+        y_true=np.array([0, 1, 1, 2, 2, 2]), y_pred=np.array([0, 2, 1, 1, 2, 1]), top_k=1
+    )
+    assert objects_are_equal(
+        result.compute_metrics(prefix="prefix_", suffix="_suffix"),
+        {
+            "prefix_count_suffix": 6,
+            "prefix_top_confused_count_suffix": np.array([2]),
+            "prefix_top_confused_pred_suffix": np.array([1]),
+            "prefix_top_confused_true_suffix": np.array([2]),
+        },
+    )
+
+
+@scipy_available
+def test_multiclass_confusion_matrix_result_sparse_confusion_matrix() -> None:
+    result = MulticlassConfusionMatrixResult(
+        y_true=np.array([0, 1, 1, 2, 2, 2]), y_pred=np.array([0, 2, 1, 1, 2, 1]), top_k=2
+    )
+    matrix, labels = result.sparse_confusion_matrix
+    assert objects_are_equal(matrix.toarray(), np.array([[1, 0, 0], [0, 1, 1], [0, 2, 1]]))
+    assert objects_are_equal(labels, np.array([0, 1, 2]))
+    assert result.sparse_confusion_matrix[0] is matrix
+
+
+@scipy_available
+def test_multiclass_confusion_matrix_result_sparse_confusion_matrix_nan_omit() -> None:
+    result = MulticlassConfusionMatrixResult(
+        y_true=np.array([0, 1, 1, float("nan")]),
+        y_pred=np.array([0, 1, 0, 1]),
+        nan_policy="omit",
+        top_k=2,
+    )
+    matrix, labels = result.sparse_confusion_matrix
+    assert objects_are_equal(matrix.toarray(), np.array([[1, 0], [1, 1]]))
+    assert objects_are_equal(labels, np.array([0.0, 1.0]))
+
+
 def test_multiclass_confusion_matrix_result_generate_figures() -> None:
     result = MulticlassConfusionMatrixResult(
         y_true=np.array([0, 0, 1, 1, 2, 2]), y_pred=np.array([0, 0, 1, 1, 2, 2])
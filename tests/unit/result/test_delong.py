@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from arkas.result import DeLongResult
+
+Y_TRUE = np.array([1, 0, 0, 1, 1, 0])
+Y_SCORES = {
+    "a": np.array([0.9, 0.2, 0.6, 0.8, 0.4, 0.1]),
+    "b": np.array([0.8, 0.3, 0.1, 0.7, 0.2, 0.5]),
+}
+
+
+##################################
+#     Tests for DeLongResult     #
+##################################
+
+
+def test_delong_result_repr() -> None:
+    assert repr(DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES)).startswith("DeLongResult(")
+
+
+def test_delong_result_str() -> None:
+    assert str(DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES)).startswith("DeLongResult(")
+
+
+def test_delong_result_y_true() -> None:
+    assert objects_are_equal(DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES).y_true, Y_TRUE)
+
+
+def test_delong_result_y_true_2d() -> None:
+    assert objects_are_equal(
+        DeLongResult(
+            y_true=Y_TRUE.reshape(2, 3), y_scores={"a": Y_SCORES["a"].reshape(2, 3)}
+        ).y_true,
+        Y_TRUE,
+    )
+
+
+def test_delong_result_y_scores() -> None:
+    assert objects_are_equal(DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES).y_scores, Y_SCORES)
+
+
+def test_delong_result_confidence_level() -> None:
+    assert (
+        DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES, confidence_level=0.9).confidence_level == 0.9
+    )
+
+
+def test_delong_result_nan_policy() -> None:
+    assert DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES, nan_policy="omit").nan_policy == "omit"
+
+
+def test_delong_result_incorrect_confidence_level() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect 'confidence_level': 0\.0"):
+        DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES, confidence_level=0.0)
+
+
+def test_delong_result_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES, nan_policy="incorrect")
+
+
+def test_delong_result_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="arrays have different shapes"):
+        DeLongResult(y_true=Y_TRUE, y_scores={"a": np.array([0.1, 0.2])})
+
+
+def test_delong_result_compute_metrics() -> None:
+    assert objects_are_allclose(
+        DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES).compute_metrics(),
+        {
+            "a_roc_auc": 8 / 9,
+            "a_roc_auc_ci_high": 1.0,
+            "a_roc_auc_ci_low": 0.5809102612556272,
+            "a_roc_auc_variance": 2 / 81,
+            "a_vs_b_pvalue": 0.6547208460185772,
+            "a_vs_b_roc_auc_diff": 1 / 9,
+            "a_vs_b_z_score": 0.44721359549995776,
+            "b_roc_auc": 7 / 9,
+            "b_roc_auc_ci_high": 1.0,
+            "b_roc_auc_ci_low": 0.2908208107907881,
+            "b_roc_auc_variance": 5 / 81,
+            "count": 6,
+        },
+    )
+
+
+def test_delong_result_compute_metrics_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        DeLongResult(y_true=Y_TRUE, y_scores={"a": Y_SCORES["a"]}).compute_metrics(
+            prefix="prefix_", suffix="_suffix"
+        ),
+        {
+            "prefix_a_roc_auc_suffix": 8 / 9,
+            "prefix_a_roc_auc_ci_high_suffix": 1.0,
+            "prefix_a_roc_auc_ci_low_suffix": 0.5809102612556272,
+            "prefix_a_roc_auc_variance_suffix": 2 / 81,
+            "prefix_count_suffix": 6,
+        },
+    )
+
+
+def test_delong_result_compute_metrics_nan_omit() -> None:
+    assert objects_are_allclose(
+        DeLongResult(
+            y_true=np.array([1, 0, 0, 1, 1, 0, 1]),
+            y_scores={"a": np.array([0.9, 0.2, 0.6, 0.8, 0.4, 0.1, float("nan")])},
+            nan_policy="omit",
+        ).compute_metrics(),
+        {
+            "a_roc_auc": 8 / 9,
+            "a_roc_auc_ci_high": 1.0,
+            "a_roc_auc_ci_low": 0.5809102612556272,
+            "a_roc_auc_variance": 2 / 81,
+            "count": 6,
+        },
+    )
+
+
+def test_delong_result_equal_true() -> None:
+    assert DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES).equal(
+        DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES)
+    )
+
+
+def test_delong_result_equal_false_different_y_true() -> None:
+    assert not DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES).equal(
+        DeLongResult(y_true=1 - Y_TRUE, y_scores=Y_SCORES)
+    )
+
+
+def test_delong_result_equal_false_different_y_scores() -> None:
+    assert not DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES).equal(
+        DeLongResult(y_true=Y_TRUE, y_scores={"a": Y_SCORES["a"]})
+    )
+
+
+def test_delong_result_equal_false_different_confidence_level() -> None:
+    assert not DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES).equal(
+        DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES, confidence_level=0.9)
+    )
+
+
+def test_delong_result_equal_false_different_nan_policy() -> None:
+    assert not DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES).equal(
+        DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES, nan_policy="omit")
+    )
+
+
+def test_delong_result_equal_false_different_type() -> None:
+    assert not DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES).equal(42)
+
+
+def test_delong_result_equal_nan_true() -> None:
+    assert DeLongResult(
+        y_true=Y_TRUE, y_scores={"a": np.array([0.9, 0.2, 0.6, 0.8, 0.4, float("nan")])}
+    ).equal(
+        DeLongResult(
+            y_true=Y_TRUE, y_scores={"a": np.array([0.9, 0.2, 0.6, 0.8, 0.4, float("nan")])}
+        ),
+        equal_nan=True,
+    )
+
+
+def test_delong_result_generate_figures() -> None:
+    assert objects_are_equal(DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES).generate_figures(), {})
+
+
+def test_delong_result_generate_figures_prefix_suffix() -> None:
+    assert objects_are_equal(
+        DeLongResult(y_true=Y_TRUE, y_scores=Y_SCORES).generate_figures(
+            prefix="prefix_", suffix="_suffix"
+        ),
+        {},
+    )
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_equal
+from polars.testing import assert_frame_equal
+
+from arkas.result import GroupedMetricsResult
+from arkas.result.grouped import check_grouped_task
+
+GROUPS = {"country": np.array(["fr", "fr", "fr", "us", "us", "us"])}
+Y_TRUE = np.array([1, 0, 1, 1, 0, 0])
+Y_PRED = np.array([1, 0, 0, 1, 1, 0])
+
+
+##########################################
+#     Tests for GroupedMetricsResult     #
+##########################################
+
+
+def test_grouped_metrics_result_repr() -> None:
+    assert repr(
+        GroupedMetricsResult(groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification")
+    ).startswith("GroupedMetricsResult(")
+
+
+def test_grouped_metrics_result_str() -> None:
+    assert str(
+        GroupedMetricsResult(groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification")
+    ).startswith("GroupedMetricsResult(")
+
+
+def test_grouped_metrics_result_groups() -> None:
+    assert objects_are_equal(
+        GroupedMetricsResult(
+            groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+        ).groups,
+        GROUPS,
+    )
+
+
+def test_grouped_metrics_result_y_true() -> None:
+    assert objects_are_equal(
+        GroupedMetricsResult(
+            groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+        ).y_true,
+        Y_TRUE,
+    )
+
+
+def test_grouped_metrics_result_y_pred() -> None:
+    assert objects_are_equal(
+        GroupedMetricsResult(
+            groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+        ).y_pred,
+        Y_PRED,
+    )
+
+
+def test_grouped_metrics_result_task() -> None:
+    assert (
+        GroupedMetricsResult(groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="ranking").task
+        == "ranking"
+    )
+
+
+def test_grouped_metrics_result_nan_policy() -> None:
+    assert (
+        GroupedMetricsResult(
+            groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="ranking", nan_policy="omit"
+        ).nan_policy
+        == "omit"
+    )
+
+
+def test_grouped_metrics_result_incorrect_task() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'task': incorrect"):
+        GroupedMetricsResult(groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="incorrect")
+
+
+def test_grouped_metrics_result_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        GroupedMetricsResult(
+            groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="ranking", nan_policy="incorrect"
+        )
+
+
+def test_grouped_metrics_result_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="arrays have different shapes"):
+        GroupedMetricsResult(
+            groups={"group": np.array([1, 2])}, y_true=Y_TRUE, y_pred=Y_PRED, task="ranking"
+        )
+
+
+def test_grouped_metrics_result_compute_metrics_classification() -> None:
+    assert_frame_equal(
+        GroupedMetricsResult(
+            groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+        ).compute_metrics()["grouped_metrics"],
+        pl.DataFrame(
+            {
+                "country": ["fr", "us"],
+                "count": [3, 3],
+                "accuracy": [2 / 3, 2 / 3],
+                "balanced_accuracy": [0.75, 0.75],
+                "precision": [1.0, 0.5],
+                "recall": [0.5, 1.0],
+                "f1": [2 / 3, 2 / 3],
+            }
+        ),
+    )
+
+
+def test_grouped_metrics_result_compute_metrics_ranking() -> None:
+    assert_frame_equal(
+        GroupedMetricsResult(
+            groups=GROUPS,
+            y_true=Y_TRUE,
+            y_pred=np.array([0.9, 0.1, 0.4, 0.2, 0.8, 0.1]),
+            task="ranking",
+        ).compute_metrics()["grouped_metrics"],
+        pl.DataFrame(
+            {
+                "country": ["fr", "us"],
+                "count": [3, 3],
+                "average_precision": [1.0, 0.5],
+                "roc_auc": [1.0, 0.5],
+            }
+        ),
+    )
+
+
+def test_grouped_metrics_result_compute_metrics_regression() -> None:
+    assert_frame_equal(
+        GroupedMetricsResult(
+            groups=GROUPS,
+            y_true=np.array([1, 2, 3, 4, 5, 6]),
+            y_pred=np.array([1, 2, 4, 4, 3, 6]),
+            task="regression",
+        ).compute_metrics()["grouped_metrics"],
+        pl.DataFrame(
+            {
+                "country": ["fr", "us"],
+                "count": [3, 3],
+                "mean_absolute_error": [1 / 3, 2 / 3],
+                "mean_squared_error": [1 / 3, 4 / 3],
+                "root_mean_squared_error": [np.sqrt(1 / 3), np.sqrt(4 / 3)],
+                "r2_score": [0.5, -1.0],
+            }
+        ),
+    )
+
+
+def test_grouped_metrics_result_compute_metrics_prefix_suffix() -> None:
+    metrics = GroupedMetricsResult(
+        groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+    ).compute_metrics(prefix="prefix_", suffix="_suffix")
+    assert list(metrics) == ["prefix_grouped_metrics_suffix"]
+
+
+def test_grouped_metrics_result_equal_true() -> None:
+    assert GroupedMetricsResult(
+        groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+    ).equal(
+        GroupedMetricsResult(groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification")
+    )
+
+
+def test_grouped_metrics_result_equal_false_different_groups() -> None:
+    assert not GroupedMetricsResult(
+        groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+    ).equal(
+        GroupedMetricsResult(
+            groups={"device": GROUPS["country"]},
+            y_true=Y_TRUE,
+            y_pred=Y_PRED,
+            task="classification",
+        )
+    )
+
+
+def test_grouped_metrics_result_equal_false_different_y_true() -> None:
+    assert not GroupedMetricsResult(
+        groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+    ).equal(
+        GroupedMetricsResult(groups=GROUPS, y_true=Y_PRED, y_pred=Y_PRED, task="classification")
+    )
+
+
+def test_grouped_metrics_result_equal_false_different_y_pred() -> None:
+    assert not GroupedMetricsResult(
+        groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+    ).equal(
+        GroupedMetricsResult(groups=GROUPS, y_true=Y_TRUE, y_pred=Y_TRUE, task="classification")
+    )
+
+
+def test_grouped_metrics_result_equal_false_different_task() -> None:
+    assert not GroupedMetricsResult(
+        groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+    ).equal(GroupedMetricsResult(groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="ranking"))
+
+
+def test_grouped_metrics_result_equal_false_different_nan_policy() -> None:
+    assert not GroupedMetricsResult(
+        groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+    ).equal(
+        GroupedMetricsResult(
+            groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification", nan_policy="omit"
+        )
+    )
+
+
+def test_grouped_metrics_result_equal_false_different_type() -> None:
+    assert not GroupedMetricsResult(
+        groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+    ).equal(42)
+
+
+def test_grouped_metrics_result_generate_figures() -> None:
+    assert objects_are_equal(
+        GroupedMetricsResult(
+            groups=GROUPS, y_true=Y_TRUE, y_pred=Y_PRED, task="classification"
+        ).generate_figures(),
+        {},
+    )
+
+
+########################################
+#     Tests for check_grouped_task     #
+########################################
+
+
+@pytest.mark.parametrize("task", ["classification", "ranking", "regression"])
+def test_check_grouped_task_valid(task: str) -> None:
+    check_grouped_task(task)
+
+
+def test_check_grouped_task_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'task': incorrect"):
+        check_grouped_task("incorrect")
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from arkas.result import QueryRankingResult
+
+QUERY_ID = np.array([1, 1, 1, 2, 2, 2, 2])
+Y_TRUE = np.array([0, 1, 2, 1, 0, 0, 1])
+Y_SCORE = np.array([0.1, 0.2, 0.9, 0.5, 0.8, 0.3, 0.4])
+
+
+########################################
+#     Tests for QueryRankingResult     #
+########################################
+
+
+def test_query_ranking_result_repr() -> None:
+    assert repr(QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE)).startswith(
+        "QueryRankingResult("
+    )
+
+
+def test_query_ranking_result_str() -> None:
+    assert str(QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE)).startswith(
+        "QueryRankingResult("
+    )
+
+
+def test_query_ranking_result_query_id() -> None:
+    assert objects_are_equal(
+        QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).query_id, QUERY_ID
+    )
+
+
+def test_query_ranking_result_y_true() -> None:
+    assert objects_are_equal(
+        QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).y_true, Y_TRUE
+    )
+
+
+def test_query_ranking_result_y_score() -> None:
+    assert objects_are_equal(
+        QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).y_score, Y_SCORE
+    )
+
+
+def test_query_ranking_result_k() -> None:
+    assert QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE, k=[1, 5]).k == (
+        1,
+        5,
+    )
+
+
+def test_query_ranking_result_nan_policy() -> None:
+    assert (
+        QueryRankingResult(
+            query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE, nan_policy="omit"
+        ).nan_policy
+        == "omit"
+    )
+
+
+def test_query_ranking_result_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        QueryRankingResult(
+            query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE, nan_policy="incorrect"
+        )
+
+
+def test_query_ranking_result_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="arrays have different shapes"):
+        QueryRankingResult(query_id=QUERY_ID[:3], y_true=Y_TRUE, y_score=Y_SCORE)
+
+
+def test_query_ranking_result_compute_metrics() -> None:
+    assert objects_are_allclose(
+        QueryRankingResult(
+            query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE, k=[1]
+        ).compute_metrics(),
+        {
+            "count": 7,
+            "map": 0.7916666666666666,
+            "mrr": 0.75,
+            "ndcg": 0.8467132018086354,
+            "ndcg_at_1": 0.5,
+            "num_queries": 2,
+            "precision_at_1": 0.5,
+            "recall_at_1": 0.25,
+        },
+    )
+
+
+def test_query_ranking_result_compute_metrics_prefix_suffix() -> None:
+    assert list(
+        QueryRankingResult(
+            query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE, k=[1]
+        ).compute_metrics(prefix="prefix_", suffix="_suffix")
+    ) == [
+        "prefix_count_suffix",
+        "prefix_map_suffix",
+        "prefix_mrr_suffix",
+        "prefix_ndcg_suffix",
+        "prefix_ndcg_at_1_suffix",
+        "prefix_num_queries_suffix",
+        "prefix_precision_at_1_suffix",
+        "prefix_recall_at_1_suffix",
+    ]
+
+
+def test_query_ranking_result_equal_true() -> None:
+    assert QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).equal(
+        QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE)
+    )
+
+
+def test_query_ranking_result_equal_false_different_query_id() -> None:
+    assert not QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).equal(
+        QueryRankingResult(query_id=np.ones(7), y_true=Y_TRUE, y_score=Y_SCORE)
+    )
+
+
+def test_query_ranking_result_equal_false_different_y_true() -> None:
+    assert not QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).equal(
+        QueryRankingResult(query_id=QUERY_ID, y_true=np.ones(7), y_score=Y_SCORE)
+    )
+
+
+def test_query_ranking_result_equal_false_different_y_score() -> None:
+    assert not QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).equal(
+        QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=np.ones(7))
+    )
+
+
+def test_query_ranking_result_equal_false_different_k() -> None:
+    assert not QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).equal(
+        QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE, k=[5])
+    )
+
+
+def test_query_ranking_result_equal_false_different_nan_policy() -> None:
+    assert not QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).equal(
+        QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE, nan_policy="omit")
+    )
+
+
+def test_query_ranking_result_equal_false_different_type() -> None:
+    assert not QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).equal(42)
+
+
+def test_query_ranking_result_generate_figures() -> None:
+    assert objects_are_equal(
+        QueryRankingResult(query_id=QUERY_ID, y_true=Y_TRUE, y_score=Y_SCORE).generate_figures(),
+        {},
+    )
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import numpy as np
 import pytest
-from coola import objects_are_equal
+from coola import objects_are_allclose, objects_are_equal
 
-from arkas.result import RegressionErrorResult
+from arkas.result import (
+    MultioutputRegressionResult,
+    RegressionErrorResult,
+    RegressionMetricsResult,
+)
 
 ###########################################
 #     Tests for RegressionErrorResult     #
@@ -273,3 +277,267 @@ def test_regression_error_result_generate_figures_prefix_suffix() -> None:
         result.generate_figures(prefix="prefix_", suffix="_suffix"),
         {},
     )
+
+
+#############################################
+#     Tests for RegressionMetricsResult     #
+#############################################
+
+
+def test_regression_metrics_result_y_true() -> None:
+    assert objects_are_equal(
+        RegressionMetricsResult(
+            y_true=np.array([[1, 2, 3], [4, 5, 6]]), y_pred=np.array([[6, 5, 4], [3, 2, 1]])
+        ).y_true,
+        np.array([1, 2, 3, 4, 5, 6]),
+    )
+
+
+def test_regression_metrics_result_y_pred() -> None:
+    assert objects_are_equal(
+        RegressionMetricsResult(
+            y_true=np.array([[1, 2, 3], [4, 5, 6]]), y_pred=np.array([[6, 5, 4], [3, 2, 1]])
+        ).y_pred,
+        np.array([6, 5, 4, 3, 2, 1]),
+    )
+
+
+def test_regression_metrics_result_y_pred_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_pred' have different shapes"):
+        RegressionMetricsResult(
+            y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1, 0])
+        )
+
+
+def test_regression_metrics_result_nan_policy() -> None:
+    assert (
+        RegressionMetricsResult(
+            y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 1, 0, 1]), nan_policy="omit"
+        ).nan_policy
+        == "omit"
+    )
+
+
+def test_regression_metrics_result_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        RegressionMetricsResult(
+            y_true=np.array([1, 0, 0, 1, 1]),
+            y_pred=np.array([1, 0, 1, 0, 1]),
+            nan_policy="incorrect",
+        )
+
+
+def test_regression_metrics_result_repr() -> None:
+    assert repr(
+        RegressionMetricsResult(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5]))
+    ).startswith("RegressionMetricsResult(")
+
+
+def test_regression_metrics_result_str() -> None:
+    assert str(
+        RegressionMetricsResult(y_true=np.array([1, 2, 3, 4, 5]), y_pred=np.array([1, 2, 3, 4, 5]))
+    ).startswith("RegressionMetricsResult(")
+
+
+def test_regression_metrics_result_equal_true() -> None:
+    assert RegressionMetricsResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1])
+    ).equal(
+        RegressionMetricsResult(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]))
+    )
+
+
+def test_regression_metrics_result_equal_false_different_y_true() -> None:
+    assert not RegressionMetricsResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1])
+    ).equal(
+        RegressionMetricsResult(y_true=np.array([1, 0, 0, 1, 0]), y_pred=np.array([1, 0, 0, 1, 1]))
+    )
+
+
+def test_regression_metrics_result_equal_false_different_y_pred() -> None:
+    assert not RegressionMetricsResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1])
+    ).equal(
+        RegressionMetricsResult(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 0]))
+    )
+
+
+def test_regression_metrics_result_equal_false_different_nan_policy() -> None:
+    assert not RegressionMetricsResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1])
+    ).equal(
+        RegressionMetricsResult(
+            y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]), nan_policy="omit"
+        )
+    )
+
+
+def test_regression_metrics_result_equal_false_different_type() -> None:
+    assert not RegressionMetricsResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1])
+    ).equal(
+        RegressionErrorResult(y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1]))
+    )
+
+
+def test_regression_metrics_result_compute_metrics() -> None:
+    result = RegressionMetricsResult(y_true=np.array([4, 3, 2, 1]), y_pred=np.array([1, 2, 3, 4]))
+    assert objects_are_allclose(
+        result.compute_metrics(),
+        {
+            "count": 4,
+            "max_error": 3.0,
+            "mean_absolute_error": 2.0,
+            "mean_absolute_percentage_error": 1.1458333333333333,
+            "mean_squared_error": 5.0,
+            "mean_squared_log_error": 0.4611748400643132,
+            "median_absolute_error": 2.0,
+            "r2_score": -3.0,
+            "root_mean_squared_error": 2.23606797749979,
+        },
+    )
+
+
+def test_regression_metrics_result_compute_metrics_empty() -> None:
+    result = RegressionMetricsResult(y_true=np.array([]), y_pred=np.array([]))
+    metrics = result.compute_metrics()
+    assert metrics["count"] == 0
+    assert np.isnan(metrics["mean_squared_error"])
+
+
+def test_regression_metrics_result_compute_metrics_prefix_suffix() -> None:
+    result = RegressionMetricsResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1])
+    )
+    metrics = result.compute_metrics(prefix="prefix_", suffix="_suffix")
+    assert all(key.startswith("prefix_") and key.endswith("_suffix") for key in metrics)
+    assert metrics["prefix_mean_absolute_error_suffix"] == 0.0
+
+
+def test_regression_metrics_result_compute_metrics_nan_omit() -> None:
+    result = RegressionMetricsResult(
+        y_true=np.array([1.0, 2.0, 3.0, float("nan")]),
+        y_pred=np.array([1.0, 2.0, 3.0, 4.0]),
+        nan_policy="omit",
+    )
+    metrics = result.compute_metrics()
+    assert metrics["count"] == 3
+    assert metrics["r2_score"] == 1.0
+
+
+def test_regression_metrics_result_generate_figures() -> None:
+    result = RegressionMetricsResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_pred=np.array([1, 0, 0, 1, 1])
+    )
+    assert objects_are_equal(result.generate_figures(), {})
+
+
+#################################################
+#     Tests for MultioutputRegressionResult     #
+#################################################
+
+Y_TRUE_2D = np.array([[1, 2], [2, 4], [3, 6], [4, 8]])
+Y_PRED_2D = np.array([[1, 3], [2, 4], [4, 6], [4, 4]])
+
+
+def test_multioutput_regression_result_y_true() -> None:
+    assert objects_are_equal(
+        MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D).y_true, Y_TRUE_2D
+    )
+
+
+def test_multioutput_regression_result_y_pred() -> None:
+    assert objects_are_equal(
+        MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D).y_pred, Y_PRED_2D
+    )
+
+
+def test_multioutput_regression_result_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_pred' have different shapes"):
+        MultioutputRegressionResult(y_true=np.ones((4, 2)), y_pred=np.ones((4, 3)))
+
+
+def test_multioutput_regression_result_nan_policy() -> None:
+    assert (
+        MultioutputRegressionResult(
+            y_true=Y_TRUE_2D, y_pred=Y_PRED_2D, nan_policy="omit"
+        ).nan_policy
+        == "omit"
+    )
+
+
+def test_multioutput_regression_result_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D, nan_policy="incorrect")
+
+
+def test_multioutput_regression_result_repr() -> None:
+    assert (
+        repr(MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D))
+        == "MultioutputRegressionResult(y_true=(4, 2), y_pred=(4, 2), nan_policy='propagate')"
+    )
+
+
+def test_multioutput_regression_result_str() -> None:
+    assert str(MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D)).startswith(
+        "MultioutputRegressionResult("
+    )
+
+
+def test_multioutput_regression_result_equal_true() -> None:
+    assert MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D).equal(
+        MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D)
+    )
+
+
+def test_multioutput_regression_result_equal_false_different_y_true() -> None:
+    assert not MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D).equal(
+        MultioutputRegressionResult(y_true=Y_TRUE_2D + 1, y_pred=Y_PRED_2D)
+    )
+
+
+def test_multioutput_regression_result_equal_false_different_y_pred() -> None:
+    assert not MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D).equal(
+        MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D + 1)
+    )
+
+
+def test_multioutput_regression_result_equal_false_different_nan_policy() -> None:
+    assert not MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D).equal(
+        MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D, nan_policy="omit")
+    )
+
+
+def test_multioutput_regression_result_equal_false_different_type() -> None:
+    assert not MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D).equal(42)
+
+
+def test_multioutput_regression_result_compute_metrics() -> None:
+    metrics = MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D).compute_metrics()
+    assert metrics["count"] == 4
+    assert objects_are_allclose(metrics["mean_absolute_error"], np.array([0.25, 1.25]))
+    assert objects_are_allclose(metrics["r2_score"], np.array([0.8, 0.15]))
+    assert objects_are_allclose(metrics["macro_mean_absolute_error"], 0.75)
+
+
+def test_multioutput_regression_result_compute_metrics_empty() -> None:
+    metrics = MultioutputRegressionResult(
+        y_true=np.zeros((0, 2)), y_pred=np.zeros((0, 2))
+    ).compute_metrics()
+    assert metrics["count"] == 0
+    assert np.isnan(metrics["mean_absolute_error"]).all()
+
+
+def test_multioutput_regression_result_compute_metrics_prefix_suffix() -> None:
+    metrics = MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D).compute_metrics(
+        prefix="prefix_", suffix="_suffix"
+    )
+    assert all(key.startswith("prefix_") and key.endswith("_suffix") for key in metrics)
+    assert metrics["prefix_count_suffix"] == 4
+
+
+def test_multioutput_regression_result_generate_figures() -> None:
+    assert objects_are_equal(
+        MultioutputRegressionResult(y_true=Y_TRUE_2D, y_pred=Y_PRED_2D).generate_figures(), {}
+    )
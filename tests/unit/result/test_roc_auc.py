@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from unittest.mock import Mock
+
 import numpy as np
 import pytest
 from coola import objects_are_allclose, objects_are_equal
 
+from arkas.metric import BinaryScoreHistogram
 from arkas.result import (
     BinaryRocAucResult,
     MulticlassRocAucResult,
@@ -132,6 +135,16 @@ def test_binary_roc_auc_result_equal_false_different_nan_policy() -> None:
     )
 
 
+def test_binary_roc_auc_result_equal_false_different_n_bins() -> None:
+    assert not BinaryRocAucResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
+    ).equal(
+        BinaryRocAucResult(
+            y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), n_bins=10
+        )
+    )
+
+
 def test_binary_roc_auc_result_equal_false_different_type() -> None:
     assert not BinaryRocAucResult(
         y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1])
@@ -177,6 +190,48 @@ def test_binary_roc_auc_result_compute_metrics_prefix_suffix() -> None:
     )
 
 
+def test_binary_roc_auc_result_n_bins() -> None:
+    result = BinaryRocAucResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), n_bins=10
+    )
+    assert result.n_bins == 10
+    assert isinstance(result.ranking, BinaryScoreHistogram)
+    assert objects_are_equal(result.compute_metrics(), {"count": 5, "roc_auc": 1.0})
+
+
+def test_binary_roc_auc_result_n_bins_lazy(monkeypatch: pytest.MonkeyPatch) -> None:
+    from_scores = Mock(wraps=BinaryScoreHistogram.from_scores)
+    monkeypatch.setattr(BinaryScoreHistogram, "from_scores", from_scores)
+    result = BinaryRocAucResult(
+        y_true=np.array([1, 0, 0, 1, 1]), y_score=np.array([2, -1, 0, 3, 1]), n_bins=10
+    )
+    from_scores.assert_not_called()
+    result.compute_metrics()
+    result.compute_metrics()
+    from_scores.assert_called_once()
+
+
+def test_binary_roc_auc_result_n_bins_nan_raise() -> None:
+    result = BinaryRocAucResult(
+        y_true=np.array([1, 0, 0, 1, float("nan")]),
+        y_score=np.array([2, -1, 0, 3, 1]),
+        n_bins=10,
+        nan_policy="raise",
+    )
+    with pytest.raises(ValueError, match="'y_true' contains at least one NaN value"):
+        result.compute_metrics()
+
+
+def test_binary_roc_auc_result_n_bins_approximate() -> None:
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=1000)
+    y_score = rng.random(size=1000) + 0.5 * y_true
+    metrics = BinaryRocAucResult(y_true=y_true, y_score=y_score, n_bins=1000).compute_metrics()
+    assert objects_are_allclose(
+        metrics, BinaryRocAucResult(y_true=y_true, y_score=y_score).compute_metrics(), atol=1e-3
+    )
+
+
 def test_binary_roc_auc_result_compute_metrics_nan_omit() -> None:
     result = BinaryRocAucResult(
         y_true=np.array([1, 0, 0, 1, float("nan")]),
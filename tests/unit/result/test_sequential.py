@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import numpy as np
 from coola import objects_are_equal
 
-from arkas.result import Result, SequentialResult
+from arkas.metric import accuracy, binary_precision, binary_recall
+from arkas.result import (
+    AccuracyResult,
+    BinaryPrecisionResult,
+    BinaryRecallResult,
+    MulticlassRecallResult,
+    Result,
+    SequentialResult,
+)
 
 ######################################
 #     Tests for SequentialResult     #
@@ -114,3 +123,53 @@ def test_sequential_result_generate_figures() -> None:
 
 def test_sequential_result_generate_figures_empty() -> None:
     assert objects_are_equal(SequentialResult([]).generate_figures(), {})
+
+
+def test_sequential_result_share_confmat() -> None:
+    y_true, y_pred = np.array([1, 0, 0, 1, 1]), np.array([1, 0, 1, 0, 1])
+    precision = BinaryPrecisionResult(y_true=y_true, y_pred=y_pred)
+    recall = BinaryRecallResult(y_true=y_true, y_pred=y_pred)
+    result = SequentialResult([precision, recall, Result(metrics={"ap": 0.42})])
+    assert precision.confmat is recall.confmat
+    assert objects_are_equal(
+        result.compute_metrics(),
+        binary_precision(y_true=y_true, y_pred=y_pred)
+        | binary_recall(y_true=y_true, y_pred=y_pred)
+        | {"ap": 0.42},
+    )
+
+
+def test_sequential_result_share_confmat_different_label_types() -> None:
+    y_true, y_pred = np.array([1, 0, 0, 1, 1]), np.array([1, 0, 1, 0, 1])
+    accuracy_result = AccuracyResult(y_true=y_true, y_pred=y_pred)
+    recall1 = BinaryRecallResult(y_true=y_true, y_pred=y_pred)
+    recall2 = MulticlassRecallResult(y_true=y_true, y_pred=y_pred)
+    SequentialResult([accuracy_result, recall1, recall2])
+    assert accuracy_result.confmat is recall2.confmat
+    assert recall1.confmat is not recall2.confmat
+
+
+def test_sequential_result_share_confmat_different_arrays() -> None:
+    y_true, y_pred = np.array([1, 0, 0, 1, 1]), np.array([1, 0, 1, 0, 1])
+    precision1 = BinaryPrecisionResult(y_true=y_true, y_pred=y_pred)
+    precision2 = BinaryPrecisionResult(y_true=y_true.copy(), y_pred=y_pred)
+    precision3 = BinaryPrecisionResult(y_true=y_true, y_pred=y_pred, nan_policy="omit")
+    precision4 = BinaryPrecisionResult(y_true=y_true[:4], y_pred=y_pred[:4])
+    result = SequentialResult([precision1, precision2, precision3, precision4])
+    assert precision1.confmat is not precision2.confmat
+    assert precision1.confmat is not precision3.confmat
+    assert precision1.confmat is not precision4.confmat
+    assert objects_are_equal(
+        result.compute_metrics(), binary_precision(y_true=y_true[:4], y_pred=y_pred[:4])
+    )
+
+
+def test_sequential_result_share_confmat_accuracy() -> None:
+    y_true, y_pred = np.array([1, 0, 2, 1, 1]), np.array([1, 0, 1, 0, 1])
+    result1 = AccuracyResult(y_true=y_true, y_pred=y_pred)
+    result2 = AccuracyResult(y_true=y_true, y_pred=y_pred)
+    assert objects_are_equal(
+        SequentialResult([result1, result2]).compute_metrics(),
+        accuracy(y_true=y_true, y_pred=y_pred),
+    )
+    assert result1.confmat is result2.confmat
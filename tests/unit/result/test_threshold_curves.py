@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from arkas.metric import multilabel_threshold_curves
+from arkas.result import MultilabelThresholdCurvesResult
+
+Y_TRUE = np.array([[1, 0], [0, 1], [0, 1], [1, 0], [1, 1]])
+Y_SCORE = np.array([[0.9, 0.2], [0.1, 0.8], [0.35, 0.6], [0.3, 0.1], [0.8, 0.5]])
+
+
+#####################################################
+#     Tests for MultilabelThresholdCurvesResult     #
+#####################################################
+
+
+def test_multilabel_threshold_curves_result_repr() -> None:
+    assert repr(MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE)).startswith(
+        "MultilabelThresholdCurvesResult("
+    )
+
+
+def test_multilabel_threshold_curves_result_str() -> None:
+    assert str(MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE)).startswith(
+        "MultilabelThresholdCurvesResult("
+    )
+
+
+def test_multilabel_threshold_curves_result_y_true() -> None:
+    assert objects_are_equal(
+        MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE).y_true, Y_TRUE
+    )
+
+
+def test_multilabel_threshold_curves_result_y_score() -> None:
+    assert objects_are_equal(
+        MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE).y_score, Y_SCORE
+    )
+
+
+def test_multilabel_threshold_curves_result_beta() -> None:
+    assert MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE, beta=2).beta == 2
+
+
+def test_multilabel_threshold_curves_result_n_jobs() -> None:
+    assert MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE, n_jobs=2).n_jobs == 2
+
+
+def test_multilabel_threshold_curves_result_nan_policy() -> None:
+    assert (
+        MultilabelThresholdCurvesResult(
+            y_true=Y_TRUE, y_score=Y_SCORE, nan_policy="omit"
+        ).nan_policy
+        == "omit"
+    )
+
+
+def test_multilabel_threshold_curves_result_incorrect_nan_policy() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE, nan_policy="incorrect")
+
+
+def test_multilabel_threshold_curves_result_incorrect_n_jobs() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'n_jobs': 0"):
+        MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE, n_jobs=0)
+
+
+def test_multilabel_threshold_curves_result_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_score' have different shapes"):
+        MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE[:4])
+
+
+def test_multilabel_threshold_curves_result_compute_metrics() -> None:
+    assert objects_are_allclose(
+        MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE).compute_metrics(),
+        multilabel_threshold_curves(y_true=Y_TRUE, y_score=Y_SCORE),
+    )
+
+
+def test_multilabel_threshold_curves_result_compute_metrics_beta_n_jobs() -> None:
+    assert objects_are_allclose(
+        MultilabelThresholdCurvesResult(
+            y_true=Y_TRUE, y_score=Y_SCORE, beta=2, n_jobs=2
+        ).compute_metrics(),
+        multilabel_threshold_curves(y_true=Y_TRUE, y_score=Y_SCORE, beta=2),
+    )
+
+
+def test_multilabel_threshold_curves_result_compute_metrics_prefix_suffix() -> None:
+    assert objects_are_allclose(
+        MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE).compute_metrics(
+            prefix="prefix_", suffix="_suffix"
+        ),
+        multilabel_threshold_curves(
+            y_true=Y_TRUE, y_score=Y_SCORE, prefix="prefix_", suffix="_suffix"
+        ),
+    )
+
+
+def test_multilabel_threshold_curves_result_equal_true() -> None:
+    assert MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE).equal(
+        MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE, n_jobs=4)
+    )
+
+
+def test_multilabel_threshold_curves_result_equal_false_different_y_true() -> None:
+    assert not MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE).equal(
+        MultilabelThresholdCurvesResult(y_true=1 - Y_TRUE, y_score=Y_SCORE)
+    )
+
+
+def test_multilabel_threshold_curves_result_equal_false_different_y_score() -> None:
+    assert not MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE).equal(
+        MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE + 1)
+    )
+
+
+def test_multilabel_threshold_curves_result_equal_false_different_beta() -> None:
+    assert not MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE).equal(
+        MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE, beta=2)
+    )
+
+
+def test_multilabel_threshold_curves_result_equal_false_different_nan_policy() -> None:
+    assert not MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE).equal(
+        MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE, nan_policy="omit")
+    )
+
+
+def test_multilabel_threshold_curves_result_equal_false_different_type() -> None:
+    assert not MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE).equal(42)
+
+
+def test_multilabel_threshold_curves_result_generate_figures() -> None:
+    assert objects_are_equal(
+        MultilabelThresholdCurvesResult(y_true=Y_TRUE, y_score=Y_SCORE).generate_figures(), {}
+    )
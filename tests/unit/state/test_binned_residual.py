@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_equal
+
+from arkas.figure import MatplotlibFigureConfig
+from arkas.state import BinnedResidualState
+
+#########################################
+#     Tests for BinnedResidualState     #
+#########################################
+
+
+def test_binned_residual_state_y_true() -> None:
+    assert objects_are_equal(
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+        ).y_true,
+        np.array([1.0, 2.0, 3.0]),
+    )
+
+
+def test_binned_residual_state_y_true_2d() -> None:
+    assert objects_are_equal(
+        BinnedResidualState(
+            y_true=np.array([[1.0, 2.0], [3.0, 4.0]]),
+            y_pred=np.array([[2.0, 2.0], [4.0, 4.0]]),
+            y_true_name="target",
+            y_pred_name="pred",
+        ).y_true,
+        np.array([1.0, 2.0, 3.0, 4.0]),
+    )
+
+
+def test_binned_residual_state_y_pred() -> None:
+    assert objects_are_equal(
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+        ).y_pred,
+        np.array([2.0, 2.0, 4.0]),
+    )
+
+
+def test_binned_residual_state_y_pred_incorrect_shape() -> None:
+    with pytest.raises(RuntimeError, match="'y_true' and 'y_pred' have different shapes"):
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+        )
+
+
+def test_binned_residual_state_y_true_name() -> None:
+    assert (
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+        ).y_true_name
+        == "target"
+    )
+
+
+def test_binned_residual_state_y_pred_name() -> None:
+    assert (
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+        ).y_pred_name
+        == "pred"
+    )
+
+
+def test_binned_residual_state_bins() -> None:
+    assert BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0]),
+        y_pred=np.array([2.0, 2.0, 4.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+        bins=[0, 2, 4],
+    ).bins == [0, 2, 4]
+
+
+def test_binned_residual_state_bins_default() -> None:
+    assert (
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+        ).bins
+        == 10
+    )
+
+
+def test_binned_residual_state_strategy() -> None:
+    assert (
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+            strategy="uniform",
+        ).strategy
+        == "uniform"
+    )
+
+
+def test_binned_residual_state_strategy_default() -> None:
+    assert (
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+        ).strategy
+        == "quantile"
+    )
+
+
+def test_binned_residual_state_nan_policy() -> None:
+    assert (
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+            nan_policy="omit",
+        ).nan_policy
+        == "omit"
+    )
+
+
+def test_binned_residual_state_nan_policy_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'nan_policy': incorrect"):
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+            nan_policy="incorrect",
+        )
+
+
+def test_binned_residual_state_figure_config() -> None:
+    assert BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0]),
+        y_pred=np.array([2.0, 2.0, 4.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+        figure_config=MatplotlibFigureConfig(dpi=300),
+    ).figure_config.equal(MatplotlibFigureConfig(dpi=300))
+
+
+def test_binned_residual_state_figure_config_default() -> None:
+    assert BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0]),
+        y_pred=np.array([2.0, 2.0, 4.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+    ).figure_config.equal(MatplotlibFigureConfig())
+
+
+def test_binned_residual_state_repr() -> None:
+    assert repr(
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+        )
+    ).startswith("BinnedResidualState(")
+
+
+def test_binned_residual_state_str() -> None:
+    assert str(
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+        )
+    ).startswith("BinnedResidualState(")
+
+
+def test_binned_residual_state_clone() -> None:
+    state = BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0]),
+        y_pred=np.array([2.0, 2.0, 4.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+        bins=[0, 2, 4],
+        strategy="uniform",
+        nan_policy="omit",
+        column="col",
+    )
+    cloned_state = state.clone()
+    assert state is not cloned_state
+    assert state.equal(cloned_state)
+
+
+def test_binned_residual_state_clone_deep() -> None:
+    state = BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0]),
+        y_pred=np.array([2.0, 2.0, 4.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+    )
+    cloned_state = state.clone()
+    cloned_state.y_true[0] = 0.0
+    assert objects_are_equal(state.y_true, np.array([1.0, 2.0, 3.0]))
+    assert objects_are_equal(cloned_state.y_true, np.array([0.0, 2.0, 3.0]))
+
+
+def test_binned_residual_state_clone_shallow() -> None:
+    state = BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0]),
+        y_pred=np.array([2.0, 2.0, 4.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+    )
+    cloned_state = state.clone(deep=False)
+    cloned_state.y_true[0] = 0.0
+    assert objects_are_equal(state.y_true, np.array([0.0, 2.0, 3.0]))
+
+
+def test_binned_residual_state_equal_true() -> None:
+    assert BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0]),
+        y_pred=np.array([2.0, 2.0, 4.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+    ).equal(
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+        )
+    )
+
+
+def test_binned_residual_state_equal_false_different_y_true() -> None:
+    assert not BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0]),
+        y_pred=np.array([2.0, 2.0, 4.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+    ).equal(
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 4.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+        )
+    )
+
+
+def test_binned_residual_state_equal_false_different_bins() -> None:
+    assert not BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0]),
+        y_pred=np.array([2.0, 2.0, 4.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+    ).equal(
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+            bins=5,
+        )
+    )
+
+
+def test_binned_residual_state_equal_false_different_strategy() -> None:
+    assert not BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0]),
+        y_pred=np.array([2.0, 2.0, 4.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+    ).equal(
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+            strategy="uniform",
+        )
+    )
+
+
+def test_binned_residual_state_equal_false_different_type() -> None:
+    assert not BinnedResidualState(
+        y_true=np.array([1.0, 2.0, 3.0]),
+        y_pred=np.array([2.0, 2.0, 4.0]),
+        y_true_name="target",
+        y_pred_name="pred",
+    ).equal(42)
+
+
+def test_binned_residual_state_get_args() -> None:
+    assert objects_are_equal(
+        BinnedResidualState(
+            y_true=np.array([1.0, 2.0, 3.0]),
+            y_pred=np.array([2.0, 2.0, 4.0]),
+            y_true_name="target",
+            y_pred_name="pred",
+            column="col",
+        ).get_args(),
+        {
+            "y_true": np.array([1.0, 2.0, 3.0]),
+            "y_pred": np.array([2.0, 2.0, 4.0]),
+            "y_true_name": "target",
+            "y_pred_name": "pred",
+            "bins": 10,
+            "strategy": "quantile",
+            "nan_policy": "propagate",
+            "figure_config": MatplotlibFigureConfig(),
+            "column": "col",
+        },
+    )
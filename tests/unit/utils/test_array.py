@@ -84,6 +84,14 @@ def test_nonnan_2d() -> None:
     )
 
 
+@pytest.mark.parametrize("dtype", [bool, np.int8, np.int64])
+def test_nonnan_int(dtype: np.dtype) -> None:
+    array = np.array([[1, 0, 1], [0, 1, 1]], dtype=dtype)
+    out = nonnan(array)
+    assert objects_are_equal(out, np.array([1, 0, 1, 0, 1, 1], dtype=dtype))
+    assert np.shares_memory(out, array)
+
+
 ##################################
 #     Tests for rand_replace     #
 ##################################
@@ -142,6 +150,32 @@ def test_to_array_float(data: Any) -> None:
     assert np.array_equal(to_array(data), np.array([3.0, 1.0, 2.0, 0.0, 1.0], dtype=float))
 
 
+@pytest.mark.parametrize(
+    ("dtype", "expected"),
+    [(pl.Boolean, np.bool_), (pl.Int8, np.int8), (pl.Int32, np.int32), (pl.Float32, np.float32)],
+)
+def test_to_array_narrow_dtype(dtype: pl.DataType, expected: np.dtype) -> None:
+    assert objects_are_equal(
+        to_array(pl.Series([1, 0, 1]).cast(dtype)), np.array([1, 0, 1], dtype=expected)
+    )
+
+
+def test_to_array_bool_with_nulls() -> None:
+    assert objects_are_equal(
+        to_array(pl.Series([True, False, None])),
+        np.array([1.0, 0.0, float("nan")], dtype=np.float32),
+        equal_nan=True,
+    )
+
+
+def test_to_array_dataframe_bool_with_nulls() -> None:
+    assert objects_are_equal(
+        to_array(pl.DataFrame({"col1": [True, False, None], "col2": [True, True, False]})),
+        np.array([[1.0, 1.0], [0.0, 1.0], [float("nan"), 0.0]], dtype=np.float32),
+        equal_nan=True,
+    )
+
+
 def test_to_array_dataframe_1_col() -> None:
     assert np.array_equal(
         to_array(pl.DataFrame({"col": [3, 1, 2, 0, 1]})),
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_equal
+
+from arkas.utils.labels import (
+    factorize_arrays,
+    factorize_labels,
+    is_string_like,
+    to_label_arrays,
+)
+
+######################################
+#     Tests for factorize_arrays     #
+######################################
+
+
+def test_factorize_arrays_dense_codes() -> None:
+    y_true, y_pred = np.array([0, 2, 1]), np.array([1, 1, 2])
+    (codes_true, codes_pred), labels = factorize_arrays(y_true, y_pred)
+    assert np.shares_memory(codes_true, y_true)
+    assert np.shares_memory(codes_pred, y_pred)
+    assert objects_are_equal(labels, np.array([0, 1, 2]))
+
+
+def test_factorize_arrays_sparse_codes() -> None:
+    assert objects_are_equal(
+        factorize_arrays(
+            np.array([0, 0, 1, 1, 5, 5], dtype=np.int32), np.array([0, 1, 1, 5, 5, 5])
+        ),
+        (
+            (
+                np.array([0, 0, 1, 1, 2, 2], dtype=np.uint8),
+                np.array([0, 1, 1, 2, 2, 2], dtype=np.uint8),
+            ),
+            np.array([0, 1, 5]),
+        ),
+    )
+
+
+def test_factorize_arrays_large_labels() -> None:
+    assert objects_are_equal(
+        factorize_arrays(np.array([0, 100_000, 100_000]), np.array([0, 0, 100_000])),
+        ((np.array([0, 1, 1]), np.array([0, 0, 1])), np.array([0, 100_000])),
+    )
+
+
+def test_factorize_arrays_negative() -> None:
+    assert objects_are_equal(
+        factorize_arrays(np.array([-1, 1, 1]), np.array([-1, -1, 1])),
+        ((np.array([0, 1, 1]), np.array([0, 0, 1])), np.array([-1, 1])),
+    )
+
+
+def test_factorize_arrays_float() -> None:
+    assert objects_are_equal(
+        factorize_arrays(np.array([0.0, 5.0, 1.0]), np.array([1.0, 1.0, 5.0])),
+        (
+            (np.array([0, 2, 1], dtype=np.uint8), np.array([1, 1, 2], dtype=np.uint8)),
+            np.array([0.0, 1.0, 5.0]),
+        ),
+    )
+
+
+def test_factorize_arrays_float_non_integer() -> None:
+    assert objects_are_equal(
+        factorize_arrays(np.array([0.5, 2.0, 0.5]), np.array([2.0, 2.0, 0.5])),
+        ((np.array([0, 1, 0]), np.array([1, 1, 0])), np.array([0.5, 2.0])),
+    )
+
+
+def test_factorize_arrays_float32_dense_codes() -> None:
+    assert objects_are_equal(
+        factorize_arrays(
+            np.array([0.0, 1.0, 1.0], dtype=np.float32), np.array([1.0, 1.0, 0.0], dtype=np.float32)
+        ),
+        (
+            (np.array([0, 1, 1], dtype=np.uint8), np.array([1, 1, 0], dtype=np.uint8)),
+            np.array([0.0, 1.0], dtype=np.float32),
+        ),
+    )
+
+
+def test_factorize_arrays_bool() -> None:
+    y_true, y_pred = np.array([True, False, True]), np.array([True, True, False])
+    (codes_true, codes_pred), labels = factorize_arrays(y_true, y_pred)
+    assert np.shares_memory(codes_true, y_true)
+    assert np.shares_memory(codes_pred, y_pred)
+    assert objects_are_equal(
+        (codes_true, codes_pred),
+        (np.array([1, 0, 1], dtype=np.uint8), np.array([1, 1, 0], dtype=np.uint8)),
+    )
+    assert objects_are_equal(labels, np.array([False, True]))
+
+
+def test_factorize_arrays_int8_dense_codes() -> None:
+    y_true, y_pred = np.array([0, 2, 1], dtype=np.int8), np.array([1, 1, 2], dtype=np.int8)
+    (codes_true, codes_pred), labels = factorize_arrays(y_true, y_pred)
+    assert np.shares_memory(codes_true, y_true)
+    assert np.shares_memory(codes_pred, y_pred)
+    assert objects_are_equal(labels, np.array([0, 1, 2], dtype=np.int8))
+
+
+def test_factorize_arrays_string() -> None:
+    assert objects_are_equal(
+        factorize_arrays(np.array(["b", "a"]), np.array(["c", "a"])),
+        ((np.array([1, 0]), np.array([2, 0])), np.array(["a", "b", "c"])),
+    )
+
+
+def test_factorize_arrays_empty() -> None:
+    (y_true, y_pred), labels = factorize_arrays(np.array([]), np.array([]))
+    assert y_true.shape == (0,)
+    assert y_pred.shape == (0,)
+    assert labels.shape == (0,)
+
+
+######################################
+#     Tests for factorize_labels     #
+######################################
+
+
+def test_factorize_labels_string() -> None:
+    assert objects_are_equal(
+        factorize_labels(
+            pl.Series(["cat", "dog", "cat", "bird"]), pl.Series(["cat", "cat", "dog", "bird"])
+        ),
+        (
+            (np.array([1, 2, 1, 0], dtype=np.int32), np.array([1, 1, 2, 0], dtype=np.int32)),
+            np.array(["bird", "cat", "dog"], dtype=object),
+        ),
+    )
+
+
+def test_factorize_labels_categorical() -> None:
+    assert objects_are_equal(
+        factorize_labels(
+            pl.Series(["dog", "cat", "dog"], dtype=pl.Categorical),
+            pl.Series(["cat", "cat", "dog"], dtype=pl.Categorical),
+        ),
+        (
+            (np.array([1, 0, 1], dtype=np.int32), np.array([0, 0, 1], dtype=np.int32)),
+            np.array(["cat", "dog"], dtype=object),
+        ),
+    )
+
+
+def test_factorize_labels_enum() -> None:
+    dtype = pl.Enum(["z", "dog", "cat", "unused"])
+    assert objects_are_equal(
+        factorize_labels(
+            pl.Series(["dog", "cat", "z"], dtype=dtype), pl.Series(["cat", "cat", "dog"])
+        ),
+        (
+            (np.array([1, 0, 2], dtype=np.int32), np.array([0, 0, 1], dtype=np.int32)),
+            np.array(["cat", "dog", "z"], dtype=object),
+        ),
+    )
+
+
+def test_factorize_labels_shared_vocabulary() -> None:
+    (y_true, y_pred), vocabulary = factorize_labels(
+        pl.Series(["a", "b", "b"]), pl.Series(["c", "c", "a"])
+    )
+    assert objects_are_equal(vocabulary, np.array(["a", "b", "c"], dtype=object))
+    assert objects_are_equal(vocabulary[y_true], np.array(["a", "b", "b"], dtype=object))
+    assert objects_are_equal(vocabulary[y_pred], np.array(["c", "c", "a"], dtype=object))
+
+
+def test_factorize_labels_string_nulls() -> None:
+    codes, vocabulary = factorize_labels(pl.Series(["b", None, "a"]), pl.Series(["c", "a", "a"]))
+    assert objects_are_equal(
+        codes,
+        (np.array([1.0, np.nan, 0.0]), np.array([2, 0, 0], dtype=np.int32)),
+        equal_nan=True,
+    )
+    assert objects_are_equal(vocabulary, np.array(["a", "b", "c"], dtype=object))
+
+
+def test_factorize_labels_numeric() -> None:
+    assert objects_are_equal(
+        factorize_labels(pl.Series([30, 10, 30]), pl.Series([10, 20, 20])),
+        (
+            (np.array([2, 0, 2], dtype=np.int32), np.array([0, 1, 1], dtype=np.int32)),
+            np.array([10, 20, 30]),
+        ),
+    )
+
+
+def test_factorize_labels_numeric_nulls() -> None:
+    assert objects_are_equal(
+        factorize_labels(pl.Series([3, None, 1]), pl.Series([5, 1, 1])),
+        (
+            (np.array([1.0, np.nan, 0.0]), np.array([2, 0, 0], dtype=np.int32)),
+            np.array([1, 3, 5]),
+        ),
+        equal_nan=True,
+    )
+
+
+def test_factorize_labels_numeric_nulls_keep_dtype() -> None:
+    (y_true,), vocabulary = factorize_labels(pl.Series([1, None, 3], dtype=pl.Int32))
+    assert objects_are_equal(y_true, np.array([0.0, np.nan, 1.0]), equal_nan=True)
+    assert objects_are_equal(vocabulary, np.array([1, 3], dtype=np.int32))
+
+
+def test_factorize_labels_numeric_all_nulls() -> None:
+    (y_true, y_pred), vocabulary = factorize_labels(
+        pl.Series([None, None], dtype=pl.Int64), pl.Series([2, 1])
+    )
+    assert objects_are_equal(y_true, np.array([np.nan, np.nan]), equal_nan=True)
+    assert objects_are_equal(y_pred, np.array([1, 0], dtype=np.int32))
+    assert objects_are_equal(vocabulary, np.array([1, 2]))
+
+
+def test_factorize_labels_empty() -> None:
+    (y_true, y_pred), vocabulary = factorize_labels(
+        pl.Series([], dtype=pl.String), pl.Series([], dtype=pl.String)
+    )
+    assert y_true.shape == (0,)
+    assert y_pred.shape == (0,)
+    assert vocabulary.shape == (0,)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_factorize_labels_random(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    y_true = rng.choice(["a", "b", "c", "d", "e"], size=100)
+    y_pred = rng.choice(["b", "c", "f"], size=100)
+    (codes_true, codes_pred), vocabulary = factorize_labels(pl.Series(y_true), pl.Series(y_pred))
+    expected, inverse = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+    assert objects_are_equal(vocabulary.tolist(), expected.tolist())
+    assert objects_are_equal(codes_true, inverse[:100].astype(np.int32))
+    assert objects_are_equal(codes_pred, inverse[100:].astype(np.int32))
+
+
+####################################
+#     Tests for is_string_like     #
+####################################
+
+
+@pytest.mark.parametrize("dtype", [pl.String, pl.Categorical, pl.Enum(["a", "b"])])
+def test_is_string_like_true(dtype: pl.DataType) -> None:
+    assert is_string_like(dtype)
+
+
+@pytest.mark.parametrize("dtype", [pl.Int64, pl.Float32, pl.Boolean])
+def test_is_string_like_false(dtype: pl.DataType) -> None:
+    assert not is_string_like(dtype)
+
+
+#####################################
+#     Tests for to_label_arrays     #
+#####################################
+
+
+def test_to_label_arrays_string() -> None:
+    assert objects_are_equal(
+        to_label_arrays(pl.Series(["b", "a", "c"]), pl.Series(["b", "b", "c"])),
+        (np.array([1, 0, 2], dtype=np.int32), np.array([1, 1, 2], dtype=np.int32)),
+    )
+
+
+def test_to_label_arrays_numeric() -> None:
+    assert objects_are_equal(
+        to_label_arrays(pl.Series([1, 0, 2]), pl.Series([1, 1, 2])),
+        (np.array([1, 0, 2]), np.array([1, 1, 2])),
+    )
+
+
+def test_to_label_arrays_numeric_nulls() -> None:
+    assert objects_are_equal(
+        to_label_arrays(pl.Series([1, None, 2]), pl.Series([1, 1, 2])),
+        (np.array([1.0, np.nan, 2.0]), np.array([1, 1, 2])),
+        equal_nan=True,
+    )
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from arkas.utils.sketch import KLLSketch
+
+
+def rank_error(values: np.ndarray, quantile: float, q: float) -> float:
+    return abs(float(np.mean(values < quantile)) - q)
+
+
+###############################
+#     Tests for KLLSketch     #
+###############################
+
+
+def test_kll_sketch_repr() -> None:
+    assert repr(KLLSketch()) == "KLLSketch(k=1024, count=0, num_retained=0)"
+
+
+def test_kll_sketch_str() -> None:
+    assert str(KLLSketch()).startswith("KLLSketch(")
+
+
+def test_kll_sketch_k() -> None:
+    assert KLLSketch(k=100).k == 100
+
+
+def test_kll_sketch_incorrect_k() -> None:
+    with pytest.raises(ValueError, match="Incorrect 'k': 1"):
+        KLLSketch(k=1)
+
+
+def test_kll_sketch_update() -> None:
+    sketch = KLLSketch()
+    sketch.update(np.array([3.0, 1.0, 2.0]))
+    sketch.update(np.array([[4, 5]]))
+    assert sketch.count == 5
+    assert sketch.num_retained == 5
+
+
+def test_kll_sketch_update_empty() -> None:
+    sketch = KLLSketch()
+    sketch.update(np.array([]))
+    assert sketch.count == 0
+
+
+@pytest.mark.parametrize("q", [0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0])
+def test_kll_sketch_quantile_exact(q: float) -> None:
+    values = np.random.default_rng(0).normal(size=500)
+    sketch = KLLSketch(k=1000)
+    sketch.update(values)
+    assert math.isclose(sketch.quantile(q), np.quantile(values, q))
+
+
+def test_kll_sketch_quantile_empty() -> None:
+    assert math.isnan(KLLSketch().quantile(0.5))
+
+
+@pytest.mark.parametrize("q", [-0.1, 1.1])
+def test_kll_sketch_quantile_incorrect_q(q: float) -> None:
+    with pytest.raises(ValueError, match="Incorrect 'q'"):
+        KLLSketch().quantile(q)
+
+
+@pytest.mark.parametrize("num_batches", [1, 10, 1000])
+@pytest.mark.parametrize("q", [0.1, 0.5, 0.9])
+def test_kll_sketch_quantile_approximate(num_batches: int, q: float) -> None:
+    values = np.random.default_rng(0).normal(size=200_000)
+    sketch = KLLSketch(k=200)
+    for batch in np.array_split(values, num_batches):
+        sketch.update(batch)
+    assert sketch.count == 200_000
+    assert sketch.num_retained < 1_000
+    assert rank_error(values, sketch.quantile(q), q) < 0.01
+
+
+def test_kll_sketch_quantile_min_max() -> None:
+    values = np.random.default_rng(0).normal(size=100_000)
+    sketch = KLLSketch(k=200)
+    sketch.update(values)
+    assert values.min() <= sketch.quantile(0.0) <= sketch.quantile(1.0) <= values.max()
+
+
+def test_kll_sketch_deterministic() -> None:
+    values = np.random.default_rng(0).normal(size=10_000)
+    sketch1, sketch2 = KLLSketch(k=50), KLLSketch(k=50)
+    sketch1.update(values)
+    sketch2.update(values)
+    assert sketch1.equal(sketch2)
+
+
+def test_kll_sketch_merge() -> None:
+    values = np.random.default_rng(0).normal(size=200_000)
+    sketches = []
+    for batch in np.array_split(values, 20):
+        sketch = KLLSketch(k=200)
+        sketch.update(batch)
+        sketches.append(sketch)
+    for sketch in sketches[1:]:
+        sketches[0].merge(sketch)
+    assert sketches[0].count == 200_000
+    assert sketches[0].num_retained < 1_000
+    assert rank_error(values, sketches[0].quantile(0.5), 0.5) < 0.01
+
+
+def test_kll_sketch_merge_exact() -> None:
+    sketch1 = KLLSketch()
+    sketch1.update(np.array([1.0, 2.0, 3.0]))
+    sketch2 = KLLSketch()
+    sketch2.update(np.array([4.0, 5.0, 6.0]))
+    sketch1.merge(sketch2)
+    assert sketch1.quantile(0.5) == 3.5
+
+
+def test_kll_sketch_merge_empty() -> None:
+    sketch = KLLSketch()
+    sketch.update(np.array([1.0, 2.0, 3.0]))
+    sketch.merge(KLLSketch())
+    assert sketch.count == 3
+    assert sketch.quantile(0.5) == 2.0
+
+
+def test_kll_sketch_merge_incorrect_k() -> None:
+    with pytest.raises(ValueError, match="The sketches must have the same 'k'"):
+        KLLSketch(k=10).merge(KLLSketch(k=20))
+
+
+def test_kll_sketch_equal_true() -> None:
+    sketch1, sketch2 = KLLSketch(), KLLSketch()
+    sketch1.update(np.array([1.0, 2.0]))
+    sketch2.update(np.array([1.0, 2.0]))
+    assert sketch1.equal(sketch2)
+
+
+def test_kll_sketch_equal_false_different_values() -> None:
+    sketch = KLLSketch()
+    sketch.update(np.array([1.0, 2.0]))
+    assert not sketch.equal(KLLSketch())
+
+
+def test_kll_sketch_equal_false_different_k() -> None:
+    assert not KLLSketch(k=10).equal(KLLSketch(k=20))
+
+
+def test_kll_sketch_equal_false_different_type() -> None:
+    assert not KLLSketch().equal(42)
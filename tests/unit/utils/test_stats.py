@@ -6,6 +6,7 @@ import pytest
 from coola import objects_are_allclose
 
 from arkas.utils.stats import (
+    _central_moments,
     compute_statistics_continuous,
     compute_statistics_continuous_array,
     compute_statistics_continuous_series,
@@ -170,7 +171,9 @@ def test_compute_statistics_continuous_with_null(data: np.ndarray | pl.Series) -
 #########################################################
 
 
-@pytest.mark.parametrize("dtype", [np.int32, np.int64, np.float32, np.float64])
+@pytest.mark.parametrize(
+    "dtype", [np.int8, np.int16, np.int32, np.int64, np.uint8, np.float32, np.float64]
+)
 def test_compute_statistics_continuous_array(dtype: np.dtype) -> None:
     assert objects_are_allclose(
         compute_statistics_continuous_array(np.arange(101, dtype=dtype)),
@@ -204,6 +207,61 @@ def test_compute_statistics_continuous_array(dtype: np.dtype) -> None:
     )
 
 
+def test_compute_statistics_continuous_array_bool() -> None:
+    assert objects_are_allclose(
+        compute_statistics_continuous_array(np.array([True, False, True, True])),
+        {
+            "count": 4,
+            "num_nulls": 0,
+            "num_nans": 0,
+            "nunique": 2,
+            "mean": 0.75,
+            "std": 0.4330127018922193,
+            "skewness": -1.1547005383792515,
+            "kurtosis": -0.6666666666666665,
+            "min": 0.0,
+            "q001": 0.003,
+            "q01": 0.03,
+            "q05": 0.15,
+            "q10": 0.3,
+            "q25": 0.75,
+            "median": 1.0,
+            "q75": 1.0,
+            "q90": 1.0,
+            "q95": 1.0,
+            "q99": 1.0,
+            "q999": 1.0,
+            "max": 1.0,
+            ">0": 3,
+            "<0": 0,
+            "=0": 1,
+        },
+    )
+
+
+def test_compute_statistics_continuous_array_moments() -> None:
+    array = np.random.default_rng(0).normal(size=10_000)
+    stats = compute_statistics_continuous_array(array)
+    centered = array - array.mean()
+    std = np.std(array)
+    assert objects_are_allclose(
+        {"std": stats["std"], "skewness": stats["skewness"], "kurtosis": stats["kurtosis"]},
+        {
+            "std": float(std),
+            "skewness": float(np.mean(centered**3) / std**3),
+            "kurtosis": float(np.mean(centered**4) / std**4 - 3.0),
+        },
+    )
+
+
+def test_compute_statistics_continuous_array_moments_chunks() -> None:
+    array = np.random.default_rng(0).integers(-100, 100, size=1000, dtype=np.int8)
+    mean = float(np.mean(array, dtype=np.float64))
+    assert objects_are_allclose(
+        _central_moments(array, mean, chunk_size=7), _central_moments(array, mean)
+    )
+
+
 def test_compute_statistics_continuous_array_empty() -> None:
     assert objects_are_allclose(
         compute_statistics_continuous_array(np.array([])),
@@ -627,7 +685,7 @@ def test_compute_statistics_continuous_series_only_nulls() -> None:
 ##############################
 
 
-@pytest.mark.parametrize("dtype", [np.int32, np.float32, np.float64])
+@pytest.mark.parametrize("dtype", [np.int8, np.int32, np.float32, np.float64])
 def test_quantile(dtype: np.dtype) -> None:
     assert objects_are_allclose(
         quantile(np.arange(101, dtype=dtype), q=[0.1, 0.5, 0.9]),
@@ -635,6 +693,13 @@ def test_quantile(dtype: np.dtype) -> None:
     )
 
 
+def test_quantile_bool() -> None:
+    assert objects_are_allclose(
+        quantile(np.array([True, False, True, True]), q=[0.1, 0.5, 0.9]),
+        {0.1: 0.3, 0.5: 1.0, 0.9: 1.0},
+    )
+
+
 def test_quantile_with_nans() -> None:
     assert objects_are_allclose(
         quantile(np.array([float("nan"), *list(range(101)), float("nan")]), q=[0.1, 0.5, 0.9]),